@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Answer Cache
+Caches generated answers keyed on the normalized question, the transcript
+context chosen for it and the sampling parameters. A bounded in-memory LRU
+sits in front of an optional SQLite file that survives server restarts and is
+shared by all worker processes. A semantic layer matches paraphrased
+questions by hashed n-gram similarity.
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from collections import OrderedDict
+
+import numpy as np
+
+from transcript_index import tokenize, STOPWORDS
+
+def normalize_question(question: str) -> str:
+    """Lowercase a question and drop punctuation and extra whitespace."""
+    return ' '.join(tokenize(question))
+
+def context_key(item_ids: list, params: dict) -> str:
+    """Key of the context items and sampling parameters an answer was generated from."""
+    digest = hashlib.sha1('\n'.join(sorted(item_ids)).encode('utf-8'))
+    digest.update(b'\0' + json.dumps(params, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+class AnswerCache:
+    """LRU + TTL answer cache with an optional on-disk tier."""
+
+    def __init__(self, max_entries: int = 1000, ttl: float = 86400, db_path: Path = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.corpus = ''
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.db_path = db_path
+        self.db = None
+        self.pid = None
+        self.inherited = []
+
+        if db_path:
+            self._connect()
+
+    def _connect(self):
+        self.db = None
+        self.pid = os.getpid()
+        try:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                "key TEXT PRIMARY KEY, corpus TEXT, created REAL, value TEXT)")
+            db.commit()
+            self.db = db
+        except sqlite3.Error as e:
+            print(f"Warning: Answer cache database unavailable: {e}")
+
+    def _database(self):
+        """
+        This process's connection, or None. A worker forked from a process
+        that had the database open (gunicorn --preload) opens its own: SQLite
+        connections must not be used across fork, nor closed by the child.
+        """
+        if self.db is not None and self.pid != os.getpid():
+            self.inherited.append(self.db)
+            self._connect()
+        return self.db
+
+    def make_key(self, question: str, item_ids: list, params: dict) -> str:
+        """Cache key for a question answered from the given context items."""
+        digest = hashlib.sha1()
+        digest.update(self.corpus.encode('utf-8'))
+        digest.update(b'\0' + normalize_question(question).encode('utf-8'))
+        digest.update(b'\0' + '\n'.join(sorted(item_ids)).encode('utf-8'))
+        digest.update(b'\0' + json.dumps(params, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        """Return the cached value for key, or None if missing or expired."""
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                created, value = entry
+                if now - created < self.ttl:
+                    self.entries.move_to_end(key)
+                    return value
+                del self.entries[key]
+
+            db = self._database()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT created, value FROM answers WHERE key = ? AND corpus = ?",
+                    (key, self.corpus)).fetchone()
+            except sqlite3.Error as e:
+                print(f"Warning: Answer cache read failed: {e}")
+                return None
+            if row is None or now - row[0] >= self.ttl:
+                return None
+            value = json.loads(row[1])
+            self._remember(key, row[0], value)
+            return value
+
+    def put(self, key: str, value: dict):
+        """Store a JSON-serializable value under key."""
+        now = time.time()
+        with self.lock:
+            self._remember(key, now, value)
+            db = self._database()
+            if db is None:
+                return
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO answers (key, corpus, created, value) VALUES (?, ?, ?, ?)",
+                    (key, self.corpus, now, json.dumps(value)))
+                db.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: Answer cache write failed: {e}")
+
+    def set_corpus(self, corpus: str):
+        """Switch to a new corpus version, dropping answers from other versions."""
+        with self.lock:
+            if corpus == self.corpus:
+                return
+            self.corpus = corpus
+            self.entries.clear()
+            db = self._database()
+            if db is None:
+                return
+            try:
+                db.execute(
+                    "DELETE FROM answers WHERE corpus != ? OR created < ?",
+                    (corpus, time.time() - self.ttl))
+                db.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: Answer cache cleanup failed: {e}")
+
+    def prune(self):
+        """Delete expired entries from the on-disk tier."""
+        with self.lock:
+            db = self._database()
+            if db is None:
+                return
+            try:
+                db.execute("DELETE FROM answers WHERE created < ?", (time.time() - self.ttl,))
+                db.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: Answer cache cleanup failed: {e}")
+
+    def _remember(self, key: str, created: float, value: dict):
+        self.entries[key] = (created, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+# Words every question about the call corpus shares, ignored for similarity
+DOMAIN_STOPWORDS = {'call', 'calls', 'transcript', 'transcripts'}
+
+# Who a question is about sets its answer apart, so each side of the call
+# is one feature whatever it is called
+ROLES = {
+    'customer': 'role:customer', 'caller': 'role:customer', 'client': 'role:customer',
+    'agent': 'role:agent', 'rep': 'role:agent', 'representative': 'role:agent',
+}
+
+# Domain synonyms folded together so common paraphrases share features
+SYNONYMS = {
+    'complaint': 'issue', 'problem': 'issue', 'painpoint': 'issue',
+    'challenge': 'issue', 'trouble': 'issue',
+    'top': 'common', 'main': 'common', 'most': 'common', 'frequent': 'common',
+    'frequently': 'common', 'often': 'common', 'typical': 'common',
+    'usual': 'common', 'usually': 'common',
+    'fix': 'resolve', 'solve': 'resolve', 'resolution': 'resolve',
+}
+
+def stem(word: str) -> str:
+    """Strip common English suffixes so inflections share a feature."""
+    if word.endswith('s') and word[:-1] in ROLES:
+        word = word[:-1]
+    if word in ROLES:
+        return ROLES[word]
+    for suffix in ('ing', 'ed', 's'):
+        if len(word) > len(suffix) + 2 and word.endswith(suffix) and not word.endswith('ss'):
+            word = word[:-len(suffix)]
+            break
+    return SYNONYMS.get(word, word)
+
+def question_vector(question: str, dim: int) -> np.ndarray:
+    """
+    Embed a question as an L2-normalized hashed feature vector of its
+    distinct stemmed content words and word bigrams (signed feature hashing).
+    Mentions of the customer or the agent become role:customer and
+    role:agent features.
+    """
+    words = [stem(w) for w in tokenize(question)
+             if w not in STOPWORDS and w not in DOMAIN_STOPWORDS]
+    words = list(dict.fromkeys(words))
+    features = [(w, 1.0) for w in words]
+    features += [(f"{a} {b}", 0.5) for a, b in zip(words, words[1:])]
+
+    vector = np.zeros(dim, dtype=np.float32)
+    for feature, weight in features:
+        h = zlib.crc32(feature.encode('utf-8'))
+        vector[h % dim] += weight if h & 0x80000000 else -weight
+
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+class SemanticCache:
+    """
+    Answers for previously asked questions, looked up by cosine similarity.
+    Vectors live in one float32 matrix so a lookup is a single
+    matrix-vector product; when full, the oldest entries are overwritten.
+    Each answer is stored with the context_key() it was generated from and
+    only matches questions answered from the same context.
+    """
+
+    def __init__(self, threshold: float = 0.9, max_entries: int = 100000, dim: int = 512):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.dim = dim
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """Forget every cached answer."""
+        with self.lock:
+            size = min(1024, self.max_entries)
+            self.vectors = np.zeros((size, self.dim), dtype=np.float32)
+            self.contexts = np.zeros(size, dtype=np.int64)
+            self.questions = []
+            self.values = []
+            self.next_slot = 0
+
+    def _similarities(self, vector: np.ndarray, context: int) -> np.ndarray:
+        """Similarity of vector to every entry, -1 where the context differs."""
+        count = len(self.questions)
+        similarities = self.vectors[:count] @ vector
+        similarities[self.contexts[:count] != context] = -1.0
+        return similarities
+
+    def lookup(self, question: str, context: str):
+        """
+        Return (value, similarity, cached question) for the nearest match
+        above threshold answered from the same context, or None.
+        """
+        vector = question_vector(question, self.dim)
+        if not vector.any():
+            return None
+        with self.lock:
+            if not self.questions:
+                return None
+            similarities = self._similarities(vector, context_id(context))
+            best = int(similarities.argmax())
+            if similarities[best] < self.threshold:
+                return None
+            return self.values[best], float(similarities[best]), self.questions[best]
+
+    def add(self, question: str, value: dict, context: str):
+        """Cache an answer, replacing the entry for an identical question and context."""
+        vector = question_vector(question, self.dim)
+        if not vector.any():
+            return
+        context = context_id(context)
+        with self.lock:
+            count = len(self.questions)
+            if count:
+                similarities = self._similarities(vector, context)
+                best = int(similarities.argmax())
+                if similarities[best] > 0.999:
+                    self.questions[best] = question
+                    self.values[best] = value
+                    return
+
+            if count < self.max_entries:
+                if count == len(self.vectors):
+                    size = min(2 * count, self.max_entries)
+                    grown = np.zeros((size, self.dim), dtype=np.float32)
+                    grown[:count] = self.vectors
+                    self.vectors = grown
+                    contexts = np.zeros(size, dtype=np.int64)
+                    contexts[:count] = self.contexts
+                    self.contexts = contexts
+                slot = count
+                self.questions.append(question)
+                self.values.append(value)
+            else:
+                slot = self.next_slot
+                self.next_slot = (slot + 1) % self.max_entries
+                self.questions[slot] = question
+                self.values[slot] = value
+            self.vectors[slot] = vector
+            self.contexts[slot] = context
+
+def context_id(context: str) -> int:
+    """A context_key() as a signed 64-bit integer for the contexts array."""
+    return int(context[:15], 16)
@@ -1,72 +1,40 @@
 #!/usr/bin/env python3
 """
 Transcript Search Tool Builder
-Parses all transcripts and generates a standalone HTML search application.
+Parses all transcripts and generates a standalone HTML search application:
+a small search.html shell plus sharded transcript data scripts in
+search_data/, loaded on demand so the page is interactive before the
+corpus has downloaded.
 """
 
 import os
 import re
+import sys
 import json
+import base64
+import hashlib
 from pathlib import Path
 from datetime import datetime
 
+from ingest import parse_files
+
 # Configuration
 TRANSCRIPT_DIR = Path(__file__).parent / "formatted"
 OUTPUT_FILE = Path(__file__).parent / "search.html"
+DATA_DIR = Path(__file__).parent / "search_data"
+SHARD_SIZE = 100  # Average transcripts per data file, at most
 
-def parse_transcript(filepath: Path) -> dict:
-    """Parse a single transcript file into structured data."""
-    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
-    
-    # Extract filename without extension for display
-    filename = filepath.stem
-    # Clean up the filename for display (remove audio_Call1- prefix)
-    display_name = re.sub(r'^audio_Call1-', '', filename)
-    display_name = re.sub(r'\.MP3$', '', display_name, flags=re.IGNORECASE)
-    
-    # Parse individual utterances
-    # Pattern: Speaker [starttime: MM:SS - endtime: MM:SS]: Text
-    pattern = r'^((?:Agent|Customer|Speaker \d+))\s*\[starttime:\s*(\d+:\d+)\s*-\s*endtime:\s*(\d+:\d+)\]:\s*(.*)$'
-    
-    utterances = []
-    full_text_parts = []
-    
-    for line in content.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
-        
-        match = re.match(pattern, line, re.IGNORECASE)
-        if match:
-            speaker = match.group(1)
-            start_time = match.group(2)
-            end_time = match.group(3)
-            text = match.group(4).strip()
-            
-            # Normalize speaker names
-            if speaker.lower() == 'agent' or speaker.lower() == 'speaker 2':
-                speaker_type = 'agent'
-            else:
-                speaker_type = 'customer'
-            
-            utterances.append({
-                'speaker': speaker,
-                'speaker_type': speaker_type,
-                'start': start_time,
-                'end': end_time,
-                'text': text
-            })
-            full_text_parts.append(f"{speaker}: {text}")
-    
-    return {
-        'id': filename,
-        'name': display_name,
-        'filename': filepath.name,
-        'utterances': utterances,
-        'full_text': '\n'.join(full_text_parts),
-        'utterance_count': len(utterances)
-    }
+# Search index terms: runs of ASCII letters and digits in lowercased text.
+# The page splits queries with the same pattern, so any other character
+# acts as a word boundary on both sides.
+INDEX_TOKEN = re.compile(r'[a-z0-9]+')
+
+# Incremental builds keep per-file parse results between runs
+BUILD_CACHE_DIR = Path(__file__).parent / ".cache" / "search_build"
+MANIFEST_FILE = BUILD_CACHE_DIR / "manifest.json"
+FRAGMENT_DIR = BUILD_CACHE_DIR / "fragments"
+POSTINGS_DIR = BUILD_CACHE_DIR / "postings"
+MANIFEST_VERSION = 2
 
 def load_all_transcripts() -> list:
     """Load and parse all transcripts from the directory."""
@@ -79,20 +47,225 @@ def load_all_transcripts() -> list:
     txt_files = list(TRANSCRIPT_DIR.glob("*.txt"))
     print(f"Found {len(txt_files)} transcript files")
     
-    for filepath in sorted(txt_files):
-        try:
-            transcript = parse_transcript(filepath)
-            transcripts.append(transcript)
-        except Exception as e:
-            print(f"Error parsing {filepath.name}: {e}")
+    return parse_files(sorted(txt_files))
+
+def read_manifest() -> dict:
+    """Read the incremental build manifest, or start an empty one."""
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'version': MANIFEST_VERSION, 'files': {}}
+
+def write_manifest(manifest: dict):
+    """Write the incremental build manifest."""
+    BUILD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = MANIFEST_FILE.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, MANIFEST_FILE)
+
+def page_record(transcript: dict) -> str:
+    """Serialize the fields of a transcript the search page uses."""
+    return json.dumps({
+        'id': transcript['id'],
+        'name': transcript['name'],
+        'utterances': [dict(u) for u in transcript['utterances']],
+    }, ensure_ascii=False)
+
+def transcript_meta(transcript: dict) -> list:
+    """Result-list metadata for a transcript: [id, name, utterance count]."""
+    return [transcript['id'], transcript['name'], transcript['utterance_count']]
+
+def transcript_postings(transcript: dict) -> dict:
+    """Search index terms of a transcript: {term: [utterance number in the transcript]}."""
+    postings = {}
+    for i, utterance in enumerate(transcript['utterances']):
+        for term in set(INDEX_TOKEN.findall(utterance['text'].lower())):
+            postings.setdefault(term, []).append(i)
+    return postings
+
+def read_cached(path: Path):
+    """Contents of a build cache file, or None if it is missing."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def load_transcripts_incremental(manifest: dict) -> tuple:
+    """
+    Load transcripts as serialized page records (see page_record) and
+    their search index postings (see transcript_postings).
+    Files whose size and mtime match the manifest reuse their cached
+    fragment and postings without being read; otherwise the content hash
+    decides whether the file is re-parsed. Updates manifest in place and
+    returns (fragments, metadata, postings, number of re-parsed files).
+    """
+    old_entries = manifest['files']
+    entries = {}
+    fragments = {}
+    postings = {}
+    changed = []
     
-    return transcripts
+    txt_files = sorted(TRANSCRIPT_DIR.glob("*.txt"))
+    print(f"Found {len(txt_files)} transcript files")
+    
+    for filepath in txt_files:
+        stat = filepath.stat()
+        entry = old_entries.get(filepath.name)
+        if entry and (entry['size'], entry['mtime_ns']) != (stat.st_size, stat.st_mtime_ns):
+            # Touched: compare content before paying for a parse
+            with open(filepath, 'rb') as f:
+                sha1 = hashlib.sha1(filepath.name.encode('utf-8') + b'\0' + f.read()).hexdigest()
+            entry = {**entry, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns} if entry['sha1'] == sha1 else None
+        
+        fragment = read_cached(FRAGMENT_DIR / f"{entry['sha1']}.json") if entry else None
+        terms = read_cached(POSTINGS_DIR / f"{entry['sha1']}.json") if fragment else None
+        if terms:
+            fragments[filepath.name] = fragment
+            postings[filepath.name] = json.loads(terms)
+            entries[filepath.name] = entry
+        else:
+            changed.append(filepath)
+    
+    FRAGMENT_DIR.mkdir(parents=True, exist_ok=True)
+    POSTINGS_DIR.mkdir(parents=True, exist_ok=True)
+    for transcript in parse_files(changed):
+        filepath = TRANSCRIPT_DIR / transcript['filename']
+        stat = filepath.stat()
+        with open(filepath, 'rb') as f:
+            sha1 = hashlib.sha1(filepath.name.encode('utf-8') + b'\0' + f.read()).hexdigest()
+        fragment = page_record(transcript)
+        with open(FRAGMENT_DIR / f"{sha1}.json", 'w', encoding='utf-8') as f:
+            f.write(fragment)
+        fragments[filepath.name] = fragment
+        postings[filepath.name] = transcript_postings(transcript)
+        with open(POSTINGS_DIR / f"{sha1}.json", 'w', encoding='utf-8') as f:
+            json.dump(postings[filepath.name], f, separators=(',', ':'))
+        entries[filepath.name] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha1': sha1,
+            'meta': transcript_meta(transcript),
+        }
+    
+    # Drop fragments and postings of deleted or changed files
+    live = {entry['sha1'] for entry in entries.values()}
+    for cache_path in [*FRAGMENT_DIR.glob("*.json"), *POSTINGS_DIR.glob("*.json")]:
+        if cache_path.stem not in live:
+            cache_path.unlink()
+    
+    manifest['files'] = entries
+    names = sorted(fragments)
+    return ([fragments[name] for name in names], [entries[name]['meta'] for name in names],
+            [postings[name] for name in names], len(changed))
+
+def data_filename(stem: str, content: str) -> str:
+    """Content-addressed name for a data script, so browsers can cache it forever."""
+    digest = hashlib.sha1(content.encode('utf-8')).hexdigest()[:12]
+    return f"{stem}.{digest}.js"
+
+def encode_varint(out: bytearray, value: int):
+    """Append value to out as an unsigned LEB128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def build_search_index(transcript_terms: list, metas: list) -> dict:
+    """
+    Build the page's inverted index by merging per-transcript postings
+    (see transcript_postings), in page order.
+    Utterances are numbered across the whole corpus in page order; each
+    term maps to the sorted utterance numbers containing it, stored as
+    varint-encoded gaps. Returns the newline-joined sorted terms plus
+    base64 varint streams of per-term byte lengths and of the postings.
+    """
+    postings = {}
+    first = 0
+    for terms, meta in zip(transcript_terms, metas):
+        for term, utterances in terms.items():
+            merged = postings.setdefault(term, [])
+            merged.extend(first + i for i in utterances)
+        first += meta[2]
+    
+    terms = sorted(postings)
+    lengths = bytearray()
+    data = bytearray()
+    for term in terms:
+        start = len(data)
+        previous = 0
+        for doc in postings[term]:
+            encode_varint(data, doc - previous)
+            previous = doc
+        encode_varint(lengths, len(data) - start)
+    
+    return {
+        'terms': '\n'.join(terms),
+        'lengths': base64.b64encode(bytes(lengths)).decode('ascii'),
+        'postings': base64.b64encode(bytes(data)).decode('ascii'),
+    }
 
-def generate_html(transcripts: list) -> str:
-    """Generate the complete HTML search application."""
+def shard_count(transcript_count: int) -> int:
+    """Smallest power of two that keeps shards at SHARD_SIZE transcripts on average."""
+    count = 1
+    while count * SHARD_SIZE < transcript_count:
+        count *= 2
+    return count
+
+def shard_of(transcript_id: str, count: int) -> int:
+    """
+    Shard of a transcript, from a hash of its id (its filename stem). Adding
+    or removing a file only changes the shard it is in; when the shard count
+    doubles, each shard splits in two.
+    """
+    digest = hashlib.sha1(transcript_id.encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'big') % count
+
+def build_data_files(records: list, metas: list, postings: list) -> tuple:
+    """
+    Split serialized page records into shard scripts (see shard_of), plus
+    one metadata script for the result list and one for the search index.
+    Metadata rows gain the transcript's shard; within a shard, transcripts
+    keep page order.
+    Each script registers its data through a callback, which unlike fetch()
+    also works when search.html is opened straight from disk.
+    Returns (data file names for the page, {filename: content}).
+    """
+    files = {}
+    count = shard_count(len(records))
+    members = [[] for _ in range(count)]
+    rows = []
+    for record, meta in zip(records, metas):
+        shard = shard_of(meta[0], count)
+        members[shard].append(record)
+        rows.append([*meta, shard])
+    
+    shards = []
+    for shard, shard_records in enumerate(members):
+        content = f"registerTranscriptShard({shard}, [" + ', '.join(shard_records) + "]);\n"
+        filename = data_filename(f"shard-{shard:04d}", content)
+        files[filename] = content
+        shards.append(filename)
+    
+    content = f"registerTranscriptMeta({json.dumps(rows, ensure_ascii=False)});\n"
+    meta = data_filename("meta", content)
+    files[meta] = content
     
-    # Convert transcripts to JSON for embedding
-    transcripts_json = json.dumps(transcripts, ensure_ascii=False)
+    content = f"registerSearchIndex({json.dumps(build_search_index(postings, metas))});\n"
+    index = data_filename("index", content)
+    files[index] = content
+    
+    return {'meta': meta, 'index': index, 'shards': shards}, files
+
+def generate_html(data_files: dict, transcript_count: int) -> str:
+    """Generate the HTML search application shell."""
+    
+    data_files_json = json.dumps(data_files)
     
     html = f'''<!DOCTYPE html>
 <html lang="en">
@@ -442,7 +615,33 @@ def generate_html(transcripts: list) -> str:
         }}
 
         .transcript-card.expanded .card-content {{
-            max-height: 3000px;
+            max-height: none;
+        }}
+
+        .card-placeholder {{
+            height: 70px;
+            background: var(--bg-tertiary);
+        }}
+
+        .show-more-btn {{
+            display: block;
+            width: 100%;
+            margin-top: 0.75rem;
+            padding: 0.5rem;
+            font-family: inherit;
+            font-size: 0.75rem;
+            font-weight: 500;
+            background: var(--bg-tertiary);
+            border: 1px solid var(--border-color);
+            border-radius: var(--radius-sm);
+            color: var(--text-secondary);
+            cursor: pointer;
+        }}
+
+        .show-more-btn:hover {{
+            background: var(--accent-primary-light);
+            border-color: var(--accent-primary);
+            color: var(--accent-primary);
         }}
 
         .utterances-list {{
@@ -641,6 +840,10 @@ def generate_html(transcripts: list) -> str:
         .transcript-card:nth-child(4) {{ animation-delay: 90ms; }}
         .transcript-card:nth-child(5) {{ animation-delay: 120ms; }}
 
+        .results-container.virtual-scrolled .transcript-card {{
+            animation: none;
+        }}
+
         /* View Full Button */
         .view-full-btn {{
             display: flex;
@@ -1550,7 +1753,7 @@ def generate_html(transcripts: list) -> str:
             <div class="sidebar-footer">
                 <div class="sidebar-footer-info">
                     <span class="sidebar-footer-label">Total Transcripts</span>
-                    <span class="sidebar-footer-value">{len(transcripts)} records</span>
+                    <span class="sidebar-footer-value">{transcript_count} records</span>
                 </div>
             </div>
         </aside>
@@ -1574,7 +1777,7 @@ def generate_html(transcripts: list) -> str:
                                 <line x1="16" y1="13" x2="8" y2="13"></line>
                                 <line x1="16" y1="17" x2="8" y2="17"></line>
                             </svg>
-                            <span>{len(transcripts)}</span> transcripts
+                            <span>{transcript_count}</span> transcripts
                         </div>
                     </div>
                 </header>
@@ -1645,7 +1848,7 @@ def generate_html(transcripts: list) -> str:
                             <path d="m21 21-4.35-4.35"></path>
                         </svg>
                         <h3>Start typing to search</h3>
-                        <p>Search through {len(transcripts)} transcripts. Use quotes for exact phrases and semicolons for multiple terms.</p>
+                        <p>Search through {transcript_count} transcripts. Use quotes for exact phrases and semicolons for multiple terms.</p>
                     </div>
                 </div>
             </div>
@@ -1686,7 +1889,7 @@ def generate_html(transcripts: list) -> str:
                 </svg>
                 <span>Transcript Assistant</span>
             </div>
-            <span class="chat-status" id="chatStatus">{len(transcripts)} transcripts</span>
+            <span class="chat-status" id="chatStatus">{transcript_count} transcripts</span>
         </div>
         <div class="chat-messages" id="chatMessages">
             <div class="chat-welcome">
@@ -1694,7 +1897,7 @@ def generate_html(transcripts: list) -> str:
                     <path d="M9.663 17h4.673M12 3v1m6.364 1.636l-.707.707M21 12h-1M4 12H3m3.343-5.657l-.707-.707m2.828 9.9a5 5 0 117.072 0l-.548.547A3.374 3.374 0 0014 18.469V19a2 2 0 11-4 0v-.531c0-.895-.356-1.754-.988-2.386l-.548-.547z"></path>
                 </svg>
                 <h4>Ask me anything</h4>
-                <p>I can analyze all {len(transcripts)} transcripts to answer your questions.</p>
+                <p>I can analyze all {transcript_count} transcripts to answer your questions.</p>
                 <div class="chat-suggestions">
                     <button class="chat-suggestion" onclick="askSuggestion('What are the main issues faced by customers?')">
                         What are the main issues faced by customers?
@@ -1720,62 +1923,301 @@ def generate_html(transcripts: list) -> str:
         </div>
     </div>
 
-    <script>
-        // Embedded transcript data
-        const TRANSCRIPTS = {transcripts_json};
+    <script id="searchWorkerSource" type="text/js-worker">
+        // Search worker: owns the transcript data and index and answers
+        // queries from the page, which only renders. Started from this
+        // script's text via a blob URL (see createSearchWorker).
+        let dataUrl = '';
+        let DATA_FILES = null;
+        let latestSeq = 0;
+        let forwardLoads = false;
+        const pendingFiles = new Map();
+
+        // Verification yields to incoming messages this often (ms), so a
+        // newer query can cancel a long-running one
+        const SEARCH_SLICE_MS = 8;
+
+        // Results are handed to the page in pages, best first, and each
+        // result's matching utterances in pages of their own
+        const RESULT_PAGE_SIZE = 50;
+        const UTTERANCE_PAGE_SIZE = 20;
+
+        // Latest completed query: [position, match count, matching utterance indices]
+        let lastSearch = {{ seq: 0, results: [] }};
+
+        // Loaded data: metadata rows [id, name, utterance count, shard] and
+        // shards of full transcripts, filled in as their scripts arrive
+        let transcriptMeta = null;
+        let utteranceStarts = null;  // Corpus-wide number of each transcript's first utterance
+        let transcriptShard = null;
+        let transcriptSlot = null;  // Index of each transcript within its shard
+        const transcriptPosition = new Map();
+        const shards = [];
+        const shardLoads = [];
+        let metaLoad = null;
+        let searchIndex = null;
+        let indexLoad = null;
+
+        // Query tokens matching more than this share of all utterances
+        // do not narrow the search, so they are left to verification
+        const MAX_CANDIDATE_FRACTION = 0.5;
+        const POSTINGS_CACHE_SIZE = 1000;
+
+        function registerTranscriptMeta(meta) {{
+            transcriptMeta = meta;
+            utteranceStarts = new Uint32Array(meta.length + 1);
+            transcriptShard = new Uint32Array(meta.length);
+            transcriptSlot = new Uint32Array(meta.length);
+            const shardSizes = new Uint32Array(DATA_FILES.shards.length);
+            meta.forEach((row, i) => {{
+                transcriptPosition.set(row[0], i);
+                utteranceStarts[i + 1] = utteranceStarts[i] + row[2];
+                transcriptShard[i] = row[3];
+                transcriptSlot[i] = shardSizes[row[3]]++;
+            }});
+        }}
 
-        // State
-        let caseSensitive = false;
-        let speakerFilter = 'all';
-        let debounceTimer = null;
+        function registerTranscriptShard(index, transcripts) {{
+            shards[index] = transcripts;
+        }}
 
-        // Sidebar toggle
-        function toggleSidebar() {{
-            const sidebar = document.getElementById('sidebar');
-            sidebar.classList.toggle('collapsed');
+        function registerSearchIndex(index) {{
+            const terms = index.terms ? index.terms.split('\\n') : [];
+            const lengths = decodeVarints(decodeBase64(index.lengths), false);
+            const offsets = new Uint32Array(terms.length + 1);
+            for (let i = 0; i < terms.length; i++) {{
+                offsets[i + 1] = offsets[i] + lengths[i];
+            }}
+            searchIndex = {{ terms, offsets, postings: decodeBase64(index.postings), cache: new Map() }};
         }}
 
-        // DOM Elements
-        const searchInput = document.getElementById('searchInput');
-        const caseToggle = document.getElementById('caseToggle');
-        const speakerFilterEl = document.getElementById('speakerFilter');
-        const resultsContainer = document.getElementById('results');
-        const resultCountEl = document.getElementById('resultCount');
-        const matchCountEl = document.getElementById('matchCount');
-        const searchTimeEl = document.getElementById('searchTime');
+        function loadMeta() {{
+            if (!metaLoad) {{
+                metaLoad = loadScript(DATA_FILES.meta);
+            }}
+            return metaLoad;
+        }}
 
-        // Initialize
-        document.addEventListener('DOMContentLoaded', () => {{
-            searchInput.focus();
+        // Without the index every search falls back to scanning all shards
+        function loadIndex() {{
+            if (!indexLoad) {{
+                indexLoad = loadScript(DATA_FILES.index).catch(err => console.warn(err.message));
+            }}
+            return indexLoad;
+        }}
 
-            document.addEventListener('keydown', (e) => {{
-                if (e.key === '/' && document.activeElement !== searchInput) {{
-                    e.preventDefault();
-                    searchInput.focus();
+        function loadShard(index) {{
+            if (!shardLoads[index]) {{
+                shardLoads[index] = loadScript(DATA_FILES.shards[index]).catch(err => {{
+                    shardLoads[index] = null;  // Allow a retry
+                    throw err;
+                }});
+            }}
+            return shardLoads[index];
+        }}
+
+        function transcriptAt(position) {{
+            return shards[transcriptShard[position]][transcriptSlot[position]];
+        }}
+
+        async function getTranscript(transcriptId) {{
+            await loadMeta();
+            const position = transcriptPosition.get(transcriptId);
+            if (position === undefined) return null;
+            await loadShard(transcriptShard[position]);
+            return transcriptAt(position);
+        }}
+
+        function decodeBase64(text) {{
+            const binary = atob(text);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) {{
+                bytes[i] = binary.charCodeAt(i);
+            }}
+            return bytes;
+        }}
+
+        /**
+         * Decode LEB128 varints from bytes[start, end), as running sums
+         * when the stream holds gaps between sorted values
+         */
+        function decodeVarints(bytes, cumulative, start = 0, end = bytes.length) {{
+            const values = new Uint32Array(end - start);
+            let count = 0, value = 0, scale = 1, total = 0;
+            for (let i = start; i < end; i++) {{
+                const byte = bytes[i];
+                value += (byte & 0x7f) * scale;
+                if (byte & 0x80) {{
+                    scale *= 128;
+                    continue;
                 }}
-                if (e.key === 'Escape') {{
-                    searchInput.value = '';
-                    searchInput.blur();
-                    showEmptyState();
+                total = cumulative ? total + value : value;
+                values[count++] = total;
+                value = 0;
+                scale = 1;
+            }}
+            return values.subarray(0, count);
+        }}
+
+        function lowerBound(terms, value) {{
+            let low = 0, high = terms.length;
+            while (low < high) {{
+                const mid = (low + high) >> 1;
+                if (terms[mid] < value) low = mid + 1;
+                else high = mid;
+            }}
+            return low;
+        }}
+
+        /**
+         * Index terms a query token can be part of. A token with a word
+         * boundary before it in the query must start a term, one with a
+         * boundary after it must end a term.
+         */
+        function matchingTerms(token, startsWord, endsWord) {{
+            const terms = searchIndex.terms;
+            const first = lowerBound(terms, token);
+            if (startsWord && endsWord) {{
+                return terms[first] === token ? [first] : [];
+            }}
+            const matches = [];
+            if (startsWord) {{
+                for (let i = first; i < terms.length && terms[i].startsWith(token); i++) {{
+                    matches.push(i);
                 }}
-            }});
+            }} else {{
+                for (let i = 0; i < terms.length; i++) {{
+                    if (endsWord ? terms[i].endsWith(token) : terms[i].includes(token)) {{
+                        matches.push(i);
+                    }}
+                }}
+            }}
+            return matches;
+        }}
 
-            searchInput.addEventListener('input', () => {{
-                clearTimeout(debounceTimer);
-                debounceTimer = setTimeout(performSearch, 50);
-            }});
+        function sortedUnion(lists) {{
+            let size = 0;
+            for (const list of lists) size += list.length;
+            const merged = new Uint32Array(size);
+            let offset = 0;
+            for (const list of lists) {{
+                merged.set(list, offset);
+                offset += list.length;
+            }}
+            merged.sort();
+            let count = 0;
+            for (let i = 0; i < merged.length; i++) {{
+                if (i === 0 || merged[i] !== merged[i - 1]) merged[count++] = merged[i];
+            }}
+            return merged.subarray(0, count);
+        }}
 
-            caseToggle.addEventListener('click', () => {{
-                caseSensitive = !caseSensitive;
-                caseToggle.classList.toggle('active', caseSensitive);
-                performSearch();
-            }});
+        /**
+         * Sorted utterance numbers that may contain a query token, or null
+         * when the token is too common to be worth intersecting
+         */
+        function tokenPostings(token, startsWord, endsWord) {{
+            const key = (startsWord ? '^' : '') + token + (endsWord ? '$' : '');
+            const cache = searchIndex.cache;
+            if (cache.has(key)) return cache.get(key);
+
+            const limit = utteranceStarts[transcriptMeta.length] * MAX_CANDIDATE_FRACTION;
+            const {{ offsets, postings }} = searchIndex;
+            const lists = [];
+            let size = 0;
+            let result = null;
+            for (const i of matchingTerms(token, startsWord, endsWord)) {{
+                const list = decodeVarints(postings, true, offsets[i], offsets[i + 1]);
+                lists.push(list);
+                size += list.length;
+                if (size > limit) break;
+            }}
+            if (size <= limit) {{
+                result = lists.length === 1 ? lists[0] : sortedUnion(lists);
+            }}
 
-            speakerFilterEl.addEventListener('change', (e) => {{
-                speakerFilter = e.target.value;
-                performSearch();
-            }});
-        }});
+            if (cache.size >= POSTINGS_CACHE_SIZE) cache.clear();
+            cache.set(key, result);
+            return result;
+        }}
+
+        function intersectPostings(a, b) {{
+            if (a.length > b.length) [a, b] = [b, a];
+            const out = new Uint32Array(a.length);
+            let count = 0;
+            if (a.length * 32 < b.length) {{
+                // Much shorter list: binary search each entry in the longer one
+                let low = 0;
+                for (const value of a) {{
+                    let high = b.length;
+                    while (low < high) {{
+                        const mid = (low + high) >> 1;
+                        if (b[mid] < value) low = mid + 1;
+                        else high = mid;
+                    }}
+                    if (b[low] === value) out[count++] = value;
+                }}
+            }} else {{
+                let i = 0, j = 0;
+                while (i < a.length && j < b.length) {{
+                    if (a[i] < b[j]) i++;
+                    else if (a[i] > b[j]) j++;
+                    else {{
+                        out[count++] = a[i];
+                        i++;
+                        j++;
+                    }}
+                }}
+            }}
+            return out.subarray(0, count);
+        }}
+
+        /**
+         * Utterance numbers that may match every term, from the index
+         * postings of each word in the terms. Returns null when the index
+         * cannot narrow the search and every utterance has to be checked.
+         */
+        function findCandidates(terms) {{
+            if (!searchIndex) return null;
+            let candidates = null;
+            for (const term of terms) {{
+                const value = term.value.toLowerCase();
+                const tokenRegex = /[a-z0-9]+/g;
+                let match;
+                while ((match = tokenRegex.exec(value)) !== null) {{
+                    const token = match[0];
+                    const startsWord = match.index > 0;
+                    const endsWord = match.index + token.length < value.length;
+                    const postings = tokenPostings(token, startsWord, endsWord);
+                    if (postings === null) continue;
+                    candidates = candidates === null ? postings : intersectPostings(candidates, postings);
+                    if (candidates.length === 0) return candidates;
+                }}
+            }}
+            return candidates;
+        }}
+
+        /**
+         * Group utterance numbers by transcript as [position, utterance
+         * indices] pairs; null candidates mean every utterance of every transcript
+         */
+        function groupCandidates(candidates) {{
+            if (candidates === null) {{
+                return transcriptMeta.map((_, position) => [position, null]);
+            }}
+            const groups = [];
+            let position = 0;
+            for (const id of candidates) {{
+                while (utteranceStarts[position + 1] <= id) position++;
+                const last = groups[groups.length - 1];
+                if (last && last[0] === position) {{
+                    last[1].push(id - utteranceStarts[position]);
+                }} else {{
+                    groups.push([position, [id - utteranceStarts[position]]]);
+                }}
+            }}
+            return groups;
+        }}
 
         /**
          * Parse the search query into terms
@@ -1820,17 +2262,6 @@ def generate_html(transcripts: list) -> str:
             return true;
         }}
 
-        /**
-         * Create a regex that matches any of the terms for highlighting
-         */
-        function createHighlightRegex(terms, isCaseSensitive) {{
-            const patterns = terms.map(term => {{
-                return term.value.replace(/[.*+?^${{}}()|[\\]\\\\]/g, '\\\\$&');
-            }});
-            const flags = isCaseSensitive ? 'g' : 'gi';
-            return new RegExp('(' + patterns.join('|') + ')', flags);
-        }}
-
         /**
          * Count total matches across all terms
          */
@@ -1849,32 +2280,105 @@ def generate_html(transcripts: list) -> str:
             return count;
         }}
 
-        function performSearch() {{
-            const query = searchInput.value.trim();
-            
-            if (!query) {{
-                showEmptyState();
-                return;
+        function loadScript(file) {{
+            if (!forwardLoads) {{
+                try {{
+                    importScripts(dataUrl + file);
+                    return Promise.resolve();
+                }} catch (err) {{
+                    // Workers of pages opened from disk may not read files;
+                    // from now on the page loads them and forwards the data
+                    forwardLoads = true;
+                }}
             }}
+            return new Promise((resolve, reject) => {{
+                pendingFiles.set(file, {{ resolve, reject }});
+                self.postMessage({{ type: 'load', file }});
+            }});
+        }}
 
-            const startTime = performance.now();
-            
-            // Parse the query
+        const yieldChannel = new MessageChannel();
+        const yieldQueue = [];
+        yieldChannel.port1.onmessage = () => yieldQueue.shift()();
+
+        // Let queued messages (newer queries) run before continuing
+        function yieldToMessages() {{
+            return new Promise(resolve => {{
+                yieldQueue.push(resolve);
+                yieldChannel.port2.postMessage(null);
+            }});
+        }}
+
+        function utteranceDescriptors(position, indices, start) {{
+            const utterances = transcriptAt(position).utterances;
+            return indices.slice(start, start + UTTERANCE_PAGE_SIZE).map(i => {{
+                const utterance = utterances[i];
+                return [i, utterance.speaker_type, utterance.start, utterance.end, utterance.text];
+            }});
+        }}
+
+        /**
+         * Compact descriptors for one page of the latest results:
+         * [id, name, match count, matching utterance count,
+         *  [[index, speaker type, start, end, text], ...first page of utterances]]
+         */
+        function resultPage(page) {{
+            const start = page * RESULT_PAGE_SIZE;
+            return lastSearch.results.slice(start, start + RESULT_PAGE_SIZE).map(([position, matches, indices]) => {{
+                const [id, name] = transcriptMeta[position];
+                return [id, name, matches, indices.length, utteranceDescriptors(position, indices, 0)];
+            }});
+        }}
+
+        /**
+         * Run a query and post back its totals with the first page of
+         * results, ranked by match count. Gives up as soon as a newer query
+         * or a cancel arrives.
+         */
+        async function search({{ seq, query, caseSensitive, speakerFilter }}) {{
             const terms = parseSearchQuery(query);
-            
             if (terms.length === 0) {{
-                showEmptyState();
+                self.postMessage({{ type: 'results', seq, terms, count: 0, page: [], totalMatches: 0, searchTime: 0 }});
+                return;
+            }}
+
+            let groups;
+            let elapsed = 0;
+            try {{
+                await Promise.all([loadMeta(), loadIndex()]);
+                if (seq !== latestSeq) return;
+
+                // Narrow the search to utterances the index says may match
+                const startTime = performance.now();
+                groups = groupCandidates(findCandidates(terms));
+                const needed = [...new Set(groups.map(([position]) => transcriptShard[position]))];
+                elapsed += performance.now() - startTime;
+
+                if (needed.some(shard => !shards[shard])) {{
+                    self.postMessage({{ type: 'loading', seq }});
+                    await Promise.all(needed.map(loadShard));
+                    // A newer query arrived while the data loaded
+                    if (seq !== latestSeq) return;
+                }}
+            }} catch (err) {{
+                if (seq === latestSeq) self.postMessage({{ type: 'error', seq, message: err.message }});
                 return;
             }}
 
+            let sliceStart = performance.now();
+
             const results = [];
             let totalMatches = 0;
 
-            for (const transcript of TRANSCRIPTS) {{
+            // Verify the candidates against the full query
+            for (const [position, indices] of groups) {{
+                const transcript = transcriptAt(position);
                 const matchingUtterances = [];
                 let transcriptMatches = 0;
+                const count = indices ? indices.length : transcript.utterances.length;
 
-                for (let i = 0; i < transcript.utterances.length; i++) {{
+                for (let k = 0; k < count; k++) {{
+                    const i = indices ? indices[k] : k;
                     const utterance = transcript.utterances[i];
                     
                     // Apply speaker filter
@@ -1884,38 +2388,294 @@ def generate_html(transcripts: list) -> str:
 
                     // Check if utterance matches ALL terms
                     if (matchesAllTerms(utterance.text, terms, caseSensitive)) {{
-                        const matchCount = countMatches(utterance.text, terms, caseSensitive);
-                        transcriptMatches += matchCount;
-                        matchingUtterances.push({{
-                            ...utterance,
-                            index: i,
-                            matchCount: matchCount
-                        }});
+                        transcriptMatches += countMatches(utterance.text, terms, caseSensitive);
+                        matchingUtterances.push(i);
                     }}
                 }}
 
                 if (matchingUtterances.length > 0) {{
-                    results.push({{
-                        transcript,
-                        matchingUtterances,
-                        totalMatches: transcriptMatches
-                    }});
+                    results.push([position, transcriptMatches, matchingUtterances]);
                     totalMatches += transcriptMatches;
                 }}
+
+                if (performance.now() - sliceStart > SEARCH_SLICE_MS) {{
+                    elapsed += performance.now() - sliceStart;
+                    await yieldToMessages();
+                    if (seq !== latestSeq) return;
+                    sliceStart = performance.now();
+                }}
             }}
 
-            const endTime = performance.now();
-            const searchTime = (endTime - startTime).toFixed(1);
+            // Most matches first; the sort is stable, so ties keep corpus order
+            results.sort((a, b) => b[1] - a[1]);
+            lastSearch = {{ seq, results }};
+            const page = resultPage(0);
+
+            elapsed += performance.now() - sliceStart;
+            self.postMessage({{ type: 'results', seq, terms, count: results.length, page, totalMatches, searchTime: elapsed }});
+        }}
+
+        const DATA_CALLBACKS = {{ registerTranscriptMeta, registerTranscriptShard, registerSearchIndex }};
+
+        self.onmessage = (event) => {{
+            const message = event.data;
+            switch (message.type) {{
+                case 'init':
+                    dataUrl = message.dataUrl;
+                    DATA_FILES = message.files;
+                    loadMeta().catch(() => {{}});
+                    loadIndex();
+                    break;
+                case 'search':
+                    latestSeq = message.seq;
+                    search(message);
+                    break;
+                case 'cancel':
+                    latestSeq = message.seq;
+                    break;
+                case 'page':
+                    if (message.seq === lastSearch.seq) {{
+                        self.postMessage({{ type: 'page', seq: message.seq, page: message.page, results: resultPage(message.page) }});
+                    }}
+                    break;
+                case 'utterances':
+                    if (message.seq === lastSearch.seq) {{
+                        const [position, , indices] = lastSearch.results[message.result];
+                        self.postMessage({{
+                            type: 'utterances',
+                            seq: message.seq,
+                            result: message.result,
+                            utterances: utteranceDescriptors(position, indices, message.start)
+                        }});
+                    }}
+                    break;
+                case 'transcript':
+                    getTranscript(message.id).then(
+                        transcript => self.postMessage({{ type: 'transcript', id: message.id, transcript }}),
+                        () => self.postMessage({{ type: 'transcript', id: message.id, transcript: null }}));
+                    break;
+                case 'data':
+                    // Data script the page loaded on our behalf
+                    DATA_CALLBACKS[message.call](...message.args);
+                    break;
+                case 'loaded':
+                case 'failed': {{
+                    const pending = pendingFiles.get(message.file);
+                    pendingFiles.delete(message.file);
+                    if (message.type === 'loaded') pending.resolve();
+                    else pending.reject(new Error(message.error));
+                    break;
+                }}
+            }}
+        }};
+    </script>
+
+    <script>
+        // Transcript data, loaded on demand from search_data/ by the search worker
+        const DATA_DIR = '{DATA_DIR.name}/';
+        const DATA_FILES = {data_files_json};
+        const TRANSCRIPT_COUNT = {transcript_count};
+
+        // State
+        let caseSensitive = false;
+        let speakerFilter = 'all';
+        let debounceTimer = null;
+        let searchSeq = 0;
+        const transcriptRequests = new Map();
+
+        function createSearchWorker() {{
+            const source = document.getElementById('searchWorkerSource').textContent;
+            const worker = new Worker(URL.createObjectURL(new Blob([source], {{ type: 'text/javascript' }})));
+            worker.onmessage = handleWorkerMessage;
+            worker.postMessage({{
+                type: 'init',
+                dataUrl: new URL(DATA_DIR, document.baseURI).href,
+                files: DATA_FILES
+            }});
+            return worker;
+        }}
+
+        const searchWorker = createSearchWorker();
+
+        function handleWorkerMessage(event) {{
+            const message = event.data;
+            if (message.type === 'load') {{
+                forwardDataFile(message.file);
+                return;
+            }}
+            if (message.type === 'transcript') {{
+                const resolvers = transcriptRequests.get(message.id) || [];
+                transcriptRequests.delete(message.id);
+                resolvers.forEach(resolve => resolve(message.transcript));
+                return;
+            }}
+
+            // Replies to superseded queries are dropped
+            if (message.seq !== searchSeq) return;
+            if (message.type === 'loading') {{
+                searchTimeEl.textContent = 'loading';
+            }} else if (message.type === 'error') {{
+                showLoadError(message);
+            }} else if (message.type === 'results') {{
+                if (message.terms.length === 0) {{
+                    showEmptyState();
+                    return;
+                }}
+                resultCountEl.textContent = message.count;
+                matchCountEl.textContent = message.totalMatches;
+                searchTimeEl.textContent = message.searchTime.toFixed(1) + 'ms';
+                showResults(message);
+            }} else if (message.type === 'page') {{
+                receiveResultPage(message);
+            }} else if (message.type === 'utterances') {{
+                receiveUtterances(message);
+            }}
+        }}
+
+        function requestTranscript(transcriptId) {{
+            return new Promise(resolve => {{
+                if (!transcriptRequests.has(transcriptId)) {{
+                    transcriptRequests.set(transcriptId, []);
+                    searchWorker.postMessage({{ type: 'transcript', id: transcriptId }});
+                }}
+                transcriptRequests.get(transcriptId).push(resolve);
+            }});
+        }}
+
+        // Fallback for pages opened from disk, where the worker cannot read
+        // the data files: load the script here and hand its data over
+        function forwardDataFile(file) {{
+            const script = document.createElement('script');
+            script.src = DATA_DIR + file;
+            script.onload = () => searchWorker.postMessage({{ type: 'loaded', file }});
+            script.onerror = () => searchWorker.postMessage({{ type: 'failed', file, error: 'Could not load ' + file }});
+            document.head.appendChild(script);
+        }}
+
+        function registerTranscriptMeta(meta) {{
+            searchWorker.postMessage({{ type: 'data', call: 'registerTranscriptMeta', args: [meta] }});
+        }}
+
+        function registerTranscriptShard(index, transcripts) {{
+            searchWorker.postMessage({{ type: 'data', call: 'registerTranscriptShard', args: [index, transcripts] }});
+        }}
 
-            resultCountEl.textContent = results.length;
-            matchCountEl.textContent = totalMatches;
-            searchTimeEl.textContent = searchTime + 'ms';
+        function registerSearchIndex(index) {{
+            searchWorker.postMessage({{ type: 'data', call: 'registerSearchIndex', args: [index] }});
+        }}
 
-            renderResults(results, terms);
+        // Sidebar toggle
+        function toggleSidebar() {{
+            const sidebar = document.getElementById('sidebar');
+            sidebar.classList.toggle('collapsed');
         }}
 
-        function renderResults(results, terms) {{
-            if (results.length === 0) {{
+        // DOM Elements
+        const searchInput = document.getElementById('searchInput');
+        const caseToggle = document.getElementById('caseToggle');
+        const speakerFilterEl = document.getElementById('speakerFilter');
+        const resultsContainer = document.getElementById('results');
+        const resultCountEl = document.getElementById('resultCount');
+        const matchCountEl = document.getElementById('matchCount');
+        const searchTimeEl = document.getElementById('searchTime');
+
+        // Initialize
+        document.addEventListener('DOMContentLoaded', () => {{
+            searchInput.focus();
+
+            document.addEventListener('keydown', (e) => {{
+                if (e.key === '/' && document.activeElement !== searchInput) {{
+                    e.preventDefault();
+                    searchInput.focus();
+                }}
+                if (e.key === 'Escape') {{
+                    searchInput.value = '';
+                    searchInput.blur();
+                    showEmptyState();
+                }}
+            }});
+
+            searchInput.addEventListener('input', () => {{
+                clearTimeout(debounceTimer);
+                debounceTimer = setTimeout(performSearch, 50);
+            }});
+
+            caseToggle.addEventListener('click', () => {{
+                caseSensitive = !caseSensitive;
+                caseToggle.classList.toggle('active', caseSensitive);
+                performSearch();
+            }});
+
+            speakerFilterEl.addEventListener('change', (e) => {{
+                speakerFilter = e.target.value;
+                performSearch();
+            }});
+
+            window.addEventListener('scroll', scheduleRender, {{ passive: true }});
+            window.addEventListener('resize', scheduleRender);
+        }});
+
+        /**
+         * Create a regex that matches any of the terms for highlighting
+         */
+        function createHighlightRegex(terms, isCaseSensitive) {{
+            const patterns = terms.map(term => {{
+                return term.value.replace(/[.*+?^${{}}()|[\\]\\\\]/g, '\\\\$&');
+            }});
+            const flags = isCaseSensitive ? 'g' : 'gi';
+            return new RegExp('(' + patterns.join('|') + ')', flags);
+        }}
+
+        function performSearch() {{
+            const query = searchInput.value.trim();
+            const seq = ++searchSeq;
+            
+            if (!query) {{
+                showEmptyState();
+                return;
+            }}
+
+            searchWorker.postMessage({{ type: 'search', seq, query, caseSensitive, speakerFilter }});
+        }}
+
+        // Virtualized result list: only cards near the viewport exist in
+        // the DOM; heights of the others are estimated until measured
+        const CARD_HEIGHT_ESTIMATE = 82;  // Collapsed card plus margin (px)
+        const CARD_MARGIN = 12;
+        const OVERSCAN_PX = 800;
+        const RESULT_PAGE_SIZE = 50;  // Must match the worker
+        let resultView = null;
+        let renderScheduled = false;
+
+        function showResults(message) {{
+            resultView = {{
+                seq: message.seq,
+                highlightRegex: createHighlightRegex(message.terms, caseSensitive),
+                rows: new Array(message.count),
+                heights: new Float64Array(message.count).fill(CARD_HEIGHT_ESTIMATE),
+                totalHeight: message.count * CARD_HEIGHT_ESTIMATE,
+                expanded: new Set(),
+                requestedPages: new Set([0]),
+                loadingMore: new Set(),
+                range: null,
+                drawn: false
+            }};
+            message.page.forEach((row, i) => {{ resultView.rows[i] = row; }});
+            renderResults();
+        }}
+
+        function scheduleRender() {{
+            if (renderScheduled || !resultView) return;
+            renderScheduled = true;
+            requestAnimationFrame(() => {{
+                renderScheduled = false;
+                if (resultView) renderResults(false);
+            }});
+        }}
+
+        function renderResults(force = true) {{
+            const view = resultView;
+            if (view.rows.length === 0) {{
                 resultsContainer.innerHTML = `
                     <div class="empty-state">
                         <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5">
@@ -1931,14 +2691,87 @@ def generate_html(transcripts: list) -> str:
                 return;
             }}
 
-            const highlightRegex = createHighlightRegex(terms, caseSensitive);
-            let html = '';
+            // Rows overlapping the viewport plus some overscan
+            const top = -resultsContainer.getBoundingClientRect().top;
+            const viewTop = top - OVERSCAN_PX;
+            const viewBottom = top + window.innerHeight + OVERSCAN_PX;
+            let first = 0;
+            let offset = 0;
+            while (first < view.rows.length - 1 && offset + view.heights[first] < viewTop) {{
+                offset += view.heights[first++];
+            }}
+            const topSpace = offset;
+            let last = first;
+            while (last < view.rows.length - 1 && offset + view.heights[last] < viewBottom) {{
+                offset += view.heights[last++];
+            }}
+            offset += view.heights[last];
 
-            for (const result of results) {{
-                const {{ transcript, matchingUtterances, totalMatches }} = result;
-                
-                html += `
-                    <div class="transcript-card" data-id="${{transcript.id}}">
+            if (!force && view.range && view.range[0] === first && view.range[1] === last) return;
+            view.range = [first, last];
+
+            // Only the first draw of a query animates cards in
+            resultsContainer.classList.toggle('virtual-scrolled', view.drawn);
+            view.drawn = true;
+
+            let html = `<div style="height: ${{topSpace}}px"></div>`;
+            for (let i = first; i <= last; i++) {{
+                if (!view.rows[i]) requestResultPage(Math.floor(i / RESULT_PAGE_SIZE));
+                html += renderCard(i);
+            }}
+            html += `<div style="height: ${{view.totalHeight - offset}}px"></div>`;
+            resultsContainer.innerHTML = html;
+
+            // Replace estimates with real heights for the cards just drawn
+            for (const card of resultsContainer.querySelectorAll('.transcript-card')) {{
+                const i = Number(card.dataset.index);
+                const height = card.offsetHeight + CARD_MARGIN;
+                view.totalHeight += height - view.heights[i];
+                view.heights[i] = height;
+            }}
+        }}
+
+        function requestResultPage(page) {{
+            if (resultView.requestedPages.has(page)) return;
+            resultView.requestedPages.add(page);
+            searchWorker.postMessage({{ type: 'page', seq: resultView.seq, page }});
+        }}
+
+        function receiveResultPage(message) {{
+            const start = message.page * RESULT_PAGE_SIZE;
+            message.results.forEach((row, i) => {{ resultView.rows[start + i] = row; }});
+            renderResults();
+        }}
+
+        function loadMoreUtterances(index) {{
+            const view = resultView;
+            if (view.loadingMore.has(index)) return;
+            view.loadingMore.add(index);
+            searchWorker.postMessage({{ type: 'utterances', seq: view.seq, result: index, start: view.rows[index][4].length }});
+        }}
+
+        function receiveUtterances(message) {{
+            resultView.loadingMore.delete(message.result);
+            resultView.rows[message.result][4].push(...message.utterances);
+            renderResults();
+        }}
+
+        function renderCard(index) {{
+            const row = resultView.rows[index];
+            if (!row) {{
+                return `<div class="transcript-card card-placeholder" data-index="${{index}}"></div>`;
+            }}
+
+            const [id, name, totalMatches, utteranceCount, utterances] = row;
+            const expanded = resultView.expanded.has(index);
+            const remaining = utteranceCount - utterances.length;
+            const moreButton = remaining > 0 ? `
+                                <button class="show-more-btn" onclick="loadMoreUtterances(${{index}})">
+                                    Show more (${{remaining}} more matching utterance${{remaining !== 1 ? 's' : ''}})
+                                </button>` : '';
+
+            return `
+                    <div class="transcript-card${{expanded ? ' expanded' : ''}}" data-id="${{id}}" data-index="${{index}}">
                         <div class="card-header" onclick="toggleCard(this)">
                             <div class="card-title">
                                 <div class="card-icon">
@@ -1946,10 +2779,10 @@ def generate_html(transcripts: list) -> str:
                                         <path d="M21 15a2 2 0 0 1-2 2H7l-4 4V5a2 2 0 0 1 2-2h14a2 2 0 0 1 2 2z"></path>
                                     </svg>
                                 </div>
-                                <span class="card-name">${{transcript.name}}</span>
+                                <span class="card-name">${{name}}</span>
                             </div>
                             <div class="card-meta">
-                                <button class="view-full-btn" onclick="event.stopPropagation(); openTranscriptModal('${{transcript.id}}')">
+                                <button class="view-full-btn" onclick="event.stopPropagation(); openTranscriptModal('${{id}}')">
                                     <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
                                         <path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"></path>
                                         <polyline points="14 2 14 8 20 8"></polyline>
@@ -1967,22 +2800,19 @@ def generate_html(transcripts: list) -> str:
                         </div>
                         <div class="card-content">
                             <div class="utterances-list">
-                                ${{renderUtterances(transcript, matchingUtterances, highlightRegex)}}
+                                ${{expanded ? renderUtterances(utterances, resultView.highlightRegex) : ''}}${{expanded ? moreButton : ''}}
                             </div>
                         </div>
                     </div>
                 `;
-            }}
-
-            resultsContainer.innerHTML = html;
         }}
 
-        function renderUtterances(transcript, matchingUtterances, highlightRegex) {{
+        function renderUtterances(matchingUtterances, highlightRegex) {{
             let html = '';
             let prevIndex = -2;
 
-            for (const utterance of matchingUtterances) {{
-                if (utterance.index > prevIndex + 1 && prevIndex >= 0) {{
+            for (const [index, speakerType, start, end, text] of matchingUtterances) {{
+                if (index > prevIndex + 1 && prevIndex >= 0) {{
                     html += `
                         <div class="context-indicator">
                             <div class="context-dots">
@@ -1992,32 +2822,48 @@ def generate_html(transcripts: list) -> str:
                     `;
                 }}
 
-                const highlightedText = utterance.text.replace(highlightRegex, '<mark class="highlight">$1</mark>');
+                const highlightedText = text.replace(highlightRegex, '<mark class="highlight">$1</mark>');
 
                 html += `
                     <div class="utterance">
                         <div class="utterance-speaker">
-                            <span class="speaker-badge ${{utterance.speaker_type}}">${{utterance.speaker_type === 'agent' ? 'Agent' : 'Customer'}}</span>
+                            <span class="speaker-badge ${{speakerType}}">${{speakerType === 'agent' ? 'Agent' : 'Customer'}}</span>
                         </div>
                         <div class="utterance-content">
-                            <div class="utterance-time">${{utterance.start}} - ${{utterance.end}}</div>
+                            <div class="utterance-time">${{start}} - ${{end}}</div>
                             <div class="utterance-text">${{highlightedText}}</div>
                         </div>
                     </div>
                 `;
 
-                prevIndex = utterance.index;
+                prevIndex = index;
             }}
 
             return html;
         }}
 
+        function showLoadError(err) {{
+            searchTimeEl.textContent = '-';
+            resultsContainer.innerHTML = `
+                <div class="empty-state">
+                    <h3>Could not load transcripts</h3>
+                    <p>${{escapeHtml(err.message)}}</p>
+                </div>
+            `;
+        }}
+
         function toggleCard(header) {{
-            const card = header.closest('.transcript-card');
-            card.classList.toggle('expanded');
+            const index = Number(header.closest('.transcript-card').dataset.index);
+            if (!resultView.expanded.delete(index)) {{
+                resultView.expanded.add(index);
+            }}
+            renderResults();
         }}
 
         function showEmptyState() {{
+            // Cancel any search still running in the worker
+            searchWorker.postMessage({{ type: 'cancel', seq: ++searchSeq }});
+            resultView = null;
             resultCountEl.textContent = '-';
             matchCountEl.textContent = '-';
             searchTimeEl.textContent = '-';
@@ -2029,7 +2875,7 @@ def generate_html(transcripts: list) -> str:
                         <path d="m21 21-4.35-4.35"></path>
                     </svg>
                     <h3>Start typing to search</h3>
-                    <p>Search through ${{TRANSCRIPTS.length}} transcripts. Use quotes for exact phrases and semicolons for multiple terms.</p>
+                    <p>Search through ${{TRANSCRIPT_COUNT}} transcripts. Use quotes for exact phrases and semicolons for multiple terms.</p>
                 </div>
             `;
         }}
@@ -2054,8 +2900,8 @@ def generate_html(transcripts: list) -> str:
             return result;
         }}
 
-        function openTranscriptModal(transcriptId) {{
-            const transcript = TRANSCRIPTS.find(t => t.id === transcriptId);
+        async function openTranscriptModal(transcriptId) {{
+            const transcript = await requestTranscript(transcriptId);
             if (!transcript) return;
 
             // Get current search terms for highlighting
@@ -2169,6 +3015,20 @@ def generate_html(transcripts: list) -> str:
             return msg;
         }}
 
+        function escapeHtml(text) {{
+            const div = document.createElement('div');
+            div.textContent = text;
+            return div.innerHTML;
+        }}
+
+        function answerMeta(data) {{
+            let meta = `Analyzed ${{data.transcripts_analyzed}} of ${{data.total_transcripts}} transcripts`;
+            if (data.similar_question) {{
+                meta += ` • Reused answer to "${{escapeHtml(data.similar_question)}}"`;
+            }}
+            return meta;
+        }}
+
         function addTypingIndicator() {{
             const typing = document.createElement('div');
             typing.className = 'chat-message assistant thinking';
@@ -2198,6 +3058,36 @@ def generate_html(transcripts: list) -> str:
             setTimeout(() => error.remove(), 5000);
         }}
 
+        /**
+         * Read Server-Sent Events from a fetch() response body,
+         * calling onEvent(name, data) for each complete event
+         */
+        async function readEventStream(response, onEvent) {{
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+
+            while (true) {{
+                const {{ value, done }} = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, {{ stream: true }});
+
+                let boundary;
+                while ((boundary = buffer.indexOf('\\n\\n')) !== -1) {{
+                    const rawEvent = buffer.slice(0, boundary);
+                    buffer = buffer.slice(boundary + 2);
+
+                    let name = 'message';
+                    let data = '';
+                    for (const line of rawEvent.split('\\n')) {{
+                        if (line.startsWith('event: ')) name = line.slice(7);
+                        else if (line.startsWith('data: ')) data += line.slice(6);
+                    }}
+                    if (data) onEvent(name, JSON.parse(data));
+                }}
+            }}
+        }}
+
         async function sendChatMessage() {{
             const question = chatInput.value.trim();
             if (!question || isAsking) return;
@@ -2209,12 +3099,12 @@ def generate_html(transcripts: list) -> str:
             // Add user message
             addMessage(question, 'user');
             
-            // Show typing indicator
+            // Show typing indicator until the first sentence arrives
             addTypingIndicator();
             chatStatus.textContent = 'Thinking...';
 
             try {{
-                const response = await fetch('/api/ask', {{
+                const response = await fetch('/api/ask/stream', {{
                     method: 'POST',
                     headers: {{
                         'Content-Type': 'application/json',
@@ -2222,22 +3112,44 @@ def generate_html(transcripts: list) -> str:
                     body: JSON.stringify({{ question }}),
                 }});
 
-                removeTypingIndicator();
-
                 if (!response.ok) {{
+                    removeTypingIndicator();
                     throw new Error(`Server error: ${{response.status}}`);
                 }}
 
-                const data = await response.json();
-                
-                if (data.error) {{
-                    showError(data.error);
-                }} else {{
-                    const meta = `Analyzed ${{data.transcripts_analyzed}} of ${{data.total_transcripts}} transcripts`;
-                    addMessage(data.answer, 'assistant', meta);
-                }}
+                // Streamed sentences render into a preview that the final
+                // formatted answer replaces
+                let msg = null;
+                let preview = null;
+
+                await readEventStream(response, (event, data) => {{
+                    if (event === 'delta') {{
+                        if (!msg) {{
+                            removeTypingIndicator();
+                            msg = addMessage('<div class="response-content"></div>', 'assistant');
+                            preview = msg.querySelector('.response-content');
+                            chatStatus.textContent = 'Answering...';
+                        }}
+                        if (data.reset) preview.innerHTML = '';
+                        preview.insertAdjacentHTML('beforeend', data.html);
+                        chatMessages.scrollTop = chatMessages.scrollHeight;
+                    }} else if (event === 'done') {{
+                        removeTypingIndicator();
+                        const meta = answerMeta(data);
+                        if (msg) {{
+                            msg.innerHTML = `${{data.answer}}<div class="meta">${{meta}}</div>`;
+                            chatMessages.scrollTop = chatMessages.scrollHeight;
+                        }} else {{
+                            addMessage(data.answer, 'assistant', meta);
+                        }}
+                    }} else if (event === 'error') {{
+                        removeTypingIndicator();
+                        if (msg) msg.remove();
+                        showError(data.error);
+                    }}
+                }});
 
-                chatStatus.textContent = `${{TRANSCRIPTS.length}} transcripts`;
+                chatStatus.textContent = `${{TRANSCRIPT_COUNT}} transcripts`;
 
             }} catch (error) {{
                 removeTypingIndicator();
@@ -2248,7 +3160,7 @@ def generate_html(transcripts: list) -> str:
                     showError(`Error: ${{error.message}}`);
                 }}
                 
-                chatStatus.textContent = `${{TRANSCRIPTS.length}} transcripts`;
+                chatStatus.textContent = `${{TRANSCRIPT_COUNT}} transcripts`;
             }}
 
             isAsking = false;
@@ -2261,35 +3173,76 @@ def generate_html(transcripts: list) -> str:
 
     return html
 
+def write_output(html_content: str, data_files: dict) -> tuple:
+    """
+    Write search.html and its data scripts, skipping files that are already
+    up to date and deleting data scripts from earlier builds.
+    Returns (whether search.html was written, number of data files written).
+    """
+    DATA_DIR.mkdir(exist_ok=True)
+    written = 0
+    for filename, content in data_files.items():
+        # Names are content hashes, so an existing file is already current
+        path = DATA_DIR / filename
+        if not path.exists():
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            written += 1
+    for path in DATA_DIR.glob("*.js"):
+        if path.name not in data_files:
+            path.unlink()
+    
+    if OUTPUT_FILE.exists():
+        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+            if f.read() == html_content:
+                return False, written
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+    return True, written
+
 def main():
     """Main entry point."""
+    incremental = '--incremental' in sys.argv[1:]
+    
     print("=" * 60)
     print("Transcript Search Tool Builder")
     print("=" * 60)
     
     # Load transcripts
     print("\nLoading transcripts...")
-    transcripts = load_all_transcripts()
+    if incremental:
+        manifest = read_manifest()
+        records, metas, postings, reparsed = load_transcripts_incremental(manifest)
+        print(f"Re-parsed {reparsed} new or changed files")
+    else:
+        transcripts = load_all_transcripts()
+        records = [page_record(t) for t in transcripts]
+        metas = [transcript_meta(t) for t in transcripts]
+        postings = [transcript_postings(t) for t in transcripts]
     
-    if not transcripts:
+    if not records:
         print("No transcripts found. Exiting.")
         return
     
     # Calculate stats
-    total_utterances = sum(t['utterance_count'] for t in transcripts)
-    print(f"Loaded {len(transcripts)} transcripts with {total_utterances} total utterances")
+    total_utterances = sum(meta[2] for meta in metas)
+    print(f"Loaded {len(records)} transcripts with {total_utterances} total utterances")
     
     # Generate HTML
     print("\nGenerating search.html...")
-    html_content = generate_html(transcripts)
+    data_files, files = build_data_files(records, metas, postings)
+    html_content = generate_html(data_files, len(records))
     
     # Write output
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    written, data_written = write_output(html_content, files)
+    if incremental:
+        write_manifest(manifest)
     
     file_size = os.path.getsize(OUTPUT_FILE) / 1024
-    print(f"Generated: {OUTPUT_FILE}")
+    data_size = sum(len(content.encode('utf-8')) for content in files.values()) / 1024
+    print(f"{'Generated' if written else 'Unchanged'}: {OUTPUT_FILE}")
     print(f"File size: {file_size:.1f} KB")
+    print(f"Data: {len(files)} files in {DATA_DIR.name}/ ({data_size:.1f} KB, {data_written} written)")
     
     print("\n" + "=" * 60)
     print("Done! Double-click search.html to start searching.")
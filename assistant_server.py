@@ -5,12 +5,40 @@ Flask backend that connects to RunPod for AI-powered transcript analysis.
 """
 
 import os
+import re
+import gc
+import sys
 import json
 import time
-import requests
+import signal
+import threading
+import subprocess
 from pathlib import Path
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
 from flask_cors import CORS
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import numpy as np
+
+from transcript_index import (
+    query_terms, tokenize, format_utterances, passage_text, bm25_scores,
+    FIELD_WEIGHTS, CHUNK_UTTERANCES,
+)
+from corpus_tables import derive_tables, bm25_tables, utterance_index, Passages
+from context_packer import estimate_tokens, pack_context, pack_groups, context_utilization
+from runpod_client import RunPodClient, RunPodError
+from ingest import speaker_type
+from snapshot import (
+    load_corpus, file_stats, read_snapshot, snapshot_transcripts, snapshot_tables,
+)
+from corpus_watcher import CorpusWatcher
+from topic_clusters import load_clusters, CLUSTER_FILE, REPRESENTATIVES
+from transcript_summaries import load_summaries, content_hash, format_summary, SUMMARY_FILE
+from transcript_store import open_store
+from answer_cache import AnswerCache, SemanticCache, context_key
+from utterance_search import (
+    search_utterances, parse_search_query, verify_candidates,
+    highlight_pattern, highlight_offsets,
+)
 
 app = Flask(__name__, static_folder='.')
 CORS(app)
@@ -18,135 +46,582 @@ CORS(app)
 # RunPod Configuration - Set these environment variables in Render
 ENDPOINT_ID = os.environ.get('RUNPOD_ENDPOINT_ID', '')
 RUNPOD_API_KEY = os.environ.get('RUNPOD_API_KEY', '')
-RUNPOD_URL = f"https://api.runpod.ai/v2/{ENDPOINT_ID}/run"
-RUNPOD_STATUS_URL = f"https://api.runpod.ai/v2/{ENDPOINT_ID}/status"
-RUNPOD_HEADERS = {
-    "Authorization": f"Bearer {RUNPOD_API_KEY}",
-    "Content-Type": "application/json",
-}
+RUNPOD_MAX_CONCURRENCY = int(os.environ.get('RUNPOD_MAX_CONCURRENCY', 32))  # Jobs in flight per worker process
+RUNPOD_USE_RUNSYNC = os.environ.get('RUNPOD_USE_RUNSYNC', '1') == '1'
 
 # Processing parameters
-MAX_CONTEXT_CHARS = 20000
+MAX_CONTEXT_TOKENS = 5000  # Estimated prompt tokens of transcript context
+MAX_PACK_CANDIDATES = 200  # Top-ranked passages considered by the packer
+MAX_PASSAGES_PER_TRANSCRIPT = 3
+REPRESENTATIVE_DECAY = 0.9  # Weight of each further-out representative when covering a topic cluster
+RERANK_CANDIDATES = 300  # Passages the first retrieval stage hands to the re-ranker
+RERANK_COVERAGE_WEIGHT = 1.0  # Boost for passages containing every question term
+RERANK_PROXIMITY_WEIGHT = 0.5  # Boost for question terms next to each other
+MAP_REDUCE_MAX_ITEMS = 300  # Transcripts or passages summarized per map-reduce answer
+MAP_REDUCE_CONCURRENCY = 8  # Map-reduce prompts in flight per worker process, across questions
+MAP_REDUCE_MAX_JOBS = 4  # Map-reduce answers in progress per worker process
+MAP_REDUCE_TIMEOUT = 600  # Seconds a map-reduce answer may take in total
+
+# Answer corpus-wide questions from the per-transcript summaries written by
+# transcript_summaries.py, where they exist, instead of the raw transcripts
+USE_SUMMARIES = os.environ.get('USE_SUMMARIES', '1') == '1'
+SUMMARY_SAMPLE_SIZE = 200  # Transcripts sampled when summaries are used without clusters
 MAX_WAIT_TIME = 300  # 5 minutes
-CHECK_INTERVAL = 2  # Check every 2 seconds
+INITIAL_CHECK_INTERVAL = 0.25  # First status polls are quick...
+CHECK_INTERVAL = 2  # ...backing off to every 2 seconds
+RUNSYNC_WAIT = 30  # Seconds /runsync may hold the request before we poll
+SAMPLING_PARAMS = {
+    "max_tokens": 4096,
+    "temperature": 0.3,
+    "top_p": 0.95,
+}
+
+# Answer cache - set ANSWER_CACHE_DB to an empty string to keep it in memory only
+ANSWER_CACHE_SIZE = 1000
+ANSWER_CACHE_TTL = 24 * 60 * 60  # 1 day
+ANSWER_CACHE_DB = os.environ.get('ANSWER_CACHE_DB',
+                                 str(Path(__file__).parent / ".cache" / "answers.sqlite3"))
+ANSWER_CACHE = AnswerCache(ANSWER_CACHE_SIZE, ANSWER_CACHE_TTL, ANSWER_CACHE_DB or None)
+
+# Map-reduce batch summaries depend only on the content of their batch, so
+# they are kept apart from ANSWER_CACHE, which drops everything on reload
+BATCH_CACHE_TTL = 7 * 24 * 60 * 60  # 1 week
+BATCH_CACHE_DB = os.environ.get('BATCH_CACHE_DB',
+                                str(Path(__file__).parent / ".cache" / "batch_summaries.sqlite3"))
+BATCH_CACHE = AnswerCache(ANSWER_CACHE_SIZE, BATCH_CACHE_TTL, BATCH_CACHE_DB or None)
+
+# Paraphrased questions reuse an earlier answer above this cosine similarity
+SEMANTIC_CACHE_THRESHOLD = float(os.environ.get('SEMANTIC_CACHE_THRESHOLD', 0.9))
+SEMANTIC_CACHE_SIZE = 100000
+SEMANTIC_CACHE = SemanticCache(SEMANTIC_CACHE_THRESHOLD, SEMANTIC_CACHE_SIZE)
+
+# One client per worker process; request threads run their jobs on it and
+# share its keep-alive connections
+RUNPOD_CLIENT = RunPodClient(ENDPOINT_ID, RUNPOD_API_KEY,
+                             max_concurrency=RUNPOD_MAX_CONCURRENCY,
+                             max_wait_time=MAX_WAIT_TIME,
+                             initial_check_interval=INITIAL_CHECK_INTERVAL,
+                             max_check_interval=CHECK_INTERVAL,
+                             use_runsync=RUNPOD_USE_RUNSYNC,
+                             runsync_wait=RUNSYNC_WAIT)
+
+# Map-reduce prompts of every question share one pool per worker process;
+# questions beyond MAP_REDUCE_MAX_JOBS are turned away instead of queued
+MAP_REDUCE_POOL = ThreadPoolExecutor(max_workers=MAP_REDUCE_CONCURRENCY, thread_name_prefix='map-reduce')
+MAP_REDUCE_SLOTS = threading.BoundedSemaphore(MAP_REDUCE_MAX_JOBS)
 
 # Load transcripts
 TRANSCRIPT_DIR = Path(__file__).parent / "formatted"
-TRANSCRIPTS = []
+SNAPSHOT_FILE = Path(__file__).parent / ".cache" / "corpus.snapshot"
+SNAPSHOT_SCRIPT = Path(__file__).parent / "snapshot.py"
+SNAPSHOT_BUILD_TIMEOUT = 1800  # Seconds a reload may spend rebuilding the snapshot
 
-def load_transcripts():
-    """Load all transcripts into memory."""
-    global TRANSCRIPTS
-    TRANSCRIPTS = []
+# 'memory' keeps the BM25F and search indexes in process; 'sqlite' ingests
+# the transcripts into an FTS5 database and queries it for both
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'memory')
+STORE_FILE = Path(os.environ.get('TRANSCRIPT_DB',
+                                 str(Path(__file__).parent / ".cache" / "transcripts.sqlite3")))
+STORE = None
+STORE_RANK_LIMIT = 2000  # Utterances fetched from bm25() per question
+
+# /api/search paging
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 100
+SEARCH_UTTERANCE_LIMIT = 20  # Matching utterances returned per transcript
+
+# Seconds between checks of TRANSCRIPT_DIR for new or changed files; 0 disables
+WATCH_INTERVAL = float(os.environ.get('WATCH_INTERVAL', 5))
+# Minimum seconds between gunicorn worker restarts after reloads; reloads in
+# between share one restart. Kept above gunicorn's graceful_timeout so at
+# most two generations of workers are alive at once.
+WORKER_RESTART_INTERVAL = float(os.environ.get('WORKER_RESTART_INTERVAL', 600))
+
+# Everything derived from the transcript files. Requests read CORPUS once and
+# use that dict throughout; reloads build a new one and swap the reference,
+# so a request never sees transcripts and index from different generations.
+CORPUS = {
+    'generation': 0,
+    'sources': {},  # filename -> parsed transcript (ingest format)
+    'transcripts': [],
+    'chunks': [],
+    'tables': None,
+    'search_index': None,
+    'signature': None,
+    'clusters': [],  # topic clusters of the loaded transcripts, largest first
+    'summaries': {},  # transcript id -> context item holding its summary
+    'chunk_lookup': {},  # sqlite backend: (store_id, chunk start) -> chunk number
+    'store_positions': {},  # sqlite backend: store_id -> transcript position
+}
+RELOAD_LOCK = threading.Lock()
+WATCHER = None
+
+# Set in the gunicorn master when the app is preloaded (see gunicorn.conf.py):
+# workers then share the master's corpus, and reloads restart them
+SHARED_CORPUS = False
+RESTART_LOCK = threading.Lock()
+RESTART_TIMER = None
+LAST_RESTART = None
+
+def build_corpus(sources: dict, generation: int, tables: dict = None) -> dict:
+    """
+    Build the corpus from parsed transcripts and their derived tables
+    (corpus_tables.derive_tables), as mapped from the snapshot. The tables
+    are derived here when there are none, which costs a pass over every
+    utterance; with them, passages and indexes are views of their arrays.
+    """
+    transcripts = []
+    for filename in sorted(sources):
+        t = sources[filename]
+        if t['utterances']:
+            transcripts.append({
+                'id': t['id'],
+                'store_id': t.get('store_id'),
+                'name': t['name'],
+                'utterances': t['utterances'],
+            })
+    
+    if tables is None:
+        tables = derive_tables(transcripts, indexes=STORE is None)
+    stats = zip(tables['transcript_chars'].tolist(), tables['transcript_tokens'].tolist(),
+                tables['transcript_hashes'].tolist())
+    for t, (chars, tokens, digest) in zip(transcripts, stats):
+        t['char_count'] = chars
+        t['token_count'] = tokens
+        t['content_hash'] = digest.decode('ascii')
     
+    corpus = {
+        'generation': generation,
+        'sources': sources,
+        'transcripts': transcripts,
+        'chunks': Passages(transcripts, tables),
+        'tables': None,
+        'search_index': None,
+        'signature': tables['signature'],
+        'clusters': corpus_clusters(transcripts),
+        'summaries': corpus_summaries(transcripts),
+        'chunk_lookup': {},
+        'store_positions': {},
+    }
+    
+    if STORE is not None:
+        # Retrieval and search run in SQLite; only map its rows back to ours:
+        # (store id, first core utterance) -> chunk number
+        chunk_starts = tables['chunk_starts'].tolist()
+        corpus['chunk_lookup'] = {
+            (t['store_id'], (doc - chunk_starts[i]) * CHUNK_UTTERANCES): doc
+            for i, t in enumerate(transcripts)
+            for doc in range(chunk_starts[i], chunk_starts[i + 1])
+        }
+        corpus['store_positions'] = {t['store_id']: i for i, t in enumerate(transcripts)}
+        return corpus
+    
+    corpus['tables'] = bm25_tables(tables)
+    corpus['search_index'] = utterance_index(tables)
+    return corpus
+
+def corpus_clusters(transcripts: list) -> list:
+    """
+    Topic clusters from the offline clustering job (topic_clusters.py),
+    restricted to the loaded transcripts: [(size, [transcript, ...])],
+    largest first, with each cluster's representatives closest to its
+    centroid first. Transcripts added since the job ran form one more
+    cluster, sampled evenly, so they are still considered. Empty if the
+    job has not been run.
+    """
+    clusters = load_clusters(CLUSTER_FILE)
+    if clusters is None:
+        return []
+    by_id = {t['id']: t for t in transcripts}
+    loaded = []
+    for cluster in clusters['clusters']:
+        representatives = [by_id[i] for i in cluster['representatives'] if i in by_id]
+        if representatives:
+            loaded.append((cluster['size'], representatives))
+    
+    unclustered = [t for t in transcripts if t['id'] not in clusters['assignments']]
+    if unclustered:
+        print(f"Warning: {len(unclustered)} transcripts are newer than {CLUSTER_FILE.name}; "
+              f"run topic_clusters.py to cluster them")
+        step = -(-len(unclustered) // REPRESENTATIVES)
+        loaded.append((len(unclustered), unclustered[::step]))
+        loaded.sort(key=lambda cluster: -cluster[0])
+    return loaded
+
+def corpus_summaries(transcripts: list) -> dict:
+    """
+    Context items for the transcripts that have a current summary from
+    transcript_summaries.py, by transcript id. build_context shows their
+    summary in place of the transcript text.
+    """
+    summaries = load_summaries(SUMMARY_FILE) if USE_SUMMARIES else {}
+    items = {}
+    for t in transcripts:
+        fields = summaries.get(t['content_hash'])
+        if fields:
+            summary = format_summary(fields)
+            items[t['id']] = {
+                'id': f"{t['id']}#summary",
+                'name': t['name'],
+                'summary': summary,
+                'content_hash': content_hash(summary),
+                'char_count': len(summary),
+                'token_count': estimate_tokens(summary),
+            }
+    return items
+
+def install_corpus(corpus: dict):
+    """Make corpus the one new requests use and drop answers from the old one."""
+    global CORPUS
+    ANSWER_CACHE.set_corpus(corpus['signature'])
+    BATCH_CACHE.prune()
+    SEMANTIC_CACHE.clear()
+    CORPUS = corpus
+    indexed = (f"{len(corpus['tables']['postings'])} indexed terms" if corpus['tables']
+               else f"indexed in {STORE_FILE.name}")
+    print(f"Loaded {len(corpus['transcripts'])} transcripts ({len(corpus['chunks'])} passages, "
+          f"{indexed}), generation {corpus['generation']}")
+
+def load_transcripts():
+    """Load all transcripts into memory and build (or reuse) the passage index."""
+    global STORE
     if not TRANSCRIPT_DIR.exists():
         print(f"Warning: Transcript directory not found: {TRANSCRIPT_DIR}")
-        return
+        return None
     
-    import re
-    pattern = r'^((?:Agent|Customer|Speaker \d+))\s*\[starttime:\s*(\d+:\d+)\s*-\s*endtime:\s*(\d+:\d+)\]:\s*(.*)$'
+    stats = file_stats(TRANSCRIPT_DIR)
+    tables = None
+    if STORAGE_BACKEND == 'sqlite':
+        STORE = open_store(STORE_FILE, TRANSCRIPT_DIR)
+        transcripts = STORE.load_transcripts()
+    else:
+        transcripts, tables = load_corpus(TRANSCRIPT_DIR, SNAPSHOT_FILE, with_tables=True)
+    sources = {t['filename']: t for t in transcripts}
+    with RELOAD_LOCK:
+        install_corpus(build_corpus(sources, CORPUS['generation'] + 1, tables))
+    return stats
+
+def reload_transcripts(changed: list, removed: list, stats: dict):
+    """
+    Fold added, changed and removed transcript files into the corpus.
+    The snapshot is rebuilt in a child process (see rebuild_snapshot) and
+    mapped once it is ready; requests keep using the previous corpus until
+    the new one is installed.
+    """
+    with RELOAD_LOCK:
+        print(f"Reloading transcripts: {len(changed)} new or changed, {len(removed)} removed")
+        if STORE is not None:
+            # Row ids change on re-ingest, so reload everything from the store
+            STORE.sync(TRANSCRIPT_DIR, stats)
+            sources = {t['filename']: t for t in STORE.load_transcripts()}
+            tables = None
+        else:
+            snapshot = rebuild_snapshot()
+            if snapshot is None:
+                print(f"Warning: Keeping generation {CORPUS['generation']} of the corpus")
+                return
+            sources = {t['filename']: t for t in snapshot_transcripts(snapshot)}
+            tables = snapshot_tables(snapshot)
+        
+        install_corpus(build_corpus(sources, CORPUS['generation'] + 1, tables))
     
-    for filepath in sorted(TRANSCRIPT_DIR.glob("*.txt")):
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            filename = filepath.stem
-            display_name = re.sub(r'^audio_Call1-', '', filename)
-            display_name = re.sub(r'\.MP3$', '', display_name, flags=re.IGNORECASE)
-            
-            utterances = []
-            for line in content.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
-                match = re.match(pattern, line, re.IGNORECASE)
-                if match:
-                    utterances.append({
-                        'speaker': match.group(1),
-                        'text': match.group(4).strip()
-                    })
-            
-            if utterances:
-                # Create condensed text for context
-                condensed = "\n".join([f"{u['speaker']}: {u['text']}" for u in utterances])
-                TRANSCRIPTS.append({
-                    'id': filename,
-                    'name': display_name,
-                    'utterances': utterances,
-                    'text': condensed,
-                    'char_count': len(condensed)
-                })
-        except Exception as e:
-            print(f"Error loading {filepath.name}: {e}")
-    
-    print(f"Loaded {len(TRANSCRIPTS)} transcripts")
-
-def find_relevant_transcripts(question: str, max_chars: int = MAX_CONTEXT_CHARS) -> list:
+    if SHARED_CORPUS:
+        schedule_worker_restart()
+
+def rebuild_snapshot():
     """
-    Find transcripts relevant to the question.
-    For aggregate questions, sample across all transcripts.
-    For specific questions, use keyword matching.
+    Bring the snapshot up to date by running snapshot.py, which parses only
+    new and changed files and derives the tables, in a child process: this
+    one keeps serving meanwhile instead of spending the GIL on it, and never
+    forks from the watcher thread. Returns the new snapshot memory-mapped,
+    or None if the build failed.
+    """
+    try:
+        subprocess.run([sys.executable, str(SNAPSHOT_SCRIPT), str(TRANSCRIPT_DIR), str(SNAPSHOT_FILE)],
+                       check=True, timeout=SNAPSHOT_BUILD_TIMEOUT)
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"Warning: Could not rebuild snapshot {SNAPSHOT_FILE.name}: {e}")
+        return None
+    return read_snapshot(SNAPSHOT_FILE)
+
+def schedule_worker_restart():
+    """
+    Replace the gunicorn workers, which hold the old corpus, with fresh
+    forks of the master that share the new one. Restarts are at least
+    WORKER_RESTART_INTERVAL apart; a reload before the next one is due
+    waits for it.
     """
+    global RESTART_TIMER
+    with RESTART_LOCK:
+        if RESTART_TIMER is not None:
+            return
+        delay = 0.0
+        if LAST_RESTART is not None:
+            delay = max(0.0, LAST_RESTART + WORKER_RESTART_INTERVAL - time.monotonic())
+        RESTART_TIMER = threading.Timer(delay, restart_workers)
+        RESTART_TIMER.daemon = True
+        RESTART_TIMER.start()
+
+def restart_workers():
+    """
+    SIGHUP the gunicorn master (this process), which forks new workers and
+    shuts down the old ones gracefully: they finish their requests within
+    graceful_timeout, then cancel whatever RunPod jobs are left.
+    """
+    global RESTART_TIMER, LAST_RESTART
+    with RESTART_LOCK:
+        RESTART_TIMER = None
+        LAST_RESTART = time.monotonic()
+    with RELOAD_LOCK:
+        gc.freeze()
+    os.kill(os.getpid(), signal.SIGHUP)
+
+def share_corpus():
+    """
+    Prepare the gunicorn master to fork workers that share its corpus.
+    The transcripts are already memory-mapped from the snapshot and the
+    indexes live in NumPy buffers; freezing the collector keeps it from
+    writing to every object's header in the workers, which would copy
+    their pages. Transcript reloads then happen here only.
+    """
+    global SHARED_CORPUS
+    SHARED_CORPUS = True
+    gc.freeze()
+
+def start_watcher(stats: dict):
+    """Start hot-reloading TRANSCRIPT_DIR unless WATCH_INTERVAL is 0."""
+    global WATCHER
+    if WATCH_INTERVAL <= 0 or stats is None:
+        return
+    WATCHER = CorpusWatcher(TRANSCRIPT_DIR, reload_transcripts, WATCH_INTERVAL, stats)
+    WATCHER.start()
+
+def is_aggregate_question(question: str) -> bool:
+    """True for questions about the corpus as a whole rather than specifics."""
     question_lower = question.lower()
-    
-    # Check if this is an aggregate question
     aggregate_keywords = ['main', 'common', 'most', 'overall', 'general', 'typical', 
                          'usually', 'often', 'frequently', 'issues', 'problems',
                          'painpoints', 'pain points', 'challenges', 'complaints',
                          'summarize', 'summary', 'patterns', 'trends']
+    return any(kw in question_lower for kw in aggregate_keywords)
+
+def find_relevant_transcripts(question: str, max_tokens: int = MAX_CONTEXT_TOKENS,
+                              corpus: dict = None, timings: dict = None) -> list:
+    """
+    Find transcripts relevant to the question.
+    For aggregate questions, sample whole transcripts across the corpus.
+    For specific questions, run RETRIEVAL_STAGES to pick passages drawn
+    from as many different calls as the budget allows.
+    Both branches fill the token budget with pack_context. If timings is
+    given, the milliseconds spent in each stage are added to it.
+    """
+    corpus = corpus or CORPUS
+    timings = {} if timings is None else timings
+    transcripts = corpus['transcripts']
     
-    is_aggregate = any(kw in question_lower for kw in aggregate_keywords)
-    
-    if is_aggregate:
-        # For aggregate questions, sample transcripts evenly
-        # to get a representative view
-        selected = []
-        total_chars = 0
-        step = max(1, len(TRANSCRIPTS) // 30)  # Aim for ~30 transcripts
-        
-        for i in range(0, len(TRANSCRIPTS), step):
-            t = TRANSCRIPTS[i]
-            if total_chars + t['char_count'] > max_chars:
-                break
-            selected.append(t)
-            total_chars += t['char_count']
+    if is_aggregate_question(question):
+        # For aggregate questions, sample representatives of each topic
+        # cluster, and fit as many as possible
+        start_time = time.perf_counter()
+        summaries = corpus['summaries']
+        clusters = [(size, [summaries.get(t['id'], t) for t in representatives])
+                    for size, representatives in corpus['clusters']]
+        if not clusters:
+            # No clusters computed: sample transcripts evenly instead
+            sample_size = SUMMARY_SAMPLE_SIZE if summaries else 30
+            step = max(1, len(transcripts) // sample_size)
+            candidates = [(1.0, summaries.get(transcripts[i]['id'], transcripts[i]))
+                          for i in range(0, len(transcripts), step)]
+        record_timing(timings, 'sample', start_time)
         
+        start_time = time.perf_counter()
+        if clusters:
+            selected = pack_clusters(clusters, max_tokens)
+        else:
+            selected = pack_context(candidates, max_tokens)
+        record_timing(timings, 'pack', start_time)
         return selected
     else:
-        # For specific questions, use keyword matching
-        keywords = [w for w in question_lower.split() if len(w) > 3]
+        candidates = []
+        for name, stage in RETRIEVAL_STAGES:
+            start_time = time.perf_counter()
+            candidates = stage(question, candidates, corpus)
+            record_timing(timings, name, start_time)
         
-        scored = []
-        for t in TRANSCRIPTS:
-            text_lower = t['text'].lower()
-            score = sum(1 for kw in keywords if kw in text_lower)
-            if score > 0:
-                scored.append((score, t))
-        
-        # Sort by score descending
-        scored.sort(key=lambda x: -x[0])
-        
-        selected = []
-        total_chars = 0
-        for score, t in scored:
-            if total_chars + t['char_count'] > max_chars:
-                break
-            selected.append(t)
-            total_chars += t['char_count']
+        start_time = time.perf_counter()
+        selected = pack_context(candidates, max_tokens)
+        record_timing(timings, 'pack', start_time)
         
         # If no matches, fall back to sampling
         if not selected:
-            return find_relevant_transcripts("summarize main issues", max_chars)
+            return find_relevant_transcripts("summarize main issues", max_tokens, corpus, timings)
         
         return selected
 
+def cluster_candidates(clusters: list) -> list:
+    """
+    Candidates for an aggregate question: every cluster's representatives,
+    scored by the share of the corpus their cluster covers and discounted
+    by rank within it. Ordered by rank, then cluster size, so taking a
+    prefix keeps the medoids of every cluster before second calls on a
+    topic. These scores ignore length, so packing by them alone favours
+    several short calls over one long one; pack_clusters covers the
+    largest topics first.
+    """
+    total = sum(size for size, _ in clusters)
+    depth = max((len(representatives) for _, representatives in clusters), default=0)
+    candidates = []
+    for rank in range(depth):
+        for size, representatives in clusters:
+            if rank < len(representatives):
+                candidates.append((size / total / (rank + 1), representatives[rank]))
+    return candidates
+
+def pack_clusters(clusters: list, max_tokens: int) -> list:
+    """
+    Fill max_tokens with representatives of clusters ([(size, [item, ...])],
+    largest first). Topics are covered first: at most one representative
+    per cluster, chosen by pack_groups to cover as much of the corpus as
+    fits, preferring representatives closer to their centroid
+    (REPRESENTATIVE_DECAY per rank). pack_context then fills what is left
+    of the budget from the other representatives, scored as in
+    cluster_candidates.
+    """
+    groups = [[(size * REPRESENTATIVE_DECAY ** rank, item) for rank, item in enumerate(representatives)]
+              for size, representatives in clusters]
+    covered = pack_groups(groups, max_tokens)
+    tokens = sum(item['token_count'] for item in covered)
+    
+    chosen = {item['id'] for item in covered}
+    rest = [(score, item) for score, item in cluster_candidates(clusters) if item['id'] not in chosen]
+    return covered + pack_context(rest, max_tokens - tokens)
+
+def record_timing(timings: dict, stage: str, start_time: float):
+    """Add the milliseconds since start_time to timings[stage]."""
+    elapsed = (time.perf_counter() - start_time) * 1000
+    timings[stage] = round(timings.get(stage, 0.0) + elapsed, 3)
+
+def generate_candidates(question: str, candidates: list, corpus: dict) -> list:
+    """
+    First retrieval stage: the RERANK_CANDIDATES best passages by BM25F
+    over the inverted index (or bm25() in the SQLite store), best first.
+    Cheap enough to run over every passage in the corpus.
+    """
+    chunks = corpus['chunks']
+    if corpus['tables'] is None:
+        scored = sorted(store_chunk_scores(question, corpus).items(), key=lambda item: -item[1])
+        return [(score, chunks[doc]) for doc, score in scored[:RERANK_CANDIDATES]]
+    
+    scores = bm25_scores(corpus['tables'], query_terms(question))
+    docs = scores.nonzero()[0]
+    if len(docs) > RERANK_CANDIDATES:
+        docs = docs[np.argpartition(-scores[docs], RERANK_CANDIDATES - 1)[:RERANK_CANDIDATES]]
+    docs = docs[np.argsort(-scores[docs], kind='stable')]
+    return [(float(scores[doc]), chunks[doc]) for doc in docs]
+
+def rerank_candidates(question: str, candidates: list, corpus: dict) -> list:
+    """
+    Second retrieval stage: rescore the candidates with features too costly
+    for the whole corpus. A passage's BM25F score is boosted by how many
+    distinct question terms it covers (a term counts fully when the
+    customer says it, less when only the agent does) and by how close
+    together two different question terms occur in it.
+    """
+    terms = set(query_terms(question))
+    if not terms:
+        return candidates
+    best_weight = max(FIELD_WEIGHTS.values())
+    
+    reranked = []
+    for score, chunk in candidates:
+        term_weights = {}
+        last_seen = {}
+        closest = None
+        position = 0
+        for u in chunk['utterances']:
+            weight = FIELD_WEIGHTS[u['speaker_type']]
+            for token in tokenize(u['text']):
+                if token in terms:
+                    term_weights[token] = max(term_weights.get(token, 0.0), weight)
+                    for other, seen in last_seen.items():
+                        if other != token and (closest is None or position - seen < closest):
+                            closest = position - seen
+                    last_seen[token] = position
+                position += 1
+        
+        coverage = sum(term_weights.values()) / (best_weight * len(terms))
+        proximity = 1.0 / closest if closest else 0.0
+        boost = 1 + RERANK_COVERAGE_WEIGHT * coverage + RERANK_PROXIMITY_WEIGHT * proximity
+        reranked.append((score * boost, chunk))
+    
+    reranked.sort(key=lambda x: -x[0])
+    return reranked
+
+def diversify_candidates(question: str, candidates: list, corpus: dict) -> list:
+    """
+    Last retrieval stage: keep at most MAX_PASSAGES_PER_TRANSCRIPT passages
+    per call and MAX_PACK_CANDIDATES overall for the packer.
+    """
+    selected = []
+    per_transcript = {}
+    for score, chunk in candidates:
+        if len(selected) >= MAX_PACK_CANDIDATES:
+            break
+        if per_transcript.get(chunk['name'], 0) >= MAX_PASSAGES_PER_TRANSCRIPT:
+            continue
+        selected.append((score, chunk))
+        per_transcript[chunk['name']] = per_transcript.get(chunk['name'], 0) + 1
+    return selected
+
+# Retrieval for specific questions, in order. Each stage takes
+# (question, candidates, corpus) and returns (score, passage) candidates,
+# best first; the first stage is handed an empty list.
+RETRIEVAL_STAGES = [
+    ('candidates', generate_candidates),
+    ('rerank', rerank_candidates),
+    ('diversify', diversify_candidates),
+]
+
+def store_chunk_scores(question: str, corpus: dict) -> dict:
+    """
+    Score passages from the store's FTS5 bm25() ranking of utterances:
+    each passage sums the scores of its utterances, weighted by speaker
+    like the in-memory BM25F fields. Returns {chunk number: score}.
+    """
+    lookup = corpus['chunk_lookup']
+    scores = {}
+    for store_id, position, speaker, score in STORE.rank_utterances(query_terms(question), STORE_RANK_LIMIT):
+        doc = lookup.get((store_id, position - position % CHUNK_UTTERANCES))
+        if doc is not None:
+            scores[doc] = scores.get(doc, 0.0) + score * FIELD_WEIGHTS[speaker_type(speaker)]
+    return scores
+
 def build_context(transcripts: list, question: str) -> str:
-    """Build the context string for the LLM."""
-    context_parts = []
+    """
+    Build the context string for the LLM.
+    Passages from the same call are grouped under one header in conversation
+    order, with overlapping context windows merged. Summary items (see
+    corpus_summaries) stand in for their whole transcript.
+    """
+    groups = {}
+    for item in transcripts:
+        groups.setdefault(item['name'], []).append(item)
     
-    for i, t in enumerate(transcripts, 1):
-        context_parts.append(f"=== Transcript {i} (ID: {t['name']}) ===\n{t['text']}\n")
+    context_parts = []
+    for i, (name, items) in enumerate(groups.items(), 1):
+        if 'summary' in items[0]:
+            text = items[0]['summary']
+        elif 'transcript' not in items[0]:
+            text = passage_text(items[0])
+        else:
+            utterances = items[0]['transcript']['utterances']
+            ranges = []
+            for start, end in sorted((p['start'], p['end']) for p in items):
+                if ranges and start <= ranges[-1][1]:
+                    ranges[-1][1] = max(ranges[-1][1], end)
+                else:
+                    ranges.append([start, end])
+            text = "\n[...]\n".join(format_utterances(utterances[start:end]) for start, end in ranges)
+        context_parts.append(f"=== Transcript {i} (ID: {name}) ===\n{text}\n")
     
     return "\n".join(context_parts)
 
@@ -194,55 +669,31 @@ def extract_text_from_output(output) -> str:
     
     return str(output)
 
-def call_runpod(prompt: str) -> str:
-    """Submit job to RunPod and wait for response."""
+def build_payload(prompt: str, stream: bool = False) -> dict:
+    """Build the RunPod job input for a prompt."""
     payload = {
         "input": {
             "prompt": prompt,
-            "sampling_params": {
-                "max_tokens": 4096,
-                "temperature": 0.3,
-                "top_p": 0.95,
-            }
+            "sampling_params": SAMPLING_PARAMS,
         }
     }
-    
+    if stream:
+        payload["input"]["stream"] = True
+    return payload
+
+def run_prompt(prompt: str) -> str:
+    """Submit job to RunPod and wait for response, raising RunPodError on failure."""
+    result = RUNPOD_CLIENT.run(build_payload(prompt))
+    output = result.get('output', {})
+    text = extract_text_from_output(output)
+    return text.strip()
+
+def call_runpod(prompt: str) -> str:
+    """Submit job to RunPod and wait for response."""
     try:
-        response = requests.post(RUNPOD_URL, headers=RUNPOD_HEADERS, json=payload, timeout=30)
-        response.raise_for_status()
-        result = response.json()
-    except Exception as e:
-        return f"Error submitting to RunPod: {str(e)}"
-    
-    job_id = result.get('id')
-    if not job_id:
-        return f"Error: No job ID returned. Response: {result}"
-    
-    status_url = f"{RUNPOD_STATUS_URL}/{job_id}"
-    start_time = time.time()
-    
-    while time.time() - start_time < MAX_WAIT_TIME:
-        try:
-            response = requests.get(status_url, headers=RUNPOD_HEADERS, timeout=30)
-            response.raise_for_status()
-            result = response.json()
-        except Exception as e:
-            return f"Error checking status: {str(e)}"
-        
-        status = result.get('status')
-        
-        if status == 'COMPLETED':
-            output = result.get('output', {})
-            text = extract_text_from_output(output)
-            return text.strip()
-        elif status == 'FAILED':
-            return f"Job failed: {result.get('error', 'Unknown error')}"
-        elif status in ['IN_QUEUE', 'IN_PROGRESS']:
-            time.sleep(CHECK_INTERVAL)
-        else:
-            return f"Unknown status: {status}"
-    
-    return "Error: Request timed out"
+        return run_prompt(prompt)
+    except RunPodError as e:
+        return str(e)
 
 @app.route('/')
 def serve_index():
@@ -256,8 +707,6 @@ def serve_static(filename):
 
 def format_response(raw_response: str) -> str:
     """Format the LLM response into clean HTML."""
-    import re
-    
     text = raw_response.strip()
     
     # Remove thinking tags and content before them
@@ -349,12 +798,11 @@ def format_response(raw_response: str) -> str:
     
     # Format plain text response nicely
     # First, highlight transcript references
-    text = re.sub(r'Transcript\s*(\d+)', r'<span class="transcript-ref">Transcript \1</span>', text)
-    text = re.sub(r'\(ID:\s*([a-f0-9-]+)\)', r'<span class="transcript-ref">\1</span>', text)
+    text = highlight_references(text)
     
     # Split into sentences for better formatting
     # Break up long paragraphs into readable chunks
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = SENTENCE_SPLIT.split(text)
     
     if len(sentences) <= 3:
         # Short response - just format nicely
@@ -363,100 +811,671 @@ def format_response(raw_response: str) -> str:
     
     # Group sentences into logical paragraphs (2-3 sentences each)
     html_parts = ["<div class='response-content'>"]
-    current_para = []
-    step_count = 0
+    state = {'para': [], 'steps': 0}
     
-    for i, sentence in enumerate(sentences):
-        sentence = sentence.strip()
-        if not sentence:
-            continue
-            
-        # Apply inline bold
-        sentence = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', sentence)
-        
-        # Check if this looks like a step/process
-        if re.match(r'^(First|Second|Third|Then|Next|Finally|Once|After|If)', sentence, re.IGNORECASE):
-            # Output previous paragraph if any
-            if current_para:
-                html_parts.append(f"<p>{' '.join(current_para)}</p>")
-                current_para = []
-            
-            step_count += 1
-            html_parts.append(f"<div class='step-item'><div class='step-number'>{step_count}</div><div class='step-content'>{sentence}</div></div>")
-        # Check for "For example" or specific examples
-        elif re.match(r'^For example|^In Transcript|^As seen in', sentence, re.IGNORECASE):
-            if current_para:
-                html_parts.append(f"<p>{' '.join(current_para)}</p>")
-                current_para = []
-            html_parts.append(f"<div class='finding'><div class='finding-desc'>{sentence}</div></div>")
-        else:
-            current_para.append(sentence)
-            # Group 2-3 sentences per paragraph
-            if len(current_para) >= 2:
-                html_parts.append(f"<p>{' '.join(current_para)}</p>")
-                current_para = []
+    for sentence in sentences:
+        html_parts.extend(render_sentence(sentence, state))
     
     # Output remaining sentences
-    if current_para:
-        html_parts.append(f"<p>{' '.join(current_para)}</p>")
+    html_parts.extend(flush_paragraph(state))
     
     html_parts.append("</div>")
     return ''.join(html_parts)
 
-@app.route('/api/ask', methods=['POST'])
-def ask_question():
-    """Handle question from the chat interface."""
-    data = request.json
-    question = data.get('question', '').strip()
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+# Some models open their reasoning with <think>, others only close it with
+# </think>. Until one of the tags arrives, this much streamed text is held
+# back before the preview assumes the answer has no reasoning in front.
+REASONING_HOLDBACK = 2000
+
+def highlight_references(text: str) -> str:
+    """Wrap transcript references in the answer with highlight spans."""
+    text = re.sub(r'Transcript\s*(\d+)', r'<span class="transcript-ref">Transcript \1</span>', text)
+    text = re.sub(r'\(ID:\s*([a-f0-9-]+)\)', r'<span class="transcript-ref">\1</span>', text)
+    return text
+
+def flush_paragraph(state: dict) -> list:
+    """Close the paragraph being collected in state, if any."""
+    if not state['para']:
+        return []
+    html = f"<p>{' '.join(state['para'])}</p>"
+    state['para'] = []
+    return [html]
+
+def render_sentence(sentence: str, state: dict) -> list:
+    """
+    Render one sentence of a plain-text answer.
+    state carries the open paragraph and step counter between calls; the
+    return value is the list of HTML blocks this sentence completed.
+    """
+    sentence = sentence.strip()
+    if not sentence:
+        return []
     
-    if not question:
-        return jsonify({'error': 'No question provided'}), 400
+    # Apply inline bold
+    sentence = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', sentence)
+    
+    # Check if this looks like a step/process
+    if re.match(r'^(First|Second|Third|Then|Next|Finally|Once|After|If)', sentence, re.IGNORECASE):
+        # Output previous paragraph if any
+        html_parts = flush_paragraph(state)
+        state['steps'] += 1
+        html_parts.append(f"<div class='step-item'><div class='step-number'>{state['steps']}</div><div class='step-content'>{sentence}</div></div>")
+        return html_parts
     
-    if not TRANSCRIPTS:
-        return jsonify({'error': 'No transcripts loaded'}), 500
+    # Check for "For example" or specific examples
+    if re.match(r'^For example|^In Transcript|^As seen in', sentence, re.IGNORECASE):
+        html_parts = flush_paragraph(state)
+        html_parts.append(f"<div class='finding'><div class='finding-desc'>{sentence}</div></div>")
+        return html_parts
+    
+    state['para'].append(sentence)
+    # Group 2-3 sentences per paragraph
+    if len(state['para']) >= 2:
+        return flush_paragraph(state)
+    return []
+
+class StreamingFormatter:
+    """
+    Formats a streamed LLM response as it arrives.
+    Text is buffered until a sentence completes, then rendered with the same
+    rules as the plain-text path of format_response. Reasoning before
+    </think> and JSON answers are held back, as is the first
+    REASONING_HOLDBACK characters of an answer without either think tag;
+    finish() returns the fully formatted answer, which replaces the
+    streamed preview.
+    """
+
+    def __init__(self):
+        self.raw = ''
+        self.pending = ''
+        self.think_end = -1
+        self.state = {'para': [], 'steps': 0}
+
+    def feed(self, text: str) -> tuple:
+        """Add streamed text; return (html, reset) for the preview."""
+        self.raw += text
+        reset = False
+        
+        think_end = self.raw.rfind('</think>')
+        if think_end != self.think_end:
+            # Everything so far was reasoning; restart the preview after it
+            self.think_end = think_end
+            self.pending = self.raw[think_end + len('</think>'):]
+            self.state = {'para': [], 'steps': 0}
+            reset = True
+        else:
+            self.pending += text
+        
+        thinking = self.raw.rfind('<think>') > self.think_end
+        undecided = self.think_end < 0 and len(self.raw) < REASONING_HOLDBACK
+        if thinking or undecided or self.pending.lstrip().startswith('{'):
+            return '', reset
+        
+        # The last piece may still be mid-sentence
+        sentences = SENTENCE_SPLIT.split(self.pending.lstrip())
+        self.pending = sentences[-1]
+        html_parts = []
+        for sentence in sentences[:-1]:
+            html_parts.extend(render_sentence(highlight_references(sentence), self.state))
+        return ''.join(html_parts), reset
+
+    def finish(self) -> str:
+        """Return the final formatted answer."""
+        return format_response(self.raw)
+
+def prepare_question(question: str):
+    """
+    Select context for a question and build its prompt.
+    Returns (prompt, metadata, cache keys) or (None, error message, None),
+    the cache keys being the ANSWER_CACHE key and the context_key the
+    semantic cache matches on.
+    """
+    corpus = CORPUS
+    total_transcripts = len(corpus['transcripts'])
+    if not total_transcripts:
+        return None, 'No transcripts loaded', None
     
     # Find relevant transcripts
-    relevant = find_relevant_transcripts(question)
+    timings = {}
+    relevant = find_relevant_transcripts(question, corpus=corpus, timings=timings)
     
     if not relevant:
-        return jsonify({'error': 'Could not find relevant transcripts'}), 500
+        return None, 'Could not find relevant transcripts', None
     
     # Build context and prompt
+    num_transcripts = len({t['name'] for t in relevant})
+    utilization = context_utilization(relevant, MAX_CONTEXT_TOKENS)
     context = build_context(relevant, question)
-    prompt = create_prompt(question, context, len(relevant), len(TRANSCRIPTS))
+    prompt = create_prompt(question, context, num_transcripts, total_transcripts)
     
-    # Call RunPod
-    raw_answer = call_runpod(prompt)
+    print(f"CONTEXT: {len(relevant)} items from {num_transcripts} transcripts, "
+          f"{utilization:.0%} of {MAX_CONTEXT_TOKENS} token budget, "
+          f"retrieval {', '.join(f'{stage} {ms:.1f} ms' for stage, ms in timings.items())}")
     
-    # Log raw output for debugging
+    item_ids = [t['id'] for t in relevant]
+    cache_keys = (ANSWER_CACHE.make_key(question, item_ids, SAMPLING_PARAMS),
+                  context_key(item_ids, SAMPLING_PARAMS))
+    
+    return prompt, {
+        'transcripts_analyzed': num_transcripts,
+        'context_utilization': round(utilization, 3),
+        'total_transcripts': total_transcripts,
+        'retrieval_ms': timings
+    }, cache_keys
+
+def find_cached_answer(question: str, cache_keys: tuple):
+    """
+    Look up an answer in the exact cache, then among similar questions.
+    Returns the response fields to send, or None on a miss.
+    """
+    cache_key, context = cache_keys
+    cached = ANSWER_CACHE.get(cache_key)
+    if cached:
+        return {**cached, 'cached': True}
+    
+    similar = SEMANTIC_CACHE.lookup(question, context)
+    if similar:
+        value, similarity, similar_question = similar
+        return {
+            **value,
+            'cached': True,
+            'similar_question': similar_question,
+            'similarity': round(similarity, 3)
+        }
+    
+    return None
+
+def store_answer(question: str, cache_keys: tuple, answer: dict):
+    """Remember a successful answer in both caches."""
+    cache_key, context = cache_keys
+    ANSWER_CACHE.put(cache_key, answer)
+    SEMANTIC_CACHE.add(question, answer, context)
+
+def log_raw_output(raw_answer: str):
+    """Log raw model output for debugging."""
     print("\n" + "="*60)
     print("RAW RUNPOD OUTPUT:")
     print("="*60)
     print(raw_answer)
     print("="*60 + "\n")
+
+MAP_PROMPT = """You are reviewing {num_transcripts} customer service transcripts. Summarize them for an analysis that will combine many such summaries.
+
+{context}
+
+List each distinct customer issue on its own line: the issue, how it was resolved (or that it was not), the customer's sentiment, and the transcript IDs where it came up. Be concise."""
+
+REDUCE_PROMPT = """You are answering a question about {num_transcripts} customer service transcripts. They were reviewed in {num_batches} groups; these are the notes from each group.
+
+{notes}
+
+Question: {question}
+
+Answer directly, weighing how often each point comes up across the groups. Cite transcript IDs when giving examples."""
+
+def map_reduce_items(question: str, corpus: dict) -> list:
+    """
+    Everything a map-reduce answer covers, in order: for aggregate
+    questions the topic cluster representatives (or all transcripts), for
+    specific ones the passages RETRIEVAL_STAGES keep. At most
+    MAP_REDUCE_MAX_ITEMS.
+    """
+    if not is_aggregate_question(question):
+        candidates = []
+        for _, stage in RETRIEVAL_STAGES:
+            candidates = stage(question, candidates, corpus)
+        if candidates:
+            return [item for _, item in candidates[:MAP_REDUCE_MAX_ITEMS]]
+    
+    candidates = cluster_candidates(corpus['clusters'])
+    if candidates:
+        items = [item for _, item in candidates[:MAP_REDUCE_MAX_ITEMS]]
+    else:
+        transcripts = corpus['transcripts']
+        items = transcripts[::-(-len(transcripts) // MAP_REDUCE_MAX_ITEMS)]
+    return [corpus['summaries'].get(t['id'], t) for t in items]
+
+def split_item(item: dict, max_tokens: int) -> list:
+    """
+    item if it fits in max_tokens, otherwise its utterances split into
+    consecutive passages that do, in order (a single longer utterance
+    becomes a passage of its own). Summary items are never split.
+    """
+    if item['token_count'] <= max_tokens or 'summary' in item:
+        return [item]
+    if 'transcript' in item:
+        transcript, first, last = item['transcript'], item['start'], item['end']
+    else:
+        transcript, first, last = item, 0, len(item['utterances'])
+    utterances = transcript['utterances']
+    
+    def passage(start, end):
+        text = format_utterances(utterances[start:end])
+        return {
+            'id': f"{transcript['id']}#{start}-{end}",
+            'name': transcript['name'],
+            'transcript': transcript,
+            'start': start,
+            'end': end,
+            'char_count': len(text),
+            'token_count': estimate_tokens(text),
+            'content_hash': content_hash(text),
+        }
+    
+    passages = []
+    start = first
+    tokens = 0
+    for i in range(first, last):
+        # Each line costs its own tokens plus the newline joining it on
+        cost = estimate_tokens(format_utterances(utterances[i:i + 1])) + 1
+        if i > start and tokens + cost > max_tokens:
+            passages.append(passage(start, i))
+            start = i
+            tokens = 0
+        tokens += cost
+    passages.append(passage(start, last))
+    return passages
+
+def shard_items(items: list, max_tokens: int) -> list:
+    """Split items, in order, into batches of at most max_tokens each."""
+    batches = []
+    tokens = 0
+    for item in items:
+        if not batches or tokens + item['token_count'] > max_tokens:
+            batches.append([])
+            tokens = 0
+        batches[-1].append(item)
+        tokens += item['token_count']
+    return batches
+
+def summarize_batch(batch: list) -> tuple:
+    """
+    Map step: summarize one batch, independently of the question, so the
+    summary is cached by the batch's content and reused by any question
+    that covers the same batch, across corpus reloads. Returns (summary
+    or None on failure, whether it came from the cache).
+    """
+    # Keyed on the prompt template, so editing it invalidates old summaries
+    contents = [f"{item['name']}#{item['content_hash']}" for item in batch]
+    cache_key = BATCH_CACHE.make_key(MAP_PROMPT, contents, SAMPLING_PARAMS)
+    cached = BATCH_CACHE.get(cache_key)
+    if cached:
+        return cached['summary'], True
+    
+    prompt = MAP_PROMPT.format(num_transcripts=len({item['name'] for item in batch}),
+                               context=build_context(batch, ''))
+    try:
+        summary = strip_reasoning(run_prompt(prompt))
+    except RunPodError as e:
+        print(f"Warning: Batch summary failed: {e}")
+        return None, False
+    BATCH_CACHE.put(cache_key, {'summary': summary})
+    return summary, False
+
+def strip_reasoning(raw: str) -> str:
+    """Drop reasoning before </think> from a model response."""
+    return raw.split('</think>')[-1].strip()
+
+def shard_summaries(summaries: list) -> list:
+    """Group summaries into batches that fit MAX_CONTEXT_TOKENS."""
+    notes = [{'text': summary, 'token_count': estimate_tokens(summary)} for summary in summaries]
+    return [[note['text'] for note in group] for group in shard_items(notes, MAX_CONTEXT_TOKENS)]
+
+def reduce_prompt(question: str, num_transcripts: int, summaries: list) -> str:
+    """Prompt answering question from batch summaries."""
+    notes = "\n\n".join(f"=== Notes {i} ===\n{summary}" for i, summary in enumerate(summaries, 1))
+    return REDUCE_PROMPT.format(num_transcripts=num_transcripts, num_batches=len(summaries),
+                                notes=notes, question=question)
+
+def partial_answer(prompt: str):
+    """Run an intermediate reduce prompt; None if it fails."""
+    try:
+        return strip_reasoning(run_prompt(prompt))
+    except RunPodError as e:
+        print(f"Warning: Partial answer failed: {e}")
+        return None
+
+def run_in_pool(fn, items: list, deadline: float):
+    """
+    Run fn over items in MAP_REDUCE_POOL, yielding (index, result) as each
+    finishes, until deadline (time.monotonic()). Items not started by then,
+    or when the caller closes the generator, are cancelled.
+    """
+    futures = {MAP_REDUCE_POOL.submit(fn, item): i for i, item in enumerate(items)}
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                return
+            for future in done:
+                yield futures[future], future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+def answer_map_reduce(question: str):
+    """
+    Answer from every relevant transcript instead of one context window:
+    shard them into MAX_CONTEXT_TOKENS batches, splitting transcripts too
+    long for one (split_item), summarize the batches concurrently (map),
+    then answer from the summaries (reduce), reducing them in rounds
+    while they do not fit one prompt.
+    Generates (event, data): `meta` with the context stats, `progress` as
+    prompts finish, then `done` with the response fields or `error`. The
+    answer is abandoned after MAP_REDUCE_TIMEOUT; closing the generator
+    cancels the prompts not yet started.
+    """
+    corpus = CORPUS
+    if not corpus['transcripts']:
+        yield 'error', {'error': 'No transcripts loaded'}
+        return
+    items = map_reduce_items(question, corpus)
+    if not items:
+        yield 'error', {'error': 'Could not find relevant transcripts'}
+        return
+    
+    num_transcripts = len({item['name'] for item in items})
+    cache_key = ANSWER_CACHE.make_key(question, [item['id'] for item in items],
+                                      {**SAMPLING_PARAMS, 'mode': 'map_reduce'})
+    meta = {
+        'mode': 'map_reduce',
+        'transcripts_analyzed': num_transcripts,
+        'total_transcripts': len(corpus['transcripts']),
+    }
+    yield 'meta', meta
+    cached = ANSWER_CACHE.get(cache_key)
+    if cached:
+        yield 'done', {**cached, **meta, 'cached': True}
+        return
+    
+    if not MAP_REDUCE_SLOTS.acquire(blocking=False):
+        yield 'error', {'error': 'Too many map-reduce answers in progress, try again shortly', 'status': 503}
+        return
+    try:
+        deadline = time.monotonic() + MAP_REDUCE_TIMEOUT
+        pieces = [piece for item in items for piece in split_item(item, MAX_CONTEXT_TOKENS)]
+        batches = shard_items(pieces, MAX_CONTEXT_TOKENS)
+        results = [None] * len(batches)
+        progress = {'stage': 'map', 'prompts': len(batches), 'done': 0, 'cached': 0}
+        for i, (summary, cached) in run_in_pool(summarize_batch, batches, deadline):
+            results[i] = summary
+            progress['done'] += 1
+            progress['cached'] += cached
+            yield 'progress', dict(progress)
+        summaries = [summary for summary in results if summary]
+        if not summaries:
+            yield 'error', {'error': 'Could not summarize any transcripts'}
+            return
+        meta['batches'] = len(batches)
+        meta['cached_batches'] = progress['cached']
+        meta['failed_batches'] = len(batches) - len(summaries)
+        print(f"MAP-REDUCE: {len(items)} items from {num_transcripts} transcripts in {len(batches)} batches, "
+              f"{meta['cached_batches']} cached, {meta['failed_batches']} failed")
+        
+        # Reduce in rounds while the notes do not fit one prompt
+        groups = shard_summaries(summaries)
+        while 1 < len(groups) < len(summaries):
+            prompts = [reduce_prompt(question, num_transcripts, group) for group in groups]
+            partials = [None] * len(prompts)
+            progress = {'stage': 'reduce', 'prompts': len(prompts), 'done': 0}
+            for i, summary in run_in_pool(partial_answer, prompts, deadline):
+                partials[i] = summary
+                progress['done'] += 1
+                yield 'progress', dict(progress)
+            summaries = [summary for summary in partials if summary]
+            if not summaries:
+                yield 'error', {'error': 'Could not combine the transcript summaries'}
+                return
+            groups = shard_summaries(summaries)
+        
+        try:
+            final = list(run_in_pool(run_prompt, [reduce_prompt(question, num_transcripts, summaries)], deadline))
+        except RunPodError as e:
+            yield 'error', {'error': str(e)}
+            return
+        if not final:
+            yield 'error', {'error': f'No answer within {MAP_REDUCE_TIMEOUT} seconds'}
+            return
+        raw_answer = final[0][1]
+    finally:
+        MAP_REDUCE_SLOTS.release()
+    log_raw_output(raw_answer)
+    
+    answer = {
+        'answer': format_response(raw_answer),
+        'raw_output': raw_answer,
+    }
+    ANSWER_CACHE.put(cache_key, answer)
+    yield 'done', {**answer, **meta, 'cached': False}
+
+@app.route('/api/ask', methods=['POST'])
+def ask_question():
+    """
+    Handle question from the chat interface. With "mode": "map_reduce" the
+    answer covers every relevant transcript (see answer_map_reduce)
+    instead of those that fit one prompt; /api/ask/stream reports its
+    progress as it goes.
+    """
+    data = request.json
+    question = data.get('question', '').strip()
+    
+    if not question:
+        return jsonify({'error': 'No question provided'}), 400
+    
+    if data.get('mode') == 'map_reduce':
+        for event, payload in answer_map_reduce(question):
+            if event == 'done':
+                return jsonify(payload)
+            if event == 'error':
+                return jsonify({'error': payload['error']}), payload.get('status', 500)
+    
+    prompt, meta, cache_keys = prepare_question(question)
+    if prompt is None:
+        return jsonify({'error': meta}), 500
+    
+    cached = find_cached_answer(question, cache_keys)
+    if cached:
+        return jsonify({**cached, **meta})
+    
+    # Call RunPod
+    try:
+        raw_answer = run_prompt(prompt)
+        failed = False
+    except RunPodError as e:
+        raw_answer = str(e)
+        failed = True
+    log_raw_output(raw_answer)
     
     # Format the response
     formatted_answer = format_response(raw_answer)
     
-    return jsonify({
+    answer = {
         'answer': formatted_answer,
         'raw_output': raw_answer,  # Include raw output for debugging
-        'transcripts_analyzed': len(relevant),
-        'total_transcripts': len(TRANSCRIPTS)
+    }
+    if not failed:
+        store_answer(question, cache_keys, answer)
+    
+    return jsonify({**answer, **meta, 'cached': False})
+
+def sse_event(event: str, data: dict) -> str:
+    """Encode one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.route('/api/ask/stream', methods=['POST'])
+def ask_question_stream():
+    """
+    Stream an answer as Server-Sent Events.
+    Emits `meta` with the context stats, `delta` with HTML for each batch of
+    completed sentences (`reset` clears the preview), then `done` with the
+    final formatted answer, or `error`. With "mode": "map_reduce", emits
+    the events of answer_map_reduce, with `progress` in place of `delta`.
+    """
+    data = request.json
+    question = data.get('question', '').strip()
+    
+    if not question:
+        return jsonify({'error': 'No question provided'}), 400
+    
+    if data.get('mode') == 'map_reduce':
+        def generate_map_reduce():
+            # Closing this generator (client disconnect) cancels the
+            # prompts not yet started
+            events = answer_map_reduce(question)
+            try:
+                for event, payload in events:
+                    yield sse_event(event, payload)
+            finally:
+                events.close()
+        
+        return Response(stream_with_context(generate_map_reduce()), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    
+    prompt, meta, cache_keys = prepare_question(question)
+    if prompt is None:
+        return jsonify({'error': meta}), 500
+    
+    def generate():
+        yield sse_event('meta', meta)
+        
+        cached = find_cached_answer(question, cache_keys)
+        if cached:
+            yield sse_event('done', {**cached, **meta})
+            return
+        
+        formatter = StreamingFormatter()
+        
+        # Closing this generator (client disconnect) closes the RunPod
+        # stream, which cancels the job
+        try:
+            for output in RUNPOD_CLIENT.stream(build_payload(prompt, stream=True)):
+                html, reset = formatter.feed(extract_text_from_output(output))
+                if html or reset:
+                    yield sse_event('delta', {'html': html, 'reset': reset})
+        except RunPodError as e:
+            yield sse_event('error', {'error': str(e)})
+            return
+        
+        log_raw_output(formatter.raw)
+        answer = {
+            'answer': formatter.finish(),
+            'raw_output': formatter.raw.strip(),
+        }
+        store_answer(question, cache_keys, answer)
+        yield sse_event('done', {**answer, **meta, 'cached': False})
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+def int_arg(name: str, default: int, low: int, high: int) -> int:
+    """Read an integer query parameter, clamped to [low, high]."""
+    try:
+        value = int(request.args.get(name, default))
+    except ValueError:
+        value = default
+    return max(low, min(high, value))
+
+def search_store(corpus: dict, query: str, case_sensitive: bool, speaker: str) -> tuple:
+    """search_utterances with candidates from the store's trigram index."""
+    terms = parse_search_query(query)
+    if not terms:
+        return terms, []
+    
+    rows = STORE.substring_candidates([term['value'] for term in terms])
+    if rows is None:
+        groups = [(position, None) for position in range(len(corpus['transcripts']))]
+    else:
+        positions = corpus['store_positions']
+        grouped = {}
+        for store_id, index in rows:
+            if store_id in positions:
+                grouped.setdefault(positions[store_id], []).append(index)
+        groups = sorted(grouped.items())
+    return terms, verify_candidates(corpus['transcripts'], groups, terms, case_sensitive, speaker)
+
+@app.route('/api/search', methods=['GET'])
+def search():
+    """
+    Search utterances with the search page's query language.
+    Parameters: q, case_sensitive (1/0), speaker (all/agent/customer),
+    page (from 1), page_size, utterance_limit. Results are ranked by match
+    count; each utterance carries [start, end) highlight offsets into text.
+    """
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'error': 'No query provided'}), 400
+    
+    case_sensitive = request.args.get('case_sensitive', '0') in ('1', 'true')
+    speaker = request.args.get('speaker', 'all')
+    if speaker not in ('all', 'agent', 'customer'):
+        return jsonify({'error': f"Unknown speaker filter: {speaker}"}), 400
+    page = int_arg('page', 1, 1, 1 << 30)
+    page_size = int_arg('page_size', SEARCH_PAGE_SIZE, 1, SEARCH_MAX_PAGE_SIZE)
+    utterance_limit = int_arg('utterance_limit', SEARCH_UTTERANCE_LIMIT, 0, 10000)
+    
+    corpus = CORPUS
+    start_time = time.perf_counter()
+    if corpus['search_index'] is None:
+        terms, results = search_store(corpus, query, case_sensitive, speaker)
+    else:
+        terms, results = search_utterances(corpus['search_index'], corpus['transcripts'],
+                                           query, case_sensitive, speaker)
+    search_time = time.perf_counter() - start_time
+    
+    pattern = highlight_pattern(terms, case_sensitive) if terms else None
+    page_results = []
+    for matches, position, indices in results[(page - 1) * page_size:page * page_size]:
+        transcript = corpus['transcripts'][position]
+        utterances = []
+        for i in indices[:utterance_limit]:
+            u = transcript['utterances'][i]
+            utterances.append({
+                'index': i,
+                'speaker': u['speaker'],
+                'speaker_type': u['speaker_type'],
+                'start': u['start'],
+                'end': u['end'],
+                'text': u['text'],
+                'highlights': highlight_offsets(u['text'], pattern)
+            })
+        page_results.append({
+            'id': transcript['id'],
+            'name': transcript['name'],
+            'match_count': matches,
+            'utterance_count': len(indices),
+            'utterances': utterances
+        })
+    
+    return jsonify({
+        'query': query,
+        'terms': terms,
+        'total_results': len(results),
+        'total_matches': sum(result[0] for result in results),
+        'page': page,
+        'page_size': page_size,
+        'results': page_results,
+        'search_time_ms': round(search_time * 1000, 2),
+        'reload_generation': corpus['generation']
     })
 
 @app.route('/api/status', methods=['GET'])
 def get_status():
-    """Return server status and transcript count."""
+    """Return server status, transcript count and corpus reload generation."""
+    corpus = CORPUS
     return jsonify({
         'status': 'ok',
-        'transcripts_loaded': len(TRANSCRIPTS)
+        'transcripts_loaded': len(corpus['transcripts']),
+        'reload_generation': corpus['generation']
     })
 
 # Load transcripts at module level for gunicorn
 print("Loading transcripts...")
-load_transcripts()
-print(f"Loaded {len(TRANSCRIPTS)} transcripts")
+start_watcher(load_transcripts())
+print(f"Loaded {len(CORPUS['transcripts'])} transcripts")
 
 if __name__ == '__main__':
     import sys
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Ingestion Benchmark
+Builds a synthetic transcript corpus from the lines in formatted/ and times
+serial and parallel parsing with the shared ingestion module.
+
+Usage: python bench_ingest.py [transcript count] [workers]
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+from ingest import LINE_PATTERN, load_directory
+
+SOURCE_DIR = Path(__file__).parent / "formatted"
+DEFAULT_COUNT = 100000
+
+def build_corpus(directory: Path, count: int) -> int:
+    """Write `count` synthetic transcripts into directory; return total bytes."""
+    lines = []
+    for filepath in SOURCE_DIR.glob("*.txt"):
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            lines.extend(m.group(0) for m in LINE_PATTERN.finditer(f.read()))
+
+    rng = random.Random(0)
+    total_bytes = 0
+    for i in range(count):
+        content = '\n\n'.join(rng.choices(lines, k=rng.randint(20, 120))) + '\n'
+        path = directory / f"audio_Call1-{i:08x}-0000-0000-0000-000000000000.MP3.txt"
+        path.write_text(content, encoding='utf-8')
+        total_bytes += len(content.encode('utf-8'))
+    return total_bytes
+
+def run(directory: Path, workers: int, total_bytes: int, count: int):
+    start = time.perf_counter()
+    transcripts = load_directory(directory, workers)
+    elapsed = time.perf_counter() - start
+    assert len(transcripts) == count
+    print(f"  workers={workers:<3} {elapsed:8.2f} s  "
+          f"{count / elapsed:10.0f} files/s  {total_bytes / elapsed / 1e6:8.1f} MB/s")
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    directory = Path(tempfile.mkdtemp(prefix="transcripts-bench-"))
+    try:
+        print(f"Building {count} synthetic transcripts in {directory}...")
+        total_bytes = build_corpus(directory, count)
+        print(f"Corpus: {total_bytes / 1e6:.1f} MB")
+
+        run(directory, 1, total_bytes, count)
+        if workers > 1:
+            run(directory, workers, total_bytes, count)
+    finally:
+        shutil.rmtree(directory)
+
+if __name__ == "__main__":
+    main()
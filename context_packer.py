@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Context Packer
+Chooses which scored transcripts or passages go into an LLM prompt so the
+token budget is filled as densely as possible.
+"""
+
+import re
+
+# Knapsack capacities are quantized to this many tokens to keep the table small
+PACK_GRANULARITY = 16
+
+WORD_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate the BPE token count of text without a tokenizer.
+    Short words are one token, longer words split roughly every 8 characters,
+    and each punctuation mark or newline costs one token.
+    """
+    tokens = text.count('\n')
+    for word in WORD_PATTERN.findall(text):
+        tokens += 1 + len(word) // 8
+    return tokens
+
+def pack_context(candidates: list, max_tokens: int) -> list:
+    """
+    Select the subset of (score, item) candidates with the highest total
+    score whose combined item['token_count'] fits in max_tokens.
+
+    Solved exactly as a 0/1 knapsack over token counts rounded up to
+    PACK_GRANULARITY, so the real total never exceeds the budget. Returns
+    the chosen items in their original candidate order.
+    """
+    capacity = max_tokens // PACK_GRANULARITY
+    weights = [-(-item['token_count'] // PACK_GRANULARITY) for _, item in candidates]
+
+    # best[c] is the highest score reachable using at most c units of budget
+    best = [0.0] * (capacity + 1)
+    taken = []
+    for (score, item), weight in zip(candidates, weights):
+        row = bytearray(capacity + 1)
+        for c in range(capacity, weight - 1, -1):
+            value = best[c - weight] + score
+            if value > best[c]:
+                best[c] = value
+                row[c] = 1
+        taken.append(row)
+
+    chosen = []
+    c = capacity
+    for i in range(len(candidates) - 1, -1, -1):
+        if taken[i][c]:
+            chosen.append(i)
+            c -= weights[i]
+
+    return [candidates[i][1] for i in sorted(chosen)]
+
+def pack_groups(groups: list, max_tokens: int) -> list:
+    """
+    Select at most one (score, item) candidate from each group, for the
+    highest total score whose combined item['token_count'] fits in
+    max_tokens. Solved exactly like pack_context, as a multiple-choice
+    knapsack. Returns the chosen items in group order.
+    """
+    capacity = max_tokens // PACK_GRANULARITY
+
+    best = [0.0] * (capacity + 1)
+    taken = []
+    for group in groups:
+        weights = [-(-item['token_count'] // PACK_GRANULARITY) for _, item in group]
+        previous = best[:]
+        # row[c] is 1 + the index of the candidate taken at capacity c, or 0
+        row = [0] * (capacity + 1)
+        for i, ((score, _), weight) in enumerate(zip(group, weights)):
+            for c in range(capacity, weight - 1, -1):
+                value = previous[c - weight] + score
+                if value > best[c]:
+                    best[c] = value
+                    row[c] = i + 1
+        taken.append((row, weights))
+
+    chosen = []
+    c = capacity
+    for g in range(len(groups) - 1, -1, -1):
+        row, weights = taken[g]
+        if row[c]:
+            chosen.append(groups[g][row[c] - 1][1])
+            c -= weights[row[c] - 1]
+
+    return chosen[::-1]
+
+def context_utilization(items: list, max_tokens: int) -> float:
+    """Fraction of the token budget used by the packed items."""
+    if max_tokens <= 0:
+        return 0.0
+    return sum(item['token_count'] for item in items) / max_tokens
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Corpus Tables
+Everything the server derives from the transcript text, as flat NumPy
+arrays: the size and content hash of every transcript and passage, the
+passage boundaries, the BM25F postings of the passages and the utterance
+search index. snapshot.py stores them next to the transcripts, so a warm
+start maps them instead of re-reading every utterance; Passages and the
+index views then read them on demand.
+"""
+
+import hashlib
+from collections.abc import Sequence
+
+import numpy as np
+
+from context_packer import estimate_tokens
+from transcript_index import (
+    build_chunks, make_chunk, passage_text, build_index, build_bm25_tables,
+    TermPostings, FIELDS, POSTING_STRIDE, CHUNK_UTTERANCES, CHUNK_CONTEXT,
+)
+from transcript_summaries import content_hash
+from utterance_search import build_search_index, search_index
+
+# Index arrays, only derived for the in-memory backend (see derive_tables)
+INDEX_TABLES = ('bm25_terms', 'bm25_offsets', 'bm25_postings',
+                *(f'doc_lengths_{field}' for field in FIELDS),
+                'search_terms', 'search_offsets', 'search_postings', 'utterance_starts')
+
+def item_stats(items) -> tuple:
+    """Character counts, token estimates and content hashes of transcripts or passages."""
+    chars = []
+    tokens = []
+    hashes = []
+    for item in items:
+        text = passage_text(item)
+        chars.append(len(text))
+        tokens.append(estimate_tokens(text))
+        hashes.append(content_hash(text))
+    return (np.array(chars, dtype=np.int64), np.array(tokens, dtype=np.int64),
+            np.array(hashes, dtype='S40'))
+
+def derive_tables(transcripts: list, indexes: bool = True) -> dict:
+    """
+    Tables for transcripts (server corpus format, in corpus order, each
+    with utterances). The signature hashes every passage id and text and
+    identifies the corpus to the answer cache. Without indexes, the BM25F
+    and search arrays are left out.
+    """
+    chunks = build_chunks(transcripts, CHUNK_UTTERANCES, CHUNK_CONTEXT)
+    counts = [-(-len(t['utterances']) // CHUNK_UTTERANCES) for t in transcripts]
+    chunk_starts = np.zeros(len(transcripts) + 1, dtype=np.int64)
+    chunk_starts[1:] = np.cumsum(counts)
+
+    tables = {'chunk_starts': chunk_starts}
+    (tables['transcript_chars'], tables['transcript_tokens'],
+     tables['transcript_hashes']) = item_stats(transcripts)
+    tables['chunk_chars'], tables['chunk_tokens'], tables['chunk_hashes'] = item_stats(chunks)
+
+    # Every passage's id and content hash, so any change to its text shows
+    digest = hashlib.sha1()
+    for chunk, chunk_hash in zip(chunks, tables['chunk_hashes']):
+        digest.update(chunk['id'].encode('utf-8') + b'\0' + chunk_hash + b'\0')
+    tables['signature'] = digest.hexdigest()
+
+    if indexes:
+        index = build_index(chunks)
+        postings = index['postings']
+        tables['bm25_terms'] = postings.terms
+        tables['bm25_offsets'] = postings.offsets
+        tables['bm25_postings'] = postings.postings
+        for field in FIELDS:
+            tables[f'doc_lengths_{field}'] = index['doc_lengths'][field]
+
+        search = build_search_index(transcripts)
+        tables['search_terms'] = search['postings'].terms
+        tables['search_offsets'] = search['postings'].offsets
+        tables['search_postings'] = search['postings'].postings
+        tables['utterance_starts'] = search['utterance_starts']
+    return tables
+
+def bm25_tables(tables: dict) -> dict:
+    """BM25F tables (see transcript_index.build_bm25_tables) over the derived arrays."""
+    postings = TermPostings(tables['bm25_terms'], tables['bm25_offsets'],
+                            tables['bm25_postings'], POSTING_STRIDE)
+    doc_lengths = {field: tables[f'doc_lengths_{field}'] for field in FIELDS}
+    return build_bm25_tables({'postings': postings, 'doc_lengths': doc_lengths})
+
+def utterance_index(tables: dict) -> dict:
+    """Utterance search index (see utterance_search) over the derived arrays."""
+    postings = TermPostings(tables['search_terms'], tables['search_offsets'], tables['search_postings'])
+    return search_index(postings, tables['utterance_starts'])
+
+class Passages(Sequence):
+    """
+    The passages of the corpus transcripts in index order, each built when
+    it is accessed, from the chunk tables, as build_chunks would with its
+    char_count, token_count and content_hash added.
+    """
+
+    __slots__ = ('transcripts', 'chunk_starts', 'chars', 'tokens', 'hashes')
+
+    def __init__(self, transcripts: list, tables: dict):
+        self.transcripts = transcripts
+        self.chunk_starts = tables['chunk_starts']
+        self.chars = tables['chunk_chars']
+        self.tokens = tables['chunk_tokens']
+        self.hashes = tables['chunk_hashes']
+
+    def __len__(self) -> int:
+        return int(self.chunk_starts[-1])
+
+    def __getitem__(self, doc):
+        if isinstance(doc, slice):
+            return [self[i] for i in range(*doc.indices(len(self)))]
+        doc = int(doc)
+        if doc < 0:
+            doc += len(self)
+        if not 0 <= doc < len(self):
+            raise IndexError('passage index out of range')
+        position = int(np.searchsorted(self.chunk_starts, doc, side='right')) - 1
+        start = (doc - int(self.chunk_starts[position])) * CHUNK_UTTERANCES
+        chunk = make_chunk(self.transcripts[position], start, CHUNK_UTTERANCES, CHUNK_CONTEXT)
+        chunk['char_count'] = int(self.chars[doc])
+        chunk['token_count'] = int(self.tokens[doc])
+        chunk['content_hash'] = self.hashes[doc].decode('ascii')
+        return chunk
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Corpus Watcher
+Background thread that polls the transcript directory and reports files
+that were added, changed or removed, so the server can fold them into its
+corpus without a restart. Polling keeps this dependency-free and works on
+network filesystems where inotify events are not delivered.
+"""
+
+import threading
+from pathlib import Path
+
+from snapshot import file_stats
+
+class CorpusWatcher:
+    """
+    Polls directory every interval seconds and calls
+    on_change(changed filenames, removed filenames, stats) when it differs
+    from the last state handed to on_change. A file is only reported once
+    its size and mtime have held still for one full interval, so
+    transcripts that are still being written are not parsed half-way.
+    """
+
+    def __init__(self, directory: Path, on_change, interval: float = 5, known: dict = None):
+        self.directory = directory
+        self.on_change = on_change
+        self.interval = interval
+        self.known = dict(known) if known is not None else file_stats(directory)
+        self.pending = {}
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """Start polling on a daemon thread."""
+        self.thread = threading.Thread(target=self._run, name='corpus-watcher', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop polling and wait for the thread to exit."""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+
+    def poll(self):
+        """Check the directory once, calling on_change if settled files changed."""
+        stats = file_stats(self.directory)
+        settled = {}
+        for name, stat in stats.items():
+            if self.known.get(name) == stat:
+                settled[name] = stat
+            elif self.pending.get(name) == stat:
+                settled[name] = stat
+            elif name in self.known:
+                # Still being written: keep serving the previous version
+                settled[name] = self.known[name]
+        self.pending = stats
+
+        changed = sorted(name for name, stat in settled.items() if self.known.get(name) != stat)
+        removed = sorted(name for name in self.known if name not in stats)
+        if not changed and not removed:
+            return
+
+        self.on_change(changed, removed, settled)
+        self.known = settled
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"Warning: Transcript reload failed: {e}")
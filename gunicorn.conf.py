@@ -0,0 +1,28 @@
+"""
+Gunicorn settings for the assistant server.
+The app is preloaded so the transcript corpus and its indexes are built
+once in the master and shared by every worker through fork, instead of
+each worker loading its own copy. Set WEB_CONCURRENCY for more workers.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+worker_class = 'gthread'
+threads = 32
+preload_app = True
+
+# Workers replaced after a transcript reload get this long to finish their
+# requests; above assistant_server.MAX_WAIT_TIME (300 s) so a RunPod job
+# that is still allowed to run is not cut off
+graceful_timeout = 330
+
+def when_ready(server):
+    """Runs in the master after the app is loaded, before workers fork."""
+    import assistant_server
+    assistant_server.share_corpus()
+
+def worker_exit(server, worker):
+    """Runs in a worker as it exits: cancel RunPod jobs nobody will collect."""
+    import assistant_server
+    assistant_server.RUNPOD_CLIENT.close()
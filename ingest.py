@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Transcript Ingestion
+Shared parser for the formatted transcript files, used by both the search
+page builder (app.py) and the assistant server. Large directories are parsed
+on a process pool.
+"""
+
+import os
+import re
+import threading
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from transcript_columns import Transcript, speaker_type, to_seconds
+
+# Pattern: Speaker [starttime: MM:SS - endtime: MM:SS]: Text
+# Applied to the whole file at once; only spaces and tabs are allowed between
+# fields so a match never spans two lines.
+LINE_PATTERN = re.compile(
+    r'^[ \t]*((?:Agent|Customer|Speaker \d+))[ \t]*'
+    r'\[starttime:[ \t]*(\d+:\d+)[ \t]*-[ \t]*endtime:[ \t]*(\d+:\d+)\]:(.*)$',
+    re.IGNORECASE | re.MULTILINE)
+NAME_PREFIX = re.compile(r'^audio_Call1-')
+NAME_SUFFIX = re.compile(r'\.MP3$', re.IGNORECASE)
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 200
+PARALLEL_CHUNKSIZE = 64
+
+def display_name(filename: str) -> str:
+    """Clean up a transcript filename for display (remove audio_Call1- prefix)."""
+    return NAME_SUFFIX.sub('', NAME_PREFIX.sub('', filename))
+
+def parse_transcript(filepath: Path) -> Transcript:
+    """Parse a single transcript file into a column-stored Transcript."""
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+
+    filename = filepath.stem
+    utterances = ((speaker, to_seconds(start_time), to_seconds(end_time), text.strip())
+                  for speaker, start_time, end_time, text in LINE_PATTERN.findall(content))
+    return Transcript.from_utterances(filename, display_name(filename), filepath.name, utterances)
+
+def _parse_or_error(filepath: Path):
+    """Pool worker: return (transcript, None) or (None, error message)."""
+    try:
+        return parse_transcript(filepath), None
+    except Exception as e:
+        return None, f"Error parsing {filepath.name}: {e}"
+
+def parse_files(filepaths: list, workers: int = None) -> list:
+    """
+    Parse transcript files, in parallel when there are enough of them.
+    Results keep the order of filepaths; files that fail are reported and
+    skipped. Only the main thread forks workers: a fork from any other
+    thread copies whatever locks the rest of the process holds.
+    """
+    workers = workers or os.cpu_count() or 1
+    parallel = (workers > 1 and len(filepaths) >= PARALLEL_MIN_FILES
+                and threading.current_thread() is threading.main_thread()
+                and 'fork' in multiprocessing.get_all_start_methods())
+
+    if parallel:
+        # fork keeps workers from re-importing the server module that called us
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork')) as pool:
+            results = list(pool.map(_parse_or_error, filepaths, chunksize=PARALLEL_CHUNKSIZE))
+    else:
+        results = [_parse_or_error(filepath) for filepath in filepaths]
+
+    transcripts = []
+    for transcript, error in results:
+        if error:
+            print(error)
+        else:
+            transcripts.append(transcript)
+    return transcripts
+
+def load_directory(directory: Path, workers: int = None) -> list:
+    """Parse every .txt transcript in a directory, sorted by filename."""
+    return parse_files(sorted(directory.glob("*.txt")), workers)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+RunPod Client
+Client for RunPod serverless jobs. Each job is submitted and polled on the
+thread that asked for it, and every thread shares one keep-alive HTTP
+session, so a worker process can have many jobs in flight without a new
+TCP/TLS handshake per status poll. At most max_concurrency jobs run at
+once; further callers wait for a slot.
+"""
+
+import time
+import threading
+from collections import deque
+
+import requests
+from requests.adapters import HTTPAdapter
+
+class RunPodError(Exception):
+    """A RunPod job could not be submitted, failed, or timed out."""
+
+class PollSchedule:
+    """
+    Adaptive delays between job status checks.
+    The first check is deferred to just before the quickest quarter of recent
+    jobs finished; after that checks start at initial_interval and back off
+    exponentially up to max_interval.
+    """
+
+    def __init__(self, initial_interval: float = 0.25, max_interval: float = 2,
+                 backoff: float = 1.5, history: int = 50):
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.durations = deque(maxlen=history)
+        self.lock = threading.Lock()
+
+    def observe(self, duration: float):
+        """Record how long a completed job took from submission."""
+        with self.lock:
+            self.durations.append(duration)
+
+    def first_delay(self) -> float:
+        """Seconds after submission before the first status check."""
+        with self.lock:
+            durations = sorted(self.durations)
+        if not durations:
+            return self.initial_interval
+        return max(self.initial_interval, 0.8 * durations[len(durations) // 4])
+
+    def delays(self, elapsed: float = 0):
+        """Yield successive waits for a job that has been running `elapsed` seconds."""
+        yield max(0.0, self.first_delay() - elapsed)
+        interval = self.initial_interval
+        while True:
+            yield interval
+            interval = min(self.max_interval, interval * self.backoff)
+
+class RunPodClient:
+    """Submits prompts to a RunPod endpoint and polls them to completion."""
+
+    def __init__(self, endpoint_id: str, api_key: str, max_concurrency: int = 32,
+                 max_wait_time: float = 300, initial_check_interval: float = 0.25,
+                 max_check_interval: float = 2, use_runsync: bool = True,
+                 runsync_wait: float = 30):
+        self.base_url = f"https://api.runpod.ai/v2/{endpoint_id}"
+        self.max_wait_time = max_wait_time
+        self.use_runsync = use_runsync
+        self.runsync_wait = runsync_wait
+        self.schedule = PollSchedule(initial_check_interval, max_check_interval)
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        })
+        # Connections kept open for reuse: one per concurrent job
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self.session.mount('https://', adapter)
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+
+        # Ids of jobs submitted and not yet finished, for close()
+        self.active_jobs = set()
+        self.lock = threading.Lock()
+        self.closed = threading.Event()
+
+    def close(self):
+        """
+        Cancel every job in flight on RunPod and refuse new ones, e.g. when
+        the worker process exits. Threads polling those jobs wake up and
+        raise RunPodError.
+        """
+        self.closed.set()
+        with self.lock:
+            job_ids = list(self.active_jobs)
+            self.active_jobs.clear()
+        for job_id in job_ids:
+            self.cancel_remote(job_id)
+
+    def _track(self, job_id: str):
+        """Track a submitted job, or cancel it if close() came first."""
+        with self.lock:
+            if not self.closed.is_set():
+                self.active_jobs.add(job_id)
+                return
+        self.cancel_remote(job_id)
+        raise RunPodError("Error: Request cancelled")
+
+    def _release(self, job_id: str, cancel: bool):
+        """Stop tracking a job, cancelling it unless close() already has."""
+        with self.lock:
+            tracked = job_id in self.active_jobs
+            self.active_jobs.discard(job_id)
+        if cancel and tracked:
+            self.cancel_remote(job_id)
+
+    def _check_open(self):
+        if self.closed.is_set():
+            raise RunPodError("Error: Request cancelled")
+
+    def _acquire_slot(self):
+        """Wait up to max_wait_time for one of the max_concurrency job slots."""
+        if not self.slots.acquire(timeout=self.max_wait_time):
+            raise RunPodError("Error: Timed out waiting for a free RunPod slot")
+
+    def stream(self, payload: dict):
+        """
+        Submit a job and yield its partial outputs as RunPod produces them.
+        Runs on the caller's thread and holds a job slot until it is done;
+        closing the generator early cancels the job on RunPod.
+        """
+        self._acquire_slot()
+        try:
+            yield from self._stream(payload)
+        finally:
+            self.slots.release()
+
+    def _stream(self, payload: dict):
+        self._check_open()
+        try:
+            response = self.session.post(f"{self.base_url}/run", json=payload, timeout=30)
+            response.raise_for_status()
+            result = response.json()
+        except Exception as e:
+            raise RunPodError(f"Error submitting to RunPod: {str(e)}")
+
+        job_id = result.get('id')
+        if not job_id:
+            raise RunPodError(f"Error: No job ID returned. Response: {result}")
+
+        stream_url = f"{self.base_url}/stream/{job_id}"
+        start_time = time.time()
+        finished = False
+        self._track(job_id)
+
+        try:
+            while time.time() - start_time < self.max_wait_time:
+                try:
+                    response = self.session.get(stream_url, timeout=30)
+                    response.raise_for_status()
+                    result = response.json()
+                except Exception as e:
+                    raise RunPodError(f"Error checking status: {str(e)}")
+
+                for item in result.get('stream', []):
+                    if item.get('output') is not None:
+                        yield item['output']
+
+                status = result.get('status')
+
+                if status == 'COMPLETED':
+                    finished = True
+                    self.schedule.observe(time.time() - start_time)
+                    return
+                elif status == 'FAILED':
+                    finished = True
+                    raise RunPodError(f"Job failed: {result.get('error', 'Unknown error')}")
+                elif status in ['IN_QUEUE', 'IN_PROGRESS']:
+                    if self.closed.wait(self.schedule.initial_interval):
+                        raise RunPodError("Error: Request cancelled")
+                else:
+                    raise RunPodError(f"Unknown status: {status}")
+
+            raise RunPodError("Error: Request timed out")
+        finally:
+            self._release(job_id, cancel=not finished)
+
+    def cancel_remote(self, job_id: str):
+        """Ask RunPod to cancel a job, ignoring failures."""
+        try:
+            self.session.post(f"{self.base_url}/cancel/{job_id}", timeout=10)
+        except requests.RequestException as e:
+            print(f"Warning: Could not cancel RunPod job {job_id}: {e}")
+
+    def run(self, payload: dict) -> dict:
+        """
+        Submit a job and poll it to completion on the calling thread,
+        returning its final RunPod status payload. A job that has not
+        finished within max_wait_time is cancelled on RunPod. Waits first
+        if max_concurrency jobs are already running.
+        """
+        self._acquire_slot()
+        try:
+            return self._run(payload)
+        finally:
+            self.slots.release()
+
+    def _run(self, payload: dict) -> dict:
+        self._check_open()
+        start_time = time.time()
+
+        # /runsync answers in one round trip when the job finishes within
+        # runsync_wait; otherwise it hands back a job id and we poll as usual
+        try:
+            if self.use_runsync:
+                response = self.session.post(
+                    f"{self.base_url}/runsync",
+                    params={'wait': int(self.runsync_wait * 1000)},
+                    json=payload, timeout=self.runsync_wait + 30)
+            else:
+                response = self.session.post(f"{self.base_url}/run", json=payload, timeout=30)
+            response.raise_for_status()
+            result = response.json()
+        except Exception as e:
+            raise RunPodError(f"Error submitting to RunPod: {str(e)}")
+
+        job_id = result.get('id')
+        if result.get('status') == 'COMPLETED':
+            self.schedule.observe(time.time() - start_time)
+            return result
+        if not job_id:
+            raise RunPodError(f"Error: No job ID returned. Response: {result}")
+
+        status_url = f"{self.base_url}/status/{job_id}"
+        finished = False
+        self._track(job_id)
+
+        # Any way out of the loop other than a final status (timeout, a
+        # failed status check, close(), the thread being interrupted)
+        # cancels the job
+        try:
+            for delay in self.schedule.delays(time.time() - start_time):
+                status = result.get('status')
+
+                if status == 'COMPLETED':
+                    finished = True
+                    self.schedule.observe(time.time() - start_time)
+                    return result
+                elif status == 'FAILED':
+                    finished = True
+                    raise RunPodError(f"Job failed: {result.get('error', 'Unknown error')}")
+                elif status not in ['IN_QUEUE', 'IN_PROGRESS']:
+                    raise RunPodError(f"Unknown status: {status}")
+
+                if time.time() + delay - start_time >= self.max_wait_time:
+                    break
+                if self.closed.wait(delay):
+                    raise RunPodError("Error: Request cancelled")
+
+                try:
+                    response = self.session.get(status_url, timeout=30)
+                    response.raise_for_status()
+                    result = response.json()
+                except Exception as e:
+                    raise RunPodError(f"Error checking status: {str(e)}")
+
+            raise RunPodError("Error: Request timed out")
+        finally:
+            self._release(job_id, cancel=not finished)
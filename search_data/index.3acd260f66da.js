@@ -0,0 +1 @@
+registerSearchIndex({"terms": "00\n000\n000048\n00363\n004\n00497071\n00506169\n02\n029\n03\n0300\n031\n0310\n03100844\n031020844\n031050828\n031068400404\n0311\n03112\n03116919\n031207640\n03122795\n0312841\n0313\n0314\n045\n05\n0521\n06\n07\n08\n088747\n1\n10\n100\n105\n10th\n11\n1124\n11th\n12\n123456708\n1234567890\n13\n13th\n14\n14th\n15\n15th\n16\n16th\n17\n171\n172\n1766\n17th\n18\n1820\n1870\n18th\n19\n19th\n2\n20\n202\n2021\n2022\n2025\n20th\n21\n21st\n22\n22nd\n23\n230221\n234\n23456789\n24\n2433\n24th\n25\n257688434\n27\n27th\n28\n28th\n29\n29th\n2nd\n3\n30\n308\n30th\n31\n3130889\n33\n34\n35\n36\n364\n37\n39\n3rd\n4\n40\n405\n41\n42\n42906\n43\n43953\n44\n45\n46\n48\n483\n49\n4th\n5\n50\n51\n52\n52797\n537\n53953\n54\n55\n56\n5610254\n59\n6\n60\n61\n6251\n63\n64\n65\n66\n69\n6th\n7\n70\n71\n72\n74\n748\n75\n77\n7724750565\n780\n79\n7th\n8\n80\n802\n81\n81021826\n82\n83\n84\n844\n85\n86\n864\n88\n885\n88584\n8th\n9\n90\n9013700081\n93\n94\n96\n97\n99\n9th\na\nab\nabandoned\nabi\nability\nabimola\nable\nabound\nabout\nabove\nabsence\nabsolutely\nabused\naccent\naccept\nacceptable\naccepted\naccepting\naccess\naccessed\naccesses\naccessibility\naccessible\naccessing\naccording\naccordingly\naccount\naccountment\naccounts\nachieve\nacross\nact\nacting\naction\nactivate\nactivated\nactive\nactivity\nactors\nactual\nactually\nad\nadapter\nadd\nadded\nadder\nadding\naddition\nadditional\naddress\naddressed\nadg\nadi\nadia\nadmi\nadmin\nadministrator\nadomen\nadopted\nadult\nadvance\nadvanced\nadvances\nadvantage\nadvice\nadvise\nadvised\nadvising\naford\nafraid\nafter\nafternoon\naftertest\nagain\nagainst\nagenda\nagent\nagents\nagila\nago\nagree\nagreed\nagreement\naguilar\nah\nahead\nai\nair\nairport\naj\nakile\nal\nalbania\nalgorithm\nalice\naligned\nall\nallow\nallowed\nallowing\nallows\nalma\nalmost\nalone\nalong\nalpha\nalphabet\nalphanumeric\nalphanumerical\nalphar\nalready\nalright\nalrighty\nalso\nalt\nalternate\nalternative\nalthough\naltogether\naltoid\naltom\nalubeka\nalways\nam\namazing\namazon\namber\nambivale\namerican\naminist\namount\nan\nanalog\nanalysis\nanalyst\nanaria\nand\nangle\nanimals\nanki\nannoped\nannounce\nannounced\nannouncement\nannouncer\nannual\nannuals\nanonymous\nanother\nanswer\nanswered\nanswering\nanswers\nant\nanti\nany\nanyb\nanybody\nanykt\nanymore\nanyone\nanything\nanytime\nanyway\nanyways\nanywhere\nap\napar\naparcas\naparcase\naparques\napart\napartheid\napartment\napax\napocalypse\napocas\napologies\napologize\napostle\napp\nappeal\nappear\nappeared\nappears\napple\napplecase\napplic\napplication\napplications\napplied\napplying\nappointment\nappreciate\nappreciated\napprecin\napproval\napprove\napproved\napps\napril\naq\nare\narea\naren\narithmetic\narm\naro\narose\naround\narrest\narrive\narrives\narriving\narrow\narthur\nartificial\nas\nasa\nashomody\nasia\naside\nasio\nask\nasked\nasking\naspect\nassemble\nasset\nassets\nassign\nassigned\nassigning\nassignments\nassist\nassistance\nassistant\nassisted\nassisting\nassum\nassuming\nassurance\nassure\nassured\nat\nathletes\natlb\natmi\natop\natp\natperformers\natro\nattach\nattached\nattaching\nattack\nattacking\nattacks\nattempt\nattempting\nattend\nattention\naudi\naudible\naudio\naudited\naugust\nauthentic\nauthenticate\nauthenticated\nauthentication\nauthenticator\nauthenticity\nauthor\nauthority\nauto\nautomatically\nautumn\nautumnator\navailability\navailable\navaya\naverage\navia\navoid\naware\naway\nawesome\naws\nazure\nb\nbaba\nbaby\nback\nbackground\nbackgrounds\nbackside\nbackslash\nbackup\nbackwards\nbad\nbadly\nbaffled\nbag\nbaki\nbaking\nbalance\nbaljit\nball\nband\nbank\nbanks\nbar\nbarangay\nbarcode\nbarely\nbargo\nbarmigo\nbarrow\nbars\nbase\nbased\nbasic\nbasically\nbasilar\nbasis\nbat\nbath\nbatter\nbattery\nbayak\nbc\nbcrgper\nbdi\nbe\nbeach\nbeams\nbeaning\nbear\nbears\nbeat\nbeatlocker\nbeautiful\nbecame\nbecause\nbecome\nbed\nbeds\nbeen\nbeep\nbeer\nbefore\nbeg\nbegin\nbeginning\nbehalf\nbehind\nbeing\nbelieve\nbelieves\nbeloaded\nbelongs\nbelow\nben\nbenefit\nbenefits\nbenign\nbent\nbereavement\nbeside\nbesides\nbest\nbetter\nbetween\nbeyond\nbga\nbgi\nbhasid\nbhr\nbicon\nbig\nbigger\nbill\nbilled\nbillet\nbilling\nbing\nbingo\nbirth\nbisque\nbit\nbitcore\nbitlocker\nbits\nblack\nblackened\nblank\nblending\nbless\nblessed\nblessing\nblink\nblinking\nblock\nblocked\nblocks\nblogged\nblow\nblue\nblurry\nbma\nbme\nbmh\nbmi\nbml\nbms\nbmsd\nbmsid\nbmws\nbns\nboard\nboarding\nboat\nbodo\nbody\nbook\nbooked\nbookmark\nbookmarks\nbookmas\nbookner\nbooster\nboot\nbootmark\nborn\nborough\nbosom\nboss\nboth\nbotista\nbottle\nbottom\nbought\nbox\nboxes\nboy\nbp\nbpa\nbpn\nbracket\nbraffle\nbrain\nbrand\nbrandi\nbravo\nbreak\nbreakfast\nbreaking\nbreathing\nbrick\nbrief\nbrilliant\nbring\nbrings\nbroke\nbrothers\nbrought\nbrowns\nbrowse\nbrowser\nbrowsers\nbrowsing\nbsd\nbubble\nbucks\nbuddy\nbuffering\nbug\nbuild\nbulchi\nbump\nbunch\nburied\nburning\nbus\nbusiness\nbusinesses\nbusy\nbut\nbutton\nbuy\nbuying\nbwp\nby\nbye\nc\ncabins\ncable\ncables\ncabra\ncaledio\ncalendar\ncalific\ncall\ncallback\ncalled\ncaller\ncalling\ncalls\ncame\ncamera\ncampaign\ncan\ncanberra\ncancel\ncancelation\ncanceled\ncancellate\ncandidate\ncandy\ncannot\ncap\ncape\ncapital\ncapitalized\ncaps\ncapsule\ncaptured\ncapturing\ncar\ncard\ncards\ncare\ncared\ncareful\ncarefully\ncarlor\ncarna\ncarry\ncars\ncasa\ncase\ncases\ncat\ncatch\ncater\ncaught\ncause\ncaused\ncauses\ncausing\ncave\ncb\ncba\nccm\nccms\nccus\ncd\ncdl\ncell\ncellbie\ncensure\ncenter\ncentric\ncentrics\ncenturies\nceo\ncerebral\ncertain\ncertainly\ncertificate\ncertificates\ncervical\ncf\ncfu\nchag\nchained\nchair\nchance\nchange\nchanged\nchanges\nchanging\nchannel\ncharacter\ncharacters\ncharge\ncharging\ncharity\ncharlie\ncharlotte\ncharts\nchat\nchattel\ncheaper\ncheat\ncheck\ncheckbooks\ncheckbox\nchecked\nchecking\nchecks\nchemical\ncherry\nchess\nchest\nchildren\nchina\nchipped\nchoice\nchoose\nchoosing\nchose\nchrome\nchromeus\nchurch\nci\ncipher\ncircle\ncircles\ncircuit\ncisco\ncite\ncitric\ncitrics\ncitrix\ncitrus\ncity\nclaim\nclaimless\nclaims\nclarifications\nclarinet\nclass\nclassword\nclause\nclean\nclear\ncleared\nclearer\nclearly\nclick\nclicked\nclicking\nclicks\nclient\nclients\nclip\ncliques\nclock\nclogis\nclose\nclosed\ncloser\ncloset\nclosing\nclosure\ncloud\nclub\ncm\ncms\ncmu\ncnrsq\nco\ncoat\ncode\ncodes\ncognitive\ncoke\ncold\ncollar\ncolleague\ncollect\ncollected\ncollection\ncollie\ncolon\ncolor\ncolumn\ncom\ncome\ncomes\ncoming\ncommander\ncomment\ncommentary\ncommenting\ncomments\ncommit\ncommittee\ncommon\ncommunications\ncompany\ncompare\ncompared\ncompatible\ncomplaint\ncomplete\ncompleted\ncompletely\ncompleting\ncompletion\ncomplicated\ncomponents\ncompound\ncomputation\ncomputer\ncomputers\ncon\nconcept\nconcern\nconcerned\nconcerning\nconcoc\nconcurrent\ncondition\nconduct\nconducting\ncone\nconferenceial\nconfidence\nconfidential\nconfig\nconfiguration\nconfirm\nconfirmation\nconfirmations\nconfirmed\nconfirming\nconfirms\nconflicted\nconfused\nconfusing\nconfusion\ncongratulated\ncongratulations\nconnect\nconnected\nconnecticut\nconnecting\nconnection\nconnections\nconnectivity\nconnector\nconnectors\nconnects\nconsent\nconsider\nconsideration\nconsidered\nconsign\nconsisting\nconsul\nconsultation\ncontact\ncontactation\ncontacted\ncontacting\ncontacts\ncontain\ncontained\ncontaining\ncontains\ncontent\ncontention\ncontinuator\ncontinue\ncontinues\ncontinuing\ncontinuously\ncontract\ncontribute\ncontrol\ncontrolling\nconvenience\nconventions\nconvergation\nconversation\ncool\ncooling\ncooperate\ncooperation\ncopied\ncopy\ncoquette\ncord\ncordell\ncords\ncore\ncorner\ncorrect\ncorrectly\ncorrecto\ncorrecty\ncorrel\ncorrelation\ncosa\ncost\ncould\ncouldn\ncount\ncounter\ncounting\ncountry\ncounts\ncouple\ncoupon\ncourse\ncourt\ncourts\ncover\ncovered\ncovid\ncp\ncpi\ncpl\ncpm\ncpo\ncps\ncpt\ncpu\ncpus\ncr\ncranner\ncrash\ncrashed\ncrazy\ncream\ncreate\ncreated\ncreating\ncreation\ncreative\ncredential\ncredentials\ncredit\ncriteria\ncritical\ncross\ncrosscheck\ncrossed\ncrude\ncs\nct\nctc\nctms\ncto\ncts\nctss\nctssup\nctu\ncub\ncubic\ncucu\ncup\ncurious\ncurrency\ncurrent\ncurrently\ncursor\ncurved\ncustomer\ncustomers\ncut\ncutner\ncutting\ncvs\ncx\ncycled\ncytrix\nd\nda\ndaily\ndale\ndamage\ndamaged\ndamn\ndamo\ndance\ndarb\ndash\ndata\ndatabase\ndate\ndates\ndating\ndaughter\ndavid\nday\ndays\ndb\ndcf\ndcp\ndd\nddw\nde\ndead\ndeal\ndealing\ndeans\ndebate\ndebit\ndebt\ndecatur\ndecember\ndecide\ndecipher\ndecision\ndeck\ndecline\ndedicate\ndedicated\ndeep\ndeeping\ndeeply\ndefault\ndefendant\ndefender\ndefin\ndefinite\ndefinitely\ndefinition\ndeity\ndejan\ndel\ndelaware\ndelay\ndelete\ndeleted\ndelhi\ndelight\ndeliver\ndelivered\ndelivering\ndelivery\ndelta\ndemand\ndemographics\ndenial\ndenials\ndenied\ndeniers\ndenounced\ndenta\ndental\ndentists\ndeny\ndep\ndepartment\ndepend\ndepict\ndeployment\ndeposit\ndepot\ndepressed\nderivation\nderive\ndermatology\ndescribe\ndescribed\ndescription\ndesert\ndeserve\ndeset\ndesign\ndesignates\ndesk\ndesktop\ndesmond\ndespite\ndetail\ndetails\ndetect\ndevelop\ndevice\ndevices\ndexa\ndexto\ndexus\ndga\ndiagnose\ndiagnosing\ndial\ndialing\ndiamond\ndiams\ndiary\ndicks\ndictate\ndictionary\ndid\ndidn\ndied\ndifference\ndifferent\ndifficult\ndifficulties\ndigit\ndigitally\ndigits\ndilution\ndimension\ndina\ndining\ndinkiting\ndinosaur\ndirect\ndirectly\ndirector\ndirectors\ndirectory\ndirt\ndisability\ndisabled\ndisagree\ndisagreement\ndisappeared\ndisappears\ndiscipence\ndisclaimer\ndisconnect\ndisconnected\ndisconnecting\ndisconnection\ndiscord\ndiscount\ndiscover\ndiscuss\ndiscussed\ndiscussion\ndisguise\ndisguised\ndisk\ndismissed\ndisplay\ndisplaying\ndisplayport\ndisplays\ndisputations\ndispute\ndissolved\ndissolving\ndistribution\ndisturbing\ndivided\ndiving\ndms\ndn\ndna\ndnm\ndns\ndo\ndoctor\ndocument\ndocuments\ndodd\ndoes\ndoesn\ndog\ndoggin\ndogs\ndoing\ndollar\ndollars\ndomain\ndominance\ndominant\ndomino\ndon\ndone\ndonia\ndonuts\ndooming\ndoor\ndor\ndormotor\ndot\ndotholder\ndotia\ndots\ndouble\ndoubt\ndoubting\ndow\ndown\ndownload\ndownloaded\ndownloading\ndownright\ndownstairs\ndp\ndpn\ndr\ndragging\ndrain\ndream\ndria\ndrinking\ndrive\ndrop\ndropped\ndropping\ndrops\ndry\nds\ndt\ndual\nduck\ndue\ndug\ndummy\ndurham\nduring\nduty\ndw\ndwelt\ndwp\ndwpcc\ndwpt\ndwt\ndy\ne\neach\neagles\nean\near\nearlier\nearly\nears\nearth\nease\neasier\neasily\neasy\neat\neating\nec\necho\neco\necosciera\necosystem\ned\neden\nedge\nedges\nedible\nediting\nefficient\neffort\nego\neia\neither\neldu\nelecting\nelectric\nelectricity\nelectron\nelements\nelse\nelvin\nelvis\nemail\nemailed\nemails\nembassy\nemit\nempathy\nemployed\nemployee\nemployer\nemployment\nempty\nems\nenable\nenabled\nenabling\nencounter\nencountered\nend\nended\nendesa\nending\nends\nenforceback\nengage\nengine\nengineer\nengland\nenhance\nenjoy\nenjoying\nenough\nensuing\nensure\nent\nenter\nentered\nentering\nenters\nentertaining\nentertainment\nentire\nentirely\nentry\nenvironment\neo\neoc\neop\nepa\nepn\nepp\neppp\neq\nequal\nequipment\ner\nera\nerroneous\nerror\nerrors\nes\nescalate\nescalated\nescalating\nescalation\nescaling\nesf\nespecially\nesper\nessential\nessentially\neste\nesteo\nestimated\nesudo\net\netern\neternal\nether\nethernet\neu\neukaryotic\nev\nevanscarin\neven\nevening\neventually\never\nevery\neverybody\neveryone\neveryr\neverything\neverywhere\nevolution\newp\nex\nexact\nexactly\nexam\nexample\nexcellent\nexcess\nexcessive\nexchange\nexcite\nexcited\nexclude\nexcluded\nexcuse\nexercise\nexhilated\nexist\nexisting\nexit\nexpect\nexpected\nexpedite\nexperience\nexperiencing\nexpire\nexpired\nexplain\nexplained\nexplaining\nexplanation\nextend\nextended\nextender\nextension\nextern\nexternal\nextinct\nextra\nextremely\neye\neyewitten\nf\nfab\nface\nfaced\nfaces\nfacial\nfacing\nfact\nfactor\nfactors\nfadden\nfaiduan\nfailed\nfailure\nfaint\nfair\nfall\nfalling\nfalse\nfamiliar\nfamily\nfamous\nfantastic\nfar\nfara\nfarming\nfascinate\nfast\nfaster\nfastword\nfate\nfault\nfaults\nfaulty\nfavor\nfavorite\nfavorites\nfax\nfbt\nfe\nfeatures\nfebruary\nfedex\nfee\nfeed\nfeedback\nfeeding\nfeel\nfeeling\nfeels\nfees\nfeet\nfellow\nfelt\nfestival\nfetch\nfew\nfewer\nfi\nfield\nfields\nfight\nfighting\nfigure\nfile\nfiled\nfiles\nfiling\nfill\nfilled\nfilling\nfinal\nfinally\nfinance\nfind\nfinder\nfinding\nfine\nfinger\nfinish\nfinished\nfire\nfirm\nfirst\nfirstly\nfisco\nfish\nfishing\nfit\nfitter\nfix\nfixable\nfixed\nfixtures\nflash\nflashes\nflashing\nfleet\nfleeting\nflight\nflip\nflo\nfloating\nfloodfag\nfloor\nflorist\nflow\nflowed\nflower\nfluctuate\nfluctuation\nfluctuations\nflush\nfly\nfocus\nfolder\nfolders\nfollow\nfollowed\nfollowing\nfont\nfood\nfoods\nfor\nforbidden\nforce\nforced\nforch\nford\nforest\nforever\nforget\nforgot\nform\nformat\nformation\nfort\nforward\nforwarded\nforwarding\nfound\nfox\nfoxtrack\nfoxtrot\nframe\nfrance\nfrancisco\nfrank\nfrankie\nfrankly\nfree\nfreedom\nfreeze\nfreezing\nfresh\nfriday\nfriend\nfriends\nfrom\nfront\nfroze\nfrustrated\nft\nftp\nfull\nfully\nfun\nfunction\nfunctioning\nfunding\nfunds\nfunny\nfurther\nfuture\nfvt\ng\ngado\ngain\ngallery\ngalliego\ngame\ngamma\ngandhi\ngar\ngarden\ngate\ngateway\ngather\ngave\ngay\ngazed\ngbl\ngdando\ngedb\ngee\ngela\ngemma\ngene\ngeneral\ngenerate\ngenerated\ngenerating\ngenesis\ngensa\ngentleman\ngeorge\ngeorgia\nget\ngets\ngetting\nghop\ngi\ngift\ngifts\ngigs\ngilmer\ngiraffe\ngirl\ngive\ngiven\ngives\ngiving\nglad\nglobal\nglosses\nglue\ngmail\ngo\ngoal\ngoals\ngod\ngoes\ngoing\ngold\ngolden\ngolf\ngone\ngonna\ngood\ngoodbye\ngoodness\ngoogle\ngosh\ngot\ngotcha\ngov\ngpa\ngrab\ngrade\ngrading\ngrain\ngrandma\ngranted\ngreat\ngreen\ngreenish\ngrid\ngrief\ngrind\ngroom\ngroome\ngross\nground\ngroup\ngrouped\ngrow\ngrudge\ngsa\ngsca\ngsi\nguarantee\nguess\nguessing\nguidance\nguide\nguidelines\nguiding\ngum\nguy\nguys\ngynec\nh\nhacked\nhad\nhafes\nhair\nhalf\nhamburg\nhamo\nhand\nhanded\nhandle\nhandling\nhands\nhang\nhanging\nhapes\nhaploid\nhappen\nhappened\nhappening\nhappens\nhappy\nharassment\nhard\nharder\nhardly\nhardware\nharley\nharry\nhas\nhasn\nhate\nhaul\nhaunt\nhave\nhaven\nhaving\nhawaiian\nhd\nhdma\nhdmi\nhe\nhead\nheading\nheads\nheadset\nheadsets\nhealth\nhealthcare\nhealthexpex\nhealthy\nhear\nheard\nheck\nhedge\nheelbick\nheld\nhell\nhello\nhelmets\nhelp\nhelpd\nhelpddesk\nhelpddk\nhelpdesk\nhelped\nhelpers\nhelpes\nhelpex\nhelpful\nhelping\nhelpless\nhelps\nhence\nhenry\nher\nhere\nhey\nhgmi\nhi\nhide\nhiding\nhigh\nhigher\nhighest\nhighlight\nhighly\nhim\nhint\nhinto\nhire\nhired\nhiring\nhis\nhistory\nhm\nhmm\nhmp\nhmpu\nhold\nholden\nholding\nholds\nhole\nholland\nholmes\nholy\nhomage\nhome\nhomes\nhomogene\nhomogeneous\nhonest\nhoney\nhong\nhonor\nhook\nhooked\nhope\nhopefully\nhopes\nhoping\nhorde\nhorrible\nhorse\nhospital\nhost\nhot\nhotel\nhotels\nhotmail\nhour\nhours\nhouse\nhouston\nhover\nhow\nhowever\nhp\nhsd\nhtmi\nhttps\nhub\nhuh\nhuman\nhumana\nhumes\nhumina\nhung\nhunting\nhurry\nhurts\nhush\nhyand\ni\nibm\nicc\nice\nich\nicid\nicon\nicons\nicp\nid\nidea\nideal\nideally\nideals\nideas\nident\nidentification\nidentify\nidentifying\nidentity\nidents\nidho\nidio\nidiot\nidl\nidlbeck\nidle\nidlvex\nidma\nidmos\nidol\nidolatry\nids\niduly\nief\niep\nif\nigl\nigloo\nil\nilaga\nimages\nimagine\nimaging\nimf\nimmediately\nimmorses\nimpacted\nimplo\nimport\nimportant\nimprove\nims\nin\ninactive\ninappropriate\ninbod\ninc\nincdigo\nincendi\ninch\nincident\ninclined\ninclude\nincluded\nincludes\nincluding\ninco\nincognito\nincome\ninconiousness\ninconsistenc\nincontinuous\ninconvenience\ninconvenient\nincorporate\nincorran\nincorrect\nincorrectly\nincrease\nincurred\nincurrence\nindeed\nindex\nindia\nindian\nindicate\nindicated\nindication\nindicator\nindigo\nindustry\ninfinity\ninflicted\ninfluenza\ninfo\ninform\ninformation\ninformed\ninforming\ningredient\ningredients\ninitial\ninitially\ninner\ninput\ninquire\ninquiry\nins\ninserted\ninserting\ninside\ninspiration\ninstall\ninstallation\ninstalled\ninstaller\ninstalling\ninstant\ninstead\ninstruction\ninstructions\ninsurance\ninteraction\ninterchange\ninterest\ninterface\ninterior\ninternal\ninternet\ninterrupted\ninterval\ninto\nintro\nintroduced\nintuitive\nintune\ninvalid\ninvented\ninvested\ninvestigation\ninvestment\ninvite\nip\nipc\niphone\nipv\niq\nireland\niron\nis\nisd\niship\nislam\nisland\nisn\nisnessa\nisot\nisp\nisping\nissue\nissued\nissues\nissuing\nist\nit\nitem\nitems\nithabit\nitit\nitl\nitm\nitmp\nito\nitp\nits\nitself\nivr\nivy\nix\nj\njack\njacobs\njag\njagged\njam\njanuary\njazz\njeez\njefferson\njennifer\njester\njesus\njewish\nji\njob\njoin\njoined\njoining\njokes\njourney\njp\njuan\njude\njugs\njuliet\njulius\njulu\njuly\njump\njumping\njune\njunk\njust\njuul\nk\nkalo\nkannul\nkat\nkate\nkazor\nkd\nkeep\nkeeping\nkeeps\nkego\nkelly\nkelo\nkem\nkept\nkeraton\nkesa\nkey\nkeyboard\nkeyboards\nkeys\nkeyword\nki\nkick\nkicks\nkid\nkidding\nkids\nkiev\nkilicon\nkill\nkilo\nkiloca\nkind\nkindly\nkindness\nking\nkingdom\nkings\nkino\nkip\nkiss\nkit\nknack\nknew\nknife\nknock\nknocked\nknocking\nknow\nknowledge\nknows\nkobe\nkong\nkoran\nkorea\nl\nlab\nlabel\nlabeled\nlack\nlacking\nlady\nlagging\nlake\nlakh\nlamb\nlan\nlanaya\nlancashire\nland\nlane\nlap\nlapped\nlaptop\nlarry\nlast\nlatency\nlater\nlatonia\nlatonio\nlauda\nlaugh\nlaunch\nlaunched\nlauncher\nlaunchpad\nlaw\nlax\nlay\nlayon\nlazy\nlb\nld\nldu\nle\nlead\nleader\nlearning\nleast\nleave\nleaving\nlebec\nlecture\nlee\nleft\nleg\nlegal\nlegion\nlen\nlending\nlength\nless\nlester\nlet\nletter\nletters\nletting\nlevel\nleveled\nleveling\nleveltail\nlever\nleverage\nlevine\nli\nliberty\nlibrary\nlicense\nlid\nlife\nlift\nlight\nlights\nlike\nliking\nlima\nlimb\nlimba\nlimited\nlimpa\nline\nlines\nlingo\nlink\nlinked\nlinks\nlipata\nlist\nlisted\nlisten\nlistening\nlisting\nlit\nliterally\nlittle\nlive\nlivedmeat\nliving\nll\nloa\nload\nloaded\nloading\nloads\nloan\nloans\nlocal\nlocate\nlocation\nlocations\nlock\nlockdown\nlocked\nlocker\nlocking\nlockout\nlocus\nlocusts\nlodge\nlog\nlogan\nlogarithm\nlogged\nlogging\nlogic\nlogin\nlogo\nlogout\nlogs\nlondon\nlong\nlonger\nlook\nlooked\nlooking\nlooks\nloop\nloose\nlord\nlorenabustan\nlorgis\nlose\nlosing\nlost\nlot\nlots\nloud\nlouder\nloudly\nlov\nlove\nloved\nlow\nlowcase\nlowdown\nlower\nlowercase\nlowered\nloyalty\nlucas\nluck\nlucked\nluckily\nlumb\nlunch\nlurky\nluza\nlynchburg\nm\nma\nmachine\nmachines\nmackayton\nmacula\nmadam\nmade\nmagician\nmagnetic\nmagnification\nmaiden\nmail\nmailing\nmails\nmain\nmainstream\nmaintain\nmajor\nmake\nmaker\nmakes\nmaking\nmalago\nmama\nman\nmanage\nmanaged\nmanagement\nmanager\nmanagers\nmanaging\nmanchester\nmandated\nmandible\nmandy\nmania\nmanila\nmannitude\nmanually\nmany\nmap\nmarai\nmarch\nmardi\nmargin\nmarines\nmarios\nmark\nmarked\nmarket\nmarks\nmarry\nmars\nmary\nmass\nmassage\nmatch\nmatching\nmate\nmaterial\nmatissa\nmatter\nmatters\nmay\nmayamot\nmaybe\nmayor\nmcv\nme\nmeal\nmeals\nmean\nmeaning\nmeans\nmeant\nmeantime\nmeanwhile\nmeasure\nmedia\nmedian\nmedical\nmedication\nmedicine\nmedium\nmeet\nmeeting\nmegan\nmelbourne\nmelodrama\nmember\nmemo\nmemorial\nmemory\nmendel\nmendoza\nmental\nmention\nmentioned\nmentioning\nmenu\nmercedes\nmercy\nmess\nmessage\nmessaged\nmessages\nmessaging\nmessed\nmessing\nmet\nmeter\nmeters\nmethod\nmetro\nmfa\nmfi\nmfs\nmhm\nmic\nmichigan\nmicro\nmicrophone\nmicroscope\nmicrosoft\nmicrowave\nmid\nmidday\nmiddle\nmidst\nmidway\nmight\nmigrated\nmigration\nmike\nmiles\nmill\nmillion\nmin\nmind\nmine\nmines\nming\nmingle\nminimize\nminimum\nminor\nminus\nminute\nminutes\nminzy\nmirror\nmiss\nmissed\nmissing\nmistake\nmitochondria\nmitp\nmj\nmm\nmmhmm\nmmms\nmms\nmobile\nmode\nmodel\nmodem\nmogul\nmokam\nmolino\nmom\nmoment\nmoments\nmomentum\nmoms\nmonastic\nmonday\nmoney\nmonger\nmonitor\nmonitored\nmonitoring\nmonitors\nmonkey\nmono\nmontana\nmonth\nmonths\nmonttas\nmonument\nmore\nmorlet\nmorning\nmortals\nmosquito\nmost\nmostly\nmother\nmotor\nmotorcycle\nmotorker\nmotorola\nmounting\nmouse\nmouth\nmouthpiece\nmove\nmoved\nmovement\nmovie\nmoving\nmpo\nmps\nmr\nms\nmsa\nmsi\nmsid\nmt\nmti\nmuch\nmultiple\nmultiples\nmultiplied\nmum\nmusic\nmust\nmute\nmuted\nmvp\nmy\nmyd\nmyford\nmyhealthscreen\nmyhealthsisting\nmyina\nmyp\nmypont\nmyport\nmypp\nmyself\nmytp\nmytpont\nn\nnails\nnaim\nnaird\nname\nnames\nnana\nnancy\nnational\nnative\nnatural\nnatwest\nnausea\nnavigate\nnc\nnci\nnd\nndr\nnear\nnearby\nnearly\nnecessarily\nnecklace\nneed\nneeded\nneeding\nneeds\nnegative\nner\nnervous\nness\nnet\nnetkins\nnetscaler\nnetwest\nnetwork\nnetworks\nnever\nnevertheless\nnew\nnewf\nnewling\nnewly\nnewport\nnews\nnext\nngo\nnhs\nnice\nnicely\nnick\nnight\nnino\nnn\nno\nnoble\nnobody\nnoise\nnoises\nnon\nnone\nnonstop\nnope\nnor\nnordic\nnormal\nnormally\nnorman\nnorwood\nnot\nnotable\nnote\nnoted\nnotepad\nnotes\nnothing\nnoticed\nnoticing\nnotification\nnoval\nnovember\nnow\nnowadays\nnowhere\nnp\nnpc\nnpi\nnq\nns\nnt\nntd\nnti\nntn\nntp\nnuclear\nnueve\nnumber\nnumbers\nnumerics\nnutistic\no\noak\nobc\nobjective\nobliged\nobms\nobs\nobviously\nocho\noctavus\noctober\nof\noff\noffend\noffer\noffice\noffline\noffshore\noften\noh\nok\nokay\nold\nome\nomin\nomni\nomnifi\nomniside\non\nonboarding\nonce\none\nones\nongoing\nonkyo\nonline\nonly\nonsite\nont\nonto\nontp\nopen\nopened\nopening\nopens\nopentrade\nopera\noperas\noperating\noperation\nopinion\nopioid\nopp\nopposite\noption\noptions\nor\norange\norder\nordered\norders\norg\norganization\norganizer\noriginal\nortp\norum\noscar\nother\nothers\notherwise\notp\nounce\nour\nout\noutage\noutcome\nouter\noutlet\noutlook\noutro\noutside\nover\noverall\noverflowed\noverview\nown\nowner\np\npace\npacific\npacing\npack\npackage\npackaging\npacket\npacking\npad\npage\npages\npaid\npain\npair\npairing\npam\npamph\npan\npanel\npango\npapa\npaper\npapers\npapua\nparagraph\nparameter\npardon\nparent\nparents\npark\nparking\nparochy\nparrot\npart\nparticipant\nparticular\npartly\npartner\nparts\nparty\npas\npass\npassage\npasscode\npasscord\npassed\npassing\npassive\npassport\npassword\npasswords\npasswordsit\npast\npaste\npasted\npathcode\npatience\npatient\npatiently\npatson\npaul\npause\npave\npax\npay\npaycheck\npayment\npays\npbx\npc\npci\npcl\npcp\npcr\npcs\npcu\npdp\npeanut\npedal\npen\npending\npeople\nper\npercent\npercentage\nperfect\nperfectly\nperform\nperformance\nperiod\npermanent\npermission\npermissions\npersist\npersisting\nperson\npersonal\npersonally\npesso\npeter\nphi\nphilippines\nphilly\nphilosopher\nphilosophy\nphone\nphones\nphony\nphosphorus\nphosphory\nphoto\nphotos\nphrases\nphysical\npi\npick\npicked\npicture\npictures\npiece\npieces\npin\npine\nping\npingham\npinnant\npins\npipin\npiquet\npizza\nplace\nplaced\nplacement\nplaces\nplacing\nplan\nplane\nplanning\nplant\nplastic\nplatform\nplay\nplayer\nplease\npleased\npleasure\npledge\nplotted\nplow\npluck\nplug\nplugged\nplugging\nplus\npm\npms\npnc\npoint\npointed\npointing\npoisoner\npoker\npoking\npolar\npolice\npolicies\npolicy\npolly\npolo\npool\npop\npope\npopped\npopping\npops\npopular\npopulated\npork\nport\nportal\nportals\nportion\nportland\nports\npose\nposes\npositive\npossibility\npossible\npost\npostal\nposted\nposters\nposting\npostword\npotential\npouring\npoverty\npowdery\npower\npowerbox\npowercard\npowered\npowergiv\npowering\npowerpoint\npowers\npp\nppnc\nppo\nppp\npps\npr\npracticing\npre\nprecious\nprecisely\npreferences\nprefers\nprepare\npreparing\npresent\npresident\npress\npressed\npressing\nprestige\npreston\npretty\nprevent\npreventing\nprevious\npreviously\nprice\npriest\nprimary\nprime\nprince\nprint\nprints\nprior\nprivacy\nprivate\npro\nprobably\nproblem\nproblems\nprocedure\nproceed\nproceeded\nproceeding\nprocess\nprocessed\nprocesses\nprocessing\nproduce\nproducing\nproduct\nproduction\nproductivity\nprofessor\nprofile\nprogram\nprogress\nproject\nprome\npromoter\nprompted\nprompting\nproper\nproperly\nproperty\nprotect\nprotected\nprovide\nprovided\nprovider\nproviding\nproxy\nptcl\npte\nptsd\npugged\npull\npulled\npulling\npurchase\npurchasing\npure\npurpose\npurposes\npush\npushed\npushing\nput\nputs\nputting\npuzzle\npvd\npwh\npwp\npx\npythias\nq\nqldp\nqr\nquad\nquality\nquarter\nquatted\nquebec\nqueen\nqueensville\nquery\nquest\nquestion\nquestions\nquick\nquickly\nquit\nquite\nquote\nr\nrace\nradiance\nradians\nradio\nradish\nradiz\nrain\nraining\nraise\nraised\nraising\nran\nrandom\nrat\nrate\nrather\nrating\nratings\nratio\nray\nrays\nrbc\nrca\nre\nreach\nreached\nreaching\nread\nreading\nready\nreal\nrealized\nreally\nreap\nreason\nreasons\nreattached\nreboot\nrebooted\nrebooting\nrebound\nrebuild\nrebutted\nrebutting\nrecall\nreceipt\nreceive\nreceived\nreceiver\nreceiving\nrecent\nrecently\nrecess\nrecheck\nrecipe\nrecited\nreckon\nreclose\nrecognition\nrecommend\nreconfirm\nreconfirming\nreconnect\nreconnecting\nreconnection\nrecord\nrecorded\nrecording\nrecount\nrecover\nrecovered\nrecoveries\nrecovering\nrecovery\nrecreate\nred\nredirected\nreduce\nredware\nreenable\nref\nrefer\nreference\nreferences\nreferencing\nreferred\nreferring\nrefinement\nreflation\nreflect\nreflecting\nreflub\nreflug\nrefold\nrefolx\nreform\nrefresh\nrefreshing\nrefrigerator\nrega\nregard\nregarding\nregards\nreggae\nregional\nregister\nregistered\nregistration\nregret\nregular\nrehire\nreich\nreid\nreindos\nreinforced\nreinforming\nreinstall\nreinstalling\nrejoin\nrelated\nrelation\nrelations\nrelationship\nrelative\nrelaunch\nrelease\nreliable\nreligion\nreload\nrelogged\nreluct\nremain\nremember\nremembered\nremit\nremonstration\nremote\nremove\nremoved\nremoving\nrent\nrental\nrenting\nreopen\nreopening\nrep\nrepack\nrepair\nrepairs\nrepayment\nrepeat\nrepeating\nrepentance\nreplace\nreplaced\nreplacement\nreplacing\nreplay\nreplicate\nreplication\nreplu\nreplug\nreply\nreplying\nrepn\nrepool\nreport\nreported\nreporting\nreports\nrepository\nrepresentative\nrepresented\nreputation\nreq\nrequest\nrequested\nrequesting\nrequire\nrequired\nrequirement\nrequirements\nrequires\nresatisfied\nresearch\nresend\nreservation\nreserved\nreset\nreseting\nresetted\nresetting\nresign\nresolution\nresolutions\nresolve\nresolved\nresolving\nresorted\nresource\nresources\nrespect\nrespective\nrespond\nresponded\nresponding\nresponse\nrest\nrestart\nrestarted\nrestarting\nrestore\nrestored\nrestricted\nresult\nresulted\nresults\nresumed\nresumes\nresumption\nretailers\nretails\nretrieved\nretry\nreturn\nreturning\nreuser\nreusing\nrevelation\nrevenge\nreview\nreviewing\nrevoke\nrevolt\nreward\nrewrite\nrez\nrich\nrid\nridipc\nright\nrighty\nring\nringing\nrings\nripping\nrise\nrisk\nrit\nritm\nritual\nriver\nrl\nrms\nro\nroad\nrobot\nrock\nrocked\nroger\nroja\nroker\nrole\nrolled\nroman\nromeo\nroom\nroot\nrotor\nround\nrounder\nroute\nrouted\nrouter\nrouters\nroutes\nrouting\nrow\nrq\nrub\nrugby\nrule\nrules\nrun\nrunning\nrush\nrushed\ns\nsad\nsafe\nsafely\nsaid\nsake\nsalem\nsales\nsalmon\nsalt\nsalves\nsalvior\nsam\nsamaj\nsame\nsan\nsands\nsango\nsanitisers\nsanta\nsara\nsat\nsatellite\nsatisfaction\nsatisfied\nsatisfy\nsaturday\nsaudi\nsave\nsaved\nsaw\nsay\nsaying\nsays\nsb\nsba\nsbmi\nsca\nscale\nscaler\nscam\nscan\nscant\nscene\nscenic\nschedule\nscheme\nschemes\nschool\nscidders\nscore\nscott\nscout\nscp\nscreen\nscreener\nscreenmate\nscreens\nscreensaver\nscreenshare\nscreenshot\nscreenshots\nscreenwriter\nscrew\nscrewdriver\nscrewing\nscrews\nscroll\nscrolls\nsda\nsearch\nsearching\nseason\nseat\nseated\nseattle\nsec\nsecond\nseconds\nsecretly\nsection\nsectional\nsecure\nsecurity\nsee\nseeing\nseek\nseem\nseemed\nseems\nseen\nseep\nselect\nselected\nselecting\nselective\nself\nsell\nselling\nselvo\nsemi\nsend\nsended\nsending\nsends\nsense\nsensitive\nsent\nsentinel\nseparate\nseparately\nseptember\nserial\nseries\nseriously\nservant\nserve\nserver\nservice\nservices\nsession\nsessions\nset\nsetdown\nsets\nsetting\nsettings\nsettlement\nsetup\nsetuping\nsfa\nsfs\nsgmit\nshabank\nshadow\nshake\nshall\nshally\nshame\nshape\nshara\nshare\nshared\nsharia\nsharing\nshe\nsheet\nshewaterland\nshift\nshining\nship\nshipment\nshipped\nshipping\nshira\nshoe\nshomi\nshoot\nshooting\nshootment\nshop\nshort\nshortly\nshot\nshould\nshoulder\nshouldn\nshow\nshowed\nshower\nshowing\nshows\nshunka\nshut\nshutdown\nshuts\nshutting\nsick\nside\nsides\nsierra\nsiete\nsign\nsignal\nsignature\nsigned\nsigning\nsim\nsimple\nsimply\nsince\nsingh\nsinging\nsingle\nsinus\nsir\nsister\nsit\nsite\nsites\nsitting\nsituation\nsize\nskill\nskin\nskinny\nskins\nskip\nskittle\nslap\nslash\nslide\nslight\nslot\nslow\nslower\nslowing\nslowly\nsmall\nsmaller\nsmallest\nsmart\nsmile\nsmiles\nsmoke\nsms\nsmudge\nsn\nsnap\nsnapple\nsnapshot\nsneak\nsnow\nsns\nso\nsoccer\nsocial\nsociety\nsocket\nsockets\nsoft\nsoftware\nsold\nsolution\nsolve\nsome\nsomebody\nsomeday\nsomehow\nsomeone\nsomething\nsometime\nsometimes\nsomewhat\nsomewhere\nson\nsoon\nsorry\nsort\nsorted\nsos\nsought\nsound\nsounds\nsouth\nspace\nspam\nspams\nspare\nspark\nspeak\nspeaker\nspeakerphone\nspeakers\nspeaking\nspears\nspecial\nspecialist\nspecialists\nspecific\nspectrum\nspeech\nspeed\nspell\nspelled\nspellings\nspells\nspend\nspin\nspindle\nspinning\nsplit\nspoke\nspoken\nspontaneity\nsport\nsports\nspot\nsquare\nss\nsspas\nstabbed\nstable\nstack\nstacks\nstage\nstair\nstand\nstandard\nstandsta\nstarbucks\nstars\nstart\nstarted\nstarting\nstarts\nstartup\nstate\nstated\nstatement\nstates\nstatic\nstating\nstation\nstationary\nstatus\nstay\nstayed\nstaying\nsteady\nsteam\nsteamed\nsteaming\nsteel\nstem\nstep\nsteps\nstick\nsticker\nsticky\nstiff\nstill\nstin\nstock\nstocks\nstolen\nstoned\nstop\nstopped\nstore\nstraight\nstraightforward\nstrange\nstrangest\nstrap\nstrategy\nstreet\nstretch\nstrong\nstrongest\nstrongly\nstructure\nstruggle\nstruggled\nstuck\nstudent\nstudents\nstudy\nstuff\nsu\nsub\nsubmit\nsubmitted\nsubstances\nsuccessful\nsuccessfully\nsuch\nsuck\nsudden\nsuddenly\nsugar\nsuggest\nsuggested\nsuggesting\nsuitable\nsummer\nsummon\nsuper\nsupervise\nsupervisor\nsupervisors\nsupplements\nsupply\nsupport\nsupporter\nsupporters\nsupporting\nsupportnew\nsupports\nsuppose\nsupposed\nsure\nsurely\nsurge\nsurname\nsurprise\nsurprises\nsurvey\nsurveys\nsurvive\nsustain\nsuv\nsv\nsva\nsvl\nswap\nswapped\nswapping\nswear\nsweet\nsweetie\nswell\nswitch\nswitched\nswitching\nsymbol\nsymbols\nsync\nsynced\nsystem\nsysteming\nsystems\nt\ntab\ntabby\ntable\ntablet\ntabs\ntack\ntad\ntag\ntagged\ntake\ntaken\ntakes\ntaking\ntalicia\ntalk\ntalked\ntalking\ntall\ntan\ntangle\ntango\ntanza\ntap\ntapping\ntarney\ntask\ntaudiness\ntavite\ntbpt\ntbside\ntc\ntcms\ntcr\nteacher\nteam\nteammate\nteams\ntearing\nteas\ntech\ntechnical\nteddy\nteeth\ntel\ntele\ntelecoform\ntelecom\ntelegram\ntelepahan\ntelepaths\ntelepathy\nteleper\nteleperant\nteleperform\nteleperformance\nteleperforming\nteleperforms\ntelepermann\ntelephone\ntelepop\nteleprofency\ntelevo\ntelevox\ntell\ntelling\ntells\ntemple\ntemporarily\ntemporary\ntempt\ntend\ntennessee\ntenny\nterm\nterms\nterrific\nterrifying\ntesla\ntest\ntested\ntesting\ntexaco\ntexas\ntext\ntexted\nthan\nthank\nthanks\nthat\nthcp\nthe\ntheca\ntheest\nthehammas\ntheir\nthem\nthemax\ntheme\nthemi\nthen\ntheory\ntheperformance\ntherapy\nthere\nthereafter\ntherefore\ntherein\nthese\nthey\nthick\nthin\nthing\nthings\nthink\nthis\nthisdown\nthislicia\nthose\nthough\nthought\nthrough\nthrow\nthrowing\nthursday\nticket\ntickets\nticking\ntie\ntiers\ntified\ntightly\ntill\ntimber\ntime\ntimed\ntimeout\ntimes\ntimetable\ntimid\ntina\ntino\ntiny\ntire\ntissue\ntitle\ntk\ntl\ntn\nto\ntoad\ntoday\ntogether\ntoify\ntold\ntolerable\ntom\ntommy\ntomorrow\ntoo\ntook\ntool\ntoolbar\ntools\ntop\ntopic\ntotal\ntotally\ntotem\ntouch\ntours\ntowards\ntower\ntown\ntp\ntpc\ntpcpu\ntpcs\ntpdi\ntpg\ntph\ntpp\ntppdi\ntps\ntpu\ntpusa\ntpusha\ntpv\ntpvda\ntrack\ntracking\ntrade\ntradition\ntrain\ntrainer\ntraining\ntrait\ntrans\ntranscribed\ntransfer\ntransferred\ntransferring\ntransparent\ntravel\ntree\ntrees\ntresh\ntrial\ntricks\ntried\ntriple\ntroku\ntrouble\ntroubleshoot\ntroubleshooting\ntroubleshootings\ntrue\ntruly\ntrust\ntry\ntrying\nts\ntt\ntub\ntube\ntubic\ntubing\ntuck\ntuesday\ntumors\ntune\ntunnel\nturboshoping\nturn\nturned\nturning\nturns\ntutor\ntv\ntwice\ntwin\ntwisted\ntwix\ntwp\ntype\ntyped\ntypes\ntypical\ntyping\nu\nua\nuac\nubs\nucr\nuh\nuhc\nuhhuh\nui\nuic\nuk\nukd\num\numbila\numbrella\nun\nunable\nunaccounted\nunauthorized\nunavailable\nunbelievable\nunblock\nunconnected\nunder\nunderscore\nunderstand\nunderstanding\nunderstood\nunflugged\nunfold\nunfortunately\nuniform\nuninstall\nuninstalled\nunion\nunit\nunited\nunitedhealthcare\nunits\nunknown\nunless\nunload\nunloaded\nunlock\nunlocked\nunlocking\nunnoticed\nunplanned\nunplexed\nunplot\nunplug\nunplugged\nunplugging\nunplut\nunrelated\nunresolved\nunrevariative\nunrupted\nunsaid\nunsatisfied\nunsettled\nunstuck\nunsuccessful\nuntil\nunwelcome\nup\nupc\nupdate\nupdated\nupdates\nupdating\nupgrade\nupgraded\nupgrading\nupload\nuploading\nupon\nupper\nuppercase\nuppercases\nups\nupside\nur\nurl\nus\nusa\nusaid\nusb\nusc\nuse\nused\nuser\nusername\nusernames\nusers\nuses\nusing\nusn\nusual\nusually\nut\nutility\nutilizing\nuwa\nv\nva\nvacation\nvacuum\nvalid\nvalidate\nvalidation\nvalu\nvaluable\nvalve\nvanilla\nvantage\nvarious\nvasa\nvb\nvbi\nvcb\nvcn\nvd\nvda\nvdaga\nvdi\nvds\nve\nveep\nvencare\nverification\nverifications\nverified\nverifies\nverify\nverifying\nvermiz\nversion\nversus\nvertis\nvery\nvg\nvga\nvgi\nvhcp\nvia\nvice\nvictor\nvictoria\nvictory\nvideo\nvideos\nview\nviewing\nvignette\nviii\nvillage\nvin\nvina\nvirginia\nvirtual\nvirtualization\nvisa\nvisibility\nvisible\nvisit\nvisited\nvisiting\nvisual\nvisually\nvj\nvjit\nvl\nvm\nvms\nvn\nvocal\nvoice\nvolmer\nvolumes\nvote\nvp\nvpi\nvpl\nvpn\nvps\nvta\nvti\nvtp\nvul\nvvi\nvw\nvwcc\nvwptcr\nw\nwagons\nwaha\nwahaset\nwait\nwaited\nwaiting\nwake\nwalden\nwalk\nwalked\nwalking\nwalks\nwall\nwallet\nwalmarts\nwalms\nwalter\nwant\nwanted\nwanting\nwants\nwar\nwarcore\nwarm\nwas\nwashing\nwasn\nwaste\nwasted\nwatch\nwatching\nwater\nwatermelon\nway\nways\nwcbs\nwe\nweapon\nweapons\nwear\nwearing\nweather\nweb\nwebcam\nwebfast\nwebmill\nwebsite\nwednesday\nweek\nweekday\nweekend\nweeks\nweeping\nweigh\nweight\nweird\nwelcome\nwell\nwellcare\nwent\nwere\nweren\nwest\nwfm\nwgo\nwhat\nwhatever\nwheeling\nwhen\nwhenever\nwhere\nwhereas\nwherein\nwhether\nwhich\nwhile\nwhilst\nwhiskey\nwhite\nwhitespeaker\nwho\nwhole\nwhom\nwhoops\nwhy\nwi\nwide\nwider\nwidest\nwife\nwifi\nwill\nwilling\nwillization\nwin\nwind\nwindow\nwindows\nwins\nwinsway\nwinter\nwipe\nwiped\nwire\nwires\nwise\nwish\nwith\nwithin\nwithout\nwmt\nwoke\nwon\nwonder\nwonderful\nwondering\nwood\nwooly\nword\nwords\nwork\nworkday\nworked\nworker\nworkers\nworkgroup\nworking\nworks\nworkspace\nworkstation\nworld\nworried\nworries\nworry\nworrying\nworth\nworthing\nworthwhile\nwould\nwouldn\nwow\nwp\nwrap\nwreck\nwrite\nwriting\nwritten\nwrong\nwrote\nwy\nx\nxxxa\ny\nyahoo\nyale\nyankee\nyeah\nyear\nyears\nyell\nyellow\nyen\nyep\nyes\nyesterday\nyet\nyinco\nymail\nyou\nyoung\nyour\nyours\nyourself\nyourses\nyoutube\nyup\nz\nzarlie\nzca\nzebra\nzed\nzero\nzeros\nzing\nzip\nzmail\nznga\nzone\nzoo\nzoom\nzpo\nzscaler\nzulu", "lengths": "CAMCAgICAgQECwICAgICAQIDAgICAgICAgIIAgICBAICNAICAigCBhQCAg8CEQJfAwgCAwIDAgYHBAIJCgKfAh8CAgICBg8EBwIMAgICFgICCwIOAgYCAgsEiAFIAgIFAw4EBwQCAgMUZAICCAICAgICBgYEAgICiAIGAggCAwICCgICAjUGAgICAgQCAgWRAQICBAICBAQCAgYCMgYCBgIDAgYCBAMCAgICCUcEAgIEAgICAu0LAgIBBAGPAgKLAQIEHwICDQICBIoBAgICBAYLAvkBAggCBAICBAIEEwICCl0NBxkQBAQCaKcBBAICAgICAgICBAIDAgIDCggCAgbQAQoCqAMCBEEFAidsAlECCI0BDgQCAwECAgICBKQEiQESCgICHwYITAUCAgLdASAC7AEECAQCBAICAhaSBgICAwICAgbhAQICAgL8DQICAgILBgICBAICWRQCBgICD80CAgQCGg6KAgUQAgwCAgIDAncCAgICAgIwAjUEAgQEDgICSBQGBAJzCQIOCQgTFQKdBAYOAgMCAg8CAgICCQICrAMCAgQIAkkWXQICEAICBgICjQGjAQkCDQIEAgIK9wECAgICAgICBAQGBAICBgIIBAIODQIPCAwCKTQCAgIEFgICBDIHAgICAgsGBAVZAgLwAgsCMAINBAkCAgICAgICBQICBAYEAgQCAgIEDgoHIAIDBAICAgIEAgO/BAICAjoCDQMFArACAgIEwwEEAtYBAgIKAgr5ARQCAgMOAgQGAgIBAgIpGRQKAgICAgIUAgoCAgYDAggCPgIHAjMCCAICBAIEEQMQAgICGwMCAgICAtIBAgQCAgQCBAICCQIFBwICBAQCAgICAiYCBjUGOQIRBAIJAwMEAgIoBAIMAgIEAhACAgMIAgI6AgICAgIEAgICAgICAgIEOAIE/AI1BAIDc5IBqAECvwE8AgICAu0EBFgEpgIeFpsBCcIMAgoKBAIEBDQCAkMCBAIEAgoVAkwCAhECAgYCAnQCCAQEBAQ0AgQCAgIEGwICAhwCBwwCAgICAggJAgICAgICAgICZSoUDAcRCQcCBJwBAgIKAgICnQMCAjN8EAICAgICAwICCQYCBwICAgIFBAIEBAYEIQcdEQICAgIKAgIGEwICEeUBBw8CIgYCAgoCZxEcAgQCAgQCBAICAgJNCgICAgIEBgQCAgIMBoABQRcqAgYCAgQEBAICFwQCAgKcAQ4cAgICAwQCpwEGBAQwBAICAgYEAgICAjoCBsQBVAIGIAICAgICAgLvAeABBEghAgIGBAQCDAICAgMCAocCAhOLAWsHAgQDCgICZwICAgUCGwIEAgIbEQICBAUQAggCAgQXsgILAgICAgIxjwIWAgICEgIXBB8IAggCAhcEAgIOAgKQAQQCAgICAgZTOiMCAhMODQYEBAICAgIEAgICAgICBgITAgQCAhkeAgKPAQsKAgICAgICbgILAgkGAgICAgcwBI8BAgICBK0BMwICAgICBgQKBAICAgQCCAYCBgkCAgMGAgIEAgICAjsDAgICAhkOAgQEBAYCCC0CAgYCBAICAgICAgISAgIEAgICAgICAwQCAgICBAI0DwICDoIBAgIkDAICAgICAgIHAgIGAgQCsgFmAgRBAgQQAgQCAgIEAgIQEwICAgICE2ZKBQQCBiAbEAICCAICAgQCAgICFAMCAgICAgICAgICDwICAgfhBAgDBAJBRQwCAk8KBBkCAwLEAn4CAgEFAgKtAQICCx0CAgLAAQkEBAIFDQIEAgkCAgQGDAwEBAICAgMCJQICAgUIAgIWAwsCAqgBDAICBjIGBAICBgRlBgICdA4CAgQCFAICAgICAgIfAgICAgIC0QECAvwBAgQCAgICHg4CCwIMDgIDAocBBgIKBgICAgQCfwYCBgIEAqgBDA8CAgIIAgIKAgICAgICAgQEEgQCAoEBAgQaKRQEAgICAoEBBAICAgICAgICDgICAgI3CAISJgIGAmwCAgIEJyUEBAQeAgMCAgQCEwQCAgQCAgICBgICCQkCAgQCAgQJAgICDAQCAjYCEgQCAmICBgICAiIGAgICAggCBAJtFQICAhkEAgICAgQCBwYCAgICDQUGBIYBBAsCAgICAgQCBsgBAgQEAgYGBA8EBAIKAgIGCApNAga7AQIIDQYCowMIAQQCBQIaAggCAgIFAgICBAICAgwCBwIEAgICCQIECQkaBGsCAgKmDgIMAgICBAIJGgICAgIVBgIeCAIXBAICDgICCgIDBAsQAgKOBB4CAwICfwsGAgQCAgRVFQI5AgQCAgIEAgICAgIHKwQCAgICAgICBAIKBgIPAgIFAs0CFZUBAgIEAgICAgelAhcLrQEJDQICPJUCBAQcEbACAgIKERqSARMEBgyUAgICAgIGBAICAqQBDAIEAgICAgICHAIGAgICAgQjAgIPAgICDyACRgKpAQICEQICEAJgAgoaAgICDyUKEgkCGAQCBAICtQEOAgIC1wc/fAICAgkwEgIEEgI4BAICcAwCAgINArYEAvsEDgYCdQkCAgIIDQIXBAQd4wIdAoQBRA8TXAYCCBMCAgoZMA8DCwoDApoDAhgCCwICBAdmAgIEBAQCAgICGwsCAgICAgQbAi0FCRcbCAIE2gITAgICBgIOAgICAgICCAICApUcAgIGAgIiCALvAQwIAgICGAYEAgYCAgICBgICAgICBAQCAgICygMCAgICAwICAgcCAgIEhQECAoUJAgIClgECAgIPAgYCAgoCBgICAgJxBAICKgIDAgICApUBDAICBAQTAgICAgojnAEKAgIECggDCwICAgICEAILBBMCAgQRAgMEEwICBAIEUQQC6wECAgICDAICAgIEDgIEBQICA/AOAgICHR0CAgQC/QMEMQIC5RMPCQICBAICBALfARcCBARKBAICAgIKAgQDAgMCAgIYFQ0WAgQEAgICMQIHBgQCCgKgCAIrAgICAgICNQQWAgICAgICAzorAgoEAgIFAgIGAgICFwIvKAICBAICAgICAggCBgQDiQQCAgICAgJUBgQCAgQHBgYCAgICAhEEAgITArQBAiECAgIEBwICAgICAgICBQICAgIGAhwaBQLGAQIeAgICAgIGAgLaBDMLJCkCAgICAgICAwIIAgICOAblAgIoBAIDAqsBAgK4AgUKAgICDAoDAgs4CQICxwMDFxM1AgQCEgJKAhQCSwQGAgoEAo4DBAJURgNmAgQEBksNOA0jHwIEBAIFBAMPIAIEDAICGAQbBQJCbQICAgYCAgIIAgID8QnwBBgCAgIDagICAgIsAgIXAgICewICCwIKDAYJAl8CAgICAgIFBgIJKwQECgICAgICBAYCAgEUAgICAgMCAgYCxwICIwIC0AwCAnYC2gEEBhMCCgICAgUCCw4CAgIOBAICAgICDScIEAICAqIBBBcCAgQEAgIEBgwCAgYCAgICBT0CAgILAgI+AgMZBgIEAgcMAgICDwYCCZQBiAICAhMEEgYCBgIEbQIERw4ECQICAgeuAhACAgITGwKPAQQEHgICBEcUAgKEAQJCAwIgBAcCAgICAhQPAiANAgQIAgIMGwQCAgICugN9AgICYhgCAgKcCAICBQICAgICAggJA6oBAgMCjQQCAmECAgIBAgIEBAUCCwMCAgLgAxYIGQICAgISAgIDKAQWAsYBAwICBgg7AgU5AgILAgLMBQIMDwIGDgQIBAIaDgIDhAYCkwEJBAlCAgIKAmizBQICBAIHAgIEAgICAgICqQYfAgJeBAICAgICCgICF/sFdgICHAICBv0BoA+HBjkFAgQCAqoMBJUCrgcXAgKcAbsBBwYPBq8BGiwFAgICAgIEAgICUhu7Aw8kAgICDgIEAgIilgEEEAIC1wHRAQoCAgIEAg5rAgICFANGAgICAgYCBAICKwYGBgICAgICAgIrCgQCAgIMAwICAgICEgIIAgYCAwIgBiACBAICArgDEwISAgQCgwEUEQIFBgICFQIGAgKsAQMCBAsKAgICBAoGFA4CAkwIE18GDQ4CAQISdQYCAgYiAgIBgAILAgICBgMCDgILAiEGDgYOAgUCAgQCAgInBAQCChICAgICDggCpwwCBwICAwIvEQkQDQoCCwICAgICAgIGEQICAhICAggEBAQFKhMCAgIeAgIEAi9sBgoCBAICAgIChgECAgICBAICDAICBAIEAgICAgICAgICApkBAgkCAgwEAiQcBAIEAgICAgsCFAISkQEJDDMCJSoJAgYCAgkGAgIaBgYFAgIEAggeAggC2wFHHUUFAgICAiQHDgQCAgMCBgQCyAECJAICAgICAk0CBgIJAgIWGwIFBCInGBcCCAiQAQICAgkCAgICFA0EBAUCJAYHAwoXAgIC/QMZBghIC4oBEAKPAQIlCwIvBhQCAgICAgRZagIXCBUCBgICAgICBA4CDwgCCQoEAgIDAgINAgsEAgICAgZSAgIGBAICBAMCAgICAgoFAgIEXgkCAgwOBAQCAgICAgICBQICCAICBwIPBwICAgICAnIEAgIbQgcIBAICDAICAgYCAq8BDgIbDJoBBwILAwEEBgQCAgwJCAYCCAICCFMMFQ8RBAQGAgYCAgKAAQIGEgKCAQJ5uQENAgQCAgIMAgaSARFWHBIEAgIUBgIBAgICAgIDBwICAgICRwYCAgICAgYGAtYGAgwFAgICBAICAwICAgIEAgICAgICAgIDaggEAwYCCgMfAgIEAgICAgICCgwCAuULAggCgwECAgMCAgICFALbAQICAgICAgIChgHZAQQEAgQHDndtbAUEAgLUAQICBAIHAgcEAhcCBgICAtEBAgIEAgIIAgIEAgICAgICCQUCAwICBpICUgIJAgM98AIoAgYCHxACkQEEAgISBgICAsUBAlcCAhd6AgQCIRYCAgIEDNsBH2IKUQICDg0CEgICAgICAgIRAgECAmIyAiUtAgIOAwYDBh4CAgICCAIGigEQCJUBAgTsAQYEax8CGwQEBQRiBhsChwEHAhIaAgUKRAIHEQLxAQUKOgQGBQkJBAICCAQCDwQCAx0HAgQxCAICAgIEBwICDgIGAgICvwwCBAIIAgQHAg4ChAERAgITUQQZAgUEGI8EDAQCBAwQAgQCAgIFGgwCAg4CFH4CDAICByEEAgIEAgIICAkCAgQCAgIEAgICAgICAg4CAgICVyITFQIIAmsNAgUTAgflAQKqAQICAgICBA0RBhQGAr0CAgICAgIUBAQCAgUCAgQGAgRUagICAhkCAgIZAgIGBgIGEAwCAgoEAgICBAQCAgKqAQUCApoCAgIEAgIKIrgCRAIEAgL1ASQCAgILAgIJBAcCAgIDEwYCDwQDAtUBAgSTBRYCHgIDAgIxAqcCCxIzAhQGLgICBDMCDgICBAICAgICAgUCzgEDPwICDwICAgIJAgMCAgICLwIDJwMGAg4CAgIClwEmAgIFYQIEBAIKBgICAh0CBAIEUgMf2A2XAsINArgYAgICMU4CAgKjAwICBJ4EAgICMM0BAgK0ASS/AZ4JAgIbEhdcBAICvQMPAgICAgIaAp4DAwMtAgMCAgICAgICAgKREwL0AQgCPwICAhQ3eh0CGiEDCgoDAgIKBgUrAgICAgICAgIGBQQCCwQKFgICBBETAgICDAwCAgIEAgIEAm8CAh0MKgIGBAWXA6cBAgQEAgICAgICAgICbx0lDAITDAICAgNEAgIECzkCAwQCYAg/AgIYAlgCFQRGAgICAgICHARiEyACAgkTCQICEw8IAgIIAgI7IQsCAgICJggCAgICAgICYQICAhQCiwIIWCUPEwICAgYDDClyAgICAgWIAiQCBgiWASFJawIKAtEBAgIRAgICBEQCBAIHAgMCZAICAgICAgICAgYZAlQEzAECAiMCCAJPCgICBALgAgUMBAIfAiICC18CAgICAgMCAgIKAgQCFAgCBAICAwICCx4CAhUCAgQLAgLTAQICBAICAgMDAzMCBgLbAQRgAgIOBBAEBAICAgTXARoCBAICAtEDAiUCAgQCBAJECAKrAwYCAg8EHA8CAgsCHAIIBgICAgSyArEBBB2mAQQCAgKIBCMC7AEqjwIEMim8AmoCHA8CJSMCAmMEAgICBRDaBAYCCAIgLAQCAgIDBAQGBOQHHR0CAh4GIAkCAg0EjgEFDQQCAt0CJwMGBAJrMwIEAgLYAQwEBQMCNwQPIQQCKgJWCAIpogpPDAISAlaxCSZLAgKqIQKsDgsNAgICLQICFAI3AgIPAgICAgICBBI=", "postings": "szXYA74Cxw2eCgLjF78S8BjUC50SmgOaFs4FrUHzIHnnBo4CrQLLDb8X8SueQo8t1C19iUXfFByHAbFIijWeCPwMjDDJR9kY4Rb0HKUKAwrVM+sg4hbGEcsoxTrAPeMIQHsCrAGDAQF+J5AFbgLDAdIBQt8B2gFesQLaAawBlwGLAdAF1AIB7waLB+0F5gXlBDjZGNkYzQ+AAQEGmgKVB9oD/AfWAY4DJ4EGAQEBzwH2AcMD/gcGzQnRAr4E9wkChwGxFaohnRHRCmMCpQQE8xDABksBrgEVrhfVBcQ9xj3FFZ0CqQTzDA7vCakT1wG8FZ8Q7AueDaME4Qq3CZcGiQEe/DpXcasChgHOAW1vdQuTAhzjAbgBerAB3AICahwoFG5CmQEdUwJzTmIlFKsCG5IBImT3ARYLhwRH2wQObw6FAi7nAjoSjwE6ggPSAxFbpQEmeZ0BnwKtAnC0AZgBjQGVAscUHJABjw/TCL8JnDWzRwTUDPg5AdEVoASBF/gHnw/YEIMrBPE8iQ6fD/oCpgHgIVqBELkD4Qm/AZgo9gPkLCdZBgEIBAIOAQSLARkc8QEiUBQBRAkdBRISF1cfByEEKQgCAgUJBN4BfQIPGB8zIgdVAgEQDwITCAELIReCAQEIEzMEJFVZBgICEwkaAhIrCEkOBTcNGQMcCwcKCwcVFBYaoQE6FwgEBwMjHDIHDAQLIhUCSixABhgIBAIbJAIUCSATzgEOMD0dEREBChM1KTEIDQ2vARVdA3U1BwItDQIGIGV+DQkBASBJFgIIjAIbAxlTNWcCUQICAQExU3ABFhMYAQkHCAUCDU0MRgYQPkiOAQR0PSBZDhhJCwkeARfCAYQBC0AuFC8CFS0zCmgFoAGIAXoSAgIEZyQuAlEeRjEJCR4/CQgj/gETARRLGQI9ARUnFgKCAScBCgkuMQ8ZkwHFCKgDdZsFBJ0CsAaQBagC6QjcBskBggOVEKIDHdU14B/gH98noASnIY4gjwX6BgKBCv4HkAu7CpcEzQ/aBZAT5wdpiR+TAfACtQhG0x+6DgHaAYE/izmMKeEL9gb8BJkGjQPhBZoQAQH9BKwKggSHAdMSN+0P8AcaPoYP/xTqE8QBgwepBxYUMQHiB60r80iRBtIQuw/FQpkjqhwilQ6ICvoO+gK5MOIMSDENAR2NAcoCZAFqHVkEEgEzY+cCcCcHVwEQNj9rAhDqAQICAVwaAQES0wFFHGcU0QEaIz8x+wEDBQJXHSB4AbQBXRJjswFnFdUBdSd2DHsikwOYAs0BogMwpwErCPgCNRkELUEHLzdJO1MEZQf9AxKgAxQMCqcBM7ICE1YKGQJGAQ6hAZcBSYcEtQFGsQOHAwMEAaAB7QLvBKkCngPJAgET9wFq8wICAQEJAwEBAVHXAoEBMAIKfAKSBb0DUQoiAgE/PyrDAwKkA/cFmQPQA/Ea1x/HFByuL8EHAocBgAHNGUTVBQHKAagn8ieaIKIEoxzqEgyzCf4PgQyHAvg5AcMKDgGLBKgO3AfaBP4Gkga+CeQLhwGBAQECpwNQwAITAw8ECLoBA54CYJ0BHsQBBQlBjQOeAZoBIWcIBJcBmQJAJiDhAwQIARMHAw6DBwY1rgLYAibWCsMBNAEBAQIVA2/cA7IBhwPHAU0uG0xpfrYCYQwFCiQEB4QJgDyxLbQKpgGrErYJuT3gN9chjgbLBo4SkQ+KFwE/AgLsHY0DxBeLOewvhgEBHAEEX2GLAQWBAQI5JHIpQS1CdYwCDRklWScDQwEleQIHBAgEBlgBAxgBgwEHJQE7Ow8XDwLEAQI8GAEDGAEnAwEQCgFjAUFyDhkCGwEyFwkBAQE4Bg4mTjooJQETAgQUAyASASIiU0QBMHsBASEBYAMcHwG7AQEVXAEHATY6NAFrAzQDYy5NAxkiAT8PTDmEAQcBiQEOAmEDCQgCCBJIagEqAT8FfuQBATkEDkIsIXQrKQgBkQFCCUO0AQFJNwMBRQIOEBEDExQBAwYRAQITKDMROQkdAVIDIwEGNIQBATFiaQM5GjkJCU0/AQg+KQgRI3cBQwdOAU4SGQIRThsBSUoYVwlQ7w7VKeIB9BbbDeIHphWbFp06iQIB1CGOR4UB9wuWC78j5QrbC41B6Q68BYQCBOkCA8QB1wKEAa0BuAEL6QOuBb0FPwWFAZYCgwGKBtYFzQW5AkLIArwDDNEGNXSXAtMRvw+PCLYvukGhL/wQzhECAvQl7Bg3jCz/FoYBHjEyYZABApQCPCm6AVOkAjmVAUSgAQcQMi0cM312NwkGhQEyDj4cPhFktAEJHxwXAwUTFwoBAVOGAW8TUCIimAEwfSJDBwECAgFPvAEVZUMtCSxumAI8gQFTiwGZAcQC0gNieHRdEwS8AQn4AYQBeRYtAn8JMSZ5OoUBjAFzngGNAQg+MREjkQJgG3viAXmtItcB6Q6DKZkGlSDYG/4f1wHiO+cHwga1Aq8YjRyMR8AHwAFXAZMDnQMlBQmcAosEY5oBZ5ACjAL+AQwMnwSZBskPTJgDuwHiAwXsA9IDQTVazAKmKeUOwx65A7Iv7xD1P/g5AfI6jwWkC+cPyi1XmRoBkgkB0TXFOtE1oDOOGakqBAIE0wPAAlulBJcCAfQBjwTZArYBywQDBTPkCAIBwgH/AwELAwSVAd8JyQJNIIYBN5EBByoHAmtmO+4CngKUAccCX5cDQQIDPhPZAoYZAjO5FoFHwBucB4Iczzu4PuELCgYBAwIDDhUKCwUDCQsGEgEBCAQCAgwBAgEBBAIBBBgCAgoBCQsEAgEDBAEBAQMHBwIBAgEBBgoBAQICBAIEAQoBDgkBBAIGARMGAgoDAgIEAgwEBAkOAQQCAQIFBBsCAgELBRURAQMBCAQICAoCHQECDwUIDRAaAQEGAgMBBQgFAgoCBwETBAUIBQYCDAYCAQEEBgIIAhIDFBoEAgQEAgUUHAIFFgEXAgIBCwYDFQMEAgoEAxIJDQoBAgIGDwYBAQMBCAwCAgQSHwIaCSc/AQYGAQEIAQECBQgCCAIBAQICAgIBBBAEAg0MDAENCAQEGwQICgwCAQ4BBAImAQcBAgQSAQMBBAQOBgIFBxQKAwIjEQIDAgIEBAgCAQkDAwECAQIFCQEDHgUCBAQHAQECAgQCBAQEBAEgCQ4LAQIFCQ4CBAMNAgoEAwIIAQQQBgECAwQDAxoFAgwQAgUUDAMEBwMDAhcBAwcCAgMQEhABBwMDAQgEBAQIAgMBAQcHFBABAwkGEgQCAg0ECCEIAgYEBAEDCAIGBAQBBQIQBgIEBAIBAQIHAQYBAQECAgECAQMBFgIIDgkSAgcBBQYBAQcJAxcLDAEIBwISCgQBAgEDBQYBCQISBQsBAQQCAQEEAgMGBggCCwQKAgEXAwUCDAQBAQQCAgQCBgIDAgQBAQEGEwMSBAQBBQsFAQECAggCBwECAgEEAQICCBACBQEBAxgEAgwBCAMCAQEEAQEMCAYKAwEOCwEGBAcEAQcSAQEBAwICAgIEAh0OEAIGAQMCBgEEBAEFBQIDBwMEBAEFBQIDBwMICBQCAgUFAwECBQoBCQIDBA8NAgEGCgIEBAQBBwYFBQICAwINAgECAwcWCAgHAgEBAQoIAgUGBgICAgQGCAEBBAYDBQgHAQ8EAQEGBw4LCAcPAggEBQcYCwEFAgEDBgQCAgIhBAoCAw4cDSAHDAQGAQMEBAgCAQoBBAsIAQYBBgUCAQEBBAwJCAEBAgQBDgcIJAYIAgENDgIBMAQBCQQIBBkDBA4JCQQOAwQEAwIVBQQCBwMIBgcKAQoVBAcPChEFBAgCBgQBGDQDAwECAw8IAQIBBAEMBgEBDAQCBgQCAwEEBAIEDAIGBwYQCAQHAgIFAwYHBAgDBxIFCQ8BDQ8TAwMNAh4CBhgBAwICAQgEEAoCAwELAQMGFAoNBwQBBQYGDgICDAEKCAEBAgEIBQIQFAoBAQQCBAQCChoFBAICBwUCERQJBAICBwIIBAYIFBACDQMBCh4BDwQCAhURAgICBRAJJQEBBAUBCAIBAgEFAgINBQMBBQECDgsEAigCSiIBAQICFQEFAgMGARMCMAYBAwMGAQICCAYCAgUCAwMJAQMCAgIOAQQFCAIIAQIGBgYEBAQfAQEDDAoMBgMFBggCDwEHBAYCAgMDEAIIGwIKAQYBBgMDAwQFAgICBAcBAwIBAgUBDQoFAgIZAhgCBgwGBAMDAwMJBBECASwDBQEDBgQBGgQGAgcCFCQICAYJBxICDAYBAggOBgMCAQUCCQUIBAoJAwEGAwYOCgELCgQCAg4CAgIRBQMHAgsFAgEEAggCAwMDCAQMHAgBAQEBAQECAwkCAgILCAIEBQUGBAgDBBsBAgQEBg0CAwcKDggBJQEFCwsHKAcMBAQCCAMEAgEPCwoEEQETAgEIAR8HAQIBBgIGBQoBAwMJBAoBBgMCBw0GDAMCBgUBAQIeCAkCAQIHAwYCBgIBBwEJAwEOCgYBAQkIAgIFBAYNAgMCBAEBCAIHAQgNCgoIAQEDAQICARcKHgMEAg0QBAQKBAoEDAMUAg0OAgMGAQECBAECAgkIDwgDAwIKDwYUBwEDBAEBAgQCFwYGEAIIBAIGBAYODgQCDgMBCAwHBQMRBgMLCAIMAw8EDAcKAgcGDAEBDgQCBgsEAg8TAQEGAgIGAwQCBAIGBAIBDgIEBwkRBB8FAQEaARcGAwEHAQsFCAgBCwwFAwgNAQUDBgYEAhACEQwMAgECFAESAgIGAQQTCBwECAm2H6ZEYPoFxTpMTzgYBAkcBEsgIEoOKgoXswIe7AEEEDYHFAYWRENmBgsYAiTkAQGQASABRxQGBBAQAg4YEhIIBQEECBsDCAwaKgm/ATpZCQoEAgwKBAIuHBIHFAEBYAEEFpUBPTEEAikFBA8BP0UJCFkOBgQCBkATVwcYAggKciMzQwEDlgEMCwgGAgYCRAsHbwEBKTQEDAMQegLHASAWdxtFEv0BMAR9LwEYBQIKDwyCAgsVDh0QgwEEAgccBgdUAhgDDAIFAw1VAR81NwYGFAKFAeIBHB+JAS4kEAgPnAEaGAQZNSACJws8CAZSAQVoAQU6GwZKGgI2AiRAAocBAhgeSwQfkQEGAV4FOAYQJIEEPRcOAiQOGOEgJwFZFgITHK8BexkVKzIQngEgEAIi7QMIMQoZCoUCbBEFfCsGFDIrmwHgAaUBIxAxCgICAm5ilwEKLyMLEx6AAzvhAcUBIjaAAfYCLDuOAWQEArABiwEBXG4EwQECyAEjWQ0sLQROGxVkdEykAqMEvQEMH84BvQKIAWcDJQQC3QMLNkEyBFZdAo4BfIgHhwHlQNMO+gEC1AW4AQYGF7MCnQGJDP8Blwq0DPsDrgS1AjCqGOkz0RQcpxHeD7INjQGzBftK5Q/HLs0YhwEcSkokHQFJQQWJAgMNLHEVGQfWAjZ8HpIBPhaVAT3JAUwFCQlKCS31AgEBRRYCBARI1QFEhQEEDG0Q3gWGAt8CAQECvwQBrAEeAQEKCAEKDAYIAYMBBgQbAQEdC4gCHJQBGxnAATn5AXyJBEkCArQB5wHCARSoAUkcDkCtAcICB0daCtUCGAI5m0XeFdMK6S6UGYYc3BDnD+sOF6MIMA6VKv8IlRsBAQI49QECAm71Ad4BV2cDBBTFAjgEAgcCtgIOAgEQJxAGXgIQEAsPBAIQJDEDdAgrigECBWBAHDQIAgYPFHotlAECCgcCBQUBDywCAgYEAiACjgICJxo3AQYGAhMBBgYCqgEKCrcEQwq+AoEBAQwMBHtzowEGVwILBA40Aw5aS6YBBwRAHhmVAREOCCueAQkZCguuAakBCFICWQwjHkoIrgIEAQE2BhUhEgYeAytEBAwUMw4ZCN0CBhQCAggEAwMMBg6PAQQEMA0GBYABARYEDQ2DAQYCBAQBFBo2AgITAg06AgYEgAE3OntAChAUEgQCFRQmAgQEAi+lQ9ALzQnUBoUlpwXCA40L4Bn1NrAJqyGdLL4VmyHCAoMXiQLnBu4DBocG2gPNC7kEqDCZFroV3wUW6wFL4hGAAShq1wGUAQIq+gNlpwF0UYABEcgBAknTAR2yAaUE2gEKCu8BAgpJzAKcAku7BYQBjwHWAwwMjQFUjAKBAVSNAdwBXE4ELaoC6wEQFRdHR+IBgQGPA7YCtwMEngPMFt0FIvEBxg7vEeEBzScgAQPBGdkBvxcDNLwCB+ENAv0HAgSaAeQBtQa5AWCqDMQbApICoQTTA90OAssEtwLKCqQg0SrSQIYBHsQBkAH7ArEEMeEBoAEXe7ABdjfGAbcBZLQBKBwyFwoCyAITUCIimAGtASKfAbwBeqUBbpgCPNQBiwGZAU9pAooB0gPaAXRd3AH4Af0BxAE6Jnk6H2aYAwWNAQg+MREj8QIbe9sCEwRIlAEJA7QBkgEBBH2EARwoGZMCAekBAlkCAgQKQaQBqAE2dYQDjwEchQIBCgICAgEBAQIBAQIBAQEBBAEBAwUBHgEDBIYBFfcBXQYCmAIDAQgjLMUBaQLVAakBpQF1BJUCAiaAA2CeAQIMwQEBA5cD7wMIAQEKOhsBeQYtPgMBUjKXAj8JngICDlICDATLAQECAQIMBAEMrgWRASUMGIwBAwPxAQHzBpwRqUCbKrlC9hr/K8givSrIAooblSnRFv0cAakBrUiLDwmRBvkwrgk2COAG/A7wB70YkRPvDucY2yqGB4gJSEsCCgQDBgcmLgQ6IhBINAf0ARPGAgYSOU4EHxAPjgEaXhRARQISjAFuEigEDCQzRE0sHRwKAnsCG0kCBBYCBEMBUBZ0EjgEiQECLwQEECJSZF8t9wEKqgERATQGAgItCB4IBlw5AxwMJTsTCxLKAQ2rASYhNAkkNRAbWTYRAg0BBAEVxAEPbrcBAidtBQxwAmaoAQIOBAYIGgEBcySkAQhWZxdbGDSvAjtCkwJ7PBYQWQNGAgQdcULQAS13eIsBCSAgOAZAtAEBAQtICBJQGtEOmwvQCN8OphHARTEfNgEMAg4DAgsVDR4KAhYBARACBAQOFAgCCgMRFgMDPQYJaDBdFgEqAi8DJgl0CBwJJBQDCgIPNBsFZBUqCAICBA4dCgIFQFcKDwxODA0rFAgBARwBAwEWBG8BCAoEBBoeDAIHBwQCAgVQcBQFAR0XBBIYAQgJCDcHFBYYAg8BBgYhAwIXAwIoARoIPiE9floBAQIQAgQaJjgCRhYRWiQlCiYvIjMJzwEcFQgBEzAODGQDDhwZSiw1JAJFVis3CHYDAQETBAkIEQ5eAygPDgEBAgEBBQ4BDBACAhACHAIJKw4JLzQjBwUBAQwBBA8CCjIBAQYOARkrAg0lDDYMAg0QAQ8xG248FiY7SAIEHREEIAgWB04fBA4dCwMDAhkBCwcLBAEGERaSARgNASw9PxAHVAMEXgkShwEBAQESEiETDwEDAg4XEQYZHBQEHgEGIxQULzMqAgEqmQETBA4RAQQKCgcsAQInAgUvFCwtBAY7ATJaAjQERQcQDQQDISsGBAYXAwkuEBINASoCNkMJBQEkLQICBCIGCAUBDTAgbgYBAgEsFTYIWhPwH8wf8x6jAf4BWNoB5QOLAZEElQGGAcgECAI2Lt4BGrsB9wHmAfYESziuA8QCOMcDoQEwOesCSp0F3gMP/QK5AWBtTKYDSuUFXLM6/wGCAqEHrwJytAT6B6EF4gKiAoEF4QulAbICpAK+BOoE8wHlAcYBlAKGAR7EAZAB0gIpsQTOATkLoAEXXxywAXY3xgG3AWRcWCgcMhcKAsgCE1AiIpgBMGIbIp8BvAF6cDVu1ALUAYsBmQHEAtID2gF0XdwB+AGEAbwBgQE6Jnk6hQH/AZ4BjQEIPjERI5ECYBt72wKLH6QB1ALSAin/BUS3AXumAjfGAbcBZNwBHDIXCgLIAoUBIsgBnwGfAbwB6gE1btQC+APEAtID2gF0XdgEvAGBAWB5OoUBnQONAQg+MREjkQJgG/QBog4p7wQCgAuFARp8nAEcpgFSDnACzQJ8EHoHBgIRIwjZAYoBCHcCCAIECAKEAQYoF+AEWQoYFh0RASQOGTQGFAsXGRcsToIDdPQCA0g2ERY6EQkEpQFsN5QBXSwKOBIlCwYTOSlgjAEO4wGtAuIDEGP9AvcCUUJbERFOQQcWHI0BMUgMGiaMAxKsA1KsAUqjAQIKEiHWAcEP9QeaBucK7gW9Cvgf6gSGKMYSO2DEG6oMuiy5Pc4F5RwPDAwCHAkfBAMOAgMIEAQtCBUSAQYZEQERHQIGFgQTGhAEAwIEDQMFAgkBFx8gPxgpDAoRBAEHGAYOEgICCgIIFBQKHQwIBh84CBLqAgUGCwYLAgIGCgIGCQQCAQIJExoRDlkWBgMEJREHCQMGEgoFAR0EBgEBAgIRCQ4hAywCAgIEAgQIBIcBBgEdngEBAgECBDAGCh8GDQYRAwMfBA0OBgsgDxwwFAoLAg4vAQEBAQYMBz0EKB8BNwopCAIEAgIjCQgCGQIEBgEcJQUCEgoGeA4hChYfBTwzIikMFAkVAQIDAQYlAhkCAwQbBw4YMQ0ECBkFMAkrAQcBAQECBQECHQQ4FQ0GKRQBBAkQAQ0BAQYCERoCDiMNGAcDAwUyGiACBkICAiYPBB4DIQEKCBQEGA4VKSI+FAUHFgQKAgQCBhACLAoCEzYxWQKDATAaJgMHCwcGAydBWAJbK0omEQcFhQEDCwkFAwIKEQ8iIRUNBAICAgIKBgYFCwIBAQEHBgoIDgQiFAICEgkUKQIEAhE1QgwdKBZEAUmNAR8LF0NYFgcCFgESHgQwChcLBgURFRQkBAwCAUsCKRYcDgcLFgcHEQIDCAkCAQEBAQgFECQdBgIMGCgCAhURBEkBCgoRASoKGQEXBCQNOgUXBAEJAgQONSQTAgUxNSheOgMHBQoMExsFGwQEAwMCAgIDBlUDGQEhBAEMDnIUEAYCEBEFAQYBJwkBAhAMbVoKjgGIAZACDkAVFCAEBDoEAwsJAgSrAQYUCGaZAleTARYUDB46EgTtAUUGmgSnARIGdLsBHFlPAwIniQWbAiQGCk/TAQJ/7gIINdkBDEZJ3QEyhAHcAQZ6br0BBgwCAgYwJscB+gNaHg5nyQK4ARscggFJHkbXAxMfgQEUC50BAwFeAwEGpQusBOEDsARLdK8XyQKfBakKpQvvGoQCuxOzBq4DuBXtBj0Ijw6xA64M8AKrAfQJDHwOZjzRBmwCAgLZBn0E0ArhC9M1wgPkCvoaqAMZ5gEJAa0BAZIB3gVQciIHAQEB6AGwAg5BvAc6ygIEAgI82AMEAi7IAgg9vwGbBJwCAQsBCeQElwPWAZUDAmqJAs0BsAF8AgG/A/gGuxDtFgL4LOos/wFZAgYmAholBFACKhMFtwGGAQYUECIBQwYEDgg7ChzgAngDIidYnQEMBCZVFQgIBQYJCQRPlgEKAld+HxcNGzYBXAgUCEe3ASoIJi9ZEliBAgxD5gHBAQRpTAYGAga4AW0YGgh7CEc5LAgZ2AEECBAGBgIMlwIBAQIEpAEwBxgvBQRlIhYCPKMBIgOTAQIMJgYDAgkKPoMBGj6zASMBHW4KA0w3Ah0SRCEODhoXSwRHQQICcoIBByQiAgICZwkMRgQBAnclBrIBaQICBwPpARlewAEWASsoCgIC4QFqFGzKCgIGDMQCtASADtIBJc0F/QWzAjKkAfgEpgZOhwUCnSCHARwlIxcbBgbMAQU1Fi4PAh8IBQEBAgQRBRsSBAIGAjgcFjUCjQEYuwEGkwECESkCG68BERICNwoaTBwOMHgQCApzIVEKCBwbAggBAw44DkwIEAQIEDYJAk0CEjiMAQJCJggOBgsRHggCDAIGWBArCygjxQJiIgoaASAMczYMugEINigCJ7wBASMIrAE+GW0eAgIKZR+ZAQKhAQ4eHgQYeh1oDkEoUQcEAg9mNRMnGgISEwcO1wNOAgSYAyJEAgooAnwIA8gCNlIWCiAOFkMvMQghKGgsAmYCQgQCCAwOPhBaUBc7Ejoe2QFIAqsD/xCAAgMDpBKrBN4puSKvFdIahwfZIdkh8gKiBCj4CALkDZQFmAqHA/sCsgEKPtcKHRQeZAIUAQECETQeGBIKNQkMBQkDDgEPFAQCUw0f1QEqGioIAgQFFQIEAgYBCwYCAgIBAQQBAQICAwkCAhEFAQsIAjkCBAgGFAYCCAEBBAEBAgIGAgIEAgICAgICAgIMBgkBCQ4EAg4GAgYCBAgGBAIBCwYEAg4IAgkDBgIEAgIGCxQRQhMDAw4HAgIICgIeAgICBgICAgoIAgQGCjAbCighFmYINVgEBwIICAIIBlQyKhIEBBsCBQoEGAYGFAYGAgIMCAMZES0CBAICAgQCAgICBAIEAgICBAICAgIcBAICAgIBBRECAgYCBAICBAQEAgICAhACMQMJBgIEBAgCAgIGBAYINBAKJgQCAgQEAgICAgQEAh5NBgICegEBAQYCBggCAgICBgQIBAIEBAQCDAIiBhYCCAIKJwoCCQIIBAIIAgUBAgYMCAQCAgICAQEBAQUiWCMIBwoEAgIMAwQEAg4MTywYCgICBAwIAgQECCIiNAwJoQECdhMCBAMBDAoSIgIBFAEEBAEGAgICAgwCEAICAgICBAYOBgIEBAIGBAIEAgYCAgYKBgYEAgQ/FhAOFAIVE20ECgQDAwQIAgIEAgIEBAISDjZmFh0sQAsHC4EBIyYeAgh1CQQCBAYhDwIGAgYCF0oKZVIlT0dEFAMrIioWAQgDDAUBAQIECgoDAwECAQIEAgMBAgYCAjQXFQECAgYCAgICBAgCBs0BQgEBBAGbAgECCgQCAgIEAgIKBgICBgQSAgICBgYCWAIZDgIKAgICBgICBAgIAgIEBAIGAgcUMgEMBAQCAQMBAQIEBF/DAQwOAgYOAgQCAgIBAwICBWMCAgICAgIDAgIBAQICAgICBgIGAgIEBAQCAgICAgMCAgICAgIDBAICAgITAwwKBA5dBwIECAICAgQCAgIEBQEBAQIIDgYCAkUTGgIICD1ABwgWAQEBBQIGEhgiHBAJLQwDBEgLAgICAgICBCwFAgYCFQEBAUACBAIEBAICBAIBAQQCAgIGAgcCAQQCAgQCAgICAwReAgoECgYGAiwDCgREozSaEZINF5EN5wKqDLIM4RHxBkk+HAMCIkEq3wFOdAIEEhUBKWIbCuEBHp4BLkcIBgYXWEgaDSYXaAwWBAcJOAwXBAMKAZoBgAEZRAYedJgBBgIxSRATJGtFOTsVHGQmJxsbBgoMAgJFISIQBApHBiFaQRgT9AGPAQoCBwcFRRMOtAH/AUkmNggKCCS+ARABCjaNAR87LhkWK6cBAjYJGCcgBgIWCgQNCw+gAbABDhUEBhCLAQgUPi8aWBgCLgoPfYYBE/EBNkIY0QIKDoIBAwMeAQEEBQ0khQEwBRpRPxRxWpABD10NGQcWDggF8QECCSk5VoMV6CyqDMZIAQEEAQkMBQUBBAYEEQIHARALBAQSAQECAgQEAgICBgQBAgIEBwcBBgcBBAgEBQIDAggRBAYBCA4CAgYCAgoJAQcEBwQIAgMDAQIDBAYKEwQOBwEICAQJCAsFCQUEAgECBQQNAgcEAwILAgIKBAQCAgIBDQIJBQgEBgIFDQ4EBAQEDQQPAQIJAQECAQECAgIEBAMBBAICAgEBBAIBAQQMDgMDBAIEBAIKBAEDAQEEAgYEAwEIBAIEAg8EHgYKBAINBgkVAQcPIQcCCAMEBgYIEBQCFQIKAggBBQYGAwECAQEEAgICAgICCAIDBQICAgICAgIEEwwCASACCQMbDwYEFhQHAQEGAgICBQQECAQCAgICAgEGBgQKDR4CBAEBCAQEAQQCAgEBAgIBAQIGAgEDAgICBgICAgQIAwIDAxYCFgMCAQMEAQUCBgEJAgQDAQEDDhIBEgIOAgEBCQoBAQICBAMBAwEGAQUBAgECBAgCAgICAg0DAwEHCQEEARYRCwEBAgIEAgwEAQIBAgUOBwIFCAIHBAgQBgIGBQEECAYIAgIHAgECBgoHAQIEAQUCBQMHCAIJDQIBAQIKAgUHBQMGDQICAwUCDw0CAQQKAQIVAgYXCwEKAgoEDQIBDAElAQgFBAIPBQICAwEBAggCAgIBBQIjAgoCAgIBCQIKAgICAQQDBAoJAwYDAQIIBgECAgIBAgEHAQEHBAEPFQERBAYOAQIJCBQCAgQCEwQDAgEBBAYCBgIQAQYFBQEKGAEHBQEEAQEBAQQCAQIGBggCBwQBBQUBAgMOAQgBAQEEAgECDgEBAgIKBgIBBAICAQEBAwIEBgsCAgMBAwIGAQQEBAwKAgQCAgYFAQgEBwEmBAYWBgMCAQICDwQBAwECBwMSBgQCBAIGBAICAwUFAgIDAQEJAgEBCAQEAgMMBAMHBQEIEgYCCgEOAwMLAw4DAwsDAgUBCAUIBAERAgMLAQQLBAEFBAQLAg0LDgUKAgMDAgUPAwIHGBcDAgoDFgUGAQEOAQEJAQMGBAYEAQIDAgYEBAEDAgYOAgoWCAgCBwgBBwIOAQcEBwEBAQICCAICJgUCBCgCMgEBGwEHAgICBgIHAQICAgICEwIEAgwGBQIBCQYFAQEBBgEGAwQBCwEDAQECBAQCBgoCAgIIBAIFBQQCAgsBAwMHAgwUCAECAQwDAwgCBhAEBgIGFggCBAMXCwUCCQIDAgcJAwIICAIBAQMCBwcGDAEBFAYBBgEBAwEGBgQIBQYFCRUEAhMDAwMCCwICBAICAgIBBwQBDwIBAQIEBAIEAgYEAgQGAgIEAgQCBgsNCQQSAwgGAgMCDAIDAgQCCAIKDgoBCwQBCAICDQMBAQELAggEBAIHBwYCAwgFCgQBAQICAgEaAgULCwQOCgIEBQ0EAgsCCw4CAQEFDgQEAwIBAgcGAQIIBgICBAYJBwIBAQgCBgIEBAIFGAQQEwoEBAIPAgQDAggSDwIQFQEEAgQEBAIEEAICBAQCBgQXAgcCAgIEFQgCAQUHCAoDCgUBAQcDCg8BAwECAQIBAQIDBAUSAQECAxceDB8XERcJDAsBAgEGBAYYAQMCCAQGCAMBAQ0IBgICAgQMBAEBAhMGAgIBAREDBAIGAgYCBAQJBBQCAxADARsCHAEFAgQKAwIBDgIEAwYFBRoBBgMCBQMCAwEBGgEBAQIEAgICBgIBAgECAgIBAwICChMCAwYGAgICCQQIDRgKBQICAwERAgICBAQBAwQHAhALAgIMAwMDAwQDBxcHBAIIGgoKAgYMDgECCA4FAwQFAgEQAQsHAQIFAwEKDBIBAgUCAggCAgIEBAQIAgICAggBAQYCBAYCAggIAQQGBgMMBgIEAgYCAwMOAgoBAQEBAgIDDxMGBwMCMgMEBAYNBAMBAgYSCwUIAgQCBAQIAQQMDhkBDBIYAggBAgkDBwkCDgIKBAYQCAMCAQoDCwIEAgIDBAIEAQQDAQYEBAQCDgIBAgMBBQEBAQ8FAgECCgQBAQECAQIBAQIBAgECDAMPAgUBBgQCEgIEAgUGAwYBBQIVAQMGAgIRFwIDAg4DBQIDAQMKDgQEBAIEAQECAgcCAgEBAQECCgEFAgMEFwoCBRQCAQEDAQkjAgkEAgQEBAICHgEBAgICAQMGLAQBBBUSAggDAgwPCAwHAwICAgICAQMBAQMFBAQCAgQMBA4CBggDAQIGDAwGBRoDGQYGAgECAgMBAg0IAgIHBQkEAQEECgICAgYPAg8IEwQGBQQCAgIEAgICAgECAgIKBAEKBgIGBwEQAQ8CAgYUBAIBBwoCAgoEBhQMAgEJAQUECgIEBAgJAQ4EBAkEAwMCAgIGDgMBAgYCAQsCBAQBAgcMAgIEAQcTAQEODwICBA4BkTfWMNk96SerI9sN8gEGAjq6ErU3vQ6iAfVFtzfOBdob9TLSJKYDd94ChwJCsAEC2gJbtAH+BBw4DioBAQH1AQTeATkSAYoB3AEw/gaoAUrxAbcCAgKXAVO2B5oBvAIBAYYCAiEDTgRJYUIDJ/UBqAFeAdMCTA6iAnymARUbvBW2ApUGkgVF0QPxD+0MCf4CiAOZIzDsNugCcZEe/DoIvwjYBtUCxwfDDfcCvBEYUxsBCBQBKhUuMAEmMSIwAQwLDEAIdwkgGhgiEBgDFCAhIge6AQIiAgI1bisBBgYFEA9PHzgyCRcBVBAVDwMOBg4SQBoBJwWEASkyGzcdFAdiLDwWAgQWAggkEAoBCE0PE2sHChIKBgMBByAcDSUFEgoBAUQSAg4IGAhUAgYQBiwcAQQGCC4iIiIRAQMkIDwDFzIGEAIEAhwBKQsXnwEDDJkBAwIPJR0MEhoFHVIxD188IB8nWxIJAzkTGiwnVDxMA5kBEQoGBBoUDEEYAjInMQQUEgwROD4CwwEvAggXCwgwMEgfBRwVPg1QPwQEAgIICFMYFhkgMTpUBUMPAwc8BAhPBUoLCF0EBhUBJCYTKwExCSMXBhomAhkhAwlErQFSTwIXA3MINQkJEBgRIwcLCoQBAmEjBg8aDgQKBwQKBgECKwICBEUZlAEBZke2LOE2qwSlQ9QLqQfjAqYFAdoP+QIGgQTwAugHygQGDyoTsxK/BtoCkxKFFe4ElQN/BAQcDAQaAh8WUwQKHgoyGgoOEyxFWQkxIUpB5AFepQEKBgIdChkSEhtBDRYjGykaERwUG1wGBhIXEQJcJGMVEgIaJgxRNAQGC0AUCBQIJhYHAyFBNkIGPwMCAhcdFhwaCQIGLhsKDAQICTdwHQgGDkcGIiITBD8BQx9/DgMLFVoKO2k9Fhg7KWghGAIjIyI5CTgnCx9KPwYQLgRNPQgfBFAQCAJyTS4BCyBQAgIEGFA5NmMDGzxzJg8FR26UASozEgERVxdJKxi0AQ4nKCkTJBEeE0ECBBRTBhM3KHFAhQEyBwVWZR09mAE5ED8nGyE4RkUTHAsDEBQKKRIKGRECTRpGQQcGGk8OSL8ZhCgixQXWBvkQ8AeEA94ExwKAE/8r1w+sBcYM7BXCE5ABwwrpOuwf+B8S6Tp/BCDCAW4ehAE/Go0BvQJepQEWFwxYQeUBG1wehgGWA1wcJhYKYjZuCgZEMiWcAaIBCIMBIrgCDgPlAhYYzAE5Amg5ThoqTUIQMk3IAQpy4AEbpQE2vQGZAQ9M8QOMAaADVgQUWXJxQLcBYpADkQGUAyqvAbcBDq1LwivMLZkjmSPJA9kFcqIJrQSlAQuZAokBzQQG8QH/ArAIpQE45wLDBbEB0ARsvQHeAQhqQK4FhAIfRZ4s4AFegAWcC8sB0QQCKAYSswK3DToTBIwC7AEmBFSmAREIA7oCzgUDAwwC/gPoAyXUARFPtgOHQY0GvirYA7xDwCrLF9sI1QG7AdIM3AqfGjIa9jRoAp0CBgEBDBYURgXbBM0GE64BWvMBxgG4AQEBAgIUswIiXAIBAQQMrwOtAswOBDP7AT/NBKIC1AEUAgZKBCyuAcgE4wUCxwLgAaUDGA4ICBDwDIIJ5RgKLDiPBI4Rty3bBMALoSmMH8I1T6gCCrADBgrHAg8BgQGfAQgCCJ0EsgIpDCAdjAILHFPQAQIENFfsAW5dIt8BfBkCIz5EwwEIAgbRAesDPeABc8QB4AICnwGVBG5MJFgDQocDmwEYHAQGgwHLAgpSswIWCg4EJb0CDAaqAQFiEw1ExAEqJu0O0Qb+EgiFE94SnQQ8uhIGCAoKhRWdDzmgGccN4hXNCQykB+8X6RvNAZgDFioIAkDADZYHKDukErAHDAGuAqsM+gMErwTZEAHlBB8C6xgCpQKeIwIGKA0SAj4kMDAEBUUgBAsFEAoOAhwGChpoBk8dYwMGBAYyHRIBFDArEQQQNhscER0WCQICBhQrAUcNAgYCBAUQBgICJDYHAh4QDgoGEhoGBA0nBhgaIgUDAgIFAwQGDhosCw0CAgQCBAICCAQCEgYKAiYSCggIBgIKJgmWAUOtAS0EAhYEAiAOCAsCAQIJAgwBAwQEEAsBAQICFQUIGBwREwgUAgUNBgICBBYEBgcFNAYGBBYSBhkEGRYEBBYCExAFMgQcBAQIDD0oBgIEHR8VAwEhAU4CATMCDy00GBY/AwUCGBcIDwoEGgYKCRIWTAUxUgYKBiAJARgOBAQMQDkUAgoCBAwIDgoECCYEBREMFQwQAxUCBBIEFBYCHQYOHjYCGAYEBAUFCBYCDBUSI1ACIBsCOgYCAgJtKwUYLAQgBAMDChMoAgEBFA8WUQwIEh8hBwgMEgEbBAIDFwwGAgYEAgwSMCwCAgoMAioDAgNMAgIEJRFJCBQCCyc2Jx0UNAIcCA4mMRoXAg9IBk1MDgw6CBAqFgoSBgQCAgIPBBgHEgQCBgYEDAICAghkBAoDCgYEEAoeAy5ABi4OFxwmIgQIFhIOAi4iEBEhAgoOMQgGBgIEBgQGGhsHAgEGAQEgFwQiFkEGChBuBgoIBwIVAgIMBgILAQYCAhQScBMSCQQtEhgTBggFBCmaASEpCQQKAjIUBAQECAYGAiQKBAaRHP0L0xqWAwJsqQmhBpUEzgXvJ/kiszAauyrCDfoDhgLrBpoobswHmwHrA/cQ+SDkQeg/jwEj6Q/2CsId6iOTCwIkF8QBWggUKgUnDxkJuQEXDx0HBh8HBjZLE44BAwcCEhvCAVkGAhsCBhUEJRgPBiQWJQ0REgoRBggOAxoJBxkMGAEHBA5MBggIQA4CDwEeXSQTJAwEAhvfAS4EGAQcAgYICgYHDAwKQQQDN1YIHgg4AREIAgYoAgUEAhYHFgICFgcTIDACQkc8DBUCYhcNIAYYGQkUTT0PChgESyAsAQMCBggzKgM+CgoIAgZQECpECwgkCAYzCx4ODkkeJgULFB8CBAICAgEBAgQCWARnAgICWQQCMAQHFC0JAiVSB00HLwQIAgICBgIEAjsCCwIMBgMOMiwoChIgNVQODQYJDlqMAREnDAwIBBYTBgF8JRxWBhIMCCoCAgEBORQuPgcCARMCAgMCAl8BTwIuAgIWBAIMAgwHFQYCAggIAR0WGnUVExYCBgg3KEVVJg0GBBgOKDQRDxIdQgoBVVEOCQYCJAIBASsUChAxRjUEFAIKKA5AGQJLEgILEgIBAQICEBYZAwQpAgoCAQECAQEGAQEBAQEBAQEBAgIRAQEBAQEIESAeGgoEBgICAhQMOSgZ3RqpS8oL9Q2ND9QK+hC3B6UZ6gPiAX/aAbsBxQEriAKlBIgEchoUBuQBO/IB4Qf1AoACLkrUArEEugGFAboC7AG9AcsCvQEgXTwQDx19gQHAAR8pAf4CHYsDEaMCyw0ErgecA/EH8RKyBIcC1wIM8wHPAWYC1gIQ0wU1UgQmArYCdhhYENIBpgIcNoYC/QEJmwIGyAEGBnPJAQgBAUSYAjZSuwKvAscBZl4naEkoAQMnF5cC8wVz3AMNOjh2fMsCQhsJywO2A0OLAoABGjbjNvIn7wW2EbQBlALkGgYCsQXGBLUX4xeqDLkL/gHjF58pAAQGfRwCNggIXSEmYggGfT+KAQbZAdgBAagBS+cCAhRgGo4BAtADHEQYAgM3LDIQEG8zVwSgAiYSAQIoGgYCBiKHAwKdARGrARYQgQKdATAwBi2VAg8EwQEGkgLGAVgICucCEjYEggItXpECjwEGhAHQARdHSSS2Agb9ATrFAjQkBL4BA0saYY8CG1wchgEeP4UBkAEHBHIGA8wBASimAmOoAQ0knQFEoAEXXxyKASZ2N1ZwVRwqGARLGaEBCgYDDRscMhcKAkSEAhNQHgQeBJgBMH0inwGwAQoCDQwOEgcwAghsBBgdbjfGARIJPD+VAYMBCAyNAWQB3AED0QMB2gF0JzaUAUj4AYQBZRRDAnEOOiZ5OoUB/wGeAY0BCD4xESPFAUwfMBEJAhB7rQFeUP4E6xLTCmSnBd8Z8gPCARoB6hcGtRH9GIouhwGZFv0SvTqpAfQP1QbaB9QdGQcoGJUBEwEeDgIaGxU5CggCAjMfEyZhEBMBRAgVGsoEBA0QBgYYARYGAgIBAQolbAZMAR0IJwwKWBoGBgQEAgIOHAkFAjhEKYwBByQxWwRSHBoWBAIJwwFmRglADQIFAjMEDjdjLjEnFwcFAXMQWFYBIQkSOw4bST8OOoYBIwdJCgMBngEsZiABSR0hVwECHwsSFCAYBDJLKOIBJgN33AImBiyqATQNBCEIPiYODAQkEho5mQEEAV0USy8DVyA9EwEBgQFAKj1aMRdlAQIIWg0VKwIqEJsBBiUnaEIKH0YmCAUDKQWHAQSoAQkGVBM/pAI0FQwWOMwL1w6TGpsX4xerQOYVhQ7mEucYjQL1A6sKxDnKC7ET+hLxDZ0E/gTpHqYB6wawAoITgCv1J6QN1AvXE8oIItoNTGOWAQ6UFsAb/gOSBRoOJLMOzgPYBbMI8gKDAtgYAfAWzAXXBKMC/RYB8jEcxxIz7haGE9EDD6cKpkIvAoYIFwMTuwWAAiTuA5gBwwKTA7oNAQEBkgFmYgGiAowHBwEslAuBCp0CAg4EEAy0BQLLCgwDBRUC/QUBAR3GEAUPBF+GAw0GChwU/wEBAgEC8wOoCASJBNUBzgiUKqI1qiyRDY8qywECvxsCBoABsgbcA78CsguJAa4BAqYwnjC8IvoJUP0ChAnEArIFHHUcswEBKQQdgAFmnAsIcE3NAbQEDm8EwAqJAqwED5EBlAOwAoACyAS9IgglCAsCzgvwIrxIyDGYCaYDtAxr6h2YE9ILoA3pHJEkASilGQSOKfIBAgEHAQsBN6cE7gEKAhFL6wEBpQFwPrECBQmLAZQCU90BqwIDBRoOAt8CswTqAja/ATaZAmncBtMB7gEFbj2uBAIWBQQvzwEbuQMG7QHXAj6BBQWMAQEIqSHlDhsLAhkHPgkEBAwBAg0HEAJRSw8ZBCoQAQEBBQEDBBoNAgQNAQkFBggKEI0BAwEDEAEwCwYMCihaHwcamQEGFCYEugELAgUKDAQCByQ8QS4OEAEFAQoDJAYLKgIEBBMHEB0JVAEGGiIeUFwaNzEDAwGJAQUCBA0CAgIENRwHGh0DBAMBTRcjQk8BByAXBRoYFwEGAwEBMgQCAhIaIQIPCQMlGi8FByoRAlAiInAoGVQIAgQhESKLAQcNAwI9MUkEBQwjHCYlVw4SCW5hIwUHCIABKgQOAQMfBBArJBEOAi0fLD2cAQRnWhgUUzA4AQF+AQEGHAY4AgQBAn81BAouEQICAhQINg0tOl02FAcEBAwVYhgMGgErFHoYAQkCCCUhFGgXCwEKAgYCHgcPExcBCwMGHwo6HgcBeToMGw4pCAgXNEMUAgQLEQhMGx8pNAMCHU8HGgMFPjERI009ggEGBAgECiMiGQIDBAJyFQLTAW8C2xQc3wvMB6AKqgTYII8BBLgFECMmBFPJAfgC+QK2D+YBiwQSCgQIwgoBKcgCAgSrAasIkAMszQHBBgSGAoI70Q+KBQIaAo8UAQG9FZcB0i32CuciEf4DrwGSKN4DuCjVE+BEli39DbkJzjcEpUDTLIQl6xGSKNoJAgjnBu84hzC+IKEo4R3nD4sh5CmICIUOhgXHBKIV9QKTC8EH5w+DMN8D5QUCFKgOiRLaHgGHAZ4KL6AFAcgEugPDBcwJnAH0CK8KBNgDrgjCAgoCLJosljIQmwagCrsqsSLBDNY/2hOjEecO7w4NAQElKDgGAhQDAx8IAQ4EHhACBAgCAgQGBAgOCgoEAiAgNwYXDhEZCAYEAgQKCAIWQgECGg4VDQwNAhQIDAIEBgIeBhAPAgoQBjVDFUIBTR0JtgEHDAoEDwwCAgIMKAErEgIaCAEBDAoQFQ0JOSoEEA4MBB0HGR0EAgIICAYCOH4KGjoQIQMCAw44A3YDBTMhAg4MAg4sCgYGAQECMxs+CigMFgQwBgQCAQEECwoEPAIXBAYCBgMCAgICBikEAQQPAQUGBA8BAgUDHA4XDwwRDQYEGgYGBBcUBAIGBD8SCgsXCx5HBgwOAQMECgEBJjMrChMHGxcFFSMeAjcLCQg8ChUXNhoFAgMJAwUJAQUBFwkJCAQnJxAEBD8eHJkBAiYVCDwoDAUMCwUbDgItBRsIFgQBAQQFAgMCDCkPKwNcWB8IDQ4EHhovAgIOCC8TAgwGEw0CEi4FERsCECZlHAIEAil1JAIEIAQXIwEEGxwtEwMGBg4EHykrHA0eBBUCAgoSFxANBQwIFAgQBhIDAQMBAQoBQhICAh4yGQREKAhNHw0JPAQGEQoBAQoCCAoCAgIQAiVDBlUEEh6AAQ0ICQYQGwUKCgYEDgQCAgIOAgMGBj0cBAYGAgUEAQgCAgIBAQUXGAtHEQEHGAIEBwoDAwINCxcBAhYGAwMdAyYuBipRCzYEDB4BBQ4EAQUODR4BAgYGFQ0qGQUKAgEICgICAwoDCAgMCQIECAICBAUMAiceBAUaDRIEBxEIAwMoVjgMEjXCArEgpxHAChoQBhKIAgh0BoADsgSdAbEF1gTmAaQDGDaIAsIFVe8DAoUBAgRk8gEGDI8BogKVA5EEMgkdDvYIyRPPBvYGtwjBB9sKGNoFgSEBzQ4EzA3LL0gIMQYIEAQJgQE9Aiw8BAsIDxoOrAELAxIMM9EBAgI1GGpDFExJDwIcJQQkcQIcAhIFARAuCAQnChYmUAIECnAlAyNjNi8KAg8sDAUPBXkIEAQIED0GAzMEdB8ICAYECC4GcCEEAgoKHwINAQQCDgQIMwgBChsCEgJaEAxEEW0EBh1bTwYVFgkRBWsaJBcEAghQekY3ogEWBwQBaD1IlQEKAgQYMCAKHDdOKwcGfyENEAsHEgQCDjkHIQQlAhMrJ0ICBho4Bgc4CUVSAxAHAgoCAQsaEBwKBAYLAhIjFAk4BkZDSDEVfANH4AEOWhECCBsTEDAUIAICMBYEIkoUdQIUAiorIASzAQ4ZAyw/CRsgAiA1FhAlEw0fPA1zB7sBFhQOBmIZAhJKiwE+A2UEHQH2Df8UkwHkCQKEAR0BVQYTcVMkKFlTCgECAW4pQe8BrwIifhI+AhoUHBQLCgIaFhpJARoBkAEgWz4CEoICBgoLAQYKCzptBkZqJwsCDg8nFAUGIp8BCwONAQ8DPokBUxIeNkeVAQYmAQK5ASVXHFI1ygEIP3UlFgIMBAJuChG7ARAEDjRLoAEahgEEYgYCgwHaAQsnBx0naAYwqgEBzAECNMIBggECdgNDAQF/SRLXAVMNAgECdY0BLQ9gIOQBNJECAV8HDAjHAUnGAcsM8hCnAhAMa1ygAtoBHQZ2iAFPsAELCAl3GykHBg6AASMaPQgBEgNECRVmBgYKkgEavwE7egMBO3QCAgIDargBIgoODwE6BQY4GQxkCAEWaj1+JgEXSApCvQIkeQUJMwwBmgE9CF4KCh8EUF0WAloUBBIdAhIKDi1pVFgnNAsKNQSDARNPsQEOIQ+aAesBGlJWCxUoBioSEghTkAFkKWQCODoQAw4ZAlujAjMcVhQSNBYTQQdSAhWRARgECCc+CwkHGw80BHRuHwIDAUZWBCgKDgIBLSIaMgRAFCuvIogqmR+fAqMB7hOEDaUXkg70DO4DAsEDbQ54Hi8QQEAFDwp3gwFTYwYKCSluLASTAwEMG6YBRAkGGXgXDhIPAwIRAxIFHHkeCAoHdgsYFMQBAlUcKhgDAWMBCy5WTRwJKRcFBQIwrQEOBQYWAggCBBsRE1ALFwsXkQEHMHwBIhsgHlcrOz4HBQgCBl0IcDVuN80BCQsLGBIEAw0/Bw9LqgEImQEbIhICEwcCDgLHAQ4KEgQK0QE8jQHaARgJRg1KEzkiCAoEDgJbDyMJkAEthAEPVhQKCgwIBgYECwEBcwIGBE8CD3k6hAEBeYYBJx4GU40BCD4xESOgAXELAggCBBUQIBEEAgQRahkZBwTOAT8GCxunBaMQkwWUBGh9gBG8AgTqB98FxTqqLoIIAUaCAW/CDowZygqOApgDxw7rII0N5w/7HPkbjiXdHkjNGb4K2QUVhQfYAhzCBSH1ATP7AfwLlQEG4QZbcrsGa7gGjANthAKUAa0BlAPjAQj4BZMD2QT2CckOxgiyA02aAgEPnQwgjwHWFlEx3ArVCwLsA02NAYkF0Q7eEoMF9SrEAYQClzyjPMJCoRe7CrMQwAOxArsBpwezA/cFzQqlC+kG4Be7DYsRkwf8DcMN3R3YJKULwi+yEOZEAuIX8hiYArsnrAO/Na8B6QEO1AICvQHVAb4C9wKMAbUDXRTMAaYCpQFLAo8FnAI5DERigQGaAeUB8AN8DKMC0QUK0wKUCT6VBMcBvRPPD7UDUfQNoA4naB8CGLICAgcCBtwC0wjQB0IC8wFYowEM6AQHARIBA94C0w20BhvlAQKOAT2qAbUI5wTUDLIBFuUdBLwKyjGgCPkdpirRKIcB/D/ICQHvEwL2CowKxQ4BAQbZBooXRM8P5gH9GekEDe4BIaoIvwm9RJ4y2wamASKTBQEBgwL9CxygBUEgyAWgDKEGZgSfAgjEIQvlDeoWjECEJ6UXBEQBPlqMATkIFBwhfycBMo8BD0lpdl4BCQoJTj4PJx09QEePAQQIGwVWIAICcBYmdhIjATzCAQgUCDwCBgIJEjmIAQICAgYCBQE6SC4WAwgKBgk41wEiF1AiICUBAQIFAQQCAQIBIzwSJF4VCAIbngEdCZYCbzRtFSlcgQE2PglBFhSnARI4AgICXwFTNQEBTGI7IRGMAdYBuQGXAY8BYUtCugF+RhtXAgIXDlwBNyeAATeAARoGAgJ6ZgGaAQLbASU7CHIGUDwdLhUsAQsBXasBpkTMC9021kevFc8O+xD0D7gf1SylC6wj2xQctALLGtQGwAOlHc0UApEdA94UCRf2Mb8whjPjBuEx2gXhMdQMoh2OLMEYkwEMBNcCEWhbfbANygVaBIsBmgRyEQ2iBJAKTgEBCNwCR7MMmgjyAegktgeECyBvEIgBmwEC/AUCeQEJAgJikQGVAwo2eMQITPIBrgo0sAOgBRoMAgr7AekHKsQEAtUIAhcN2wbTHvAKjwEE5wICBwgKCBD7AuwGvwKLB3MEBJQCjwOKChKXBf4B1wMCAgYEVz6MBQKOAT1pIBgCAgXADb8BrSfODK8BvgKLAecC+w1xvwHJJJEc0A6bCcsOqQjjAooRbt0UHN0UHKM04AyOJdQMiAIBzAYKAhEBtgKEBQYI+gcDBYkD4APzA5QPc+sEAgEVCdsPBYwBAY0U0wP1J9cFgg2RBa4pmgJ0PNgFhiicDvAu3hfdCYID+BCYGbMErgPuAqMBjimKG7g2BKYD1iWrB/8TyTi0H4sBPUmRArgGBDKXBgQjjAQGAgQNAVeSA6IDAgMRCswDlAvVBECzBwEJ4gEIngHVBLAFBCACmgGtAynIAeUVyBuNTJcbpQuvJe4YzyrZDtgk1kDKN8BFsjrRBo0m5gSdAugFoAPjAhzCARxVjQFmGQgCAgoVfrYDIpoDygWFAgrAAs4Brw/YAVcUVIcHjQG6AWsSmwLVF7YL9CMOAgwVFwkhDgccAwIEAhoBAyQOBDULKAYGARkICSsKAwoXGQ0CC4MBHggYDAoHwQFCAhADlgEEDD0EhgEVChkEAgQlBB5bBgwBCwwCCAQCCgoCFC8BAxMxMAtBAgQMChNWJAEDcwmFAQICLSQkHhgcCQQYBEQHAgICBxIJSA9UDggLASgKAzsFCg4EEQYdCgYKBgIBCwYSBwICCAQIFQ4CCC8JAhQ4AQwCERYIBCScAQgGGy4aOwIcAgoCEgoxGjYCLQcBEgQjCBSeAWELDRoBAQRDXCFPWwcdAwEXFU0PKBACBAYMAjo/MncNAp4BAgMfDAILY1ZxQwQLMRQXH5UBTksjFRgeBBYkFhAEEDUJEQEHBWkHAgUrJzAECwwbKnQ6BQEOBiARDQIiAz4VJhMeAgICEDoiBBwrLhQkIgIUFhYCEhcGAiEQAx8NHAgYWgYPVAwCBwEzAhAaBCgNCgECCwEOKisLFxo9PwsENWMbUk0XAhoKDjBuBEAZFmonApsCGjsLHQICAgEBAZcCBuUEgwEEBKELbwL7BAH4BQJRRpIDFBIKAgQGfP8NAp0InwsEqgyLHoAO3RQcsgGpAWIlCbMCD1YxrwESpQOuAQUR8QGlASMelQE9Gw1MDusCZweQAUIPOo0BhwEM+AK/ARsCyAEQFSsMC6oDowEGExIKBhRuNKECCJ8CfX/MAaEEDMgCuwIFDNsBpgKyAbMB1gGwAUIE8QFRFdABbZ4BAoUBAREMNrQBAesBV6MBpQKLAkw/iAElAXgBGKoC8gIBVRw8CmQBQYABiQECTcoBDCUUTwEfIlfvAQHBAbwBAXEIXUgBawI1AQGTAYoBAT9bOZUCDmUYBMQBATwBLecCTBd4cywBMAF+FEgBYpoCYwNWFlsROaABOawBC8sBATsBsQE/AQc/QqEBkgEM6gFKAcEBGcoC5gGoAkNhAT8DG3vDARkKGXYEUwGiAXIWAoUBwQN6BAQCBgpgPl4kBhUBaA25AT5LAQsGCD0IBBsi0gISMBAYCQFJAW4FSEMBLghmP243AZEBIQ5eDkZxCTIfOJ8BLzMvBAGqAQJ1XTOZAgKTAWsyOn0BAQEBAwMB1wECBy+0AUoQfFk+CO0CJWRlASwRHJIBAk87RpQBbSdAByUssQEwBIsBFTwB0SAmaQQIBATiAgIECgIGCgQCApwCECUCBCL+AQYCEgQC8wICBMUBsQEFBpMJmQEMBAgBAQECAQECAgICBAI5CyzCAgIFAgFlFQwGCAgGCg4EAgGlARjYAQ6KAVdCBAIEFgQCAhoGzgJGBmwC7AUCHgIBAQwCDAEBAgYF1QICAkYCAgYEAQFVBJUIBgIBAQEBCAoDBBPmAgEDAQEBAQQCAQEDBQYOuQEBFAEKC9wBEQIEBAUBBAIBAQoBA48EDAQEAqMB4gKeAig3BQGxBfwCCQKRCQL0BAEBAQlkggICAgj0AYoBBlEgNAYEBPYCNgQKAgQC3AaqEAICuwEWBI4qowLeA9JHRgcPKQEBHAEECwcOAgIBDEZCBgEPDkcnAgIBAksCEgIHEQg5GglWCAwDAQEBAxUUQQoPNR4DCQIEBAEEBgQIAi4GAhECSAYCArkBAQsCBQgMBAQCAQoCDoMBAgk4AQIOAQIDAQIIBA4CKgIKBBMLBwEEAQQCDQoYDgQCAwUOFQcBARoBag0CBwMHAgkEEAYBAQQCQgElBAMJGhICBQICDAMBBAQCBAQGAgEDAQoCAjQCCgowAQIBAlQBGwEXEAMRBwECAQgIBDcEFAEHLgQITwUMEgEBBgQCBBUCGwEDHgoCBAEXAwYBAQEuBAQCAhIEGAgCEDAOLgYYCAQCBAQTCggBDQICAgQHPAIGAR8DHwNTDgIuBgEHEgQQA2UWAQEZAgYBGyAoBDcBpAECAxIBCQxEDAEBCwhwNAEJOgQUAgICCgMLAgwGAwkCBwNNBgYIAi43FgM7AQkCIRMNQkY6SAEFAgEcUAcWDgIEHzIECAMbAhgsFBgIFA8lAgEKMgweAgEBF08YAQEBAgMEDz4EOgE/EgExCAEDBghXFx8CDWYBAiUEFxoBDSwjNRUGKgQCBgUiCQMCAwUDGxh+AQIBBw4DAQEBAQ0CIgEBAR0BAQcLCzwEGhEDEjABAQEBEAIEERgcBAYIAw4WIwEVEAEKYgsCKRABDAJgAgYEAgYCAScKAwo5FAYCaQMOBB0KChAPBjICAhoHAwEEAiIXAgMbCAEDAgIBPhUUCAcJASMWNiwDChkFAQIGBhAcIAUJBAEBFgQVEAYGAgIGCgMGDAQCARAEQyACAQ0CCAIZBwQMDD4EDQcZAgI2BAIHQwwBvhXjJUg4B+MBkAECD9IBAaQCiQGiAo8BclaGAeEBkgLiARw/EAiZAQHlASFIC3eVAQLAApQEuQkfHoABhAIMTq0C0wJJVssCKRwMoQKrBrABoAQrJj7lAQMnU0zCCeo/AEYBPh4CNJABJGwBdQ1WBmkCXggMb1wKAg4phwE7IAwBAiIQAQEHNwkyEkQkkwEePwIBCRIDhwEkAnY3AQYUCwgBDE1rBAQGBgoMBgoMJAkMAgc2AS0CCRciFAE1KEQlDRcFBQNMDRAOSQYIUgEmEgFuIjweQjB7AiJiATQGAjWFAQIWXgYfUxlwOAUiggFLBTMLDAEVGzi7ARUNAgYCmQEBYQIHBAwDJqABPgErARVsAgEEZncuGAgBXg4gASZMDAV8ARFURQMBQxe0AQZoSRcEAwlJAhUhKx8BOAIBGAsCYRjMARgNWAIIZwQMLAMBARZFBgECFgYDByQBJxYCCT08BAIiXx8CAkJMAgUaHhIBBQoZAwcKFgICAgJEAp0BFFACDkgG1gOgA0m6Az0GaKkD1ALIDvMEtgKdC+0DBCe1A/IEvgNUENoKhAbRBAph2xi+CIkDnQWUAYcBAgZelgKOAgMNAigQBI0BBwjDAU1PDUZtbHgisQEEEvMBBAIBAe8CHMwBAhD6AjslGn0QLX6zBCbeAQ2XASYECAKBAQgBAQKFAiQE0wGjAgGJAzANWW4ZKAIBHh4oAgISFgg1DAICAgIlNQELAp0BAQMBFAMKAw6GAzcBZLcB7QGJARsdAiYgnwGSAp8B5wICjwECtAGjAQYUvQ0BBALgDfEDCgELAgQBAgEKEgoBCQELAwMBDgENAQMEBAQCAggEBAwEAQwIBQwIAggCBAIEBAMBAQIBDwcEAgQOBgUDAgcHCgICAgIEBwECCQsKAggBDgMFAQgGBAQIEwIHAQIBAQMCAgoGCgYIAQIlBgQmIwMIAgMBBAcaLCkEBgoUAgICCgQEBAIGAQMBAgEGAQQBBwUVBAIKARgWHQYHFhQKCAwzBAoBAQ4MCAUBAQMCBAIIAgYaBAECBgsLJyoGAQECCggVBQMCAgQCAgIBAggGBAICAgYCAxYCAQEEAgEDAQQKDwoHBAcECAQIBgICBgkHAgYMEQUNAgEFAQQCAhICBBEHBAYCFAgBAwwBAwYEBwEaBQIDAgICBAYCAgIFBQQFAwcDBgENCAwFBAIJAgICAgQGDAIBAwICCggCCgIOCgsCHQkDAgoCCRoBBgYCBQMPCxMGBAIKCQoKAgcBAQUFAiUEAQYCAgICBAYCEAYEBQMBBgICAggCCQ8BAQgiBQUKBQsGAwYCDCQCAQYCCAICAgIEBgIIAgICAgQEGgICAgQCAgQIAQICAgECCwQCBAEDBgYOAw4CAgICBBACAgYCBAICAgQCBAoGCAYGDRMRCA4LFgwCBgICAhMEAgcBCQgCAgYCAgYRAQoEAgQECgYDAgICAgYBAwcEAgkCAQYGCAIJBAIFAgICBAECAQMEAwIBAQYCAgQBAQIEAgIBBwYCAgQCAgEBAgQEBAEBAgICDAsUBActBwICAwIGBAYCBAgCAgQCBAICAgcGAhUDBgMWAQYEBAINCwIGAg0LAgQPBhMqDAYRAgYDAQECAw8CBhURBAIGBQIBCBIHBQQCAgQBAwoJBAMGBAkBBAIBDAYCAgoCCwUDARkCAwkUDQkDAQcBEQQDAwsDBQoIASIOAgMFBAEEAgUFBgIIByUGAggMAhYJCQYdEAEFCAMDAwICBAgGAwEDAwcBGgIGCgoSAQEEBQICBAIOEgQCAhENBBICBAgCCAQKDAIELwEBAgQEAQIOAwEBBg0BAQUGAgIGAgIEAQcCCQIDAgMGDQ4EBgMBBAMEAgEDAiAWBQUODgICDAYCAgIGBAQCAgICBAYEBAwCAgQHAgQDAQECBgEYBQ8IAgoFBgoECAwEAQMEAgENCSIDBwoCBwsVAgcCAgICAgsBBQwFAgIKAgMCCAEGAQMBARQCCAEHDAIGBAENCwwEAgMCAQIEAgQGBgoIDgEDBAQCAgIICAQDAQMCCAICBAEBDwkJCgUFAgYCAQEBBgIBAwIHBwMEAwIfGAQCAgMIDAoIDAgEEAsFAgQEAwEFAREEFgoCBAYCDAIBAwQDBhcHAQIEEQECBAIBAgEBAQMXEAUxBAQMDQkCBBADAgMBAgEBAgcCAQsCCgoCBAYCCAICBgYJBwJAAwkBAQ4FBgEFBgQBAQIEAQUHDAkMCggECAQSDwIaAgUHBBMBDQ4CAgICKgoIBAQDBQUBAgIBCQIXBgsCGQQLAQEKBwsBCgECBgoMAgYMBgQCBBsCCwgCAwYEDgEGAQ4HASEBAQEOAwEDAgQCAgMEAwgOAgMHAQcKBwUGAQEHAQIIDxEGCgEDBAUBAQUCBQECCBACBAYCAg4CAQQKAg0CBgEBAgoHBAYFAgEFAgICAgEDAwgBAwYCAgIIAgIECgIEBAQCBgMDBAYCAwEGBQ4BEAEJFgYCHggCAgEEAgQCAwEDAwICAhgBAQQBBwkJBQsEBAgBAQECFAwTAgMCAgIGAhICBQIPBAEBBQECAQEDBQEFEAIEAgYMAgICAggDDQIJBwIDRRQGAgMGAQELBQIDAgEGAwcCCgYDAQUHDAMDBQIBAwcFAgICAgsSBgwGAwYBAgEXAQEEBRMHAQEDAg0BARAECgEBDA0CAQIQAg4UCAICBAYPCQMNAgICAgECBgEBAQEBAg4EAwsEBwYBAwQCFwwHAQICAgICAgIDAQMBAgIEAQECAgIGCgQCCAEFChACCgQiJBICAgIBEQEGCAMFCQQCBAoCBAMDAQEFCAICDRMCBAwBBAQCAgUBAgICAxEBHAclAxUFAgIEAgIEBAQEBAQCBQECEgYCBAMFBAcPBAIJEwQCAgICAgIHBAMFGAYFAQEBDAYOBAgTBwIKBgoCAgQa0keWCbkQwgLgHPYBqw6iAaIWjBDYBrADsQ7bRKMinxqmP/UKtguzAhbOAQjlA+UGnQEQQLIGAtMBjgLxAWzUAbwB0wFjqgN3lwKmBhIhAkyPBfEGJ6oCaJcg4BnjAh72B/IDZgYGBAQCAjgc7AQX9wICAQWuAwEfCOUDngcBAwICAQMCAwECAQLAAQwBBPYD5wvEDQWPAVMFmAMCAQEIshCpBvU/zw+wKJcSsCiSDvwP5xSCBq8L3Q4E8gmSAqcDB9IC4hMI7AjRBdwGgxqFAR7qAcMCyAOLAosBlgGQAbUFVhxGZMsCAk0m1QFbCCAikAS/BDdMSAGDCOEDjwHjAp4Bd/gBBIYBSSOSAqwBC6EC1wGgAYoBjAJciCrPD4UEBiIB3xHlApIPgAKlEKQJvkeSDLob/SbQBOcGkgyNARaGAVLEAQIWXSKAAwgDBQ20AQcCuQH0AtABBc0BAgIE0gIcMgQEAgZi5AOOAu4DEwcCAQIBOtoBbNwDHdwBE4QBHIoCPwj6AbwBmgOUASCbApsBvQLsAgEBExDyBAgL6wKqAXg+OhwBAREhAgheAQFtAassrRTsDq4T2BXLCJ0V+hK9L6AOvgzMH9EZmQMI3AaoAe4GpwMQrwHzAc0EBnL+A8ADjwEGkgECxwLEBNEEpQG6Br0B3gHqBPYBowJFF6UL9Cf6GKoYkg6XI4ksjRj/A/cChQmXBDUcVQSPDcsF8AMB3gGXDfUG3AblMvMa8xpVvBW0AwgUHEajA6gDAhq3Ce0F8gcB7AH+CZwB/D/EQAIeBgQOpQsGtSfvBgL+BZgBlULNSIw9lRvpM6AOvxyeFdwJ/gMBmQ60Df8ChQG4RIZDyUu9IKgHrQL3KcMx6gIB9wHkBJsCiAN+aNoE+AFCYQEOH5oDgAKoAwS8ASXNAZcCAQMR7AEO7APUArAFIvUBZQYwAQEBAQUBAQUPHgECAR8B6gHMAQQKfCcBFPMBASfcAgRqYo8ECQ0NHgMCjwE5oQH0C64CRwTiAaUB/gYgmgLgAtoGqARSa50CEJ4IrwfTAQL3AfUCkAH+A2miDtEDywOlAvYB8Agp/wPbCwS8CO0OtAjRAaAO5gWXCZgmDp4T1BHfD0D4BecSA4oB3wKSCIgUHv4o+gOsGeACHswb3wsSixi6D+EXpC91AV+OAQE21wNDYj8DDwx7wwE8dgRTowEYUwEehAGYAaQDBAQCBgcDYD5eKhUBdXNGiQEMBghJ3gEBsAFCEBhTAW4FSAg1NQhmP243AZEBIQ4DWw40UTsCMAMcOJQBAmveAdQBzAICkwFrBS06fQEBAQECBNgBAgfjAUoQfFk+CJIDZGUBPRyTAQFDDDsvAhWBAmcHJRnEATAEiwHkKcsGxQQB4BoQmRXaFqgWowH9DQoIIBsMCBAWChIDFBAkCQIEAgIOChAWAm4SCggJDRYGG04qAQEFASoBDgQTLQVWBCwlBVwGDWILDA0DPwQ0TxUGIzAQCg4nMDAQEAYWCF0bBCoBAREEBwkCDQIQEAISBjgCBgoOFAICBCIIGgcSCAQCAh2jAQVpGCcEGAQwCAICDAoBAgYEChQdBjgCBBwoCwE2BysaFgQQAhQFBgsCIggeEgIeBBoENxcQEAgXAgIQBAwTSiIkBCAICQJrMi8ZLQQCkwEaBgQCMw8LBRJMCggMBhsBHQUDCSgCGgICgwGlAR4GAiYEDASNAQgSHBAMEwhFHDkwEhsBCh8tAWAQCwEkCC0MCAYCcEppggEQJk8CDAIdCxUKBhgOBGALGgUFChEsHFs0RnIcIkQKHBQFIwQNAQQ+ChocAh4IChQCAggCDAYZCgILPAICAgMiAmQSQBArGgQBkAEEKBgSEggCAg4MGxMaAgQNCjsuDwQGGAYZBk4BBAECCjwEYA4OJx8mCAgCLAa2AQIMBAYkEgURpAESFhhEFQIeFAQCDjgPs0u3AtsDrAI84gQK1gHUAaIDqgU+7wK/A7gEtQagA9cGpgOKBAQChAEokgGEAt4BERihASDiAqYBbGmIAYQCMD/dA1LYAS5jBwoCOHQKBIQBgQE5AwMQngIcKh4tmwEiGiowYy8EgwIiAjkBIyJmP6EBH8UBK8QBFAOTBy8M2wEGBhggSwoCmgFQAtcBKpwBjQEEDIoEugIBAVEKTTsCXgpPyAQ9XQQKuQJ0AgZwTQIL+gGyCP8CiwrTAh5FygraDsEJkUbOIvIYtSrvDK0SBrJD1RjxCg4yqBMC7ynJBp8ylgjsHbkfAecPqQnoEddCwT7tPsEKAcMqpQvgKdke1jkEEuc6kwK5NJUDxwrWGoEp4APbA4gDuAHDDuoClBSnAQLcBwEllwcEAgILBNMDAuMCugdC+iqVD6MBpwMBgQPqA4YK2wGaAUHzAdMCJZQF0wLPBMMVEJsD0gK/FfQMkA3EAnoQhRKlQ9c7+wvUS6cniAzKAeAQBC7qNqIOnQLeHZghnQLPEKIWugikBW+aAnJr1AG+CpYG2zOPBIIS5Q4C3gct9AyUCccEEhAQCi8IAgICAgIcAggOiAEKAgICBggEAgQCClMXpgQIzwFJNSAICjlRgwICKqYBBAgCOGIQLQEBAxkbrAEWCW4CMxzIAQoEoQIrMgIIBJ4CEQEGZAgGCReXAXgIsQGJAgI1qAG+AQIECAUVuQEm2wEPBg0MBhQCAQIBAb0BI/cBC5wBkAEjAhEBAUAeDAICMFIGAgIaAkMtNskBFJIBAgZJNVYsAgEGDQEBBAIkRgI7fgLrAVazAVQEBtMCmgEBAQKjAQQIAhoKgAEZDSJLEa8CBCwWAgICBAIpAQMDCwQKAQEBAgK/DpIBBNEWhwGMD4kN+ggC3QPsCdMD+kuBCO4GDRh3ApoFywOXCgKnDgoMNBbjBwIB7QLrA8UBArYG1RaHG7kQ6RquE6IE3gGGIoAB0xyCKhAMT7gBAjKWAaQCmgeAAQEBFQGcAQRIFqEBH58CApcCEicB1gGOAU7yAqMCsQEC2AElBI4CnAP7AeMFDlAyPgQsFDoOKCIG5ASrAQIBCxAuTLkBrgMmJEBbkgJR9AECJMcBUMsB2QGnAuEBtwrsBoUkTJ8BngX2Co8BmgGZAekKpgEE+AnwB4gBswKlBacHnQKFEgSrDvUD+xTjM+g/1B75GM4o9BCFCPgkxDnnD4obqwIIHgp3TicCsge1BQEClAGCA8EBRakBqAFVAQEOQ7IBvwWyAZ0B0wTSBWQXtwHRB1IxggE3AQFbqQGvAgsBFAEQaXzWAp0CnAGlAgmBCMQN3ATrGtgPyTiRHMow+x6QCu0I6SD6Ge4QrQaSE4cB9xiDTMgB/gf0BYUSwRmNEK4Mmh//CxlHO1oTASwCgwGCApsFAgQBAgEBR2ACAQuBAc8BArEBP04EG6gBQLgCAp4DAjPJAp4BAZ8BAaABiAH4AVMDAZsBAbQBAd8BiwKKAiYD9AEBhAIGigIBOXKUAwESAXoDVyFPAQFoBAacAQIYWkhlAQIIfakBAwLuBgaWARMCwwIhFRIBXxACCoMCGIwBkgGhBqEBal9ymwL+Bk85DoIBDoUBfTOPAbYJpASzBAJ51AQBJ3mRAusBvALlAbcGHfwBtQKZAeAE8grUCV/uASj4FfIOwAKEA/cBZnIltQKVBNEEGV1MCk11Ee8LpAEoDgqMC+EKPtEDpALsBBYOAgakAQL5A6MkuSLiFOwPxw6bF7MSkR+WEIInjQOCHLwglB2MBcEKkxCbBu0DMQEpAeMFvgwL1ALsBa1GlwOGH6g/pkRGQB4tCY4BD4EBgwHPARcSpgKLAg0aCgqTAUSgARdfHIoBJnYjAhLGAVUcKhELZEIWWwENGxwyFwoCwQGHARM+EiIimAEwaxIhAQ8EjAEimgEWE0kIcDVuN+EBPHlbgwEImQFkG8UB7gHkAUyOAXRdZy1IRLQBhAFKARMHFEMCfzomeTqFAf8BngGNAQg+MREjf5IBTxEbA3iLAlCzErohvA8EAgICBAQCBD1UAgTHDIcC+QLCAbEEzgKZBcwIigb1Aw8ItRXtBuw0/wqNPw6XF8sGvUsBAQcHDCxLCEOcAocCgQK3AQ4LAgL2AQILQBgLOAaoAQXDAQEBIgFlBAGLAmTIASwCSqkCcAIMCAITZAEFBygGDgcPHT0CWQShAgwdfikBF+ABAU6lAQ2YAZwCAgo2Sg8LsQEEbjACAhYCAgICCgQm+AMGjgIBDhISAgIIAhgZFiQahQMCAhx0B6IBkwFXAgICEIQEQQj7A3maAU8DAiYkBPoBggGvAcEZixeWF/QLswyJFJ404wEIrgFm2gFaHOcEfaQBTvUC8wRdAYECDXQI3AECOMAGVq4DtQnwBwICrwQenQgGnAmJApQPvxj5DpEW0AHFLMBFhgKXOuEXuRaLCocBZs4B1gJldwfdDBw62gQ+fT3QAqICP90EBosCigSeA5AB1gFKZTn5Af0BowHjAXb0A0RbzQZHvwHFOskV0x0CAYcB/AHUAggIDAIKOAoiBAKkA5MBQdoBKgIIbAIKOC4ODChoLU+0AxMCQQgCAgIMcBMvEjZACJQBEL8BAiPSAl5fBAaaAQoMLcIBrwECRAQKHggCAi1ckwE2LBQBWwQs1wECAhGKAV0afgQEFTeTAQIElAGWAQJnBBbpAQQfAggcugQMCBMQFwIpIhAuMDICAgQSAgsGBCMJTDVoBiwbAwQkAgwI0gFHIgoIDl1YYgoKBKgBdjgCBCICBgQCAi4WRBQEQATFAbIBtQUCBrkGYMwF2QKAAZkCnAEi3QJMqgHIAbQBAukB3QUBWxL2A6UHAgICCQz3AnMEAgIIAhgWCg0bAvgCBgirAwICIA6IBRkCCAEDBjIYDEPkH88O/x2aE/QGArUJ/AQKC0kIbDxYCI0UJt8C1QukAs4BbAS1BTVAk0fbF6ksqkTWS+8OhkpGJQIYCgQIBASIAkiGAcgBc20CdQOIAg4ZChuAAQoqCAomLAkODRkQdwQCBAYEBgIsA1UJIxAxI0jGAUYcOBsBAmRCcg4dAQYSMiNNFBIHEBkGIx8sDAoNDhICIwEZBgwgImkxLiYIAg4MJBABhQFAuAEWBQEBAwEGU243NjaLARIJGQxSGx4CChAkRJUBGAYgAgQCVKcBHqsBGT0uegIH5AFMEhIFBwYMTXMsMUxGSUW0ASobDAIxSBAOEUUCFFsROSZ3FwQSBEp4ywE8sgE/CFoCBAgZI3hJARQBAQIZH02nAUoEKB4YSwwOCCwCFFA/CAiAAQICPqQBPgICCAgCnAECLCISAgYCBAgJChICCgQCCgQCkALhAQaeAQgEDvICECAKBRccEAoGFpsDBAQ9HB8kAgG6AQIGLmyyAQolCQEDBAEFBA4uBAQqIwKdAgICbAFJDgKbAQ8WCg5wAkAeDjZyNzYSFpUBAhYkpAENEggWAgQISo8BBRQlBmACFAQKAsQDHYADAhcfBggEEAYMIQ4GAqoC2gEDCAIIdwRXCgx/AhMGBAKCAQIVBx1XBAIEBJ4B2QICAVQ3GQRdowIIFAQCDCABdTwSwgEIsQIwhijUEZ8BBMQBkANKGhj9BD5XggEHEkkE4gUcTKICJwMaU8MBHwIJwAFLrQLSAQQCqALMA2snrAEBOJUCDtsB9gUDAqsErwIW3g0rE4cBCIwIAhKRCv4GFAMBAZIGAuIGIAEDFdsKBES3BlfwAbYyvxXfBp0eixytOPAIhijmEfEWiAkE1Q4GiwGmHvAMxTqtBrVL3xQcyAeMO0Y/AR0BNY4BAYsBBYEBAjkafAECGgIKQU0EhwEKAosCAQ0ZChtmAhgDQwGeAQIXXgEbAYMBLAF2NQLEAQJQBAMVBAMlFAoBYwERMAVuDRkCGwExARcJAQEBTCZOYiUBDQQCJQkhAR8DHwMCBE1EAS0DbQ4BASJjOwGrARABFQoFTQEHAVUYAzQBawM3Yy4ESQM8FyhbOQE1AUwBBwGJAQ4CYQMbMydqATwuFYgCNBYBSw4CAV0hcwErMQGRAUkC9wEBEQRuAUceARADQgEBAW4ROQElAXgBAjcBchIBMWJXEgMgASoISQJNPwEHAT4xESN4Sk4BAQ4GBTQSGQIRaQFJShhXCU8BkjL3EMQJAYwBCfUL4gH1C3z6Dr8C2wGMAShoggHSAShB5AGLAicCCJ0BRJ8BA3YaiAGcATjGAZ4BEAykAYABARhnCQJNJk6HAakBUnN9ASLxAlwCBnADMmw3BGICLFE6QFvOAg6CAUUCDAYBaT0eELMDrgIDLgLSA4QBSB4RSRJbEc4BCzmFAQIwiQIYSU9HPzACBgrlAcQCAkgCSAIWX4YBHsQBkwLPASmxBM4BRLcBXxywAXY3xgFXHERktAENGxwyFwrdAlAiIpgBMH0inwG8AXJ4NW6YAjzUAYMBCJkBZOAB0QMB2gF0XdwB+AFcKHlDAn86Jnk6hQGdA40BCD4xESORAmAbe9sC3w9AmSDOEuosmULiBYRJHusQjAzRArwIkATWLKAwvAIBqQKdAiOQAeEBkgKkAw4CBIcBbLYBYAlYHFaHAQYUUgFDewO2AyL4BEOUAcoBe9UBCnTMAQUGwwEP9wGzA8gBpgK2AZ8ELQYQrwEZVxRUuwIBI5cB+wGSAQSNAbgBAgcGcNkCLLgojg6pN8IkyBZM4jGrA6YMBNUE/gGXAgLJA68KMqcIlAOVB9EFtAjaOrYLmw3MMZ8dowHKCs8BEgEDBY4KzBgE5AXRCckBAhACAqEIiASyCga4Eb4GwRKLAokHqQXIDbYLzguiB+gRsQsBiwGGAeoaBBbTDrgCkwwEBPoN7BkQeKIkoQPKBI0/2xeOGG0isQh7AdUFeIIL4grmEirtC64BGYAEMAGmAR4OYjsLAQxhEGIQEAYMHq4BngEeuwEKBSJ0J60BAQcoRg4RBUYQNgEOGwwGDAQqPAIWtQExQAIEIAdbOhwqAggGEwVBxAEXCBsfGxsCAgEBDAIJAhkCBAQdEAlVESMEBQgBAU8dDgICNCIiYzYtAko3lAEfER4BBQYjIAEtHCRdFzMXPQcHAQcBNwEFGgkTAhl/I1EIAwwBFgg2JCAaMASdAQIDBigHAglBBhEOBAY0FgYEEwZTAQEMKYMBCA0CECsBDQESBBkOENUBDh0EnQFsPCJbXAEqkAFghQENPAwEEAFTBhsODiJxGmkHEAYUEG0IAQwnAQEDa2QBEAUVdREMBgQCBAYBAQIoPRMaPxM5QBSiAWcTBgMCFQEFASgLBB4LShocBiQBCRoWBmsB9BCZC8ALIATCD3PdPqYfhBqgGsgxqQGUBvkDmAc99gHxAl+AA6wCfwG8AU2OA5AF4ALhAZ0BlAPXAXnyAaQExgeCBEPFAjg3HAgIQgQCGiAMAhQUBAzJAQgmFGkBBwgMAgoMAhYCBAICjAEGCAQYLhcCCAIHBhIPAykKOfsBDwQCpAE4ArQCBxkNBRMJAgbKAQIGBogDDwICApsBmQETBAIEAgICBjYhOQwKAgoIAnIaBgIEBgQQqAEEHgQOBAEBBAMDBhgIAgJeCgilASCsAQYEAgIWAgSFAWgCkgLdAg4GCggEBAIKUHxjSgICQMgCEhIOHwIJCD3ZAQEBBSRuU0cCAg4NFB0QoQEsDhAEFwUNAhsLPBkC8QJ3egbuAawBNgMEBAwMCAIUAgMFHn97BQIGBAICBIIBBkPaAQQCDhgmiwEEAjkCBAgCAgIGJAwWZiweTUBIsgOACRgwpwGxBrYB6AjaD9EDTvgMyw7cCsYgyQTeEBXbAhqzAs0HyAPzDrcEozS0COYLDHXXA6sK0ANipRL6CaUBCMsCWPwevwv6A/oCsAKnCZ8GCOICBiAckAfdAoICxBTzAc0DSsEJ7gKkAbYc7SH6A/gD1QvXDfwO0zuBDK0L5AKXCKkCqga1CRTbBMoG3AjqAosJ5ATwOvUeoCb/A8sFhQMc9BaPAaoDGLkt4Tb9A6YCChQK+QLhAQiDAQMGCgIBBQwCCqACHgICBAELCwKZCA5qAgQGCKYBCCkfEBQEBGfKAbcBCMABhgGwATUYBywOChMsFAIEAgEBAgQCAgYI9gImCgIEBAICDAJs1wMuBgICBNsBAqADBEZlwAPXA6QBBr8CAyEQAgEECAICAwsEAQEEBAQEArEBHgGUBwy3LYESyUuFN/oMhwGxNIYosxLyDHPmA4YCS9cBgAROsQECB0wGBGAKSGw2Sa8CAsUCYwLOAeYBlwQ5bsEDJDeFBzWGA4wFugMChgIGmwOaAkhHeAEEAZQCAkofBh40DgMBmgEoWIgC2wV8HOkDDCITUOYBggJ6AgKmATi8AbIBxAIVwgH4AecDyAG8DOcE9goK5ALPApIBRZgCBI4CDgJmAooGY5oBkAPqAcMCuAOPCbUDBMQFFqQDAt8FpA3eAp0BULIIsRKLD1D3ExyJEZoCnASaBRLiDOQIlwHPGQTrBagIIPkD2A++Bq8TrgEc9waGEtEGtBPpDZYe7AKiLIQYoA73B6EW5x6tIoZDuyDbC+IdryKfD7QLvEbpLrIMtw6ICKcq1QgeG50BsgQQvRjQBZEMvgLnAYZJ6TOWD6kZ9C/1A8gJAZsB+gvkDAL7AbkF3wKWBwHBDZkFAfoDvgoCFMgG7gG3ASyIFpoHBQaVBAmgAeIGAu8BzRmhGYUB4gFxG4YBOxp5beQBiwIxG4ABRp8BGV4chAEsdDjGAUYQDBAoGwNkQoABNjIhAg1AJk5iJYMBIlZELn4BwQG8ARZcCG43bDdmextjW7wBkgEOgQHEAT0u5wK6ASFzLMMBSUW0AYQBSB4RRRZMDxE5JnMFO4UBMmJpVpgBPwg/KRmbAUqdARIZE2lKShhfgBjOA/oDlhPrGFiTAa0O9yPrB8UHoTDjHp0s6Q25DtUWqQFLC4IBpAU7ggEChQIpCMMCfqEBsQMaFgYWLgoGBgEDpgF0lwEW6AEeLqUC1wEUIAwSCQZKzgH2BMoBkQEfBhSdAUJSBgIIRukBsASEARfOAVSJAQI46gEGHs8CKRz0AYcCFvwGAgEUnQEEawfQDOcPqAMEXM0dDJAFhDDdGqQbBJoNyQT6BQEB4RTVDvE+hA7BN/wQ2BEI6hoQDGu0AskBAp0BU7UE8wGTBQJsgQbZAtACabkBnAUGzwN3zwGEBkp1pQe1CegDJgL0EKobNoUBAgQCKDxIAQMCAQGRAgSmA+cBAgIhZycVEYoCXXTkAgKaAhwkARkKC09qAgEVAgIIDG4aPwYbHPcBPQRIIosDAgSwAQGkAWitAgUwXAI1TgEnXQH/AVylAfMBVihlsAQzAb4BkQHyAgwTGBMsxwEjbqMC9gEBAQGZAfQBARxfAgICBAImCTgzAXxzOlm+HdY8nUz9PbANhQEeBeUBMzeCAVYBeSpBbgF1iwIIBhkKGz9DRCZ5GQJcHIgBKHQ4Okw8BFYcKhIKZEIDdQgZHUoJAiJRTmIlFCItICJWRDB8ARsHZDsKsgEWXHg1AzA5N2YuTRcnQFs5iwGKAQ4FRAQYdmcDATwuZAMcC9kBTFEKAjJzLDGTAUhFA7EBhAFIHhFbWxE5JlIoOYUBMmJoATxjPwEBDj8IP0IjwgFOTxIZfEpKGF+oAZcCpAUIgATkA6QBPgEBhQORAggCDMoB1gHtAokDuQSzAZQMqQLKCvsBAVFnigFpuwPLL/4kniXDRJdCuSLwDNML2xeyJ48B9AXKICTKAiDPNO8SuSKSRLofjxPRAqMC8AIGBOQYAQHZAdILgROKG8ERmiaPDc0I2RYBhxSmCcgxowGxEgLPD/AN+wGDBOcXoRefLqkilA/yGJ0RMRgGAsgC3QOyAaQD4QEBnQICxgJyswIGtAPcAuMC4wXbAUS+BOgCDGI7KcoGY6QExgfUAa4C6AIgkAH1Sib8Mec7qw+iCpcOugGgBCncAq4OlQG0AQGzAc8cDsoClAOrA6oMtQzhCvYGygKQCbkf7B/cEYcBpwzCLQIMrxW9CNklxCjnGNsUAgyMBBnJCQKFAiIHAekEwgS0A/oGDBLnCJEBA+cCBgLpBsQEAlTqBB0GiAsBsQEEcq8TjiyNBb4B7jfhF9UPhBmLD7M39jSRN8UgkRyrL58CBPILf88IjwGYCsACkgz5BM8zwA/ZDssWsSz0JJMBv0TcH9kOh0ELzASYF+An9QHnF+kX3TrKELAvpAHEASdo/wLABsEDlwEB5AbHAoYBImECtAlRsgWhCIMC9QJ1yQE6ASThA3fMAT548QMCSKgUtQY8nwT0E+UCjw7GBe4Cygv5FuYTtwFQuAWPCSbDC7MBLgIIAjJCRRygApEBA7YBCIoBjgICmwICbCI28AF6FwMXPcABHEQIAg0UBDdfoQEIBgxLc1oeX2sizwGdAvwBigGPAQJwAnMgQbIBDQ4IrAECTB8tBBChATUGlQJrGQoC3gEGqQEG0AOCAtUBV4EEPjzlARnHAjsOImAIBpgD3QHYA7sPUFYGkgHJAwGuCA2aDIgCkwL/AY8H4wasB+gBiQuOBMwC2gEjhwYCOMIO2AX2C7sMrjD8C78CjjyEFPoT7ymMKYgQCB5I9xDTO4Q4jwmSAsBFzQ3VLZInWiwJF0iNAw0HKx5yKQdgRr8BQdICChACAhoEAnwXVTSoASSDAQIVAikSFDc2FjUSCgkCBwoJAigLDKYCjgEBUVExAnWEASIMLndHDAwCM29SA7kBBOsD7wEDDRAGuQGAATwHPhsmBQ4GqAHdAWUnEpIBHWQDdCRrmAEV6QG1AQ8KCg0jEA1GWQMCAtoBQ5IBAgEBbQUBJwEBKYYBCdIBa1kCGwojnQENCQJcVuwBOAJic4ICaGBYKJIBsgEBb00srgIGzwEYAhqLAQWPAacBAusBrwFJHOcCBAOPAdYCoAGAAYwC/AK5BF0IIB4HtQFZMgbJAR0GChBxmAKIAx4HTiK9ASpD+gTeBDxMK7kBECgGhANhcAecAssV7xODBY8BuQGUA5sBDMMCggLeAXo5yANYxgLMAQoBAgEDD6sCBS7+BOoD+QTQBx4CAd0CpgQOGQHMAqgGAgICsgGgBKUCtjnZLhIMzwznCymwAqEPtRK8AwycB8YLxDCYDM8Y5wKZDYcbqR6gRdYmrw3lASgfkgzsAtgN1gaWDo8BXALgCJQEevIHCIEbMKoM1wH2NJInkECwSvAxsg7FAscElhEBDAyBC1MDzg2OBIYBHsQBkAHSAimxBM4BRKABF18csAF2N8YBtwFk3AEcMhcKAsgCE3IimAEwfSKfAbwB6gE1btQC1AGLAZkBxALSA9oBdF3UA4QBvAGBATomeTqFAf8BngGNAQg+MREjkQJgG3vbAqQB1ALSAin/BUTYBDfGAbcBZNwBHDIhygKFASLIAZ8BnwG8AeoBNcID+APEAtID2gF0XdgEvAGBAWB5vwGdA40BCD4xESORAmAbrgHiAQTbGeYltzerC74oshefAgIDATwCnwS0BLEE+wHfA9wGrAGgFoMDxgaaBQbIAc0GxQYWBgpYyAK5A6sGhwiyBewCyBiJBQIGJ9QOsQUDAaURN44CEdkCkAnnGOcatgv6MP0GrgGsSaYovhWVGeIWlA+UD5EQrRfTBggE+hIyDFIQgwrMChIGARmRDMEZCvka2y+YNesXtAehTNtErzOeLpo55BzNApsD6g2hC27LCs4D5wnXO/dK3AkCAgYCAhcQCCIDDgEkCAQQBAgEB0ghHgMCFQo0DQIGLAQNCgENAgIEDQgCAwkBDgIuAmkRERMcIhQUCgYhBiknVQlWAgIgAgIGAQECBwEhAj5cCARGSjkBBwICCxEkFyIBEQ8CCQcBBAsXKgoHLgsCAgQCBAoCBgICFgIGBwQFKAECAQMaDgMRSjUCDx4YCgEBAQsBEAQeEQYIBwMkATcBAQ0TAQQCBgoEAgQCBgoEAg0fAggOCxImFhAYLy4OHAoGBAcBCwo1EhQfHQQFAgIKAxIIDAEHAQECEgIGSAERBggQBgQBBwIFBSUIBAQIBEUfIhcCBxYCAgIGFg8GCAdFJRUuBgkLARAOEgZtCgUCBgECAg4DYwIZLR4CCA8BERgCNxICAQRGCwVCBAIECAQGBAUBAhwSAhcNBgwDJQIYBAoZFwcCCxQcEjIDBwYEAgICBgoGBAIGChItM0cEBB0HDRADAgIEAQMYYjwXBxQGMwIMBwMUEAkGAgwcAQEBAQEBBgEMGQQEER0jCxMBGgghAQoFFAEBHQIbBQECHwE0PQMDAQ8BBQcLAQgFFQgfARgiAwMCAgwOBRkBBwsGAgoCBQMEIAISAgQoGQYMEi9NCREUFyEWEAwJAQkFAwUBBXpXKYYBBAQBAwICCx8CFgkBAQ0FHgICAgMiFwcCRwMoEx0MH1cNCywFMwQMGgwsCgQHDwYIJAIEBwZJEgwUAkYGBj8WSxECEQYcFEQ4BAcBCAQCAggCAggYQwcBASUEDQENFQMNBQIMCAswAhECFANZHiAjIxsGEwQjAgIKBwECDEEGCAIEAvUBowOLIo8agj1ChDj8A+ktmQEKUo4C9wHABDwIUJsCVLcCM/8CFJcEeqMCApAB3AEaQYUBGJcErQNmCvcC4gMypAO9AuMFAkgF6wFD2AEo0gO+Aq4DEPgEAokE9QHQAwMcLBgCFpQDbgKTBQEBAgIMFDVSH+4BvgS4AYQBoQMEjgMFKZAFxgIRtwQaigTpA012/QEDCW2tFNsEvAK6C7oW6QuNFM4/gwQsAf0BHmuLAiXLAZYDBA6VBQSuAztSEi8EZREEMiDqASJKlAU1B8IB/QHjATLJA6wDhgKCAgQCaPMBmAEr9QIl/wNizgUh0QHNAq4BKfIYkBEDBgEVgxzhH8YK2wLQC64CkxWaArkClAkOnweiAo4BDwPSCKIdxxQclxcKAgwIKTgOBBwEXwQBCgQILggNBgECRS4mTgw9DiESAQFzFFk3HWQtARUMPSo/EhoIAgcQCwEvIuUBAgcOAipJOxARCgScAQMdBAIzATZTUYkBAQMCFgEDAgoXDQgLA00DCzQLIhgZCxgIBgIBAQEBAQECDYABCgRDCwoDAgMMEAgCBAIKAyUKARUMFAwBPUMGDA8iRgR0ByUUEAYUCA62ATUCIp0BNoABuwJSBIcBAgIIBAIHQB8LbAQKJCIKAgIKZzkNEAMBBwcCHAMFGggaAgItFwYMCf0BDBE+CjgCAjovQT4eEEAESGluClABDwFbbAoiFzUFJwwaHhACCiUlCAY5BAIOBSEOBBESIygpDgMrAh0HAzWYASEEBBEpPAtmBlkIAgSCAQEuDAIYUVAEggEDBk8DGAkHGTUneQIOUkVWSAiTAbcB0wI/DoMBHSAIArYCqgER3wIejwQRBVRWXhxTAQJjfQICPR4sNQIJPQGUAbMDbjaWA5IBaU0tM9UCCBACAjlybJECDLIC3gFuRyYUAUIRHjpdBiU8NByDAaACFZsBGTJbCAI8LgICAv4CVIgBogFmEGoNAmF8dIwCywG9CYcHUNEKyTwXqCyaRxlHO1kBEwEsAiRfggKLA5ACAgQBAgEBR1gEBAIMgQEBAQFfbQJ+CSo/TgQbqAFA+QEqFQKKAxQCM5EBGzwdBSMcngEBnwEBcQEBLYgB+AFTAwGbAQG0AQFjdAcBiwKKAiYD9AEBTCyMAQaKAgE5cpQDARIBegMxAgQMEAQhTAIBAQEQHQE6BAYqbAYCGFIISGUBAgh9qQEDAtYCpQIyEQFNYgYPhwETApECMiFakkLyAbYRAgPICwHfFNAIrgPCAs0D0QRbwwS7BZcQsALcAsQChwPtDtoG6AKVIvVKk0InYAoVAgR/AgMHLAcXUyYovQIQBYwBUzuVAQF5KyEEpQIQFw2hAVA/H2y8ASQWYgICAhYCAgIkCAQECGYLkwEmAgQTORglAjMDATRMZiMODh0gDNwB0QEaCA8BdVYQEDwCeqUBIkqZAX1AKBxAQZgBBIgBTQEbGBBIdjMOVD36AQR6AzQuBgZhXSACZQICAykGJkHbAQJZTHB1F1s9dJoBGgEBVg2hARwCJwcCpwEOahdN2QE+MBfEAV8CAQ0iBCqzCSS/D5snAQGqFM4EsgkCAqYZtw4C/yeoB7oD1BS+EAgGngwE4Q68BcsGtgvLBqchRIgXBAajAZIZkTSfDdIL6BPvGsQGAb4IBwnGBRz2C4kvjAOFBPIPyAMCCNIaiR2tBvI5tB+sAfw6mEcZjD2zA+gFApoEiQOEBKUDA70B/QWiA4UFIAEDrgXWCOEF4AHtBc8HpzqbM60qyB+gIALJE4gFtCb+AdEPjAzEAxwCkggD2gMEhAUCAhgCAsARzwIC2xQcrgOjDIoFHJEUvxXhA69L8gECCAMJASCOAbwB1ANHL+IBAQctPjyuAQFhD2IWSAUJiQEC0QGIAgEHBAQCBikUFiyYARU4AVTQAgYlIAgTDxMP4QIgBAICRAKLAigDBzoZogGwAYwBEAMbA70CHwZ0J2VFBgIGFN0BEMQB4QI72AECBUKFAg0DFAcyASwBOmQbIgICBgoBTQV/a0UBBiECAckBP94BZguXAZUBE+ABfX8BBhMBCpcBvwyACVjhDsYiDqIEmRTVLtgfmB3mCKYBFA4CywLIAZgG4AOoA5IBtgEFCA2NAe8CxAfSCK4D6gExwgWeAZgF2AMR+wT9BTZ8ogSFJdAU/AW7PIobjQ/hF5cWlA3/Cv0ppAGeAjbSAimRAqACzgFEoAEXXxywAXY3xgG3AWTcARwyFwoCyAITciKYATB9Ip8BvAHqATVu1ALUAYsBmQHEAtID2gF0G0LYBLwBgQE6Jnk6hQH/AZ4BjQEIPjERI5ECYBt72wKLD9cIkAGmQ+gswwE8CQEgF3e8AZsEB4oCATSpAnDAAQ5tAxTPAc8BHCYICJ0CTwFU0AIGbwIgAv8CBAJGAosCKES7AbwCEAMEFwO9AgMcywIGAgbxAQEP4AQCpwOhAQdfAd0BAhBO5wEIRQEGIYsCxAILnwR9fwEGEwEKlwGWDJEJBAQCBvMK6wapHosMskO+FZ8l3RqnEQS9CxcWA4kSrwkBswbJCdoCCKEqkkCfKt06qDCIRcgsFf4MzgEizwuKBJ0CuAHhA8kEpgHgA/AQggUCSAykArNC/UH/K/IkrCOHQn8EBBwqAjVhHgpfBYQBYgWXAUHkAV5+JxAfChk/QUYbhAEbXAEdhgEkeAEfDswBXBw8AwQDYjaMAQIXHTIaCQJpCAI+BWsdCFsGIiJHDwFDHxEhTQ4DIFoKOxRVPQcPGGRoATgCRiI5aCpOOwYQLgSKAQiDAQgCcipRAQsgUAICBGg5Nj4lA1eZAQ9MBWmUASozJDc3Cj9DugJIHhNBAgQUUwYTNyhxAT+FAQExYmUBAhRDmAE5ED8nGyF+RS8eHikcGRECTRpGSAYCBAkLTw5IjhPTPBIBAwEBA0QCkAECBAMBAQEBAQECAQMvExNUBEK1AWwIAVQcG+sBJQEBAucBAgRVAgIEBgSDAQJgTDwEBwMGPhYHAQIBAQIGBAE2ARN4WhUCdLABHFbHAQEUwAECNR4BjgEBBRhXAgYCBDABCOwBSq4CAvIBAQgbLQICA54BsAEEIr4BAR4UAgICJJwDLhMDBNUBAQEBARl3AQMsAZMB1wGtAQLzAWEBPgEBAQUBAQEJAQEBAQECDAFoBi0+AwFRARwBBAEG6gE3PwIEFJIBARFpAg5gSB0BATgwAQIBqAEBxAGjARIESgb6ARNIJUMDAQIUCg4vRAZMAQ8BEfIP9wsEBbg9tUK5GfsYhwEs3xKmAQRv2gG0ApoBwwyOAcIEuwmCDagBvgEB/gGgB5cDlxPZA6sE/SDxGW2QBNgKlwm4CtkDpgP3EALaFJoBgQtopgjHAsAOArUEmxnzAwS8CMcOugEQlA/bAj4YqgFABKYBGs4BAZYB4QEIBO8CoAELqwGVAo0BpwHmASIKBhA2PFAwLAIGiAEnAggCQ9kBcRTMAdwB3AQlhgHOAYADAjfKAc0BkgI+DgVOBpoCgwFPuwEBKyIBAh8hBoIBAgatAQo+uwHAAjC4AZQBLRELcAIOBAIOnQGrARxyAghUBHP0DNkj7QinS7QS9w+3B4EE9QfZGOUZ5QjlJfAS1w/MG8MDvg1GQB7EAZABgwHPASmmAosCMZ0BRKABF18cigEmdjfGAVUcKhxktAENGxwyFwoCyAITUCIimAEwfSKfAbwBcghwNW434QE81AGDAQiZAWTgAe4B5AHaAXRdlAFI+AGEAWUUQwJ/OiZ5OoUB/wGeAY0BCD4xESN/kgFPERt7iwJQgAGdG5cBuwOmAqwYhRfOEtsq+wLFPCBmHpEBAggcBAmQAYMBzwEptAEZsQIfFM4BRKABF18DBhMnChJHJhgBXTeuARgRRBwqARtkJ40BKBwyFwoCXAToARNAECIiQVcwfSKfAZ8BHXIIOwMyNW43UZABPNQBKxkgHwiZAWS9ASObAmxLQZkBdF1ld5MBBAIEAiA5hAFVEBRDAQF1CjomeTqFAQ00vgGeAY0BCD4xESPUAT1gG3vsAQIIFTwBE78CsxH+B7YIqg2rA8UIygF5CMsEjRjgCeEIArsq+0e/FbcCqBX3AtoF/BWnJ7wxDDQW2wHqDn7WMLYLvkeKF9dLyBuzOPs6iwinJ40O8waNCacFAgaaAggE7gGBEYoL2B+7BfYQkyUCTVcEAhyZAsYE4gGoAlQmcTN+CBYCMCTNAwG3AQLDAg4SR1kCFHQBSCrJAtoCFAHFAQM3Lyk7cmdoAgxuHQEFFAhLiAJUAnUCATkK0wEiOnAXCQQYAQXDASgkSgIhBBAPcggPGgKqBVo4dgL0AbUChQESzAG9A48BERkCAo0DAQ60SLkWhTGdBBSnAYUViAQcDuABCmBc+wWCBJIGgQqfC9cGOxy3BGwE3AUCjgHMC84CUgqwAcsEhATCAbEBAlnEAsQIuwGvBPQGnwJc1AM7vwXSBsQQ6wGyFQrUBALvIIkNpQubR8MOmytGQB7EAZABAoEBzwEppgKLAjGdAUSgARdfHIoBJnY3xgFVHCocZLQBDRscMhcKAsgCE1AiIpgBMH0inwG8AXIIcDVuN+EBPNQBgwEImQFk4AHuAeQB2gF0XZQBSES0AYQBZRRDAn86Jnk6hQH/AZ4BjQEIPjERI3+SAU8RG3uLAlC4DZsMvTqfD9YF/yvAO7NDmxOyQ4QOzgwL3RfSECcNkgQQ6CnUDtAMiyZcR8kDcLIBgAFBMaUCjQOxCf0B+gQCCARWcvsBtQLvAlkQuwgW2gGxA5YDBooFzwL9AZoBngMk3AGfH4YghAamA8wBvwfFArEJsybtBOwC1QX/AtwFDtUGqAP1ArsDzAGrBQaLCdMBTIkJcAG6AwOZA8UDoAToA7IH8kasG68P7QahFydgHPEBPwsBDTa6AWaQBQKgAa4BLg2GAQR7BwsD4AMcRHG7AStFJUIhCHdXBl0GigEECgIX7QHAA0y0AfoCAQIGEwSuAaEB7AUGigIETzmXAZYBigGtAYkCgAHjBMEBAgg4MDhltQMOGswCBNwejD3RD8IDzD3wAgYB9wQN0wN2iQO+CByqAgJLjwOYBJQGtQGBA4cF2wMfxgbvBQL7ApMLOQaOAYwHiwKLARy2B5wE/QbYC9kCAjvvAb4E+gWwAwYchQrtNdQeqw2VBZkrnwICAgYCDCSOC5IEAqQHBAQQ2RYQBo0SAuYIBhIItj2xEgKuP+4/3jkCDO4SyAzDCtEJhQr6BSSEAf0G8gTuCOwS0TibEY8QiC/YF4oH5xjwEoYkjwfSL9YIjRj0NqcV6gZk5BmIEswLyRQB6QLvI9gFhCO0B4MO3DuRJI8B2jiHBLUHjRfvHAHpJ4Yzjir6A7QF8hCaBMof4gn9Ca4Mqw2nKtUIBQUCEuoFDJMCsQN6OdgCBa8HDAGpB7ABsAEGGQZmyAgOwgQHLwRnBfkDGd4EQcIHBGUIB8cSnRHECKoC2Q3vDb8I9AIXBtQHlkTfBsc37BgE3wGcAvUCxAIuBBsCngEKAhUVpAEuPAb+AXoQsgX4AcwBVIUBnwFeiQKdARPHAQj9AQqZAaMEUQJQtwHxARJHygIazgKZAYQEYAYyAjjkAbUBHAIkVg5MuQICAgJ5VOICfP0YpCOwB/YdgSekKecCL4gIGkz/BgIBIcwH3QjkBiABA2rbAgGqB4QCBwEsCQGLFacNshsBArEitgOuMOkvoxXEC/QJ9RyPMKkFtxXyGIYBHsQBkAHrAhCxBDGdAURqMwMXXxywAXY3xgG3AWS0ASgcMhcKAsgCE1AiIpgBMH0inwG8AXIIcDVumAI81AGLAZkBxALSA9oBdF3cAfgB/QFDAn86Jnk6hQH/AZ4BjQEIPjERI5ECYBt72wLPBc0FLKwGtARjkgWMCfoOIrIE9wOLAdsN4wHUC7UImgHdAjXuCYAMmQGpBM0JhwEs0Axs9gqgPNsXnETuBbk/4C/YD880mx2yE58BApMdzhQFC8gf1TPGSIQIoRv4B58LjRQE1APWAuEX8R0BuRmDAqIKzgu8JEZAHsQBjQEDgwHPASmmAosCMZ0BRKABF18bAYoBJnY3xgFVHCocZLQBDRscMhcKAQHBAYcBE1AiIpgBMH0hAZ8BvAFyCHA1bjfhATzUAYMBCJkBZOAB7gHkAdoBdF2UAUhEtAGEAWUUQwJ/OiZ5OoUB/wGeAY0BCD4xESN/kgFPERt7iwJQuBnEC/4B6hCKBk/SCOEY8Ae1NIcOsRn2GLkZ2wOmRNEo3AL2CUZAHgI0jgFkCCRHECzPASk3CoMBYosCBwQCGgoMkQFEoAEXXwECAhIFigEmdjfGAVUcKhEFAgQ7KUIJCAYKAggGDDUNGxwyDQoKAjIbdA4bOCYTUCIimAENI58BnwG8ARZKEghwNW4IL5IBTzwtEJcBgwEIVURkG3RRPjMQNA4CBCXkAUxBTXQtMJQBIgYgLQgPtAGEAUobARNDAm8CDjomeTqFAXQga54BjQEIPhUcAw4jECAODjOSAU8RBw4GeykLBRELVmBQ8iTUJrQMwxDNC/ZDgQ2CHKEc4hesD+sj4TGFFecGgAjUAu8CGq4EsBPDBp8b9Su7OaMMwRWQDvkFjwrIFrUF5Rm8G60G6zCODL4DkQzYJKARwiSCBP4T7wvwA4ABqAF+OAUG8gHgBAbRAtcBbBwCAgYEtgOdAgSFAgabAWGXBbgCE5ABBJkDmgLSAYcBpwXbAYQBTDgQFK0ClALrA9cDtwECygSBAZsE3gOFELcLlyE9ZigCIXlTYwUddFkfAgeEAcsBGhsSCNMBBgICMAILA0EDAgELAwUmFxBESCwBAQcCAg44Dh4CAgQCBAwoUhYDJu8BigFGHGM5UwcIAy0jAQQRQQgCFAgKAh3rASMNlgIOJxl3LAICAgrVASYxdS0vBAY0nAHWAQEbiAEFAm+9AYsCBAaZAYMBOBcDNccCHHG0AQQUCRVhFGUBJyMCCAajBCAINcoCArcCQQHDAwMtuwJnNzgKCgIEKg09vBulHdIX5QbdCIgKmgS/BIECHMkXuw3bF+sN7B3fLQEFAxUGIh0KGAIcBztSMERIGAcfSDsaeQQoFSwTXAdgAQEKAghhMgIEEg8DBC8TAgwFFAobGDA4RgYBSwoYKxMGBVkCAgIEBgQIIio4CgMfLUc4GgSzATMICgYECAoGKBQBAgICAQI6CiBCCgECbQEFGQkaBCgCFAIJAgQGBhMDJwQKAgIUTggBA0sLBwwCAg4CEgMBAR4sICJWDgIBMwYUFBxiAQgaBCYPQiQ3FiU4Eg4IJQIQBCECBgoBDgECBU0NKggLARw8NwwSNhIKFBAZNBAuAgQMEhw3FwILCTYCCDUeIAQCAjhFDQIMLTYeaVsPBAYkKAYHJU0KAwgavwEUKg4wPgMOEAkeTAgdBzEaIAYcMAY2EwkEGwHQASAKKTEFQwQMDgEQKRwCFFsDCAYdHAYgHykEIwkCDSQIDRUlAhAsBiwEOAQiMDkKBgEPBAQYFgVETz8IDhkYKQ0CCgkmAhAMTgNHAwICCzgEBAJHAhIFBAoGAxAKDQICASodAQEBAwhCAioGBBQGEAIFFAcBDgIMBAIQAQECEAcHBhELCgIMljLTAdQFiQ9rnRiKM4MT5w/0Dg2TDaMB6wbWFATzAQQCGL8CzgSVAX3nA8MTX+QBqhmOCO8KhBmeHNQv1i2bDqsi7QUWxEizQvIY0QPAGKo6lzTgJJIOA5wHmwajGxSREIQ32RQclwjrGYgH4CS4A+Eqz0jhKtwJAgIGAgLGHtoH2waVKfkBCKoJqwqHBJQDARGFCKwKAaMBwAfTApIFqAYp/AeSA/YKTyVa1gjRA70Bzw/UJIYBHsQBkAHSAimxBM4BRKABF18csAF2BDPGAbcBZNwBHDEBFwoCyAITUCIimAEwfSKfAbwBenA1btQC1AGLAZkBxALSA9oBdF3cAfgBhAG8AYEBOiZ5OoUB/wGeAY0BCD4xESORAmAbe9sC5SXbC/ovAAYEBAsZAg0EAQEICggSEgEBAgYEAgIMAQEBAgEfCwEBAQMBAQgIAw8BAQcCAQcCAwIIBAUBDAILAQUSAQQDAQEBAQEBAQ4KDAIBBwIBBw0CEgoGAQEGCQMECAEDAQEBHwUBAgEBChECBAICDAQCAgwGAgICBgECAh8GERoBAgEEAgEEBgsMAgEFAQgGHAQCBAoGAgEBCgICBgICBAQCAgICAQINDwIDAQYDAQIFAQQEAgEIAiICBgcRBgEFBAICDgECAgQCBAIDBAkBCgYDAgICAgUBAQECAgICAgsDCAIBAQkBAgEBAR0DCA8IAgYCCAIPHAwCAgICHQ0HJxIEBAQBAQYEAgEEFAEBAgICAgEBCQIFAQEBBAIBBAMEAQsBAhIFAQEHBAEKBAQCAgQEAgIEAgIEAgICBAgCAQESGRQCAQEBAQIFAwIBAwEHAgUEAgwCBAYICAERBwECAQUEAwMBEQ8CAQEBAgQKAgQBAQoCDgIBAQcIAwIOAwMPAwQBAQEBAgQCBAQEBAEBAwEBDAsGAgsHCwEfBRACCAIEAwEBCAECCAUBBAYBAQQHUAcCDgMBBAQCCAgCAQUHAQIBAQYCAQEDAwECEgoBAwQBAQsKCAgiDAUBAgQYAgITBQIPAgQGAgIKBQQEBgYCAggCAgIBAwYCAggCAgIBAwEBEgQDAwIEAwECAgEBAgIGAQICAQEBAgEBBwgECgUOAQMNAQgECAgEAQUCAwEGEBQECAEBAwIBAQECBgYKCQcHAQMBBgIGAgECAQIMAgQEBAUBBAIBAQICAQQGCAIBAwILCAYCAQEHAQwOAwIDAgQBAQICEgECAgEBAgEBAQIMAwMIAwoFAgIIAgkHAQECAggBCgEIAgIBBwIGCBoODgEBCh4EAgQCFgIEAgICAgIGAQ4CAgICBggBAQQGBgIBAgIIEBQVAQIDAwEJAgYEAgcBAwkCBgQCBwEDAQIjEgEaBAYECwEOBQECBggGAQMEBAcCBQICAw0BAgEBBR4FChMYBgICAgEDBgYBAQEIEAQCAgEBAgwEAgEFBAIBAQICAgMDBwUCAQMCAgIGAgIIAQECAQMCAQgBAwEDBgIWBAIFAQEBCAQCAgEMDggIAgQlAgEHBgIiDgQDAQQFAQEBBAYCAgYBAQoCDQUDCAIVAgQDAwIEAgIDAQEBAgQBAScBAgYWAgYCCAQCAgsBAgECBAQCEBQEAQEEAgIMCCMDAgYEBgICAgIEBAICAgIBAQMHAgIGAgIGAgEEBQUCAQEDAQYLAQgECwEIDhMKAwEBAgEBAx8BAwQBBAYKBBEEAQMFBQkEAwEDAQIEAgICDAIBBgEGAgoEAgEBAwUCAgMBAgYBAwIEAgEBAgICBAIEBgICCwcPBBMOAgICDQEBAwQCCAYgAQEKAgINCQIOJQYVCQQBAQIEAQEHAQMQBQIIAQEKAQkMCAgHCAcJDQ4CAQECAxAECBYEAgICDAIEAQMCBgIBAQQCAQEDAwQEAQECAQMPAwkEAgEBBwUEAgoDAhIBDgIHAgQEAz0GAgEBBQQECg0EAQEDAgMFAgIBAgEBBhMIBAICAQFFAQMHBwYFAwIIAgIGAQECBAEBAw0EBgQqDhUEKQESIQQSAQMIBB4MAQMGAgIEAQEBKyAEAQoEAwoHGQEBBhEBBgEBAxIEGBUEBwEBAgMCBAUDAgMHCAICAQEBBgQEAQ0SAQEBCwIgAgYCBAIaAggEBgQJBQICAQEBAgcCAwEFAQsEDQMgAgEKBAIMGAYIAQEKAgICAwoIEUQLEg0LAwELHRYSCAIpAQEEBgQdFwQDAQYEDQECAQMBBgICAgIBCgkBDAgGAwMCAgoBAQEBAgIMAgEBBQQCAgYCAgQFCwQLCwIDAQQCAQEDAwECAgIEAgQBAgoCCgIKAgoIAQECDAQCAgMHBAEBAwEDAgEGAQ4CAQECAgICAgMEAQETAQYFDAMHBgIDAQEBDgQCAxIJBgEBBAMGAgECAQEBAQEBAQUBBRoGAwEEAgIBCgYMAgQCAgICBgIBAQ0PCQECAgYCAgYCBAEBAQEGBQsECAkDBAIBDwIEBAEBBQIEAQgIBgwCBBEYBQIDAwEBBAEJCAkGBAQEBgICBgIEAgICAgIBAQECCgQHFQICAgIEBAMFAgIBCgICDggKDgQMAQEBFAIECwEIBgIGAQECBAECAQYEHQQEAwEIARQECAQEBwEBBAIBAQIBAwIBHAQCCgICAggQAgIEAgQIBAIIBA4BCwIBARABAQEDGgEBAhQBCwIDDAEKIAUCBgEEAQEFBQICBgIEBAEMBAsFBggBAQEBCAIEBQQIAgICAgIBBAMJAQgCAgYBAwQCAgQDAQsBAQ8MAhYCAQEEBA4CEAkHBAcFAQEBCQoKAgYSEAICAQMOAgEYAgIGBgUDAgIBAwEBAgUPBAIEBAEBCTcCBgYBtwPnAs0CmwqJGq4Z/gHlJbgfmxOEMNkK8zOLC7kBpCB97B3qAu8LdJAFHJME1hPgDfQCEAEGN7IDjwG1CIIlkUbSJIRH0BI71QWyF+AE/ASYCUPVAwbMAZMDzAUCiQ8czgWmA4cI8wH5CZAFIu4BO9gBzAUOnhMOuAGLB5EC7gLdDp8CwQfOGd093Q7YCQMF5Q7gAgMCARnjDKEBB48KQQP9Eu8KpxXpINUICgEBCwe6C8sLxioE7B/1MaYBkwiDEtcG4hjIQukXA78Z5hr+Ad4VQasH3wbbIMADuALOAswD4Ax6ggICnyT7B5wCEAELRh0EAwEIBBABAj1AHhoKAygCAgUYAwkFAg8eBx0CBQsEAgQBJQIcBggxGAIsAwY+BAUBDAQEFA8ICAIKkAFqAR1AFZABCQEGAgQVAgQIASYBLgIHAQUSIgUJFQwaIxYOAyIhCgUEFQICAQ8EAgUNAQEiBQkDAQQFEQENKk4FJlwaNxUcFS8HICIIDUEGARUGASUFARAHAQIBPxAGDAMpAggYDAEVBggEBgoSAggEAgMJBAIZFAEEAw8SDgMBAgwIBQUBAQYZEwQECgIMBjIWMBoMQwQIAwEMBhsBDxITHQUdBQaCARAwIxoTGwICCgMBImwELx4kCicwFgMFCAIEAhwBBSYKCwglQgkMDBgCAwkMFgY0CQIRDwUJBxEKBCgKEBYOBjsSCSkQAwEBCxAGCAIGBgYDSkgNcQIDBwFxKAIjAhgMGQEEAjcWGxFgAiYMDAwEGAIREAstDRcJHxiZAQQLAwMHHwIKBBACGA4ETRQEdAtRAUEICAQyBAQFJSM/AjACYiMRET0LAxcPBAIEGBIgAhQeIgMBAQECCQEGPRwFDg8CCAwSAx0IAV4SCRoQDQMnECcEGAsJBgICAgIYBwwVOhcHUBojEFEFQC4RCQEHBB4cBBUYAQIOBQIcGgIOBAIODB9cTAECAhAGEQEiERsPByIeJQ0CCBEbKAQMKQQUAT0OAgESAwYCM48BBLsCATwEHAKyAQETZtMVIq8TrglKAqgB5w+JAe4YsQU51TPVM0uiApQBygIrvgQYqwFwTiIEHFY2JkLeATOYAXEiCgcWOSoEpgFKTRdqRuwBIuwBAg4fRIsBAv4BFAj9AXA7kwGOATlB9QEQAiSNARo5em8BIpEB4AFQ3wKPAU1GtgHCARtZH8MBAUMJATI5nAJ/MgVRSToRRdoB2wEVMLQBRCO3DgLPG/oF6w73C7QHrSqjE7dLrwvQGcgsuSLTJ9QMowKNAU+KAiQYiAHYAwos8AK6BwhsBhoIBAYqDtQBDDmnAiKABgYZ5AEEbDq8ARKeAbgDsQIwzQEKdU8U1AEtYW2JBvQCAqABGkgCBKkCpwGCAQqqA6MBwg3MAwKmAhxCYrsU/gFw+RiMBeMz8gECAQpBkArmCaEC5QIEBKMBeowCKgHABDaZAs0FmwsUB70CBBHRAYoBE5MBggSgA+gBBAGCAQEB4AjXQr8B0EfNPLwPqw7NFuMqgj+vHt8++wuGJQLMGsAHhwGqAZsDJuMJErcCuQIcrQJCYIYDQwaZAbQG2gMC6Qy0AZQFAi6JC64BGqopiRndAZYQ6jfrII4l8iz8JLQL8jjIDOMZtQTBA8MGkhWRG50iiA2pNbYLAroXAakUAQIhAosRBJUZ3xfXPROlC6MbhgEmHCYkDQICDARIFWMqBR0QLFsCBB4vBgQCFSkrLysVamhBXyYGBB0IIQYeCk8CBhAiBAgNAgELFghWFBJfAQ4MAxAlAiIMQQibARQ9iQEtChMCAgIDAhECAgIDAhwMCwsBBAlUCiwCGiMIDwMuAQVyHgFGCw0RCwEISRgHIgwGFxgCClYeBB4MHAQGISUfmgECEQGKARkRDUIvAkkDITAaAwJZFgEfKggaDDAcIGEmWhsXBQMHBkEUWRsnBgsKQjQKBz0cAgIbBQcULAgPBgoHWP0BPRwPXBUHNAIIRxNKAQEGAgQaBgYIBA0pFgQSHwZ6KUAgJQQwOwIZEy+uAQJABAUGHxEWChsDAQEFDx4HEwRRMwicASMCYAYTCjACGCABETsyDDofPQF8DRGAASMHEgQ1E0EJJT0BFD0PG48BAjUaHhwOKQwdGD4FlB7yCbwKbjkCLJoDBpgC6Qb8B6UBAo0BEPUBrQMKAgJyAiQaNhi6AcUBYwJeGiQPcX4IxgHbAVhAARsdFgYWQwMHAmDjAQ4SPAsH2gEEBCo3DASgApQCd8IBajE+gAIXLAxrAh4CBBQIBBAEAhwVAtoCAmM4Ft0BIjobCg5g6gEmHgFMDBQnbjXQA0eRAYgCqQMHSbcBDgRLAwGQAwj6AVwCAwICpAI8BAjCG+My8hjBHvw80hqNQtgIuSbEGIsJBEBFSSrGARELGys/GSsFCgIOGUBEFHs6BAgDGEaWAgQPEAQTDAtddgQLIBQhUAIOPhaNAS0GLRACGasBEgMlNhQYEQgUCCAOCAYHAQIRDDoBBVsSCAYMNgQCLA4ZBjgKLSIBAQIGBQEIqAEGOz0MHAEhAUxVHAcrY64BBxY7CQQEHDgIDlEHDhAVAQ08QkauATsCBhZhEggEHVUQ0wEaqgEILCEPEFlAbAILAgcQIxEOAgQfUTI6BBgKTA0kBiwaGDooGQQGPcsBCAIcMwYr0wIBIQMIHQITBAsOAgEBBQWEAU8PBAENOwgCC18vWCMgHRFBIA8EAggRDhwCgAEOBDIpMj4DQgMCDgIkGWkQBxMUGkELBggHXQEBGCNJQB8MAioKKQgX7wRfkAj3AagD3gSeBoADyQwCDJkG5QGRHvUJiwinAga1DkZAHjaOAR1zCwF2V3kpQeUBiwIBDBoKnQFEkQEPF18XBQMCMCQBAS8mdjfGAVUcKhEHBANhQnINGxwyFwoCTQElTmEmE1AiIpgBMHwjYzy8ARYHAhI4CQhwNW43kgFPPBPBAYMBCJkBZBsTBi1/PZQBHeQBTI4BdBsSMJQBSES0AYQBSgcUE0QCbxA6Jnk6hQGUAWueAU8BPQg+MREjf4UBDUYJERs4Q0phKTdQhgLODNoWN60D5w4CyxCYCBgBAQIDAvIY4RkZR5UBEwGxAe8HXwECAgqBAakEBeIBAgQB1Qi+AgGoAvgBUwSbAQHPB02/BQGrAZ0FT7EEAQIIfbgJ2AInOwUZDxB8QAZNCRUHao4BDlQegQEJJ8sBA0oQEgICCwUeBiIOBwYCESMIBgYGCmpTQz4IHmQEBAIEBAQCAiEBIT8LOoUCAaUBAgIYAgJDAVFJGg4KEAYCBAYKBxEBDgYBDyAHFCAGFAUGFxkIDwoUKRQCuAFuIjEmgwEcAgICAgoCTASzAQIwAxouNgUFBxYtDREJBA5g4QEOGAQWDicMOR4SIQsEAwMsDBIIHQsGdWB9BD8OAi2AATIdTUlIGi4UuQEVTxUYBgICGAIMBBgqTzMCRwsXJAICdwIbYnYEChYCARpBKiwhBDJKQz9QBxYeEYUBbgwaE3oChAIfEgQjD4sBJsUBUgUnhQIgAgEBRAIKMwsJogz8Or8VmQ+gCNQI2gLZAbkC8AHAAoUCnhE2ggGpB6YBJ6IMjwHJBAStCBe/CbYCtwTMCRgMGyFPHCsQEREPBwcDLwQ2OwQGEwIYEhQoFikfIREgCBwUBAYOBhwMHSA6IBgBGAQOAhAVEFYrZSc/EW6bAQJHBAQMZQ0aGS4yCxFwCz8CIwInSk6LAQkNAQMkEEQdASJnAgE4AlEEXgcBCRkCLGJEHQ4aJSI6BgwLKBgIGkUEMAJtCRoEJAIDCQcQPwEFKSsIAhoNFwgIAQEFAhsZKwI5cVoJCxEDETIDE0crSQQCBBIVCA49AhAsEB0EFU8CAoEBHx8BAQHGAgFDIAYEDiELIBwIEkspGSIpTA42GgICOig2OzoNMQMBKSJJYnUPdwkRDxECBAQIBxUDPwpYPTEcBDta0gEHFBMeRDwIMwEBFRIofyEyOwEBAnQaBgJIPAIFBikUFCUWIlhYGgwaNwoYuSKOJf8BvRkE8QbyFQidBL4T1QgkkxHXB5kCVNEFJc4BnAlUigX0CsoKng+iD6ECbi2WAgQ+GIsBSFs5Nk8JI+YDRGwpKgKaAhMRN0MCwAEkDwEpAgYYXAI8kQFxLUrFARzFAUJxlwGiAogBFgsXC/8BSAMBAVYeOCICjgENAQsBGaoBXzB1mgIKCCkrcYsBBAGXAlZpNDaDAW06jAHGAR48vQEVAYkBAxyQA0dgIGHlAQTkASObAd0BDpsBAb8BkQEWAwIslwIXFTGrC84SwASZAvoBuAFA+A2HD9wC4wGVCM8bswGyAs4TwAHkA5wFuxKqEwIZYwkCEEo8ClEgDAokKx4GAiQEDBpzHgEnCxQCEAIUEw4sMpIBB5oCBicCBWpMAQwMEEY1HA5uAgI5DhhGCUAdOG0VHjZOJxwiI0ebAQU5AwtfJQIEFRoRCwoCCQ9XFgVIHRACAwIGEAIDDQEJAQsGFSIWYQIvG1oUAgQIAgICEw0FDpsBXCRoApgBWQa5ARMeBjSiAXAGBArVARYHAjEIFyoqFg4GGAQCZRAQSiQqGiIKGiQRCALmAS4IawwkBAo6DhUCBQ89iAExBC0CAQyUAg4BBAEGJAYFD2UUBVVwDpEBBwYdAhwOSlU7BQgHBkYHAysKOQYDFRThARc2UXVhXzoCDgsTBAwXcwIIEiCFARQaE90x0UCMSL80vxnBEL8KlQuSD6M0oz2DOUY4ByQwSDIMApwBdAcB+gFBbAJBNd4BLQ4ZChs/hwEmIlexASZEnAE4wgEElgEGEgqYAQ50DBkdSgkCTSZOYiVMFgEgIlZ0fAEiBGA72wNsN5QBiwFATQIMOUk6eBoOG0p2ZwMVBBwILoMBsAKCAl2TAUT9AYMBQwYeEVtbETEdCgceXDmFATLLAZ0BMh8/CA4xMBIjYGIaNHaAASUlShgRAi4UjwG1CM4DFgECA6EB1C+PAcAzwBONNLQfuB/WB8wWjwGUB4cEpwMEwwFl3AIc7gKoBAaOChrPAgK8FY8B9QPyC5wFsxPRQOUcqUC9QuMILLUHZbkCTcgB4APEAakFLOECDoQElAHuCXLZBrcB0whyww+pMNASuAaQHOkDtAcHJZESWrUDzTy5Jq5H7gWSB9QBngrjGdUGBrYNlwcNGkT7CvUFoQUn0ASfDQjwAr4DywKtAhI6hgTPAQK6C/IBAgsHAgECnAgCB60EAQuTApsCkALLA9QCYCKiA68DkwL8AQIB1wKlApgEwgcBDAEBtgEFtwHvBD/eAZEEBnmeAwIEcgL/CoYBHsQBKi44gwGJAUYpjwGXAYsCATCdAQIeFgQKGAlsExdfHIoBAiR2N8YBE0IcKhxkdEAJBBscMQEXCgIDAgQQYM8BE1AiIpgBMB9eImc4vAFyCCBQNW434QE81AGDAQiZAWTgAWw8NQm6ARAIAhgWOlQ2JFAcQT8BGzlI+AFiImUUQwEBA3w6JkQ1AjiEAQH/AZ4BKjkqCD4xESPUAT0VOhEbe6kBYlDGOc80qRnoDZgCgQaeCq4HAQEEqgO8K4YrrgP/B98C5wxVQ5UJ2hHzFIYOpAHUAtICKbEEzgFEoAEXXxywAXY3xgG3AWTcARwyFwoCyAITciKYATB9Ip8BvAHqATVu1ALUAYsBmQHEAtID2gF0XdgEvAGBATomeTqFAf8BngGNAQg+MREjkQJgG9YD+jbVD40PAf8FgyY2zQGxDMMF8gZMvRuCA3KUCm/wAwKeAR0PqgG1NMc5tRgMuA3CBsYH6wy6CcMWtwKjASXcAQpvnAX2AeEB9QZCHLUB/AflAsUIowGYB6EE/wo2gwYUpQuqHNQMmwXYB+MX2wLWA6wF/QvvAxYx5AeuA5ICD6Ed1wOZGsATlwNMzwePAQH3FYYBAeIEAgSQApsF4RgZ5x6BGqsZywaHQesypxUCE3EdAVsUVRseHU0SFQFIUwoEbikxEOkBiAIKFy5+UCc5FzQnJgYMGwGoAQhbGxwHAhI/hQECVxw8a0xqJQILAg4POwvBAZsBA0wBngE+MH2VASy8AQtahQE1ygEIPyoGRSEECwsSAmYIG3RHEAQONEugARqKAWIGAgJaJ+UBJyQ5Vjb3AvgBhAF2A0MBAQECAkowIyYHC8ABQCoNAwInXBqBAiDkATSRAgFfBwwIAfUBGsYBowHXAijBE0nyBMsWwQWHR/IYsg4EDgUBERMKAx0fAgwMBAMtBioUBQECBgICBAICCAgGFAwGCgIUBwUWAhEDAQQRHAMJCAYMAgMFCg4ICAoUAgUFLAQlAQEHAQUOAQsGBAIEChIEGggCAgIICBQFBAYBAwIKEgQCBAYZBi4EARoCARpAAwIWCwkCAQEBAQcFFAELAgglARUlDwwOGBICBgIIAQMFEgIEAgICBQwKOwQVDh4CCgkJAg8QBwcKCgMEBCIBDhQLBw0EBwgCCRACAwUMBwkBLgEEBAQCBBIGAgIBBwoCAgIFAQgCBgoCGAgEAgIcBQMFGwMDGwMCCyACCQgCDgwDEwsLGRICCAUIDggGBwEHBwICBgMeCwQCAgMNBAcaHQoGAQcECgYBBwYcAgEFAhADBAECCQICDgICCicUBiEbNgQKJgoDAgEBAQQZGQQICBISAgISBQQCCgYSFgIDFAICBBACAwUKDQgCBAQlCAEFBwEGBwMBAxoTAQoVEAICAggCAgIDAgoDEAkCCgYGBgYPBwoRBwoVAx0JAQgDAQsDIAMbEQwHDw0BAQsGFgIBGgIDDAgEBAgBGwcYTBABAQoEAgoJBgQEAgICBCIBEAMLUgICAQICDgQEDgoCAwEbAgQGAQ4KAgQGCBMLAgoCFC4CGQETCA4WDwQlCgYlBQkECAg3AgQSBxoECAgFAQMQNCwFDQIKAgYGBA4CEAIGBw0JAwEMAQYMBgMMCQIuCAIQBSoECxUGDAQGAnkRDhkCBwEDAQkFAQEGBAYGBgMFCgoIBgYEBBcUBAIFAQcSBAUBAwEHCgMHAQIhGgECAQgUBAgOBgsBDRQBAwYEAgIEDQkEBQEICAEBEAILBQIPAQUDIm8EAQEDBAQXFQgKBAQICAIWDgkBCAMkBwcGCQYHAQUCAwoJAgYEEAICDUMjDgYIAgoCAhECFwQDBwkFPQIDBQIGAi0mAR0ECQIUCgkOAwcVDRoTDQEJCDEQBgYGIT4TBRkEAQUKBAoIDBACAQ4CBg8OBgoFARACAgsDAgMdFgQDBRcDAgIEAgQSAwEkFgcHARUkBwIVIyMBDgcPEQEIGwIBAgUGBQQMBgYOAhACBAIKBAQIDQQJDgEFFwkUAwIGCgNOAQITChEJBQYSBxUIAgQCGAcUCyANAxkCAhcCAQgCBgMFBiACBgkhDxIiARIBBgMCDAQSEgYCBgICAgQdAwoIAgIBAQ4SBRMmAwkEAgQQBgcIAg8TAgYEBgMCEAQDEA8OAgIERA4CAggEIAMHAiYQEQMWAgIPAgEBAQsCBgUJBQEEAQ8CBAgFAQcCAgQIBwMGBgQFAocBacABKKEDAnXiA6UCERoZrwQ4BJcCvwYV2gTlBpoBwAkB+AGrAbgCBGZSLJwB3wHRAdIEFgIcVrwDVewBOE8CNhwFiwIukwODBLICAjNTQV8GEJUB8QFhQkscIh4IpAI9Bx8LIQRYQQgoNkcMWiJ1Bs0BGr8BFh8vPyEK1gUJDbsBdOgBCjg/AgIHpAE7SEgCbBIKIJECDJgBjAIBAgIviQGAA3SgA6ADFgK6ATmmAhRLFxkVdz8EQBnqI7wg7jvpGg4CkhRyjwymA7ICBBKAAswDkwKQBxxe0wEy1gcozRDBBLIBkAMGVG1mAtUCDOcBhQTuApcB4gOsBgH1EOkLyA3PDfIFBIAD/QOLFa0L7gncBR4BMAKSD9sBBgECyR+uAhbsNo8DaIIBuAaEApgCvASeAkIChwJz1QFj3gGOBQIKCHDcAZIBT5MDAuQDyQbHBhS6AvMFf5ECuAMWhhf6KecCgxiPASUMmARzBKsDAbcBAg7kAbYDtAEBuwcIFQEBCgECswW1Ap4BAdUFAYgCEQEzAQweAVBE0wMBmAMBB0UihAFBARcSFikBrAID6wEGSgNsYAHIBAF2HwEGDgEfAZYBAwIIAQQ5twIUAwQBTAkKEv8BuQnkC7QD1heyFfkBjDuZI9M7hQH9BP8MkR+RAnruDP8UHAwFIhhJAQITGDISJTgCwwESAgoCBRgBAgkCBAINlQEFBAsjCRQSBAMFYwUpCwQaHRsMAgEZFQEhGAEDDwEkDQQpFgsBBAMFAQcHAQ0RAQEDAQIBPAIBAQEGDwEHARYDE0kCBilDJgoOCw0FDwMKBgMFFwEBBQECJTQDMwIUAQEDAQEBAgIJEm8GAgIUHRMMAQcBLC0HAQFaBAgBAQIFAwEDBwIBBwcBAwcCAQctAwICAg0BARQGCDAqAQwiEAYzKAEGBwwCTQILHAcBLhQNCAICBAQGAgICBQwdAhQPCCoWBxETEgECBwMBAQEQRAgVBQgVPAEMDxcgBSY7KColBwMtISMbCDgaCgkMBVMGRRwCAQEDKgIaCCADFQQJBVgJAQMCCAwk/QEqCAMEAQEDAwYEAgEHAgIFAQMHBRIFJRAgBBAZICIxGAEBAQULAQEXDwEMGwECAQdCHggOAhYFAgEGAQgpAgpBF18BBQUCYXVRAgQMQD8WCAcBAwUnFhwMAhADBAMoARkFQwwSAT8MBBglCx0GBSYVAwEMA0EhAyICQAETAhIDO1pgBAQCAgMBAQEBAQUDIwEFAQUBAQEBEgQBBgUPARAGBAgQAgIVAQEBAgUCAiYsAQ9ZBAEBAgEBBghEbAwMGgpNBREiV2IGLxUgER8FCwEEHQMXFgUDAQEIGQkOAgUEAQEBGkcBdAQ1KAUCAQEIAgEBAgQBEgEQARAGAgEBDgEZiwENCA8pEx0CAT1oFwHgMkYBAgYCLgQDAR0pFAo0KSAsBRoaKAECAks2VAYCA3ABKAECNAoBCggcRQIIAmQBASAHNQcEGIIBCAEBCgMYAgIGAQIEBAIMQgYQEAIGEAQBATsEAQECGA8MaQQBAgISAQQvKAMBBBYBAQQEEB4MPgICBQEEGgdxBQEEAiIMAgMGAgIqBQMBBgQKAmgIAQY1CAoGAQMICgYBAwICHgEEARABAggIBicsAwUGAgICBjxhBQQCAhcEAwQEAgQCBgMFBCYDFwoBAQYcIwkaCAQEAhAmbgIHFggDARACAwIIGCsFAgQCAg4FBQIEAgIOBQECBjIWBAwCMgMBAhkUAQECAwpUBg4DAR8DOh0KAwQCBiwDARcGBAICFgJlCAIMAgEDCAoSBEYBAQIEAQEGCgYqFBIJAgQEJgIDAQQ8JAkwBwdADBIIDBgFBgQCBAI5AQYSCgkHBgMNBAYvAgQOMRQyAwEBfgMBAgICAQEMFA4CFAIOHBgQBwIIBA4wBgsBBBYHEgIIEB0CBgMBAQxXBQYuDAEbDgdcAxsDAQIedDgXDQyeASMBBgIQWAECBSIzAwEEAgQWFiQWHgIDCDwEBgEmEgUBBAYCEwkqPgQfC3YDBUAGGAIBBAoCAgECCAIKKAICAQEBAQIRBgQCCjAGAgQFAQUOATYDJQEBA2wJAQYECiICAQIGBhQCXgMBAQECBCYEAhAeKAYEDAJTCQcICQUDAQwkAwRBBQEEAgQQAi4DAjQJAQYBBAY0AQElCgECBAojBwECAgICBGgDAgECPQFMAwEEAwcGBgMuAgEBBAwBGAIPAwgGBjgaAwEEAgI6AQUCBgQ2BgICFgMCShFQjhLlBrQG1Q3XD7kIuwTaAdAcwSGSOUZA8gKDAc8BKaYCiwIwAZ0B5AEXXxyKASatAcYBVRwqgAG0AQ0bHDIXCsMBhwETUNwBzwGfAbwBFlwIcDVuN+EBPNQBgwEImQFk4AHuAeQB2gF0XZQBjAG4AmUUQwLfAXk6hAOeAY0BCD5CI3+SAU8RG4YDUKAIhA0eoRXGFe0ztg3GJ+cPogTGCpEWRbAL1RqoGKoFfwKZA8smpAHEAb0IwgTZDCKXAYsK3AwIpQgnhQuSDLAB3Q7yN8AKsgXEAqoFArABAvoEsRLWCaICtQPKAgTFAfACIAdZEQIfAmUPMxwEBhUoBBoEAgocCgIDBQwGFzgSGkc0YiI4IDcYekUyGgIEAwQBIA4VAgkCDTAnRjoPJAwkARQvFhYZFzYBGRQCCjgFQCQQCwIPlwE/DgoOIV4GFgY4CQQMDAotQgIGRAo9AQsKF0ITAwsLFxATGDcEAwECKAglHDsCDrcBBAEDBgMHBVYGCgc6La8BJx8IyAELAwECNokBVh4QHkUYrwFADQIKBgoUCj8KBwUfDQECAVsM7QEUBAYEAQIPAQEDHAQfDgIUCCpYbhgIGgo6JAFeEAMFBAISBRMBAw0CAhUddgIGFgQYAjahAXgoIgMBBAkYiQESFyEXUF5FKRkFBkpDQQoRMggZfAYPBQcBBgIDBAVJNQcRBwQBBAgSDwYKAgoPEAQPHghHNAFCbAoXE2YEAgQFDRQVEm8HSwIBIyECBwQEBgQVBJwBCmQEAxonEBMGBgEDCAoECJ8B1QmaBoIBvQIc+ALUCMcJYekE6wNr8wj7BbkCjTwBpQE2GyJ3+AFOngFCb3Zg0QEMGYMBQwFOxwGnASatATuLAUAcXDMwL4QBRUgKBMYCFJQByAF6A4UBTSmCAQsLW64BNzebAS9OOxAyWd4C2QFrPiyLAd0BUaoCMC5lKxQKRLQBswEaG1cCgAHZAdMCpQEZmAE/CoIBL7QBTSYITXyTARiHAbQCSPMCdwjJAU2gAVGjB7IBHDq7AucBdn09fr8BfPgBugECVcwCBtQEwQEegAOQAdYBSp4B+QGDBXb0A70Ef7ACR+0BmQMGgRD0BI0NoB7IAm6rCYoBKeUWjAHRGKUFGwRdsQG7AQIEArQBjQKuA+sBiAG0A8YBkgICIzm+ARxTT2oCazEaPwauAokBIr4BzQECBLABjQK+AzfaAgF4XKUB8wHjAbAEMwG+AZEB/gITKyydASq0A+EB3ATnAQGtAaMB9A/iFacYowvEDYAktQPMBQxrnQMIhA3gBL0WyALZBKwSng6hKtsXsgFgsRISpQebCrIFUgIBsAKLCdQGlQM1pAYiAQGBFsgENrUBhAEEAgKYAo4FxAHsA4AFHCUZCqwGnQoF2wECAYQBAeMTeKUGygEoAQGEAZ0BuAUEDJoS6gO+G5INCo0B0hUE/Q7PCL8EBqcDtREpxQHcFQT0CKYqixwGkRwKAgISLQIVDhgHDDZWrQGQATAgdwQEAgoKFiIkJmUEDziaAQI+RAoCCgUYAg8CSBAEBGEDGBIEFgIEKxEuBAwSEhICBSEGAQEGDAEeCFgBBxUECgYOVSMCMT0DK5YBDgICCg4CAhoEIgQBAQJMIBgFFEYMASoEAhMzQwICAQMqBQICHgIIBRMQBQIpPAIEAhYCBAICAgICGRQKE08iXUUVBBVYND4gHi1NCBkDAgICBlEMBgIIXigEAQMCCwweHDACFAMMCQICCAICNAICbIcBChUCKggSCgIKAyBZRgUBBwwXOiYuGAUPjAEKfgIEBBoRBCQDAQEJCwcECi4CRVYXKUsGDIIBCI8BSwoZCwknAQECAgIgLCIIBAMDAgIOAikSExwsMw4eBgIMAgcBBAYEAQsYNxYnTxoZAg5JAgICHU8CAgQCAxAKNgIFEgIoChkJKgQReEAKAk4CDQOGAQILCgQYH0kCVRYWBCcEBAQEHQQMFARvHjkCBQdwAQEBBwIEFRYBCQIEBDEMAnQ+CgoCBiYEECQZAQYHJLkikwFQQEDKAbAJKewK0gswEC72ApQEAowT5Dj0BesKAocOpgbmH60T5wakEdEIRp0X2AqHGocBHEBeZVPZAdMFJ4cBnAFleRyGASjCASTCAgI2LqQBOhMHFToGdRaZATIHGgG8AQ8rL6MBtwRjGl4hHly3AS4gdMEEJ2zoAglBcW6rByasAhsJwAFgBWixAoYBQBBMRwINPC2HA+cX1y3KC5EM8hiwK+AXtQHwI6IE1y/jL8kEKr0I5QfSAtkWiAQC2QElAgIDzQ+BAfMEYqMB6ww1/wOUIM0BphjYA4NBgyO9KqZEtwL5EKICkAEBkQICkAwCAgMB5gfjCDMCqwcC6ArIOcMBPAcCAQKcCAIHrQSfAiz/A8sD1AKiBAIOoQOPBALYAgaoFuEEjQKeAwIEZdgkrwUa+g0BjxgBvxMBlgLAAwIEErsT6AGHDZIHAfgL0wUBAQT9BMoIAgEQngWxBsMEqQHkAcABsBEEhwMBAVreHfQIjwymDu9LkRC8CQApHQENMgEMEQE2FFkgAQ8XGQE1GgGCAQFZAghrASgBQQEBbXUBHktpOAENBBAGAgcbP0MNDQICJhACQBgLKwEWAUsJCgEbASVkAQYfdgE2PHEZATsZAxkDJwERBwMCMwoCIwEBQWkIAQcFARocMhcKAQEDMxgOGAEDVhFEJQEMBgEjLAMfAx8BJwICBiNDAS8BDxclEAQMEAECIAFkIxcBEUVlARYUBEMBBwE/MAIzKEYCNQEwNC9NASsQDQQCBwMGEFYSOQE8JwICGwEEAwEGkgFkARtaDiwwAlhYBS4KlQEcMgFMFV4OCgIBCmkBLS8BKwMfRiImRU8BAUcbAVAOJQFKGgEEDwJBAQEBAgIKBWsBOQEVEAF4ARUkAiJhATICAT00Qw0IAToWAyMnAU0/AQc+ATABBwIHASICAQIBegItFSYGChcBHTEBEAEIEgERaQGUARRiAU+ADxSkDrkFhxXNBASVCbYBzQEcqyelFP0voh2aKccFoAScAosJyw3CFYIGlxSvA81IzUjsGM9ImjbyLLgSmAGPBNwf/TK8Nt0aAAEBAgYCBgICAgMECAICAQMCAQoBAwEFAQEBAgICAQEDAQQCAQMCAQEOAQwBAQMCAgYCBAQIBAIBAgEDAwMBAQEEAQEBAQICAwQBAQEBAQIEAQEBAwICAQMCAgICAgIBAgEBAgEDAQMBAQEDBAIBBQEBAgEEBAMBAgIDAgEHBgkCAQICAgMMAwEFAQIBAQICAQIBAwYBAQIBBwMKAQEBAQEEAQEMCAIDAQcCAQIBAQIGAgICBAICAQMBAQICAQEBBAECAQQBAQIBAgEBBQQIBAMCBgYCDAECAwcEAgQCAgEBAQIBAwUCAgQBAgUGBAIBBQMBAQQBAQECBgIBBgIDAQEFAQIDAQQDAgEBAwEGAQMKAgcBAQEBAgEBAQUGAQICAgIIAgEFAgIDAgIEAgUEAwEBAQoBAgICAgIKAQECBgICCAIEAhICAQIDAgECBQMCAgUDAgoEAwMCBAQCAQIBAgUBAQIBCAEFBwcBAgQCAQYCBwUCAgQBAQUBBQEBAQQEAgECAQEBBgYCAgEEBQEDAgMCBAQOAgIOAQMGAQICAQEBAgECAQEJAQICAQECAgIBAgIIAgMCAgEBAwECAQYBCwwHAQMECAUBAQkCAQEBAgECCQQGBAcEBAICAgMBBgIIAwQDAgICAwUCBAMBAgQBBgkBAQYCAgECBAIDAwIBAQQCAgIBAgEBAgQCAgMCAQICAgICAQECAwICAgICAwEEBAIBAQQHAQIBAQECBAcDBwQBDAUCAQEEBQQCAgUCBQEEAgIGAgEBAwEGAgQBBQECAQMBAwEEAQMCAwIDBQICAgQBAQIBAQEBAgMCAwIBAQEFAgEBAgQCAQECAQQBAgECAQIJAgQCAQMBAQYBAgQBAQEBAgYCAwIBBgEBAgMGAQcEAQECAwEEBAQCAQEBAgIDAgICBAQCAgQBAQMFBAEDAwEFAQEBAwUBAgIBAwMCAQcJBwgCAQMCAgICAgQCBAICBAICAgEBAQEBAQEBAQgEAgMCAwMBAQEBAQMHAwIBAQYCAgIBBgMBCwQBAgQCAgoDAgYBAQIBAQYBAQEBAQEEAgIGAgEBAQQBAgcDAgYCBwUCAgMEAgEHAwIDAQMGBQEBBwIBAQgDAwEBAQIDBgECBAIBAQQCAgEBAQECAQgCAwMEAQEBAQEBAQEEAQQDBAIEAQQCAgEDAQgCAgIDAwIBAQICAQIDAQIEAgUCAgQBBAIBAQECAQEEAgEBAgEBAQEEAgECAQEBBwEEAgcBAgIMBQMCBgsBAgEBAQMBAgEBAQYCBAIOAgYGCgEGAgICAgIBAQICAgICBgICAgICAQECAgICAgEBAgcJAgICAQECAgEBAQEEAgICAgEBAgQBAgIBAQECAwEEAQEBAgQEAQcCBQIMAgIBAQICCAUCAQICAQEBAwEBBAICAgICAQMCCQMRAgQEAgMCBAgCAQEBAwEBAgEDAgICAQECAQEGCAEHAQEEAQECAQEFAQoGAgsJBwECAQEBAQEBAQECAgEBAQQEBgQBAQIDAQEIAQEBBgMCAgMDAgIBAgMFBAcBAQEBAQgBAgICAgICDgIBAgICAgIEAgEDAgEBAgEIAQMDAgEBAgICBAEDAQEDAQIBAgUCAQECBQICAgEBAgICAQEBAQMBAgEBAgMBAgICAgQBAQEHAQIBAwECBQIEAgIGAgEIAQMEDAIBAgQCAQEBAgQBCgQEAwECAQYDBAoBAwIBAgIDAQIBAQIBBQEBAQEBAQMDAgEGAgYCAgEBAgICAgICBAICAgEBAQEBAgYEAQILAwICAQYDAwYBBAEBAgIBAQMCBAIEAQYBAwYBAQcBAQYBBgEDBgEBBwEBBAEBBAEIAgEEDwICAgIEBAEBAgIBAQYCAQgCAQECAQEGBhQBAQkEBAMBAQQBAwIBAQQFAQUBAQEBAQIBAgEBAg0EAQIBAgQBAgIBCAYDCAYCBgMBAQECAQEBAQMBAgIKAQQFAQEBAQECAgIBAwQBAQEDAgEFBQEBAQECAQEHAQEDAgQBAQICAQEEAgMDAQECAgEQBQEFAQIBAQgEBQMEAgECAQcDAwEEAwYEBAICBAIEAgIDBQEBAQECAwIEAgICAgIBAQQHBw4BAgIKAgMKAQMLAgUCCAIGIgEEAgEBAgMEAQMEAgMBAgIBAQYCAgICAQECAQICAgEBAwECAQUBBAcBBwEGAwECAQYDBAEBAwYDAgIBAwICBAIBAQMDBgECAgQFAQICBAIEAgMBAQMCBAQBBAQDAQIBAQEHBAMBAwMDAgEFAQECEgESBQICAgEBAgICBQIDAgEBBwwGAQQBAwMEAQICAgkFBgIEBAIBAQIEBAIEAgQIAQgFBAEBAQICAQEEAQIDAgUEAgMEAwIDAgEEAQECAgEDAwEBAgEBAQIBAgEBAQMBAQIBAgEBCgUCAgEBBQgDAgQBBwIEAgQCAQECAg0EEQQCAgQBAQYBAgMGAQEBBAEBAQIBAgICBQEBBAECCAgBAgUBAQMBAgICAQMCAgIEAgQCAQECBAIGAgICAgICAgICAgIEAgIFAQECAQYCAQIDAwMBDQQBAQMBAgIBAQICAgEBAgEJAwEBAwYIAQwBAgEIAQQCBAICAQQCAwICCQEDAgEBBQIDCgEEAgIBBgEBAgICAgIEBwIEAQIBAQEBAQcBBQMCAwICAgICAgIEAgEDAQECAQEDBgIFDgYKCgICBAQKBQQCAQEFAQEBAwECAgIEAQYLAwQCAgEHAgEIAQICAgEBAQEBBQEBAQEEAQEBBAIBAQIFAQEBAQECAwIBAgECAQIBAgECAgQEAgICAgICBgQBAgMBAgECBQEBAgECAgEEBAICBwUCAgMCAQMBAgMGAQIBAQEDAwIBAQEBBQEBAQIBAgQDAgUBAgIFAgEGBQICAwYGAwgDCgICAgIDAQEBAwINBwIBBAMBCgECBgQBBwUDAQIFAgEFAgICAgEBAgEBAwIDBgMGBQIBBQEDBgIBAQICBAQDAQ0GAgYBAQECAQIDBwIFAgICAwIBAQECAQIBAwEHBgMBAgMBAQIDAgYDCBsHARwDAg4GAgEBAgIDAQYCAgMBAgYBBwIIAQEEAQEDAgECAgMEAgEBBwECBgIBAgEBBQMIAgMCBAICAgIFAQICAgICAQEBCQICAwIGAQQEAQYBAgQBBQECBQIGAQYCAwECAgIGAQMFAQEBAQECAgIEAgICAgICBAICAQECAgECAwEDCQcBAQIGBAICBAQCCAICBAQGAgIBAQEBAQECAgQDAwMBAQIBAwIMAgEEAQELAgIDAQMDAwUCAwgGAwIEAQICAQEBAQEHAgEDAQUGAggEAgEEBQMEAQMBAgIDAgMFAQEBAgEBBgMBBgEBBAYDAgEDAQIBAQECAQMBAgYBAgEDAwIDAQEBAgECAQEBBQIBAQEBAwUCAQICAQQFAQEBAQEDAQMBAQIIAwECAwoBAwIDAwQCAgEFAQEBAgIBDgEDAgIBAQICAQEDAQICAQMEAQEBBAQCAgEDAQQIAQEBAQYEAgIGAgICAQEBAwcICQEBAgEBAgEIAgEBAgIDAgEFAwIBBwEBBgQDBgUBAQIFAwECAQEFBAEKAwUBAQEGAgECBAENAgICAQIIAgIBAQICAgIEAQECAQECAgEBAgMBAQEBAwEDAQQBAwEBAgQCAQMBAQEBAQQCBAICAQEEAgEDAgIBBAYEAgUBAgECAgEBBQEBAQIIAgECAgEMAQMCBgICAgICAgYBAQQCAQUDBgYCAgEDBQMBAQIDAQEBAgMEBAUEAgIEBgECAQICAwICBAIEAQEBCgIDAgIDAgMFAgIKBgEBAgEBCQMBAwIBAQIBAwEBAQEBAQEBAgIBAQMCAQUBAgEEAgIBAQEBARADBAcCAwIBAwEEAgUFAgEDBAIBAQIBBAIEBAEKAgEHAQEGAwMFAQQDBgUCAwEEAgIIBgEGAQEIAgIBCgUCAQEBAQEDAgIBAQEBAwMBAgEBCAIBAgEGAwMEAgICAgEBAwMCAQICAgEBAQgBAgIDAQEBAQEBAwECAgEBAQEFBgEIAg0EAgMEAwQDAQEDAQIHAwYBAQICAQEEAQIDAQIDAgICAQMCBAEGCQIEAQIBBwICAQMFAQMBAgEDAgEFAgEBAQIDBAEDAQIBAgMCAgIDAQIBAQEDAQEBAgYDAQMBAQMEAQEBAQICAgIEAQEBAQICAQEDAwIFBQEFBwECAgICAwEBEQICAgEBAQMBAQEBBAQCAgEBAgUBAQEBAQEBAwEDAgEBAQIDAgQCAwQCAgUBAgEBAQkGAQIBAQIBAgELAgQFAgIBAQEFAgICAgMBAQECAgQFAggBAgICAQIDAwECAQEBAgQCAQMBAQEBAwgGDAYCCQICAgEBAQEEAQEBAQQKBgYFAQECAwEBAQIEAgIBAQEDAQECAQQHAgICAgEBDAIHAQEBAQIDAQEGBAIGAQQCAQUHBAEEAQEBAgQCAgUKAQMCAQIBAQQCAgIDAQoBAQIBAgICAQEBAQEBAgEDAQMDAgIEBAMBCAIGBgECAgIDBAQDAgECAQECAgIBAQEBAQECAQEBAgMBBAIBAQ0IAgEBBwIGBAIBAQIBAgIEAgIEAQECAgIDAgQCBgIBAQIBAgQCAgkFAQYBAQELDwcCAwEBAQECAQ4FAgIBAwgBAQMDAgMDBgYCCQUEAwMEAgMEAQQHAwUCAwIEAgUDAgEGAgIFBQECAgIEAgUHAgIBAgMBCAMBAQEBAgECBAIEAQEBAQECCQEEAQQBAQQEBAgCAQEEAgMBAwICAQEBAQMBAwEEAQEBBAMCBAIEAwEFCAQFAQLsOZQPhiizEvIMkRzRSyJJAsQBkgH9BX0LAYQPuwjaDwrpBwL7BsYGAgGWBAIyCCDSOfEE8AwvBLQMXEcCAQ0CASvJAw4EDAQCCnMEJAM0C0wnBBtXHEOmAQIKLB0QLYABnwEDGCQRAgMm8gECYg7fAUUcECQKBwRrBEsBcR0MQCERAQc2MEgQAT8NJgICBgIEBxQWqwILdSRmNwxIDBoCPgI4OAIOEF8CPqcCVTYQLgcCV8EBDDgCAgJgUxwZAQE+Eg9PPCARfIABFAQUNgRQcwISeSs0MGFLkgEGZFggBkIfKQEtAg4LBApJFAOJAgkYVAoEBhoEAgMNBz8oZSYMH0sCzQEDBAEBAQIOAgEDExkYCyMmMAY/AQdeRxAHFQELAVkERGNAAhz2CsEC8gWxFssY5gLbDZoL5hH5Ef4ryB/6D5oJ3gKDBKIBqwHKAaYBBBCYFPQSzAOyB7gHzQ6SNJEWoAq5D8sGzwPsCK8i8xDgJOAS/CyiGIMDzAuXOtsBkTmWRMIB5SjNJtoDgi/gLK4D7TNQNgEEFAQBAwwHEAIFLhMKTBEKOwQoCwMlAyUFDRYLAyILBQcDJBECDDMdFRQDAgsHIEMHGhcYQwQUTiVrLgcGDRYBBgQCFH0TDAMZAQgXARAXDwZFBwcEDEEeAwIWAQkJBgklFRkLMTAlISUSAjIHJ2QTDDMCAxcCAx8KAg4LMhkKAQ4THkIIBAYCKAUBBAEBAgQbFwUhAg8XCgEBLQEKGBgGCy8kHi0iDwUIBAIrJSIiEAUjDFAEEgUWAxkYAQMCBiEDHAsXIwh0DQSaAQIPAxIKAiEMAhsHBwEiThgdD183GzYcJE0DBCAEFAEEBgIGEBAIHysBFjgnAxFIBQN6HxEMBAQUAhAKAgIBCjYGJX8YCAIIDCECEAESAxcJAywfO0oJDA8bCgwLA0AlMgECBwshCiABGRIoFRIXHzYgBj8TCAMCDBAFLQsBBU5JDxEDUAEzEAMjFQIEIwIDEhMeAgEECzA1Cg8DKCUBAxEKKBccAiIWBjQEBwMBAQUNChAOAQIHHQ5IFQIFBhFQGAUEIjQBJAJgAwMEDRYIPjEBCAgjHSEOBgoQJ0EsAwENPgEXCgcOBAIDCgInKxoNAgMFSAYgDggCDmAQQI492yzWP/E+rQYy/gjPGNsX6gPHBwWdQKIswyLxQZMd2BKFAQEexAGQAWoEjQIQswHuAjHhAaABF3uAATB2N0WBAUEcVQVkJGYqGg4cMhcKAQHIAhNQChgKGJgBrQELF58BvAF6pQFuggIKDDwsqAEkZ2cyJZ8CsQMhS48BdCsy3AFhCY4B6AEVcVM6HAoKVBs6hQGdAx1wCD4xDAUjnwJSGxBrH7wCqgPbFwIGFwwSBAUCBwEMEwIVAQYCDAQEAQIDEQ4EFANQAgkhAQcBBAQGAQoBEwwFCA8CBgcDBQQbBQcRCwUCORMLAjkaCgQDARAKUAECAhgMARcEGQwKDQIDLgIWEQULBAYKCgMHAhICGQ4GAQMGDAEJAQEIHhIKBAYiKAQICAQCFRsBBAIGBQYEBgYCAgICBRAEBwcXHDUMAwI4BQUMAhQCDwgTAQMIAQ0DGggEAQMEBQILCAQOATkSBAEBCggGAgECAQQECAsJAgIJAwIKBxYBAQkMAgIGAgkBBBAHBwEDDAQbCwsRBgEJEQUJFQIBDwIUBDILNh0EGAICBAUIAgMBCQ8IAgESAgICAwESAgICAwITBAMBAgIEBAEPAQIEAQIBBQEBEQQCAgcCCQgbCgICAQMSBgoCEggDCyYKBQESHQEDAQECAQQZAgsECAIBAQECBwMIAwIGAQECBwEBBgkOAQQCAgEBAQUDAQEFBgwHEAILBwcFAgICAgIEBAgCBhAJDhcIDAgJDQgeAgYGBwEFAQsKBgEFBgICAgIQEAIBIA0OAg8DDgIPAx0BAQUGAwUBAQEBAgEEBxM0DAESBQIFDwMOFAgCAgEBAgcEAxERCRABASIDDAgaHQYBEgkFCAICBAMCEAEEAwYCBiIdHAMwGAUHAgIEBgMNAgMjDxYDBAEBDg8CTQMsAgIEAQ0SEAY2AycCBQkECw0OBA0JDRIHDAMQBAQbAgQCAgIBAQIEAgYHEh0MEAIBAQQEAgIIGAwGBCIDAgICCBQQFA0LBQIGAQINCwINBAINDAwOAxEKAgEDAgIBUQ4CCgERDA4CAgEDEwIBAQMBDAEEBw4BDQQEBwsDAwIEAgJGCAoCDwk3HAMBAQEJAQgIAgMHCgYFJQMDEAkJEw4CBgICAQMCCgUCAQIBBAkBAQIEAgMBEQkCBAECBy8BBQMYBAIKAQEGBAEBBBECEAoQBwEDIgYOAgIFCQMBAQ0WEQQJAgIHCwgNBAIEAgEFCAQDAQIGJAgBAQIBCQYJBQgSAxACBQoDBA0UEAEaIg0DDC8CAgEBBAkBBBIXFAIEIRhPAgINBgEHAgEEIRwBAwIBAggHBwMDCwECHxEHAgsJAgIGAQICAQsBAwEEBAQEAwQBBAQBBwEBBwEEAgQECAgRAxAEDAEEAQoGBAgBAQECAQIDRxsEAwQGBAQPCgwCBggBAhsBAgUBARMFBSYZAwYBEgICAQgBBQICCgYDBwgBOigHGQMDBR0RCwEDFggEBQEJCwIVBAIpARICAgEVAQcDAQEFCQICAQYCBAoDCxMFAh8FBAcaAhUGCgUXAgEBCBkEAwkHAw0BBgEJEw0DBgMFBAQlCAkCBAIDEAQDCQcKCAEDAQwCGAICAwcBBQYGAhUiEwUNAw8CAwIxBREPCggCAQECAhAMBAIEAQgMAgICAQIEMQICAQEBAQEBBgEBAQEBAQEBAQICAQIBAQwBAQEBAQgHAQ0CCAwkAgMEJQIECwIBBgQLDQIBAg8NEAYCBAQKBAgJCAIBCwYQAg0CCAoBzDKrC41MQTQICoACGNQBW6UBoAHcAwR0FWKxAViEAQIobvgBZBw8BwNehAE4BgaAAUI8SGQjGt4BcAEBewYCBR6vAaACbj0BbpgBAbwBDjRUBMUBjAECAQGeATcCCgJkZm7MApUBaTICKTYCVgICBowBuwLBAQIQbjbXAYgBLgGHAgED7gECRS8DFJMBRgQBAQShARAZE7EBZFxS7havGb5LhwEc0AP+BsEPwwuaHp8E2jrqLA7zGjz4LP0kuQwGixH5BVfyH/wTxzgGiwgWwwWLE84S2DaHAZICCLgCmwECRwJnAtUBqAHEAnB0ILABdg7gAjkDAgsxME55G0QbgQHkAZQBVAY+NJsBbTAdjgM0pwFgLwZIBCQSEAKMAUB7pQHhAWI7IdEEpQFcqAN+RhtXKZQBJ4oB3wFstgFjM/YBdq0BMBUXf5Yy0ALcAZUp3Ap9AQGGA3QXAVbdET2mB4wDBgLRAdoB5gkB7wMC0wEGBigMLMMDgwF87T//KAHyGK0Z8A28G8MBEQExAgFaAVO6A0NfAgHYAcMBPCUETQRTGAG+ATcBHoQB0QEBA58CHCwXYz5eJAIEFQF1c9cBBA4xGN4BAbABHp8BAbsBcm4/GlICNwGRAY0BQo4BhwFknQHeAdQBoQIrAoIBEWsyOn0CAQEErgJmLk6MAVkPNzRFAQZ6mAHJAQE9rAECAkMMOy8X2QFPbN0BvwFSdQEB/g2OA+oZAu4IyDuUF9MqtguhGb4UmgMa1wi2CegEiwHzBukF6hjQB/FHzUjoLOQfpwKaFPsEhymnAfcCuAieAu0HggbFAwwCAgICpAMKLPoL7AQUBIcBlw1TKIYDCgYMMa0CiQGOAjogYiAH6wMCGy5XcM0CP5oBMzQJOp4BHBgUEVUgCiAoJjYEAgKJAVcCBDinARICcyISFIoBBv8CGo8BAhkaAhoEEwKvAQg2AjCaAhAKKgKMAUJ7H38eNpsBAltcGUY+DIUDJRRaYywQ2QMXapUBTx0KMAQODYABSm8yEhpBXxWOAUMULAIXP+4BPWAmGywYnAFC7wvZD8YDtQPRJLwL1jypAd5F3iICApsT1gW+CaYDmwKQE7Mp2yMCigpSkQ/bAeofkATeAbY98ym6MvIYqwuHAaEM/gHwH2EehwoSBMIw2hIC4AgMBJwBxBPZGfMBnQICyAz0AwKTCXSxAs4OCKgdHKZHzBvqA98/kwHXBLYTswu+CqgEAe0UH3uwSewtJZADvzG5EgK9GugHpwQCmgIihAiPBHJkiRvrStY8uQ/SNadDvwQmYQgEBAQEBIMIBgIBAwcHBAUTAQECCGmpAhcaAlcyjgb6BRQBAQECAgICKKEExwf0A8AEmwMlIwICBgQBGT0EmQ8WAQIDEwkBBI8EDB9SnwPVGgEBujMCBgE0ASVDBo0BQh0OAwUUEk5cGo4DEQoMOgE+UxoCBBICCgIEAQMGPgZKzQFcDSADEwZoGwEPCwkdPgwBqAEwyAEGKAMSChI6CwUYUSMCwQEaFjQEKiMMCGcJD0MPvAEG0QEtLRsBGqIBlwKNAQEosAFqsgEITQIBHRcPOjkPGAICAoIBPBwCOBONAawBHA4aPwICASUcJAQCGg5ZASIGDgICEzYLCwYGFKUBfnI4IwEEAgQO6gIPEBsEDEkCcn4KcV4QHCE0CQMQAbsBBQQCAQEFBgTCASgFHHsFCmcBFasBVyTGAcoBAi4EyjjTO+kz6TOGCgSpF78L5Q+2AwTyLNM7pkT8Mac9ug7nD+ELVe4GwAOtE9gNAuMX2TPcF9s5BRUC6BiNMY1FAgABAwEHBw8HAgYPBgEIAQYNBwMICgQCAQEIBBABAQEBAQYaAQQCCAICAQIXBwIBBAECAQQICgQEAgIIAgIBAQEFAwIDCAQKCAICAQEGAgICDAYGAgsHEgwBBwYBBAoDDQUCBQEBAQEDAQMEBAQBAwQGEgUCEQIBDQ8GAwICAgQCAQkGEgsDBAUIBwEKBgMBAwEFEgEBAQEEBQMBAw8MAgQEARUIARACBAYMAQIJAQMBAQECAhQKAggCAQMBAQEQASEBBgIFCA8NAQQCAQUIAgEFAwgIBgEGAwEoAgEBCgIBAQEKDQEBAQECDgICDQ8QDwQCBSMJAgIGAhQaCRQBBwgBAQYCAgIBAgIEDAICAgICBAECAgYCDAIIBQUTBgkHAgIBAQEBAQ0DAQQDBB4CAwEOBAEOFQIIAgEBBQIHAwUKAgICDAYZCgELAhIZBAECAgIBAgICBAYCBAIFBAMIBQMEBAEBCgIOBgUCBAgBAwECAgQCBAQEAgIBAQIBAQMDEgMBBgEDAggCDA4GAgIJAgIDAgILBgUFAQEDAQICFQYBAQ4KDhEBAQgQGQYFARIDAQQCAgQCBA4BAQIUBBYKAQQECAQMGhIBBggNAgIBAgECBQEIBAUBAQIHAwMCAQYDAhoDBQEKAgICAgEDBQEKAgICAgEDBAgBCwEBBAICAgMBBAQCBgEFAQECAQIFDgEHCA0DAQMPCwIHBQMBAQwFCAkPEAEIAQEBAwERAQICAQEDAgMCBAIEAQEDAQIDCAEECgIBAQEBAQEGBAEBBAEBAgICAQEBBAIECQUBCw0DAwEBBAQCAgIEBwECAQEECAMBAgICAQEMAgECAgQBAQECBwYJAQEEAQIBEAEBAQEBAQICAwUCAQEGAgYEBgQCAgYCAgIGDwEHAQQCAgQCAQIBBAgQAgYBAQENBgEBAgEHBwECAgQHAQEDDAEBAgEBCAIBBQ0SAQEEBgIEAgICAQ8BBQMCHgIHBAQCAQMGAQERAgMBAwYBARECAwEBAwECCAgUCwEFBAMCCwICAgIEBAICBA0IBAIKAQkBFgMCBgEGAQEFAQIWBwIIBwEBAQECBgYBAQIKBAIBBAsBAQIEBAYCAQEBAwEBBAMPAwIBAQEdAQEOBQMBEgYHBAYCAQECBwsTAgIBCQICAQECBAQCBAEBDgQCBQQCBAcFDRcCAgUBMwERAwECAQECAgIEAggCAgQCAQUDCwYBDAYBEAgCCQIBAgQBAQICAQgSAg8CBgYDAQoLCgUFAQMCARUWAgIDAQMPAQsBAwQSAwQBAggBGQIBAgEDARkFAw4CBQEBECkMGgICAgICAgIIAgwCAgICBAICAgoKAQsJAgUEAwcBBAcBAgwGAgQEBAkGAQYCAQEEBAICBAIGBAQKAQ8EAwgKBgQIEQELAQEBAwECAwMIAQICAgICCwEBCQUCBQICAgQCAQEEAgQEBAIBBggFAQgDAQkBAQ4YAwEPAQEEAgEBBAIBGAwPBAoMBA4BBwcDBgcFBgMNAQEKAg8EBAYDBBkIAgwDAQQEAgYCBAQBCwcGAQEIGAQLBgICBAMBAwcCBw1EBAEBAQQSCgQJBQsBAgICAwEKBgMLAgEBCgEBAQMLAQEKAQEBAwMDAgMEAwgBBwEBAQEDAQMBAQMCAwEBAgMDBQYCBwEEBQEFAQILAwIECgYBAUoKAwEIBAQGBwsGAgIEBgEEDwMBAQYDBAYPBQUBDg4CAQENARYMCQMKBAICBAEVAgMEAg4GBAEDARwGDQIEBgQMBgQIAgIKAQIBAQIEBAgIAgIIBAMBBQICAwYBBgIGAgEHAgEBAgIKBAEEAQgOBgcDAgIEAgIKBhcMBwYEAgMLBwgIEQENAwQCBQ8CDwILAgMEBwEBGAMJHBcrAQgCIAEDAQoLBAIBAgMCCQYOAQQECgcCAQYCDQENBAIIBQMBAQEEAQECBAQHAwUPAgIEBgICDgEBAQQGBAIDAgcBAgIFAQ0CHwEBAQEBAQgIAQcaAQEJAggBBQELBwMGAgMEBAIEARAMAgIIBQMGAwEMCAIFBwIBAQQBAgIGAQEBEgoJDAMEExABAQYCAQECAhEBEwgCAwMDAwEEEQUKDQEGAwEDAgUIAgEDAQUFCwEICAMBBgIDEQQCAgEBCAICAQIECQEBBQoCEQcLFQMEAQEBAwMJBgEDBAcHAgICIgsGAwEGAQUNAwQHAxACBQEIAgICAwEGBAsCAS8CARQCAwMECAEDDhACAQEBBggCAgQEDAENBAQBAQYBAgMEGQIBBQUPBAECAQMCARcCBAYBAgICBAEFAQEBCgIBAQEDBAoCBQYCAgEBAggBAg8HBQkEAwEGCQIBERADAgQPARoDDAMBBQIGAgcBAQECAgIJAwQGAQ4FAwMCAgcDBAIEAwwCDwMCAg0BAgQCAgICAgEEAw0CAgIBAgQIAQEBAwIEBAQCAgECAhkCFAMBFQIBAQIBAQJACAQGDQkEAwkEAQsGAgIDAQIJBAECAQgYEAYCAgIEAhQIAQEBBwIDAQwBBAQNDAQCAgoBrSLBE+YIogSpAo8EBDK7C+YZAhoHQLQHAdcLMowBBCAC8ARQyAKgBsQQnwUwmwSGAkjSARKYFtsDiQW5AQKNA5IZuD7eCQIIyUsERQY3ARwBAgISEAINCoUBGw4GHEAFAwQySrIBBhcBKAQTCCLUAQIBAQoCAx0ZFQQdCZMBAQEKBxAGCAEGZQkIBBoDDRMWAwMHATMGQyICFwUOFDcBBRYBgwEMHAQBAwJUCg4FNQIdCgIJAwMGAQsYFgRIAjkDGwEbGwoUAwUDCAgGORICAQNQMi8IBRkCGwECBykXCQEBASJQCBA2CgEBAgIOAgo4IQQBAQoCBgMiHgwBHwMfAwIBAz0QBAYhGi0DA1QOBg4CAQEiWwgQKwEBBgYEAgECIAIpEDoRBQoCAgIEBAIINAURAQEGAQIeIQgnLgYBBQoQTzQDBV4WGE0DBAMdBBMBCQQGGAIGDAlSBQQwATU2GAUDTTwOAhcBARwEGAgIAwcQBEYUagE2BgsGEwgCNQgBQQg3kwEXAwgIHgQOCE4jBhgLHDgFDwEDAiYEDSABBQIIJAwBARo2CUACBCMPA74BAV8QBBABLxgEBhQBCgYDCgI2AQEBAmYGAwIMFiMBAwwEEgFsAgszBAMGAgQCEgICAiIKChgQARkYQgsFE2YDDQETLAZJAgUKAgICBgIeEkABBw0bFjEHChcMUicnAiARASoFCQUBFAsNGQYBEwMCDAgCARUKCAICCiYEFAIEARsuCAQqBBACFAIDAhgiEgIBAwkEPQIMAaMCqzOHARzJAjbSAqkClALgARwxmwUEugKwAeoBIccEBgTjAfcD9QTPBYwGkAKfAQPzCMAHvz65IgABAQMCAggCAgMIBwoMAgEGAQECAgoEBAgEBwEOAQQBAQICAgICAgQCBgMBAQICBAQCCA4BAwUIAQkLAgUHAgIGBAEGAQsCBAEEAQIBAQMFAggDAgIRAQIBCAECAQECBgYEAQkJAggKBQgIAQcBBQoBBQoCBgQCBgMCAQEBAgcCAQEBAQIBAQIBAgEBAwEBBAUBAgQCAgIBAQEBAgYDAQQBAQEDAgICBAQQBwECAgEFAgEBAgIECgEFAQcGBQIBBQEHAwECBAYGBAUBAQIBAQkGAgYGAgYBAQUKAwIDAwECAQQHARQIAQEBAgUDBAICAQEGBQUCBQIBAQICAwMCFgYEAggHAQcCCQYHDgYDAgMBBAYTAgkCAwMWAgECAQUFAgECBwcCAgEPAwIBAQEIAQYNAQECAgIGAQIEARACAQECAQEBBAcBEAIKCAYGAQECBQECAgICAggCAgEBCgEBCwMCDQYDBAICCggEAgQDAQEHBQsCAgMHAQYCAgIFAgEDAgICAgICAgEBAgICAgEEAQEEAg4BAwICBAYKBAIOBAoCAQIBAwsBBgoGBwICBAQGAQIGAggDCQIBAQEHAQECBAQBAQEDAQEEAgICCAIDCwUSBgECAwIRAgQBAwIBBgMCAgkBCwICBAMBBAECAQMBBAMFAwMDAQEBAgMBGQkCAwcPCwMCAgQJAgEBAgIEAgQCAgQCAgEBAgEBAQIKCQIBAgcEAgECBAIBEgIBAgIDAgEBAQEBAQUHAQICAQQDDAMCAgMCAQEBAgECAQIPAgUCAQUKBwIFAQMBBwMCAgMBAQ0BAQUCAgUCAwEDAQYUAQMJAQEECgEFAQEFBAQCAQIFBwIEBAILBAIBAQwBAgIGBAMECgYEAgEDBggKAgQGBBQGBAQCAwkCAgECAgQBBAIEAgEBAgMBAgEBBQICCAkDBgICAgQCAgICAQIBBgICAgQCAgICAQIRBAQBAgMBAQMCAgECAgQBAQIEAQIDAQECAQcBFAEEAgoDAgMFCQcGAgEBCQIBAQIBAgUMEgQGAg4DAwMGBQsCAgMHAQEBAwECBQEDAQMDEAIHCQEBBgUBAQIBAgEBBBUBBQwMAQIBBAoJBQIBAQEFAQMBBAIBAQICAgICAQYBAQMDAgICAQEBBQQGBQMBAQYCAQIBAgIECQEBBwICAgMEAgIDBQICCAICAgQEAgUBDAECAQIFAgYIAQEBAgICAgIDBQQGAQoBBAQKAQEBAwYGAgQBAwQEBAEFBAIBAQMBAgQEAgICAgICBwICBgcBAQECAgIGAQMCAQIIBgIBAgUBAQMCCQMCBwEFAQEDAQIEAQQBAQQFCgICAgIDBAQFCgICAgIDBAIDAQIIAgECEQQCBggDBwYJAwIBAQIBBAEBAgULBgMCAQICAQMBAgECBAECAQEBBgsBAgICCQ4CAgwJCgIFAgEBAwEBAQECAwEBAQECAQIBAQIBAgEBAwIBAwEBAwEBAgEDAQUDAgQBCgEIAQEBAQEDAQICAgYCAxsNAgIHAQIBAQoFDBABAwcBBAYEAQMKAQIECQMBAQIFAQECAQQIDAsBAQICFQEFBBICCAIMKA4DBAkCAQEGAgEBAgEDAgIDAgoGAgEBBAEBAgQBAwIBBgQEAgIBAwQEAgQBAQIEAQEBBAIGAggBAgMBAgETAQEBAwQBBAQHCgQBAQICCQMBAwIHAwYCAgEJCgIFAQIHBQIDBgQCAQMEAQcEAgICEQEJEwQDFhcHAwEBAgoHBgECAgQEAQEBAQICCAIGBA0XAgIBAQQIAQMHAgIDBQkCDyMHAQgDAQMCAgEFAwQCCgQDAQECBAEBAQEFAgEBAgEDAwECBAICAgEFAQMCBQEBAQEGAQIFAQEDFQ4CAgIKBQEBAwEBAwIDAQIFCQQBAwUDAgELAgECAQIGAQECAwMGAQUCBgoCAw0BAgMFAQYBDQUCDwQQAgUBAQQCAQECAgIBCAYBBAMCAgIGAQMQAwEHBQQCAQUDAwIGBAcBAgkFCwIBAQEBBwIBAgIQBQcCAQMCAQEBAQEBAgQBBgYJBA4KCQIGAgQEAwEDAgMFAgUCAQYCARIFBAMDFQMBBQEBAgEBAQUGBwcHBAECBAMMAwIEBAYKAwEGBA4KBQEBAQERBBAEAwMDBQQGAgYDAgEBAQMBBAUBAQgBAgECBQMBAgQCBAELAwkBBQQBAQUDAwQCAQEBAQEDAwIICQsEAwEDBgECAgMDAggFAQQCAwYHBgoCBggCBwEBAwEGBA4BBgQNAgECAwYFBAEBBwEDAQIBDAcCAQsBBAEBBAYCAgQFAQICBAECAQECBwICAwQECAQHAwQCAgcIAQMBAwQBAgQBBg0BBQECAQIDAQMBAwIBAgEBBgMXAQECAgQEBgICAgUEAgMEAgICAgEDAggCBQUEAQECBAEMAgUBAQECAwIDAggEBwECAQEBAwMCAgMBAgoBAQIDAQELAwELCQICBQEBAgEBDwIBAgQDAQEBAwUUCAIHCAMBAwQDAQUPAwMBBAQIAgIBBgQBAQQCBAcHAwIJDggFAgEDAQYIBg0BAQUICgYCAgQLDxkCCQwEAgoBEQIGAg4EAgMDAgEFAwMHBAIBBAUBAgIBAQMDBQIBBAECCQICEg8BAgEBAQQCAgQCAQEGAgICAwQIBgUCBAQGAwMEAQQCBAICAgMKAgIGDQEDFAEFAwEBAQEBAQIDCwIGBwcDBAUFAgEFAgMIAQIBCQMJAgMEBAMBBQEEBggEAw4CCAEEAwEPAgQBAQIKAQEBAQUCCgcFEQEBBwMOAQUMAQIEAgECBwEGBAEBDAELCAYCBAYCBAcCAwMNAgEGAgYBAQICAgQHBQECAgEFAwUCAgMDAgICAQEGAQEBBwgCAQICAgIBAQICBgkBBAICAgEBBAIGCAMBAwECAwEEAgQGCgECAQMBBgYGAgEFAwMCAgEDAgECAQIPCAMBDAIBEQcKAwQDAQIBAQYBBgMEAgIGAgIBBAcEFwYCAgQKDQIBAQYCAQEBBAIFEQkCCQQHBgICAQEEBgQPAwEJBQIOAgMCBAIBAQEEAwEFAQEBCQIDAQYBAwIEBBMBAgMDAgQGAwMDBQMGAgUIDAIGAQgCBgIKCgYHEgMCAgECAQMCBgICBAUBCAMDBAQBBQYEAgECAwEIAggGAQEtBgECAQQCBAcJBAIHAgEEBQEGAwcEBQkFAQUCBwICAgEFCAICBwMKAgECAgEIAQIBAQEBAgIEAQECAQEDBgICBgICAgIBAgICAQMBAQICBAMEEQECAQcCGAQDAgsMAQgGDAIHBwEaAwQDBAEEBQ0DCgYBAQICAwkBBAYBBAECAQIDBgMCAwISCAQGAgwGAgQDCgEKBQEHCBADARkGCwJjnA3cCc4KjQ70AqgG5QS+AQrmCoUWnxeMNekW8wzKNeUXkRyyC6sCmA8ZDgEeChAnEicEBIkBGD09P9gBZykkMy1HDw4BEQo0FyQVMQJLMgwGeiYGHxIBNDMPHRsPBEEhDAgERmECLzMgCyDQAaQBAwqwARw1DRcDKgsDDCcCHxQWJR8BGzERKRIIMxQBIhsNkQECUB4KiAEEDgdBOBx7OQGUAZgBDxwqBEEMTUZrPiICBgInAyjMAfkBUwcMStMCEwENLQ00VDVLEANQTxS2AQxBCwRSWoIBAQEiGjUVExtXhAEEKGMEjQG0AbwBVxcljQEPMwE9tQJeEwQcDgJiZxYGCgobPAJy3QXxBa0I7AK2BY8X4AJeBFmNCKYChgjZF4Qo3ArCAxwGhwGtAvEG2AOwAgUBCEGbAtUMBAgB2wEDwgG/AbIGAgMBCwEDBsUBAgYCjgsMAhUHLwICFeMEDQUBhwL5AwEriQLtAYoBAQqdAQSOLJMduzPpIOInnis39xeyAwRGIp0Y8hjxOvsM0UUCmSOeKx79MoUB6TrGC94E/Aa7D4UB5wTgA70GxwT8Ad0EjgW+DpEBsxWBAQwS9wH9AcEGBLwThAfqEfQJggSHHQrjCQgBiAUEwQ8cPs4BngGXLKYCAgEBAQEEAsMOwxmGBYEFugqTJbQf6ie0AwPGCrACBghBhAvwAwhzaQECwgG/AbcGAQsBCccBCLELB6sFDQUBoQoBigEBpwEEzTzqLIAOAaUOzQ+eGtUTgAj/EPQshwHGDtoFwh6jB/4NAQgJDgQDFQECCREBBwoVBwgCAgEFAgQEAwIGAQQXAwIDGwEJBgEBEAgCBAIEBgQuBhoHDh4QAwQPBgICBAINAQMCFAQTAwITCggPBA8DKAQCDgoDCAgBCwEBAQIBAQEDAQEGBQIMAQYEFAMCCwICBAICCgoEDBgxPQ8eIA0GBgYCBAIgCgsOcQUCFAosDAIOCw8VBgICAgUGAggGAgICBxwCKAIDAiMIBB8MBQUHAQwJAQICAQsFAggCBAYEAQYmAwEIAQEGAQcCBhEOEggCBgQPFwELLgICBAYEBAQDBAQBAhAKAgIHARANCQIFBwMBBggTAwEBDgIDBRAEAgcHFgIDBA0DAhYDCREDAwILAwoCDBQBAQQPCUIGDyQQAgsFBgUOIAgEEAgECRsCCgICAgICAgQBAgICAQIKBwQBAQYCAwMFAQkIEAoKBzMWCAIEAggQAQYBBAUFGhIEAgEBAgIRFQEBCgIRHQgCCgYEAwICAgIFBgIIBAcBAgICAgYEBAQLBwICAgIGAggEBgwIEiYGCwEICwQHARYKAwUDARUdAQMKAgILBA4ODAQIBgYfIgYGCyIBAgUFAgMKBwkBAQ0CGAQBCBgCGQIVCgwCAQMBAQUBCwIYAwICAgcKCwIFIAQCRg8GBAYYEAYEHwobBAMXBEwBDQICCQYHIAkHAgMJEwQIBwkCBiMVBhAsPhcgAiYCDwQNCgoBAQMRBQ4CBRECCBUEOiASAQoGDAYCAgoEAgQEAgIEBgICBAICAgQCAhMBAQ4DGQEIAgQKDioxRA4DBwsERg0bOAQGAgcBBQECBhAaBAICAgIEAgQCAwoNBwQCAgcFAgYGAgMPAw0DCgIGDAIGBx0ICAsHAwcKBQMLAQEyFR0MDQ4CIQQBBQQbBBAFDgsEAQgFKAwIIgICAgMBDAEDBgwIAxYJBAEBAgYCAgQHFggEBxoEAgsBBwwCBgwCBgQhAwwKDAIEAwMBBxgEBQQCBgMCAggCAwQKNQMDAQsCAgYHBwgCCAUIAwYEAgEZORQRFhQHAQMIATIWBQ0EAhEnDAIEARgVAhEuJg4BAgIFARACBAUQBQIEBAYKARAGAQgBBQIECAIEAgoEAgcFAgEBAgNHGA4MFBoZAQEIBAwOICsBCAIfARAGBCIOAQYBARMQAQYHAwECAQMBAwEDAw0IJxADCwEMFAQFAQEBAgIDAQkDBgINBAIBAQUECBACBwkICQkKAggOAgIBBwEBDiAWCggmIgIBBAUJDg8ZBgEDBAUIAggCAgIIDRUHBAo6AjECBAIEBAICBggCBA4CBAYQBBouMgIKBwIBAwIEBAMFCAEUAgIZIBMIAgICBAICAgcCBAYCBAk7LwIGAgYGBgsFBBgKCgIbEw0DBBMEBAwOBAYFAgMKDwsZBAYV6iwZwgL0A4oC0gEFsgPUCK8C/ASrAgoCAUq2AukGHwbNAvcB1AGqCgQC/wcR7C6tPtss9CzuJupHjwEEFf0CCGm1ARAElwQIMypGlQUCAwTdAqMBgAR/+gEikgKmCRa1AoUB/wZO+wagBc4CvwinC5Yp/AkK5g+zAZkCApUKmgj4AkgSlAGMFZYg1CLsLp0ChBrwD+k6ApMBFJgBngxy7QEDxQG9Ajsb7AO5AQzGBK8BDBAIAgIg1AECAQG1BPMBngSnAVuuCSquBQXbAeIEvAX1BS8DAQECIO4I8QSVATkCAQYCDgbGDbUE4RsLDr0FAQ4BBwQECAsJBKEBpkHTEKoFAhnvE9If8w/MBewsijaHAe00H8s6okbpDvkImg2NTI1MmhAZkgoFjwfXDgLqCQUaywII9wH+C4UIEYwgvgMgJQiABpoBDPQKogEKBkJVbeEB8AI0FIMC7wHtA6kG/QK2A5ABtQueAXkvkwaFAfkEH8wBugMCqAQCDMYJugiYBFwGPbIMSFQGDpMBhATIAY8FwghX4BmOIM0PkReZI4gC5waYIIQ9tjb6A5YJpQaiBr4V3iLZEOYX9h+5E+EyWgwmDggBAgQBAQQKIRceBAICAgIREQICAgIGIQoBAlcBDDsgDSkOKA0VAQgJBAIbDgcDFQIKBAERDk8UKwoKEB1VDAgHCQ8qAwQGDAgCAgMNBhw8Exc6MQgJEAwPBAQEBwEMMAYWBEEWBg8WKgoBAhYCJQEPCgQCAiU/AgIEFgEECQERAgEFCgQ6CAQNAxIqHVoMQyYCIA0fMQIWEQYWBjEBAgoKCQMCGzAOBTwRAQEFDAYeAhgiAgECAQImDgI2GQICBAQMChkeCwoUKg0bIAwPBQUCBQERAwMqZyIdQhMREgsXByIDAhIQCCJGAgIGDB49BR0CCg4iDx8+FhQEAw0CCAQsBRkKKAIcATgqAgZSWRYQBkwEMRwKBAIEBBYIBAIDAwQGBw8EBgofGgIBFF8SBUIDFEwEBBM5DQoCDwkEBAYCAgoKCgYCAgIEAgQCBxq+ARICBAMODgMSKikXES0KXRYDFAI7RBkBEAIEFgEMDAEnAg0cAxwCBAwvAhQJCzMMChoOCiEcBgUGIkkiCQ4KVRkzPxMVAgsBCwwhBA0SBgUCAQ0CBAgGDAUBDAJbFQgJChgKNA4NQAcDBisJFxwCPyQcAgYDDD4UFQs9Dg8MLwQEAiFIBxIWHgQZChRtAgxABA0DMyIGAg4JDRcCAgICAkMIAQMEGRoSAjAPFgIgCgJAAjQQAgIS+zG7PJ4n8CO3KedDGdkBAgEKyAYZsgPqAQGiATAW3wHoAQIheBxIBAIGB0zbAg3KAgQrIAgTIqMBzQH+AyCCAecL7gEFqwGfAoYC+gLRAWtFB3N6P9wBAinnBJwBpgJ7pgjQG6QG9hLQEvgY0zuvC4JAlBnNJ8gFS7gHiQ7qMqEZpxjBEf0EiCW+MoI/zCyvBIoegRACAqsBBOcOAlcEAvUB7xjsS9hD3AX2AwKNBQL6C7sPAzgEjhL7DM08BlonJTkQQCaqARgEmwEGOAUFAQGFATxjHFoBAV8HnQEIigFJOwFmRb0BF4sBT5cBaDMcVQQDEzhnA5UBUAwNCgYKBwEnCNkBICw+BhwGsQGCAqYCCi0CCgEBAygQcb0CPUQ8BAjDAigSAQiEARyGAQQGewRSC8UDRRUnLUVcM3oBE3wNAQMbLIgCG1dyCEVsM78BGQQCGv8BD20EAQIH3wEVBSEICRGeAQhCZBMaZ0p6ISYhyEijASmXAcMU8AiUAZYH6gbqAeIFXZoHlgQDoAH3AaYB5QKBONk4pRmbBeQToSMC1SDVBP1HrBHPSJ8BxwHdGpAXyB/6PwICAqtItUL4PKsv2A0B6hQG5iOiBLAHjQSECJwBApADqAa4BCGWAYIBvwrnA+YDmwGQAwLACocDAboC1AbCB6UMuQy/BeQDnQfgF9oeAu4kKAaCAdAB1gECCwgXDQQBAaIBB18Ea1cdJ6MBEkoEJRMBBT0EFwgWkAGMARIPAxMFFwgoMzYCGQICAQuHAYkBLWQDCgEGAwQYBEEEAg0BFgUIMG9cGk6AAQoCCAYCAgIRHW2aA60CXRgKCf4BGqsBCAQCCOICBAgUAgKBAW8xYLkBAggILAlBd+MBYqQBRildVZ8CYgMjVQIS+AEEAQUDBVoVFgQYAgIXCAMBUmrHAQwmClIR2wEGxgF5BNECOQYCAg+kARYOkA+nAp0B6QfZAswMdugEHnupEATfCGvuBbwE1AGpBAbJOq06rC/fD8sG2w+wDKQG6S7cIh8TDhBBAgQPCgoYERkDFgEHAiMWAwkXBwFDFg9SBwIRFgICBCQGDgcWAQECCxcrBwkMFBQCHA0KChAdASwILgYHGF8iOhUBHBoMAQUGAgIEBw8VBgsCBhATBAQEAgYCLycDHw4EFCgSBCo+DAEVAQUEAgIsAhUfBAQKBgISCgUBFgsBHQoJCAQPAQIDAQwIRwIIBAkCAw01GFECBwIXLDECBREREAIKEAImAgoCAgQCAgkCARtDATshJAYXIAYBGw4CDAkFEREIAgISBQIECwIiKi8rCEAMCgIGHRQQAkMiIhU6Ag8SEQoICwFSFJQBSQQYCgIKBgICHhcWRxYKDhACIA0LAwJALBsXBCoCBlIxAg0ZCwYBBAkFKkoJDBwOBhYBAwgKAgIOAgIMAgIGChUkAgsGFk0SBR4GDxIJC0wBKSEHFwICDwYHBAYIBgoGBAYCAgIGBAIjAhI9OR8TEQECBAMcAxgHEAguEgUCAhYbJw86FBECAi9XGQkHAgQOAgYEBAMCBAkNBgUFAgIGAgILFQIFAwULEhYlAhQjARYNDAoFEQQTBVgYHGYKERQIAwUKBxsGAgEELg0BNgM4KAkCBBUKCwIECgIECAYMBgwCAQEFRQ8JDAgFARsKCikMGgI8AQUMBhoUFx4nGDAPDAwOEQgHCQEBAw0BCAIPWgcYDAcGBRoeDwQ8AgIkLg0BBwIECggWBAYqLgEWAQYUCgEBCAgCJA4+FiJADQEEAxkOCQ4EAgMIBg8OAg8WAh8BAQkCOQUCAhMXCgwGAhIUDQIGAhQKBhIaLRAciAIIcdwLcgwEBDwMBwcC8QJ+fRd7sgUgCIQEzAKvBIwBYQHqAwrQBfAClQECkAKFD/sB9wrYBAxEFI0LtBH0DNMBqhLPAtACAgSTBhGNAoED+QGzBLICBEdi2wIMqwMC8AZyrQEEtgL2ATvtCnUECAY/AgLoBQQM9AgIAgL3BQKTFAIC+AGzAgICBLkZtijBE/sR+RG1IsM+mTIF8RHeFQIU9wruGrVClxetBo8B9AIIBAQBARkBygEtAwEBWsECAgHUAowBugreAQoujgHvCaIDGLwH0AJHhgOLBhaCBfYBvAQEyQnJA+4RSD8MEAMCBA4OzAEVBREDLxIIBQECAQQKD00qDCkCDw4IPQoUX1gPAR8KNQQCDguNAUYIASEPB0FXJgYGBQsCFgYpLQYIDAIbBAwMDi8LIQscBSUqPRYCCyAGKggCPALlAQ4nEAIKEAIsCQoFAjwEBBEPAz8FBA8iKAwNBwMvBxYQCQ4TBgQGCgYOBgQRAQUEBgQIBB1GEgEBAQIBBQoECwIDERAuBBQSHlpICQJPAgEFAQsaDhkDDEEXZAsC7gEEBggEBgZOFQIOBAIEHERMC6IBDgxxSwQCCwoCBgoiRBkaW4cCAw8DLAoKBpQBSRQOBiQKfSSAARUGEgIODCkECmADDAUPGl4YFRQEKBAJDBoBCQQIAwMCAgMDNgoQCxEbMOsBIBo2EAgTCzo8gAFFHA82GAkbDkYiWR4EBFUECwYCFARINQQEBAQGEgcoHAY2IAcbMtIBBQO6ARUCJhEtcwUHiQI2nwwZ5gGXCucBrAPlAZ0CBAIGB7QDygIEAgKUCdUNygbBBEUHcwmwAe4GkyrcIZIMyCwOjiVzFEYEHdYCIz00BA0aBC4BA1EIAgoQsQQGBHI1XSoOqAECBgI0xgG5ATQBAw7XAQICAgICAiM5agIEAi4GygEiDCtkJwQYAgYEAi8CAgYEAknvAx402wEIc0ZCVFeTAiYBOCt9BQI7Agw7R00eaQICBwcCCgIDEnAMsAQOBBYMGwQCDgIIIfwCcYEDCk1gQwIMJXy5AX9gBIsBBmIDcW0CBqECKFwEAhWDAhCvIoZDEAw1CAQCAiYEYAICCAYCAg4CAgICKhIEAlYEMAEBAQEc2QENASMEAgkFKgIpBm0CCMcBBE0CAZcBBlECHG8BAgYFCU8CUY0BAhbAAQQWByADtAECCAYBAaABAgQWAgQOAiSSAYwDAngCAgICJk8CAgYzAgEJAWkEAQIFBAgHBQEBAgEBAQEEAQWVAQkGJP4BPwEFtAECVZEBBAIBB6kBCgEBAgICAgEBCgEBAQECAgEBNAQCsQEEAgTxAQJMvwEBAQEFhwG6AVcDjQEGBMwBAhoqAgICEBYCOwQCBC82wwEGFN0BBgMEAggcAjwMEwEUBAEVAQECAgEBHQIBSgQEU3QC6wEeaxBwAgE3YgMDMQIBAQSIAS8fA4kBAagBAhASAjxgAkICRRECAkZiAq0BCAFTAgUCAwEBW8wQ8i/rA9ga6QfMC8UI4h2qFOtDzBe4EOEH/QnrCZII0BvCCvwBhg7zD5YmDMsZuhWcBdkYDMUKjwIrwwEQzglenwf4AcsDQQrpAQKmA9UCUOMBmgH8AqMBEqQB8AgGBgpCkQKLCIkBPpUEAcYBXgQPAfQ2vwMKxQWlCLc61wYEBicPCQY2AgYKHBkDHwoKGUAFGzAvJRUGFB0EEBICMA0BAQIEBhALAwETEhEFBAMCAQ0EAgwOJxQKCgwEBhkFO4gBEiBNLG0JCg4CAgkGBAoOEi1OHhUICgQHATEGDjBJTsABBx0VFAgMCyUKIEQUBgIIBjQCAQJOAgICAhQCAgICLBAGAQEKYiIOhgEBAQI+ChEuAgICNxoDBwsDCAIVAycPCx8kFAI1pgEuXT4qHAYEAgIEAgQGBgFeHggeEwkCCzkvAjYkBBJMKTIiKjoQVyQhCCMGDAwIBIUBBgUPGgYGAgICGwgWChg4RwVOSBcHAQkBBQYObRAEIxATNFEcH2E/BwhXDBsiTwYGCQ8IAggCBh4QKQ0NBgQQAg8DEQEIHAYEJhQSEAQULAMHDggKDQMNFAICHB4CAggCBgwGFSINGwwEAggkdw4kAgwZEAILVgQMCwoBAQoIDAQOAygyETclFV4vDg0DMCMDDgRbAhQsCQQHAgQBBgkQAQ8RCgIGDgUCAyADDAIqDRIEHikcXhMUUAsmChIjGAgLDCgGBB4KEB0HEgIDAhAwDwoCBAkIAk4aBwoGAgYMAhYkBgYLCBcOBxUQAtU7AsoO3gapBOAFoALAAskBmQ7bAwf/Bu0MvAutAvkC9wjQDxbxCcgCugGhBChxDwUB1w4KfwL9AgQFBqIBJf0DAaUCggaYAQQIowQ7AgS/CwSwAS4UiQLUBeUGpgS/AqsBvSnsEv0zgAbzCNwG/Qu4Be0GkRoU4AICAQPXOzrIBKMGIaUBRKkFQY4CCgvBAQYGGHQcO6QDHSLAAccBowErAgKJAZMDmQEzUoEBiwGRAp0G0AItyQGLAbQBAogCmgEvJPUJlQMC7DYrmwIB4gOOAqIDxgSgA/cp6AibBYYoAbYIGP0CAgIJ6gTKAwJxjQMCEwoOAgIqAgIGpwIGgwEizwHzCVmNAgQORZYD0gbMAqECEjcGNhIGHrwBDSerBqEBBgqkAdkDQAQCzw+1A88InRb1E5o61QiUA7AX2gWPAfEosAGPAQEBBgE/BxQMAi4bDgSTAQEMFhYOBAQRvwEapgINMygGCwQGCgIoExQGAQMGDAEJCh4SCgQGCRkBAgQSAgoCAQMBAwY+ERYCAgIizgFcAy0TBgJuDgUBD04BGgYMARMSQRhanwEpCAIDARgIAhMEGAQHGgECCggLBAoBDgMEAgJGASICXWMCAggOARcCJwYEBAIoKwQGAnAPNQwBAQUBCQJEAgFzBqcBhAEbARovJDAdAgQItAJkASgCnAEUNxYbHT9CFAQINhYdFAMPcwEOPlQOAgoBER4BGAEBAQIBJiQECNABAQwICAIDBwoqcAIBAw0EAgcBGgEFAQkOIQECAwMYAgICCgwGRwEiFAICEhQuKxoEAgEBHxYDARgiEAIjFKsBAUcfAQEFBG8HCnFwIAEFAgEBDAIEDAkQFwwGHgIBAW4EHSkbARwKJhkDBgEUAwkFAgwGAwQD3gEwAYUBCQQBAwIBAQUKwgEXBBIcGRA9EQQFCgoDIwQzAQwIAW+VASICBE8CbzoDJANGIAI4hQ7JHsoOAQGhAUDCCQazAiozEASnApcDUhzBAwILIwRI8QIixgH1CQpaywJ6JhoDBq4DlgEBAQyCAVwn3gGSA9oBDAQBATxYBvQCzAOSAwlkAgKdA5EB1wEEPuMCCN4FngIG7QIzBBKVArEECAvUAhIBHi0GXZoDAasC1gEO/gSPAlUCLyfQAkHlA6cC7AaQAYcBhAGWA5wBcBi+CJABOIYoBAg0NbYCA50FvwEJWT0rAko1tgFgZggOkgHSAxxEMZsBngFhEQGiAkEqESKJBKcCecwCRBWAAUfkAZECCBS8AYACAowBHARCKA4GGAE7vgEhEIkCO2DgAgI4dvYBvgGOAnuUBOoBHqsPvxiaH58oggK+FbQD2Bgp1QFEfSeQAxwCCgQMBAJ+CQo40QIErQFHzQXwAiWtAQoDkAEzKgpo1AOCBUdoJYQCgwEgBmYrIJgBlwlJsAXEBU1chAEKgAVOlAOMDsUKwQ/QBQLgAogPxgMEAtoE/wKJAnK1AQIECAL9B5ABvQMiOQreAQQJ+Q7xAWV+lwE/wgMSuALOAYIHpgIpBdsBpQHMC5MJHOAEghbLE6oEzgMCzAOJBPAJnQO+A8UJgwG0ASrWAgEDU4kBngLpAbELogijAZwNDAQWqQICY6MEsgKHAQgE/gegBgLHEhTXA9gF6Uv8BcwZkyDzCY1Bgiof3RLSGrYN3RQcmAPcGwKYCtcJ6wbOCLkBqAIaTgQEcN8TiwGYAq8E2QiuBiphZrYB5gbeAfEJ1gbOC+w2ugbJIUTCEbsMgQO5AxSmKMwxyQiFAwKkAeYFvwLqAx6kB9kE6AK+CdAVzgvJCbkHqAGIA8kE9QQIApcLyAcWsQn8CboJtwEUdK0Q+gQK0QKpAq0GEMEBCK4EchZItAPGAQQMiAPMA+wDFQgEAYAD+QOyAT2EARzJAgj6AcQExgGGCFkBlgUIjgUKeB6aAQEBbQHVCAECAQEEAQEBBQ2yAQICAgIDuQH0AnIMUgUBBu4EBAQCBrsD9gYEDAEPAgIEAwMBAgH/AtQFmAEC4wICBgIE8wEBigabApABAgIDAgK9AgLrAgECBAcEjAULhgUHegEDAQsBAQEGApsBAgRhxCiQPI1FiRSFDP0hzAvhF+IdgBUa7BLKDwjrOtU75BoBARgOBREEBwEGAggCBhAWEAwGCQIIBQMEBAMOEQ4CCAgCAg0EAwIIBgwVDAQQBAYEDAcBIgMDDwQEAQQBBQ4CAgoECBUUDQQJBAcCBwUWBQECAgYCAQYCBAYDDhsKAwEHBgEEDwwIDw0KDgYECgYVAgUIAwQFAwIKBAMJBAIDAQIFBRwHAgEGCQUJAQwGBBgBEgYEAgUHAgUCCQ0CAwIBEAMZAQQtFxwEGQQCAxQXCgQcAQIOAQUCBwEBAgQCBwECBAICCwkFAgoHAxMMFBcMAgIGAgEBAw4GAwMSDDEDAQUGFAoBAQIIDQIIBiIEAwEBBAMCAgIEBAIGAgMWAQsCAgQFAQcJBwgDBwICAgQCBAgCAgUCEgwCEgsDBgMBDwEUCwQLAQEHAgYDAQEEARQQAgMXDgEMCAMLEAcDAQICAQ0DBwEBAQEBCQ4GAgEDDwMDAwMWBAQUBQMTBQIIAgIzDxgXBAIEBgICCAQCBAYCAgMBCQkGDgICAgIBAQIEAQIDAQECBAUUCQ4DAQIKDgUBBA4OEQoCGQQBBQIDA1gCAQMBAQIEAxkBCQ4CAwcBAggLAgEBCQcGDgIBBgQEAgEFEQYLAQMBCAIFHAUJAwQHARIPGQ4BAgQEEjgKAwEBBgkUAgICBAICAgEBAgEaBQkNBgIaDAgODAgGBQEPEwIGBAEBDAsUFBgEBAMBCQYlCRoUBRMMBRUKEBEBBAUDAQEFBwwBAggBAQgJAwQCAwEMDwgCAhEFCQIEBAICBAQHBx0TCwIFCisEDgMGAwYNAgIJAQEDAQMFBQcCBQITAwUBGAQRAgYKBAIGBAoFCwUBBwQDEwECEk0QARoCBAcDEAwUBwoQBAMCCgICAggFAQIDCwIBEhETDBMECgcEAhQHBwkHEQgBDAMCBgICAgQCBgQEAgYCAgICDAYJEwYDDQwEBAQKBREBDQMIEAQJEAEVBgIHAg4JBwwLBwICAggHIA8GCBYFBAMHBQEjAgIIAgoCBgECBwEBBAEIAQECBQMEAwIGAQUJCAICAg8EDhACBwkDAwQCAwsNBQYJAgUNCwcGBiYSDgMBCg0BDwMFEgIFBQkNBgENBAQEGQYdCAIGBAcJCAUCCQgjHxwMAgUDGAEGCQIKEQIXAwYCBggLEAILBQYDBAYBAgcGBwIDAQwEBgICAgICBAIIAgQCAgQCARkEDAIIAhAEBgIEAgIIIRoTOgIIBwwIAQICAxARAQEKAwIBAwoLAwEMBxYFBwkEBA8BBQoEAgYECgEWAwIGAgEHAwoIBAQBEAoEBAIEAgYPEggCAgkBCwgBCgMGFgEBAyMtDAIEAgIIBQMBBQUIBAkCBAICAQEEAgEFAwQGBAIIAQYFFQ0FDAQCBgEgAQgFAgMCARYECgMIDgIhDhwGAQYCCAcFBAQJFw8IDwkCAgclCyEWIQsBGAwDBgcBCAUCEwIDCgINAhkTAQUTFwQiAQoEBAkELwEKAw0ZAgECAREFDQECAggZAQcWBwQDAgUFGwEJDg4CBAcFBwQCBAEZBAMCAw8DBwslBAEBAQEFAw4YAQEBEQQPBA4JAQECBhoYAQ8RAgEBBAISHg8LBgYOCQEEBgECAwoBBAMaDwQJBgQCAgYCAxAYBhQeBBsJAQMFAxEJBRMFBAcNDQMCGAIIDgMCAwkECAQIAgMUBSYBAQQKAg0PCAQdlgECGMwBCQwFCQMOEBQEAlMs/wEaKg4FFQIEAgYBCwYCAgIBAQQBAQICAwkCAhEFAQsIAjkCBAgGFAgIAgQBAQICBgICBAICAgICAgIODwoOBAIOBgIGAgQIBgQCDAYEAg4IAgwGAgQCjQEGDgkCCAoCIAICBgICAgoIAgQG4QJYBAcCCAgCCAbnAQUKBBgGBhQGBgICDAgtLQIEAgICBAICAgIEAgQCAgIEAgICAhwEAgICAgEFEQICBgIEAgIEBAQCAgICEAIxDAYCBAQIAgICBgQGCHQEAgIEBAICAgIEBAIeVX0CBgIGCAICAgIGBAgEAgQEBAIOIgYWAggCCjwKBAIIAgUBAgYMCAQCAgICAQEBAaIBCAcKBAICDAMEBALVAQQECET1AgIEBAwKEiUVBAQBBgICAgIMAhACAgICAgoOBgIEBAIGBAIEAgYCAgYKBgYEAgQ/FhAOFAIVgAEECgQGBAgCAgQCAgQEImDfBAkEAgQGIQ8CBgIGAhdUZXdPiwEUAytiAQgDDAUBAQIECgoDAwEDAgQCAwECBgICNCwBAgIGAgICAgQIAgaVAgGcAgIKBAICAgQCAgoGAgIGBBIECAYCcw4CCgIEBgICBAgIAgIEBAIGAhszDAQEAgEDAgIEY8MBGgIGDgIEAgICBAICaAICAgICAgMCAgEBAgICAgIGAgYCAgQEBAICAgICAwICAgICAgMEAgICAhYMCgQOcgIEDgUNDgYCdggIPUcIFgIGAgYSGCIcRg8EUwICAgICAgSVAQQCBAQCAgQCAQEEAgICBgIHAgEEAgIEAgICAgdeAgoECgYGAizNA4gDBAjwBQHCAuMBEALUCRYOS/kGDhfAE7oa4QvNFBykAdQCGrgCKbEEzgFEoAEXXxywAXY3xgGzAQRk3AEcMhcKAsgCE0MvIpgBMH0inwENAqYBB+oBNW7UAtQBiwGZAS+VAtIDOQSdAXRd2AS8AYEBOiZ5OoUB/wGeAY0BCD4xESORAmAbe9sC7jGBJ+ISsiWOAgEElwMOBAwEAqcIAga4ATLaAQKJCogJBEiTBMUEgwsIygPFCRQCogLJAsAb9QOFAQqyFaQE9gMGjAL4BIQLowy4Ap4GEPYQjDXJBhAMFCCTAQowZYEBF/cBOvoBUigtI1kOAQIqDgUIpQH4AQIQYgxEDBgOGs4BA+sCF7IBPQEJGkrmAbsB6QEeoQUClwEFhAQwAi8oBIIB1QIIBqwBJYoBM6ACjwEYCBQEOPcEC7ICCwFU/wMghAVAAlgeVxACIEBIQW4ea8A7oDCgBJ8ZBpkIthOmD9QMgQPiFMMM6gbdGbAK9QPNCt8bhQKfEDihFByUDoIDJOMf5Q6nEMZI6QHdAp0CEKwDAoQBJxX9AbYBnwMdO/4BHgoLAnXcAWPgAWoQpQIaAZgDAgGKAdkE2wGHAdMBqAIjfAG1AQKKAYcC+gGTAQGPAfsCPAaLAQIPJAkkK4kFggQChAFbQwG6BYsjpQuWRO4SqiGpHCK6KsgLwgsNOOwYoizWBfEBBKoG3wXZA44C/AMNAqoEhgIDzgEQxwGoBYACxgn1A94HigHvBIoDLC7RBJUHYKAwxQzdOuAH4witDIQDqhPzGZMaoATUC5gopEa+FfYyhiiSCP4U4TH5DifTDdgHBAIGiQasBAzkApoS1wfRCvYxoEX7R5kXrwIs9Br0AewFugiXB4QoAAEBAgwiFwICAgIECigeEAQCAgICGgoCAgIGIlaQAU41BgJRCFAeBDhGVwgYOQ0MBAQCAhYfzgEKAwR5AgYaInY3TiBBHCACBgoEUgQGkgEIIBMmCA+RAS8cMBQKBwIFBQpZBjwBAQEFDAIEBBoCRVQZAgQPAgYiFQM7egYYCAQCCQYGGhNYImoEfpUBAgICBgwCHAQcAggLGxkzEAN2CgIKYgIIKAIcVwY8NmwlfQIGBAYBAgEEGQkQAkk/NhARIAYtFwQGFTEESEUCDAwGBBcesAE3GQoCBnMQFD6UAQhCAoUBBg1hBwYnBBBUXwUBBQMQJPsBCgYhTwQGAgIJAWZCAhIPTxEKAgoiFJkBoQEECAUGBiUCPgQabyAaAgQCAgJSElejAQINIgIEewEEBgIQIwMFAgICAgIBOhARXhu0AUACDWgEnw+iBPwBsAiyAeoIEv8FPZQDwAaXA+wDGfsDabQGyQW8AfEFK+oj2RgfEw4FCwEBBwgKCAwICAgIBwMHAwEGBg4EDwIIAgEOAxYBBwICAh4BEQUDBAQBFwcBFAMLAQECBQUDBwEMAwEBCwIHAQcHAwoGAgQEAgcFAQ4FAwULARUTAgIEJAYKBAMEDggBAwgBAQECAQMDAgMFBAMCBQUODgQDAQICBAwKAQkGCAIEAhIDDAgFGwQEDAEIBAEXCwIIBgICBQIEAxAIAgICBAIDBBQGECAtBgIEAgEBAgIMAgYDHQIBBAoDCwoBGwEaBAgBAwIEAgICBAcBDhUCBAICAwICAgYEBAQCAgQCBwQCBAQECAIBBAQKEAwIBxADBQMFAgIEFwEIBAkHAQMCEAkJBAIFBAYBAgIcCAYKCgMJCgQCBAIFAwgEAQ8CBAYEAgQFBQIeAggNBwURAgICBAYEBAQHCwEHAgUBDQkLAQsMBgoJAwIBAgQNAgECAwEMAwUQBhoTBAIIAgIFBAIKBAIPBQQFAQ0cAgQCAhcEAxQDBAQKAgQCBwISAhAHDwQFJQIGBwsCAQcMBAEKBggECgYIBQMQBAICAgcDAgIEAgIFAgICAQICBgcCCAQnAgICDAEBBAENAgQCAgIGGgICEQ0BAQQCBAYIAwMFAgQBCgwSDgMBAQEBBQsGBQgEAgIBAQQCBAIGAQEEBgcECgICCwICEgUCBAQCAQQCBAQCEwUXCwIGAQIHBAEBBgICBAEDBAICBQMGAgEBBgICBg4CBgwFBQYaBgICAgYECgIFAQ4BAgQIEgICAgYCBAIFCAIIBgMCAwoPBAEGBgYCAgICAQECAQIBAhACAgICAQECAQIBAg4FAQcrBwIEFwYRAgMDCgIJAQcCAggGAgIFAiEIBQwBBwUEAgICBgYEKwgmBAcFDAQBAgMFBAQNEQwCAwMEFwcCAgIBAwEDAgYCAgsGBAICBQkEBAIEAgkEBAIBDwIIBycKCAQKCAIUAgEDBAYFAwoCAQoBAwYBAwoBCgIECAkBBAIGBQICAhEIAwMKAQMhBA4YCgQEAgIEAgoKCgICCAoECg4ODBcCBgcCDgkBCgICAQEBAQMGAwUIAQIHAQELCQIEDAcFAgYEBwQEAgEBAgEBAgkJDB8BAggICgcEAwQEAgICAQECAgICBAYBAQEBAgwCCAQCBAIHAgQDAQICAwMYBAIPAggONxIEDwMFBgUCDAsPAQELBQEIBwICDQMIBwUCDAINBwICAQEKFAMHCRgHAgUMBAICAQIDAwEFAgQREgEEAQoEAgICAgQCBAICAQMHCAYCBgIQAgkmBAELDAgVBwcJBgoHBA4NBQIEAw0NAgMDBwEJAwECBQ4CCBMEBAICAwoCDAIEBQICCAwCDA8KDQ8QBQwUDQgMBQMIFgQYAQYDEgICCgoCAgQKAg4JAgEBBQICAgsOBgMGCAIKBAUCAgIGDgICAgEDAQEEAgIGAgEBBwICDgcHBwEJAg4EBBIRAwMCBAYCAhQFDwYJAQERAQECAQQCBgwCAgYLAgMGBAIEAQIDAgUDAgkBCAQCDAUYDgYCAQgBDAMEBwgJBQIUBgQCBAIHCgYCEwkEChEUBgIDBQoFAhUDAwYCAQEDJQEBAQQCAggCAQEFFwYBAgIHAQcCAQoZCwQDAgEHBAgCBwIGBAkCBAQCBAgCAQQCAgYCBQIEAgIGAQECAggGAQQHBgwCAQEFBQgCAwICAgoCBAQGBggCAgEBAQcEBgIDDAgGBQEOBwgMAQEhBgkDDAUGAwICFgcHBAUNAQEHAgEGBAIFAgUEAwEGAxEBCA4GAhAEAhwFBgQUBwIcAgQFDwwMAQIDAwEDAQMJAwIPAgcCAgEIBQkCGAIGBwIIBAoSAQQFDg8CAwcBAQIDBwEBAwQCBAUJBgsCDAIICgEKBB8JAgQCBAMFAgIDDwIMBAgGARAEAgMGBAkBBwIEBAYFAwMEAgQJAwEFAQQJAgIBBwEMBAYfAgIBAwIWAQMDEAICAgQCAgEBAgEBAgIIAgIQBg8KAQ8OIQQSHgQIAgYHBg0CBAwCAgIKAgICBgEBEREJCAQCAgICCwIEBAICBAMOAgUEAgQEAhACHwEBBQICAg4OAgIEBAQEBwEBAQQCCwkBEwQKBAYKCwYBAxECBQQDAgIDAgQHBAUEBAIGARECGAopBwECAwYGAgQHAcIv4BeAARMQCQ4I5gFSEeMBFkc4N84CHxs9gwIE2wHGAcQBjwFA4AFjBRUpmwECBm4hUQ4UoQE2DLgBDAQ5RxcICzeQAVOQAbsEAeECB7IB5QEXKCEEegs/GHjyASbkAQIYjAMnDK0E9wG8ARgKCgwCOAIQ4AEVAtoDqw5GQAEcAcMBAYsBBYEBO5YBHQxB5AGLAgENBR4bgAEDQwFYRgIXXgEbAYMBLAF2NQJ0UAJUHCgECAgKAWMBQXIBKBsBMQEXCQEBAUwmTio4JQETTwEfAx8DU0QBLQN7AQEhAZ4BAbsBARVcCAFtAzQBawM0ZgpxPgE/WzkBHGYIAYkBDgJhGgRaagE8LitQAgbkAQElChyPAXMBKzEBkQFLQ7QBAYMBAUceEQNCAQIFaRE5ASUBeTkBhQExywEDKgFxAk0/AQcBPikIESN5SU9OEht6AUlKGFdYAaYBlTK8FOEXigOqB6YEwwZHCJ8ICOUSlAHiA/UEsgumAZUVxQHFCpcgriWSJ91LxQQg5hXdDekNQtMagQP8CM0D/wrrBv4Gih0BARYJqxDlGqAjwAHPFBxG2wj6A/4Fzx3GAtcqlCCmRPM7qyedLssBvQOOAegNhAfBC6MTVM0B1AHGA40C2QQKsgEKVMYCUNkCjwWoA5kBngmmBDXCBu4I7AWvAZkXkg+lGbwEyAFfhAncCbEKrhLKAZ4GAewYoiWLQhA/CjYQKWGGAQJSlAJjLiO+AjpiKWNfA4kBM34CBqcCDJkBAQM6LzkYBBgGigMgR1kWHp8BIghaIiOqAdoCFAEsBQGTAQM3JDQ78QFQEocBARlTiAJUAnYBATmoATUiKhAhZgwayAEQGCQCDF8UD3IIDxoCcAYHlgM8BEEEBAQCQx84OzsCqQE7ELgBfVEFLxJLBEsyAbwDnQEcAgKLAn8DAaglrxaeDqkLqAMCoBKnAyu2AucG8QHCBvADKrw2hwG+Grcsqhm4HsBI3TrIIr4FyQjBDg04uRkCoxDKFo0CAgQFuRniKcoTzA6SDPMWjUXiS8AbwQKeKwSdAgISBBe3BckDggYBJNQDAR4CQM8CAR0RARGwA/MM/QMBDCyPAgUCCgIZAWQCiAKeCAJqBN0FAeMDwwIwlkTdNt06hwFu0AGeFOAishCwILYLhwEGvwK0Ba0CCd0BxwUSAtsBHFiiAxPWAtwBXWZJpge8Ac8CngEiswVCnwKjA1qFAqABVPMFygHxAfYC5wH/SMcSGtUIBRn2AiILxQPhAgED3BQPc0+4AsYP0AeBDAYCqBaJN9Y7xgi9OqAE7RGJLneQCqELkyPlAaoB0QucRJIM4h2rC40U4AjvDbwEAvwJoQHbD9Io1xCuS6kCF+FIAgoCBQqJAQIO2AFKywEBBQENEgQEAgIJAWE0FRQkBJ0B1gIMDxK/Ar4BDASAAQLwAwIEFgIERggRiQGdARUOQhVRINkBtQIEDBAHYizSAxWvAgIgKQsVGlGkAVaKA5UD5AMiiAGoAYMBZlc4CxkCrAEGFjLrAWQnBtgBUg80LkgiG5QBBAoECgRDQwJEyQFGtwFPAuMBigFGPwEeAgIgEo4BkAEqHRAszwEpNwpVHwQIZQqBAg0FFAEDAgIDCpMBDjUBMwJfDBdfAQIUBYoBJnYJLq4BAhYNAgwOLBwXExEFAgRkQnIIBRkCHDIFBgwKAQE4Sj8tBhgIBAIIExMRAk8BIiKYARoWfCIBWTkNvAEWShIHAR5SNQcCOgIpN4UBBAlPKRMjAggQXwgwgwEIZBgBGgJkBQIUclM+MxBCAgQl4wEBOQQGCW0hDCoEOi0vAVkOGBUoIES0AYQBCwU6ARoRAxMBEwEDBhICbxA6JghxBjSFAZQBax2BAWQpCDAOFRwHCAIjTCwHfxMVBjQRBwYIBhFqFQISCwURAjgnYFDOBb1LrQvuBgLiBZkDEhD/Ac0KzRPOELYY8yki/wIEGASJAfsQEZYEGKUIhhH/AdUBzyLOOKsfiBm0AscS/Q7pONIDCt8BDkwJFB2IAhymARJq9gETZFuyAYcCDAOpAXF/8QFVbokBYY0DCUBBwAEhPmRuOY4EGEYE8gM8EccBCAbcAqsBERdmnwITKJIBJ4EDNgYETSA4rwE4tQEYowEJwQIUMgSyAsABvwHMARjTO9w8zAgz6gHZBG0HAQEHmAKaAYIK4AGOAsYBZQYCowEEMMIJzgb5BLEBLQjxAQiwAgIGAWTmAXQwHQKeAQIEgwKfAZIChgEGzAMqHdQghAPiCAKkDd0IKLUEmQ2OBCZpBMYZgRWMGMMOxQHIC7MN5gy5CmnjARoCFgIsGBFj0gE6BggyBQQIxAEdIWoDDB4IBTwWHAIIEA8HAgICBAIEDAQVCg8GAi4IXeQBHBQMHgEOEBcCCAwElQEBAg0FOCUrBis9pwEYTSUHAh0XGgoFD01liwECAgICaEQJYxIXCwQpIAYGECJWCgpOYw4dBBM+cBcIAQEnBAwJBAQcOAgOCDgyBEIGCk+sAQYNHyAxAgZaAw8LEhgSBCUGLAMGAgRUGgg1CBUFIfABBQElBBJ/G0MICAnEAQ0CVQgPBBgKTDEnRhsMFgkEByEEBisOBhoGDAIIEOIB5gEEIhAUXBQLCEcCAQEfIiAqCgoOlgEhSTMcWyBGCgQS4QFXD5wBRQENAQECAiAGjgEgPg4RCD9/NQsJCCQCEQEfDCwaEAkEBAIJDMwDCLME3BCNFYYC1wJTrwTLQvEdxUuBA+oI8AMEngOwD8sG/gsF2gYCpgGbArUHUvoDmAP9A7MErgKSA4oD6Am5BcYMogRRAQfMAYkBTBEHAwICGJoCBgoCFwoEAgICHAQCBAaMAgJ5DvcEA+wIJG4CAgQCAgwCEQECFgQCCAQEBmiCAcABoAEBA8EB9AIziwEBFQIJAZMF6gQJAwsCEw8BCQEDAQEEBwECAwUDE8QCrQkgCwIIAQEDBPkCBAECAQEHC8cBAQEDAgkHAwERAvcGBCiUAmHWHxS8I6UMwg+VCWwGMNgEggKmBMQIzQFPB6QMIfgCAQIGA9gBkA/1KdIS2wX3AtUIgQRSBAEBzwGbAa0CqwKeAgnCAQ0EAacCvwcyAwLfASbkAQHUAZgDhAiSAYUFvwUVAgEBAXQBAwFoggHIAf4BtgFIC0iDBfkGlQIQjwLJB8IM1hOOA6cLmQ2GB0ZJTskBqAJ/DrIBNFeNAgoHEmKtAQSCAVgWAgIUPBkL1wMCPwICGAICRlB6DjAWcgoXMwYJD4EBDgsiCAQCL7UCrgFWfMgBWQeJA3AWkAIcEvgCFLgBU4kBF8QBawQOiwFUCkQBsQESzAQUCwYTcm2uAqgCigJGpgEe3wEsfzYEGwXJAZU9SKICN1kogwc0V50DzQHoAcUBHKsIBgrXATTBBqwCcARRiwEEAe0ClwY0AgKsAgGBBV6BAXrXAQHyAQJF5wEEnwYr5DEBiRujAdAF+geQBOYEtwmpAf0ECOYGBMkBpgI7AvADsArTCsQU7BMZuQ3CAds3mEerJZhH0SCgMPUFAQEtAQEBJMYJrgX5ChaeEdcSwgOmBQL4DssDgwXND7QD/AWjBuIPNhD+AY4B5getA94HjwMM/gMCAocDS8cIiQK2CfAOE7QEgQ2UEm3BDAK6IJwM8gHCA6oQ+AqgBosctQm6BQrtD/YC5iwQygWrBSN9gwWABw/zApkC3QPgAa4Dxgv3CMsHmw6pGZYptkiQQMs8gxlFLQwEBRxINEMEEQQCAgIDawdLAQEUAggUBAMFTQE4URAOAQQPAQIEAQEBAgoKAgIGbAwCBhk3Lh4mI2wPAg8IBBkIDwgGPywFDgIBQilwDAICCQMGLi8DAhgGDAMJFw82BQF8AhUPAgIrCggEIgYTAjUBBAEFAwMELwUTBBUSHDsOAggDAQIBAQNECAICCQQGAQsZATEGLjAGAgwGBgJNFAIDBwRNNl04MWwIGghTDkYhDYABGQmAAR86PToaHRcuBDYVCQoPBQEBDAIFAwQLEVUIBARcRwImAgU5CwIIDQ4cBwgKARMHBAYFAw0HDykOARsdDwIWAsgBCgQmPgICKwwCAikCSgQXKAImFQsuBEgFDSgLBAgCHwoKC2ckAi4QAQ45UQRbIQQIGDBdJAIPSTQJBAICH3SlAUgYBAQEBgY4EiYKAgkBCCUHAgoOAgwKAgoYBAICCl8EBBAtDAZxBQcIAjssEBsGVwMHLQQOMmJKFxIcBBA6AgIEASkGAgIIEAICBAIEAQQDBAIaDkEUVgkHBTIECgUKBAIEAgECDgJOHAELDgIXAgMDAQIBAQUCBH4CBi0CBgZIhgEexAGQAYMBzwEp3AHVAs4BRKABF18csAF2N8YBVxxEZLQBKBwyFwoC3wFpE0MNIiKYATB9Ip8BAwazAR9TCHA1bpgCKRPUAYMBCJkBZOAB0gNQSzsEdF3cAfgBhAF5QwJ/OiZ5OoUBJdoBngGNAQg+MREjkQJgG3uVAka2KKkVnxUNQuIFBgQCAgKSAQQCBATuA50CAvMCHAICAgIMEXb8AgIoAlHLAQICAokBCi4hMW4GFgIIAgK/CTw3sAgEBFha0wQCAgICyAErIokHApoBNWIGBAKCAewBSIIBAljsAYsCdcMG/AcqjAHJBY4LjxfJByyCAbIBEYsEBKE64gTXCQEQAgoCCQYZAQgKBiceAQoGCAQZAQIeBAIEQhMGAgQCAQoMEAICBA4IAwUIAgEBAgUDCAoEBhEBBiIoDAILCBcNBAEBBgQEAggCCBUIAgIBAxACDAIMExIKBw0oAQInBAMRAwI2HBgBCTUdGg0SQwoCAQcKJgoOAQMBAQQIBgICAhwCEQEEBQIBAgICAgIKBgMIAgcCAQIDHxIMBAUBAQQMCAEIBAkVARwYBgkBBgQWAwIBEBAKCgMCBzkCAgYCAgICDwIGAQEBAgQBAQEIAwICAxMFFwIGEgIBAgIECAMDGBggAgoKAgsBDQICAQoBBgIBKAICJQkIEwkEAgYGHAECFAQLEQQBAgIOBgcHAgIRAgIIBQEZJAELEgcBAwoBBgECBAoIBAIECggEAgsCBRQCAQQBAQEHBQEBBQEEAQEJBQgWARkWAQwKBSYBAgcBBQUCFQUGChUIAwcGBAEMDg0BChICHQUNFwQGAwECAgEBBgEBDgIMBwEPAwcCAQoBAQgGAgICAQIFAQgdIwECBgwGAgQpCwwJHQIIAgICAwEYFAwIAQIKAgMfAx8BBggGHBIRARAWBRgBEAILEgEOIAIDAwEJCA4EIAIJBAMCEAE2LAECBQIPFA8CBgkBFAESBQMRBQUJAlUCCgoBCAYCEjkIAQQIBgQIDhoBKQEzAQ4CAwsuCAQCCAsYBgMFEmQEAgQVDgIECC4TEwgCDhEBAgQCAwMBBAICCwICAwIECAkBAUEEBA4BDQYDIwELLgkBKgYBDgQFChgPBAkKBB0PAgIcAQICBgIDAQoBAwICAwYBBAIGEAcFAg0EAQEBCAgEASEGCQUKAhAIAwMDAgIIAgEQAhAJERckGgUCCgQGEQEGCyoBKBAEAgkBAgYKBgQGGCYaCAwBCxYQCgQVAToRAQIMBggYHAYCAgMDDgYGCgQFAQQoAgMHCg4ICAIRAQ0gBgYCIQECKwUIBAwKEAwoBQwIBwoCAgQFDQQkAgYCAggBAgQSAwICBAUNBgMXAgIBAwIIBgQCBxkCBA4ODAoMMgoCKggFAwMILgYCDwQBAwIDBQIFAwgRExMCAgIGBQQBAQ8QBgEDDAQCAgQCAgoCCgEDBAEDAQEBAQ0HAwwWAQENBwMDCgQONBMLAhMBDBAUCQIIHg4BBwQCBAICEBIMCwEMDgEDBg0BAgQLLAIFEQwBAgYrAh8WARYCEg0CAQYKCAEQBg4EIgECAQ8GCwUFHwEcBAgXBQQBAQECEikEKgICAwECAQYBFA8FBAICAgICAQMBAw0EDQgEAggHDQIGFQ8dFgEFBgICAwICBwwkFAIBBgEcCA0BAwIBAQEBAQEFBAQBCQIHAgQIAwMBAQwEBi4aAgUMAgMFAQ8BBg4PAQQUIBEJBggfPwIDCwEktB/nAqcRhy8CnkfNSKwf1wr7L94K3gOMK98NmwXgCtYUyQy0DAbZCgiHAU4BMF0eGRoD/QMKVwExE2Nwego4BHZXoQIMhQFa6AF/cx4DYBUpXiQbAVwZFqIBigEBCwZR2QMIawFGIVRELiWIAW44EhJtNlcOQgQXAmECMAYZBjIxODYvYQUBOwJtAjEBQ10zmQICkwFrHhS3AQMBAQICArUBAQwBAUW4ATgUjAFZFy80Jx4HdlwbJRlLZQEtKJQBBE+BAZQBRSgnBDwHJSyxATAEZrFExjkFxzkGLAIEDwQVJx4QBAYcAwcEDAk3Jg4EBDwJQwhKNQkkAg0SBgRzGBECDTISXQYKFVEGIz4FBBUCEnIIBQIYCwgCGTAFCCYWBEAEAQEKFgoYExksAgIMEAEcOQgUGiIENRUBBRcJKyckBgwMGQEBAQcxAQkLBREDGgU+AQcXARsCGgIaBgICHgIIBwQDBQopAQ8CAR0KAgEBCAIqAQcBAgVREQcGIQYWAggiFAMEBgMHBgcGAgECASYGAiQMQgQuLwYGGh8KAzcGAQUWBgEFFlQsGAQMIAgCDmMCIgEDAgQCKywBAwI2ERAaAQEBfgwKEgICAQEDAQcCATYCBggPAQJXAQcsBgsBPCAICAImC2AKHAkEAQFADDAEBgYIKQgWOwYOAgEjCghRIAQFHwMBDAIBAgEBCBcECTYUFjoEDAseAhoEFAgPXA0EBCkEAQEBFAoCBYQBCAQCAQEE0AEEAkYIOC8EAggRCGwGAiYDLAgCJAoCAVwGBRABBwwEEwc8ChgNAQMgbXkFAgFBCBMEAg8DFSoCAhEMQw4IBwMHFBwEBBUJAwEJOQEDBygKOQF7BC4BBAIrMAELXyAKEAYBBQwBBAg/CkMGCgICASsJCBwpIQQNCAUIDwoBAgECAQoNBA1HBAEFAQE2AQoBBEITBgYEKAoHBAICDAcRCAEJAVAHBkQIBD4CFQ4QASEgBAKqOrg21QExAlyyBZcCvAEE3APiAYIDMhxDYz4PcwYVAXUWxgJJ2QMIawG7AXLHAVI5rQI0K5MBHziBAgHdAaAEApMBcC25AQIFwwPYAZ8BNCceB3acAWRm7QFPaheBAif5AgRmJc0z6Dv+FjXZJ4w77hbWGp4WuwLzEQrIKJIOowaCBaMDhgTtAxDRFBziG7Agww2BAQUdAQgzZQIZCQInAxEJEAQgAgUPAhEELjgvEBMRMQJAKBx/JMoBHSAgAQMBAwIEGAwFFBIcAwwhAgQSEFcEAQEbFDMcAgoQAQkHBBIOAQIQBAMPBAcJATkCCAgGAgECB2ElAh8fCx4uNwIJCwYLGAcQIgJMDQQCAgIlAgYQBAIGEAgYDAIGAgkCAQEECCoyUxAKBggENQEHAQkWDQ8yFwUFAQFFBAcMJggPAgUCAhwKAQEeTw8BCgIEAjwUBAcXBAcXJgwEAhBNAxUEBRcyIAgGBhIiaAQzDw0CQ1sVAwEUIRcCEwIkYh0FCAIQBgICCAQCAggGJwUCCgkIBQICJwQKAhwBBQQCQjEBEQkcIA0KJAQbMBUcGQIBDEITFgICBAQCAxp/AgULIgsSCAwEBA4JEQ0QFBUTVkseRhYLEwSUAQwBAi0DAQ4IAQMQTwMWHgwxBEQwGxooEUCLAdIBAyMpJwMLKBMQDAMjBAIJExYIAwEBAQIeBBYBHywCCgQKEgkdAhAWRDUXBAkWCD0EAQc0YwQaDAR0AwUKAQESHwEBCUEBAQUfHhM9AQc7AzEDDiMHCQkRBwUIIDsTGREEHBwSBwYkFgYTBgIHCA8CGB4lAgsCiAGDAQkGCAIEAiLKBIQBIOsF9AgSChKWCR3aFugS+gEpuBW6DZMcwQmmAQIEMgHHDNUDrQK6A3OCATaMCYQJvxQgli3WQrk03kK0H4UDUrgL9Qf7AfAKrwQQqgTWLI4pvw0CIAomT6oJiAUKNgIYxwhbmwOhBrADzQHjBu0M6wICogSvBAdHZKIDBsIC3SOiBN0HkwEWBHbyCvoDBp4UmQ+qBuoExkgUApIBNjcCeQIPpgFcASMPAgQeCQFJAgL+ATLzAWBvASdZJQjeAQYCMRdV5QMBGwExBDvjAQgKCIQBOhgBAQYCFhMBcCQnSBwFdQQFBgIBAkAyICBJCEcgFaACECYCogIRcwENAQMC5wFVFQcBAgYCCXz4AQIRDQU6cAUBAwKGAUILBAMXBwECMhQB9wHbAgIBAlADBgEBFQEGJpICIB4CBvYBI1UImAFNRgYfhAEZSwbkAQpJwgEK+gEBAawBKWaPARgPLgGKLAKZAuMP2RQcqhEarCCNAt0FqRi3AiSdBcsCBgj8AoIDZwSKAwsc9gLIAQItsgFYigLSClB0BpQBzQPVA70FdCCkA/IB7wa2AzoekQIECeIXvg0EAQGjAeABCsICAcgD2QPjARmqAsgDHEK1A9wCnAHeAvEC1AGhATfhAbcHlQPbAZ8BwwHGA/EIuwLwAhn8NMQ2og65CdEEIoEayROfD8tDCRc+JgMIBBAGBhUEBwEqBAIBBQwFDggMCwMQCAceAQgJCw0ELBQCDwIKBAIIAwIDCwsEAwQWDA0BAwUMBQscIhQNAQQJEAMQASAICBgGAgoDLBAQBRcKCa4BCA0BAQEKC2QpDw0PDwYCAgIVBAoZCBwcKzgEARYEBQkFAgYOEQkDEAYCAgYMAQkHBhIEAQgWEA06CQIMDAkBBhkGCQ8HBAcUAgcEAgsKFQUsAQE9DAEQBhgFHwEBBAgFCwMSGAIRFgtsEAICAgIEEAICAgIHAR8FAgIGBgECAgIDCQEBHhEpHRklFCUjBAEBAgICHhYgAQMKBQMCAh0HCRMMFwMDBQgECAQRAQ8BCAQCCwEHAwIKGQEBCAUIFgwIDRUICAMKAgQTAgIPAQkTAhIiOAYRBgwfBAsEAhINHgcIEgMYFQEFBgIGAg4DBgYCAgQBAhwFBRIwBwECCQMzDwMCCAYXIxUbLAIoBwtOBAcIEgx3ERQEDgYCAgIMUgwzAwslFQcCAg8BXBUOAwUDAgIQBggITgMECjEHCAk/KAIDAgcGBgIOIlMeEQoFBxEGDwEBChUKEz4IBgYBAhIPLAwKCxEGDSsCBQECAgUNAgEBChMJCQQGBQQEHwEBGg8DCQFfBQc2CAgPCQIBDAwZIwQDJwIJEggCFAIwCBsEHQkKFxUEEQIHEgsHHwcHBAEBAgIECBkHBAIFECgLDhcOFkEYBgcNIgIMAhgEAQoBBwIBAggFCAoQAwQBAQEWEh8CCB8FBQECCgYHCgIPBAEzBBAkAgEGAgkFJQIeGwcnFVErRAYQBwUGCQECDAELLgIYBgwvNwolFCcKGAgBARMKHgEhLQIdAhQJAQMPCQMGBiUCAgQJCTgKBgwQKwQIEhYDQgkJEgIOOA8EBAIJKB0PNQULBhsCEgM/Ch4eBQcGEwEDAgUQGggZAgwPDgwFBg0EAgbYJOMX2QK0AoABtgHRHZ0ZngQBggKBAeMH0yICKL8dhAcCAs8j7gy6CYEPmgWKBrYC2xSmAc40/g3yCpoi1AzNMMYZlkSfAtsE2ATnBzUEAsoBmwQCjwPQFsoGwgT5Ba4DFALGGQKqBtgEzBZ25CWGGQQBAU0OFQQQAQQEFAECBg4OBAIPJBYGCy8RLR0ODwoKBwEQBAQCAgQEAQMCARcCAQEDLhk4FgECDAQSDAIcBiwBAiYSAQEIFwIQAgERNToDDhMXAgEBDRUcCggVMSoFBwgBASINJg0CAhACBgQCAR8LCSgCARELIwIGCw8VAgMWJQsHAwwWAhAcAQQoDwk4AQECAgQCBAgEAQMCHBYYCgYCAgkHBhMkAyILFA8JNxoVAgEZAggRGRcNAhENAgICEgUCAgILBAIDAwEkCgIEAwIHCgIEAwIfCQEEBAINASEUBAECAgIYEUcIFAgGAgUBBAMCAQIdBA0EAwEfKw8VAhQKAQYoBwIEDgYCBgIECAICEQ0BAgkEAhAjCAoBAQEBAyAIBgEBAwEaAxQCAgIGBAIRAgILAgwVDSIiCAUBBBgIAgICCwESAQYMDQgaDQoZDxQLBgYJAgYXCREBBAECAiElBwIBARUhEx4BCAQYHR4HARFDAxYCBAIECgoNCg0IAhUBAwgBAxAdDQYeAzIfAQMQAgc2NRkBDAIBAQICCAIBAwIQARYDAj4rDAQRAgoDAQMBAxABDAQCFgIGAQEnHwUCAQIBAgMEBRIXIj09AQJkOgIBAxIDAQEBAgEFAQUCDQQIBAwYBisCHmkbBhINIwEHEAwLDgICAggDBgMBAQMHASsQBAYCDAIRAQICAgYTHx0BDQIFBAMRAgMPBgYXAxMZEwwXFgoUBAkWBgQCDgQCAhwWBBAWBBUIDgEBGAhyAwc+ARMIERUCBCEEDSIJHyQrAhACEwMVAQUUKAkCCwISDwECAQEBBgIEJQUCBA0MDyYUCQEBAQICMAoOBRMMBAoSKyNGNQwMCw4KAwEYBgIMAwwEAgEEDgsQLQcCDzAlDQQRKhMsBQUJIw4CBQYPJxQBBQEKAwEEBwM0AiUDCQQOGhEDAiQHBAYCEAUMHA4EIwUITgkfDDEEBgUEBAQFCgMRBQMHCQQCBAcUAS0sHgY6DwkKAwEMCgwTAQITAiwGBgIvHgMhiUHTAVgCNh6zBF1CO143ehQXIXpwZiISIEIMDEQMNCqkAQOlARawAQQEAgYHX0JYZBgYJ7cBiQEODAIdLBwingHPAQIgAh4eAvUCZEGFAn1ADjYjLM4BiAGBARBIqQEOZiv6AcABKTotfQIUWCkscBkEZgKCAUxwHlMEF1vmAki9AUUD8gECZy6MAU0+MBcVrwFIHlmvAsEWrQkCjinhE7YC/BgGqAjpH5ICFXJB6AGfAkLfAb0DqgLzAcAC+wHGApYChAF1mAIojQHrA/QBqQMSDocE1QOiAZgBRKUF6gLsA8UBT6oByAV9swIY4xeYKLEH4h62FgIIog7JDHeSAVo3GgIBugNDrgICCsMBsgEEU9cBVoQBpQICrwL8AagCRokBCAQEAq8CAbABgQPYAT9uyQGNAQ5dAmECmQUBoAHMBGx9tgLiASNXa6EFPhMJkAECRYEBDNoBjgEHJRnEARNZAqMBBDoKJQISBgYCBAICAgYEBSEBMwIgBAQGBAwIFgYaBgEBCgsmGgIEBAoBFggJAQ0FBAQCKAkPCAkCJQYMAwYIAgkTBgMCKQUfAwYoCgEGJiImBBgSFwgMGBYCDTABBwEGRgEWEgoLHQYCDhQTBgICCxYCAiAkYhgRBQMBBRImFg8DBBYDBREDAQIBAgIBBQQEDAQoKw8CBAIIBAQsAgQlAwgGDBkEBQyvAUALBxABPw4FDRMCAg0HHwMICAQCAgQICAQCAggkFQIDBAYMARwRCAQEAQMKVhAeAQMBCRMBCAgJAQsCEzAOEAICCggHBBcJDhgCBQIGAgQCAgIEBAgcBBQEBAQZBQEFCwUeCQcSEQIQAgwEAhsdAQEBAgIEAQEBBQEiIhUBBA8BAgICBhQKAhkBBDoCUBwBBQwaWCQODQYDAgwCAgESDBwZAwQGAwETOQwBDBMCAi4IAiQIDid0CgEPAhYCAggCGBIoUUICBAgZKz0CDAIEBAYIAgoUFQoKAhECQgwMFzICBBQCFgYGAlUZA1cCHQYDBQoYZw0lHCQMDFcUAQIOBAEPLwMGAiQEBwMBAR8CBAMfBRIWAwYQAksDKAoCCgICBgIEAggEAgIEAQYBBQICARUUBiYSAg4BBwQ6BAQCBAcBCggOVhABERUlAg0ZDAEaBQkDAwIKPSg4AgERBAMWFAMJAgYMAgUEDQ0MAQIBEBsMCQINAgsCBAoCGRMCDgYTCwQJASMQCAIbDAgGIxQbBhcBB041BwIIJwYCAgoVFAoIFiMDEQkQAhYGDBINEwICCis1AQoMCD4CNw1AAQYEAQwGAw4QJDwXGgIOEQEDAQ0CBgICCAIEBQIFAgYCBAICBAMFZhgSKDAVAhEIAgIDAgwoASMBpAEBAxINAQcMAgIMCgMPAgIIAkoKBuMX1xmKCpQg4BKRGHKYFcwMqSeWRNg2ugmgM7NL3T6zOI9F0QcELw0BCAwFAQEZEhwDDQIBDAgBAgEBBAIMChUBAQYBLCYGAgoYFTMoCgFaEwIEPQICBBYJAQ8EBB4KAgooAhoCBgQDGRUGChAfJAcDAQkNLQMFAgEBDgQVBgcBCEgEISIDZQIGCAgBAwMUBAQCAgUCEgQBQxABAgUCBgIMCAoGBg4eCwMBEQIBAwMBBxEiRgIEEAUBAQECCQIBAgUBAgECCAkCAQEBAwUZBgIQCAYCAgE7BQEILgIJAxoMYgICBAsBCAEFARIFAgEMPAEWRQMFDwtEAQgICAQICAgIJAoGBQIDCQI5FAQBAQIWJAQNAQMXGgIHCwIBAQICCAIUBgsGBgIhCBIDAgMYBAwCAwICAgIHAQIQFAkDAQINBwIVCQIKAgwoAgJCAgEBBAEbAgkYCgIOBxgIBgMPCgIMDwESDwEWPgEXJQQBAgYGBBoBAlcKBgIWBAkIBBABAQggBAgJCQICBQEBAQIBCQIGNwICBAgCEwgKAhkBCQEBBQQBCQULOwIIEhIBEDADCgQICgEGAgECAiIBEwpBCgQKJiwCAgwkBQIKBhApAgQBAgYFAwELEhQPDgYGBgMJEg4tAQICDAoEFBQGBwEvEgQGBxQUAgI+AUgIAhA4AgICIQcQAgUYCBICMAQCAhAIBgIECAEIAgEDAQECFhMDAQYBBBRJCjMMAgINCAwBBgoBBgxGBCwYsQEBBAUBFAQGLgIUAgEBSQkCCwYIBAgEGUsDEggODAIHIAQPCgECAgECAQEBBAoYCAgrBQ4SAhYDFwMNLwMCCAMDMBACBQIvLAIOBgYBAw0pBScCIioCCAgCBggCAQQKBgIBCAgDHwIMAgIKBAkOAgIuDQENCgYDCAEBAgEbDBoCAgQlBhAFKQQEAgIMBBgBDwF2AhwXBx5GAgICEi8YCAEUASYBAxgCAgk0BAUFAh8kDzIBAQIICwIIAgQZAgECAgICAiUKFQILFA4QFD4CAQMuAQEIDAoJARQlBgkECgYGBxQCAwsIAgQCBgQDBgoCAgIDDgInBQkBDAIBCAICAiAEAg4LHQI0EgMFAhICBRkCEQYLFwRKBP4E8QaDCMwBmwPCCI8E1AOWBDuiCYcD7AKcAqQHrgH3CtJHhgICAXj/Ar4BaZYB6gFC5gMMCpcBSALmAQGaARxEBAQCBgebAwwCCxa+AiX2AaoDpgEyigYZhAIEAQEBCgQGggFitgOWA6EB+wGRAVNPhgGjAi+vA+EBAogCe0iHBfwFhQ+2C4ob5xi4JaAjkAMD5AiDAV7SIdAHjB6gBP4FAoYGAq8PtgGkAZIK+haYAgK1ATcPAj0BAQgEEAEIBycEAiYREAoRGQwBAgkBAQUJAgsEBCYgFQULAgIBAxUCBQYuIAsDAyMFGg0KCRsCBjAGAwEECgIEFAoBCAQFFQQHBRkGGQcOJwQBBwMSNxgBCw4OAgICDAoCAggjMANlAQEGAgICBRAFAwcMFiYCCw8DBQUpAw8EKAEHAQEGCgwEBCwXAgYQDQQPAwISBQUMEQILAgIEDAQHCwEBAgwIBAENBREGGkAHBSABI1ADIwIGAwcCBggqHhQGGiACBBQCDwwhFAICAQMUAgIBHwIGAwEKBgUCAwEQBiMCAQEGIAECMwQIAQQJAQMQGAQGCgICDgoEAgIBBgEBBQEaFwICAQUbARABAxQBAgQCAQEBAxYBBAQHBAEZBQICFgIFBQoKBAgCBAIEBAIMEAELKgwMCQcEBAcBGQEBEgYGIBEGBQcBDhEDDhEDDhgMBxoRBywBLQMCAx0JCwcCBgIDAQoCDgQSAQEHCw8BA2AEEw4CBQ8BAwQIBQEtEwFTAgIOAQkKAgEJGwgvAQMEAQgXAgQcLAMMKAEZBA4KBA4UBgoDNxgBAhM1CAcPBAwBFAQ0AwY1AQ0QAgQGAgwIIxsJCBEFAREdAS8NCCAeAQUDiQEOAhsERRsKEBkTFDczAT4KIhsBBA0BCQ4IAQEMBBYGAgcebwIpFBcBJQIkASUBARoJAwIBBgQBAQEICAcWBA0UAVEBCAECIBAiNAIbBAY0AgMKBxUBCxAGDwIfCwgBDhFQGCwBGAYOJBIBAhQKAQIbCAgEBBIDAQwOARADEDIBAQERMQsDAQUPAQgBBgQGESgBAgccAQF4EAciAQYILAQEBAICCAEFCggEBAIOAgEJKBwWJgIIAQIBBQQHBgVKAwcYAgoEDBUIAw4EMSkBIw4DAgYmAQcBDQ8QEikHAQcIAgIhDhwCAgMFFhIaBzcMBwsqExECAhUkAREBBAQECAQCAQIOFlQhHAwBNQ4GAgsLBQINBQQEDgIGBAIEFgkcFgkCBQ6HAQoCEAOaAjo3DcQBcRcgjwLsAQidAjozAgoecASFAgQC2gEBAWIQigEGmQEVogFDIewBXqAD+AHsAoUB0wMQGMIBEfABigLcAdsCHScEKzI+HQukAQEfAQMOF3ACAiuxAxbzAxkUwQGbAYwCxQK2ARmaAZMB4xfPPcYLiAYBAQKUBIwD9wLhBpgFrwiPCyC9DAGrA12MLpEviAy2DuIVDFYgBQg1ERE2JgYbQwhvrwHcASQKAnVuXwQGBEwGGBMGAhu+AQIYCxouEiaiAQICBBJ6JhUCFU88GQQkEhEIJIkBHBsBLQIBLC0CCUc6MAQDBAEBiwEKDggJDRoUC0EDDQElGxkFRjsEAf0BBwoCKBMCAQYHBiwYIWgDpAFLKFceBAQIFwFnH19DHAgmeQYfWQMJpgEQQK4BFBUXK0IJARXYARAmPSMiDZ4BZyIaFnRBdj0FChUKAwIGF40BhgEMOzkFDwUODAISBgQGCwSVASIucz0/C1pCEI0BVgwGhAFvGCQSIjQFFAMOBjwfOw8JMTAQGSwwNhICAsQCEwICAgICAQUKDQECFgkEAgEBAQMEBAMBAQECAQEBAQEBAQMBAQEBAgIFAQQBAwIBBwQDBQQECg4XAh4MCAoCCAcPAQECBAIPDQkEARcGAQUFFQUHBgYBAQECBwQDAgEGBQEDAQ4IAwsEAwEKAwUDBQMCAwEIBAIEAgICAwQVAgEBAQUCAgEBAQQNCwEGCBACCAYZAgULBAwEDAUBAQEHAwcBAgIEFgEJAgECBQgHBgkDBgYBAQICAggCCgEFBgEDBAIHAwIBAwEGAQISBAEBAQIEBAEBAQEGAgIBBgEBBgQMAgMFBgECAwECAQsEBgIBAwIGBAIBBQICAgICAgIBCQEBAgUBAQICAQcRCwcFAwEDBQMBEwoCAQEKDAYCBAEDAQMKAQgCBBMEAQkDBAYGAgEFAwECBgYLAgEDAQMBAgIEBAECBgICAgUGAQYBBAYECQICAgQKJwYKCgIEBgIEDAIIAgkBBAMBBAUIBAkFAwoCAgEDCAIQDAMLGxcZARgdAQMEBAMBAQMGAwoDDQMIIQIKBQIBAQQCAQMBBwICBgQCAQICCgMEAQUCAgIDAQMDEAMGAwEFAgUBAQUDBQIBAQEFAgEEAQQHAwICAhQOBwgBBRMBAQECDQIBAQUCAQEEAgECAgEDAQEDAQMCAQIBFgkGBgMEFw0lCw4EFQwVDAoCAgYEAQEgAQEEAgIDAQQEAQEBBQENAgEIAgEBBgICAgQIAgEBBgICAhAGCwsCAgICAgIEAQICAQEBAgcCBAIGAgICAgIEDAQCBQYEBgICAQUCAgQBEAsWAwIEBAgWAQEDCQECCAYCCgYOAwoIAwQBAwIEAgEBCwQBCAIdARoTAwYCAQEBAwIIAgEBAgMCAgIQBwwCAQQECgUFAgEFBQICAgEBAQECAQECAQECAgECAQMBAgICDA8CEgMFBAkJBQIGAhQKAgEBCAIMAgIFAQIEAgIDAQEDBQIDBwILCQICAQEBAQICAQECAhkIChYCAwEQBgIEAQMHAQoGAgQBAwcBCAcIAgcBDw4JBwICAg4CAwEDAgEFBAQFAgEBAwMDAQUCAQEHBAELBAEDBhQCBgYCBAIEAQQCAwEBBwUBAwICAhQBAQMHAQECAQECAQEBAwEHAQQGBwEEAgoKIQ0SAQICBQECAQICBBUHAQEEAgECIAMBAQIBAgMBCQEDFgQKCQIEBBoCEC4IGgQGAQEDAwQFBQMIAwIDAhYEAQMCCQIBAwYOAwEEBgcFCQIIAQUCCQ4BBAIDGgMBFAMDMAEBAgIWDQkMIh4BBBEEEgwEEgcCBQYICgkBAgICBAIBCgQEBAIDARMBCAEKAQEFCgICAhACBgQEAgMBAgEBAgQCBgMBAgMBAgIEAgQGBAICBgQGAQECGQIKBxEHBAIDAgUFAhEIAgECDgEBChUEAQQFEhcCAQYUCgICAgECCwECIg4FBwcDDAIEAQcCAwEBCAECBAICDAMBAQEHBAICLREoBAICAgQCAQEBAQICAgUKEgICAgcHAgoBBAICBggTLQ8DCA0KAgQQBgIBBQgBBQEFEgYBDQg6YAQEBQIKAQIBAgEBAwIBBQEHAQUNCQIVBgIBAwECCQEDBgEFAQUBAQECAgcQBwkGBAQGBAYCBgQGAgICBgQEAgICAQEBAQEEBgUOAgIJAwEDAwECBAEBAQIBAQMEAgYIAgMCCwgCAwQCAQcBAQICAgICAQMCAwIGEAMCAgUBBgEDAgQKBwkEAgcBCQELEwMFAQYEAQEFAgICAgQCAgICAQMBAQEBAgIBCAECAQQCBQIGAQIFARIFAgIEBgEGAQQCAgIBBQEDAgICAQMBAwQBBQcDAQIIDjEnAxcCCgILAQMHAwEDBgEEBAMDAQgFBAMBAwIBAQEDAg8DBQECAgIBBwoBEQIBBAEBAQICBQUGBRMGCAILCgoIDgYCBQYFAwEDAhAHBwcCMQEBBAICBgYFBAIEBAIHBgQCAgICAgICAgEDBgQGBAQEBgICAgEHAQMCBQIEAgIIAgICBAICAgEHAhABAwICAQcCAwECAgMCAgEBAgEBAwEDBw8CAgIIJAoFBQcCCQMBBQQCAgUQAQIIAgIGAwEBAQUHCQUEAgwKGwMEAQ4KDAICAgYEFgICAgYCBAICBAIEAgIEBAYEAxMBAQECCQIECgEEAgMBBQYFAQwGAgYEAgICBAECAQIEAwsEAhAFAQQCAQMCAQICAQ0DAwICBQUHAgcEBgIDAgIEBAwIGQsLCwIUCQUCCQMFAgICAQECAQECARABEAICBAQDAQoEBgQDAQQDBQMOBgIEBAEBDAEBBgICAgICBAILAgIGBwEDAwICAgQEAgIBAwEDAgQmAgIGAgEBCAIeDwkGAgMEBAQCCgoCAgYCAQIBBgEIBgQGFRkBCQ4BAQ8DAQEJAQ8HEQQEDA4CAgQCAgIFBwMBAgEDAgICAgICAgcDBwYCAgEBAgICAQEBAQECAgICAgIBAQECAQMCAQECAgMDAgUGAgIFAwoEAhMHAgICAQMCAgICFAIEAggDBQECBQEBAQICAxcCCAUEBBYJCQEBCQUDBQIBAQIBAQIEBgEBBwQCFAEBAQoBDxEBEwIEGBoQhwECBQECAgQCAQEBAwQGBxsCDAgcIAQCAgQCAQEKCwILBAisAQQPA2cuAhgCCgQBBAkBBAUHBgICAR0KHgQDBwYBAQYMDBBJbS6IAR9WRAIBCAcGAQECAioEDgwGAgIHA1ADBwEGBgEDAgwEBQEUCgQIDhYSAgIFEQQBCgYBCQEFDRMCBxQFAQQCAQcUCwQDrwElAgQGDwkCDQYUAQoJAQ4CJw4GCAIGAgUDAgMFAxkTBAEGAQEHAQoCBAoCBAEUAQgGAQcGAgIBWBwGAgICDAoCAQMUBgICHTppWgEDAQECAQECEiAMAgICBAICBAoHAQECAwQUCwUUAgIEBwEDAwQHQQIGCAcLBAEBAgECAQQDAwEXAgQKBgQGCgEFBAICAggBAQMBAgQCXyWZAkofBRYCBAIEBAECAwgEBhoKBgQeCAcEAgIKAQMGBAMDAgIDAwIWERIOExwCNgIUAgkDAQECNgNUTBAkAgoEBAICBAECAwEBCQQBAgIGAgIEFhYCIwGiAQYECgINSwEECA0MdAYCFgQEFAEFAhoCAgEHBAECAQEBAQYDBwUECAECAwcUCAIPAgEDAQafAQICAQ8CDAYDBQIEAgcBCAQDAwwBAQIFAQoFAQRnAgQCAwIICAIIBQIBCBYOAhVdBAcHBgQGAwUIAQUMBgYCFAIIAQgCAQQCBhQCDBUSBQYBAwEBAScDCQgSBAQDAQICAgIBBQgIAQUBcp4BGikIGikUCjgBUAICCAwCBAQBCQMBAQsCBwIGBwEDAgEEAwQRAgoCWzZMAgILAVMEBAQCAgIRAQICAgIKBAEBAQIHQCYIAgMGfAgCBBAOCB+MAQwGBwQLAxMBOh4CWigECJMBEwMEBAEFAwYGAwYCBAYBAwUCBggMAwgDFgICkAEBAQICCAEBCRsQAQwBAgQBAQELAQMBAwYMHgUBBh1IYAoEAQgcCwgLCQcCAQOOAW0/AQkBBAILAQUEAgkDDAkCBAIECAIGAgEBBAgDCAMBAwICAgIBEQEBAgEDAhAlDAUCBMoDuQIBmwqaCaoEKSAeAzkQCAGMA80CBAizApEDBQJ1AR0BAfYBBQEBAQJ18wOyAuMFUJYCCgHcB4scCJ8VyDHnMEoasTDLMQEBCAICAgIKBAgBAQcVAgUCARQFBAUBDQEEAQECAQEEAgICAgICAgIEAQQgBQQCEAEHAgQGAgQCAgENAgEBBgQCAQECAQECAggCAgIGBAEDAwECAgICCgYGASwSBQMBBAMKAgMICQIGAgESAgIBAgEEBAgCAgQCAgIEBQ0CAQYJAgEBAgMFBAYJBRICFQYUCgICCgYBAQICCAICAgEFBwUCAwEBAgsBBAEFCgcCAgEEAgICBAICAQECCAYDARAEFAECBAoBAQEBAggCCgYEAgQGFwIeBQMaBBIJBgQBBAYECi4GAgcKAgQGFgEFBAgCCAIUHAUOIgEbBj4JAQIEAgICBQYKBgICAgcGAgQEBg0GFwMDARMoBAICDwgDBAMCAwYCAgICDgkHAQIFBQMCBgIEBAEGCwIEBgIGAQECAwMBBQQBAwIDBAECBAMDBAkBAgQIAQIDAwYBAgQMBA4BEQYEAgMDAgUEBQMDBQUBBwQBAQICBAICBAIIARgIBwQEFAwbDgEKBwIFBAICCAIGBgEHBRICAxkUBwYZBAUCGAUNAQEFBA0BBgYEAgICBAcBCQIBASYKAQIBAgEOBQUHKAIGCwwCIwQCBAICAgIBCQQCBAICAgIBFxADAQICAgICAgQCBAEBAgEDAw4GAgIMCAcSAhYBAgUUCgEDEAgIAQYDAgQCBA4CBAIBCAMEAgIGEgoGAgIBAwIBAQQbEAMIAQkDBwsTAQECBgwCAwICAgEBAQwDEgEGAQQBAgoNAQQCAgIIAgIBBQEDBgICEAUCCAEGFgQOCQcOAQsEAgQCBAYMAgUBAgEBAgIGAgIPEgEBAgIGAgICAgMIEAUCAwYQAgYCAggBHwMfAwIDAQkEAgQCAgQOCgQEBA4DAiQGCAMEBgEHBBUQAh0cDAEJBQ8GEAEBCQICAQECAg8bEwYHHhMDAwMQAQUCEQEDJA0IGQMEAgMDUQYBBQQEBgIeEwEFBAIFAgcDAgwBAQYBDQIOCRAJAwIQBQQDCQcmDgECBQIGCAYCAQcFAwQCAgoCAgIGCAYCAgINCwICBAMDBgMJAgobDgIDAQECBQEEAhMSAwQBDg4KGRQdAQIDAwYCGAYMBgEBCAQGAQkCBAYCDAgNKxACEQMCCBIaAQ0JAQMCAQEBAQUCAgYBBQUCCwEGFAIECBEBAQMEARwEKhgFBAwSDgICAhgEAgEBAQYUBAMbAwUCCAwFHAICAgcFAgIEBAICAxILBAIJAgQCAgoICAIFCgEDGQEKAwEBCQsHBAIIASkEAgIVAgQNBxICGAEKBw0JAwIRBgMDAwgKBAIIAg0EAQgEHAIBDQEBBAMDBAYCBAIJDAICBgkCAgkBCwICBAIEEAIEAgQCAgEDBAoEAQgBAgIFAwgDCQIDAQIBAQMDAgoHAQQYAwQCBAgCAgQCAgIDCBMBAi0HAQoRAQcdBxcBAwICEwcGEgIICwEBAwoEAgIBAwYBBQIGBAYCAgkBBAIQEwIEAgQCBgEDCQQDAwsCBwQECg4BBQgBAwIdCQkEDgcEEwUBAggEAgcBBAYEAQMIGAMCCAEDBQILAQMEAQECAgYCAQYNAQEEAgkLBgIBAgUYAQQDBAQOAwEMAhgEBhQBBAYEAgMKAgYwAQEBAQEBAh0GAgIBEwIJCwYDAQYLAgICAgIEDwICBgIIAgIKCAETAgIFCQEIAigGBBkZBAcCDQQEEgEEAwgBAwMBBQIQAQgGERcVAgEBAgICAgICAgIEAgEIARQIAgIOCwEIEgQCBAUGBQIFDQIEAgUGChIYBCYDEAILBAYEDgQGAgYCBgUKBgIGBgEBAQEBAhwDAg0CCAMDAQECBAYEBAIEAQcMAxQCDREIAQEGAQsJAg0BAgMBBAQEAgYDAREEAQEEBgQICQIGBw8NFgQEBAQEAgYCAggJAgUKBQECCQ8CCxgBAgMBAgYGAw0FCQMBBAIBAQIEAg0CAgkFDgECCAICAgQCBAQNAQMQBgECBQICBAQGBwICBgQCBAMEAggLAjkCAgcCFAIBFQICBAICEQIFBAwMCgoCBgsIDwQCAgUEBAECAgEYBgIBBQISAQECAgEBBAIVCgsFAQ8BBgQBAQICFfMPAgpARwoCWgYsBA4CAgIGAhIWFDCGAR4kWSMkBgIGFBYCBCsOCgoGBgSTAYEBYYIBKxUEBGAKpgEKQSF+EkogJpgBEAIjBA4EDgMICBICIBQYMRgOVwQMBg4KPiEZEBQaIhooWgICEBsCOxAWAggMpgExJQoFISIiGgQoWhwJZwwCAgLOAQo/DyACKAQWClgFFSQCGgRzCFIpZncuEAICEAQsEDugATAOOhQnmAECDgIFEMoBCAIOT0wcKAQCNiAImAEEQiUyAgJVMhYJeosBHwQeQJACEBAaGQQGBBcCHgYQBSACMhkvMgI/anRLEAklBhICCgIEHyoYK0oxIogBcD8SBgogKgIoDlIQGR4SAhcCFxGEARIPIQEBIz8BAQQEBAgEBAEkEQQLAwoOAwMaAQUMBBgWASorHQgRBQ0CBAoCBggDAQhIAhQBAQULAxACBAQCAgkBAgoDAQUEBwQCAgEFBgMBHgIIFQIHAQQCCgEXEAMBHgMHEQQdDRINGhoOMRgDBgYRAQwIBQUFCAMiAgMWDgoCAgEBAQECAwECAQQBCAoFBwICAgQCAwEDCQQTAQEIBAUSCgILCwUSFQoDIQQIHwMeASURFA5JEAgBAgcCBwQCAgEDBCALCQUEBAcBBQUDCAEBBAQKCAEOBgQfAhcRBgQYBwoBAg0FBgEbFgsBFgMGGhAaCwIPBh4jHx8wAhESAgQSCwIEAgIBAwECCwIEAgIBAwECJQMBEAgCAQkHCAQCFRcZAUEFDjEeBQsBAQECAQEBAgQZAhsBFhsBCQQKBQICAQEBJwIFCAsGBQICCAIDBQUBChQMBAUFAQMCBRURGQcWBwkBCh4HAQECBAMDBAIXBhsFAQUMAR8DHwMJChwMBRMSBwwJAhQBEgcSAgMCDwgHAgYCBgICAgEDCgECAwIGCgILAgYDAQEFAQELAgQQAQgkDCsJBAUFDgIUAQMBBwEbARoLBAtNEgEVAysKARsFAgEBAwQBDQMOAgIDEQYGAygDDCgBFgMEAgQIBAQCBAMCAQEBHA4DJwYHAzQGGg8uEgIFFh4DOwENBgoGBAwMOwEBCwIGAwMEAQsOHAQBHgkIFQoWCBUBAQMDAQFfBSUOAi4dFgMJCAMBBgMDAQIIBB4CBgICAhcCCwICOSIBNgYNAQESDREBBgUOBwIBBQQLEgEbDC0QFDACAgwICAgKBwELBxcBHSUBCCcYAxAFFwkIDAQJHg4bAwcZARMIAQEFCAERDgQCDAEaLwYMCh0DDAoTGg4BAwIPCAIqfAkJFA8DARgHDgQiAw0UDAEVAgIICgICAhABBQQEAgQCBAoBCAgDBgYUIgEBAQIBJxgJAgICAhEBCQcEBgQECh8IARUQAQEKCiMEBhcMFBUBBQIcAQUaAhkFBgQOAgYJAgMXAQkoBgwXASENCgMBAQYPAgQQAQECNQMCDgQEBgoDBAUfJCUCPQEBAgwEEyAGAgEHAQcCEhcCAQQCAQIcFREREhoCBgEDAgIBAQICAgwMDAYcShIECBIBGAUBAQICEBwODwgGBAkQAgIqAQkCHgEDCAIWARcCBAQoFzMCDwQDBQcRBAgCBAgJCg0JBwcBBQEBAgMBAQEBBQMBBAQCBQQKAggBwgPAA7AHb64K2ws54wmuARRx5QRHlAW3QqEPcd8B7wECDgQEAqUBLwqqAQgoG6IDE34CEwZFBmILIK0CCAqeAaYB0gEEAgICBgECBAECUNsCBgeuAwIgApQFUCAsCWMQBJMBBAYEAgIEBCgDBQnUAQkuEgQUQg9LiAMCBCYCAg4CJwIHBQQCCgPpAdoEB0cBFN8FUAIKCgIIBgYCAoABmwRjGFZ6GAS1AQIEmQI/CgICSnp4EssBsgEWkwEm1wIDAQUTAwNRBgoSFiVbNIEBAY8BGEMVDga7AQs2Dy4ZNgk8GREMBgYECAkgM58BRzNLFDRgCgICDgoCAjgnCEW6AQRKJgISCwoYFQIQBkkPXjEpmQEZkgKtAS0GAgK0AQSPAZwBCgIGEAUBKjAHVPcBDh8shQFPwQEENEkSDJwBMQE9LAgID8kBGmgDLSwbFKsCYGlaDgMCBoUDSgQErgJKDSQ+VxwCRAINNTxhZWNuLgaPBo8e5SauBQK2H7MP0xcB+gsejgnpEqYQiAFstATiCp0hugyLAWIvDQcBEBACBQFVFAIWCCGQAg4qrAMXUDQCEQZvGL8BDUQC2QIKBAMdA44BxQEBBAICGg0IFAhxMTTMAgUE6gFvggEECwEBCQqTAgasAwIXAgIfBAhnPekBLgHYAjMg/gNY5AEHJMoBNiIiE8UC8wEsBBACBARsEDIBLwQEAgICDAL+AeUDDhYGFlkCAQEEBQGxAZoBMj1NBgYWBJYBBg0CARBtAgIeApcBrQECkAqyAq0C3gLPAtoIJwGbAoAFAgLbA/4YlQeLAaIBLakB8wLkA4MIyAEDAbsOQL4KMwLcAoACpQcXW+QF8ATgAQUJMS4CBK4D4BkG3ETtOogqjSOqDPkYwCOGQ71L2j4gCmcVIl+eAfkFkwFcpAQEtAEyAgEWRr8CAgIYAgKiBDICAusBDL0BGpwGBdsCHvEHP6kDwQEahwEEvAKFAQWZAfsGlQIb6AIIogEDmgQCAgYCsQICGQ/2DEXFBAIaArEIygXFA4UE7APYEekKCEg3CAYOCRQjBjQCCAoCEQMrJQ8VBEAECAQGGkQlDTICAwEWAg4OBRMENBUBELQBSRkGFRIIAgITHQRgLA8GCxYECQYVDUMNdQECBCQxCRQPBgUIGg8wEQICAgQODgoSDSABBggSBjoJAxYLLCcOFAoZGBheJA8OFBgCAhgCAgYCGgoICQICAgEbAgoXGgETGDIQFAIGBDAjFyIoGQYLDwgPAhgWAgUMKQYgGggMBAYGDAQCBgQKHQwEBRh/Bw1PDQUUHgICAUUrCiNmIiYSBAQWNEkCIwgKBQECCBcGTSAGCmMQAhEpEjcfGxYEMh8tIBsUEAICHAIKBgEQLxkfBywoRmMeHQIFGAQiBA4WBisaAgImBBgtFhkDLhcZBwUEDgI3ARSKARguHxE7GgUGKgcWCA4GBDpVIkMCGgoKAwYcIwoLBhYKBCkRKgiwATIDcA4CAgIPDisUDgIIHxYvEgksKgoqDyAgDiIeQBUvAQQBAQ8FAw8RCAEQAgkPBwIECiMfZg81JgwOLQQGLFIhHx4BDSYCHEZmAh8MDwMQAgYEDQgGBxQXAgIUMB4CBh4YCiYUQwYUBgIYAgOPAQr7Ar8CvwaVCAQEAgb/A6sDBLICfuQFN7oBmwFolQ5O+QSQAdMMJrsFb9gEkAHDBxSSKMMqhkNQpgq/Bq8LogvoCQKkFegctAuKLrM4tROIAgHgCZMFwgS0Axa+AjqxBrwGogIBARTRCY4C8wGFBJUIiwEoOjISEAEZNxsBFBmcAmQEbMUCtgGBA00nIDY4MLABtAIcRpMBkQFwAj8GKQghGQIGBgg6Bgok3gHuAQQOAhICzQEdU+kB1wGhARElezAMjgIvvAEcK211oAEBLy3QAQQrERUVAhUODiMcEFYErwKGAhvXAjsEBCLIAXwZBRMVFZsBFQEDCQ2TAeEBrAHRAiydAwIhwgODLqMB+gKCDIYH7gbfBpEdBATMOLozRj8BHQE1BYMBB5ABgwE5GhdlKaYClwF0CwcQDAOdAQ8sCY4BBwsXDhkENBsBigEmNkAtCsYBVRwFJRkDFFB7BAUfCAkJBBkCHBECEA8XCgJMaAyIARNQIiKCARYwfQcbeiW8AWASCEEvNUUiBzeWAQZFOwHUAToxCQcICJkBEVMXJ0ZcKI0BLMQBLdoBYhJKE5QBSAk6tQGEAWUFDxMBIg0CA3wPCgYbJnkENoQBASdqbl4PCh4HAiEgTAgUKjERIw4iDi8SdBAOTxEXBGICF2sEXzQJTwEBAY0BDNwBASloIEQuCDcCbxAEc2WlAQICCOQBAicVd2gYDwJxAggGA1ETJbIBwAINKRwdJxMFCwhWpQEOBAECKwEwAQEoBAYEAgEODlhRFEUCBgEuBQgYhgIDF1fGAQcCiAICCASFATNBvwF3BhdXFBBJggIdCQJ7Ui0cbjoSEUhcHgIEIcMBCiwqAQw0BAYY5wECMAIBFQIHKUlUnQEneAMBETcGOjK8ATQQExcFngEMAmTFASUZjwEEbjZDEAEoBjwCAgEtByOpARAyBgSBAsYLtQOrEJ0DjRXIG7ki0xiPAbkauSKrC5EmAq8F0QNixQfBAZMByQIeDj2XASAVDjZTRc0B6wEInAOmARQCCgIjQOUDAhoCQVmUAdgBAiwiCn8wBHsGBr4HAt0B4gI0XcABjQNQkgIDmQEGAgcjmQECAiAQI+wC3QIKFvYDDQLuAT8DDBQYBLQD8AM8XWlk4hKqOvUNrgPiCfMHOYUEH6sCiyaOBNcBywLFDUzWASa7AYcEiQHPA+cBsAIFCUGrBKcC+APyAzMBDAERCZ4C9gfDAgIGAuEGDvEEAYgBQEoCBskCRQfuBKwEbh9fCgEKAowC3wbvDvE5rD/GI5cTihTLHc4O3CvnSs1IayCbAh+wDdkG3wcEB7MB7wSwAu0BS58HpAOTBaIGAaMFBAYCCB4Q2wFSAq4Dny2uAeUlkA2fFM4X+gPlK8gbvBuhE6dChiiDD8AbtgMB9wt/BghuFssBvAimBAwS4AwCBpkL0gGMAfIBXUUH7gQNnwTsAQEJAasCArQR+yfBDwHCIPwgjTjOF+wXtgPrFI4K0QQMxiAavBsM3UXuN4gp0zn9OYMD2QLtAtwChxUFee0SkgZ6ArUwyguxCs4LyiOKE5whjwbED+IskTACvUvZAVImCpgE1AGiBucDmQMBthCdBOgFihXkBIoBBhACCPo3ngPTAp8CAgIGDgcBEgrlBc8BFEAOCAYKApYOBBTpFgbsD6ICqRncBZsFuCanFexIHwELAQQBCwELJQEByQEjBAsBEAYtJs8BAQEBAgMMAQgMAn3yAQgKBAIQEAyFAQQGFDgMDBQCQgQJAQEGBAQLKOwBFikQAgICBAgCAmACBgIEBAQCAiABAQUBCQcMFAICBgUBAQECJqMDZQISEgICAgICAgQBAgICLGPVAQsGCgQBAi6nAgYxARoFGwEBBAEBgAK4AQEYAgoCBQwBxQJOAgSYAgEUDgJfRRQCEA0GAQEBLAEfQhQDCAQMBAECBQMGAgFmAgkDAQQFEAQEAgcNDQMCAgF0ARkBAQIBARspOgYCCAazAQEaARIDAQICAQEDAgECAgShAQ4FATbwAQh7HocBAQYBGggBuQEQBgIHEAxlBAIJFgQMAQIBAQUBAQUPDAkBBQMCAh8BmQEBATcGAgICBgYgAwEEAQEOAQEBH3IECgICDwEaHBkQAQUBAQECAQECEQcJAQIQAgUEBAIgEKIDBAERAQEHNAEMCwcCChgEap8BIBgBEAUBNAYCAQECAgMBAQEEEjkfHwICOQEKAgQLCAlECQ0BAgICBAIeBAFsBBMBBwECAQICAgkBBQIVOxA/HwEBAQGODhQlEsYB8xbzAeUDggzKBMUKhkORArsJ0AR0ZbID3A+tAuII6AyzOp8dgxWoME+oAgrCAQICDAQCDgZWbgYKmwM9tQGPAQICAuwCkgEeDowB/gInUyAuvAFXPfsBIg8QLBIi2wKPASoCyAEIAgYOHxUCBwMCBkAYBgoEAg2oBAoIpAEWAoUBuQHrAgKfAYMFTCSkBJsBGBwEBjQKAgo5ywIKUrMCFgoOBCX6A3UNRMQB1wpEM1yzCBzeA9gOV5wN8wwQxATZBgoECJgKCsUE5gUEBqIZDKcVsSLuJgKjAccE6TXRBtUz3waXBIoCugiOBtkNkAPVFnfBA5MEoAT/Kx6LFzDJAYkjHmMOFwIEHAXDAQICDQ0PPgQECAoIAgIEAgapAQIPAwUUSPYBBi4IiQGwAewCBwIIAwMCRFAGAp0B7AE7GgQCSaMBCAsFrQEDCjIOAQGWAQQScpUCywEGBAQBAQINAhBCAx45AQ+jAxAhBrEDAisBAxieAS4CMQH+A1MHrgIQAgQEDAFxjQEJBBoCDgKBAf4BDNgDAiAgiQEQSboBnwEDAhoQuQXvAk0UYGHmAsQtDNIPkSTVI5UDvAyMBRzJGPQKzQiKB+IWggfBDe8Oph/hE9UfpxurAgK0EfcmxRABrQusDu0KhAnNBqwDmwPJAacQ7hJuhQG/Bgq0BfcHsALaB4IJ/iGdA8AC5w6jAewDtwLwA9EEIiASBggCJsADHEoK3AJVvgJqpQMC+AJknwECtAKJAQHZA/UCDRa0AygOBJwDVvEFlAIMpgSTBQUVtwECBhgBAwNJrQvqCsIY8RqaEMYJkg4gEAIEBvoHwQPwBO4BzQIOqAKlAlAKowPPAZ0BVkQ8DioC0AGeAQTwAT6OAQIkARXOAR0CJEFxqgpO5ATVAWO6AYkCN2AMoQIElgMBAQHMAls6b/oDWBoIAQ0MCeoBgAG8ATQBERUWAgIBC3GBFqYWvArjDwQ4KugEwx/qEDQOiQHEBs8ZEAPjBL4KqgOYKB/5EsUGgQXrCYsFtgKGEbUBogTeFV8oZAYGOoIB1AIBCZkBkAIEFAICgwIjCAR50AIqyAHYAQwIqAEcpwQnCHYeXwozfsQBrgIC0AKVAbcB2gSeAQIYBAcLyQEEAQFrpgGXAq8BBrYCHkKNAQbJBKwBARGTAQsHA4UBfgEB7QG3At4CpgEKpQEGTfwt1wKlEe0i9CzZAfYW2gGDBcMG2QP7A+QDUcwJDogBkwaqAfkDmgHUBJ0K5AGtAfIF9Q+KGD0QAQECPQQELmQCFAEQCwIBAQgIEAFWNAgv0wECEQUfBAYMU20HAQEEAxLZAkcRHAdBZwgGYAIPBgcSAQEltQNNBgwYExYGAREKIipGAgYDEQIGA1VGF19VC24hAgQGEwcEJQgNBxw/AwQYEFECAgYCKwamAUd2EEZndQIaF+4BAZoBAhQ4gAMEDLgBAg0fBQEJPga/AQK4AQUBAQEBAQHoAUICAxACCwIbAhcoBJUBGh8PBRBQDCUIGQq9AggBAyYiOjsCBgEBBQRaB20VBggMIBVEPgJJqwJmHygFAWeYAT0EMwuGATN8DAQCEhpSBTMCgQECEwphKwQCDmc7DRwKtyLaDpEKvwemCAG5IvIYqTrnGLABoy7ZFByXNIob0hR6qwUEmg3JBOkDsAqcDNAShwtIzgeWDpIoYkqPA84BAvwHxguYBQEB0AN1gwoCvwLQAWbHBwj/BvAGvRXzEr8e2xKfAd0B2gnBEN0DxROgDpMxnQjfBtsIAhOACKYDAlGIFc4XyBubKQKiSY4lug+tD4oXoQ/iF60GRrQB0wedAswFdKUBCGDUA5YMEewDXNAGbUf3BW/RAvwFvgNCVdYD0RmBL7YQ4zL3A4YNBBCFK8gN0BaaCN4D2APnA/8BNowFNJECvBv6IJUa8j2rHwEFkQS9COYD1gPkEZIEpjKLCOgJ4x4QCAQMCAIKGQQIAwMLAQwGAQECBgICCAQFBQoXBwwEAggCAQkEAgIBGAUCAgIBBQICBAICAgQEAg4EAgICAgIGBQcUNAQbDhECAQdCAwsEBAINFRYFAgIFAQECAg8CGAkIAgYCBgQCCgQEBgQCDAICAgQCAgIGAQECEQECBAYCAgQCAgICAgICBgMCBAICAgEHBQMCCgYCAgIEAwECBAEGCAQUBAYBAQIDAwIEAgwCBAQDFAICBgICBQYICg8DKQ0LBAIGDAICAgIEAgYKEBEMAgIEBgIIAhIKAgIGAggEAgYGCAYCIAIGBgEBAgQCBAUQAgQCBwQGBg0KAhAYAw8BCAcBBAQCAgICAgQCAg8DAgYaFAEKBRQMBAYCBAQCBiAGCAICCQwEAQESAQICDAIEBRMICgIDBQ0BBgsEBwEBAgIEAgQFAQYBBQYGCAIGBgQSBhYCBAIfLQIBBQcPFQYGCBcOCgMFAgICAgEFDgoDCQMCAgQCAgIEAgYEBgICFQICAQEGCAIEEAIECgIKCgQIDAoSAgcCBAIEAgwCCBABBAICCAQCAwIBBAICCAQCAwIFGgkBAQMEAgYBBAEBAwEHAwIECAYlAgICAgIRBQEFBgICAgICAgQDBQEBAgICBAQEAgYBGQYZDQUBAQUWDAEBBAIBAQQNBggDBAIEAgICBgMFBAYGDAYGBQEIDgUDAgEBBgoGOgQCAgICBgIBAgEIAhAIFAIEAgIKAgIWChoEAgIEBgQMAgICAgIJCAgCAgYJAQICAgQEAgIFBgICAgIEBggGBA4BAQICAgICBgEEAQQBBgMECwQBBAEGAwQLAwQCBAQCAgQYCAICCBoZBggEBwcDAggICQIZCAgeBAQEBAoFAQcJFQENBAoCBQ8MAgoCBQECChABAQwCDQIjBQ0BAgQCBAQHBgQCAhIEAgQECwQFAgsKAioIDgIHAwgCCA8DAhkEEQQNCwIEAQ0QAgIKDgIGBgIIAQIFBAIXBAIMAgwGBAUFAgIEAggCBAIBAQICBgQCAgIEBAICAgIGBAYEAgYGBwcCBAQCAgoDBQYFJAYCBgoCCAkXBgIUAggjFA0KAwQFBwYIAg4CDQEBAQICAQECBggCAQMCCAoBAQQCCg8DAgIPBBsNBTkICwkCBAIEBAECBAoPIAwWAgMfAgICCgEBAwIPAQMBAQoCAgICAgIGBQcDAQoCAgUPCQgEBgIGAgICAg4GBBIIDAIEBAgEAwQCAgYCAgQBAQQEEAIjEQcMBBMpCQYHAQQCAgIICgIECAsCCAgCAgIBBgQECQwCCAgUBgQIDgQBIwoGBkBACxsVAgERAwoCBAYMBAYGAgYOBgQEAgIGAgYCAgYKAgQEAgIEAgoSAgsCAgIEAgQGBAICBwICDgYCAgMSAQICEAgCBwkDCQECBQoEFgYTAgICEwcECAIUDgICBAQGAgQCCgICBAQCBAICAgcFAgQGEQsHAgwKBQsEAgcEBAogAg4GAgICAwgBAQICBAMECgMFAQMMBAIKCh4GAgMBAggEBAQCAwYLBgYCBgIIAgEBAgMBBgIFAQYCBgQICAYCAQsMAQUCBAQEBAIEBAwCAgICCAICCgIEAgIIBgEBAQQGBAILDAoCCAQIAgILAQIDBBICAgIBBwICBAoCBAIGAgQCBgICAgMBAgIBAwsGAgMBBQwCEAICCQEJAwICBAgEBQEEBQMBBgQGChoCBAEHCQ8QBAIFCwIICBYHBQECBAIUAhYECAwYAgICBAICAgQHAwIEAgIQAggCDAMDBAQEBgQCCAIEAgICBgUFAgICCAYGEAEBBRYKCgQEBgMGNwYICgYCAgICBA8aCx8DAgIEBAICBAEBBAQEBA4OCyoICwEEAgEEBgEJEgwDAQIGBQIICgoGCAEGAQECAQMCCgEMBAgYEgIIKAkfAQECAgICAgICAgYCBQEBAQYEAgQFHgMCDQYNAhEBBAYBAgECBAICAgkBCQIBDggJBAICAgIEFQQCAQINAQMCBAQEAgICBAICCRkEAgIEAhQEAwUCAgQCAgQCAgQCAgIGCwUECAwCAgoSCRMIAgICDQECBRQCAgEFBhQECBAWATsBAwHwLeMCBIsWzC7aEqEY2RQc9B6YBAEQBJ4C2wIGFAaND7IC2AODBgKQA7oBgQYQDhrZAtgDmgUEb/0CDhcHqATuA4cECQ0KpAL5AvEF3wrRFewYnwGeLizHDxgEqQIID6YHmg7zEQLGD/YRAsACsha7CQzlAwLjGgbFGYYJgAb6DN8KtRfYCbQV4RC2BIkLAqYBs0LMC70wgi6fD6ZE2RmOB7oI/RH1BowQJL0BpQ2PCZICiAWmGKcCmgkruA9IJC28DjPOBtkB8AEGmBqPAaMByAGDFZgD6hbCA+s8hwHZGPYQpQbbPgLYA9sFGARo5wKjBPAGHEqeBQwQmAGVCpcJGgwMDAECiwwLDAMBAogDyAToA4IM5AmgEtoHgQzUBgIglwECmwfKN4dMrCbYBQcgQv4O+gi6BgEICLoDtgcJBY0GhwaxAwmECgTWLfAY8Q3eCu5A+AQwA5EDjg2RAhdPhgUZewQIHwL/BJAJKwIM8Qda0QO1AQFy8QIm3ALhAeoDlQNGoQKiAyICGQVp5AGZAiObAf4BXswBdDh8+AEHA5gCjgELTSZOhwEUqwKtAYYB9wF6pQG3AosBQJcCCIoBDoEBxAE9lQNMggIswwFJRbQB6gERR4ABOSZ4O7cBYmk8Y0/IAeUBTmEZfEpiV1j3DdYu+QvZBSQ2mS3/BpMGuSLHLq4H8hiAO+IXqyKmJI8BAgIICKQCMxECmgIkBgItAgQCrgSDAQQCAvgBfAoByQGyAgGwAzqrAQJuCi58AQEOAgKvAgIRBAMCAZwBEBKyAfoCBAQCUUIEAgQECIADFBIKAgQGCAJy7gUCLgIfmwMQVSQEEoYDAgHeBAHhAiEJCgEDAQEBAQQCAQEDAgIBBgQGBOwEm0fBP84dgRvRGIMIuD/yJMsGjQSzGLoVoQTgC6EX/A7IG5wByTy4H5scmzTSB8kOlEOmAfAYkSKZIuYbrCCGAQsCEcQBkAELKAICTM8BASixBJUBCDFEoAEXXwkTsAF2N8YBHzgcRGSMASgNGxwyAxQKAiUCoQITUCIiMgM3LDB9Ip8BvAFIAigIIQQEAhACAjE1HwZJN4MBXjwNEAIKqwGDAQiZAWTgAe0B5QHAARp0XdwBDwIG4QEpW3lDAn86Jnk6ahv/AZ4BjQEIPjERI5ECYBt72wLWI/oDM/wBqBLXD5MBnxOdDLsB6QsY5A8C7R7MH5sb6By/DQLgCxhA1wGlAbYFkgGkA6ICAgHWBU29AvID7wfQCWQ/igFQ8QHkCJ4CmwjzAqsDnQGfAxbgAvERkgbXA4wI4heTEr8Y7wTkLpxAm0r5NNIaowGoDQSpCJQauhGDD4ME4RebAQEGAgQDBQLOBQKgBcEYlB2XAaEUugMQH/kHkw6hAq8DhwWjAQMDA2ZzCCEwFikIHRoMDQQFHG1/iAHDATSeAjUcOAEQBQgECuwB1gIGsAFCNRACBgQQAgZDowJAGhN9EEM/IgogH0cCEiJhEm4VGBYyCAMmZEtrXgelBAKmARAQVfgELK8BFg8pJc0BDAwMapABBCSIBXMFAQwNCkxz1gIKAwMKAgwrkgEBAYEGAl074AFsohwiox7HA6sLpwOqCZwXzAKXDN8H4wFA2geoAQqqAzoG1gcQIgT+BAYcBuYDVewE6QMN+gLUA+0KAskBhgI4AgIOMKgEuAEKsSDbC3wCkAGzAfUBvwE7sQLvAQKCBSLCApkEQ1lwCuIDihYiBLsF2QGCA5kEkAWtBAKKA0hnLS8b1gEK0gWVAtUFoAK3CZMBBFSZC9gDD/EE3AXtEQwOgigC8SfhBNEChz28NssGzCcYAQiZBfgT7zZXmwsivhq8G/cQwQSLBALjATGuAo8KrAh+AbENZrsFApgDMgLRFooC2Qa3B5QV3RQcvCqnEYsJoBmpI8QYuReQC4sNyQf6A9sL9Aj3AqQBBFe7CjwCywTKBgIagwMzvw0E1AW8G+cO/xgFBs4czSeHARwGChgCAjAgRIgBb1NgEiwoHHQESDmRAYoBExYCAgIulwE2AyEGkwEKOxjAARo+FD0cEgYjnwEZHAgcHwOaAWAgCg0GDRZRAgRRZEZZtwI+NhYnJgQEKB4CtQFyEicIA70BCGQkOR4CGiYdHk4GGNkBGS8iAm8HEDMKMo8BFzJJjwEcBibIAUACDAYCAlQRAgQCDtsBV148vQFpGhReAhBaDmwGEx5JAQECAhoKAhAWVWZUSAK+ARYSKAcYMzQKC0kSCA8CBpEBGDIoqAEHDgciJgICAsABBxhGvQE8IooBFH+FA2L+AQ69AeoCL6QCLBwXNAnYARzsAoUBkQGgBdwB0QElqgcEBAQeINsDyAjcAQHwAgLvA0gEhQLJBNUECo0DvgIDjgQCCskB+gHgBekDZeMDxQLgDOIDgBZQowLTBPACBKwBDSkTAu4DBgIICNICAsgCEIYBHn4gmwH9BLAFxAKxAVAKe4EBeWC/Bp0GbPABA6AChwGpBDi8ApsDJ5cDxRUBAgHRD5QPxkjPBgSPAgREwAEpvAO4A5ICEOIN2AH0C9kBtQGDAu8D3whs+wn/AqYBIocOxg/iBZoUrAG7KQMC5QOUA5AD2xz3EssGBsRFvT3nHoYV1xXKC/0u0hoKQyAuBKMCEiES9QExoAFBlgK7AQKIAhsJEQMlhwECBgYEBgJjCA0BARMJIqsBPTYrqwEqCAQONiCuAQdcLDIFGQkDGxQPAjkiBhgIBAIbIg8yAgSJATgvS1o+IB4TEVYkb1EXS2gWFhA2+wEMAww0AgEH1gE3DVZ/LAswiAHfAXeFARYJVqkBE24TKAEnPTCWAtMBIh5AECICIU8dCk+AAVIKBFwCKAsBAxYRQRojMiY0BDBXLFh2BDNYJwIVAp4BFa8BTgaOAZw3tQb4BCGdAuwBDvQEHEmkAr0DrQk8NrQHqwdfoQadAxCCBJoEgCDbAvwQ+wvUC8sB8wTiAx4bnQEFbwE0iQMMBLMG+wIBMSPFAwEBIAEBywMDA/MCgQQMGAO1BYECuAYCBdEDAe8BGjQF4gEnEzsCAdAExgLtAXCbAQEIlwGzIrMCljqJBLYs7Q7/CM4EIvoSpkPTBp8LAf8J/QJUxQMixgaKBBvuFY4I3QLzBOEGiQO+CYwIA9EOgAzcAhM80gS+BgEIlwGUA/UT2xgM8QSBI4cF+wOZCjb5BfIBnwKvCwRa9AEGogGLA+EMmwXkAbUC0wHvAsAEsgTbCbADvQMivAEoggLoAs8G0QGXAQzHDgI/YSniCJwDsAGgBO4FWFihBOADtgL9Ap8D1BMqBLYBtBHzBqsHAhfSASKTBbQD1gWTAuIIApkcYMAj8hjMAYsPixW8DRACvA3tFBluawILuAG8AZsEkQIBBy2oAmGIAU2SAQJMC3oWAfEBAcMCOBoBAQEFGhkYtAIKYA8BAwEODwEDAYUB1wEgBAIpHQIEqAEFWitB2QISugEDxwMPjAFTgQIaqgGcA9gBAgW3AZoCAZ4BPRQBTQXqAR0BDgQCEwchA1eNAwEBgwMadAZ5aQUPH04BFhMBDJcBCphGlhOWE9kTAgIslgSsIpYTlxOHAYcBowG4A9MC0gcB8wbvBLwSuA4CnwaqB7kQjwHlIq8DWvIH8R2wD+cXtSzgGaIvAqkSowGOCrYEhAG4BLYCJ5UD0gW4Cd0C4QavAYwC4wNWuwG0COEG4izwHQYatAUaqyGLAd8UHMoLgQS2BSaHEDfeCLsaiQTKBQj3AQHMDiMCIMEMAgJpAa0n5DyTIFA3CAQCCgQKBhgDHwIfDhEKKEgCMwEaCAwICicQBAYXDQgCAQoWCgkJAQQCCF4LAgIaAhMLDBABGE0PHAsOOwgCAhCkARBTAgYEFwIEAgYHDkEzUBYCLQwBEQoJAiwDBQgGCxpBBAQQBiACA04CAQYQAwMaBFZdX3EnAgYCDAICBAYCDAICGgIICAICCgkBAgQBLicKAgISGhI5AT8CAREMCwIECA4mBAQCFwQEAwIaIggECxcIFAkCAxkBCgggYQQOYgIBBBsCAQQMQBQGBCMPBCFxChFYOREDFgQDARADIiUEQBIKBgQSBAIGCjEFBAgGBiNMQB43NgENDAwQEAYQHAwMUwgEAgwQAgIEEAQIAgIyFwIeERM5HQcMRgUIBgxEBAIcAhgUCw4EAw0CIgYGCwEDCwIHFAoCRAIUETkiCAIiBQIHCQMiLBQVBSM2SB0HIgYIJQEDFwQZPhYGGAIlKw4CFQgIAhQCGAdEBAgCEgkDHwQQCgYZAQsCEgqIAyUPBAIEDgsMDywMAgQiPg4LASUBEyQCBQ4mDigEQEoJMlEjGAhBAxkCFBoJARIPBxkGDSQKBAcBAgYFDA0ZKAQGAhAMAh4YCgIEGQMCBAEFJRIyLQYSBBgJTw4DCwsGDBwEEgIBGwIMAgUKFgIqAi4IMgQaFwMMVQQDC04I+ALkBgICCJsFELkMArkIxArWDPEEkQKtBcIt3wGlCfcC1AOuF6YqkALdAgaAArABoAKyAp0BS+YDHTGWAhqJAe4BOHXYAgMfA4ABF4wBwAP9AYkCe9YB9gJYxAPTARFM3wKBBKwGsASwBATCAZACvAujCRyEBqQSBxhBwAIE6AFA1gEYiAPGAacCSxJ6qgFxOLMBsgEdBVyeAWB9FzZEpAFmASEBnwEljAFBHSA+f64BCgRhrAEzbLcBAQEMNieVAVcK9wEBERCCAR55AcQDbQdBSB8WtgFcWuICbwxqFicKKyQBwAIByAE+ARwaFwJeRQGOAR9yODglGD4vEwIPFgIqAgFRvQlYjwvwGSoEhgPACKQH6TxJBgKCAQaeAQoCCgpeCiFHcnLVAWgPAaYCFvQBqgFdGAbhAiDvARweIwQ9CgwIygEEQAUpHQccEEjPAQQMlgNEPj4gJAFpcwhZCBRU6gIGgAECDAQCGgoIwQK3AbkCNALrArcCgAFMJC8BKAMJoQP/A98B0gEQiwEWAjMWMwlAwQESlQF7DgcKYEwEQBYhL88G7AXYAv4EApUBmgPWAbIC9gqiBRArBI8MwgGyB8MC+AH7AfwET7IIwBCyCAIEhQEC6SDcBW/2AQYdEZEBuwKZBlsEOhEMEQEi/wGnAYQBywmEAQLjBAIE8wGjCHkDM9sQAf0I7QnMAc0ILAEBvgUu3AHzA5cc8QG9EUwC7jziEooovDfHQo4qiBcQ3QEVrQHkAg4BWDAKggQvKqcBR/gBqgMCDokCkQII8gGCAaoCBKIC0QOdA2L7BLACgQExbMQCZ3i8AesBJGIIPWwEuQESAhwCL5gCwAQOEJkC6gKBAa0BVV1LBCcdEbABbAK4ASwVBlp4lAGPAhJEFvgB0QMD1wEEA64BHM4EAikB2wGoAQS4ARcGoQTmAQEIegXIApgHAgYWCnDaAQGuAYECrAIEJz9SM5UBYgIUS40D/gG0ARYCEQoB2AKPAt0BDziLJPkBpAuhDgK/BdkDrAHsDJcD/QGjEOEB8xHWEPsF2QTSC+YB2gvcAqkHyQZrlAS3BpAL1weoDZkX9hX5Eq8/nSrGDaUC5xfKAcQmtAXlEcUQEAKsFewClgmeMoIH+AUxA/0C9BXnAd8KMz23DAbACKMVrA2XH6kRBNURlQeRBoYZlBCNEe4DzgWdG/IYrAGmASLIAacBqAEEow61A2+ODQECRZ8QoA45yxqYCYEC6xHHBrc60zCRDvEmyBulC8IE4RIBAT4BxALuAaMEwwLfAQQSAQECAQMBkAKIBAIRXRzgAQTdASsLWxjNAWMC1gGICZkBwgMHpwEIDgLhAZ0IvwSAAbIClAMcAtQBAboEAgLMAVpXzgXsFooP8QLbNcAKhhG9Qqw/uwztG48EBLkiqCTIG8gbtSKNAW7dIwHpDMkF/AECyAmnKPgk9wKtHd4BAgMIvwW7B5YDDEAWBBkEB7UCBQZmsAF2IWteTgwnFZQBlAGdASoC5wIKZNYCqQIuTxU8ffEBBLQBbZ0F8wQCygKAAQMStQYGugEC3wJhVQICNBQChAEqBAMYNAL3EgLDD4IB3hOGQ/oS3gFquicGnASzFOAI3wFpAZAM4grUB8gf4AreAc0M8heyEYkpnyyxR5Y8lA/ZO+0z5S3DAgSsMO0e8hj2E5AcAgKlH+En9BAB3iKpB7Iswgn/Bt8DApgL8hMCyBABywanITACCvw67g7aJZEUuCjjF6QBzAGIAbEBoQEpygEK3QLOAUSgARdfHLABdjfGAU4cTWTcARwyFwoBAR8BAacCE3IimAEwfSKfAbwBJQHEAQE0buEBcxPBASphmQHEAtID2gF0Xb4EGmFbgQFKFnk6hQH/AZ4BjQEIPjERI5ECYBuvAowZwBnjINU62wKHFeoDYiLIC/oGlAOzBe4CB50D3gahAQICjwEEEOICAwMcuw5UAmahAeIDcga5A3sCIsgBAv4BaxgGApgBBgYGBAIQpAMQBsYKBPwE0QMCwgHqAxAFjQKfBaIBlQQCpSTfFvMkyQOXCPEOsxGuKags5zqRAkaMDcUEmh4OwBOrFfVKmiSmAZ0fqiumAYcO3QEWCUMlLQaHAQ7DASmhAWU3DAQOuwFM3QEP6QJRDe4BAQUzAjfAAQQGCAoEBggsekSYAQtLBBtnVI8BEmcikQGxAQZTAQICGiUunwEBPg8IAQI9kQIBOBoCDBGIAQMEGj2TATsBA0k+T05sDAINAQMCCAICNpMFFn1eEBsUuQEG3QHFAhBYKSgvXXdEC9ICzwEBAQIPBAQGEgeRARUWBgqrAQLbAQI5PiABMDQeAecHhBS7A+YQwROzA2ZBhw7ZBMsCsRHhAQKgA7EB4QUCmBcKAgiYA9cB3QitBkDoEekBH6sK/hvZBBq6ASIKFAYxBggCjwUUAgqMAgEBCgEHBgoBBQMoA6UHAwoGGgECBAEBAQIGAQEIBAEBDQEMBgYCcgIKYioCTAICHiIKAmO+AlUOBN4BBAIC9gIOfwEBDA4GCgaCAwgKAr0EHgICBxjKAXoEoQYCEBDtBfECAwEBAwsSBAYCBAUCAaMBMgTmAQYCAgIEBAIE8QQCBgQGAgICpAe2FhLAHskjvhXjAdAP2wsEvAifAg4muSLzBa0XlgzgEtgF1RH5DMUirAHhAdwUqgK1AZkw3g3JB6QnUcwCpxUKsyZhhAiAGKkdwAbFBc0N3AuAKusBsCP5Cu0Oxg0iwB5CowG+AxKAAnYk4wJGHPMBtwEGCQmjBsoBYoQBBQICMJ8B9AEiswLtAZ0GzATBAQICBxjKBlS4Ah+eBAJykwMEpwEDAbQBWAIC2gIhDI8CfxnEAUTPBtoLAuAI5gWEFSb3AuILFocEkwHpBI8Cgw3rDYIMmgGtCwTOCxIkEgoEAvUD1BehA/gLjgb+AZoBLeMbggqDAdsPmib7NKkRxgKOKIwDlRviK6IWjwiAAp9I0TuTAWt91AX/AgIRBMMBAq0BAsYBKrgEAiQCBgIHAgKfAkcLRQYtBBCXAgEaJrsDOJMDAgSYAgGSAxekAdsBAQECiAH5AQa8AcgDdhECIMIBoAHvAgIIKAQEAhEBoAFyQuMDBAEJCAEIvAMBEGS0AQEKWA4LDgICBKgBAQsVAhWKAaE42QuRIcwdkwHCDtIF8g3lA/wQAv8PtwIDrzNGPx42jgGMAYYBO4AC5AGLAg4FFAobgAFGnwEZeoQBJgasAeACHrECDh1KCQJNJrABJWMgIlZELn/BAbwBFlwIbjdsN2YuywFbvAEIigEOgQFaaj0u6wLXAXNdkgFJ+QGEAWYRRQJvEV95vwEyYmmfAU8/CAV8I3hKTmEZfEpKGFdYowGGAR7EATEK2AFTfCn/BfsBXwEbqwEFdjfGAVQDGQMDPgNktAEoHDIXCsUCGFCTAUkwfSKfAbwBcng1bj7XAQMHNdQBgwEImQFk4AHxAeEB2gFbGTglmgFC+AGEAXlDAgNuDjomeTokAp0DX40BAQc+MREjkQJgG9YDRkAexAEbcAWBAQLPASmVAgQKAosCASYKngFElwEHAhdfGwGDASwBdjUCxgFXHDkKAQhbAUtpDRsbATIXCgEBck6HAQETTwEfAx8DmAEwewEBIp8BvAFyBwFtAzVuN2MuUDsBCTZbOQGDAQiJARBkFwRaazyLAwoBS48BXQIFDwErMQGRAUv4AXMQAUceEQNDAgV6OQETEgF5OoQBATHLAQOcAQJNNAwIPjERI3pIT2AZAnoBSUoYYFDvC4ABRu4HxAKJAdAVt0L/K7MNkjKWRMpIrwGtBO0GCASSF/sciSPWBZ4OqCWGAR7EAZABgwFoCw8GMAICEw0cHwKQBBIfnQFEYT8XXxywAXY3MVk8VQIaAigcZLQBKBwyFwoCyAITUCIimAEwVwwCAhYinwELaElyCHA1biIF8QE8ERynASVmmQHEAmgCWY8C2gF0XbwBIPgBhAF5QwJ/JRUmeTonEEMLcwQSdp4BjQEIPjERI5ECFQZFG3vbAo8B8gHYAgOqBMkFDAimC68DJAEBbRMilAQOvAOjAQFsfAkGMx0cVzEBA5wBAmxGsAKWARxUggECjAO2Ab4IBqADCIIBEwJhOJIBAgK/BhKyAi8ExAUCrgEGJUfbAgzcBYEDT2kEjwJIugWjBdUB3QKyAbEDsQwGgQcFc8cO/wGKBaoMgQa6CJ4MmAYI1AYCHgTeIJMCpgGdKbVL/yu6CQSpDYsC3AL+A5sBxwS/DqsDCLEL9hKbHrQFSP0NhkO7QsIljh32CgTzA5cbAqUplEe3ONwxtxWcIYIG3QVj1QUzPRj0ASVVIFLEAuQCIrgBZn3LAmi7BETQAZoBpwR+wwSPAQbkBHsabApPgAE3lQOOAVeEASPLATmKAQo9tAFC1wSQCq429RP1E5sqpTqfD+AZohCZDeMXuRSUDeMXAwwMBQcCBg4CAQUJARMLAgIDDQEFCAcJCx4BDyUCAQoBARsKMwcSIgwDLQQDCRgCAgEDBAMBAQEEAwEGAgIBBQEDCgQDAwQGBAQCCQsCAgIGCAkPCwUBBQELAQIZEgQGAhgFAQ4CEAICDAgQEgcJBwQSDAIGDQYCAgQeHQcUAQUBEQYCEgQOFg8EEBoCCAEGAUgKAh8BJwEEFwkCBQQHEQsCAgYGAggCAgcCAgIBAgkHGAgGEQgJD2oOFxETAR8CIwQSBAcDAiIFBRYUCQUCAgQCBAoCBiRkBwEMCQoQCisJMQIBBwgHAgQKCgweCxAGARIBBREDFBINFgcCBAIKAg4OAQgCBgwIAgYMBBAUAgIPBAMKAwglFBQGBAwCAgQULB8BCy8GAQECJggCBAICHQYRAgICAgYGAgUCBAUCCAsUGAICAwIIBAYGEwEMBgYBAwEBBUIBBAYIBAgKAwwyAgoBAwIbBB4yIjIIAg0JAwUKCQMVCQoBAhQHBx0FFhMYEhEEJjAEBSsKAiYHGxMDBBUNBgMHHxQBAgIGAxAIBAIBAQICAgIIAgICCBUCBAUCAwQDAgICAwUCBAYCCgMHAiEdAk8KdwQTCyQBCggFBgkEBwQIBScVLAYSCBQICAETBQUCBgYCCgYIDA0DAgUCGQIDEQIVHRwGEQ8FAQMOBAElFgYCgAEfFgIVFQYGAwUDBwgDBwYDBiEbHAoEGxwNEAwCFi4LCQgPBQYFGgMKDREHCwkLEQcBOgIHBB8NCgwDCQIJBgICCgUCAy4FKRIGAgIBAgQCAgICCgEFBhIBBgMGBgQCBgIGBgQDAQUUGw0sCgQrCCYIIgQIAhIEAQEPFCAHAQEVDw8YDwcCAzBrNDUICxALAQMsHAwDAg0EDAkEAgEHDwYCAQEMAwMeAgEBBBECFAUDBwMKBgQLEgQhDgkJEgICDAIBGwMXBgwFCgI6AhUfKQ4DBwoQAxApAhYGAgwYHQcEAgIYAhhMChI3CwcCAgEXKgIEAgICBAQGAiQBAgICEQkOAiYqEhUEAwIFAwQjAREECQQIEQYCAgYBDAtcEQIBCQEMGAkEBgIIAgkbDwIODwQDAwICAgMCBApLOgYDDA8zNgEHDAICDAoUGQ0NCQsKAgPsGJoM2BA0xiQECh79CNwFZsIzlUuYKNBH1RO+MaISkhLZFBy4FZYy4Sr0E7kOzwqSDOEd8hiAHMgL7gLbK4obvSoEGaoBPLcBvQGbBJECATQ3CAHJAhC+AvQDxAI4ARkCAQUzzAIKOjUCAgEdAgIB/AIEAigeAgSoAQVabMUB4AIBAtYD3wGBAokIhwIB7wFO5wEIHQEOBBUHIVqSBi3gAWUEBQ9tARYTAQyXAaMgmgrnBdwKrg2fGqgNBZMBpw6iL48BjwGfDIgB3wu+LsU8BI8BFIMIBhjMAxiKAQWrBOIBwAVVAfAC8hQCqwfmDgTTSIUbyw+wOLwo1zu7KpsTlA/RFqYBBvQMF6EpqA2HAZ4KFY4NnxOFE02VL9M/AwQCCAQSIQICBA4UDgQCAQQEAgIDAQICBAQBAgIEBAIIDgQYCgQCAQcBAQEBCgIGDwgHBQILCgcIBAIEAQIbFAkEAggIAQ0CCQkEAgIICgYCAQEDAgcDAgIBAwIECQ0BAQwCBwUMJAICAQEGCBQHAQYCCAEBEQoBAgESBgYCBwEIBgkJAgUCAQYWAQIPAwQEBQUCCgYDAR4FCAgSRwILAwoRBAoCAQIEAwQDAgIDBgICAwECAgEBAQgRCw4MBAYBBQgBAw0BAQoIDAICAgQEAgwBAQEBBgUCAQEPEQIdFhICCgECBAQHBAIKAgICAgQCBgEEAgsBAgwGHgQKAwIBHwYLBAsCBgIIAgoGAggIAQIDAQUCBAQEBQcEAQMBAQIVAQUHAQ0DAQQCDAIJDAICDAECAQMBBAMBAgICAQcBAQICAi4FLAECAgQCBAoCAQQOCQIBEAIEAg0ICAMEBgEGAQQHAQUIAgIBBAICBhkDBAQHBAEHAgUKAhYJBgkHEw0DBAoKAgQBAwUKAgIEGAoRBAECAQMCBQIOAgQDDwIEBAIEHgMPAwQCBAgMBAEHFhICAgIBAxICAgIBBwQCCgwCAQQBBAQBAQYBAgMBAQIBDBACAwIUAxAGAgIDBgIBAwECBQkDHgIRBAYQAgICAQcBBQEHBQMBAhkKBwMDBAECAQQXBAkGCAICAQ4DBgUDAQYEAQcBAgIEAwcBAwcDAQEFBAYIAgYCAQsJBAsJBQUECAQKFQIaAREBBAQNBg0BAQEDAwYDAgwDBgYGAQMBAgQGAgQBAwsLAgIBDAQCEQIEBQ8DAgEHBgUCBAIDAQEXAgICAQQXAgICAQQCBAIGAhoIBAIMAgQGCAUBBB4BAgUCBQQDAhEBAQEFARMDHQ0EAwMCBAQCCgcFCAQIAQECAgEBCAIBBAQCAxU2AQEPIAgEBgMFCgETAwYCJAEBAQUIAwkGEAIbPgsBAQYCDAUBAgQDCAEBBAEOAREOBQECBAEBAQICAgYCCAECAwQUCg4BEAICAgsUAxsDCQoCCgQMBAICAQERBxoDBgYECQIICwMDAwIMEgQEAgEBAgoCAQUEFBACBAkDAQELGAMZCxgDAgEBAgICBQYCAwwBBgQCAQgBCgIEAgoBBQQCAgEGAwUBAQMhCBEKBAIPDAUGCgQHBgopAwEBGgUBEQURDgUDDgEHDAQRAwcBCgYCBAIBAwYLBQ4FAgICCAQCEAwCAQMCAQECAgEBBAQEAwIBCwsDBgUJCAIOAhACChIPFQ0BAgIGHAMDBQkHBA4GBBYSAQEBGwoEDQYCAQICBgYBAQYMCAEDAggCAgQCDAwIAggNCwgUCxMIAgoJJwQKCw8CAgIECyMCAgICAwIFBAEDCgoBBRUCAwQFBQoCDAICChsDAQMCAgMBARMGBgMFCQEZCQISAgILAwYGFQsGAQQJAQcBAQEDAgIDCAQoBgEBCwMBARMCAQgCAgEBAhAHAQEBIhMDDRMDBgYJAxECBBwOAgYSCBADAgoHGgEsAgQKBQYZAQQCAQEEAgMCCAIFAQQBBAQGBwshBAQBAgIOBBACAgwIDAwLBgICBQEKAQQCBgQDFCYFBAEBAQEBAgIbBxQFCQEDBBcLAwEFAQQGCAQRCQEFBAkNAwEMBg0GBRILDgEYAwIOBAIMDAYCBgoEBAcCBhAGAgYBBQ0JCgIMBx0EAgQUBAMBBgoMAwcCAQwBCgcEAwYFBQQDDQEBAg8CDAwCBCYCAQIBCAIIAgIECgEQAR8FFgMBBw8UAQUCCQsGEAQTDgIGCAEBAgcBAgYJAQEBAgcCAwECBAEDBgQTGQUNAwEWAgIGAwQCBgEBAgoCFRUCBAIIBQsPAgoPBgIGAh4fCgQCBBAEAwQEAQQPEwcEAQQBBwMBAgIDAwUDAgIKCggJCgUBAgEBAwIEBgQCAgICAQoECRUNGAQDCAUOBwYVCCkJCQ0KAQECBQkBCgYDAgkCAwQBBAYQAQkCDQMCAgIBARgCAgEIBRUbEQEB5kfCEvUCnxiRDegccg72ATgUyAFEDQEfywJlZQoCIBQJB0CHAgEmZGI5AgYGDBNAJv0DHCEk1AEPOwMNL5ECMUIdDtABeVSAAQwUI5UCIwipARDqAbABSQpBbqABAqABQegCAzIKDgG/AoQB2AJcL4wDSWICBEIGBEJ+7gKAAcgBBgsEdPcBBgQ+bZgByQHoP7VCMfYpjUzUC/hBwAHiCQJMjQjtAYcO0QcEAhnKBAH/C84XPAFKHBe7AhZkxAEiCAoMAy4ElQE4OAEKGRUEHAqVAZsBlwGQAQs9AxUGCA4uuQI0kgGXAQoGMxsjBU4GJAZBLSgSHzccWT9rCUKmAQZ5VwwcfiDWAQQKEZgCdgIpCCFnOgEBAyAMFBENCqoBAicaFAcOEWdMtwIOCgorAhMNAQECDA4BAUsBLQcuQDQsJAQ24AECFAEgWhkGC7wB4AEwFGYMFxcQAQEgAgEDHWAMBAEFZWo3FAQEHgQIHAY4PBoHBwYHIg3jAYkDBgaNATUFYBdzBgFoGAtYGjACkyWWRK4PlkTGSJ5HnESHAYUB4gGMAYYBOxp5AWzkAYsCJwobgAFGnwEZXhyEASx0OJwCHCgeZEKAATYyIQJNJk5iJYMBIlZELn4BwQG8ARZcCG43bDdmLk1+W84CDoEBxAE9LucCugEhcyzDAUlFtAGEAUgeEUUWWxFfeTqFAZQBaVaYAT8IaBmbAUqdARIZE2lKShhfRj8BHQHDAQElZgWBAQI5GnwpQW91AYoCAQ0jARo/QQNDAZ4BAhdeARsBgwEHJQFzAzUCxAECVAEbAScDEQoBYwFBcw0ZAhsBMQEXCQEBAUwmTocBARNPAR8DHwNTRAEtA3sBASEBngEBuwEBFV0HAW0DNAFrAzQDY3sDOwE/WzkBgwEHAYkBDgJkG1pqATwugwHlAUtuIXMBKzEBlAFIQ7QBAYMBAWUUQgEBARNbETolAXgBOQGEAQExYmkDngFNPwEIPikIESN4Sk9OAREZAhFpAUlKGFcJUJUjqyLDGeQI5wLeA7YLpgMcoAG4PK4NtQqRB78LkwTzAZYYjwEIAlUBaKMBGQ0CmAFKKZ8BngMIvAGSASklKQwa1wEE+gErErgCCQ0BhAEViQGSAUIN0gKJAQLWAVRoQQh/ggQESP4B4wE6EyXmAQQ/FI8CaDpnfzgUFK0C8wHvAQ5mSjmoBFkWlwEEoQIMqwE+owFjAgginAJQVrICBc4CGOsBzgEKcGWABBEOJCIQJNoCB9IBAgIaBZEC/gETEBAyYR0KAqABJAwBkwOtArkDARLhAQwGsANjVl3iAb8BehwBSxrSAQIsUkiKAYkDAT4ZVYIBtAMCowMCChszowFazwOfARJzATB1BhzzAnnnAwKwAQ8YnQFjR2UrFgaFASpeATuoAc8CIjOmAgoOAgJaAgYtN5MBiwEiVOkCUxUYxwGkAygEDAIGKJkBBBUCVCLjAZ4BiAQUCvABUNkGIhVsCh+OA9UBBjoULLgHDxkUtgEX4wfEMUPFGfQg/C+EOIUBAR0BNY4BAYsBBYEBAjmTAQMpQW91mAFzAQ0+gAEDQwGgARdeARsBgwEHJQFzAzUCxAECVAEbAScDEQoBYwGzAQEoGwExARcJAQEBck5iJQETUB8DHwMFTkQBMHsBASEBnwG7AQEVXAEHAW0DNAFuN2MuTQM7AT9bOQGCAQEHAYkBDgJhAxtaagHRAwE5Em4hcwErMpEBS0O0AQGDAQFHHhEDQgEBAX85ASUBeTkBhAEBMWJpAzllTT8BBwE+KQgRI3hKT04SGQIRaQFJShg9GglQ5ByDBMk8iQTALuEXAtQfjAOrDq4DOAKCGTzbF9wipwWxAgLeC4kLogfMBAjjBAKkBLkSwwGeCc1ImQqWBOQ9vxmOKcEiAQgTAQoqAQcIASUIEA8FBw4lMAgCAgQEDAgBAQw9BBIFA4sBArsCVSEBBgbGAQFLMAUqFCcGLiMeZwaAARcJqgEGOAIaHpcB0gEBaTUcOpQBBgrfARWSAQQQGCLpAWoG0QEmQwZ4CBYdAuoBEukB5wEaeSAaAZACAQkcJH+IAd4CiAESJqABSgUDcQQFHBUhQUDtAQELEAovoAEUAhImATkMCAI7CgINAtACTwkSCZYBOQ0YuQF/rAELmAEECQQCBgwwagEDAkJHxAIKOg5JAQLyCqcRwRnWELoB8hyiKBzJCdoHFq8m8ArAD/4Q4R7IIPsv3RmeDrM63RQcuwqbGooC3RQc4Ca8MdsUHOIX0Ae7Hq0b6wFGPxIMJREPc30CGRhuOxoibRYBMBCbAQQCQyAid1IKAgIZChtqFkYIEgQ/DDYFCAICBAReHA8GbwoiCgYtEAIZHSdIMSglExQvHCgECAIGClcGB0J4AgIEGTQbGAkCKiMMAggEAgEFBE5iJQIBCQg9IREREUMTRC4cEQ0THwILBQEiZBwMzwEWXAgWWDdsN2YuTT5AUAoBOYMBBASKAQ5jHgMEAggEICMCLD4pEAQuAg8MCBVJCyK3AUxuERBzIwkjDkAgLAYKaBi4AV0nLBcFBAYGBApWBjI5EQQEMSYREjcECA0GOrcBTxNpBQ4EChFtTwQ7CAgyBTkJI3g0FiklTxIZExsrAhsGSjcTGCEgFggcJ2zvBEkoxAH0AgQHhAEDBAGzAQkIAQshngGsAvQECAYKAggGDEKeA8kCAfQCgAMDAQEBUUaSAzACCnwCkgXVAcsCGgJA7wMmwATRAmimBC7iAeIXgBhnpSTwBM0JoUzQJDPIAifDBc0CYhv4BNwBOxChAtMCHkWDAbQCIrwBnQMCBIUBAmjPBtEB3QbPAb4HAhCQASlPmwb4AZwDsAFzHQNhBggEEAQgAV8QGgYEIEcFAw8HAgEJHwQDEAwBeaMBKwcBewE9TTxOMQEwDgglAgINAmCGAQIBAQYqAQU3HQwPEQsSLigEBh8EAggHAQEdSwM6BAEDAjRTMykBDgEsRjYEGAQiIlJpYQUBAQFKOgsETQYEDikbIBMDAgYQBlMCFSsJWQgGGQIIeAQhJAQNAQ0JHBQDeQgEDAYIAmULAwSaAQtIDiZ9CwcFigEFDggqowEiCmwtZAcBEYsBFSchFwEQDgE9Uy4EETcJXAQWSSUHAgMCAwECBwIMPCQCAgIBDh05AQEIBDUTAQ8BBwMGGhABDxwNBQKdAQIqExUBJyoMJjffAQcBARgBEgEHAUUBAQINAh4GCg81nQETCVVSFxhLAhgRFB8yKAIQCzICCAIBCRMTBSMGYQQ9BkINCBcgAgQBInMCCQoBBhCaAQIBETIDAQcZKwMOGwJMIjwtBCwCCywBAQwzBwIEBwQPAQOyAb0MMRIGGoMBBgLwBBz+Ar4BCBziCN0CFCQh/geqBLwB5gaxC6IGvze4HpYIwgLIAf8KvAMSDJUKrAOYAQLYCwKyCv4FygbyAQrIAtUBlQRmywGqBIAOHJ0EwxqRBbIOvjJGXQPNAsEBGuYB5AGLAjEbgAHlARleBgQShAEs8gJQAgQWAgQoFApk2wEdMhgLWwQCEk5iJVEGDCAiVnJ+ARKvAbwBFmRuN2w3VBIuTT5AWzkqWQiKAQ49Jh5aaj0u5wJMggIsMZIBjgG0AURAZhFFcUomehsCHIUBMjYsaZ8BTz8IgQEjeEpOYZUBSkoRB1dYhAmRLZ8m5wLQC7EJAvsRBJ0OkgM+/woCjQTDEvkIpgiTS/4/qSoWMAsIAQUDJY8BzgG/AQIFBgcBBgkBIRETBAIIAQMCVQUUGZICUZoBW4wBAgJfBgLwAQdkb9oBBAgBB1k/EAQEBBAEBCySAWw+hAFeOEp3OwO+Aly+ARc/AQEDAf4BngEH1AEG4wEIAgTwAeABLwMCAgSyAR61ARQBwwICZQJtECIBGeABHEYFAgEGAj5HEAcDGT8DDCQEGAYcAQIBAQcBAgc2DEcKSwInAg4/pwO1AQoSDGUpAUWMASpAPyRudEcTEwKbAbIfhwHvBRlaAQa7A9IC6gGRAbkDHgICBAgMAgIECOoDmgFAArgB+AHBAQbyAYQC1QKZAuMDsAHiAt8C1ALAAgMSYgICsAFb7ASaASMbBOACqgEk4AFHyAMCkzCDFRAMnwNI7gnBEbIDAuoBtwEGiASqGv0DFEcGoQGQAQ+kAhegASxIzgFPmAEGUI4BBgNrywPZAZ4C5QE76AGLAbMBcN8BYrUBDDwGggLnBLsCzAGEAzAEBARnuQFa6wJVPFhQEgIWHA0VEAQLHBcKFwNVrwE6JgYYwgNqNwEMxQEMiQGrASQYBGtbRRESmgEgCj2wM48ByDqtAsQBCZQKlwv6ARy7DJEBiAL/AfUD4wHjBNACvAOdAVbJBsUMAQcCng79AgHSAwEBBQ6NAooQpgLALpodlAzzA6UzkAuZDpcJBEXcAswGRj8BHjiLAQGQAYMBzAEDKUHlAUMCAQEIvAENGQYEARo/QQM5C6ABAxReARyDAQcCJHMDNQLEAQJEEQsRKhEHBGRBcgENGQIbATEBFwkBAQFMJtYBE08BIiKXAQEtA3wBIp8BAQK4AQFxAQcBbQM0AW43lgEERzyaATqCAQEHAZcBAmTgAQM5sQHlAbkBIXQrEx4BkQEDSEO1AYMBAUceFCYdAQEMAQZMDxEnEgEmcgc6hQElDAUJEAIcBAgabDkaS2YCJQcBPikIESN/Q04BLCIBDQQbe0nCAU8BRu4EvwHsDRzBBpECPwIFqQIvmQfoDAbyBr8GgwL5A4cBmAEGAiwOWtACBmUFDxo/twRnBmpNCYgB2AEEBQECTpoBBDxDowFQKAivAlU4lAK4AuIEpQEsBp8BQLcByQKVBQ6+Ag4gCCZogQKsAQIk1AJddO0BiQEQLIgB7QKkAeIDhA2CJL0TowEECJAD8wSYA9kF7gEYwgKvAlQQKCoKDoEFkwkgAQPrAQICAgZrAgIEzQGxAQEFAQW9AgIBAQIC6AGlAfkD7AOpAQTgAy7eAQIgrQGDA6oBuAFKaKMBlDbVF9cGArYP8QWPCaEKdtkZ8AgrBO8DAe8S1g7PSOMBvwysBPUG7ASWHuMDjQLeBKMCmzaTKoAwgQW8FN0+0AHVCdECtwI89gMcQq0J2yDmNEeNLqw46wEGOFI4TMwCAqcEigGXAQI4ggI4LjTsAxw0GuADCBCDAgICBiqCAcgBAQjAB17fAgyVAfUBpAFvvQMGqQEEAgaNAxkNAQGFAxIhCUwkDHpdAj8Oe7UDDAKSApAB4QLZAgIS2wEKBgIQBJwBVMgCAtAGsgIYvgmXAocDygcIUKoH/wPRAcICaA2dAwShBRDUCNkCFI0e/wEWAuwByAIoiQXxA/gJ1wGYA40MvQcIAvgKDtYBYIgGQowCAlJFEdED1AgL2Qe7AT44kAGYAgSeASLAAZEDnganAs4NHgLRBAQUaK4D3AWeBJQdzxjnApMBjgYBnQ0BhALqIMcUHOsMvwrXFKJDBqoXMeUdAucGQYUQNnSMAqsKtgOODUm7CQIQywEGDBHwBqQBBv8BvxGEJcM0zjDYEoAB5QayQ80Isw+mLEY/HsQBjAGGAbsC5AGLAg4+gAFGJnkZXhyEASx0OOACFAcDZEJyDjYyGAkCTSZOYiUUbyJWRC5+Af0CFlwIbjejAWYuTT4sFFs5gwEIigEOYx7EAWvnAkxuIXMsMdsBRbQBhAFIHhFFAhRbETkmdzy3AcsBPBqYAT8IPykZI3hKrwEZE2lKShhXWMwDrxKaA5oJlQaXAvkFuRuuFM8a6ATqAitHFQgEEAzzAgsImQF9uQKuAQQCAgwWAgIWAwYmfm8MERMCAhKJAQwkPgwEDjIyK7ABsQICGgIuFAEDXrwBZxcZUwQEArsBaNkBpgEKCf8ChwEP+QMlIKoBAQECAwIXYjEKI54BHqcBygFAuAIgKgEElAFfNLEDjwH7A6YBCDoPY6EBGAslQc0BiwHoAiQbGTEeBM8BmwH7C4EpURocCBBMAjASCAoSbws4AgQEDhQIoAFKAgIEIAYIAgQfAgIiSAcGAsMBAgICAkU0ZggJZG0gYAoMCgRUVvwEHDqeBAYKDAQYBgICBAICAgYskgQMBAICAgsBBNMBHVICpgEFCzkNHHsCBgkBCgQGAgIIrAHyAQ4MAtUBAgwaAiIClwI3vQJ+VgUCCRwERQECAgQyEhZJAgYlAjTDAQUBAhPlAaIBAggIAgEUWwIIBAgeZAIPLgQMCAICAQEIwQG7AQkEDg8CIkZhAgiMAwwGIHYBEBSWAQgCDQYvAgJWrgGDAQchFgQCBEwCBgbBAosdlQutC4EaEAwzAV4EAQcPXBgICARFAkTKAtUBVu4BmgEC/gIOrAEC6AEkqgPAAQ0BAwkGzQFJLAzDAasB4wMhLyoL/gUCQdECkQJFBGoExAFEkwH5AqEC0AICDhQaFilRHQICNgIC1QMCpAHNBL0GEBDnAq0Biwv2B6oBgAGxAiDdCpkB/QEKFSDKA1zoA4EHtAuRARUCBIABzgEolQoC7wfmAeMIkRK6A3KCAgKRAaQN4SqiCPoDiS9w7BnfICBNMogBCn39BwICJa8DAgUNAicRCp4HChIMKAwL1wEWCrQC4QIPBK0BInuzA6YD0QECKJ8C0QKiAgEBDgEIAycEBmfWAQSRAwvpAsICvQECjQEChQGAA5MCrgECATWfA2IcnwGDL7kH1QgHAw8FugHlAQSTBZcBsgbmC60F7QKSCuUD0AdQTwSDAQMKAnHABwgEAvUCGBAa4wEDAhhOF10xgAIpFAICBBQCAjAEAg2LAakCKTICAgKdApwBCPIK1QEYAg0DBgEVBhQCAQECC7MB9gEkggIGBAOgAROIARNdDhKNB1N25wERAQEpQAJFLgkTARAEmgFK1AMEAQkMTCSPBAYEAQEEKQwGEAKdBB6yFcAV9CmlC+wISAYWBsUDxg+fCOAEjxIgCrYB5wyKAQqZAaoD/QSeDYIEDdMDD/EYYtASqRUEvBmtDeYB0wbEE/EhiwEQLTb8AdECCiaQAgxwL8kCKb0BCg1ZqAPQARyYAbsFDNgHwwG1Awpk8gr5BeQBAtUDAgpMAQEbPQ2RASwPa/ID6wHYJJIlBggzlRmXDg78C+0CBjeFCAhH0w+IFpZE2QGcAQIKBAjfARIEAgQECgchELUBrwHcARIEDgICBAIEBgQECQIDAggCAgISBAQGBgoCBCoCAgICmwIGCAgMBAoCEQYGCA4RaAIGAgQECLICAgYECgKYAQzqAQJTEEYBAgIEDAwGAgg+BhljF2U1ArIBBgJzIskCCWUOSQ7NAUavAQIEewQYCQShAiLGA3oCBgICAgILDAi5AZcB/wGHAncQBAgMBCxKiAHDAhulAQEHBwIxbAgCBAIET1CXAQhPCqgDBBAuQgIEmQEPAggCDAELAgIEAgQIBgkFAQMICBKLATQEBgwEAREEBAIEUS3DAdEYJKgRvgOQLdUD2w2nBDqpAeMJAqEC5AHeB2oUCMQBdF8EHUQiGZ8HC7IBzAFSvwfcAh/GBOQBoQLeAUfUBQGUAgEEKfEBuwHIC7cT4iyjBpoJ7hcE4QKPAfcdQukRjAOPAdgV2ALvFiznILQq4BmkF8QCAQGtBJUj1A6RF4UN6QnCB6AQ5R7WApgEBt8EkRyiHrAg2RQcpQsKugInDimOAYIKugK1CNkBUOwEDLgBa8sF9wO3A4kYApkYyA6+A9kwkwHuAfYH5gNyDAgCOgwOAuwEEAf3AgMF4g11AQsCAgMGxwWkCowP4wECAibyAgRiBIQGug/5AqQgiUybE/ol+wvJGK0VswOeDJ4NAssG8xrLBuIE2AIClAUk6w3aGvQkrD8CJuUE5SWWRNAwAQQDCQMBBA4CBgIBCwgDBwEMAwQPAwoCAgICBAQCAgIGBAQDAgEGBBEEBQEFDQECCAIEFQoPAgIOAgICAQkaBwICAQMBDAoCBAwBAQwEAQUDAQEDCgEBAQIWBwIBCQICBgEEAQQEBAQVAiAFCAoWAgIGAwEZAgEGAQMBBAEEAgEEAgQKAQICAQEDAQEHAQMBBwMKCgMIAQEBAQICBBQGAQEGBAoCAgYECgIYAwEMAQYIAgIKCgICBgkBAQ4WCwoGAgYaBgYCBgMGECULAxgcBjwaNhQaAgkRBAIGCQYCAgIFAgERAgIEAgcGCAICAgUBBgUHIwQUFQMTAgEEBgcWBwIIAgECAQIBAgcJAgIIAwEEBAMFBgYDBQUEBAEDBAICBwEGAgEBAwILAwQBAQQIAwEEAQICAwICAgoCBAMTBwMGASwHAwECAgYGBAgGAg0JDAQFAgMMCgQQAQIVCAMJAgEBAwsCBQIPBQMFFTMBBgIMAgIKBAIBEwIFCAoEAhwCAgYCBAMBCQIOAhEBAgoBAwICCgMDBB8DBAkBAwEFAQEGAgQCAgoMEAEGAgIIAgEDBAYCAggCAQMFAQIQBAYBAQQEAgIDAQgDAgEBAQIHAggEAggUCwYIAgIJBAUBAVQCBAIICgMBAgMFAgIJAQwCCgEJBAQCAQMCAQECAgMICwMNCAYcBxABAgICBAYIAwICAgIFAQEDDwgCAgUEAQQEAQEECgECAwICAgYCCgICBgICBwEIAxwMEwkCARACAgQGCAwGAQcHBAEGBAkBCQgFBgEEAgQCBAICAREMHAgJDAIGAwMUAgYDAxMIFgIEAgQGCwEGCAUGGAMJBgIBCgIBCAYFAQIEAQICAgIKAQMOAgwDAQISAQEKHAYSCAUDBgsJBAwMDAUDAgYEEgwCDQQCAhgKBAQCAgoGAgsCBw8FCQIdCDgBAQ0JCAYCAgICAgoBARoDCAYCDgsJAQICBBkEFhMiBQEBBgIEAgwUAgICAgQCBBYIBA4IAgICDggIAQEEBgICCg4DDgICBQIKBAkFCQEBAQIKAwEEBAIDCw4CAgECAwEMCQUCAQIFBgMCDhIMAg0IBQEBAQECAQEDBwQIAQEBAQMBAQEDAgIBAgICAgEBBAQCAgQCBAYEAgYEBAYGAg0HAwwhBAIGBAcDAgQSFAgBAQQCAgIEAg0JAgIVAgQKAhIVBAMCAgICAh0CMQYbBCYDAQYICgUBAgIGAgEEAQYEAgIEBgYEBAQCAgICBAICAgQCBgICBQIFDQIGAhAICwQFBAsGCwMEBhIUEw0CBQICEAQCCAIFCxgQAgQCAgIJBwEKAgEWCAoSAR8CAQECAgQBAwECBAgCBgEBBAEcFSMLCgIGBAECAQEBAhEFBQECAgEBBAUBBQ4CAQQIAgYCBQgXBAUJDgICDQYLCxMLGAQCBgICAgQDAQICBwYMEQwEBhAIGwQEBAgIBQcCAQENBQEOBgMEHgIVAgEBBwUGAgMDAgUFIQMCCQMDCgwIAgICBAMJAQEBAgIBDAIEAQMMBQYBFgYEAQECHwMSJxEFDAkMAQglBwUCBAIMAgcWBQIKCQ0CAQEEAQcDBAgEAQMCBAEDBAMBBgIEAgIBAwIDAQICAwUGAgIKBAIBBAYEAg0EAgIBAQIGAgIBAgMPAQICBgICAgEBAgIJBRMNGgICARMEBgICBgQCAgQCAwICAgECAwIDBwICBQECBQECEAQCAgcDBAQ0EAkKBBQWBBMBAwcBBAIIBgQMAyECAwEPFQQBBQcEAwECDhQDEQUGAggCEwMEBAYYAgIEAQYEAgECAwcCBAQECAIEHwkDAwQIBAEEAwICAgYCBQYEAQcFAQoCBAICAgIRBggHBAUCFgICFgwgEBYNCQICBAICAgICAgICDg8GBwQOAgUDAQUUEwICBAQCAyYBBQICCAEECwQCAgIEAQQDBAIOAQcEBgUDMg8aCQICAwEBAQEBAgICAgIEAQQHCAUGAgEBBQQIAgcBCQMLDQcEBgEDCgYDBgYCAgICAgMCBFUcAQUCBAICAgMDAgICDgkCAQQCAgQBAQEEBAEIDgMDAgQXAgEIBhcCDAgCAgIEBAICFg4BAQEBAgIBAwMBBQEGAgMNCQYPCgEJ8hj8C6Y4xTXVHgECAwrTIMc/nRyjKasLpC4C/w2UR+cW7gHeAZMN9xpQ0AUFkD2LARsGHATnAdYCqQJOtgJ0mAECJYQBzgJuMRICHbMCARM7RY0BBA87KAIEFzMEGhYCGmicAbgEDUEHFpUBZgKvAS4GPAphKwQfnwECFjdFRFvTAa4BqAGAASYyPioYUgosAQMRnAMWkAUCyQE0dlpiBgYXf5EBAzwGBgICggFOogQk1wKUGf8ENc4H6gbqAbUR2QHPA6kZjhjXBe0HTKoHEP4WyQPyCaMJDLQEUDcIOdUCEv4BxwSsA1vFATRHmgLoAVsGwgEHiwEKEAZamgGLAZMBpAH7A7wJHrsBBtwBL5MFAkZQBmuvAnxBIfEBPdECIGdMHgJbAkFoGL4FhAalE68BoAfeBJcH0Alz2gvhBIAD0QPDBf4CrwKgDpY2BD0XpzDsGrMG6gatCL0OxgMgBNEFAgy1ESYvFGf9BjUKCgYCEQkcDBYTBQMZBhwHCiYLAQYUCwMnBgIIDioEASFMHAUZAgYCBwEFCQgZBiIEClUjAg0DDAIKBAwEAgQFAjAlBgwCDAMECgYsBjcXFB4gGAcEZQYKEwYNGw0DAhYBOA8dDwwiAgYGGyENBAUFNAQVFw0MAgUQCAwCAhYlFAsJBCQbJhgCAwgPDjMBCQUBEAwXDA8MDwcEIBMGDRRdDAYKDAYGJhMDAQEoEgIKDgUGDUcHFTwXAgcjDgwqIQcFAw4GGAcFAiYMmAEMBgEBIwQJCJQBmAE0DzQ8EhABAwUEBhAJBQoGBgkXMAIICQoSDVQUJBEBCAEEBUQEMwo6AzELUQclHw8YBwsKHS8GChUGGwgDAQsZEggCAgQCBAYEAiQYKlEFDSUDSAwHFwkFAw4DAQIsFAIZSBEMDwQCCAIEIxIUAQgJCxcGCg0aChUcDAsSBwUyIy0EHjVqHBUuGF4EAhgHGQQOCgQJBwYCBAICICwaHBYQDQEpLAMQATUTFg4VCBwICQ0CGgQaCg0IFAFCGiIeKAYEAQULCgYOBAYcAhEECAEcBBUBDiERARkVFB4HBxECIgMEFyk1NwsZDwYVAg2CATk8NgsdARoQAgEWAg0LGwkOGwwLGR4ICikgPQ5GBAtODDUEMgkFFAQPDwMBAgoJBhQWJwkZKgQHGgIdBBAFAgMoAgQ9EgQSrAHLCo4BmwHHEqEJrjDZBNUziRSlHMsGBPwFR78LDrkPGB/tGLEDIlzOBA6ZBsUG6BnqApE2jw75AYs48wa5CZgPDpgP2gcs7wqZBmC4BaEF/gatBe4BChR1uQMUyQrhBLot7gKTA4gJ4UKdDKsPxwnOAtYMzwK6FdkBuyr5CuYEQPMW7AEDigHrCgb2CJILHoYBHsQBkAGDAc8BKaYCiwLOAUSgARdfHIoBJnY3xgFEEQsRKhxktAENGxwyFwoCyAITUCIimAEwfSKfAbwBcghwNW434QE81AGDAQiZAWTgAdID2gF0XZQBSPgBhAFlFEMCXyA6JnIHOoUB/wGeAY0BCD4xESORAmAbe4sCUJk2zQ+qAbQH4APICvIH4TKeRrIJAgIIFgKDCocCnwekBKUBFcgIArYEgAUCDwKMAeAF+gV23QQTFwX8AbUg/wGEN6cR7zLDR/MG5TK+AYABAgbxEcwBoSYCDPIL4y8CAs8HCrJDvULGEtUH+C/sD7oPpTiIE61LiAe7BKss1RjPD+BKxA+IAw6aHwLfDtMDgwTMMocSiTGrSTxVBgSMASD9BF+IA4YBqAIEsQEnBOICOgQBAeYBXo0BLwiPASIRBBAodeIEEJMD3gMgEZwBAk5C0APBAwIjBd0CBzLlBQGHAijSA9UDAVgsigGpAcYBAkiyAyYCigX8A7oKAasPTxoRAq8IGugCLgICDJANuQKbA16tC9ICyAHDAY4F2QrcDwbyBYcJhwEK4wlg1wRA9AMcpx3aCATCBIgJmSDKBKEC9hH/IJNKhgEebFiQAdICKbEEzgFEoAEXXxywAWkNN8YBtwEDYdwBHDIXCgLIAhNQIiKYATB9Ip8BvAF6cDVu1ALUAYsBmQHEAtID2gF0XdwB+AGEAbwBgQE6Jnk6hQH/AZ4BjQEIPjERI5ECYBt72wK8FdwCzQLJASLAAZAmywbOBZEPHNwBkwzgAYYEBAScCHHiB7cBywrICfMG3w76LAZzrAECAjgGAuEBCwQTgwETBwQuAQECHgIGAgQIHaIBI+cCKQZsBAYIiAESFAQCCAIEChsGRwIDBQ5WChw2gQIKAgICFwE0AQIBVo8BAgICAgICBQICAlFqAgYubFdmC0JaDB0ChQEisAIOxwEFfkIWCLYBA0IYPAIGCAYCBBoMBgMJugIDOKgBBQI7AgwYIz0KDAQKArgBAgkHAgoCAxJ8W5kDkQEOBgI6GLUBmAEbLhwDCQEIdwSmASKMATsCBhYHRQwcBAIDAQR3TWIGBAJ9ZE4gHWGWATsGVBS1Agp5CHoSKBAdyAFP9AMCAhACnQIcAgoEAgoEAn4FBAo4nAE+RDURCL4C/QKqAShfRwR3EAQCAgIGAwRTzgECOldTIBDXAbkCFXUCtgM2DAa9AUIQBgTwAhoEBgjdBAIHBQQCCgMuBASxAQJfxgKdAYUEI27eARsEBgQCSwIjGBwEBoMBggE1YgYGJgoCsQEYVh1HFgoOBCUuKwQEBCEMFQIGMyACDCCFAgg/RG4KCgIGKhAbCIlBixOzOqsR2w2FD7AEowGrCim6CNEVnBG1DaMBkwrLAcIM+gnAEh60BvcL9xHwBbkNnQS+Ak3JFwoCwgIKvg7iA80FshCqIdoWjwmjAXEVEwoBCQMCAhOhAQKQARgvAgwICgYUFAc4KwQhLAMCJBgJtgECAgM0FhIBOAQcOQYraVUxAgIPAjUZDUgOQhcKCwEeGgMMDAEdPQUgJQx2ECcuBFIGPFIFFwWDAl4YCxc6FAsGLRwgCwFlegIgAhYGAhBWbwIKCxIefVYzDggEAR0JCKsBEwIOAzEGBh0YOwQTGAEcYQcDIg5FBqABBAEBQQIWBgIKCHAOAjwCDSkmfwcbGx8FCAQEJDECBxUDLlEYCggEOwECJgMuVCoqDyI2NQIGMxYWIAIaAjYEDggGClIGBAJPFgYVAhBdFAFDKmECEz0yFVEoQwEBAQICeiUqAi0BhAEGQA8DDREUGVUPBQoCUgF0AkwFBBYCEQ4CAVAEAwlmND0B0wEVRQICAhEKC4oBARkvBBIiCURz2waiKawgtizOLOUZvQrLBcQG9wJ78QHYD0I8KJEB2AX6FOxBxQbcHqYDzQ+UImDYR/1IkCjvINcYzyvbA8ov6iySCKQB1ALSAin/BUS3AXuwAXY3xgG3AWTcARwyFwoCyAKFASLIAZ8BnwG8AeoBNW7UAvgDxALSA9oBdF3YBLwBgQFgeTqFAf8BngGNAQg+MREjkQJgG4YBHsQBkAHSAimxBM4BRKABF18csAF2N8YBtwFktAEoHDIXCgLIAhNQIiKYATB9Ip8BvAF6cDVu1ALUAYsBmQHEAtID2gF0XdwB+AGEAXlDAn86Jnk6hQH/AZ4BjQEIPjERI5ECYBt72wKeFKYDpgPLBsINBN0E/wWlCbAKgwPPAxwNEjPCDpUB3Ev9JqsbKesCjAuyCKACSLADrAIQ2Qw4qgZOCATRAvQ+0BLDDp0D9ymqEuMXyhGmROkNhAabFt8ClQmpF9QDkQODCc4NAgKnFZEKihGfAuAB4QnTI4cBpgECBIIMowv0C9INogOlGY8ftUK5HiIW4heFCc4LihvhO6MBHAEpiAEGkgIBGQIFAwIBBw3wAvECuAEe3AECJgMBBwECBgEBUgo4QoABEAEBCgEW0QECVgIWBAIWJB04FSpgBggEAgQCCFogQx8BAZQBQCoRQ0Yi2QIqBAKhAaIC+QEBDQganQErTtwBAawBvQEwCBAS3wHpAQOFAVJJXg6bAY8BfhMJPZkDE0kCDAICAgazBD7hAQQBFJwBzAEeAQE6QkEBRnAEA9EBlBmYLWifGOkzAEYBPgEebiwqASQCaAEBgAEDUgV2KgFAAeMBiwIBDhgCCRo/AURCAQEOAhQCdwIBFl4CGgEBhgEEJAEBE18DATY8iAECPBwcJQMQAQoBNC4BAUBzAQgFGgEaATEBARYKAk4kAkxiJQETAU4BHwMfAwFSRQEtA3oBASEBZDoBAboBARUCWgIGAQFxMgEBagMBMwQvsQE8ES4DWAE4AYQBBgGJAQ4CARZMAhtZAWkBKBQDGxABhAHXAQsBAUqPAXMBASoDLgEBLmJJAgFCArIBATKZAQQaEQNCAgISAVoRATgBJgFtCwE4AYQBAQEwAgtVAjI1BDgCGUgCAUxABwECPDABEQEifAKUAR0yEBt6AQFIAkgCFiY5Ak4BvxnwC4c2kxWDTOcXvRwinRDDBDWrFqIE9ArFBRx9NM4CoAFHtgPXEL8BjAOZAocGxwcGAgICrwQQDBQgTS8XCkIMICcuDjYPDwgGFDsoHAQCBjEZCA0EKTiEAQEGATY+SkJaAQ0CASkCBwQWA145eIEBAwEKAgRXBwIORCQOOASVAUH4ARwwBA0GAwVSVj8BIwoEAlozBEYTIRW7AekBHgLhAQEqXlENEA0CAgIREQooDggEES0IAiIFAQUKUxKFASV0L4YBMSIECAICDAcVLw0FZAULQipuLkkECAYmKh4HBBQbBAsCBAoKAw4oGw4EBuoBQQUdJDQiDjgTBgoEBCQBExgQDwO7AT8vGRwKFiCqAXICRgMDAgsFKh6VAQ0KAkgCEJwBPhZnARcaBgwVEwkKKAkXLhQZAwcCBAwOEp4BBUIOIgQEAj9AAjApEA1HEAYKAg8EDQosBQ8GMgQCCAQQJQsLBQxiMD4DAREiBQEEBpUG3gOoASkNjgJuApwCnQPnAvMBDewDVAbnAZMBTY0BtQI8oAS7AcQEjwHnBIQEtgJyqQKeAoECS7cBBDu5AcYBFc4RlS+DD+IXpCBGPwEdATaNAQGLAQICAYABAQI5GnkDKUFvdQGKAgENGQoBGoABA0MBJXkCF14BGwGDAQclAXMDNQLGAVQBGwEnAxEHAwFjAUFyAQ0bGwExARcJAQEBTCZOAWElARNPAR8DHwNTRAEtA3sBASJjPKQBAgIBEgEVAVsBBwFwNAFrAzdjLk0DOwE/WzkBggEBBwGJAQ4CYQMbWmoBaoMBAeMBAUtuIXMBKzEBlAFGAkMBswEBgwEBRx4RA0IBAQETWxE5ASUBdgEBATkBhAEBMWJpAzkaSQJNPwEHAT4pCBEjeAdDTgFOAREZAhFOGQIBSUoYVwlPAaMB0AWlAp0EnwG1BZoBHqYCiQHJCdIBowE3lgbRB8ABgAa9ENFA8hj0PsER/wkG3R2QAeUL9kvPD9MgxQ4C9QaKC4YHvQfBBoAPkzQEqTqSKL0N6QcCkwHXBNgH/Qf9GTD9A5cHuwTIAZQDEpwKAuwdzw8UAsYFxwP5AgIeCL8kixyHC7ESAo0NTwEwBwgCAggIDAQ4OAICNE4CEw9VdrMBDgIEJAiVAYYBBqEBWAYCAh0CbQYzUYYBBBgIAQxRAh0ZPh4TMAMEowEMCBseGgIeGAYCGx4IBAoLAhoCJgSSAQISAQMCCl4eGAsCAk8UGQbEAQJNIwIEGimIBTETDGACDg9zAgIEBiStAiEuBgJcAh4EAQUhigFxAgYCBhICBgYC0wECBK4DMNcDFgQCBNIB1AQSHAICFgY4AjRwH2MKmwEiNgwMmwQBAwMiIwQCUkUKAgIIxQFwGQsEmgICrwHHDewUCgIMCAchAQcSEA4BBggEEAwEPQICAQgCAxAEAQoECBEdCAcCBAYBAQEdAgIMCg4MCAEFFA4KDhAoFgw9Dh8CBAwCAQEFCzEiEBQGAhMBLw4kDgUdKw0PEA0tAQYPDD0qOgIDEhoGAgIHEAYFASUEBhgKVxgCGQEQBCcOBgsCBw4BAQEXAgMNEgwWFTkCEAsGCgQvBQEIOQIaCgMdBAIzASoMNwkCESUEKEIdFwMQAQECAgYQAQECAgoMCw0CBgsDAQEYMwMLNAQHIhgZCxgIBgEBAQEBAQEBAgILMAoSFR8KBBICEgMRAgUCCAIBBgQDAgMMEAgCBAIKAyUKAQ0IDBQMATUIIwUMAwwGDA8iGiwEBhM3JAclFAMHAQECAgYGDgYCCgQPAwESBxMPARkECwcLAQELDggKCAQdDAIidSg2AilNCFcTC4cBAiYCFQsGAhIGJwQDJQIiBTYCAgQEBAIHDx4GAQsBCxQLARc6GgQKBR8iCgICCjIGAi05DQ0CAQMBBQICBAEBARwDBQwIBgIGBwYKAwICCRkLBgIPBgwJGxBLASYrBR0KAgcMEQIXCQ4OBgQfGQICHhwUDQ4ZDQEHARImGB4QBwEKEwcUBCYQEgQMNgEiMCQBDwgCBwECFjoBCAIFASkhES8BBAQEAQEuCAINFQQCEAETBwEODAUDBA0TCQMaHhACCiUHAwsECgIIBjkEAgIMAgMdBA4EBA0JCSMBAxUPKQ4DKwIdBwMVBAYWmAEhBAQRBwQaBDgECyMaHQYGAgQCAgQFOhIIAQEEJgEWAg4BDQMkAQMGJQwCGBYRKhM5BASCAQMGCR8nAwsJBAMGAwQDFgwcBAkSBwIMeQIOLyMMCRUJAhAyBx0LPQjmFQUB1wTUAgECoAK8EscH9gcSAgIL5w+bAesFhBMNrwYl9wMiugPkA5wDARgKuwwCAf0EgAK3R5QDLtsG+CTnBQg0gQGJBOQCkAECArQJlAIBAQX2AocBygf1AdYHnALHAcoFAgLFAQSzA50Blghn8waFAQoUhgECAgIMGjg0DjoXCRYQcg85AkAQBIQBoAEVzwE8AhECBAQECgZWBBsiFkYUKgIIFw4EEgQGGTpQlAESlAEBARcQEgIZWgQkDx4GHQYWBhglBQEBAmQITQgKUAYFVwECFAIEAgYECQIrDBYGCAw1BQgEYAc0BgoEQQYIChYMFpIBEFsJAQEDesYBhQEGAk3cAQsJBA8DGwkvAVM8DAFYPgIEDA4CAgQGEzxZDx4UOCFDcwY02wEyFRULHCKSAYkBGzhCRQQEGTQuEgIQElk/Ahh3ngF8DHAEBgoCRAQaIQ4sCBcEDwo2GQ5yGRENIxcCAgUQCQwGPFgaB00bHSNYEkUQBAQQJRAnKwJNAgJQECojIwUJGD0GHwQeAkNvQg4GHQ4q2wKUHtoI/hDnBCbKDuEK8QeNCOsC/wO5AgQGjQ+7BIUB7QUJ4AK3AQLfBOcEOpQBBCT1A+8HhgHFBALCCBgVXBSvAd0CxAN8eViaAgIC2QKYM5cBuA63GCIc+QXMA4IBuwfLBdYGywTDGfgJ3gMtFbgBpwGZAtwBVIUJChIK/wNcPDKYBO8Cug2FAvMBqgGwAv0DnAyDAU+lAu4x7iaSDvo5/wHTAasKFkrQAQYI8gN68AFMjwHUAjmaB78BwwbPAQj5AQG2A7MBogWJAv4BjQu3AmsHkgwc0BKdCY4BuwcIngm/FNERqiXyGNUh4wbZEqYdxCHZBKId2xQckxSHRvsCQ18UJnIQChoGBioECgIUMwgCCgYKBE8C0AJjEB9FHwgEcAgLARAuNCQlhgJABgsGCAICNAJDAlfgAQItApEBNDaXASINBAQQjwFBQQK/AwQCAgTYAVoQAlIIAgIKBjYFBVYI6QEDBdgCAhK8AT0MGMkBCAoSCF0KAgMCDCixAQJZJgcCgAEJAwk0FhQeBJ0BBATkAcQDFAIEAkoEfQpQAQI3NTEC4gICBCgJSwIEEgICBJkBAhAOAi5ICs0CAgoBQkEQQgICAj0bBjACnQJExguFAwSaApIBAsoDAQ8BCAgLAdMEAqkCxQXKCwENvgIcAUQCDAMJTf8GCBQBDQ810wECAoUDhAQCogMCAQEhuQ7ARc4LBIIDvwTIBLoLyQnLE78Z+CSnNIMVzxaOA/wrFRYClT2EIwWHDMgx5w/nD80CDs0EzAWdAdYBOALQAeAEJAEVzgEfhxOmBDeNAwTjC1gaCA4MCeoB8QI8AwEMhBmHMBo1gAICygmnAaMDDqIBjQczIiCRDVyLAooC6AE2ZKYBowGjD6YEoAbxHgznD4QjiAmEF+4B/QnuDC02pwbZEZYOxDHcMLwxvDF/3wFHAgIUd2dGpANjI5oBAg0CEPcBAhJAggEiBRsSd6kDCwIYkwEKLJABETcVBUAGRQcJAQY6IgwCEwojBhAaBgIEBiI1EQgYMyJvHx8KBgIJkQFpEeEEWEHzAWW4As4DLRbiAlkHKiMaAvoCBcYCDocBUiAM2ALKApoBEiUMAhIUHGJDAjE9QyYHtQE7Ai4GowEECJsBkAimA9sBKJYCBugIxwG8AQz6B8wEnQS0BoYBBJYDlweHAuMCWi+bMPw04ToG+g2fAgICBgIMAQcc+AUCkAME8AICAnIGBgQEPAwWAgz4AQkcvQKZA18EFK0GswP5A8kDnQMmCx0WAQUBAwe7AfUHGgIgjgIC3gIGAgICAhYCCgIQAgWvBBi4Ak80BuMBEakD9DSKHqwOyAQBAYZD5Q/rAqsMzh2jBb8O1xeoE4oZkTL4DLIJCAQWAuUEsQoCywnXAaYEhwLUC7wG5geJAtMBqEPJE5c22yqQHooXEAFIkgECwgECUpQCYy79A+4BY9kB0gMEOowD3AIQHgrBAa8BAsEC+gEFAZ4DswEBYawIMAFvBNIBAh1KKXT6AQYWARiqA0mtASTxAQEC1gPKBcMaBNcNddMBJMgGDkecAkgOnwahBmrwDqECvwuvA9cCBhoINAkBCQoIEQoBAQEDAQEBAQERBgEBAQIBASAHBgEFAQIICAMRIAQ3CAEDAQEBDgQBAQEDAwkCTxEDBAEBCQIEBBIiAgEBAQEIAgEBAgEBAgEBAgIKBgcBBAEBAQUOAwECBAgUBAYDCwEBLgYEGg4BAQMCBA8CCwIBCQEDAQQDAQQBAgEECAUCAQEEAQEBAQEBAgEDAQEBAQEBAgQBAQIBAQICAQEBAwYIAQEGDgUVBQ0CAxMDCQICAgIDAQMOBC8BAwQUCAEGCwUKAgwMAQUBFAIBHQEBATEKAQIlCQILAgICAQEBAQYBAQEIBAEEAgEHAggCAgICAQEBCgIEBAMDAQQ5AQgCCgIFAQIFAgEEAgICAQEBAgkBAgEBAQEGBgIJEhYCAQEBBgIGFgIGBgIEAhIUAQ0BAQMBBwgMDAIBAQECAgkCAQYMAgoBBgEKAgEBAQECAg4BAgEBAQIBDAEBAQMCAQILDQEFCwEDCQYRAwoCEgcBARsEAQkBAQwCAQEGAgICBAMCAQEBCzMECAEBBwYEAgIPAgIBChgICgECAQQEFwEIAgECAQILBgEBAQELGg8BAQQBAQECAQEBAQMBAQIRAQEcBQEBEAEEBRACAQEVARALARAEFAQFAgQBBAQBAQEBAQEDAgEBAQMBAQMBEwEXAQMUCAIJAgICBgEBCAEBARUBAgEDAQUEAg4SAgYuBiQBAQQBAQICAgsBAgQBBQEBAQsICAEJDAwHAQIFAgEBCAICBAICAQECAgIBAQEBAQIqBAsBBwEIAQEDAQkCBgINEB8RDgIPBRoGFgIIAgICBgcCDAMEAQUBAQEBAQQGAwIBAg0OAg8LAwwBAgMBAQEBCQgNAQIBCQgNAQIBBQgsFwQWBQ4TAQEEAQEIAQERBA0CAgEpEygEAgUIAwEBEAMBAgIBAQcBARgCIBcBAQICAQoDBhMMCwIGAQENAwEiAgIBAx4XBAE6AwEBBQEBAQQIAQEFAQILAQYCFQICCgcBAQEBBAIBAQICBgUBAQEBAQQBBwQBASEBAQYCDQQFAQECBgECAwkFAQECAggCAQEBAQEBAQECAQEDAgEBAQEBAQECAQECCgEBBgIEAgYIGAICCAEDAQIBAQECAgMBAQEBAgEBAQEBAQEBAQIBAQIEAQIBCgICBAIIAwICAQIHAQECAgMKESkcAgEBJQECBRkZBgICBgICAgIDAQILDgoSBgEEBAICBAEBAQUCDAIEAQIBAQEBAwEDAQEBAgEMBw8pDgEBCAUBAgEBCAIGCA0BAQEMAhECAwIMIx8NAQMBAwEBGwIBJQkQAQQCCgQXDgI2AQcDCwMDDwIBAQQBAQEBBwQCAQEBAiQBAQEBAgECAQEBAgECAQELAQIBBA0DARcCAgICAhACAQMUCwICAgQEBQEMAwkVBAIFAwEBEQEHAQ8CAgEGBA0tFAEFIwEBAQgECAEBAQMGDQQDBwICAwQDAgEBAwECAQEBBAsBAQEBAQEBAQEBAQEBAQEBAQIBAQwBAQECFwECCAQKFwEKAgIBAQsDBQENCwEFAgMEAQEDCQICDAQCBgYCBQkCAgULAgQMEAgJAQgHAgEBAwEOBAQCBwECCAEBAQMBBQMBBAMBBgoEBAsCCwEBBwQGAhgZAgICBgsBAQEMEQICFyEBBAECBgMBAQQDAQEBCAIPAQICEgYPHQECCwEBAQEUBAICAwIBCAEBAwICAgsCAgIMCRAGTAgiAQEnAQIBExoqAQIKAgEBFwMCBgEBEwEBAQIEAwwEAQIBAgICBAICAgMKCgsBCAUBBgEDCgEBAQEBAQoGBwQCAgMBAQECAgQBAwcBAQIBAgIBAg4DAgEBAQEBAQQBAQQCAgMBAQEBAwEBAQECAQEMAgIKCAICCggBDwQCAgMHAwEBAQhRBAICBgoHARACEwMBCAYBAQEHBmEBBAICAwEHAQEODwkDCAEBCCwMBBsBPwIDAgwKAggDAQEBARAVAQQDDQgCBAIHAQEGCAEBAgECAigEBQEBCwICFgoOAwEHAgMBFgIHDBMBAQICAgECFRIDAQgBBwEBEwIBAgkEAgcBAQcBAQEBAQMBAQEWCwEGBgIKEAEDBAEBBAECAQEBAgEDAhEJAQYGAgoGAQIBHQEOCAQIAQEBDyEFAQIBBAELAgEBAQICAQUDBwECAgEBEgIQDQECAQEFAQEBAQICAQgCAgICBAIBAgEBAQQFAgIBAgkCAQEGAQMGBigEAQEWAQEBCQcGAQEBEgEBAQEBAQICAQEBAQEBAQMDAQEEAQIKCgIIAgYLAQoFBAIBAQQCAgoEAQ4LAgIGLQIEAgYBAQEhARgLCQFGQB42LGKQAUw2V3AJKS4TzAEZ7AEfAQwTBwoBEAEBE2YRQAQmSA0lCA8BXQECCRGKAQocYhQ3CB8BAwQBWT0yBAwTCRMqBgsLEFQLBigJSycBBAgbHAElAgkBFwYEAQE8EQ4KDQFOYSUBEwFPIiKYATB8I2M1B7wBDQlcAwVwHBlXFyYRkgFPNQcEAQQHCgxTW2AVDgghNEMBARoeBAIEDAISAQgEDAMmnwEBDQoNBQQCDYwBJRVXBHQtGAdgLQEBcxAdMA0CKgQCJAoEIxYwAkQ3RCoPhAFKGwEMBAJEAQE1Kw8QOyV5OmgdJm5rOR5HUCYXCAkEIRAlDAELBSN/kgEGBQIIAgQiEgIPGwhzSk4TAV4BSQcDBhIIBAICBBkBBgEBAwUGDBQBAQIBAwQEBAMBBAQEAwECAxkDDwYBAwIKAQcKAwEEBAEDAgEBDAICAgICCAICAQECCAEGBQICAggEAgEDAR0BAxkBAwIIAQQLAQMDAgUBCwICAgUGARABAQMEAgYCBQEBAQQEAQICBQUBAhALEQQQBjQCBQEBAQEJCAcCCgMCCAcCAwICBQcCAQcBBgEEAgIGAgECBQIBBg4BCAQYBAgBAgcEBQEdAQMCChkGEB0CDBEHBgEBCQQJEhAOCQ0BCQIBAQMBEgoCDwkDBQUEAwYKAQUJAwEGAQkPCQ8DDgsHBQQLAQEFDAENAwgCBgICAgMCEAICBAIEAQYCAgIIAgEBAggFAQMIDAUHAQIKAQQBHAUDAg0UDAgBAgMCAg4IBgUDAwECDAEEBAMBAxEBAQwHAQIBBgIBAgEDBwISCQgKAgUDAgICBAYCAgIFDQQHAwYBCwEBDhEJAgICAgQCBAQGAgUBAgICBggEBAYEBAIFAQECCQwCBwECBgIDAQEBAgcBAQUIAgIBBgIBBRULAQMHBAEFAgcBAgEBAQQQFwkFBBUFBwQICAEBAwEKDQcEAwsICQMBEgIEBgMFCQMEAgQDAwUKDwYFAQMIAQ4BAgECBwkPAh0IAggCAgIECAIIAgICBRMCBAEFAgEFAgYCBgECAwEBAgUCAgQEBAgJFAoUBAsDLAIRAQgBAgMGEggGAQEEBAICGgICAQEEBAIBAQIDAQEBAQEECwwKBgQJCAQEAgYLAwQIBAICAgEBDAIDBAICBAIEBQoBAQQBAwsBCAQCCQEBBwICAQkBCQICBAIKEAQDAQQCAgEBBAEDDQMGBAILEgIBAwcQBwMJBgQiBQYCAwQGBgIDFAgDAwYNBQEFAgQCBAUICAMGAQEHCAgDBgEBBREGBAERAwQCAgICBgQKBQcDAgICAg0CBwIBAQEGBQcFDwEGAQ8BAQcFCggDCwQFAQIEBAIDAQICAwIDBAYFAwIEAgMBAQIBAQUEAQIFBQEBDgcBCQ4iDwYODQUGAgQDAwICBAQRAQUGAgYHBgIBBgUDDwQNEgkFAREbBwEHAgwCBAIGAgIGBAUBAgMDBggEEgIBAiABAgIEBAEOBwUBEwcDBwEBAgEGAxEDESoBAQIFAQQCAgIFAwgQCQkLBQwIAwIBCQYECQIIBAUCAwMVBAUJBgEBDQIBEQUGBgQFBgwDDgIJAQYDCwkOAQQBAQoMBQICBAUFBQEEBwEBAgsGAwQCBAIGBwMKAgIMAgEFBwYHAQMDDBMEBgEFAQEBAQEBAQIGAgMCBRIUAgUBDwINDQUBDQQOAQESFwkCBAIbAhMGBQcBCgEEAwEKEAIDDhMGDAUKAQEBAQQCBgcBAQQDAgELBgQEAQUGBAICAgYCBAQGAQwHAQgHCQwHAQQFAgIBAwQDBgEBAQEDEBUDDg0NAQICCAEbBgICJgQNAQUCAQIFBQIQBAIHAQYDAQQCAgQCBgMGBQMBBQMCAwEDAQUCBgEBAwECIAIDFgweGxoDAwIECQUGBiECBAEBBwIBBAECBAEGCgEDAQEBCAQBBwIDBAIDBQIIEBYKAwQCAQEHAgEBAQUOBgYDAwIGBAQCBwwIAhMCAgoSCAgKAQgCBAgDBAECAQYCAQEWAxIBDgEBDQQBAwUBDw4CFAICAgIfBwoDCwIKAQQCAgECBwwCAwELAQYEARAHCQIMAQIBKQIGDhALCg0BCAELCQwBDw8BAQIFAgsMAQUBAQMEBw4GARoCAQUGAg4eAgEEBAMHAQQGBgEFBQYEAgQCBgIBBAIEAgICDwcBDwMQAgYCBAIBAQICCQMPGAgIAQEDBAQBAgIQAQQEBAYRChUBBgERCxACBQYCCggKAQEHDAIcDQEGFgIBAgUDAg8BBQEKBhQBAxgIAQYCBAgBBQkEBAIEAggCAwUBCBAFAgEEAwEGAQQGAQIBAgIDAQIMAwkFBQgBBAUFAwIFCAQDBgcOAgcDCgoBAQEIAg0BAgMFBgQECAQBDQECAQYZBQYDEQcEHwEDAgYBCwsCBQQEAQUSDQEGAQIHAgEDBAYQBAEDBgIEBAEbFhAGAg0LBgcEAQcBARAJEQECAgIGBAMCAQMEAwICAgYCDAIHAQYXNQwKAQwTBQIEAQICBgoPAwMCAQEFBAwEAwMFCgIPEQQGAgIGBQMBCgICAgMBBQgHCQEWDwILBAgBAhMEAQcGAgICCAQCAgIgAQgFBAcWCREGAwINAgIDAwEBBAwIBAgPAwQCAgYCCAoBAQcDAQIBAQoDAgcCBAcBBAUCEsMiAQEEAwEGDAICAgkFAQIEBQEDAQUCBwIBBwMBAgIBAQYCAgYCCwEEAQECAgQCAgQCAgQEAQICAQECAgQBAgUBAgICBwEBAwQCBgEEAgMGAgICCAYCAgEBBAgDAQICAgQCAgIBAQICBAICAgQGAgIBAwIBCQIEAgIEAgIEAQMBBAIBAgEBAgEBBgQLAQMDAQEBBwIDBQIBAQEBAggCAgMCAQIDAQMBAQECBQgEAgQBAgQCAgIBAgIBAgQCAgQCAgMDAgIEAwEBBQQCAgIBAgEPAQEBAgENAgEBDAcBAgIGAgMLAwwLAQEDAwQBAgIDBAEJAgUCCAIBAgEDAQIBBAIBAQMBAwEBCAECAgIEAgEBAgQCBQQDAgEBAQIBAgIBAQYCAQEKAgEBAQEDAQICAgQCAgEBAQECAgYGBgECBgICAgEBAQECAgEEAwIKBAIBAwIEAQMCBAUCDAEBFggBAgUFAQIGAQEBAQMGAwEOAwMBAQICAQEEAgMEAgMBAwECAgQCBAILBQ8BCAMDAgMCAQECCAIBAgEEAgQGAQEEAgEBAgECAwICAQECAQIBAgUGBQEBAgYCAhMIAQMBAQMBAQkKAREGAQEBAQEBAQEFAQQFAQcCAgUFCAEFCAEJAQEGEwEBBgICAgUGCAICAgEBAgICAgEEAgQCBAQEAgMCAQIEAQICAQESBgIBAgQHBwEBBAICAQECAQECAQEDAwICAgQCAgIICAQDAgYDAwEBAgEBAQIBAgQBAQUJCQMBAQIBBAEBBgUDAgECAwIEBAEBBQsCBAkGAQEEAQEBAwIEAQEDAwYBAQIEAgMEBAQCAgIBBAEBAwEDAwEHAwICBAYCAgICAwMCAgIBAwMBAgkFAQQBAwMCCAYDAwYDAgcEAQECAgQCBAQEAgIBBAEDAwIFAQoGAgEBAQEJAgMCAgIGBwUEBAIBAQYBBAEBAQIGCAgCBwICAQEBAwEMCgQBBQIIBAUBAgIFBREBAQgEAgIIAQkBCAICAgQBAwMFBAICAQIDAQ4BAgYCAQcCAgMCAgIGBAEBAQECAQEEAgQCAgIEAQECAwEGAQICAQEEBAcBBAIBDQEBAQMCBgEBAgEHBgEBBAQCAgQHBwIBAgECAgEIAgEDAQIDAgYDAQICAgIDBQICCAYIAwYCAgIEAgICAgEDBgICAgQCAgICAQcOAgwEAwECAgICAgIEAQICAQEBAgEDAwEDBgQBAQIBAQICAgMBBAkBCAMGCgIGAQUBAwQBAgMCBgQCAgIOCgQCBAgBAQEBAQIBAQECAQEBAQICAwECCAICAgECAQMCAQIBBAEBAQIBAQQCAgYEAgIKAQEEBAQEAQEEAQEBAQICAQQCAgIIBgIJAgEDCAICAQMBAQQBAgIBBgIBAgICAQICAQIFAgQBAQICBAYGAgUEAQEBAwEBAQMDAwoFAwEHBAEEAQMCAQELAQIBAwICAgICAQECAgIEAgEBAgIEAgIHAQIKAwEDAwEBAgIBAQIEAgEBAgICAwcECgEHAQEBAQQCDAEBAgEBBgYCAgIEAQEEAQEBAwEFAgQCAgEBAgICBAQFAQEIAgICAQMIAQECAgYCAgICAwEBCgQEBAIBAQECAQEHAgEJAQMBAQEBAwECAgIGAQkCBQEOAwkCBQEOAwIBAgECBAEBAQQBBAUCAgEBAgQDAQICAQECAQEBAQIBAQoBBwQDAQEFBAQBAQEBAgEEAQEJBgIBBAEBBQIGAQMECAYCAgQBAgsCAwMCCAEBAQkDAwEDBwEBAgMCBAQCAQEBAQIBAQIEAQECAgQBAQoEAgICAQMCAwEGAQEGBAMCAQECBAQBAQQBAwQEAgIEBAICAgoCBQkDARMCCQIIBAUDAQIBAQEEAQIBAgYDAgEBAQIDBgIEAQECAgICAgICAg0HAgEIAgEBAgYCBAEFAwEEAgMCBAEEAQkHAgYBAQIjBAIDDAIEAQMBAQICAgICAgICAQMCAQECAQEDAQEBBAQDAQQBAgYCBAUBAQMEBQIBAQMFAgEDBgEBAgQBAgECAQECBAEBAQ0BAQIBAgEEAgYCBgICAgEBBwUCAgMBCgoEAwQCBAIMDgYEBAEFCAMJBAIBAwgFAQQCAgEDAgEBAgIIDgIEBAMDAxUBAQMFCAEBBQICBQIDAgsBAgIEAQMEAgEBAQECAgEBAQECBAICAQEBAwMBAgICAgQHAwEFAgQEAgUDBAQCAQEBAwICBAQEAQEDAgYEBAEBEAUGAQEGAQEBBgIEAwMBAQEBAgYFAQYDAQQBAQIBAQIDBgECAgIBAQQEBAQCAQMCBAEBBAQCAgYCAgICAgICDQYCAwEBAQsSAgoBAQEBAgEDAgoBAgECBAICDwoHAgIIAQIBAgICAgIJBAICAQEFAgIBAQMBAwIBBQEBAQEBAQEDCAIHAgUGAgUBBgcCAgMEAQMCAgEgBRMRAgIEAgoDBAMFBwQEAQIBAQMCBAENAgIFEAkBAgEBBgYBAQEFBggEBgQEBAQDAQQCAggGAgICAwUBCAIBAgEBAQYCAgIHBQICAggCAwICBAICAQEEAgMGAwECBgMCBQECEgUCBAICBAgBAREGAgEFAQQFCQMBBQEDAQQCAwEKAgUHAgIBCgICAQQCAgICAgIBAggCAQEBAQEBAgEDAQECAQEBAwQCAQEBAQMBAgEBAQIEAwEFAQMFAgUCAgEDCAQBAQYCBAEBAQEDAwECAgECAwEGAgIJAQICAQMECwICARgEAgYBAwEBGgEBAQEKCwEBAQEBBA0CAgIJAgQCAgMDAQMEAwEBAQEHAQIBBgoSAgICAwECBAQBAwYCBgECAQECBgUCAwMIAgEBAgIEAgQBAQIBAQEBBAIGAgEDAgIEAQUBAQgIAwQCBAICAgICAgQCAgUCBgwHAQMDAwwCAg4EBAcLBQwBAwICAgIIAQECAwEBAQcDAgIFBAIBAQQBBA8DCQEFAQUCBAIFAQEBBAUFCgEBAQECBAIBCQEFAgEDAwMBAQYbDQIEAwYFEAEBBwEBAQEIAwEECQEEAgUBBQQCAQQCAQICBAMCAQEFDAIIAQUGAgEBCgMBAQEBBgMEAgUBAggEDAQCAwECBQ8MCQYDBAQIDAIFAQIBAgEFAgEGBAEBAQECAgEBAwEBBAECAQUBAQgGAgYFAgEBAQQECAECBwIBAgUCCgECAQEBBgQCAgEBAgIEBAICAgEDAQECAgICAQMCCAQDAQYCAgYCAQUCAQQGBAIDCQMGAQECCgIBAgELBQIKAQEBAQEBAgMEAQMBAgUBAQQCAgYCAgEBBgEBAQkBAQIEAgECAgEGBgMFAQEBAQYDAgIGBAMGBAICAQEBAgECCgICBwMIAQMCBAYECQECAgQBAQIBAQYJBQECAgICARAFAgUEAQICAgEHBAIFAQkBBAQCAgMBAQIBAgIGAQEEAgEBBAkFBQIBAQEBBQEGAQUCAgoEAgEBAgIBAQgFAgIBBAEBAQEDAQIBAQMCAgEDAwQCAgEBBAMBAgEBAgICAgICAgIBAgECAQcBAQUDAg4CAgEBAggDAQECAgMCAgEBAggDBAIFAwEBAwQKAQUDAgEBAQQBBQICAgICBQEBAgICAQQCAQMCAQEBAQEDBQEIAgIBAwcBAwQFAQQCBAIGAQkDAgYBBQEDCAECBAoCAQEBAwYEDAICAgICBQMCBQYCAgEDAgICAQkCFgEBAgIFCAICAQECBQMBAgECAgICAQEBAQIEAgEBAQEBAQYECAMLAQICAgEBAgEBBQECAwMGBAQBAQYBAQQCAQMBBQICAwQHAQQEAQEBAgMBAwUBAgEFBBEGAgQIAgYHAQEBAQQCAgQHAQQNBAoEBgEBAQIDAQECAgICBAIBAQICBAgCBAICAgIEAgQCBAEBBAICAgEBBAEJAQEBAQMFDwoBCwwBCgIFBAICAgIBAgEBAgEBAgICAgIEAQIEAgsFBgMEAQECAgIGAgICAgICAgQBCgIBAxYGAgEBAgQEAgQBAgICAgICBAICAgICAQICAggCBAEGBBQEGwIBAgEBAQMCAgIUAgECAwQEAgIDAwMBAgICAggOBAgCAgMDFAgBAgEGBgQBAwECBwMDBgIFBAICAQICAQYLBQQEAgYBAQYCBAQCAgIBAQIGBgIEBgMHAgECAQEDAQEHAQEDBQYBCgYCAgICCwL+N54O7QaHAdwErQTAAb0C8ASgAkm6AQsq1AG+B8sHxgW6ApwCnwF7uAa+BRYImQHAAcMDAocFvgMkdfQBRwIKZPwCfYgDEPQExAEyAVZMgwOrAf4CbZsBtQIl1gGuA+QDDBYQBgn8AuABFgIcpQEvVGqAAnujAyAMFGIQoQkhxwEUQd4Cg0GqDN8GJgUlEwgCBAYCDgoCBAgEAwILGgwvDgkYEwEBFTMSBQIBCAEKAQIxBSMFqQKUAgETMwYJBAcXQlgBMwgjSgYBARAHAgEFDSYGFxoCASwbGQIOBBMEChoMBCYEJAkLBl4ICDECSwU2Dz4HCxFAAisRCRENCz0EGAQwIl1GKwwGAh4RBgE+FAIICgwZBCYCAT09KQUPBActHgIeIwYIB3QgARE7am8EHCoKCwEIOAEQDiYLKAIDAhgGDzMKAhsENQsiEwICaBALARF/NQkKCl8FBkUUCgIeDC8QFg5UEgIBCxsHBxEUOgQjDRENDhsISgQMFYwBAgIOOEcBLAhDAgMBAgEiR4EBASgECgQVIxAdBRUGBgEBEBxtBQE3ETAJFyQfGgYlBBECAhoyDQEdAQwiHDswAQFHCBACBBgGBhMMFgEKAgURAgwUjwFZBBcNAgEKBy4QFCMNDhMCDgQDAQopFCADCkIcARceLAIGBQQqAhUVBB8CaB4IugEMBAwCBiBaCSECAwkPAgISA0AfBgkMBwIE1wFFHAcJCAQEAgcCFSECHwKaPrwF4AqEKgEqEggoEgQCDhADIgQBAiYJAQEEHwQCCAYLCgUUFggKCAUHBQgWAQURAwEMBh4EAggDNx4NFB4VAQQKB0kDMBgDEQECIAoXChgHazkhAQwCAS0VBTpREAICGwQGGT0CBg4hDD0BAgYaMQoFAwEHCAIQEQYBAQcHEAQ9IwICBAIEDAYkOSMjASUhFgQCFgcnQAIEDTKVAQgCAgIOCAICAiYGEAYBAxUBPxIRCBg7HwQkCAICECQQJgIGBggJAikKEgMLFggCIAQaHAURCCoCAQcCFQQQDDESBgwDGwcbNgcBBBQIEA4sEREmDxUKEQkOAyA6IAoSCSZPEQMBEgUlFhgQKScEBgEIFA8CNCEYAhwGBAQODiI5TgoQCiAfFgIiIBAGDAICAQUYEgJKAz0IURkZCAJyQxIBHQgCARMICj8VAgIEPB0PLwQGKQsCEgYFBwQIBRAEBAQBAQEBBAIIAQIPDgM3AW4RBAUBBAYFDwUgLiEVBRMZBQQCAgIIBAQEBRwXIAgRKjMSEiACBEQEKh8YImE+HhoFAgIDAgEWBwQOEggwBAEKAgUFEQIcAwQKAisGBgQMBBAtAgoEFgYJChEmGg4FDycKLCAgCQEgFwsKAgwJAxUMJhIbCwQLDgUIBw8aBg4JGAEzJgoLBhYzAzEYGAkQKhUnGyo2Bn4TAxMGAwsQEAoEOwoJDBUCTQEZJAcbSAYCEQcgCQg+DBkR1xrZNt06nALXArEBwgOECRPeBAeKASgV3wMMkgIitAVgde0DtQYCxgLyAWyNDrgBhAJrngIwcg4HHCVXvQGcAVYOHggGMAoDDFkUDjYBgQHzAT8vwgEeCDIhAxQdHhEQLVBkHGs4OQQKCfECYyccBhUgBgEGAQQFYyMvBAQECwEGBD0fHR8vPgQClgEOOGklAhozBAQID8EBCghQbFYKvgLzAUAMMoICG6ABHA4jCW1seQEDOxMuCURKAQEBAR4CAxACDm47Cb0BTrMBDwQJmgHBAYcBBwQKSQSQAQLxATGeAU0GLApGBAgTHwEESxwCAgIKOQYwBR1QLZICBAoGZ7ADFLwzlRpGSQqKAXIqZqYCKBC+AQsDKWQtAj5cEUGaATEZVxBLKBYCCAoRChZsWIYBQRefARw6M78BAgYKNwGZAS4ZFEdjCj1JWQFcB4YBXQMDggEYAiDGAXJvQgQCBAgEBgQFAQIcKw0GQQ32AQYQcmO2AV88URQeAgKYATAROeoBBwwTOhUPNHsTZAFoHAY5WgrpASidAQY0OCtHbTmJAnu3AzUEdQYIBAICCAzUAdQBOgSfAQwMAgyQAwQCggnnAesDgAEQ0gIaDrcBMf0B0QebEDK+AeQC8w3NARcnIT8fCQR1QkkNFAIGAgUBCAZghQEbEgJ3oQFmNY0BggEEBQEHZwRoBDCNAWQOBgIhbGAgNgJE6wEclQEGApYBLgQGLkUdChAJDAQeBg+hASg/MZcBawFZBAVCiwERS2sMowJGTDEnBYEBZ9YDGR8DDwITUbUCCQweFAIpHHSMAlxI8gEOBwEOBGblASICPAgEDiAQFQExkgE+GwgGH5oBNgPDA2YBNAYIH1QWBhygARtCBxAtFwICKtsBQQMfHAAECAQMBgcTCgoaARQEAgEBCAQIBAQBAgISEw8HHAIeAQECAQcNBgIBJAIBDwoCAggCEgoEFAQLAQkVAgUCBQQCAgQKAQEGAgIBBQEBBgIFCQ0DDBEBAgICAgcCDQQhBBcBAgwDBQgTBgICChEBAQcBAQYEDAIFAQQKAgICFAMJAwQBAwgWBgYYNAECIAMCNiIKAQEKAiEBGBUPESsKAgICAQECAgEDBRMSJQgBAQgCAgUQBAICBAIFAgQCBAgUGRICFAEBDB0FDQIEDRYDAQkBBwgIAgcBBA4UAgEFCQMBAwIKAQMGDRIDAgECAgIBFgIDAgcQCAENJwECAQECBg4CAgEYJAcDHh8CBwMBIAUKBBAaBQYBBwwTBAMFFhAKAgkPBAsEDQEHBREXCAMCAg4fAQMBAQ4BBgI5AwgIBgIECAgGAhcPDwcDBAECAQgBEx0GAg4IBQUCASQPDgkJBhoCChEBAQEOCgQEAQEFAQEBAgICAhUCARIJCQIDDAYBAQEIAgIDAQICEgoBAQYcEAICAQ8CBAQGBAYECgICCBAHAQICAQECAQEBAQIBAQQHEwgBAwIODigFCwIRCAgCAQEEAgYEAgIBAQEdIA4EBQETAgMEBQETAgMDAxIFDwYBAgYCBgELBAYIAg0GDAgNARkEBgoDBxkCAwUBBgMCAQgDAwEBBQYGBAICAgMGAQMEBgIBAQ0ECAIGATcRGw0DBggbAwMEAgICAgICASIYIx8NBhYCAQkIAgIKAgYKAgYHBgYBEAMFCwIBAgUGFwECAgYaFg8BBAQDEhsCAgEJDQcIDgIEAwQBBg4GAgICCgMZBgMJAgMEBAMPBhEXBQEFFQICAiQCBAQOAiECEAYDGQoJBwYCAQECBgICBhAGAggCCicQCwYCAQICAQMNBDEPMAEBAwgZAgIBAQEBEwIEAgIBbAUCFg4CAhYWAQMDHAgIBAgCCAgTBwkjDwUgAkYCAQIEIgwCBgMBAQYjBxQEAQwGAgYEBggTBBwEFgwCAQEUEgwtCQIBCAECBBsFBgIGBAEEAgkCAQseCAwMAgMCDQUQJQICBwYHCgcWBAIJHA8KBB4RARMJDwMuAQ0CBCQIAggSHhYCIQYBAwsPBAIHNAQEAyQzAQENQQIEAQMBAQkSAgsFBBcHCgUhAwEEARACAwMEBAcBAQEYDgIMAgEEBgYDFCwCAQEBAQQMAiIBAQsLAgIUAQIEAgMOEwIIEQEIAyUBA0EZDwICCQICAREBHAQCAQUDBAICDwIBCQ0HBAUBAQUDBQICAQMJAgYEAgQIAgEMAQIGBAEBAgoIAgYMBwECBgEDDAQGBAIGCgYCBhwCAgQOAQECNQMCCwECCAkKBAoEEAQCAgMQDyIBAgIFEAUBAhgBAwEBEgMNByAIAQEGAQkEDgcCAQoCAQMJDxIICAECBAkBARIQHQEEBgImCAIeDBkDAgQPDRIMAgsRDQUBAwQKBAUQEQQPAgQMARQEAgECDAIFCggCAioBCRQCAQECAUMGKAICCgECAwYGAgIDDAQBAgMCHBYIAQEJAQQDAQQCBAULAQgSCgUGBAIMAacRwjOjAdcC1QOAB5MJzwiIAhDwCMQEiAO6BJgEzwivBQzFA8sF3wqiAtgB3Q7XCm+lC4kCIpcC9QcGlwEj8gGaB9gYxAL+AxVyeYMCyALTBmAgAifCAZ4BOQrvAgYWBkMnDgGtAToIN1JXGmFNFCEGBqYBqwaFAz8EoQHYAwRP4AIw3wIJOALNAr8BJmPNASNDEBtDkgEaDl9HezzMAmQmHs4I2xfHFNtLwANzAhIcEBcBAgEBBExCAjcHHDAEBGQBEwY9AgYWCQEDEGwIAgwCBDcKUgEBBgMBdgYIUASrAQEBBggJAxcIAgIZPTkYAjsFCAIGAgQEAQEQHE0bBwEGBAECAQIEAQEDBQUvIIIBAiZqAgoLBwIBBQEHCAIBBQIBQHECAgYCTQEYBBgkGAcDCQweJQQEOgQNAQMPHg0LAgEBAgIKFAYCAgIFBgYCITAKEAILOwI0AgoKLAICNAYcEjtJApIBAQc8BiUCZxgECRoCAQFeAjcGAgIMBAICaS8IBAoSVg4gQEE6JgoCMgUCCkUBAg4BbBACOwECAgw0AgYHBjwEBi8CAocBCm8HEAIFYAQEAiACDQgCAQIBAQcCIwMBBgFhCj8CAg0UAQwCAgFcHNkBAQQFARQ4AmoCKWQDGkMTGQpYDkcCOgMCCKoBAg5yAk4gAgEUAgEICCICDAICAggEVgEXFRwmAgIEbQQCAigBECZUCgQqZAICAkEgATscAQECAQEXMgJDQQICCAYuAgECAgICJwQEAhUCHQJwAgExAQEUCj4FDwQOCCsKDAQDBAIMFQJNAgICPxEMAkYcAiEcGAQEmQPaA4YIlQn6DAKPFogFiRvQC7Qf/S6tBKECAqoNCEUBMK4G6QSGEQQM8wsCtgIKAgYSqRlGCTceLwcDIQMFERgMFgQRApABKQFZOQ0LIhEuBAYKCSklYTMVQgcBAQ0JOmJmAQwFAgQECwcDiAECAgIPRBECTRAOBBEFCBc6JQECEAQEAQ0CQQsvBhMNdiMCEhUDBAsCD2gmESgDEgIEAQMSAgQBKhEDBAQ/DBlCEggKPREFAgYbHDIBDAYECgEBKggECxsKAjgIBBUHARYRBBgLATARAgMBATwGCSIiMhFHDhsVdQgTDxsRLUQCESMChgEWMAYiBAEHIBEYBgoEAQERNR0nAxsMNzooJQJYPAEKAiACBAQISQUWAQ8DDgsFBQJ8AwUhUyUrCgQEAggdCQYCAghICnADKBZPYRU+KhtMDRcBFAQGCRZ0BCcmDRoZMRMGLgsWBiQVSBctFAppCAIfAQOEATYUBwwBBwETEg4IBBcBAXsEOhURFlgLBTUBC0MjAgYLdwIPAwkWUAUNAQUKAx0CIwYCAjIjEz4EBA4DBwEENwMxBwgCI1wjDycDDTkFCQVPAQYKGygCAjUTAgEEfwEHDAQOBAJLCAEBCw4kCRXBIgKbCQKCBs0CMc8GUNwDiQLOBGlW2gQGogW8ASO8CwwvBKcCnwEEAQEkD4EHLC5JlgPoA6UCBPIYhgLkHucO+RjbJsk8ySHHBAEBAgQCAhsBBhgCBQIBAQgBAQQCEQ4BBAEBCAICBAICBAQBAgIEBAMHDgQNAQQBAQMIAgEQAgIOAQIEBQECBAIBAQIEAggCCAMCARAEBAICBAECAQwEBQEBDgEDAwIIAgIBCAEECwEDAhAEAQUEAQEFCAICAwIFBAICBAQDAQUCAwMCBQoOCwUDBAEBAQIFAwMFAgIKAgMEDQQBAQECAwgCAQMBAQIDBAMJBQIHCAICAQEHBgETDAIGAwcDAQIKAgIEAgIHAwMBAgMBBAIGAgYUCAcBAwQICwQDAwcGCQEBBQcBAQYWAQECCAMBAgECAwEBAgQDAREDAgIBBgYEAQQCAwEGBAICBA4CAQEOAgkCAQEGAg4BAgEBBQEDAQUCBQUBCQIIEAEBAgYCAgQOCgMCBQcCAQkLCwYEBgEBBgYCAQIBAQMCBAEMBQYJAwUCAgcJAQEEAQICAgUIBgYBAQIBAQICAQQCBAEBAQEBBAEGBQEGAhwBBAcEAQQDAQ4CBgEIBAkFCAQDAgUBBwMCAQoRAQgDAgUBAgQJAQIBAQIBAQIHAQEBAQ4FBAMJAQEFAgUEAQ4BAQEJAgUEBQcBAQQCAQMBBQIBBAIEBgICAgMCAQYBAgQDBgEBAQEGAQICAwMBEgUKBwQBAQICBAIEBAIBAQICAQIBAgEBAgICBQMCAQMGAgMBAgICAQECBAILAQMCBgEIAQgBAgEDAwcCBQMDAQEBAgICAwIBAQECAwEEAgIBAwEGAQIEAQMMBAYCAgEBAQMGBwYGBAQEAgYDAQEEAwMCAgIMBQkBGQIFCwICAwQCCgEBAQUHAwQGAQEBBAEGAwMBEAYHAQYEBgICAQEPBwIIAwYFBgIPBQICAwIEAgQCAgEBBgIFAwIBBwMBAgICAQIBAQEBAgIEAgICAgIBAgECAQEBAQICBAICAgICAQIBAQECEAcBAgIEAwECAQMBAQEBBgECAgEBAQIBAwMBAQgCAwIBBAIBAQgIAQEBBgIICAQBAgQFCAECAQQMAgoFAQICAgMBAQECBQkBBAMBAwMDBwkEAgICBgIGAwEFAQUBBAYOBAQEBAEBAQMBAQEBBAIBAQEGAgIKAgIBBgQDCQIBAwYBBQsEAwIDCwEBAgICEAEEAgEBAQEBAwEBChYIAQQBAwEBAgsBAQUEAQEGAwEBAwICAQEFAgEBAgEHAQgEAwEDBAEEBAEEAQIBAQQMDAECAgQCAQICBAgDAQECAQQCAQUGCwUCBAIEAQMBBwQCAQEFAQkCAQEEBgICAQECAgIEAgICAgIBCBIDAgEIAwwCAQECAwIIAgEEAQQBAQcDCQEDBAEEAQEHAwkBAwIEAggDBAIECQcCAgEBBQEEBAIBAwgEAwEGBAICAQECDQETBQgBAwQJBAEBAQIEAQEOAw4CGgEGBAEBBAEBBgcFDQIBAwIBBhABAQQFAQECBAYIAgECARgPBgEBCQ0NBAoFAgIJCAICBAYCAgMGAgICAQECAgICBgINFgIECAEFAwEEAwIFAwMCBAEIAgIpCAIDAhABAwEFAgIEAgIBAgIBAQECAQEDAgEBAwQBBgIBAQUBAQEDBgMGBwEEBQIEBgEBAgQBAgECAQcBAQECDAICAgICAQIDEQIDBAEYAwQBBAMDAQISAhICBgEDBAYCAQ0CAQUCAgQEBAICCAIEBwIGBAIBBwECBAMFBgYICQUCAgIHAwQDAwgJBAoBARAMAQUDAQEBEAMGFAEEBAgEAQYOHQEDCgkDAgIDAhAEBwEDAQECAgUGAgEBAgEBAgECAQIDAQICCAQCAQIBAQEDAwIBCAUEBQQLAgEIFAMIBAICAQEBBQYDAgMKEggQAQIBAgIGAgkEBAQFAQIDBgYJAgIEBQsDAwEHBQQCAQQBAQIEAQECAgIBBRUCLQEHAgwCBgEDAQoEAQEBAQsLAwICAQEDFAEBAQEBAQEBAQEBAQQBAgMBAgEEAgQICgQBAwEHAwEEAQEBAQIEAQECBAEBAgMDARMJBgkJCwEBDAEFAwEGBAEGAwEJBwEKBxYZAQQBAwIGCAoDAwECCAECBgISAQYJBgIBAQIFCgENAwYEBgIEAgQHFAIGBQIBEAECAQEBBAECARcDAQECAgECBQIEAgUCAQ0LAgcBAQEGFwECAgIBCQwBAQEECAICAwECDQMBAQEEAQIBBQgJAQIBCAgXAQEDAQEEBAMBDgEDAQIHAgIFAwMLBQECBAIBAwEHAgYEAwYCAQMBAg4BAgYGBAoCAgIBAQIBBQESAQECBwQFBQEBAQIHCAQFBRgBAQIBAgIGAgMBAgUBAgoEDQUFCg4CAQICDAQcBAMCAwUIAQEBAgUDAgELBg4CAgEBEQIDBgEGBQEEAgMBAQEDAwINAQgEAQQCAgECAQEIAQIGAQICBwEBAQUEBAIIAQQBEwMEAwMGEwEEFQEHBQIIAh4DAQEBAQEDCwEBBgkCAQMHAQoBAgUCAgIBAQQDAgQHFgECAQgBBg8BEQECCQoCBAgCAggCAwEBAgYJAwECBAIEBAIBBAEBAQEBAwIDAQQCAwMDAgEBAgEFAQECCAIBAQEBAgULAgcDAQEBAQEBAgMFAwMEAQIIAwUCCQMDAQMDCwQGAgIKAwYDAQMEAQMBAQINAgIDAwIIAgoKAQIBCQMBAQUBAQEBAgEBBwEDBwYBAwoTBwwLBwQEAgEFCAgCAQIJAgEBBAICAQMGAgQBAgQLAQgEAhAIGAcBAgIBBwYEAgQIBAEFAgUHAgECBwQCAgICBwQFAQECAQcDAggBAwEDBAECAwICCQEBBAQGAQMCAwEBAgcBAQIEAgICAgIFBAIFBAEFAgsZByIDAgQBBwIEAQIBAgEBAQQKAQMFBQMDBAYCAQEDAwIDCgMDAwIHAQIGFgUBAQICAwIIAgQBBgIBAQEBChMMBAIBFAICAQECAgkDAwkGAQECAwEBAwEBBAQMAwMBAwMFAQMGBgMPBgwICAMEAQECAQMCAwMHCgMFAwEHAQYCCAEBAwEEBAQEBAQICQMBBQEBCAMBAgICAQEFAgsEAwUGHAYCAQEFDQUJBAIBAQIIDwIDAgYFCAUBAQQBBgIBBAIBAQEBAQEDAgoCEg4CAQEBBQECAQEBBAMHAQgCBAIBAgQIAQEEAQYCAg4CAQEBAwIeAgEZBgIBAgMIAgMDAwcDCw8NAwEIDgMJBAIGAwYCAwcDAgIEAgMEAgIDAgECDg4FAgECDAoCAgYEBgIIAQUGBAkGAQQDAgQCDQIIAgQDAQGtQABPNwEcATeNAQEBREoBggEBWQIGASJKKQFBb3YJgQIBDX1DRAEBajQBFl8BGwGJAQUcBQF1ATbGAQE7GQMZAycBFAcCG0cBQgM6BjMEBAEaARsyFwoBAXirASAFARIBAgEBSAMDHwMfAQc0GQwBATUwKlIBAiCdAQIBCAgBqgEXWwgBbwIzbjdlL008QkkCR4MBAQYBAQaSAQJiHMQBAlgICuYCTmwgAXMuDyAvZElFswFfASQBShoBE0MBARRfDDomAW0LOkVAAR0EEQJcbgEBCy5jAYwBCAI8MQMOASICBGUXUj0BBBlCGxJpAasBXwFAAg3QDrgWlxvQC74lUr8DywEICNIBRLYFBAsHCaABiQYXAtkD2gKoAcwG3QgOK+UGZKUBqgEyjwI+6gETggYEHuMB4QMUOyz+AaoBg0GZI7wmtAeQDVuIA0BD/xYBAYQDmRDABh2OA1iUAboCbwv3AkqjAia4An/IA2+YBiLFAvADrgH3BwKXAzHqBB+OAXIMmQbNA5YDAwQKd7YDhgEexAGQAYMBzwEpZssDzgFEiQEXF18cEp4BdjfGAQJVHERktAEoHDIXCgLIAhNQIiKYATB9Ip8BvAFyCHA1bpgCPKQBEh40TwUDmQFk4AGoAaoC2gF0XdwB+AGEAXlDAn86Jnk6hQH/AZ4BjQEIPjERI5ECYBt72wLBFegGIr8I9AEES5oEuAGqDa0GAgSKAo8CAuYCS8gBsQ2lCHkCBATYBq4BAgEz9xvqBQ3ABrcBAgKnAgp1tQNN6RUKzwEl5AoCyAUaDAbAA5oHjQWCAeMB/Agf1xaKG+wDwRiUCbAH1RfiCPMIiQ6TBr0TAtlFwCnbBgTgEu0lAo8M4hKPDMQVlDkGFgrtBuwDUoQKJ/IFWiLxApAKugIaBA6FBQEOATy/AfcDDHUZngF35AEEHMYL8zrEIdA5owLDIYsjyBugFLExlRe9A5AON6M54xfEGOMXpQI29DcCkQsCxwKSMZkX8wbCEY4LvA6zEeEXhAECqgK1BSvdFAECAgECAQEBqxSxJ49LwCOoIOwFggq2AgbQI34BCegEUZcJoATsGQLTDOIF7AIgqwJ8As8OEsZJhCXcSvEKgwboDeshPBfRCeMX9QG7C+gSiAmNBuo//EHQEtQMlCXUL9YmkgKhEK4DSF4CIMgBEVniARsKQAH+AXlNCsABCWnWAeIBfJoDcRm3AyHnAQEDQilIygKXAtkBWhgEvgMESwIBNjRQ1gKEAtgBWAIRJgaQAmysASRwwQHEAQihAZYBdsUCCxK/ARkG5QICUNQC5gECAlYECE1HuB/yAvQGsQSaCrcDxgK9BbgPAnwCCiCSDrADBrwB8wJ7sQv+GgYs5hPvBe4CrwNU2QEO5QkY3AnuBkYCMZ4BdWndAUbJAdAEmwkeiAUC4wMDAQKkBKEFkiiHFNgD+RP3ELIf9BABhyoBMB82ARgEF0QCEQUsFagBHl4wXRYLAh8peghMBgYVEzEBBRYKHmEMGwIUCCYIFF8MEyIxewIBIQkDAQ4ECAICBR48FwoEAgIOBhYMAxMCBQEQAi4PEwYCAxIGBggMBakCCAIIAgUBDAgXAgMCFQIDAgMcCQECFQEJAQEIDhstERICAgIEiwESGRAMGAIIIwIDATkgBAgWsQEMAQEQNQsPBiAPEw8TBgQWCgRaFEkBBAIEAgYiBhJKBwJuAQQMOwRsJ04KIUIiEgwaAhZgAgEoEg0WOQ0GSSAEAQUOARICURALBDZCKQEICAwEdwIcFwUdB0sIK0EEQzIIAjUaGEkeHA8OJAYYCBQHAgMHAhYiNwoPOy8kGwIWAgIHDAU0IwcBDAFEFwEMQjIXHgEZHyAiCBIHEAIGCQMyCgEmIRMQEygGBgYNLwEFHQEGYw05DhoBCBQKJkgCDGQHAQYDDSlQEAENAgEFCAKQAQIBN0thBAQnAwEZD04GFwMJDhQuAgoBAVIkAwE5fhNAAQEBRD0GBggJCRbAAQEHwAECSQmjAVQ/iQHwAWFSBCGpAg9XQgbVAgYGECMBpgHYAjocHScGDSgwAjYK0wEBGScKBCo1F0kBAl8BAQZtAiIiEucC/wF+Zh5FAfQDWAEKDio9An8CVAIYMBoBEQMWlgFrzwE+F1MMAgEWKAxNbSQGFC4pPx0CjAJu7wE2AgQKAwhX5wJSYTIcygEGCkJLBAwlKCFvOBIBAyETVQjfAXwdZ5AB5Dz/K8wFiB0CDtgIqCerJ84DygWRDr8Y4DmrIpMBAgYEBAMCgwJPDAciAtEBST8aBuECogEJzgJdagYEhQIEAnsLBk7tAcgBuAEqAqcBgQUavwHsAoUBGwIQsAMCBAYCDARsggGBA48FBgw4BAIGAQFFDj7MAQEVAQkBAw7vBRZM0wM6uQQd2wIKF8gBsgKKA7UC7AGeA84N/QG3Bh6qCbcGqQogBrwJ+gMBBAQQ4QIRrgWiAzrCCAL+AQE0BAHsAewHA4MaHDbIARDNBoYHyxECoR0YB7wSBO4SywaOBAShDGF6VK4B2QQB5wyWDIQOoweQA5YP3BLcBKNCwA++Md0UHBAPMYQDMz4pA98GvAKpAQQHG3jUBD8WGwH5AwZSDKoC3QMBlgGtBM4BBOIEhAGAAgJb+gPFAZoJfwOZAQGbAbUDvwMRlkSgMJgs8Rm3AtELjgjXKewJAvIBAgEHAQK1AYoEkgWsAWGfArACApkBHDwIjgMBAQYq+gSvAgkBugIIpgcfBoACmAS1CJIPBnoBGPwQ4zJYliSjGdwm3wVu0gIEFge+AWMUPAbnARsfUwIbH1c7LCbFAYIC6AFnAW8WBwSiAksChwZHAo0BtwNoP8oEigLdApYBAgZqBMMBeMEBL8EERvgDBAJbXJIChAEbuQEoJAIFowIMTgEBpRQDux4CgxP8A5YGGHuNBmBZvwH8AjsCBP4BRQSqBpgCKViEA+8B1QPSArkBxwOABUMGlQEQAuECBAIYnAM2zwOZASlz3QGWR/wHiQY4BOoEUo8CN6ABygXJEPIOtwTxCNgFiQaSAmWpAfQESN8BEWo4QKsBggEME/oBBc4CEgoSgwHjAZcBkgEEFo4CIpYCdCmwAuIC/wIcYLACIIUBcnOZDAgOvgLOAwQCCVIYhwEZlwKWAUNGDoEBEgYGtxinFY4DAgEF/wIGAtYEugIIqiUGkwHoAt9GAskGrgEtEWQeQwqMAQKKAVvcAuoI5wbDAakDcoIDQpMBggFQuwEbwgHtARoU4gEOoAGpAYQCAlm3AfIG0AHIAtsFhAECPdcn4TrrIKAuoETpDpIEwAeHA7MEILEI+gGxDFmWB6cBiAyLBdECqQHZDu0MlwO3AqYBsQQp3wHSAWAwjgGxARMXAXciswE2VSlqCwSAAQeTAYADDAKXAXUKK44BBjGTATuaAQo0cJkB2wK+Axs1IWD5AZYB9AGqAZYGHY8BHcgDBDqzAQOVArEBGuwCLmHIApsF4hHRBiHPE/MJwgR1DOsEAqQIkAPDAfIC8Af2A+gBBrAD8AkfxwNJiwZWBhgKvAWFM6Aa4xf3FRuhFvYB/wG4AaYLUc4BlA/yCQMc1g6PENoSAYobwwKxC+sttAOPAb4C/gIOAgTOBN0ClQGcF5EJzQ/vBdwCzQLJASLAAc4IkBntGNwTLQL8L8gi+gXmEZMDniWpDtM7HoEBjAKMBQSRAwQL8gMCAgQCrAXpA70DIsYBAqYIzQH4AuoBrgW9CcoBASUHwQTjAQKlAa8BngG2AjI8hxDcBPoCUQIGuAJ4DxMPwQFevRwG5wEOIacGDfECtgPQC60SFpgXww6hAeMXuSK+MssGJgGkBuECFPkCBpIMAs4BYALEAvIE4QGQBZIJ2gP3CDgBrgTuAwTTGKEGtgq/BrwyywaPAaQpmSq+GsEuhgEe1AKDAc8BKf8FRKABdhywAXY3xgFVHCqAAdwBHDIXCgLbAlAiIpgBMH0i2wJyCHA1pQHhAZMDCJkBZLIF2gF0XZEBwwKEAWUURX9geb8BnQONAQg+MREjkQJgG4YDUMIVkijIIpIDaOMK/gjNA40HrQLODrQO6wYEjRQEbhUQCAQDIgUMOgRCAg8mBBIIEAQCCBY2AQkiBpgBFwNPEASZAQtMFBpgtwEREQICAh1pxwESEBAQBBhkBhIJGQkBHAIbLAgSAoIBJgsfGAdAMjUzAhoCB8sBJR0CAggMPVg9KgoOEgYICgJOCQJBBgUeIDGRAQIOAjFfAooB7wI+/AECe1oBlAEgAQMhahACLwIBHAICAgYHEygpAgIEBrUBFXI8AQUBBAFSoAEGBj8CAQEBAQIjJoACHx4BBjAGBiQOMbIBEiI6PBxTDJEBBg8QAgUEQjcrQTY8BNwBCxYOAgYCdUwKBCofAgQGAWkSNwJrEEklJB8DAmY/IEgQAksQawKaAXMTcjj6BbMY2RGGC3KxAc4BXgjcAVcUDIMEIVyOAQ0ICgKOAQRiAhi6AhKcAhxTIpABNT7FAwTnA6YDlgECAecCiwKTAygeFAkCEgUu6AECAgQ6esQDtQEBeLsDIQFTP4wFkAOBAZECxQp7Gw9LywcBDQrnA4AEC4wGOZ4B4AcCDD7zBQGHD8YDgAHHDAEPAdsEjgODE44RnwJCaoALAwLQCHtRbd0O+wPBCIQGsj3vDrMJAiLbBrIJBKkcImaoEVACtQilE+0IBvIC+ALkCq4GAQmgA+gFhAEBARrTAvgBpQibAegCwwINBoAI4AJHkwhCHrgBBbkB9ALQAfoEBAQCBrsD9gYBAQIECAEQAQYDB4UCevkD8AIDAhrJAgIGAgTzAQGKBgaVApIBAgetAhCTAlsEAgICCAHPBDMCAgIIAgNKAgK/BHgEAQECAQEGAQUBAQECAgEQAgEBAQh/AgJrvjzjD60Lrjn/HBy8JUY/AR41ARsRYg+BAW4VUwNnEikQMYIBY00EugENGgomdgFEMwYPAgYGBg8iBA0CBQ4EFgcJATgcgAEKJnMDNQIxAgQOfwJBEwEIEwEqEQYFZEIOOh8LAQgEDQwCHDIXCgEBMgQCAhIBJiUpKTQEJhMDAksKGAoYU0UwZRgiGkk8NnURFQE1Gg0IaAg0AQllCyIKkgE5CgkDOwEsE0JTJF8IZzJkGyElSjU+FpcBA+QBTEkEFitzASsCMFs5SDkLHQYBDAEBSTmEASweGgETAUMCAm0QOhwKClQbOQGFAYsBAgQDaxuDAY0BCA0xMQwFI3+SAQ4MMgIBERsQa0oBYEMIDAgBKAUFHrUCApIC0QsxuwgC4g6LAjXVAYgEGgQCnQGnAZkE7wS4BCbiCsgx2AUDJP8p2RDiCIkPiAlvnAMKAgKkBKYCBRESRVqHAZYBGghsSiwFAQgCGeUDHA4sDywKzgIRI50BPFcWBAIGQwEFAnVbAQEueRIBB6QBJx/gAfsEmgEDAQIBdxsyAgKOAQHIAjcHBAoaAULoAQwUoAMC9gEpAp8CqQEECBklAiaOAZABFJkBAQoJchUZFxpbiAEa0wI/JFgMAgQER7UBkgECe0WoAYUDpQegAuMGHIMByATPAeAGBaIE6g3vAwLEAgHwC1u8BYkB5wEb/AWKAQ42ODC4AQL0ApQBAtQBYeYEhwMBGaMEf16fAYkBAXnNAoEBCzjQBmUCAZgCNwbHAnJuCgHFAb0HwAITrAMjb3hQFgQKAgJP3AYFAZUBd78CBghrARcBGAoGAwIxCAYgeKsCiwEpfSamBAYHQQEjBgLPA5UGQjR1AgEBBIsCMNoBoQQBpwEImgEBfpwDzgRyIi2mARCjAQYGFxrnAUvOAjO0AYsDRKwBAQLND8cOsgqEAcYInhrDDYYBCRXEAT9R0gIBCh7DAxgBAQ4aLAEnhQEhREhYBQYGBl8BGx0LiAEMAUwdN8YBnAEbGCcCIycmAWYoDw0yAQICAhAKAQFSXJoBEzgYIiKEARQwJxFFIp8BvAEfAQErAgEjCE8hNTUEBwEtmAIdBBsDVCpTOzQHBAEQmQHjAQQRCkIiAwMvAiArOwbtATk6Wwx0Ph9RXS6sAUw+GQEsVSRDAg1yEycmFApbGx9SASMBDnkCAoIBJwRCAwIsjQEBBz4xEQ0WRAICFLUBYBs2RdsCs0fVD5kB+wIOKJgT2AbvCpMIS8UI+w21QrAg1zvgBqkCjgGeBQkBAQES4QJ+bD8uggIGBwHsBJEDiAPmAcYCAgoSBgruBZYBAQEBpgI7H6ECkweIBgGOCQQPlwSVAZMCAQEC5RrhJpUWvRPVC44SApAZig//Dg7fI4YBHsQBkAH7ArEEMeEBoAEXe7ABdjfGAbcBZLQBKBwyFwoCyAITUCIimAGtASKfAbwBeqUBbpgCPNQBiwGZAcQC0gPaAXRd3AH4Af0BxAE6Jnk6hQGdA40BCD4xESPxAht72wK0PfIY8izhF6wghDDEIsgb3Sr8L9YK2Q3hBrgDIBKDAdYF+AL7BYUL8gsGvQkaAr4N+RrgAdMIAgEDAQETAX2FAQERCIUCDxXNA7UBBgUBIpgBhwJFLbYCzQLwAhcB3wErNwxAkAGeBUaHAowBhAUsArsCAuEB2wRB/AL+AucBnwECAr0CChWDD8wrGwwhPxxWCRAtUQIBBwwuAoYCDQEaFBQBBgQLAUMCmwJHuwEtBxQSVjQJChAMDBMHFAwGHgsGDBAaZAIGAhATDiZKfB61AgYCCAQEBAYCCAQELBFs1AEpc6oBFE0TsgEQGhlSEwWVAYsBEScCuQIYGhE/6AEe5gEELj4CCALNAcIBpQEPPpkCgQIfZzAECgYwBFSDAZ4BNDcSAhYcGwcQFRwOBgwKDhoSMzm6AzMYW04dExYSRSEGCg4PBQMH5gHEAxQEUg4XowEiSj0GywaWRAafC1IEJ64GO8IBHJwBvgO6BNIIhwFGvQaTBpEByAyFA6oF2EO/GQanBBuuHfkm4QGOAQjUA+cBxgNblgECBCK5BD3LArcBhgFbAgaDAUphOZ0CGaYCtANhAhYaQAYvpQJJgAKDAgQOcApn+gTSBlsxJt0DDhJ4BsoDWGizBesB2gKGAsIPvh/5KIobsh+bCOkXcgwEAwEJFcMBARMCAgVvBQ08AhQCCBQEAgYzGjlDDhALCAgIAgQCJmphFBoeSWwfAQoCIxtwBwkDOwUDAWoFMQ4JLjABAQIYARFtAQQsAUsCFRQ0AQJOLQUBQwIqKgEbAScDBgoBAgQBAwFiAQEKGQEdDCJeBgYCARsBMhICAwkBAQEGVhbVAQETUB8DHwNCDgNEAR8OA3sBASJ/HxIoPUUBDh0XMAIFATAeChUDEQMPEQFUCAQEBwM3Y3IJAzsBCAoPBRYDTA4BOYQBBwFkJQ4CPyUIDAICAyMDAjIzKg0BaroBFFw9ASwQDzkEIRAgAVoZASswAq4BKwMxEh6XAYIBAQFeBAMRA0IBAQECER8CCQEIKAQCCgEnOAFeBBAGATkBhAEBd4UBA2szLx4sEwEIKRUxAQcCAgQBIykJUhQpAU8GCQcFMwMKBQoEAgQCAwIMAgNpATAIBA1KGGAISPsa9xQB2waOFBKBCo8KAf4M6zsCAZ0JowHgApMChAYM+wYBig4FuQEHAQEBPNMCzQrWAbkQRuw2tgMBngUKAhK6B/oEmQarAoECDHOzBgIBgAO8D/4CkQYED+4fsxAI7BYGqAzpFgSHAZgBAgMBLg51LYgCQCsUGucCNL0BHmcBAgECaE+RAcwDOtIBaigEwANCugHkBgcdIqkBBCwGgQFetwHJAr8BjwHVAkr0AQ4gON8C9QECBi2MAXBd6gRE+QMdAZEDR6oHwgyOEOkO+DKKF0TbF90z5BrtJwED6R0kvAICrUjiF/EjhQ6PBPIIzgICpRUCDI0BAs0KlwnpDdsX4gusF60B1wqUD58GqiH5G4I8OPAvv0SmA7ELrAaiBATdDsIDzgaCAccD0gj7BZAIIo4NjgHkCzgBhQQLrATLAeEGjxmPAcgE4gGDBEyeHPAbSgIrtwEEDwH8DcAPgizbEiKJA6oMgCSvDuEJ3T+NTAg1JggCNoMCBASzA8QBAREKDDoBEwEGFggCCh4vjAEnhQEjER4IBRJOCAgkHQYCBxNMAgQGCkYWAhQeAQcnqwMKBgwKBmEBAc0BDgEBDjsBBgO/AQIEBLQBAQESCQICAgFCAXhuvQHKAQoCArwBGAICJYMBrwF9AgQSCBsNDJkBEjESAgEdDgKQAQEBGAYiAgJWvQIBMu4DASIGEhJtlAEtBQRIAgGYAr8BGgIVP0AC8wELzgELEgQDf5ACBQgLAdsDtgECAqYB0wEBKJoBBQIBAS79N/wkxxL3D5sJ/Q2nPOcnBN0UHMc+ARm2DwYOAgJGDkHLAxxEBAQCBrADIbgCBiUBHwgTIpQGvgQNQroQCS8EoQIC8gcLnQYBBJwdsAz7AdIY4AEoCiMwDAIBAQIYAQMRKg8CFQEBASwYeyGfAQEdJASaARwCCgQIBAQCSpMCLxNCAg4IAiEEUgSLARERHiwnH2YCCAS8AaEBOCIUAgIWCgY0IgIMGQIaAlOzAQ4KTAYEAgSCAU0ZvQGVAggC7AERxQEEBgTAAY0BlwEbAmU2PB4CgQEcGtEBSgQUfAk7CA0CLGZNHX1LDjCLAg0BA2AfBjqUAQ6GAhjkAbYBEAMQNFidAx41CowBBBIuAuEBAXMKKy9NJgadAQQEAw0BEAoCAkECIgQIgwE1ogEUJQOoAf8yhwGcAZwCGHcVCw8GGxUkAgoECCNsCq4DkwEIBEl5JCyHAZkBCrgCBocCkQITdD8SHAbbAQQGyQN2sgICDjpmywTMAQKFAXoCOQIM4wJZsQMePhZBDM0GnwR+BIQHbJkCogSrQIYH6QyNChftHAz/BtcFogTYC7oLiQLQBekK1Af0EccK6QLxE4An2R6CGqsb8wbESKYfghmPAQTYAYoBAyBISQcHIUZVD4gCDkUsXz0GJQT4ARIhNlYJUy+MAkAHEEEEKjkOEwcWBhYfIENaIgUBYwgxOB8FC04HCn0jBTYKAgQFvwJWJgkRBSFFUgLMASkVywMuFmQRIxACHEtiSwyWAQE8OxwKRg8FAwfIAiY9VBMGRZgBCgoEdhWQAQQWFAIgFgIkFgIUAQUBMUgKRRkMAQIJLgouJgIGLhAHAgE5AQMpCAIEBQEjHEQDAhiHAxUVJ33GAXcKZREREQMFGAYCMiIhS1siDGMsQAIyBPcC/giqA40PpQ/DCLwBrAMQzQXFBcMCkwIl0DfVD9wwmxexAsI6Pwc6BgEdCBwEnAEIBgQKDg8FGAIzBQIjAwEBVwIiFyIBAQQJCQwFSykOM8oBGgpulAEBIwICCAEECBICAhRJHgIGLgYIAgQDAg8ZJRICKQsTBCkqDAkQAgEKDggcChIPGQMLHQQBYRU1AjiOAQIBATgQCwEQCwIFAgIIEhQLAwYLARwzAiMJRQYCOQEDAgECBBkCDA0DMgEOCAUEAQEBBxgCBwEJFAgYDAcNWTgLChIFBAEBCggQBA4uHwMfAxMlVgoSAQoQAwJBCAEvAgoYAg1YCBYWBAkEAgKrAQkECA8iBQIBIwEHASYMCjQDLgQCNzUVASFjDxpVBAIOEAEDFAEMECIeMgs6JQJPDQiJAQ4CAiAKGQEBARwRCiM3agEYJDA8MgoCAQ0OEBYmHQUNHTgDSwICah4gBAoKPCsSHwECAgIKI14KOgcCBDBSEhY0CAsBGAZEAgwTAQJEAQoECQwMAyAGHAEBAQEBAWsDBAQGAzYBAhwHAWEGCAoCOCMkDiwEAh4CAgwEELsBAgQUIhcIEi8CAgIWBAIBAgICAgEBBAQCBBQMDggWCAgJNTERFg16Ow0OBBYnFUsDBAISFRwrHgECDX0HGBcrHgYGLwITwBOmA1TeAfQF4gFyK/MGpQLsBrMIhAGbAb4GCkiAATCyAtsELt4IlwLuBZQT1zfYGYkUnhOrJ7IBASZpwQR9yAVFR6AIiAJFcocBEukBvAOvAo8D8wF4xwHxAQEE2wLBBDKrA9IDxAFglAHuAQEchwHmAkksUQWsBUoClRukB8ECkgnIGz0TMAYBDg4qA1M4BhY0BSoPAhQECBIINBYMMgcaC04CIQEoCicQTwurAURRAQEYOwIKBxICCicoTANDGggeCRIBCQcREQUDAQECAQQVBhQHCQE4AxBTOQwhDy0UI3IBUGYTBg4EAQIBBg4EAQIXAg8YAQZMFAIBJRosBgIGBAYCCBQaAgJGEgoMFQcBIg0IDgIKCgwERAcLCUVHBCQ5CQsDCwkLAzcBPokBKAIEGIMBBwsMIB4VDx9KEAENBAQMBhkPKm4bMgoIAgQCFiYIHRIHBRIyBBwMCRQBBQ5ZDA4BDA4cCBosAhh5PgYCigEQGRQkChISGgmoARwaMBYMUwYBAQIFURIrFSgaCgYPEwQKVgMLAQEtAk4EPwUJAg0EDgIQOAgKDQcdAgIbBxQGDgRFAZgBegYBExoDHh8HDBMEDBYBAg8BHQEJCxc7CRESExQWEAEUaT43AQUTBCgEDC8FKh4CBBdUIANFEQElHgENExA3CAIGAQl3IwcHCgEBAgICCgYODQclXSMaARAEBRACJAYIAgEWNQKtAQYBAgEXIgUlFgIHEQgLA0OrC4AD2xniJIA5+QS4Bj62CsAP2wieBK4K1AvBLrMKAgQBAeUJwQWJA6sV2gMkAq8BlguKAy4UhQLxNQQIAQMEAgEBBAICCjKZCpJGtgreBOscN+waygTAA/QRAcoHrwYc4QIBA5odBAIa/wEPbQQKqwM35gSaIOcXhAm/I8gGwhqyH+sGnwHYBcoOkijJICgGdQ0YASYfcXhNEAICBgUHCw0NBAIrDgJmAQchAjwEay0qHSejARJKBCURAgY9BBcIFQFVAjmMARIPAxMFFwIGDgEBAhYzNgIZAQEBAgsGgQGJAS1DIQMKBgEDAQMSBgEDEi8EAgYHAQMTBQgwCmVcAwQRAgo6BAYqVgoCCAYCAgIRHW1PHQEfBgEBhgKNAYUBARoiESkZCgIHSwpjRhp6MQgEAgiZAghBBAIGFAICFxhDDyokITFgJQJ7DgkCBAQIJgIDCkE/BDQJ2gFiZRIlCA0CNyldBVAcBIgBIhRBCFoDI1UCEt0BGwQBAwIDBQJYFQMTBBgCAhcBBwMBASUBKw5bDwkvAgYJcAwJHQpSEQpBHGISBsUBARlgAgIEnAEGqwEGMwYCAg+kARUPxgEISCbbAS4sCBQvNhmvAQUOJh0HBiY8XskCnwEdIzQWBl8eEgotAxoJBxUQGMMBN4IB9QFHkAFutwEDCiQtKwILBB4togFZNAyQARoxGWqfArgBkgFXZSEIrgELaxE1vAIJCskBPBI9DRcurAEkEEEBJAYXd284DBgWYQQqtAJBKNABESIRQwklCVcEAnAK5QIGBCYoNFVZlAEOZBQKECyEAQMRQn4eHAIvNQMEfyAeGnMiBpEkhSC+BNIM/QLWAzd6iQrPApoCqg1DercMDvEB8QGmAYYBHj+FAT5SgwGEASwfKaYCCdUBLQEwnQEgJJYBAwcXXw8MAYoBJl0ZN6gBHgMCUBwqGwFkhwEtCQQbHDIXCQEBAUwCYHQWEBNQIiI5XzB9Ip8BvAE1ESwHAXA1bjfhATwNTHuDAQiZAQRDHd8BAdIDNaUBdF01X0j4AYQBURQRA0MCA3w6JnknEyICYboBRStzjQEIHx8xDwIjHfQBTxEbe5MBeFDWBacppRvnLaIdBA8EEhQSATAHCCsOAhojHRIHCCoCAgIvBAYvBAcSAQEDAgIICA8lBCEUBQIWPBAFPTABAQIeAgICaw0XDgYGCG4QHwQOBB4EBxh9BgICGQYGIywOUQMBHBUfGTMhBAQCDBAYAiYMCw0CBhACBAchBwMFEBhtAzEJQicEDgkLEyAYQDkBAQQMBAYBAQQMBAwCAQECAQUWCgwCKBICBxYoMgECHwI1FykGCAgGBgICDTQICQoCAj0CCCwIHBUBCQoCAhYCGREHCBYKAgRkIhULDgoCDAEBAQFELQcZCyYWB0gXBAEhEwEFDBMKDAIEJR8NP0QVCAYCJUUJDwEBBgMCOWc4RiYRBCIBBw4EDjgnBgEBAgQaAgoGFAIWCwoKAgkJBxQsKgQCTAYhUAQTKA8CCA8CARAZJAoCCwQBNAIxDQMVJzBWEgEHGgcBAQEWAggFBw0GBg0KPDUDEBQKHQQBASI7CTgVBAIKCgQGMCoXBA0gAgIqDx8pCEIDQ1QOFAISNSULBgITChMBJT8MDAgLBgQVGAECAhMWDQQCRAcGGwQnAgIiBCoBE0ECFFkBEBQzEgUzBAEGHQIbBAMDAwkCDwMdGQ8OBAkKBDMcAy0RAgIHDgIKJQUFBDMEJgoIDicJDgIBASEKBAQmKBkFBAQEDAEuPgwEBAMWLAIEAxkuW0APGh8REhIHU7cG6wcdiAYcgAOoA8AC8AKwBZYG9wXXAvICowSUBQSLAeME/RkBLlgfImUKQRsTBQNMCRoCAgG7AR8DBSkeCpsByQFOCTZpGzE2Qx4WBhgGAXYHgwECBhIEASJmAkU5RkIBmQEGAgIIAhoDHB0jJZMCBgIdCwY0DAIUCwQCHC8IBAjCAQUBKcIBAg6NAUUpowEcHcgBESA5AQoShQEBGmYXDw8kb2kPDB4r4gEeBlRKGwUhAgIBASIUZGBTkQEBDCLCASMVFhgRQxoKJD4PKDQCMa0BLmMBB2M1BkNRESUyBGIuhAEvFw4vGgJ6Gw1XiAEsNT8eNRAGCASPAQGkAQgBNwNVSBYDHxYCKgIphQEWa0FiigyoAgpwzgX+AY4CnwG8CkXFAcoEjAGxBJgBjwORBga0BWKvBLABEwkWJx0jHQEkEQaIAQFmGwoFDQIEDAYXRQlWcikDCpgCLG4EAgJpAQEIBB0GG4MBIA4VAWo0AgsMXw8MAQkeXA8dAXYMKQJvVQKcAQgLBAMBBGBXXAEGBxscCSgBFwkBAQFcRQJKOCIBARJPASIiAjgDWgEwIhAKPwEBIQGfAUMFcwExFSsIAXA0ASsOCCoDmgEuTT4BAwYEMls5AS9bAZcBAgIvEx0exAEBPC6DAVlwAhkBJyQEaiEqCgICOwFcAZEBNRQCPyU0BhZDARsDRh8BVRABE0IBAQEDaxE6JQFeGgE5AYQBATEfbCMHFgMdHDUwISxABwE+MREjGgs7GEpOAREZAiISGQJ6AUliV1nKC+EjowGRBrcJuAQUogJEU1Ug6QFvIlaNB4QDfpQBlQIO2wH5CMYDd4AC8gOfBKkESkoYrwFGkwX1CPMBCAoIzATeBeoB/AP1AwKQA236BZ0DugEF1wGECwJAKqAJRCElQRw2CjASGgIiBD4CFgQMGgwMBBICNC47Gj9OWbEBMwMrIARSBQUdDhgaEx4bEm4SNJYBBAUHEkgFBgcEBgQSDhYCEgIKJBwsrAGuARhGAgYFAwwCBgUDJAQEEAMEA0AiKhoPDQIdOQgEGRcGMhgJAh0LKwQSCAIXAQcvKjgPFgIEBgJVDxEREVZEGAURfgEiEAiHAQUQSF8OCDYbCwgjSzc2BAgqNxQIHixtXgIsWzlFBAQ2CIoBDmMeEwZBDlw9LQEPDg4KDBgcBixgHkIQBhoODj88ST4sMRpKLiFEKSdnAiQSChA6HhYOBCAOEBElIAICBEMCJA0EAxAeCCZFNRseBwiYAQQMJTWOAQ1LKh8wPwg/CTk1BAgFCxYCAhQIAgQPA0YKDGUiFQYTeUpKGCEKEhodCgoJDBLuARQQSB1d9wKAAQIc5QNcI2hlGRuQAgMUCBS+AxwoKd8BR5ABW74BHRjTAoIBSFNw8gLPAjE63QEB1gF/ad0BoAEfQIYBF6IBCSMyKwUsEqQBlwFsxwEQzAECAqwBZaYBpQM0zgU3CKQBmxwZlBAGCOwEBAQCBokGBtQLiREJ1AL0BwudBgEEghnyAYcExAJs8g+WBYICukjGBMMBROsCxQnkBJEBtgGUARDhBKsHpQp4RBbzBvcBzQZhywEkrAGSAq4MIm65Aq0E4QGTAbMEKLwB/QWcAYQB2weEA4ESvAODS+UJyAGSBgECmQMIJwrWAT2XAYgGHPIBMAY5AQGSATuQAUEMhAIMH1R56wFYqQGhAxYOlAE7DM8CyAEBBxcOtwEcyAOkARSUAUGIAuQBZhJc5QEEEtgB+AEEAwGtBxgbV+0BfAQq1Ca0DJoshwHvSukzBM0UJgFo0xHwB/wLAQaxDAIGBEYDBzccFxACFx4WCAICDhoGECAyCzUCAQ04BAYSBBIMOQIaAQ1cEwIgBjEEAgpPBB8ODUJkEAYOIxMZDgYEAgsJGwIKAgMCCAUDBAQEAgkEBAQCAmIcBBYCFigCBgsRBgIEAgYUJh0DAgQMBBYHCTQEAgICBgQEBAICCi4kDCYCAh4GCg8FBhMUFwwmAgMaHA4DCAIUBAQECBACCCoDBQ0BFQIOAgQCBgoJAg4MAg4GAhgMEQYDCQIUGxRqEg4IBAUBAg4NAQgEBAIGAQEECw4nGAoGGAUEAgcGFgwIEAIEBBYECAgSNAsBEQ0DHwwGFxQCAgwCAyIGEgYECBULFwsFUAQBBhsDBAoBASQJFxIDMwgOAgQCD14gFTAGCAIzHRA6EBIEChoHIAkIAnQGNwQECAQWBgYGHA4lCwcMEggGAgkEEwIECAoaCBEGDigJAwwQCwQRDjRgJBweBgtIBAICeyYSFAwEAgwOFA4IZRECAhcdNAdBCFQeBAICAgSBARUoAiAEECoGDwsIFioBEwMGBgoGAjY9FAgCCjUUJBUDBwMEHREOEwQGAQQBEA4IAS4OUQECARgPEiMPSBAWChoUHhgCBQYdER0CAgEBAggGFwIONwgGJRgQCgIECxMDWBgcCAkEAhARFwICBQkEDgQCAgIOAgQGKDweBgcEAg8CNxEYDQQMEg4LCgYaGAIHGCAEDxYeCgQCFRgGAgEeDAgLBAIGJR4QHgYSBl0WDRQFCRoLHgEHCAIGBAIBBgIEBAgEEwUKGBoMAQECAjQEB4YBAjgVBQIWATUK+RKxDrwb7jGDCIUduArWFKsLwwOCB7oD0AsCBrwCbAEGCfkEYq4F3gfTCASQBrkIyQQ+JQ8PoAIk8QYafPgCBDZRpgH9B10IvgXxCBKjApIGyQE64AZEecwDpA0CMNgkySfnF5Ag6TP2GALJIbQD6yCIBN4smAP2Bo4bngUEKw0UHQYSAQEMEAECCRYFFwoTIxYkCAQBDwQSDRECAQEEFwECCQUDBAcIBAMHBA8LKBUbBgcuAhIKCwMLBAMfBA4OBgQBCQICBQEIBhQGAx4WCgsIHEAFAggCFU8BISwBAwwGAQQFCgkLGAEDEwcQBhIiAQoCAwIUBAYBBgQCBAgFAgo3EBACBhAFAhYHARkBAQYDBwYBAQIGAhoXBgYJCwIQEQ8EAQICDgQFBwMGEQEFAwMCGQEFDAECAgQGBAQEAQkCAgYGBhgFBw4IAhAGCAgCBwMHAQ8FBwINTAgMBwUCHAYMAgIBBgICDwEKAgIHAgQOBAoCGAoDAUICBAIHNRIGAQMSBgEHHgIDAQgIAQQBAQEDBwEGBgIGAhQRGAYDBQYCAgIGDw8eAgQCGBMDBiAFAQQDAwILDAQHBgQCBgMDAgQGFA4BAQIUBQUBAQMDEwgBDAgPBxwIAgcRGgkDOiwIAgYBDgQOAQEEBgQCAgUIEAEEAQIJDwEHCgEEAQIEAgICDAIDBAECBAICAgwCAwIBBjIMCgUBBhsSAwoBAxIHFAMCAgcDCBwCIAYEAQUCAg4CAQEPEgEPVAUCLwUBAQgKBQYEAgIQBgIEYQgOAwMCAgQEBgQLAwQOBxQRDAEBAgQBBwoGKhQSCQMDBCYCAgEFGhAKJAgJJwIHBAMEFwEJDAIEBAwCCAEBDgYGDBgLBAIEAjkHEgoZAQwEAgQUAhACBwIEDhsBJAUcGQ8NBBUPHgIMBAwDAQICAwEMFA4CFAICBAgMEA0LEAkICwUCCgYCBBIGCAsBBAQIAiECGAQCAgQCAgMKAgMDBAEBCwsIBAgIDwIDCgQOBQYSBAQMFAEbBAoCCwYMFgkSDAcBAhsFAgMXAQUHAmAIBAMDBjMMDQIKHAICDAkPPAIUCAUCBAoKBAYBAhAfEAQEIQMDAgIMAgUNCC4FAgQEBA4SDAEZAgoIBAIGBhUILQ8EAQEDAgQnHQITCUUmHwEyJgQoSwYCBAwCAQQKAgMGBggCEBIGAgMBAQEBARAHAgICCgIOAh4GAgQGAgMCAgoWBQgCCwEGAyYEBgQGChwcBxMHAgICAQIGCAwZBgIEAhoWBQMCAQEIAQUJCQQUAwIBAgQUFBEBCBgKBA4EBgICBAUCCQIGEx8JEgkCBQkIBQQEBhEPBiQCJwUCBAoGAgECBQUFHDkIAQEEAgEEOg8MAgoCCAMEChcMBwECAgQEBSsCAgELBAYGAhUBCD0BEioTAQQKBgUBBQ4eAwEEBgYDDgIGAgEQCQYGECAIGgMFAgIQKgYIBCAWBgQUAgMCDjgVBAkQHgYCDAHHBtwEiwGbCwgElwapBZkCmAKnDPADvwhixwKFBZMBCAiIA4YHsQf+AtkDlwGdBqwFCN8D4gK7FMIKtD3qAif7A4sC9RHKAdkKHrEBJtcJ3QGwA1QBII8NsAGAA9Ag1xOHCucCkAHSAp4JsgYMlQWHBNQDtgOYBLUM/QKlBkRnPvoCvgP6CZcHHPIziBnaHqULqw8UlwK4FNgI4QiSJ58JQAheJhdQNyYCBglFPA9sXQ6jBSEpJJYBKUpLQjAIaBqVAtEBHDAODwIFTgUCxwE6AQFVBikKBREIGmEfR0wyGggagQIIP13aAoEDcER2XCY+KwIf7wEXESqqAQEBvAENDQoCLAMXigEo1QHPAZEBigRsJbIDKAYgQjwEARkLMQZjDme1ATxQ0wEQiwGjA/8rMPkD+gPiAckFCCW7NALmBpoZ+xSZLtwiMgJTBhYoAhbdAWEBHwICChgbDgYsFgMBBQ0FAQYFLiA1AgICDAoIEgIBEUISHgGLAUZ2Hw8CDARqLwICEQYuBAMUAiozAygBAQEdNBEbBAQGCAQkAgJEAQEMCBZdoQHWARwuCgQEAg4CHgEYAQICAQEWAgFjBgQbQwsCggEzBAQMEBIGHAgEAgwEBAQvAgYBAmshExEGVwg0AgoNGReSASoBBQ4MMgEBAT4XAgIBHyYxOTQtHTkdGgRKBxREIBcoMRoBAgENDgITDAQkCDwBAQoMBAIWWwIDPoYCCUACAYEBSAmaAQEiCxANAgYCAQIDBAMBBzQBECwBVhpsBgJqDA9jHy8ePwIILBgCZi8wvwICBDpiSwERUx0CxwEEHgIHCAEWDgEmIW1LIlQpATsBBQFLBAECAgcBBxAEKQcCKgQ6AjYSdxlvARECAgEXAhULAgxvMQUmAwEWDCQUUocBlgMDAo0HD5EDkAF7wwnrAqALEJcD3gKQAawBoA96tgSWAwqXAuMyAvQQ3yKpB7sI9weTPIcBHJwD1ghUDBAKBgwXFgmgASgWBCQGKuIBlAIkEQQPAZMCAnQkHAwdLxAaCgLuAccBAhIN2QYuAgJqlgGHAQMCAt8ChQNRHAY6CBQOPPsC5AGlAQQCBASYA+wB9AVqCuEBCv8DRQ+HAiALCj84pAoK8AICzAEEVlbmAzcQrwFqjwFn4wHqA/AIAkdpvAKbAZMDXQSDAfoKkgOyCQIOrUKiDvI1wCnWPqMBTIICCR4IAlxzGAEBBgYCLtoBAmHGAiXGARECe2c9hAHHAQIPOdEBHDoEEAgCRCBHBGwDAgIEAg8EawsRDBYFEAseAi8+aIMBIhVBXhSgARrSAQoVFzYIEl4GJSBEGARmvwIrFGgDAoEBbJ0BCwkBBSdkAgwGEw9ABQMpAgwEAi53pwFkOKsBEygEERQUBDYCAQQCFBNPCAYKEAgHDAEQIiK4AcwBemsRORA03wF/CAIWCA4KCAIEAoQBAhkeAgIfAyVPPwg/QpsBSQF5AjQwZQw5AwJiXqYZFg/lBoEMogTmA4Yb1ibbFAIaApNLHLIQ6gK+AscBkQGBCuIBfBwknAImAgQTF2GdAuYEIboEWtYEYdcDqAZRngEf9wauAgJjggFlAq0BDrACuzvbD5ILBtIFvwjPDASEBBy/ArMDmgjBAYMBzQHlBmo08QFhmhHHDRkWgQFjBZ0CBASyH/cK9zNegAjSAcMH/xAniQQFBr8FCPcBAZAHlgSmAyMCIAeJCLEEAgJZEAEDBQLXJxnoAqYHAQh3QvIDoQHLAxz0A+UCBgJiIpADBAIyCcoCc9EDzAFkKx8GmwHMAd0BAYoGhgHIAm+kBAKiAbQBAdwBaAgDciWVAXR/awNBkwJDAgEJBQII8TYBjQEDywSsBRmOCsIBxQPOAcYKApQEBDTjCI8BAxzVCoEE1gOuAvkDCAOfBCBOlwMCAgoLAg4CARMLBxEWAgEOAQEBAgMCAQEEAQEBAQICBAUFBgMBAwcJAgEDAwIBAQQbCSQEEAUBBAgDBgIHIAYGAQIWDAgOAgIEAgIDCwgHAQQDCggDAgEMAQEEAgEEAgMCAgICAgQSETQJAwUBAQsGAgICAQEGDBAJAwoGAggEAgQCBAYHBAUEAQEGAwwKAgImBwUDBREMDAYCAgIMKgUHBAgCHRkBBwQDAwcCAQQOBgQCAgICBQMGAwEqKAICDTQOAwMGBQIBAgYGAgwEAgIDAwMEBQIDGQYCAgIDCAoCBAIGBwQCCAMGCQQCBBEBBgYEAwIQJAcTBAQQAwMDAwEBAwMCAgEBBAERAgEIAQELBAECAgEGBgIHAwEBAgMEAwEBAQUCDgYBAgQBAwEBAQIBAgQGAwEEAgIGAgQEAQUCBA8BFgEsDwICAgYBBwIBAUEaECQKBwQCAhEQEgkWBCMWFQYRAgMIDAUEAwEDBQEBAwgKAwICDQIDAwMCBQgHBw4BBwQOAgQCCAEBAgIVBgUBAhgDBgIIAgICAgQGAggCAgICHw0CAgEFAQIDAQICAQEBAisQIwQgBiMEIgcGBAoCBQEDAw4BAwkFBAICAgImAQEIAgIjEwICAgIFCQkCDQMKFh8CAggCAggCAggIDAMHCAYCAgQIAgQGEgUDIg8OBQ4CAgwCAQEHCAQIAQECBQMGBA0JBgEFBgQBAQIDAgMBAQQGBgsEAQECAgcGCwQBAQICBwYCCAEJCAgCAQcKAgIEBhkJHRUBBwYDGRQFCwYEAgEOAwcGAQIQAwQHBhYYDgIGChAOAg4BKx0UAQ4BAgIECQcMBQEBAwQDCQIBCQQEBAMcAgQEAwIBAgoEAxEBEQwNCwUMAxcEBQQCBhECAwYMEAICAwsEBQIFHhQYAgcFAgMDCgIEAgEBBAQCAgIiAgcCBgQIAgEBDQECAQEDIAQDCQIHARAQAQECDgICBAwCAgYGAyEFBwIBCRYCBwICAwEBAQERAQIFAwoCAgQDBQQEAgYCAgICAgQCAgQDAQIBBQQQCQINAQIBAgIHAgoHDCkBCgIGCyAGEwEiBwsDBgcCCw4hLQgICQY+BAgmEQoLChACBAISCwgEAwEFAwIGAwEVDBANCAYMAgELDAEPCAUJAQIHDAYJAgIDBwgMDAgBAgMFAg4NAyAvChACRBgBBQICGAYYKAYKAQQBAgQCBQYEFwsJGwkCAwEKAgYOBAEBBAIEAQECAgQCAiQiCCwGCAkHAhoDCQgLAQEBAQEBBQIDAQEBAgEDAgICAQMDAQICGQsMCwcLIQYOAQMEFAQGBAkRBgoGARAIAwEJAgcLBgQOAgMBAgYKAgQEAgQEBQcBBQYEAgICBAICAgIEBwcBAQMFAgMCCB0DCAwEAgIIEAYGBggTCR0KBwkCBgISAQQCBAQCNAIDDgMGBQwTAgITCQIXAwkEBAYQBgICAg4BAQQ1BAEFBAoCAg8BCgQGAgIEAgQCBAICAQMBBQYHAR8NAQEKOBASFAQdIAEPCAICDQEKAgILCwUCBAEFBwECJAcCIxcNAgIBBw4FFxsaAwwDAjgFDjURAgkCAwcJHAgDAggCAgEDBAgCEw8FBAEEAgIEAhscAgQICCIMCgIBBBgCERYKAQUXCQEDDQQCAgICBAMBAQMGAwYECgIEAwMDHQcGFAICEwIEBAECCQECDUIqBQgFBx4rAgQIEAwFCAECBgYLCQcCAgIMBAICBAICAg4CCRMetwIkHI0DAQFPNpoEJ4EECEoCAe0CggIBKr8DPqQCBI8B6AJ9EsoByQMDAgLdAYsCeIUCkAHQAXSxB26jAlfcBhUCAQEBmwEByQEotgHmAcwLowOlBM4I9wOCG6xFsAqKBe0Btw7NAsAM7A74CLoBzUMLBDSNA0TVBwUBywE2EE+CAbsCZLcCCAgIuwHXAQQKE6IBpQilAdsBG5wBBgEBrwMOpgJPBx0CBApPOxInCALsAgqlA7wBiQMDAmwEAssBBoYE+gaIAQUNCgIEDxASBAQIBgQCAg0JAgYCAgICBAICDAoLChkDCQ0BAQcFAQEBBwQFBwUBDQIDEg0RGgcLAgECGBApFQo9CSEOCQsKBQYJBwoDBg4FF0oJAg4CAgIMAwEBAQIBBgIFAwICAQkOAgICAgoDExMFAQUGAgcODgMGAwgWCwEEBxAhAwUJBgENAgMHBgQMCgwCEgcDDwEREAYiDAQGGAICAQgNDgIDAgYFAQMBBgQCAgcDFRgnAggGBgMWAQgSCQIGBAwIAgoRCQ1VCRgJAgQECAgTBAIBAwMDDAwUDQICBAIEAgEBBAICAwgDCxIFAgIEBBAWEQcBCAMQDAgDCAIGAQIEAgQCAQQLAg0DAQICBAIBAQMCBAUBCAICAQQFAggBEAYGBgEMCAIvDAUDBhkBAQICDAMBEgMICQICCAMfBgILERYDCQIOAwkCBQ4NBgYKDAEBAggEAQkIBBABLAoQD0k6CQYEAgICBgICAgcMATQBCQ4CAgICAgIIAgMCAgICBgEDCQMNAQYFAgEHAgQCAQUDAQQCAgYCAwMCEAUBAwIGAg8MDAIUAyQRBRYkAwcBBQIJAQEDBwICDgYCAw0EAgQCAQECBAIEBgQBIQE1DAEDAgIGBgEBBAICBgIPBAIEAggCCQMBAQUCChMGDwwCIw8KCgoQEBEEAwIFBAIIGhAUAgYQBxkFHQsGCAICAgwEEAVCRwMCAgYFAwcVAxIRGwQDFg8MBQIJLRoQAwIBAgcEBAIGAg4cBgYWXgIHAg8ZEgQTCwMGCwklEyQIAwENAwIBBAIGAggEAgICAwMCDAoCAhEBLAoCAQUBCAQIAggeDAYHKwgCBgIEAgQBCSACBAkFAQILAQEGAxsDBgMBAgIEBAkJAQMDAgYEBAQCAQEBDQQCBwUBAwYKDx0LBAYGAgICAgQETQ4RAwEWDBMCKAMCAwoFAgsCAgQEAhQHFgMQBQYEBgETAQcaAwUODgUFAQgQDQ4NEAERKQgKCAIFAgEEAgIICAIBCgQDMgwGCwYOAxoEBAkVBAsIAwECAQkCCAQeBgQOAQQLAREBAggBAgIBCCEVBSACDwUfAgQCAQEFAwkGBAEFAQcDBwQBEAEBAgEHARgUCAIIAwUaAggCIwQXBAgLBBsGBA4RBAkqFwUJBwIBJiQUBAQEBgIJBwMBAwgBBwwGAgICBAIGAwQBAQQEAgUGAgoQAgQGAwUBAQYEAgEBAgUDBggCCAMCAgECEBsHBAwIDQMeByAEFBEEGwkiBwICAhoIAQYMFgsCBgMJAgISAgEJFAIBAQYEAwMBAQEHCAkXAQIEAgQDGAICCAIjBwIECgsFEAkHAwEBFAQOBQkLAQsfAgoHBBMQCgMDBBsFCQQEBAEDBg4DBQQGAwEGCQgOJQQGBBMEBAEBBAgCAQQCDAsSGAUJBBAIBwMBAQsHAgIJAgkBAggBDgIDAQUBBQUCAR4PCBUCAxMbBAECAQYCCwIHAwQRAgcGAgIaBgwFAQECBAIEAQgKBAMCBhgMAQEECAMDAgQCAwICAQMEBxUCAwoGBggaAQsHCQYPCCEHAQoEBQISAgMGGgEHAgIIBBMDAxkGAwkFAwcCBwHqAp4HtQXhBwIEiATiAuMCBgKnAh6qCcUC8QW3BgICzQisAwICEBVyHE0KBgKuAQLfAge0AsUD9wElqAGIA0UEBLkESkXUAbYBkALeCnjaAtQBeaADAQGuARA+EM8DBHXoAd4B9QHSBBYCBOsBugOuAtAHzTwAAgICAgEBAQMCBAIBBQEDCgYIBAQFAQEBAQYBAQgBAgEEAQQJAgEBCgEBAQEBAQEBAQEEAgICAgUDAwECAgEBAgEBBAIEAQYGAgMCAQIBAQEBAwEBBQECAgQCCAIBAQICBAEDAgEBAQEBAQsFAgICAwECBAICAgICAgICAgICBAICBggCAgQCAQEEAgEBAgEBAQECBAgCAgEBAgICAQEIAQECBgIJAwEBAQECBAICBAYCAgEDCAkFAgEDAwoBAgEBAgEBAQEGAgICAgQEAgEBAgMFAQEBAQEFBQgJAgEBAQEBAQIEAgICAgEBAgEBAQEDAQIGBQEBAQICAgMBAQEBBQEGAgIBAgMBAgEBAQECAgQCAQEDAQQDAgIBAgIBBQECAgECAgECAQEBAQIDAQEBAQEBAQECBAQCAgMBBAICAwEBAQICAgEBAgIEBAIIAQIBAgICAgICAgIBAQIBAQEBAwcCAgQBAQICAgQBAQEBAgQCAQEDAQEBAgIBAQEDAQIBAQIBAQEBAQMBAwICAQECAQEBAQEBAQEBAQECAQEBAQEBAQEBBAEBAgEBAgIBAQEBAQEBBAEBBwEBAwIBBQIFAgUCBg0EAQYBAwIBAgMBAgEPAQIBAgICAgICAgIDAQMCBAQEAgICBAINAxIFAQMBAwQCAgIJAQEBAgQBAQQBBAECAgIFAQIEAgECAQIEAgMDAgIFAQEBAgEBBAICDAMBAQEBBgICAgUBBwEBAQECBAMWAgEEAQEICgECAgMBAwECBAECBgEBBAYCAQYBAQQFAgICAQEBAQEBBAIBAQECBAICAgECAgIBBQICAgICAgICAgIBAQECBAQCBAQDAQIBAQMBAwMBAgIKEBADAQECAgIBAwgBAQEBBAECAQQCAQECAQICAQEBAQECAwYBAgEBAQECBAIEAgEEAQIBAgIBAQEBBQUBBwIBAQMCAQECAQEBAQEBAQUCAwEBAQEBAgQBAQEDBAQCAQUCBAIEAgEFBgIEBAUBAQMBBQEFAgEBAQMBAQMBAgUDAQQJAwEDBgEBAgEBAQICAgEDAwEBAQICAgMBBgICAwEBAwIBAwECAQYEAQEBAQEBAgIOAQIBAQEDAgQCAgIBAQECAQEBAQICBAIDAQICBAICAQECAQECAgICAwECAQMBBQICAgIBAQICAgEBAgMBAgEBBAQCCQIBAQIDBAIBAQEDAgQCAQEIAQICAQIDAQICAgIBAQEBAQEBAQIBAgECAQEGAgICBAMCAQEBAgIHAw8BAQMCBAEGDAMDAQMCAwEBBQIBBAEBAgECAgECAggCAgIBAQEBAgICAQEBAQEFAQcCAgMBAQUBAQEBBwECAQICBAICBAQCBAIDAQIBBQEBAQEBAQICAQMBAQMDAQIBAQEBBAICAwMCBAIGAQEEAgECAQICAgEBAgEBAQEDAQEBAQIBAQEBAwEBAgIIAwICAQEBBAQCAg4BAQQBAQECAgICAgYCAgEEAQICBQYCAQEJAgEBAQIEAQECAgQCAgICAQMCBAEBAgIEAgICAgEDAgIQAgICAgEBAQECAQEDAQICAQEBAQEBAwEBAQEBAQIBAQECAQEBAgICBgIEBAICAgIEBAMBAwECAQIEBgEBAgICAgICAgcBAQEBAQEDAgEBAQECAgIBAQEBAgICAgICAwEBBAECAQECAQMCAgICAgQGAgIBAQcFAgICBAQMBQMEAQECAgEBBgEBAgQCAgQMAQEEBAQCAgEBBAEBAQECAgECAgYBAQECAQEBBAEBAQEDAgEBAgICAgICAgICAgEDAgQEAgYFBQICAQQBAgICAQEBAQEBAgIDAgIEAgEBAQECAgIBAQEBAQIBAQICAQYBBAIGBAIGBAICAgICAgICBQIBAQEDAwEBAgEBAQEDAQEBAQEBBAEBAQEBAQECAwECAgIBAQEBAgICAgIBAgEEBAICAQEBAgEBAQIBAQIBAQIEBgICAgIDBwIGAgICAgEBAgIGBgICBAYGAgICBAIEBgIFAwICAgICAgEBAQICAgEBBAICAgEBAQQBBQEBAQEBAgICBAIBAQEBAgECAggCDAIFAwYBAQEJAwMGAgEBAgIBAQEBAQIBAgQCBgEBAgIGAQEBAQECAQIEAgYBAQICBgEBAQEBAQICAgIDAQMBAQECAQMPAQEFAgUCAQICBgICAQgBAgEBAgYCAgQCAwUHAgUBAgECAQICAgECAgEBAQEBAQEBAQECBQEBAQICBgEBAgIBAwEMAQECAQICAgIEAwEIBgYCAwEHAwIDAQICBAQBAgcDAwMCAQEEAQICAgICAgEDAgMBAgEBAQECAwICAgIBAQIBAQECAQEDAgIBAQIHAQQEAwECAgMMAQEBAQcCAwEDDwEFAQEBAQEBAgYBAQEBAQIEAgIECwECBgIBBwQCAQECAgEBAgYGAgECBAQCBAICDgICAQMCBAEBAwEEBAEBAwIDAQEDAgIEAggCAgEBAQEDHwICBAIEAgIDAQIBAQQBAQEBAgICBAIBAQIDAQICAgIBAQIBAQICAgICAgIEAQMFAgICAQEFAQICBAEBAQEBAQECAgECAQIBAQEBAgUBAQEBAQQBAQICAQEEAQECAQEDAwYBAQMCAgIBAgMBAQEFAgECBAIDAQQCAwEBAgIBAwECAgEBCAEBAwEBAgICAgQCAQIBAQIBAgEBAgECAQEBAgEBAgEBAQECAgICAgEBAQECAgIEAgEFCAQCAg4CAgICBgEBAgECAQEBAgIDAQEBAQIBAQEBAQEBAQECAQECAQMBAgEBAQgCAgQCBAEDAgIBAgECAgIBAQEBAQICAwECAQECAgEDAgMBAgEBAgIBAQIGBAIBAgMCBAEBAgYCAQMBAQEBAgQBAQYFAgEBAQEBAgQCCgIEAwEGAgECAQQDAgQCBAIBAwICGQMCAgECAwIBAgEBAQECAwEBAQEBAQICAgIGBAICAwECAgICAgIBAQEHAgICAgEBAgEBAwEBAQEBAQIBAQECAgECAwQBAQMBAQECAQECAQEBAQMBAgEBAQECAgUCBAIBAQECAQICAggEDAQKBgMBAQEBAQIHAgEBBAQCAwECAQECBAICBAIIAgUDAwEBAQEBAgICBAIJBAQCAQICAgYEAgUIAgQEBQUBAxIDAwMCAwICAgIBAQIBAQIBAQQCAgEBAgMMAgECAgIKAgMCAwUBAQQBAQMBAQIEAgQCAgIBAQIBAgQBAQICAQIBAQgCAgQCBAENAgIBBAIGAgEDAgQCAQMCAQECAgIBAgMCAgEBAgEBAgICAgICBAEDAgICBAQEAgEBAgIBAQEBAgECAQEBAgECAQEBAgECAQECAggCAgEDAQEGAgEBAQEBAgIBAQICAQIBAQICAgEBAgEBAgEBAQIBBQICAwECAQEBBQECAgICBQICAgICAgMBAQMCBwEBAQIBAQEEBAkCBgMBAQICBAQBAgIBAgIBAQYDAQYCBAQGAgIDAQIDAwIDAQECAQEGBAMBAQIEAQIBAQUCBAIBAQEBAgMDAQICAgQBAQEDBAIDBwEFAQIBAQQEAQIBAwIEAQEKAgEBBAQBAgEBAQIGBAICAgIBAQIBAQEBAQECAQECBAIGAQEBAwICAgIDAQMCAgICAwcCAQEDBAMCAQEDAQIBAQEEAQoBAQEBAgIBAQEBAQECAQIBAQQCAgQBAQECAQgEAgIEAwIGAgQCAwUBAgQBAQQDAQUBAQEBAwEBAQEBAQEBAQEBAQIIAgEBBAEBAgIIAQECBAIBAQIBAQIBAwICAQEDAwICAgICAgoCAgIDAwMBAgIEAQEFAQICAgUEBgECBAEDAQEBAQEDBAEBCAIGAgECBAIBAQICAwECAwEBAQEBAgEBAQEEAQICAgEEBQEBBgEBAQEBAgEDAQIBAgEBAgICAQEEAgICBAQEAgQBAwECAQICAwIBCQEBAQEBAQICBAIEAgQCAgICCAICAQIKBAIFAQMBAgIECwEBAQICAQEEAgQCCwEBAQEBAgQGAgQCAgQCAgMBBAEEAQICAgICAQEBAQIBAgEBAQEBAQMBAQEDAwEBAQEEAQEBAQEDAQsBAgEBBQIFBgMBAQEBAgEBBwIBCAEBAQQBCgEBAQEBAQMBAQIEAQEBAQEBAQIFBAYDAQICAQEBAgEIAQEDAQEBAQEBAQMBBgICAgcBBAEBAQIEAwQCAQUBAQMCFwYBAQYBCgMMCQQIAQEBAQQKAwEDAgQBAQEBAQECAgEFBgQBBAIBAQECAQICAQIBAQEBAQECCAEBAwEFAQQBBQEBAQEBAwEDAQMCAgIBCQgKAQEBAQMBBgIBAQQCAgIDAQEDAgIBAQIBAQIFAQIBAgECAgEBAgUBAQECAgICAQECAgYBBAECAQMBAgQCAgIBAgIGAQECBAIBAQIIAQECAgIBAQMCAQIBAwEBAQEBBwIBAQEBAQECAgEFAwEBAQEBAwICAgICAwEBAQICAgICAgICAgEBAQIBAQECAQIBAQEDAgEFAQICAQEBAQEBAgIBAQQCAgMBAQEBAwEBAQECAQECAwcCAgEBAgEBAgIIAgEBCgYCAQECDAICAgEBAQEBAwICAwEBAQIBBAEBBAICAQEDAgEBAQICEgEFAQEEAQQBAgkHAgIEAgIEAQEGAgICAgIBAQECAQgEAgICBAUDAQIBAgEHAQUBAQEBAQQCBAICEAICAgIBAg8ECAIBAQMFAQUDDQIEAQECAQECAgMBBgEBAQECAgIGAQIBAgICAgQCAgQBAQIGAgEBAgIBAwIBAQICCgIBAgUCAgMBBAICAwkEAgIBAwICAQQBAgIEAQEBAQcDAQEEBgMCAgMCAwQDBwoCAQICAQIBAQEBAwICBQMBAQEDAQMBAgEBAQEBAgEBAQEGAQEBBAIBAQICBAUBAwECAQECAwUCAgIEAgQBAQIEAQEBAgICCAEBAgEBAQIBAQEBAQICAQIBAwQBEwQBAQEBAQEBAQICBgICAQEBAQICBAICAwECAQIDAgIBAQECAwQCAQIBCAEBAgECCgYCAgICAgMDBgMFAgEBAQEBAQYBAQICAgECAgEEAQoBAgICAgIBCQEBAQEFAQIBAgUBAQEBAgIIBQIBAgIBAQICAQQBAQECBAEBAQIEAQEBAQEDAQEBAgICBAIFAQMBAwMCAwECAQIBAQECAgICAgICAgEBAgEBAgEBBAEBAQECAQECAQECAgEBAgEBAQEBAQIBAQICAgIBAwIDAwIBAQEBAQECAQEBAQEDAQEBAQkBBAEBAQEBAQIDAQIGBAQBAwIBAQIDAQQCAQMCAQIBAwgBAQEDDAECAgIDAQ4BBAIBBgEBAQECAgEBCAEBAQEBAQIBAQEFAgEBAgICAQEBAgEBAQECBgQCAgIOAgQCAgQBAQEBAQECAgEBAQEBAQECAQECAgMBAQEBAQEBAQEBAQEBAQECAQEBAgICAwICAQIBAQECBAIBAQICAgEBAgYCAgICAhoEBgIBAQEBAg4CBAEBAQEEAgIEAgEBBAEBAQEEAgICBQECAQECAQEBAQIBAQEBAQEBAQICAQEBAQMBAgIEBAcDAgICBAIBAwIJAgECCAICAQEDAQEBAQECAQEBAQEEBAIDAQEDAgkDAgIEAgIEAgYBAQwBAwIEAggEAQEBAQICAQYBAQEEBQECAgICCgIEBQUCAgMHAgIGAQEHAQHsLgICBAgCCgoGBgICAgQKAwICAgEBBAQCBAICChQFAQgEDAQBAgYDChQGBwcEAgICAgQCAgICAgIBAw8NBgYGAgQCBAMDDAQEBgICBAMBAQUCAgIEBAYCEgQQBg4BDwkfAQEBAwQCAiIWBgICAQECAggEAggFAQYGCAMCAgIDARAFDQYEBAgBAwoJAhAFAQYCAwEMAgQEAwMIAgICDAYKCAEBAgwCCAQCBgQDBAkVEAIIAgUGCAYWBwEBAQYIBicCAgYCAgEEBgYCBAIuBgkMAQUCBgYGCAICBBICBgICCBQBBAoOBBEuCxgUCAkBAgQCAgIDAgIEBAYCAgEBAgIEAQoCDgkCAgQCAgQGAxkHAgICCggIAgICBgICAgwDAwICAgYIBgICAgIMBAQCBAECAQEFAgQEFAwCAgIEAgQCBgISDgIEAQECAgcBAQICDgEHBAQBAgICBAYCBAcDCAQHAwYCDAICAQEDCwsLAQECAgQGDAEDAQECAgIEBAgCAgIFAQIECgoCGBAEBAMDBwECBwUGAgIGAgICBAYBBQoEFgILGAsCCAIKBwUCAgIMCAYQAgMCBAICBgIIDAITBAMBBAcDAgQCBggEAgEDAgIYCgYIAgICAhYEAwIIDgQIBA0CAwECAgYCBgECAQIDAQICBgIGAQIFAgICAgIGBAgDAQMBAgYIAQICAQEBAgEHAwICAgQIAhQHCgICAgIEFAEDAgIEAgICAgICBAIHAQICAgQKCAECAQEFAQECBAEDAgMBBAICAQUCBggEBgIDBQQQBgIIAQEBAwICBAcGDgMEBAICAgIEAgMHAgYCEBEBAgICBgYCAgMCAgMBAQMNBgICBAICAwUDAQQCAgIECgIIAgIGAgQHBwQIBAICCBYIBAgNBQYEBggCBgICAwECBAICFAYCAgICBAkCBgYCAQsEAQECAgYCBAIDAgYCAggCBAUBAgYEDgQCBAIGAQUCAwECAgQLAQMFAgMBAgIECwEDAgECAQMECAQkFgwCAgICDwIGCgcJAwICBgQEAhYDAwIEAgYIBgs7AgICEAEBCQIGBgsDAhYXCR4CCAUCAgQCHgYCBQEBAQIEBAIEDQQCAg4EBAEBBBNbCgIFBgICBgEJAgICAgICAgwDBgQGAgkCAgIDAwICBAUCAQIEAQMEAgcBBgICBAIEBgYOAgEHAgQKBAEBDQEDBgQCIgcDAgICBgICBAIEAgICBAICBAIEBAgCAQEGBAYGAgUDAgQDBQQCAgQCAgQJBQIEBQIDBAcCBQUTCAcCFgIQBAIEAgICBAIMBAgFBgQCBAICIQoMBAMGBgQCAgICBAEEARIBAQICBAIGAgQCBAICAgQCAgEBAgICBAgHAgICCgQCAgICAhISAw0CAwICBAIHAQICCBgBAQYEBAQCAQQCCAECAgYGBQIGAgQCEgIGDggJAQICAgENDQIFEAMCAg0CAggGAgIEAgMDIg4CAgEGBAQEBAICBAICAgQIBggGCgQECAMBBAICBggECBMEAhIIBBsJAgILCggPDCYGBAQEAgICBgICBgICCgIEAgMCAgoCEQICAgIHAgwCBAgKGAYCBAQCAgIECgIFCQQCBAEHAgQCAgQGAgICBgYEFxEqCgQBAwQEEBIECgwKAQMCAgQCAgQCBAsBAgICBAYEBAQKAQUCAgICAgIGAgoCAgIGBA4CAggEHwQCBAICBgICAgQHAgQMCCwKCAMQAQEFBg4ZBgobBwIEAgQCBg4KBAICBAICBAICBgQCAgICCAIGAgIOAg4CAwQCAgIDAgMEBAYFAgwCAhEHBAQwBREPBjMCLAgCIgELAgICBAQGAgIGCQkCBBAQCAoGCgEFAgICBAYcAhcBBgIKBgEBAQQKAgIBBAYCBAICBAICBAIEAgQFBQIKAQEBAQEBAhUEAgIGAgIOBhoCBAIEBQQCBAQCAwELBgoCBAQCCggBAwICAgICAgQCBwIHAQQEAgQCBAICAgICARMGAgQGAgELBgYHFAQHBAgKEAgBCAICAiwQEgIUDAQCAQkUChEDAgYIAgICBgIGBAICBQEMFAYBAwQGAgUCCAgFCQYCBgQEDREDBwYGCgMBBAYOAgQCAgICBA0CCAY0AgUCBAICBgIGCAYEDgQMAwQEBgIEAgQKAQMECAkBBwYEBAYCBg4CEgMCAgICAgQEEAwBAgICAgIBAwIJBAICBAIMCAICAgICAgICAgIKBAICEAQCAgIECAQDCQEFAgIOAwUCAgICAQEEBAEBAgICBgIGBAgKBwsEBh0DBQ4FBgMBBgIBCggiAwEEAgQGBQICAgIGAgQCAQIECQEEAQQCAgQCAgICAgICAgQCHgQCBQESAgQBAwICAgQCAgQCAgQCAgIGCwkHAwIEBAICAgICAgIQEBQCAgICCgYDAgIICgQCAgIGDggCBgQKCgEFBQEEDBYLAQQCDfIOBawJ7hmaBeQTRqwYygJhxR2VBBT3A4YFzhLUIqcKCfsFAQEGBgEB7ASOAwiuBY4C4wI92wm5BQUa+gMBAvsBggEFoAH5Aq0LEMVH5BylCgIJ/QWQCJ8KPdEJ3AmlBKYOEMVLeQ5QtwSyASHzA/8BP5wBoAI4zgGDARz0AoABiQKjBqUC8gHrA/cGlAO1AqcF9AILCgPGBwG/A84MjDDJBJcE9Qa1B0WcDPkZ1wO5I7Ifxw6uDPgklxroHLkSqxAO7gSOAwOIA9kH2Qm7BbcL"});
@@ -0,0 +1 @@
+registerTranscriptMeta([["audio_Call1-0109ca19-4328-4ffa-a7c2-837328595975.MP3", "0109ca19-4328-4ffa-a7c2-837328595975", 71, 0], ["audio_Call1-014a0b9c-75d6-4df9-932b-e69c360d6a26.MP3", "014a0b9c-75d6-4df9-932b-e69c360d6a26", 64, 1], ["audio_Call1-05d5f2d3-1184-4c84-b6b0-f5b7331e8773.MP3", "05d5f2d3-1184-4c84-b6b0-f5b7331e8773", 30, 1], ["audio_Call1-05dd9caa-74ad-4a4e-9125-1b070ee8ab32.MP3", "05dd9caa-74ad-4a4e-9125-1b070ee8ab32", 54, 0], ["audio_Call1-09215eb8-5a3d-4afe-981e-9e9ff776f211.MP3", "09215eb8-5a3d-4afe-981e-9e9ff776f211", 142, 0], ["audio_Call1-0cad305a-d008-4864-820a-0cdf23064729.MP3", "0cad305a-d008-4864-820a-0cdf23064729", 38, 0], ["audio_Call1-0fcdc962-cd1b-45f6-8011-cdf030cd6624.MP3", "0fcdc962-cd1b-45f6-8011-cdf030cd6624", 106, 1], ["audio_Call1-1051bde4-a437-48b0-869f-bd8c141cbc3c.MP3", "1051bde4-a437-48b0-869f-bd8c141cbc3c", 131, 0], ["audio_Call1-12040698-3726-4d6e-9c0e-2b6a8f59c667.MP3", "12040698-3726-4d6e-9c0e-2b6a8f59c667", 86, 1], ["audio_Call1-143b6898-abfb-4f26-bab1-54a18ddcc0dd.MP3", "143b6898-abfb-4f26-bab1-54a18ddcc0dd", 121, 1], ["audio_Call1-194a265f-1c51-4dc1-b7db-ee8de6ef8e6f.MP3", "194a265f-1c51-4dc1-b7db-ee8de6ef8e6f", 41, 0], ["audio_Call1-1cdd7626-03f9-4ebd-ab7f-3247eb6426e5.MP3", "1cdd7626-03f9-4ebd-ab7f-3247eb6426e5", 65, 0], ["audio_Call1-20b1bbc5-f98c-44a8-bd55-1b959aec9d78.MP3", "20b1bbc5-f98c-44a8-bd55-1b959aec9d78", 111, 1], ["audio_Call1-231c55ed-22d1-4ce6-976f-ae940cbae2db.MP3", "231c55ed-22d1-4ce6-976f-ae940cbae2db", 118, 0], ["audio_Call1-23725cfe-8679-482e-aa00-c682ba02883f.MP3", "23725cfe-8679-482e-aa00-c682ba02883f", 94, 0], ["audio_Call1-23ddda9f-3f5a-4bc6-889f-6ed9b2b03a11.MP3", "23ddda9f-3f5a-4bc6-889f-6ed9b2b03a11", 173, 0], ["audio_Call1-25f4ed4e-7e77-4686-9cb5-e53d00ec657e.MP3", "25f4ed4e-7e77-4686-9cb5-e53d00ec657e", 13, 0], ["audio_Call1-27c76b5e-2319-4c54-a620-29494ded36b2.MP3", "27c76b5e-2319-4c54-a620-29494ded36b2", 26, 0], ["audio_Call1-2b8cc3bc-0001-4bf6-86d7-3d10ae92ddb0.MP3", "2b8cc3bc-0001-4bf6-86d7-3d10ae92ddb0", 10, 1], ["audio_Call1-2c956354-118f-42e0-87f7-f980583f9d70.MP3", "2c956354-118f-42e0-87f7-f980583f9d70", 26, 1], ["audio_Call1-2dbc165e-bf9e-4155-ad2f-c266628b9d76.MP3", "2dbc165e-bf9e-4155-ad2f-c266628b9d76", 63, 0], ["audio_Call1-2e5524b0-7d79-4e81-a519-a4320893d20d.MP3", "2e5524b0-7d79-4e81-a519-a4320893d20d", 68, 0], ["audio_Call1-35432d1d-e9a4-4f51-b0f8-e61931868999.MP3", "35432d1d-e9a4-4f51-b0f8-e61931868999", 68, 1], ["audio_Call1-360323f5-b79e-4f27-8790-1fd0ab08e943.MP3", "360323f5-b79e-4f27-8790-1fd0ab08e943", 38, 0], ["audio_Call1-36742997-2bb7-4241-8ae7-1359330056b8.MP3", "36742997-2bb7-4241-8ae7-1359330056b8", 122, 0], ["audio_Call1-3b64b22c-2eaa-49de-9b6b-c96b811f870e.MP3", "3b64b22c-2eaa-49de-9b6b-c96b811f870e", 23, 0], ["audio_Call1-3d451b4c-b906-47b5-b1d1-0ef1e13c48d5.MP3", "3d451b4c-b906-47b5-b1d1-0ef1e13c48d5", 95, 0], ["audio_Call1-3d5de824-70ea-4b08-a978-1b8d5873e05a.MP3", "3d5de824-70ea-4b08-a978-1b8d5873e05a", 28, 1], ["audio_Call1-3d88daf9-c3db-4df5-a945-34d7591f14cb.MP3", "3d88daf9-c3db-4df5-a945-34d7591f14cb", 138, 0], ["audio_Call1-3e3a4aba-e187-40dd-9137-891e7b187abc.MP3", "3e3a4aba-e187-40dd-9137-891e7b187abc", 38, 0], ["audio_Call1-3e88d173-9818-48db-bcc6-a8d8480d6f2f.MP3", "3e88d173-9818-48db-bcc6-a8d8480d6f2f", 118, 0], ["audio_Call1-3f7e982a-469d-4973-bbb5-fdffa6b5c0bd.MP3", "3f7e982a-469d-4973-bbb5-fdffa6b5c0bd", 55, 1], ["audio_Call1-3fc261e2-ebcc-46ba-8702-12d670c599a8.MP3", "3fc261e2-ebcc-46ba-8702-12d670c599a8", 59, 0], ["audio_Call1-424c398b-9289-4d4d-8af3-83da114d1829.MP3", "424c398b-9289-4d4d-8af3-83da114d1829", 139, 0], ["audio_Call1-43b15b78-19c1-4714-ab60-e02eb77c0152.MP3", "43b15b78-19c1-4714-ab60-e02eb77c0152", 59, 0], ["audio_Call1-44a8d16e-ccd5-408f-9429-11dfc976c67d (1).MP3", "44a8d16e-ccd5-408f-9429-11dfc976c67d (1)", 28, 0], ["audio_Call1-44a8d16e-ccd5-408f-9429-11dfc976c67d.MP3", "44a8d16e-ccd5-408f-9429-11dfc976c67d", 28, 0], ["audio_Call1-457e6601-a2b2-4f28-bee7-60e1394cacac.MP3", "457e6601-a2b2-4f28-bee7-60e1394cacac", 40, 1], ["audio_Call1-46e7bfa5-935e-4d87-825e-2820dd62204d.MP3", "46e7bfa5-935e-4d87-825e-2820dd62204d", 17, 1], ["audio_Call1-4747df71-14e9-4a0d-83bd-2bf236a3b7fe.MP3", "4747df71-14e9-4a0d-83bd-2bf236a3b7fe", 7, 0], ["audio_Call1-4aac5053-20aa-4329-9df9-ac2455311991.MP3", "4aac5053-20aa-4329-9df9-ac2455311991", 4, 1], ["audio_Call1-4b2caa5d-bc92-4569-a399-7b67ffe95bc5.MP3", "4b2caa5d-bc92-4569-a399-7b67ffe95bc5", 52, 0], ["audio_Call1-4bcc14cf-0ce9-4ac8-9611-94caca2aab48.MP3", "4bcc14cf-0ce9-4ac8-9611-94caca2aab48", 48, 0], ["audio_Call1-4cc90e63-91e1-4146-a242-7b7988dc7128.MP3", "4cc90e63-91e1-4146-a242-7b7988dc7128", 66, 0], ["audio_Call1-4e9adf7c-dee6-4c83-95ab-a615c9901c15.MP3", "4e9adf7c-dee6-4c83-95ab-a615c9901c15", 114, 1], ["audio_Call1-4ebb413a-982f-4379-bd94-20c54b73e743.MP3", "4ebb413a-982f-4379-bd94-20c54b73e743", 13, 0], ["audio_Call1-4f48b525-5256-4a09-8233-9c2e01fff597.MP3", "4f48b525-5256-4a09-8233-9c2e01fff597", 27, 1], ["audio_Call1-4fa9ae50-4146-4039-9470-615f10d610c4.MP3", "4fa9ae50-4146-4039-9470-615f10d610c4", 28, 0], ["audio_Call1-510403c2-774f-4f86-8a6c-f981b96dce0a.MP3", "510403c2-774f-4f86-8a6c-f981b96dce0a", 50, 1], ["audio_Call1-52d76910-62bc-48ca-9be1-c60f1df551df.MP3", "52d76910-62bc-48ca-9be1-c60f1df551df", 23, 0], ["audio_Call1-52e2d36e-ca79-4946-9ac9-3f471bfbf031.MP3", "52e2d36e-ca79-4946-9ac9-3f471bfbf031", 10, 1], ["audio_Call1-5488b2a0-37f8-4cde-b672-ee8407dac48f.MP3", "5488b2a0-37f8-4cde-b672-ee8407dac48f", 2, 0], ["audio_Call1-54c80f78-30ad-4f48-b069-25b3ae8545ab.MP3", "54c80f78-30ad-4f48-b069-25b3ae8545ab", 77, 1], ["audio_Call1-57d3e89c-a499-48a4-8651-73c359af12c0.MP3", "57d3e89c-a499-48a4-8651-73c359af12c0", 38, 0], ["audio_Call1-5a43075c-b5cd-4d91-a651-b06e79b9a67d.MP3", "5a43075c-b5cd-4d91-a651-b06e79b9a67d", 78, 1], ["audio_Call1-5bf42ea9-16f4-4d0c-b907-5489ac084ea1.MP3", "5bf42ea9-16f4-4d0c-b907-5489ac084ea1", 97, 0], ["audio_Call1-5d55fcdd-01ac-4a12-a4a9-122694f59468.MP3", "5d55fcdd-01ac-4a12-a4a9-122694f59468", 38, 1], ["audio_Call1-5dd6170e-42ea-4b4e-ac06-39b17b592989.MP3", "5dd6170e-42ea-4b4e-ac06-39b17b592989", 19, 0], ["audio_Call1-5ed2a0b3-1a22-45a1-91d8-eb5c59b55694.MP3", "5ed2a0b3-1a22-45a1-91d8-eb5c59b55694", 80, 0], ["audio_Call1-60eeacea-9b1c-4140-b9fd-ae636600472c (1).MP3", "60eeacea-9b1c-4140-b9fd-ae636600472c (1)", 34, 1], ["audio_Call1-60eeacea-9b1c-4140-b9fd-ae636600472c.MP3", "60eeacea-9b1c-4140-b9fd-ae636600472c", 34, 0], ["audio_Call1-610b3f19-a58b-4100-8dbb-798227d00288.MP3", "610b3f19-a58b-4100-8dbb-798227d00288", 84, 1], ["audio_Call1-62511105-d315-4bd7-b880-b39e6a9e9459.MP3", "62511105-d315-4bd7-b880-b39e6a9e9459", 68, 1], ["audio_Call1-62ae2480-0a5e-4237-858f-f4168a990d8d.MP3", "62ae2480-0a5e-4237-858f-f4168a990d8d", 48, 0], ["audio_Call1-69c811de-e3fd-4415-996f-2615919fb40e.MP3", "69c811de-e3fd-4415-996f-2615919fb40e", 123, 1], ["audio_Call1-6e69a874-108a-48b3-8011-189e729a6fb9.MP3", "6e69a874-108a-48b3-8011-189e729a6fb9", 2, 1], ["audio_Call1-72aec533-86ee-4998-8a9b-2919fe5d26a4.MP3", "72aec533-86ee-4998-8a9b-2919fe5d26a4", 34, 1], ["audio_Call1-753b6641-9f1f-4647-a832-b9025b2afa95.MP3", "753b6641-9f1f-4647-a832-b9025b2afa95", 99, 0], ["audio_Call1-75b052d0-acd0-44f0-8dbb-41d183be1822.MP3", "75b052d0-acd0-44f0-8dbb-41d183be1822", 60, 1], ["audio_Call1-76c572e9-9da2-4f1c-bc5c-afc60b827a82.MP3", "76c572e9-9da2-4f1c-bc5c-afc60b827a82", 17, 0], ["audio_Call1-77e74869-76b8-4865-9cad-c89bc7e1c015.MP3", "77e74869-76b8-4865-9cad-c89bc7e1c015", 171, 1], ["audio_Call1-7816ec5e-a54f-4643-92db-dd96d6ab36de.MP3", "7816ec5e-a54f-4643-92db-dd96d6ab36de", 22, 0], ["audio_Call1-7a214bb1-d408-44ff-a767-892ee0265c11.MP3", "7a214bb1-d408-44ff-a767-892ee0265c11", 92, 1], ["audio_Call1-7a927bbc-7056-40cb-8a89-7d1d5d3ce1d9.MP3", "7a927bbc-7056-40cb-8a89-7d1d5d3ce1d9", 8, 0], ["audio_Call1-7af123c8-eea4-40e7-8464-b8ba86bde516.MP3", "7af123c8-eea4-40e7-8464-b8ba86bde516", 113, 0], ["audio_Call1-7d093d2b-ce10-42ba-8bc3-4546cedda3c4.MP3", "7d093d2b-ce10-42ba-8bc3-4546cedda3c4", 52, 1], ["audio_Call1-7f6363cd-16e7-4940-a922-cbab79f405df.MP3", "7f6363cd-16e7-4940-a922-cbab79f405df", 110, 0], ["audio_Call1-82b690e4-1503-4d6d-a866-9ac8f75b03ae.MP3", "82b690e4-1503-4d6d-a866-9ac8f75b03ae", 55, 0], ["audio_Call1-839aa8cc-5496-4e25-84ac-2ffb611c8465.MP3", "839aa8cc-5496-4e25-84ac-2ffb611c8465", 100, 1], ["audio_Call1-8414850c-33fe-4382-a435-762ffacaccbc.MP3", "8414850c-33fe-4382-a435-762ffacaccbc", 46, 0], ["audio_Call1-8469b1c0-68f5-4f43-a027-c082e8681fd5.MP3", "8469b1c0-68f5-4f43-a027-c082e8681fd5", 79, 1], ["audio_Call1-8ad0b68d-3279-4cb7-b81e-58dc53735894.MP3", "8ad0b68d-3279-4cb7-b81e-58dc53735894", 60, 1], ["audio_Call1-8ad78edf-dbe9-489a-aae6-55d0748c0efd.MP3", "8ad78edf-dbe9-489a-aae6-55d0748c0efd", 16, 0], ["audio_Call1-8e892bd8-2b1e-48cf-bcb1-a294373e893a.MP3", "8e892bd8-2b1e-48cf-bcb1-a294373e893a", 48, 1], ["audio_Call1-8f3d7da5-1f76-47e2-ac99-a989a0f37061.MP3", "8f3d7da5-1f76-47e2-ac99-a989a0f37061", 90, 0], ["audio_Call1-8f5c8c0e-ba7d-4804-8169-9dd9a162109d.MP3", "8f5c8c0e-ba7d-4804-8169-9dd9a162109d", 58, 0], ["audio_Call1-90ca4a66-2fb8-45ab-8467-a59eeb2101d5.MP3", "90ca4a66-2fb8-45ab-8467-a59eeb2101d5", 131, 1], ["audio_Call1-9175cecd-74bf-48a2-95c9-29f5c6e48fc2.MP3", "9175cecd-74bf-48a2-95c9-29f5c6e48fc2", 8, 1], ["audio_Call1-926ee9bf-ef49-45ac-b992-c2e46181a22b.MP3", "926ee9bf-ef49-45ac-b992-c2e46181a22b", 153, 1], ["audio_Call1-9459a36e-87d7-4efa-915e-67f5e3a333ca.MP3", "9459a36e-87d7-4efa-915e-67f5e3a333ca", 100, 0], ["audio_Call1-94b3574a-ae15-45ee-9a21-f07e6346e75a.MP3", "94b3574a-ae15-45ee-9a21-f07e6346e75a", 27, 1], ["audio_Call1-9889d726-2498-498f-85cf-a803d53b67cb.MP3", "9889d726-2498-498f-85cf-a803d53b67cb", 90, 1], ["audio_Call1-99102736-2277-466b-a60a-00ce190aaf02.MP3", "99102736-2277-466b-a60a-00ce190aaf02", 107, 1], ["audio_Call1-99c3c841-77c3-4710-8b78-13f1c54453d3.MP3", "99c3c841-77c3-4710-8b78-13f1c54453d3", 62, 1], ["audio_Call1-9f9f0ff7-1c5e-4496-bb46-161a42fafc3f.MP3", "9f9f0ff7-1c5e-4496-bb46-161a42fafc3f", 27, 1], ["audio_Call1-a049fd55-ded0-4c80-ad4b-78fdde46c552.MP3", "a049fd55-ded0-4c80-ad4b-78fdde46c552", 17, 0], ["audio_Call1-a123256f-087d-4537-8e23-0a4ad8a0f944.MP3", "a123256f-087d-4537-8e23-0a4ad8a0f944", 132, 1], ["audio_Call1-a1c76d0c-2432-4945-b1ce-84a258941a8f.MP3", "a1c76d0c-2432-4945-b1ce-84a258941a8f", 228, 0], ["audio_Call1-a1fac52d-c07e-47c7-b0d6-b57ce79ba068.MP3", "a1fac52d-c07e-47c7-b0d6-b57ce79ba068", 76, 1], ["audio_Call1-a878a066-4553-462c-b90f-81dd7fdc3ba6.MP3", "a878a066-4553-462c-b90f-81dd7fdc3ba6", 109, 0], ["audio_Call1-b09789f0-7b2f-4082-9179-ebfb02226ab9.MP3", "b09789f0-7b2f-4082-9179-ebfb02226ab9", 33, 0], ["audio_Call1-b3c4f910-8f25-482b-9369-ad71fc25f912.MP3", "b3c4f910-8f25-482b-9369-ad71fc25f912", 116, 1], ["audio_Call1-b56ab4ca-6dfb-4e6d-8084-3a332e2a13b5.MP3", "b56ab4ca-6dfb-4e6d-8084-3a332e2a13b5", 45, 0], ["audio_Call1-b631ee07-3066-4a44-91be-add51d638305.MP3", "b631ee07-3066-4a44-91be-add51d638305", 48, 0], ["audio_Call1-b6e37b5d-f726-4be8-802e-262daa511880.MP3", "b6e37b5d-f726-4be8-802e-262daa511880", 46, 0], ["audio_Call1-b95c117a-f33c-450f-bc42-06765b600b6d.MP3", "b95c117a-f33c-450f-bc42-06765b600b6d", 102, 1], ["audio_Call1-b97d163e-af2d-4bb4-97cc-91ba0c34fdf7.MP3", "b97d163e-af2d-4bb4-97cc-91ba0c34fdf7", 72, 0], ["audio_Call1-b9d10c4a-91d5-4bc4-8f99-cc4bf04fb165.MP3", "b9d10c4a-91d5-4bc4-8f99-cc4bf04fb165", 68, 0], ["audio_Call1-bb0ae250-28d4-453a-a9ab-2f82c5f81989.MP3", "bb0ae250-28d4-453a-a9ab-2f82c5f81989", 180, 0], ["audio_Call1-bc509c72-f007-44c6-87d1-fe27a5a5c2c8.MP3", "bc509c72-f007-44c6-87d1-fe27a5a5c2c8", 132, 0], ["audio_Call1-bd0df969-0195-4e6f-96b7-e57e69a8b489.MP3", "bd0df969-0195-4e6f-96b7-e57e69a8b489", 74, 1], ["audio_Call1-bd517fa9-6934-4b6b-a13c-7e40208d6521.MP3", "bd517fa9-6934-4b6b-a13c-7e40208d6521", 27, 0], ["audio_Call1-bde1e95d-d639-4f97-9847-7c807f4f9fa9.MP3", "bde1e95d-d639-4f97-9847-7c807f4f9fa9", 20, 0], ["audio_Call1-be97572a-43bc-4a41-bc8c-ac83999929cc.MP3", "be97572a-43bc-4a41-bc8c-ac83999929cc", 67, 0], ["audio_Call1-c03bf72e-d8f4-452f-9ce9-1e90668d51dc.MP3", "c03bf72e-d8f4-452f-9ce9-1e90668d51dc", 2, 1], ["audio_Call1-c1712d4e-baab-4fdc-9fe1-30363e63b5a8.MP3", "c1712d4e-baab-4fdc-9fe1-30363e63b5a8", 19, 0], ["audio_Call1-c1f7280c-bb38-4c54-a065-5460c089a41b.MP3", "c1f7280c-bb38-4c54-a065-5460c089a41b", 92, 0], ["audio_Call1-c1fb07f4-b3bf-4ca3-b397-c15e4dd2905c.MP3", "c1fb07f4-b3bf-4ca3-b397-c15e4dd2905c", 16, 1], ["audio_Call1-c2bdacb3-8498-4838-815c-979887f84847.MP3", "c2bdacb3-8498-4838-815c-979887f84847", 58, 1], ["audio_Call1-c7f6bb9a-c1f5-48f2-9322-7251f0fa996b.MP3", "c7f6bb9a-c1f5-48f2-9322-7251f0fa996b", 38, 1], ["audio_Call1-ca5fafb9-e377-4c34-8eff-e8caae7e4bf1.MP3", "ca5fafb9-e377-4c34-8eff-e8caae7e4bf1", 121, 0], ["audio_Call1-ca9c8905-560f-4313-8d67-62e23a94ba54.MP3", "ca9c8905-560f-4313-8d67-62e23a94ba54", 58, 1], ["audio_Call1-ccaa0306-7fd4-4780-89d9-0f19ca2ad075.MP3", "ccaa0306-7fd4-4780-89d9-0f19ca2ad075", 133, 0], ["audio_Call1-d0558c7c-a17e-409e-9e62-eef7b5dba95a.MP3", "d0558c7c-a17e-409e-9e62-eef7b5dba95a", 50, 0], ["audio_Call1-d221baff-114d-4551-9684-74254bfc2efe.MP3", "d221baff-114d-4551-9684-74254bfc2efe", 98, 1], ["audio_Call1-d3e25b87-115f-4e4e-bbf9-e6c231451669.MP3", "d3e25b87-115f-4e4e-bbf9-e6c231451669", 107, 1], ["audio_Call1-d4615725-3f48-4df2-83b9-770db627dbcb.MP3", "d4615725-3f48-4df2-83b9-770db627dbcb", 58, 0], ["audio_Call1-d48249d9-c1ef-4038-a5f8-f3c3bae1c63a.MP3", "d48249d9-c1ef-4038-a5f8-f3c3bae1c63a", 25, 0], ["audio_Call1-d5c497e4-a262-44ca-94fb-c9a965b043cf.MP3", "d5c497e4-a262-44ca-94fb-c9a965b043cf", 75, 1], ["audio_Call1-d84d3076-4ff0-4cb3-a01a-2d5ce2600e3c.MP3", "d84d3076-4ff0-4cb3-a01a-2d5ce2600e3c", 77, 1], ["audio_Call1-d974aafe-116f-4709-b45e-e605f3e2d64e.MP3", "d974aafe-116f-4709-b45e-e605f3e2d64e", 64, 0], ["audio_Call1-dcc22c8a-57e4-45d8-8361-5c290a32c35a.MP3", "dcc22c8a-57e4-45d8-8361-5c290a32c35a", 8, 1], ["audio_Call1-e0e90bf8-cd62-4a44-a152-db5474cdd6e7.MP3", "e0e90bf8-cd62-4a44-a152-db5474cdd6e7", 62, 1], ["audio_Call1-e1e85146-a789-4b8b-b661-2a3d8f69e4a6.MP3", "e1e85146-a789-4b8b-b661-2a3d8f69e4a6", 49, 0], ["audio_Call1-e2d72db4-822d-4dc8-9efb-a68e07a56d5d.MP3", "e2d72db4-822d-4dc8-9efb-a68e07a56d5d", 17, 1], ["audio_Call1-e3c18abb-d709-4e5e-bd79-87f883ed0b1c.MP3", "e3c18abb-d709-4e5e-bd79-87f883ed0b1c", 35, 0], ["audio_Call1-e439b1df-3e0e-4d75-8358-efe49f3a5ee4.MP3", "e439b1df-3e0e-4d75-8358-efe49f3a5ee4", 127, 0], ["audio_Call1-e59b390d-56a9-49fa-b1d7-7e328e39d557.MP3", "e59b390d-56a9-49fa-b1d7-7e328e39d557", 68, 0], ["audio_Call1-e7da4b17-545d-4a5e-a9f9-d30dbe893d75.MP3", "e7da4b17-545d-4a5e-a9f9-d30dbe893d75", 78, 1], ["audio_Call1-e8ee0ed2-3cb6-48cd-b116-6d46fea8cf95.MP3", "e8ee0ed2-3cb6-48cd-b116-6d46fea8cf95", 27, 0], ["audio_Call1-ee779b79-8e68-45f3-b408-f18cfe70862a.MP3", "ee779b79-8e68-45f3-b408-f18cfe70862a", 52, 1], ["audio_Call1-f2a551e4-ea7c-4fe3-9441-08e89d74f91a.MP3", "f2a551e4-ea7c-4fe3-9441-08e89d74f91a", 17, 0], ["audio_Call1-f4630d8f-b938-4bfc-8506-69393639e733.MP3", "f4630d8f-b938-4bfc-8506-69393639e733", 27, 1], ["audio_Call1-f5fea380-574e-4db8-9225-8a3a942cddf1.MP3", "f5fea380-574e-4db8-9225-8a3a942cddf1", 17, 0], ["audio_Call1-f645c145-e329-4ecf-9761-fa7ea15a7e54.MP3", "f645c145-e329-4ecf-9761-fa7ea15a7e54", 106, 1], ["audio_Call1-f6d17012-c6da-42d3-8848-2839f08b768b.MP3", "f6d17012-c6da-42d3-8848-2839f08b768b", 74, 0], ["audio_Call1-fa884c50-ad8b-43c7-9f30-a17bb358e882", "fa884c50-ad8b-43c7-9f30-a17bb358e882", 74, 0], ["audio_Call1-fac8528c-3c8a-4b7e-be98-84f9c0da94ef.MP3", "fac8528c-3c8a-4b7e-be98-84f9c0da94ef", 23, 0], ["audio_Call1-fe5b0a0f-5b02-46d4-83ea-8a87515620d4.MP3", "fe5b0a0f-5b02-46d4-83ea-8a87515620d4", 96, 0], ["audio_Call1-ff841840-41e3-4431-ad7f-28d41a331a0f.MP3", "ff841840-41e3-4431-ad7f-28d41a331a0f", 80, 1]]);
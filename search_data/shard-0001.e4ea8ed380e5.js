@@ -0,0 +1 @@
+registerTranscriptShard(1, [{"id": "audio_Call1-014a0b9c-75d6-4df9-932b-e69c360d6a26.MP3", "name": "014a0b9c-75d6-4df9-932b-e69c360d6a26", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:06", "end": "00:12", "text": "You for calling it support. My name is shame. How can I help you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:11", "end": "00:48", "text": "Yeah. Good morning. I called because I'm just. That's going. I just started resumed back to work after, like, 3 months bereavement of I've called it at my password, but I, you know, I couldn't log in my BMS, so I restarted the computer, but now I tried to log on back and think I couldn't log in. You know?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:48", "end": "00:58", "text": "OK, I'm really sorry that you will have an issue. Don't worry. I'll definitely help you. May I know your BMS number."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:58", "end": "01:05", "text": "It's ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:05", "end": "01:09", "text": "May I know your full name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:08", "end": "01:13", "text": "It's Abimola."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:12", "end": "01:17", "text": "OK, may I put your call on hold to check your information?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:17", "end": "01:18", "text": "All right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:18", "end": "03:12", "text": "Thank you. Thank you. [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Thank you for staying on hold. I really appreciate your time and patience. Hello. So you are having the issue that is, you are not able to log in your system. Am I right? Yeah, OK, I'm really sorry that you are having issue today. I'll be definitely help you. So may I know your. What is the error message that is showing?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:11", "end": "04:08", "text": "So let me type this again. Then I will let you know what is showing on my system or something. Ok, so its showing. We can't sign you in with this credential because your dooming isn't available. Make sure your device is connected to your organization's network and try again. If you previously sign in on this device, we can that credential. You can sign in that credential. That's what we're saying."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:07", "end": "04:22", "text": "Ok, I'm really sorry that you are having to do real, but definitely help you. May. I know, may I send a link to your phone? You can show me the monitor screen."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:21", "end": "04:25", "text": "Ok, She told me the monitor screen."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:25", "end": "04:28", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:28", "end": "04:31", "text": "How do I do that?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:31", "end": "04:40", "text": "Please wait. Ok. May I know your cell phone number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:40", "end": "04:44", "text": "It is a ***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:43", "end": "04:52", "text": "85. Yes. 15."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:50", "end": "04:56", "text": "****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:56", "end": "05:34", "text": "Ok, thank you. Ok, please check. I'm already send a text message to your phone. Just click the link for me. That monitor screen. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:34", "end": "05:41", "text": "Did you just send it to my number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:41", "end": "05:47", "text": "Yes, I'm already sent linked to your number."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:47", "end": "05:55", "text": "So I can even call in. Can I call you the number ID?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:54", "end": "05:58", "text": "Ok, you not received the link?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:58", "end": "06:07", "text": "No, it's *** x *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:07", "end": "06:14", "text": "May I know your personal email address so that I can send the link to your personal email."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:14", "end": "06:29", "text": "Ok, its akile. Yeah. Abi ******. **** at gmail dot com. My last name and **** at gmail dot com."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:29", "end": "07:38", "text": "Ok, thank you. Ok, please check your email. I'm already sent the link to your email. Ok, just click the link for me. Monitored screen."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:38", "end": "08:17", "text": "Oh, sorry, I. Can't go. Ok, do you send a picture from the screen? Right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:17", "end": "09:08", "text": "Yes. So first can I do the VPN, then log into your windows? So where is the VPN item? Click OK."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:08", "end": "09:21", "text": "Hold on, please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:20", "end": "09:24", "text": "Click. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:23", "end": "09:33", "text": "OK, have you seen it?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:33", "end": "09:41", "text": "Please go. Ok, please go. Ok, please click. Ok. Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:40", "end": "09:44", "text": "Applic. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:43", "end": "09:48", "text": "Click OK, Yes. Click on the OK."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:48", "end": "09:58", "text": "OK, is it this button applic? Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:58", "end": "10:15", "text": "Close that and show me the VPN icon. The VPN FISCO. Any connect? Sorry. Just close this page. Close this page. Click OK, then close this page."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:15", "end": "10:17", "text": "Ok, ok, alright. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:17", "end": "10:47", "text": "All right. There is a VPN. There is on the right side corner. Right side corner. There is a VPN icon. Yes. First connect with your VPN. Yes. Connect now. Then put your password. Empty. Password."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:47", "end": "10:49", "text": "High password."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:48", "end": "12:39", "text": "Right? Yes. OK, log in right now. Could you username use and password?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:39", "end": "12:40", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:40", "end": "12:50", "text": "All right, Login. Yes. Login. I'm still online. You can log in then check it, OK?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:50", "end": "13:50", "text": "So they said I should update to windows level, but I can't. It can't. It's not coming up. Ok, hold on, please. Ok, thank you very much."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:50", "end": "13:54", "text": "Ok, please stay on the line with me and create a ticket for you. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:54", "end": "14:43", "text": "All right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:43", "end": "14:51", "text": "Ok, so the ticket number is Inc. Indian. Charlie."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:51", "end": "14:54", "text": "Indian, not Charlie. Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:54", "end": "14:58", "text": "Indian November then, *******. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:58", "end": "14:59", "text": "Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:59", "end": "15:09", "text": "Then zero 3. Yeah. ***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:08", "end": "15:12", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:09", "end": "15:15", "text": "*****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:13", "end": "15:18", "text": "****. Ok, thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:17", "end": "15:24", "text": "Thank you, Inc. 031050828 OK."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:24", "end": "15:27", "text": "Great. Yes, I got you. Thank you very much."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:27", "end": "15:33", "text": "Thank you. So please tell me, is there anything else that can I help you apart from this?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:33", "end": "15:52", "text": "I mean, it's just that they said, actually, you know, updates. What was it called? Go to updates. We enjoy 11, but I can't find 2 updates. It's here on the system."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:52", "end": "16:10", "text": "OK, right now, your PC updated. OK, so you don't need to worry about that, OK, because your Windows right now on the Windows 11. OK, you see it right now on the Windows 11. So don't, you don't need to worry about that, OK?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:10", "end": "16:13", "text": "Oh, OK. All right. Thank you very much."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:13", "end": "16:18", "text": "Thank you. So is there anything else that can I help you apart from this?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:18", "end": "16:20", "text": "No, that's all. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:20", "end": "16:49", "text": "Thank you. So please wait. I'll connect you with this short certificate on this call. OK, the service is important for us. So kindly give the survey the first survey for customer satisfaction. There is a scale of one to 55 minutes. Very satisfied. And the second service for first contact resolution to our main Jewish first contact you for calling it held support. Have a great day ahead. Thank you. Bye bye. Take care."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:49", "end": "18:11", "text": "Bye. Thank you. Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from the scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve press 2 if it still has not been resolved, press 3. We did not get your response. Please try again. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve press 2. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-05d5f2d3-1184-4c84-b6b0-f5b7331e8773.MP3", "name": "05d5f2d3-1184-4c84-b6b0-f5b7331e8773", "utterances": [{"speaker": "Agent", "speaker_type": "agent", "start": "00:08", "end": "04:08", "text": "This is *****. How may I assist you today? Yeah, you're right. I've not got any access to the Internet. I think so. I've just called the absence and they gave me an incident number. So basically, I've, I was just in the middle of a call, and then all of a sudden, it starts raining and then it just kicks me off. So I think because of the rain, my collection is down or something. Okay, just to confirm you're having issues with your Internet, like your home internet? No, no. So the internet is up and running and works. But I'm assuming because its raining, that it's messed up the satellite, which means the wider connection is now not working. I'm assuming just because everything else is okay. No worries. We'll check on that and assist you. Sorry for the inconvenience. Can you help me with your employee number first? Your BMS number, please? I think it's 5. No, no, no. Sorry. *****. Oh, ******. Oh, 5. Yeah, I think so. No, that's not delight one. Can you confirm your first name and your last name? Yeah, it's all. June A R J A N. Oh, got it. I've got, I've got it. *****. Oh, 4. Okay, *****. Oh, 4. Yeah, that's right. And what's your last name? *****. Okay, thank you so much. So you're not able to access the Internet on your system, right? So everything is just basically crashed and it's not popular. Okay, okay. We'll check on that and assist you. Sorry for the inconvenience. I'll be sending you one blink. This link is for a video session. When you click on the link, it will access your phone camera. And with the help of the phone, you can show me a system screen so I can just check. What is the issue with their connection? So should I send the link on the same number from which you have called now? Yeah, you can do that. Okay, I'm sending the link before clicking on the link. Just hide any confidential or any personal data. Okay, waiting for the link. Can you also provide me the ticket number? Like you might have got the ticket number from the absence line. Inc. Yes. Zero 3, 11. Yes, 2433 2. Okay. And see. 03112 4, 33 2. Right. Yeah. Oh, 3, 1124, 33 2. Okay. Thank you so much. And can you just check? I have already send you the link. If you have got the link or not. I haven't got anything yet. Nothing's come through this yet. Not yet. Ok, I will just try once again. Yeah. It."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:08", "end": "04:10", "text": "Ok. Yeah."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:10", "end": "04:26", "text": "Okay. Already got it. Click on it. Yeah, Okay. Click on it. Yes, please click on it and allow the permission for the camera, please."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:25", "end": "04:51", "text": "Yeah. Hold. On."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:51", "end": "05:02", "text": "Since Fara could not open the page, so can you copy the link and open on some other browser if it's not opening on that one?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "05:01", "end": "05:07", "text": "Yeah."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:06", "end": "05:10", "text": "In case I'll refresh it, you might be working now."}, {"speaker": "Customer", "speaker_type": "customer", "start": "05:10", "end": "05:12", "text": "Okay?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:12", "end": "07:11", "text": "Yeah. Can you take the camera? Deal more closer to the screen? The arrow message you are getting in connection. Say 2. Okay. Can you just show me the bottom right corner of your screen? Can you show me the bottom right corner? Ok, and not getting the internet? Okay, Do one thing. Can you show me the bottom, the backside of your system unit, the back of the PC. Okay, so orange and green light. Okay. Can you show me very internet route to your internet modem, please? Yeah. Is it directly connected to the main router or the system using any extender or any group in between? Oh, no. This, this lodge is Pope's voice. The rest is all it's grouped in to hear. Yeah. Okay, so this goes on this box, right. So what is this orange skill or this orange skill on the front? This is voice. That should be unrelated because the power, wifi or outlook. Ok, so the right one is for a different thing. It's for a voice or something, right? Yeah. Because on the back, this is all grid. Okay, Okay. On the back, you're getting a green light. Can you show me the back size? Yeah, that's separate. So this is all green. Can you see that? Yes, I can see. So the black one is for your system, right? The black one. That's right. That's right. Can you just remove that black cable from the system? Can you remove the black cable from the rounder? You want me to take it out? Yes, please. Ok, Ok, did you just keep it out? Don't connect it. You can keep it out. Can you go to the system now? Yeah. Ok."}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:11", "end": "07:13", "text": "16."}, {"speaker": "Agent", "speaker_type": "agent", "start": "07:13", "end": "07:45", "text": "Yeah. Can you just check down the system? Press the power button, click on the starts button, then click on. Shut down. So just hold on to the start here. Yes. Click on the power option. Yeah. Click on the shutdown option. Shutdown. Yes, please. Okay, yeah. Okay. Once you completely off, let's wait. Once it's completely off."}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:45", "end": "07:54", "text": "Yeah."}, {"speaker": "Agent", "speaker_type": "agent", "start": "07:53", "end": "10:01", "text": "Okay. Now on the backside of the system, there is a power cable. Can you remove the power cable and the internet cable from the back of the system? The power cable and the internet cable? Both. Yeah, there's 2. Yes. Okay, okay, now don't connect now. Don't connect. No, no, don't connect. Now press the power button for 20 seconds without the power key. Can I keep holding it for 20? Sorry. The power button on the computer? Yeah, on the small box on the front of this, on the front of this box on this. Okay, this one? Yeah. ****. Yes. Okay. Okay, I prestige like a. So once you're done with the 22nd, can you just restart your Internet round your internet modem, please? Okay, Yeah, Wait. So you want to just turn it off and then turn it over? Just turn off the. Yeah, turn off. You can just turn off and then wait for a minute and after a minute, you can turn on. Okay. I mean, instead, I could do the reset here. There's a, there's a reset button here. You see that? Yeah, you have a reset button on the back. Depressed the reset. Yeah, no, no. Instead, you should have resetting can just completely turn off. Can you turn off for the minute? Yeah. How do I cut it off? No, no, no beds the power. You can remove the power cable from the switch. Ok. Ok, Ok, let's wait for a minute. After a minute, you can't turn on again."}, {"speaker": "Customer", "speaker_type": "customer", "start": "10:01", "end": "10:03", "text": "Just wait."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:03", "end": "10:12", "text": "So now we're a minute or 2. Yes. Wait for a minute. And after a minute, turn on again."}, {"speaker": "Customer", "speaker_type": "customer", "start": "10:12", "end": "10:20", "text": "Ok. That's. Right."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:20", "end": "11:00", "text": "And then she'll let me know to talk about it. Yes. I'm going to say a second. Yeah. Bye bye. Now. Yeah, it's connected back and start. Okay. Okay, that's probably, that's backwards coming on. Okay, okay, let's wait for the internet to completely come up."}, {"speaker": "Customer", "speaker_type": "customer", "start": "10:59", "end": "12:42", "text": "Yeah. Thank. You."}, {"speaker": "Agent", "speaker_type": "agent", "start": "12:42", "end": "13:21", "text": "Does it still loading? Yeah, it's just on the thing. Its about to come on and say it's got the orange now. Okay, usually it comes on."}, {"speaker": "Customer", "speaker_type": "customer", "start": "13:21", "end": "13:23", "text": "Okay. Yeah."}, {"speaker": "Agent", "speaker_type": "agent", "start": "13:23", "end": "14:07", "text": "Dot com can just turn on the system. Can you turn on the system without shoulder? Leave that table out. Yeah, yeah. Without the Internet cable, Just the power cable. Connect the power cable. Okay. Okay, that's on the computer to put the power on the computer. Yes. Yes, please. OK, Yeah. So just put in this one. Yes. Okay, since yes, you could start the system, please."}, {"speaker": "Customer", "speaker_type": "customer", "start": "14:06", "end": "14:13", "text": "Okay."}, {"speaker": "Agent", "speaker_type": "agent", "start": "14:13", "end": "14:20", "text": "Sure. Yeah. Hold on. Yes."}, {"speaker": "Customer", "speaker_type": "customer", "start": "14:20", "end": "14:54", "text": "Thank. You. Thank. You."}, {"speaker": "Agent", "speaker_type": "agent", "start": "14:54", "end": "17:12", "text": "Ok, Thank you. Just. Okay. Okay. Can I just connect the Internet law on both the side? Both. Yeah. On both the sides. Connect internet cable, please. Yeah. Because it's plugging in this one. Thank. You. Thank you. Ok, this one. And then that one put in. Yeah, yes, yes, please. Okay, that's screen. Okay. Okay. Now. Okay. You have connected all the the cable on both the side. After connecting the cable, can you unlock your screen? Yeah, So just just turn this up. Yes. Please unlock the screen. Yeah. Click on the weeping on the bottom. Right. ******, can you click on network? Sign in? Hey, can you show me the message? If you're getting okay, you're able to connect. Can you please try to log in now? OK. Thank you. Go ahead."}, {"speaker": "Customer", "speaker_type": "customer", "start": "17:12", "end": "17:25", "text": "Thank."}, {"speaker": "Agent", "speaker_type": "agent", "start": "17:25", "end": "17:27", "text": "You. Thank you."}, {"speaker": "Customer", "speaker_type": "customer", "start": "17:27", "end": "17:39", "text": "It."}, {"speaker": "Agent", "speaker_type": "agent", "start": "17:39", "end": "20:15", "text": "Ok. I just check if everything is good now. OK is good. Back in the city for you now, the stiff hasn't popped up yet. Do I have to sign back in? Okay, Perfect. So whenever you're having this step up issues with your VPN or anything, if your home internet is already working, fine. So you can just follow the same setdown, the system, remove the power cable and the internet cable, do a power dream, then turn off the system, the router for a minute or 2, and then turn on without the cables. And then later on, you can connect the internet cheaper and prior. Okay, so apart from this, anything else I can assist you today? No, I mean, that should be fine. I'm just to see if this should come up. Hopefully it does. So if this has happened again, no, I can do those steps. Would they not still need to raise an incident because it would be to be logged that I've not been able to access otherwise. Yeah. If you're able to fix the issue with the steps, we can just try this one. But in case if they're having any issues in the future, you can raise a ticket and you can call back with the ticket or without dedicate no issues. Okay, on the same number, the IT number. Yeah, you're on the same number. So even if you will pause without the ticket, no problem. We can raise a ticket for you. But if the supervisor also is, that's not a problem. Okay, Okay. Thank you. Looks like I'm both on looks. Okay. Thank you so much. And apart from this, anything else I can assist you today? No worries. No, that's all. Good. Thank you so much. Thank you most. Welcome. And also after this call, I will be connecting to a short survey where you can rate our conversation on the scale of 5 to one VIA is satisfied. And there will be second surveys for contact resolutions wherein you can select one, which means able to provide you resolution on first contact. So on the first survey, 5 is highest in the second survey, one is highest. So request you to rate on both the survey and thank you for calling ID home Agent. Have a nice day. Bye. Take care. Bye bye. Bye bye."}, {"speaker": "Customer", "speaker_type": "customer", "start": "20:15", "end": "21:27", "text": "Thanks for giving us a few minutes of your time to complete the IT helps desk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist On today's call, Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2 if it still has not been resolved, press 3. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-0fcdc962-cd1b-45f6-8011-cdf030cd6624.MP3", "name": "0fcdc962-cd1b-45f6-8011-cdf030cd6624", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:05", "end": "00:11", "text": "Thank you for contacting it. Health desk support. This is ******. How can I assist you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:11", "end": "00:23", "text": "Hi. I've just tried to set up a new PC for work. The purchase, but obviously a lot of my things are disappeared from the screen to get the insurance back up."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:23", "end": "00:28", "text": "I'm sorry. You need to repeat the issue again."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:27", "end": "00:33", "text": "I've had a new PC sent from work until my other one was updated."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:33", "end": "00:34", "text": "So when I've, obviously."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:34", "end": "00:48", "text": "Everything up to my PC. And then, like the Queensville switched on a lot of my things, so I need my tabs and everything all have disappeared from my screen. My folders and stuff. I need help getting back everything back up again."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:48", "end": "00:53", "text": "So your folders are not there in your PCR thing."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:53", "end": "00:56", "text": "No, things aren't showing here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:56", "end": "01:01", "text": "Sorry. Can you repeat the issue again or it's really hard for me to understand the issue."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:01", "end": "01:11", "text": "Yes, my phone isn't showing. A lot of the apps aren't showing, but I'm a bit lost now because I can't log into work. And yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:11", "end": "01:21", "text": "Sorry for the inconvenience caused to you, ma'am. I'm going to definitely help you to resolve the concern. Do you have any tickets from your end?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:21", "end": "01:33", "text": "Yes. Yes. I've got a ticket number there with me. The ticket number is I for Indigo N. For November T for Charlie. Yes. 02."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:33", "end": "01:36", "text": "9. Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:35", "end": "01:38", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:37", "end": "01:40", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:39", "end": "01:42", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:42", "end": "01:47", "text": "Inc *********. Right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:47", "end": "02:10", "text": "Yeah, that's correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:10", "end": "02:28", "text": "So in this ticket, it is mentioned that new PC sent out as there was no Windows 11, tried to logging out in this morning but has missing application required for agent to be able for work. Ok, sorry for the inconvenience that has caused."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:28", "end": "02:31", "text": "You, ma'am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:31", "end": "02:32", "text": "To resolve the account."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:32", "end": "02:33", "text": "That's what happened."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:33", "end": "02:39", "text": "So you need to tell me which applications are missing."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:38", "end": "03:11", "text": "Ok, so when I initially switched on the screen, I struggled to find my VPN. Oh, eventually I found it. And then there was a bit more struggle to log into the VPN. It wasn't straightforward. I managed to do that. I've got into the VPN when he brought up my BMS screen. Eventually its come up. I it was another struggle to sign into a VM EMS details as well. It's got me into a BMS home application folders that were saved in the top page. BMS or can you?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:11", "end": "03:16", "text": "Tell me which login procedure you're using."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:16", "end": "03:18", "text": "How do you mean? What do you mean?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:18", "end": "03:23", "text": "Like how you're logging into your system. Can you tell me?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:23", "end": "03:26", "text": "Improve a VPN log. VPN login."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:26", "end": "03:38", "text": "So first when we turn on the system, we unlock the screen. Right Control alt delete. Once you unlock this claim, then we'll connect with the VP. Correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:37", "end": "03:41", "text": "Yeah, correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:41", "end": "03:45", "text": "Ok, and then with the other name."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:45", "end": "04:18", "text": "So normally, what happened with my own PC? Normally, just like on the right hand side, there's a double monitor screen, click button and click on that. Then that allows me to log into VPN. So do that. Then it allows me to log in with my password and my username. Then it opens up my BMS. When it opens up my BMS, it allows me to then log into my IEF schedule and all the other apps I need to. Then I go into my DWPT tricks and I can open all my pages for that. Like I said today. No problem. Oh, ma'am, I."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:18", "end": "04:28", "text": "Have shared you this troubleshooting link with you on the email. So sorry. On your text message. Can you check? Are you able to receive that on the text message?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:28", "end": "04:35", "text": "So we canceled for the further? Sure, I haven't got nothing yet. Nothing."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:35", "end": "04:40", "text": "Have you received the text message from my end?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:39", "end": "04:41", "text": "No, not yet."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:41", "end": "04:52", "text": "Ok, I think the SMS is having some issue, ma'am. So due to that, I will share the link with you on the email. So help me with the personal email address."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:52", "end": "04:58", "text": "Yeah. N U J. I November Union from Juliet Indigo."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:57", "end": "04:59", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:59", "end": "05:06", "text": "And then my fair name. *******. Papa. Alpha Romeo. Victor. It's on November. Pardon me."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:06", "end": "05:20", "text": "Can you please go slower? November Uniform. Juliet. India. Then it's forbidden P. Papa, A Alpha R V Victor E. Echo E. Echo N November. Go ahead."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:20", "end": "05:24", "text": "Correct. ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:23", "end": "05:27", "text": "OK 19 81."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:27", "end": "05:30", "text": "At gmail dot com. OK, fine."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:30", "end": "05:44", "text": "Please hide any sensitive or the confidential data. Ok, I'm enjoying the session."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:44", "end": "06:01", "text": "Ok. Ma'am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:01", "end": "06:10", "text": "Can you tell me one by one applications which are missing from the PC so I can mention in your ticket?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:10", "end": "06:25", "text": "Sure. Ok, so my team has come up now that finally came slowly. I don't know if it was. I'm just here wondering if all of them will come up slowly, slowly, if I need to just kind of sit back and just give me your whole system."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:25", "end": "06:34", "text": "Is it like, ma'am, the thing that you are trying to log in after so long days or anything like that?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:34", "end": "06:42", "text": "So I was working on Friday. I think I was working on Thursday, not Wednesday, Thursday, Friday. My day is off. I had booked off."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:41", "end": "06:46", "text": "Can you check then? I just take my money, which I'm missing."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:46", "end": "07:08", "text": "Yeah. So like I said, normally across here on the BMS, if I show you closer. Yeah, across here. You see my mouth moving along. I have all my tabs saved for my IX and all the other easy tabs that I need to access. The ones I have. My BMS pops up and I put my details into Open my VMS. I open all the tabs up here. I ex and all the others. Then from the bottom."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:08", "end": "07:10", "text": "This window icon."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:10", "end": "07:15", "text": "Yeah, normally it's at the bottom to the left from there. Then I open up my DWP."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:15", "end": "07:27", "text": "Page there. Just a minute. Can you click on Windows option in the middle? You have that option? Yes. OK, click on all. Click on all."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:26", "end": "07:28", "text": "Yeah, let's have a look."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:28", "end": "07:33", "text": "See all that? This is the power."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:33", "end": "07:35", "text": "Button."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:35", "end": "07:36", "text": "Ok, my apologies."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:36", "end": "07:45", "text": "I didn't see the old there. Have a look there with me. Yeah, have a look."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:45", "end": "08:05", "text": "Check with all the applications and updating."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:05", "end": "08:34", "text": "Ok, my phone might go up for a few moments, but I look at that call coming in shortly. Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:34", "end": "08:43", "text": "That. Can you help me with your system unit as a number, ma'am, which is available on your machine? Can you show?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:43", "end": "08:58", "text": "Me? Yeah. OK. Is it where the tuck is? At the back? At the front? Where am I looking?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:58", "end": "09:06", "text": "It's not in the front. Take the back. Ok. Give. Me. A. Moment."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:05", "end": "09:09", "text": "Yep. I'm looking at the back."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:09", "end": "09:11", "text": "Back the flip. Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:11", "end": "09:18", "text": "Mmhmm. This code. This is t for tango."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:18", "end": "09:26", "text": "T ****** **, go ahead and check for the applications and everything apart from this."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:26", "end": "09:35", "text": "I'm just going to put my phone down for a few moments while I type it in again because I'm just. I think I've got a mistake into my password."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:34", "end": "10:04", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:04", "end": "10:27", "text": "You've been placed on hold. Please wait. Back with you. But I think your video calls."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:27", "end": "10:32", "text": "Back."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:32", "end": "10:50", "text": "In a second now. So that's all I'm hoping. So the customer's going to be saying detect on that. Because the apps haven't appeared."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:50", "end": "10:54", "text": "I'm sorry, but I'm not able to see anything."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:54", "end": "11:06", "text": "Just give me one second. Ok. Open now, OK, We'll do that for back again."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:06", "end": "11:43", "text": "Ok. Have you checked with all other applications? Are there right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:43", "end": "12:02", "text": "Mmhmm. Yeah, I think this is over here. They're showing here. Let me just check. Yeah, I think that's that as well."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:02", "end": "12:05", "text": "I'm sorry. What you're saying, ma'am?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:04", "end": "12:38", "text": "Sorry. I'm just kind of talking to myself, OK? No problem. Thank you. You know, I think everything's there now. Just find my IX calendar finder. And how do I save it back on my BMS? That's how I'm going to be baffled with."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:38", "end": "12:42", "text": "OK, so everything is there, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:42", "end": "12:45", "text": "On the DWP Citrix apps. It's all here. I can see it's all here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:45", "end": "12:49", "text": "So are you on DWT? What error you are having."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:49", "end": "12:56", "text": "So with all my DWP apps here right now, I can see them all here. So I just need to open them up one by one."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:56", "end": "13:05", "text": "But I find that link again. I think because I'm not able to see anything and its hard for me to."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:05", "end": "13:11", "text": "Yeah, I think you just need me to. You need to send me the IX link, please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:11", "end": "13:14", "text": "I link."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:14", "end": "13:19", "text": "It too long for the work schedule link."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:19", "end": "13:22", "text": "Which? Link."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:22", "end": "13:25", "text": "What's my schedule timetable?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:25", "end": "13:32", "text": "Actually, I need to check with that where we can find."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:32", "end": "13:36", "text": "That if not, I can ask for it immediately for the instant."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:35", "end": "13:48", "text": "Yeah, because we do not provide any links provided by. Let me know. So let me know all the applications are there, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:48", "end": "13:57", "text": "Yeah, I think everything else is here. I can see it all here and I don't think see any issues now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:57", "end": "14:01", "text": "Ok, so can I close the ticket now?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:01", "end": "14:02", "text": "Yes, you can."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:02", "end": "14:03", "text": "Thank you so much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:03", "end": "14:09", "text": "Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:08", "end": "14:16", "text": "I'm going to just update the ticket, ma'am, and I would like to update you. Is there anything else apart from this I can assist you with."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:16", "end": "14:23", "text": "No, thank you. Thank you for assisting me. I think it's just about."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:22", "end": "14:47", "text": "Yeah. After this call, I'm going to connect you to the short survey where you will get first serve, which is for the customer satisfaction. You can return on a scale of 5 to 15 for the very satisfied second survey you will get, which is for the first contact resolution. You can select one, which means the issue was resolved in the first contact."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:47", "end": "14:49", "text": "Sure, no problem."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:49", "end": "15:10", "text": "Ticket number will be same. Just closing the ticket and then I will put your call on a survey. Please do the survey, ma'am. It will really help me to grow. And if you want, you can also give the feedback on the email. I'm attaching the mails with you. So on the current call, please do survey and feedback as well. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:10", "end": "15:13", "text": "I will do. Thank you so much. Thank you for your help."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:13", "end": "15:22", "text": "You're welcome, ma'am. Thank you for contacting it. Health desk support. Have a wonderful day. Just placing your call and on the survey. Please wait."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:22", "end": "16:33", "text": "Ok, I want to cover it. Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from the scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contact. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. Made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-12040698-3726-4d6e-9c0e-2b6a8f59c667.MP3", "name": "12040698-3726-4d6e-9c0e-2b6a8f59c667", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:09", "end": "00:17", "text": "Thank you so much for calling it support. This is ******. How may I assist you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:16", "end": "00:24", "text": "I'm here. So actually, it's about empty lakh hours."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:24", "end": "00:35", "text": "No problem, sir. Provided the assistance to log into the assistant for this. I would like to know your BMS numbers."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:35", "end": "00:42", "text": "Actually, it's *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:42", "end": "00:45", "text": "And what's your name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:45", "end": "01:43", "text": "It's JP. Shabank. All right. Thank much. you very Thank. You. Thank you. Hello."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:43", "end": "01:54", "text": "My. Lecture. Welcome. To. Hello? Yes, sir. I'm there. May I also know your location where you're working now with?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:54", "end": "02:01", "text": "I'm from Philippines. Performance."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:01", "end": "02:24", "text": "OK. Hello. Okay, now, may I know also your higher data, sir?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:24", "end": "02:26", "text": "I'm sorry. What is it?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:26", "end": "02:31", "text": "Hiding data of yourses."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:30", "end": "02:33", "text": "I'm sorry. What's your question?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:33", "end": "02:39", "text": "Hi. You did your joining date, sir?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:39", "end": "02:44", "text": "The name of the supervisor?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:44", "end": "02:48", "text": "No. You said you're a supervisor, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:48", "end": "03:06", "text": "Yes, this is correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:06", "end": "03:11", "text": "You're hiding. Joining date of the company, sir."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:11", "end": "03:28", "text": "And. I'm sorry you're asking about denial and. Hello?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:27", "end": "03:31", "text": "Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:31", "end": "05:14", "text": "No, no, I'm sorry. I did this one hiring. It's a perfect 21 84. Ok. Thank you. Thank you. Hello. Welcome lecture. to my Hello. Welcome to my lecture. Hello. Welcome lecture. to my Hello. I'm still here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:14", "end": "05:18", "text": "OK, OK, one minute. I'm working on it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:17", "end": "05:20", "text": "One minute, please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:20", "end": "05:31", "text": "Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:30", "end": "06:09", "text": "Thank. You. Thank you. Hello. Welcome lecture. to my Hello. Welcome."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:09", "end": "06:11", "text": "To. My. Lecture."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:10", "end": "08:07", "text": "Hello. Welcome lecture. to my Thank. You. Thank you. Hello. Welcome lecture. to my Thank you. Thank you. Hello. Welcome. To my lecture. Hello. Welcome lecture. to my Hello. Welcome to my lecture. Hello. Welcome. To my lecture. Hello. Welcome to my lecture. Hello. Welcome lecture. my to Hello. Excellent. It."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:07", "end": "08:19", "text": "OK, Yes, I'm working on it. Still working on it One minute, sir. Yes, I'm there. I'm there. I'm so sorry to keep you hold, sir. Still working on it? Please wait."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:19", "end": "09:09", "text": "You're sure? Yeah. Sorry. Wait a minute."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:07", "end": "09:22", "text": "I'm to. going So the doctor account or you can check, please log into your system. You can check."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:22", "end": "09:26", "text": "All right, Thank you. So let me just check. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:26", "end": "09:35", "text": "Yeah, no problem. Please check."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:35", "end": "09:46", "text": "And I can tell you to laugh out my end. Correct?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:46", "end": "09:47", "text": "I'm sorry."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:47", "end": "09:55", "text": "What is it, sir? I was just asking if you already done your work for."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:54", "end": "09:57", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:57", "end": "10:01", "text": "So let me just check my end. Yeah, please check and let me know."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:01", "end": "10:05", "text": "Yes. So please check. Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:04", "end": "11:18", "text": "Thank you. One moment, please. Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:18", "end": "11:25", "text": "I'm. Hello?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:25", "end": "11:35", "text": "So it's already out. And also for the new password. Can you please send the new password to my supervisor? I'll give you the password."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:35", "end": "11:40", "text": "So one minute. Well, the line, you need a new password, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:39", "end": "11:51", "text": "Yes, I have. Can you please send the password to my supervisor to BMS or I'm sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:50", "end": "11:54", "text": "Password to BMS."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:54", "end": "11:57", "text": "And achieve schemes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:57", "end": "12:06", "text": "See if it is possible. So, like, give you the password so I can. You can write."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:06", "end": "12:13", "text": "Well, actually, I don't have family here right now, so I can't remember that You want me to."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:13", "end": "12:18", "text": "Send it to email right on your supervisor's mail ID, right."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:18", "end": "12:27", "text": "Yes, that's correct. And also, is it possible to try the password to Ms."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:27", "end": "12:35", "text": "Yale? Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:35", "end": "12:44", "text": "So just let me know if we're ready to my name. Supervisor. Sorry I can provide to you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:44", "end": "12:48", "text": "OK."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:48", "end": "12:55", "text": "So the name of my supervisor is right now, though."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:54", "end": "13:05", "text": "OK, so I'll send it to that, But also the ticket number. You want me to send it to your supervisor, Right? With this?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:04", "end": "13:09", "text": "That's correct. It'll also be frustrated."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:08", "end": "13:14", "text": "Yeah, with the 4. I'll also give you the ticket number. Will that be okay?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:13", "end": "13:16", "text": "I'm not sure that's fine."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:15", "end": "13:54", "text": "Yeah, apart from this, in case, also, if you like the services, you can give, the rating for this call rating will be on a scale of 5 to one time. To 5 is very satisfied. For the first survey. That is per customer satisfaction. There was also a second survey assisting our first contact resolution. We can select number one, which means, yes, results on a force contact. Okay, so, so ***** says I need me to reconfirm your. Please wait. Yeah, I'll let you know."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:54", "end": "13:56", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:56", "end": "14:12", "text": "No. One minute. So please, hold on. Yeah, one minute."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:12", "end": "14:23", "text": "Sure. I don't just want to know as well if you're going to send the password to my supervisor already."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:22", "end": "14:32", "text": "Yeah, I'll send it on his mail ID. Your password. OK, And also your ticket number."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:32", "end": "14:35", "text": "Yeah, sure. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:34", "end": "15:12", "text": "Yeah, One minute. So you managers, Mr. ********, did you just say?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:12", "end": "15:18", "text": "Yes, It's right now, though. The assist. Mmhmm."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:17", "end": "15:35", "text": "And. The. It's last name. Dr 6 30 at theperformance user dot com. It is his mail ID, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:34", "end": "15:36", "text": "That's correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:36", "end": "15:39", "text": "I'll send it right now. OK, one minute, sir."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:39", "end": "15:42", "text": "I sure. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:42", "end": "15:49", "text": "You're welcome. You're taking your password to one minute. Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:49", "end": "17:17", "text": "Initially take your time."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:17", "end": "17:23", "text": "I believe you are working on it. Just all. Give me one last minute. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:23", "end": "17:37", "text": "Patience is income."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:37", "end": "17:43", "text": "So is your supervisor, Mr. ****** with you now?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:42", "end": "17:50", "text": "Yes. So anyway that you sent the repository to you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:50", "end": "17:52", "text": "Sorry."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:52", "end": "17:58", "text": "So you already need to send the new address?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:57", "end": "18:00", "text": "Yes. On his mail ID. On send it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:00", "end": "18:05", "text": "So you're not there on team also. Mmhmm."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:05", "end": "18:08", "text": "You're not there on Tuesday, so let me just check."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:08", "end": "18:13", "text": "This provider. So let me just go ahead and check 2 months. One minute."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:13", "end": "18:37", "text": "Not now. One minute. Not now. One minute. Once I ask you at that time. ***** let on. Oh, sorry. Let him know that I gave the password. Yeah, I forwarded the password from my mail ID and my mail ID. ***** *******. Okay, one minute. Once I ask you at this time, you ask. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:37", "end": "19:57", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:56", "end": "21:15", "text": "But still, I let you know the ticket number because we understand the ticket number. The recording stating with that we have given you. And that is Inc. 029 Inc. ********. Okay, this is your ticket number, sir. So now, yes, sir. You're welcome. And I'm. Forwarding it on your provider's mail ID. So thank you so much for all the support. The one which you have given to me on this call, sir, for being aligned for the references. And also thank you so much. And apart from this, please be waiting for this call rating will be. As I said you, it will be. One is *** is very satisfied. Both of us survey. That is for customer satisfaction. There'll be also a second survey assisting our first contact. Resolve. They can select number one. Ms. Minzy should resolve in a first contact. So I. Your ticket number and annual and annual password has been forwarded on your provider's name ID. Anything more you needed any more?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:15", "end": "21:23", "text": "Will help you. Nothing so far. Thank you so much for assisting. Thank you so much. Have a nice day."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:23", "end": "21:28", "text": "You're welcome. So bye bye. Take care. Have a nice day."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:28", "end": "21:29", "text": "Thanks for giving us."}]}, {"id": "audio_Call1-143b6898-abfb-4f26-bab1-54a18ddcc0dd.MP3", "name": "143b6898-abfb-4f26-bab1-54a18ddcc0dd", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:06", "end": "00:07", "text": "You for calling it home?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:07", "end": "00:08", "text": "Agent Support."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:08", "end": "00:09", "text": "My name is *****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:09", "end": "00:11", "text": "How may I help you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:11", "end": "00:24", "text": "Hi, *****. I was just on the phone to you for an hour. You estimated my case to get me a new PC. But you weren't responding to me."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:24", "end": "00:39", "text": "OK, I think it was someone else. I just received your call right now, and your voice is breaking. So please confirm me. How could I help you today? So you have any ticket number or anything?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:38", "end": "01:19", "text": "There's no ticket number. I was on the phone. So you're calling for an hour, so I'm not going to do it all. My name is ***** ****. My BMS ID is *******. Okay, I explained that all I have 5 ports in my the USB ports in my PC and only one is working and he goes to me. He's going to escalate it and get me a new PC and he goes to me. Wait on the line. I weigh it on the line for an hour and he did it. He just stopped replying. I could hear him breathing where he wasn't talking to me, so I don't want to do it all again. I just need to know. Has my new PC been audited?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:19", "end": "01:29", "text": "Ok, let me just go ahead and check your concern with the concern team. Whether it's been posted or what rest. I really apologize for the inconvenience because we'll show you my best."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:29", "end": "01:31", "text": "To help you out on this."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:31", "end": "02:36", "text": "So just give me a moment. I'm just trying to find the ticket if it's been created just a moment. And you said only one of the USB port is working. Is that correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:36", "end": "03:16", "text": "Yes. Only one is working the rest and not working. I've done everything. Every troubleshooting. I've even tried a different headset. It was in the headset. It was just a part because they worked in my laptop. He told me to reboot, restart, sent me a link. He's done everything with me and he goes, I'll get you a new one sent over. And I said, Okay, I'll wait on the line and an hour passed and he didn't even respond. So I'm only ringing back to know. Has it been sent out or will it be processed? Because, yeah, everything else? I come."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:15", "end": "03:26", "text": "Okay, I'll just check on it. And earlier, may I know when you have called? Like you have called for this today itself or you have called before that as well."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:25", "end": "03:34", "text": "I called just today. Just OK."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:33", "end": "03:53", "text": "Uh. And could you please confirm me how many ports are there in the front? There are, like, 2 ports in the front and 3 at the back."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:53", "end": "03:55", "text": "2 at the front. 3 in the back."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:55", "end": "04:26", "text": "Yes. Okay. And only one is working. Okay, Just a moment. Please tell."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:26", "end": "05:12", "text": "Me just pulling up the details on this."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:12", "end": "05:21", "text": "I back to the team, so I'm just waiting for their response. And you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:21", "end": "05:22", "text": "Told me."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:22", "end": "05:25", "text": "Yeah, that was one of our agents."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:24", "end": "05:34", "text": "So got it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:34", "end": "05:39", "text": "And could you please confirm me with the PC tag number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:39", "end": "05:46", "text": "Yeah. T *****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:45", "end": "07:27", "text": "*****. Ok. Just. A. Moment. Please stay on the line. All right. What I'm also going to do. I'm going to send you a link on your phone. I've already."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:27", "end": "07:43", "text": "Done this. I don't. I've already done this. I've already done this. Okay? I'm frustrated now. I've already done this link to switch the pause, restart the PC. I've done every troubleshooting instead."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:42", "end": "07:48", "text": "Okay, And you don't have the ticket number with you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:48", "end": "07:52", "text": "No, My trainer told me that it doesn't matter if I don't have one reason."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:52", "end": "07:57", "text": "Ok, All right."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:57", "end": "08:16", "text": "I know it's not your fault. And I'm sorry, but not that if you, I was on the phone for an hour with that guy, he wasted an hour of my time. You know what I mean? Like, I'm just like, I'm the best because I'm working. But, I mean, like, I'm just waiting. I just needed a response. And like, after all, again, I'm not all of."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:16", "end": "08:38", "text": "You again? Okay. And please repeat your asset, the PC tag number once again."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:38", "end": "09:25", "text": "Let me just double check here. One second. Sure. I'll just check in now on a second. So sure. ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:25", "end": "09:30", "text": "That would be T ******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:30", "end": "09:38", "text": "Yeah, sorry. I think I gave the wrong one."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:38", "end": "09:46", "text": "And could you please confirm me the port that is working right now? Is that on the front or is that on the back?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:45", "end": "09:55", "text": "It's the back hole. The only one on the back is working. Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:55", "end": "10:02", "text": "All right. And right now, could you please confirm me? Is your mouse or is your keyboard connected on that one?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:02", "end": "10:03", "text": "Mouse is."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:03", "end": "10:15", "text": "Only mouse is connected. And have you tried connecting your mouse on any other port?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:15", "end": "10:17", "text": "Yeah, Friday? Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:17", "end": "10:20", "text": "OK, and still no light comes up."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:20", "end": "10:40", "text": "Yeah, no, I only work from that last one. And unless they do send me a new one and they send me a new headset as well for you. Because my headset does get damaged. It's, it's not. It was, it was working before, but it's a bit damaged and its ability. So if they send me in UPC, you can send me in your headset."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:39", "end": "10:44", "text": "Okay? And you said your headset is also damaged."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:44", "end": "11:09", "text": "It's not damaged. It's just a bit loose. You know, when I put it over my ears, it's not damaged for it. It's like it doesn't stay oak. You know, the mouthpiece mouthpiece. Sorry, it doesn't stay up."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:09", "end": "13:03", "text": "Thank you. Thank you. Thank. You. OK? So I have posted this to the claim. I'm just waiting for the response. I'm still waiting for the response from the team."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:03", "end": "13:26", "text": "Kindly be online. No."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:26", "end": "13:33", "text": "And could you please also confirm me? When was the last time the USB ports were working?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:33", "end": "13:36", "text": "Before loans. Today is around one o'clock."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:35", "end": "13:41", "text": "Okay, and after that, have you also tried restarting the computer as well?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:40", "end": "13:47", "text": "Yeah, I'll review it. They restarted. They held it for 30 seconds. Turn it on and off 4 times."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:47", "end": "15:15", "text": "Okay. Thank you. Thank you. Just waiting for the response from the team. Please stay on the line. And is this a new PC that you have received or it's an old one?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:15", "end": "15:26", "text": "When you say new old, you mean, is it one that I had? I think I've had, I got an upgrade, I think sometime last year, but it's like a smaller one."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:25", "end": "15:29", "text": "Okay, So you got this last year?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:28", "end": "16:10", "text": "Yeah, I think so. Yeah, last year. Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:10", "end": "17:01", "text": "Thank. You. Very. Much. So *** is just checking on this. Please stay on the line. No. Problem. And you have also checked the devices on your personal device as well."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:01", "end": "17:48", "text": "Yeah. So they work on my personal device? Yeah, try anything."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:47", "end": "18:07", "text": "I'm sure you. OK? I would also need to take some picture of your devices, so I'm going to post it further to the UK team. The UKD Who?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:07", "end": "18:08", "text": "Would be creating the."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:08", "end": "18:15", "text": "But for that, I would need to take that video session so I could take the picture of that."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:14", "end": "18:16", "text": "Yeah, that's fine."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:16", "end": "18:21", "text": "All right, So please do provide me with your phone number on which I could send you the link."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:21", "end": "18:30", "text": "Yeah. Zero 7. Ok, 44."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:29", "end": "18:32", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:31", "end": "18:37", "text": "***. OK ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:36", "end": "18:52", "text": "28. OK, I'm going to send you this link with this link. I would have access for your phone camera so I would advise you to please make sure you close any of your personal or confidential information. So nothing yet recorded over the session."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:52", "end": "18:57", "text": "Yeah, that's right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:57", "end": "19:02", "text": "All right, I'll send you the link. Once you receive it. Please open that link and allow."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:02", "end": "19:04", "text": "Access to your camera."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:04", "end": "19:10", "text": "Mmhmm."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:10", "end": "19:12", "text": "Is it cleared via email or?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:12", "end": "19:17", "text": "No, That would be a text message on your phone number."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:17", "end": "19:26", "text": "OK. Yeah, I've not received it yet. I'll repeat the."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:26", "end": "19:34", "text": "Number. Once again, that would be 74. ********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:34", "end": "19:36", "text": "No, ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:35", "end": "19:57", "text": "Ok, that's my bat. Just give me a moment. Let me just send it to you. Once again."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:57", "end": "20:00", "text": "I'll send you the link."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:59", "end": "20:03", "text": "Kindly check."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:02", "end": "20:33", "text": "Mmhmm. Just waiting on it now. Sure. Still not received it. You want to try by email? Maybe?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:33", "end": "20:39", "text": "Yeah, I'll surely send it to you over the email. Please provide me with your email."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:38", "end": "21:25", "text": "I'm on ***** **@*****.***. Just a moment."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:25", "end": "21:42", "text": "Thank. You. All right? I'll send you the link. Once you receive it, please open that link and allow access to your camera."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:42", "end": "22:03", "text": "Ok, let me check this one. Sure. Ok, I'll receive it on. This is the."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:03", "end": "22:26", "text": "CPU that you have? Okay. Yeah. Can you show me the tag number on this CPU? OK, could you please move your phone camera near? OK, can you show me the cables? Data connected right now?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:26", "end": "22:38", "text": "At the moment, this is the keyboard. And these 2, here is the, that's the mouse at the back. And this one is the."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:38", "end": "22:43", "text": "Ok, so could you please show me your mouse?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:43", "end": "22:47", "text": "Showing the light as it. Mouse. That's the mouse."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:47", "end": "22:52", "text": "Ok, we have power on the mouse. And can you show me the keyboard?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:52", "end": "22:54", "text": "Yeah, there is a keyboard."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:54", "end": "23:02", "text": "Could you please try pressing the caps lock or anything? Do we get any light on the keyboard?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "23:02", "end": "23:05", "text": "No light."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:04", "end": "23:18", "text": "Ok, so there's no light on the keyboard. Ok, could you please try to, OK, that's fine. Let me just post this. And what about the headset you were saying? Could you please show me?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "23:17", "end": "23:22", "text": "Yeah. So this is the head. This is the one I've got at the moment."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:22", "end": "24:00", "text": "So when I lift this and I put it on my head, this just drops. Okay, so it can't be replaced. That's fine. Well, yeah, because for the headset, it won't be able to go with the replacement or the headset, because this is something you could say won't be considered as an issue if it's working fine. So for the final, Yeah, for the CPU, I'm going to post this further. I've already collected the images. So can you be online? Yeah. And by the time I'm doing this, may I please place the call on hold for a minute or 2?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "24:00", "end": "24:01", "text": "Yeah, that's it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "24:01", "end": "24:03", "text": "Please, ******, I'll just get back to you. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "24:03", "end": "24:20", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "24:05", "end": "27:01", "text": "[MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Thank. [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] You for being on hold. I appreciate your time and patience."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "27:00", "end": "27:01", "text": "Mmhmm."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "27:01", "end": "27:11", "text": "All right, So I've already posted this issue to the concern team just waiting for the response on this. So as soon as I get a response, I'll just update you with the same."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "27:11", "end": "27:12", "text": "Yeah, that's fine. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "27:12", "end": "27:19", "text": "All right, please stay on the line, and I'll be putting the call back on hold. Once I get a response, I'll just get back to you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "27:18", "end": "27:27", "text": "Please stay the on line. Thank you. You're welcome."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "27:22", "end": "31:29", "text": "[MUSIC] [MUSIC] [MUSIC] Hello? [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] To. Welcome. My. Lecture. [MUSIC] [MUSIC] Hello? [MUSIC] Yeah. [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] You for being on hold. I appreciate your time and patience. All right, I'm checking this with the team. I've already got the response. So can you please stay online? Let me just confirm Whatever."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:29", "end": "31:31", "text": "They will guide us with."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:31", "end": "31:33", "text": "Please stay on line."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:33", "end": "31:39", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:35", "end": "31:41", "text": "[MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:39", "end": "31:57", "text": "Hello."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:47", "end": "31:59", "text": "[MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:58", "end": "32:03", "text": "Welcome lecture. my to"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:59", "end": "32:27", "text": "[MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "32:26", "end": "32:40", "text": "Hello."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:40", "end": "33:22", "text": "Thanks. For. Calling. [MUSIC] [MUSIC] You for being on hold. I appreciate your time and patience. OK, so you'll be getting a call from one of the agents from the UK team. You're also going to connect with you. Also, just confirm me. Have you tried swapping the ports like, have you tried connecting all the devices at the back of your CPU?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "33:22", "end": "33:39", "text": "Yes. I've tried everything. Yes. OK. Is it? Are they ringing me now? 780? Is that?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "33:39", "end": "35:40", "text": "The one? Yeah, that must be him calling you. All right, So I've checked this with the team that you're saying."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "35:40", "end": "35:41", "text": "To drop the call."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "35:41", "end": "35:51", "text": "So I'm going to drop this call now and you're already connected with the end user, the person from the UK. So they are going to assist you further."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "35:51", "end": "35:52", "text": "And post the call."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "35:52", "end": "35:58", "text": "The call would be redirected to a survey within the first service for customer satisfaction on the scale of 15."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "35:57", "end": "35:58", "text": "Satisfaction."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "35:58", "end": "36:05", "text": "And thank you for choosing your major support. You have a wonderful day ahead."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "36:04", "end": "39:20", "text": "Thanks for giving us a few minutes of your time to complete the IT HelpDesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. We did not get your response. Please try again. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. We did not get your response. Please try again. If your issue was resolved in one contact press one. If it took multiple contacts to resolve press 2 If it still has not been resolved, Press 3. We did not get your response. Please try again. If your issue was resolved in one contact press one. If it took multiple contacts to resolve, press 2 If it still has not been resolved, press 3. We did not get your response. Please try again This time. Enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One The strongest disagreement. Remember 7 is strongest agreement. One is strongest disagreement. We did not get your response. Please try again this time. Enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One The strongest disagreement. Remember 7 is strongest agreement. One is strongest disagreement. We did not get your response. Please try again."}]}, {"id": "audio_Call1-20b1bbc5-f98c-44a8-bd55-1b959aec9d78.MP3", "name": "20b1bbc5-f98c-44a8-bd55-1b959aec9d78", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:07", "end": "00:13", "text": "Thank you for calling ID. Support. My name is *********. How can I help you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:13", "end": "00:16", "text": "Hi. How are you? How are you doing?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:15", "end": "00:19", "text": "Yes, I'm good. How are you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:19", "end": "00:34", "text": "I'm fine. Thank you. And my identification is not working. Sorry. The lagging. Please not working."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:34", "end": "00:39", "text": "Could you please repeat it, ma'am? Your voice is very a bit low."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:39", "end": "00:50", "text": "Yeah, it's not working. My my is not working. I mean, my citrus and I'm working."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:49", "end": "00:55", "text": "OK, Citrix is not working, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:55", "end": "00:56", "text": "Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:56", "end": "01:01", "text": "So sorry for the inconvenience cost to you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:00", "end": "01:15", "text": "Yeah, Thank you. They log in access to app to O P like T U N. Ok, so they told me to call you guys."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:15", "end": "01:21", "text": "I'm so sorry for the inconvenience calls to you. Could you please help me with your BMS?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:21", "end": "01:34", "text": "Yeah, I got 6 one. OK, 3 zero. OK, 8. OK, 8 9."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:33", "end": "01:47", "text": "OK, 3130889 am. I getting it right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:39", "end": "01:51", "text": "*******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:48", "end": "01:54", "text": "3130889 Am I getting it right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:54", "end": "02:13", "text": "No, no, I'm going to start number 6 6. Number one. OK, number 3. Number ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:12", "end": "02:18", "text": "OK, *******. Right."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:18", "end": "02:20", "text": "Perfect. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:20", "end": "02:25", "text": "Thank you, ma'am. Could you please help me with your first and last name as well?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:25", "end": "02:32", "text": "Thank you, Consul *****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:31", "end": "02:35", "text": "******** *****. Right."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:34", "end": "02:37", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:36", "end": "02:45", "text": "OK, could you please let me know? Is there any other message on the screen while you are trying to log in?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:45", "end": "03:03", "text": "To the city. Yeah, they say, Oh, now they say it is not. They say it's not working, but I don't let me go. Yeah, this is not working. OK, ma'am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:03", "end": "03:11", "text": "May I have your permission to put your call on hold so that I can check the further information of your account, and I'll get back to you in a while."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:11", "end": "03:18", "text": "Ok, Thank you. Thank you. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:18", "end": "03:23", "text": "Those."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:23", "end": "03:41", "text": "In Seattle. Ocho. Yinco siete."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:40", "end": "03:50", "text": "****. Nueve."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:50", "end": "04:07", "text": "Pre. Check it out. I'll check it out. I'll check it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:03", "end": "04:18", "text": "[MUSIC] Do. You. Have. Access. To. All. Of. That."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:18", "end": "04:22", "text": "No."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:22", "end": "04:25", "text": "There. You. Go."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:25", "end": "04:35", "text": "Gross. And 3. Oh."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:31", "end": "04:42", "text": "[MUSIC] 3."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:41", "end": "04:59", "text": "Oh, okay. Okay. Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:59", "end": "05:08", "text": "No. I. Took. It. [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:08", "end": "05:10", "text": "Why did you fly?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:10", "end": "05:12", "text": "Why?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:12", "end": "05:16", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:16", "end": "05:37", "text": "Why? Yes. [MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:37", "end": "05:38", "text": "******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:38", "end": "05:41", "text": "Please."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:40", "end": "05:51", "text": "OK, I'm here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:51", "end": "06:33", "text": "I. Guess. Its. [MUSIC] Coming. [MUSIC] 2. Zero. [MUSIC] One. I. Just. [MUSIC] 5. [MUSIC] Thank you for being online. Thank you for being online, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:32", "end": "06:34", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:33", "end": "06:42", "text": "Yes, ma'am. Could you please help me with your mobile phone number so that I can take the SB session for you for better understanding."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:41", "end": "06:44", "text": "OK, ***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:44", "end": "06:49", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:47", "end": "06:56", "text": "***. OK ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:55", "end": "07:04", "text": "Ok, I'm repeating it. 7724750565 am. I getting it right, ma'am?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:04", "end": "07:05", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:05", "end": "07:09", "text": "Ok, ma'am, I kindly request you to please be online for a while. I'm sending a swell link."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:09", "end": "07:14", "text": "To your mobile phone, please. I'm sending."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:14", "end": "07:19", "text": "A swell link to your mobile phone. Please click on the link and."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:19", "end": "07:23", "text": "Allow the access of back camera of your mobile phone and show the screen."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:23", "end": "07:34", "text": "If there is any confidential information over your screen, please try to hide it. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:33", "end": "07:42", "text": "Yes, he give me. So what is the exact one?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:42", "end": "07:44", "text": "Sorry. Ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:44", "end": "08:02", "text": "I just sent a feeling on my phone. Yes, ma'am. No, I haven't received nothing for my phone. I haven't received nothing. Please allow me a moment when I'm sending it again. Please allow me."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:02", "end": "08:40", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:39", "end": "08:41", "text": "Ok, now I got it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:41", "end": "08:48", "text": "Ok, please click on the link and allow the access of back camera of your mobile phone and show the screen."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:47", "end": "08:51", "text": "OK, if there is any confidential information."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:51", "end": "08:55", "text": "Please try to hide it. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:54", "end": "09:00", "text": "Yeah, it is now. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:59", "end": "09:06", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:06", "end": "09:14", "text": "So let me get up again to next. Let me get the performance."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:14", "end": "09:19", "text": "Please show the screen time. I'm unable to see the screen."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:19", "end": "09:21", "text": "Do you see it? No."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:21", "end": "09:40", "text": "You are showing your friend camera. Please show the backside to your camera. Thank you. Yeah. Please show. What is the exact, ma'am. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:40", "end": "09:45", "text": "To go to UIC citrus."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:45", "end": "09:47", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:47", "end": "09:59", "text": "So I'm going to wait because before didn't allow me to log in. So I'm waiting."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:59", "end": "10:01", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:01", "end": "10:14", "text": "So in jump 2 here. So let me pull this one down. That way, I can write it down. OK, because."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:14", "end": "10:25", "text": "You're not getting the authenticator codes of the client application, Ma'am, for this, you have to contact your client ID team."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:25", "end": "10:34", "text": "Yeah, I called them. Yeah, I called them and they, and they told me that because the computer belongs to the performance. I had to call you guys."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:34", "end": "10:47", "text": "No, ma'am. This win Authenticator is belongs to the team. They will set up this. We only provided the Microsoft authenticator we don't provide."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:47", "end": "10:49", "text": "The features, right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:48", "end": "10:52", "text": "Yes, ma'am. You have to contact the phone."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:52", "end": "10:56", "text": "Yeah. Ok, so can I have a ticket?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:56", "end": "11:04", "text": "Sure, ma'am. Please allow me 2 moments. I'm creating a ticket for you. I will provide a ticket number for you. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:03", "end": "11:10", "text": "Ok, thank you. Thank you, ma'am. I'm waiting. I'm waiting for the ticket. Ok, sure."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:10", "end": "11:14", "text": "Ma'am, please allow me to minutes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:14", "end": "11:46", "text": "Thank you. 3 3."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:46", "end": "12:44", "text": "All. Right."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:43", "end": "13:03", "text": "Hello. Welcome to lecture. my"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:03", "end": "13:17", "text": "Thank. You. Thank you for being on, ma'am. Can I request you to please allow me one more moment. I'll get back to you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:17", "end": "13:29", "text": "OK, yeah. You fixed the problem. Even if we just put that, you fix the problem. Its working now, but I need the ticket number. Sure, ma'am. Number."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:29", "end": "13:31", "text": "Sure. Sure, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:30", "end": "13:54", "text": "Yeah, but you're telling me."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:54", "end": "14:47", "text": "Hello. You for being online, ma'am. Could you please note on the ticket number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:46", "end": "14:49", "text": "Ok, what is the ticket number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:48", "end": "14:53", "text": "Yes, ma'am. It's all Uppercase Inc. I for India."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:53", "end": "14:57", "text": "I'm sorry. I'm sorry. I'm sorry again. Please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:57", "end": "15:01", "text": "It's I N C I for India."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:01", "end": "15:08", "text": "I like in India N like in Nancy C. Like in Charlie. Yes, ma'am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:07", "end": "15:12", "text": "***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:11", "end": "15:15", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:13", "end": "15:17", "text": "***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:16", "end": "15:24", "text": "I'm sorry. ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:24", "end": "15:27", "text": "Number ***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:26", "end": "15:28", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:28", "end": "15:41", "text": "Again. ******. ***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:40", "end": "15:55", "text": "Ok, I'm going to repeat it. I think. 03122795 A."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:55", "end": "15:59", "text": "Yes, ma'am. That is right."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:58", "end": "16:13", "text": "Thank you so much. Have a great *****. You call me. The system is working the system. It's working right now. I don't know what you did, but you really helped me. God bless you. OK?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:13", "end": "16:15", "text": "You, ma'am. I would connect you to you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:15", "end": "16:17", "text": "Have a great day."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:17", "end": "16:31", "text": "Thank you, ma'am. You too. Have a good day. I would connect you to the group. Start. Survey for this call with the first survey, but. OK, and you can read on the scale 5 to 15. It's very satisfied."}]}, {"id": "audio_Call1-2b8cc3bc-0001-4bf6-86d7-3d10ae92ddb0.MP3", "name": "2b8cc3bc-0001-4bf6-86d7-3d10ae92ddb0", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:16", "end": "02:14", "text": "Thank you for contacting Idlbeck Support. My name is ********. How can I help you? Hi, sir. Can you unlock my account? Yes, sir. Definitely, sir. Please provide me a BMSID number. *******. Okay, please provide me your full name. *********, Please provide me your manager poisoner name. The past athletes are okay. Please provide me a high date as well. This month and the year only 9. Um, ****. 9 and a year, sir. ****. Okay, so it's being 10 years. Okay? Yes. Okay. Thank you for providing me all the details. Okay. Could you please explain me your issue a little bit? I'm lucked out. I was trying to get back in. I looked at my password. It looked correct, but I can't. I guess it wasn't correct. So I'm just locked out. I was just trying to log on. Okay, Are you using VPN system or VDI system? I work from home. Yeah. Okay, So you're using Microsoft Windows in your computer? Yes, I think so."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:13", "end": "02:16", "text": "Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:15", "end": "03:26", "text": "Okay, So where are you not able to log in in your computer system? On in your VDA? It's locked. Its a. Okay. Okay. What is the exact message that you're getting? It is love. Yeah. What is the average message that you're getting? It is loved out. Okay, there is lots. How long does it? Okay, Reset itself. Okay, How long does it take to reset itself? But just give me 2 minutes, sir. I will check with it, and I'll provide you a computer update. Okay, so just as I understand, let me summon that you are not able to log in in system getting that Ms. *****. I'm sorry that you have a step of a patient. I'm surely help you on this. Thank you for your patience and cooperation on the call. Okay, I'm just putting your call on hold for a while to check with the with tech with the details and feed the details, and I'll provide you an update. Ok, please be online."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:22", "end": "05:29", "text": "[MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Hello. Welcome. [MUSIC] [MUSIC] [MUSIC] [MUSIC] To. My. Lecture. [MUSIC] Hello. Welcome. [MUSIC] [MUSIC] My. Lecture. To."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:28", "end": "07:03", "text": "Yes. Thank you for staying on hold. Okay, *****. *****, your account is locked. I'm unlocking it right now. Yes. I love their account and just wait for 2 minutes and then type to log in. Okay? Yes, sir. Just wait for 2 minutes and then tie back to login. I'll provide you a ticket number. Okay, after that, once you are able to log in. Yes. And in a. Meanwhile, sir, I just want to ask you. Have you ever tried to use the self service password reset to unlock or reset the accounts?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:03", "end": "07:05", "text": "I don't think."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:05", "end": "08:49", "text": "It's awesome. A long time ago, I used it, but not recently. Ok, OK, I've already been under the account. Okay, ******* will right now. Just drive at the login, sir. And tech. I can try to log in now. Yes, sir. The. All right. It worked back in. Thank you so much. Okay, so just give me one minute. I'll provide you our ticket number. I don't think I need it because, you know, I've been on the phone, so I just haven't got a call in about 15 minutes. So everything's normal. Yes. Just give me one minute. I'll provide you a request number, sir. So at least you have a request number for this call."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:48", "end": "10:03", "text": "Thank. You. Thank. You. Thank. You. Thank you. Thank. You. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:03", "end": "12:12", "text": "Yes, sir. Your new ticket number starts with R E Q. It's zero PX. It's Romeo. Echo Queen 00497071 3. What was the first number is not in C anymore. Its I. Yeah, its R as in Romeo V As in Echo Q As in Queen zero zero. I got everything. Yes, sir. So basically we. Yeah. So R E is R Q. Got it. Thank you. ***********. I have. Yes, ***. Yes. Audi Q *********. Is there anything else that I can help you apart from this right now? No, thank you. So I will connect you to a salt survey post this call. Weather for service for customer satisfaction. Marines **** ***** very satisfied. And the second side is for fast contact resolution where you can select one, which means you're an issue was resolved in fast contact. Thank you for contacting it. HelpDesk Have a really great day, sir. Wait for the survey if you want me to take it before I get a call. Yes, sir. Yes, sir."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:12", "end": "12:36", "text": "Thanks for giving us a few minutes of your time to complete the it helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT. Thank you issue. That was not a valid response if you. Fantastic. Thank you for your important and valuable feedback. If you need any additional support, please call us."}]}, {"id": "audio_Call1-2c956354-118f-42e0-87f7-f980583f9d70.MP3", "name": "2c956354-118f-42e0-87f7-f980583f9d70", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:05", "end": "00:07", "text": "Thanks for calling."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:07", "end": "00:10", "text": "My name is ******. Can I help you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:10", "end": "00:11", "text": "Hi."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:11", "end": "00:32", "text": "I was on the phone this morning. I have a reference number, please. My password needed resetted. I got back on the computer. Just think I've locked my screen. I've tried to lock up on it. Still in personal. Is it showing incorrect password or the account is locked?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:32", "end": "00:34", "text": "It's an incorrect password."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:33", "end": "00:56", "text": "And I'm saying that if I keep trying to unlock food account. Ok, so it's showing incorrect password. Am I right? Yes. All right. I'm so sorry that you're facing this issue. I'll surely help you with that before proceeding further. Could you help me with the BMS ID number? Yeah, it's 56."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:52", "end": "00:58", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:58", "end": "01:06", "text": "7. OK, that will be ******* ** I right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:05", "end": "01:07", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:07", "end": "01:50", "text": "Could you also help me with your complete name? Yeah, it's ***** *******. All right. Thank you for providing me this information. Is it OK if I put this call on hold for one or 2 minutes to review your information? Yeah, that's fine. Thank you. Please stay on the line."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:49", "end": "02:25", "text": "Hello. Welcome to my."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:24", "end": "03:15", "text": "Hello. Thank you so much for staying online. So is it OK if I go ahead and reset your password? Yeah, that's fine. OK, so before I reset your password, I need to confirm few security questions. Could you help me with your date of hiring? Uh, yeah. It was the 9th of September 24. Could you also help me with your manager name? It's Macula. All right. Thank you for providing me this information. Is it OK? If I put this call on hold, I will go ahead and I'll change your password and I'll let you know. Yeah, that's fine. Thank you. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:15", "end": "03:59", "text": "All right. Hello. lecture. my to Welcome Hello. Welcome."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:59", "end": "04:31", "text": "To. My. Lecture."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:31", "end": "05:37", "text": "All right. All right. I'm going to."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:37", "end": "06:16", "text": "Hello. I have escalated this with my upper team. They will reset the password and they will give me the temporary password. Once I receive the password, I'll let you know. Ok, please stay on the line. Thank you. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:05", "end": "06:45", "text": "Hello. Hello. Thanks for calling. Hello."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:45", "end": "06:46", "text": "Thanks. For. Calling."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:46", "end": "09:03", "text": "Hello. Thanks calling. for Hello. Welcome to my lecture. Hello. Welcome lecture. my to Hello. Welcome to my lecture. Hello. Welcome lecture. my to Hello. Welcome to my lecture. Hello. Welcome my lecture. to Hello. Welcome to my lecture. Hello. lecture. my to Welcome"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:03", "end": "09:41", "text": "Hello. Thank you so much for staying the on line. I received the temporary password. Let me know once you're ready to note down the temporary password. Yeah, go ahead. That will be uppercase M As in Mike. Lowercase O. As in Oscar? Yep. Lowercase N. As in Nancy. Yep. Low case D. As in Delta. Yep. Low case A. As in Alpha. Yeah, Locus Y. As in Yankee."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:41", "end": "09:46", "text": "At. One."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:45", "end": "09:58", "text": "23. ***. So that will be Apple M Monday at telephone ******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:58", "end": "10:01", "text": "Yeah, that's fine. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:01", "end": "10:26", "text": "Is there anything else I can help you with? No, that's good. All right. So I've created a ticket for this conversation. Let me know once you know, down the ticket number. So that will be I. As in India N. As in Nancy C. As in Charlie. ***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:26", "end": "10:28", "text": "Yep."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:27", "end": "11:06", "text": "OK, so the, the numbers would be Inc ***. Yep. ***. Yep. ***. Thank you. That's it. Thank you. So before I let you go, I'll connect you to a very short survey call. Well, informed service for customer satisfaction wearing on a scale one to 5. Satisfied. And second survey is for first contact resolution where you can select one, which means your resolving first contact. Thank you so much for calling support. Have a great day. That's fine. Thank you. You, too. Thank you. Bye."}]}, {"id": "audio_Call1-35432d1d-e9a4-4f51-b0f8-e61931868999.MP3", "name": "35432d1d-e9a4-4f51-b0f8-e61931868999", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:06", "end": "00:11", "text": "Thank you for calling itl best support. My name is ******. May I help you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:11", "end": "00:32", "text": "Hello. Hi. I had the problem with my system with the teleper performance system. And when I was in love with the call, like everything ended in it and it says its reconnecting. So then I actually restart the computer. I'm still not letting me but online, but I'm trying to get the VPN and it's just not working."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:32", "end": "00:42", "text": "Ok, can you please read me your BMS number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:37", "end": "00:43", "text": "*******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:43", "end": "00:47", "text": "And your full name, please?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:46", "end": "00:49", "text": "Tesla."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:49", "end": "00:54", "text": "Thank you. As I understood, you are unable to connect your repn, correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:54", "end": "01:13", "text": "Yeah, that's correct. Like I was on the internet, obviously online. And then the crash and its reconnecting, but it didn't reconnect and then I couldn't do anything. So I restarted the computer, But now I'm trying to get back on. It's not working."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:13", "end": "01:17", "text": "Do you have any ticket number from your supervisor?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:17", "end": "01:34", "text": "Yes, I did. It's inc. 0312841, 55."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:34", "end": "02:02", "text": "Ok, let me check. Please be on call. I'm checking the ticket."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:02", "end": "02:06", "text": "Yeah, Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:06", "end": "02:19", "text": "Thank you. Since how long you are facing this issue."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:18", "end": "02:24", "text": "I'm just a guy like the last pay. 20 minutes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:23", "end": "03:10", "text": "Ok, thank you. Okay, let me create our video session so I can take the steps out of the adder. Okay, so I am creating a video session. This is the video session. You need to fight your personal information, which is visible on the screen. So your phone number is **** ** **. Correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:09", "end": "03:15", "text": "Yeah. What you do mean after the video?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:14", "end": "03:17", "text": "Sorry. Ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:17", "end": "03:23", "text": "It's been video sessions. I have to do on the video."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:22", "end": "03:41", "text": "Yes, ma'am. This will be a video. For. Why? Like, I just checked. Could I just need a slap? Sort of like if the VPN is not connecting? What is the error?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:41", "end": "03:48", "text": "Oh, that's fine. But do you need to be on the camera? Is that what you mean?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:47", "end": "03:55", "text": "Yes, ma'am. It will be a video session, but you need only to show the screen."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:55", "end": "03:58", "text": "Oh, okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:58", "end": "04:02", "text": "Okay. I've sent you the link on your phone."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:02", "end": "04:08", "text": "Ok, Ok, thank you. Just bear with me. I'll get the link."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:07", "end": "04:11", "text": "Mmhmm."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:11", "end": "04:13", "text": "How did you send the link?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:13", "end": "04:16", "text": "Yes, ma'am. I have synced."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:16", "end": "04:19", "text": "How did you send that?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:19", "end": "04:29", "text": "On your phone number, ma'am, I sent. Okay. Have you got that? OK?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:29", "end": "04:43", "text": "My router. My own router. Because it's got like one and the line from my own router. How did you send the message? No one knew anything happened."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:43", "end": "04:58", "text": "Yes. If you are telling that you are getting an ambivale on the auto, then, ma'am, to me, issues with your internet. Do one thing. Just restart your internet."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:57", "end": "05:22", "text": "OK, because, you know, when it disconnected, all the lights were green. Only now it should sound orange. Amber. And I've never had this. I've never had this issue before. Can you just bear with me? Yeah, like I didn't. But when you sent the link, I'm sorry. I couldn't find it where you sent it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:22", "end": "05:26", "text": "On your text message, ma'am. It might be either fitter."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:26", "end": "05:28", "text": "If it is not. No, I didn't guess that."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:28", "end": "05:34", "text": "Yeah, Okay, no worries. Let me share it on your email."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:33", "end": "05:35", "text": "Okay, that's fine."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:35", "end": "05:41", "text": "Can you please provide me your email so I can share the link on your email?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:41", "end": "05:53", "text": "Yeah, that's **** *** ******** ** *** **** ** gmail dot com."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:52", "end": "05:59", "text": "Okay, its monttas dot model Dina ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:59", "end": "06:00", "text": "Dot 19."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:00", "end": "06:04", "text": "Dot ****. Okay, Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:04", "end": "06:07", "text": "Ok, thank you. I've got it from here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:07", "end": "06:12", "text": "Yes, Shared, ma'am. You will be receiving it soon."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:12", "end": "06:48", "text": "Ok, I'm just waiting for it. Mmhmm. Sorry, but I have data as well. So it should come through. Yeah, Yeah. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:48", "end": "06:49", "text": "Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:49", "end": "07:02", "text": "Ok, so, OK, where's the link? Oh, yeah. OK, I found it, but. Yeah, OK."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:02", "end": "07:07", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:07", "end": "07:09", "text": "What do I need to hold?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:09", "end": "07:14", "text": "Yeah. Now connect. Try to connect your VPN."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:13", "end": "07:17", "text": "Ok, can you see it?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:16", "end": "07:21", "text": "Yes, ma'am. Hold on."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:21", "end": "07:28", "text": "Different. Yeah, I can hear that. Can you see?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:27", "end": "07:44", "text": "Yes, ma'am. I can see. They said failure. Okay. Can you just show me your."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:44", "end": "08:05", "text": "Rotor? Yeah, I'll just reset it. Like you said, just recess it. Like now it's coming back. But when, you know, when it got disconnected, my router was all green. You see? So? And I never had this issue since I started working at teleperformance since August. So."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:04", "end": "08:10", "text": "It's still not having the green light. It is still amber light. Correct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:10", "end": "08:15", "text": "Yeah, yeah, I did. I just reset it there. So."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:15", "end": "08:47", "text": "Okay, ma'am, then there is an issue with your internet service provider. Okay, as per eye checking your VPN error. Also, it is not having internet access. So you are getting this error. Oh, yeah. Here it is. *****. Okay, now it's green. Now, I agree. Please decide to connect. Okay. Close this and reconnect. Yeah, no, its."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:47", "end": "09:17", "text": "Yeah. Ok, can I please, can I just get in before. I just get. OK, Now I think its working, but I've never had this problem before. With the reconnection."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:17", "end": "09:36", "text": "I can understand number. Definitely. There can be a problem with our internet internet sometimes. So you're whenever, very If you aren't facing any of the issues with the internet, just simply restart your rotor and then check."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:36", "end": "10:06", "text": "OK, you know, when it disconnected, I didn't look at my root and it was all green. So I thought that's definitely not on my route. Um, the issue. But then when I called the help of 4, then I then I suddenly saw delight *****. So, like when I did, when it did reconnect, it was all green because I did have a look at it to see if that was the issue and it wasn't. So."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:06", "end": "10:10", "text": "Location. You should work. No, it's working direct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:10", "end": "10:16", "text": "I think so. Yeah, I hope so. Yeah, because it did allow me to get to the VPN. Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:16", "end": "10:25", "text": "Okay, ma'am. So, yes, you are in now and you can use your all the tools. Yeah. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:24", "end": "10:26", "text": "Thanks for your help. Thank you very much."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:26", "end": "10:30", "text": "Welcome, Mom. So is there anything else I can help you with?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:30", "end": "10:33", "text": "No, that's it. Thank you for your help. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:33", "end": "10:52", "text": "Welcome. And I would connect your call to a short survey for this call. We are the first surveys for customer satisfaction where you can wait on a scale of 5 to 15 minutes. Very satisfied. And the second survey is for first contact resolution, which means your issue while resolving first contact. Thank you for contacting ID, health and support. Have a great day. All right."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:52", "end": "12:09", "text": "Thank you. Thanks. Bye. Thanks for giving us a few minutes of your time to complete the IT helpes desk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist On today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to receive. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. Made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-3d5de824-70ea-4b08-a978-1b8d5873e05a.MP3", "name": "3d5de824-70ea-4b08-a978-1b8d5873e05a", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:14", "end": "04:34", "text": "You for contacting health support. This is ******. How can I assist you? Hi. Good morning. My name is ********. Please. I actually need my. I cannot unlock my system. OK, good. Very good morning, sir. Sorry for the inconvenience calls to you. I'm going to definitely help you to resolve the cancelation. Can you confirm one thing? What exact error message you're getting? I cannot. It's. I cannot. I forgot my password, but that's not very strange. This is the same password that I've been using. So is there any specific health message? No. Just password. Wrong password, That's all. Are you working from home or working on site? I'm working from home. Sorry for the inconvenience. Confirm your BMS number, please. Yes. *******. Your full name. My full name is ******** ******** Login User name usernames. You said you're calling from United Kingdom, right? Yes, please. Ok, can you confirm your hiring month and the, can I cover what? Hiring? Month and year? Sorry, I didn't get that the date when you got hired for this company. Oh, oh, that's 21st of July ****. Just a moment. Let me check with this 10th of 10th of June. OK, kindly wait. Hello? Hello? Sorry. Can you confirm it again, please? You're hiring one time a year. 10th of June ****. Thank you so much for your confirmation. So I will first check in the account and let you know till that. Can I put your call on a hold for one to 2 minutes? That's fine. Please, go ahead. Thank you. Hello. Welcome my lecture. to Yes, I do. Hello. Hello. It is taking a few more minutes, sir. Kindly wait on the line. I will update you. I'm checking. All right, that's fine. Thank you. Ok, that's fine. Just what to be sure today. Hello. Hello. Hello. Hello. Thank you. Thank you. Thank you. Please continue to."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:34", "end": "05:25", "text": "Hold. Hello. Thanks. For. Calling."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:25", "end": "12:11", "text": "Thank you so much for your patience. So the account is not blocked. Do you need the new password? Yes, please. Ok, so I will provide you the new password and you will connect with the VPN first. OK, and then with the Windows account. OK, that's fine. Yeah. So kindly wait on the line for a moment. I will provide the new pin. All right, Thank you. Hello. It is taking a few more minutes. All right, that's fine. I've actually pulled the password there many times, and the system is telling me that I need to be very careful. If not, I may need a bit locker recovery key. So it is asking for a bit local recovery key. Sir, you should update me before, right? No, it's not asking for bitlocker now. It's not asking for BitLocker now because I've not put the number of password that we finally unlock that we finally blocked me. Right now. It is asking you for the better locker or it is asking you for the password. It's asking me for my password. No, no password. I have not got into the deep locker recovery stage. I will force you the video station link that you need to join for the troubleshooting so I can check with it and ID. Please make a note of your password. I will be providing you the new temporary password. OK, so its welcome with the capital letter W Rest of the letters followed by the lowercase E L C O M E at ******. Yes. Hold on. Capital letter W Yes, Welcome, right. Oh, welcome only First letter W Capital rest of the letters lower. Yes, Yeah. At symbol ************. I'm really sorry to welcome at ***** **** 5 only. Oh, *****. Ok, can you repeat the password you said welcome with capsule letter W Welcome with capsule letter W at ***** **** W capital rest of the letters are small and I have shared you the video session link on your text message that you need to join. OK, All right, that's fine. Thank you. Just hold the line for me. Thank you. Sorry. Hold on. Yes, I don't know. 6. Hold on. I'm still with you. Just a minute. It's not visible. OK, what is it? It's not visible. I'm just still. Just hold the line for me. Just. I'm trying to just hold the line. Hold on. I'm still with you. Have you need to put that? Yes, I will do that when I put this. Do I need to talk to the welcome on the system first? Do not enter anything first time. Please join the SVL link so I can check with your PC. Please wait for a password. Please join the video session link first for the troubleshooting."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:11", "end": "12:20", "text": "OK."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:20", "end": "14:11", "text": "All right, just let me click the link. Access the camera. If you're not able to access it, please let me know. I will share it on your email because many people are having issue on the SMS. OK, that's fine. Is it working for you or not? Yes. I just clicked the link. Now, have you allowed the camera? It's just coming up. Just give me a few seconds. Allow. Yeah. But it's not visible to me. I think you are also having the issue. Can you help me with your personal email? Oh, yeah, yeah, yeah, yeah, that's fine. I can see. Now unlock the screen first. Ok, control all delay. Do not turn off the camera. OK, yeah, yeah, it is. OK. Now first connect with the VPN from right bottom side. Ok, click on that network signing network signing option. Yeah, OK. Yep. Click on Connect on network VPN Connect. Yes. And select group DWP. EWP. which Which options are there? Can you go closer? DWP backup DWPT PTCL. Which one? DW backup PCR PCR. I'm sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:10", "end": "14:15", "text": "PCL."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:14", "end": "14:23", "text": "******. Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:22", "end": "14:29", "text": "Username. Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:29", "end": "19:28", "text": "Go ahead and enter your username, sir. Ok. What about the password? The password which I have given you. Welcome at *****. Only W capital. Ok, you have to find a new password, correct? All right, just hold the line. Let me just do that now. Yeah. Hello. Welcome. lecture. To my It's telling me login denied. Show me. Oh, I've clicked that since when I put the new password. Can you connect with the slow VPN? Yeah, Slow VPN. Now select the group DWP this year so the can you go closer so I can only DWP option. Is there only DWP slow VP address? Yes. DWP. Enter your usual name and the password. Are you unable to create password Because the temporary password was working for you earlier? I can put the password there. Have you created the password or not? I have not created the password yet. Then use welcome only again. And let me know it is. Yes, because it wants to put the fine for you before, right? All right, that's fine. OK, that's fine. For it. Are you seeing it now? I've put the welcome at *****. OK, yes. Let me click. OK. All right. After that username and the password here, same username and the password. You said the username or the password. This is incorrect. Can you just tell me the error message? I cannot see anything. So whenever you're getting the error, you're turning off the camera. Look at it. OK, do one thing. Restart the PC. I'm providing you the new password. Which new password? The welcome you gave to me. The password is not working for you properly as it is connected to the VPN and incorrect error message. You're getting on the empty. So I am resetting the password again and providing it to you till that please restart the PC. Do not turn off the camera. I'm not turning off. I'm just trying to use my 2 hands to press the control to delete to unlock it first. So here is zip. Now restart the PC. Can you please restart the PC."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:28", "end": "19:32", "text": "From. Here."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:31", "end": "23:31", "text": "Restart the PcS? Go ahead and please wait on the line for a moment. Hello? Thanks for calling. Are you having a look? Now, I've restarted the PC. Yes, you need to restart and wait. I will be providing new password. Unlock the screen. Ok, and wait. OK, All right, that's fine. Do not log in anywhere, sir. Please do wait. I'm not putting an engine there. Hello? Thanks for calling. Hello? Hello. Hello? Hello. It is checking for a moment. All right, that's fine."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:31", "end": "23:34", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "23:34", "end": "24:36", "text": "Come on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "24:36", "end": "24:38", "text": "Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "24:38", "end": "27:44", "text": "It is checking for a minute, sir. Please wait. All right, that's fine. Ok, make a note of a password. Capital M for Mike Capital M lowercase. Do not directly type the password there. You should not connect with the other user directly. So kindly wait. Make a note. It's Monday. Only Capital M. Rest of the letters O N D A Y at *****. Ok, Monday, Monday only. So are you saying that you put the. Are you saying that you put the password? That's where you are seeing? No, no. You will first connect with the right bottom side. As I said, not directly with bottom. Yes. VPN Direct network signing, network signing. Yes. So its connect, Correct? Correct. Can you confirm the password with me before 9 Monday? Capital M. M O Capital M O N D A Y only M capital rest of the letter small at *****. Yeah, exactly. Just look at it. Go ahead. Please create the password as per the requirement. It is written there. Temporary password is working fine for you. Please create the password as per the requirement. Ok, Ok, um. You were entering your password with a minimum length of 12 to continue. Minimum length of 12. I. See. Um. I'm still with you. I'm just trying to make sure I get the minimum."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "27:44", "end": "28:36", "text": "Yeah. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "28:36", "end": "28:43", "text": "Are you seeing it? Yes, Yes, I am. But click on. I click on. Continue."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "28:43", "end": "28:48", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "28:48", "end": "29:39", "text": "Go close. That is. You need to be quick whenever we are providing you the temporary password. Sir, it should be 12 character in the LEN. At least contain one capital letter, one special character, one number. Click on click. Yes, Connect again. So I should put Monday. Now, first, I don't think that will work for you because temporary password only works for one time. So you need to understand the thing. So you need to create another one. Just a minute. Now, let me check with the account again."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "29:39", "end": "30:41", "text": "Please."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "30:41", "end": "30:56", "text": "Continue to hold. Please continue."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "30:56", "end": "31:22", "text": "Hold. To."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:22", "end": "32:05", "text": "Ok, allow me a moment, Ok, a few more minutes. Ok, now you will again try with the same password. And now this time, I'm giving you the permanent password as temporary is not working for you. Its welcome. Capital W rest of the letter. Small at symbol *****. Close the pop up or close all the pop ups and try to reopen the pop ups again. Close everything. Just as close Everything. Yes. Close everything and try newly Welcome at *****. Yeah. Look at it. Look at it. Yeah. Go ahead and try login."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:05", "end": "32:07", "text": "Welcome."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "32:07", "end": "33:20", "text": "You're putting W capital, right? Yes. W capital. Yeah E L C O M E r in small at symbol *****. Yes. Look at it. Ok, go ahead. It's accepted that. Yes, VPN is connected, right? Yes. I think it was connected before. Yeah. What password do I need to put in the password? Welcome at *****. Ok, look at it. Yeah. You will be able to connect this term. Yeah. Let it lower completely. You will be able to log in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "33:19", "end": "33:36", "text": "Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "33:36", "end": "37:56", "text": "I think it's working out. Yeah. Is there anything else apart from this I can assist you with? No, thank you. So that means I need to change my password Now. Is that correct? No. This is your permanent password. Now, welcome at *****. Only W capital. Oh, this is my permanent password now, correct. I will provide you the ticket number for this call. So, and I would like to update you after this call. I'm going to connect you to the short survey where you will get for survey, which is for the customer satisfaction. You can rate on a scale of 5 to 15 for the very satisfied second survey you will get, which is for the first contact resolution. You can select one, which means your issue was resolved in the first contact. Ok, so you said you will send me a link. Is that correct? Uh, no. On the call, you will get survey. I'm providing you the ticket number and on the email, you will get feedback email so you can just give and fit back based on this call. So it can be really helpful for me to grow. Ok, All right, that's fine. OK, that's fine. Survey. And please give it back, sir. Note down the ticket number. It's inc. **************. Yes. Yes. I N C India. November Charlie. Correct. I N C *********. Ok, so this ticket number. Now, where do I put it? You can provide your supervisor the reference number for this call. No, the ticket number. You just gave to me. Now you said you were sending me the link. Is that correct link for the feedback? Are you asking? Its ticket number. What do I do with this number you just gave to me? This is the reference number for just this call. You can provide this ticket to your supervisor that you were having this issue. Every troubleshooting is mentioned in this ticket. You do not need to do anything with that. You can refer to your supervisor. Ok, that's fine. So I will get everything from you now. So I will get a link from you. Now, is that correct link? For what? Sir, I thought you said I will get a link. No, no, no, I'm not sending any link. Now. You will get survey on the call when I will disconnect it. Oh, OK, that's fine. Ok, so please do survey. Thank you for contacting IP help. Best support. Have a wonderful day. All right. Thank you so much for your time. I really appreciate you. You've been very helpful. Ok, can you just help? Can you? If you want to provide feedback, please tell me so I can provide you the feedback mail so it will really help me to grow. Yes. Please send me the yes. Send me the feedback. Send me the mail daily. I will do that. Feedback mail. Yes, I'm ready to work. Ok, can you confirm your ********, please? Um, teleper performance. Sorry, benefits. Sorry, but let me go. Dot 5 at teleperforms dot co UK. Ok, I'm sending you the feedback link. You will confirm me on the call only so you will get that link. Ok, All right, that's fine. Telepathy barmigo dot 5 at telepaths dot go UK. Just a moment. Allow me a moment. Do you still need the camera? No, no, I do not need camera. Now your issue is resolved. This is just for the feedback, Ok, All right, that's fine. Yeah. The feedback. All of mail has been already shared with you. You can provide feedback and you will get survey on this call. Now, thank you for contacting. It helps, sir. Have a wonderful day. All right, Thank you so much for our tabby. I'll be very helpful once again. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "37:56", "end": "38:57", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve, press 2 if it still has not been resolved. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement, and one means you strongly disagree with it. Made it easy for you to handle your issue. Remember, 7 is the strongest agreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-3f7e982a-469d-4973-bbb5-fdffa6b5c0bd.MP3", "name": "3f7e982a-469d-4973-bbb5-fdffa6b5c0bd", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:10", "end": "00:30", "text": "You for calling it? Help Desk support. My name is ******. How may I help you today?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:30", "end": "00:34", "text": "Hey, there. Can you hear me?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:34", "end": "00:35", "text": "Yes, I can hear you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:35", "end": "01:04", "text": "Hello? Yes, I can. I'm sorry about that. I'm following up on a ticket. I've got a RITM ticket number. Uhhuh. Its R IT M *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:04", "end": "01:15", "text": "And sorry for the inconvenience caused. I'll definitely help you with this. In the meanwhile, could you please provide your BMS number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:12", "end": "01:17", "text": "*******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:17", "end": "01:23", "text": "Could you please help me with your name and last name?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:21", "end": "01:29", "text": "*********** ****. Mmhmm."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:29", "end": "01:36", "text": "May I please place your call on hold for 2 to 3 minutes so that I can review the information you have provided."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:36", "end": "04:21", "text": "Certainly. Thank you. Thank you. [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Thank. [MUSIC] Hello. [MUSIC] Welcome. To. My. Lecture. Hello. [MUSIC] [MUSIC] [MUSIC] Welcome. My. To. Lecture."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:21", "end": "04:31", "text": "You for being on hold, sir? I. appreciate your patience. Please allow me a moment. I'm just checking the ticket details."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:31", "end": "05:04", "text": "No. Problem. Hello? No problem. Ok. Where do you have an option?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:04", "end": "05:21", "text": "Could you please repeat the ticket number, sir? It's **** ********* **. I right. So or did I miss anything?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:21", "end": "06:00", "text": "I'm checking it again. I'm sorry. Just a second in my email. Hello? Hello. Can you repeat the ticket number again, please?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:59", "end": "06:16", "text": "Its R IT m 00506169 5 am. I right. So did I miss anything wrong?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:16", "end": "06:32", "text": "Yeah, that's right. That's the one my supervisor gave me. Correct. So I still can't sign into my account."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:32", "end": "06:38", "text": "I'm just checking. Allow me a moment."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:37", "end": "06:51", "text": "No problem."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:51", "end": "07:04", "text": "Could you please repeat the ticket number once again, sir? Sorry for the inconvenience calls as it is showing a different name. I'm just asking you for the update."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:04", "end": "07:22", "text": "You want the ticket number again? I'm sorry. Yes. Sure. That's rit. Mmhmm. *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:22", "end": "07:24", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:24", "end": "07:29", "text": "My trainer is ******** ******* and ******** ******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:28", "end": "07:38", "text": "Mmhmm. Your BMS ID is *******. Right, sir."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:35", "end": "07:41", "text": "*******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:39", "end": "07:43", "text": "******* *****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:43", "end": "07:44", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:44", "end": "07:51", "text": "OK, this rat ticket is requested for you only or for some other else."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:51", "end": "07:56", "text": "That I don't know Has my trainer that submitted that? I think."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:56", "end": "07:59", "text": "It is not requested for you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:58", "end": "08:09", "text": "I think it's just for me. It should be just for me. I think."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:09", "end": "08:15", "text": "Your China name is ********, right? As you have mentioned."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:15", "end": "08:18", "text": "Yes. ******** ****** *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:18", "end": "08:23", "text": "OK, please be online, sir. I'm just checking."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:23", "end": "11:03", "text": "All the details. Thank you. Thank. You. Thank you. Hello. Hello. Thank. You. Thank you. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:02", "end": "11:33", "text": "You for being on call, sir. Like as the user higher date is in future, like the ticket has been escalated to the dedicated team for exchange email creation. So the ticket is with dedicated team, so it will take 2 to 3 days of time to complete the process and sync all the data. Once it is done, the exchange email will be created for the user."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:33", "end": "11:36", "text": "Ok, I'm sorry. Did you say that it would take 3 days?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:36", "end": "12:31", "text": "Yeah, 2 to 3 days because your china has been provided the user ID. That user higher date is in future. So as the higher date is in future, the ticket has been escalated to the dedicated team. So it will take 2 to 3 days of time in order to create the exchange email and complete the process and to sync all the data? So once after that date, the team will mention the details in the ticket. So your manager will get an email. Once after the process is completed, they will update the comments in the ticket. If anyone updates the comments in the ticket, your manager will get an update like your trial will get an update."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:31", "end": "12:44", "text": "Okay, And that would be ********, right? Yes. Okay. All right. And did that ticket number ending in 6? 9 5?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:44", "end": "12:46", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:46", "end": "12:53", "text": "OK. All right. I will let her know what's going on."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:53", "end": "12:58", "text": "Is there anything else that I may help you with?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:58", "end": "13:05", "text": "No, that's going to do it for now. I guess I'll hurry up and wait. Thank you so much. Have a good one."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:04", "end": "13:12", "text": "Yeah, I'm just providing you the ticket number for this interaction. Please make a note of the ticket number."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:12", "end": "13:14", "text": "All right. I'm ready when you are."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:14", "end": "13:19", "text": "I'm just providing you the ticket number for our interaction."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:19", "end": "13:31", "text": "Please make a note of the ticket number. It's I I for India. M for Mike."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:31", "end": "13:39", "text": "No, its I s I for India m for Mike S for Sam or *****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:39", "end": "13:49", "text": "Oh, I'm sorry."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:42", "end": "13:57", "text": "00363 6. Again. ***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:57", "end": "14:06", "text": "So it's India. Mike Sierra. *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:05", "end": "14:09", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:08", "end": "14:16", "text": "Okay, alright. Thank you very much. I appreciate that. And hopefully it'll be done safe."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:15", "end": "14:37", "text": "Thank you. I would connect with you for a short survey. Post this call with the first service for customer satisfaction, where you can read it on a scale of 5 to one where 5 means very satisfied and the first contact resolution and the second service for contact resolution where you can sell up one, which means your issue was resolved in the first call. Thank you for contacting it. Help us have a great day."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:37", "end": "14:39", "text": "Right. On."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:39", "end": "16:05", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve, press 2 if it still has not been resolved, press 3. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-457e6601-a2b2-4f28-bee7-60e1394cacac.MP3", "name": "457e6601-a2b2-4f28-bee7-60e1394cacac", "utterances": [{"speaker": "Agent", "speaker_type": "agent", "start": "00:08", "end": "00:15", "text": "Thank you for calling right to hell. Bed support. My name is *****. How can I help you today?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:14", "end": "00:25", "text": "Yes. I was locked up for lunch when I came back and told me that I'm locked out. So I'm just trying to log back in."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:24", "end": "00:37", "text": "Okay, I'm sorry for inconvenience cost you. I will try my message to resolve our ratio. So have you ever tried a self help link to reset or oak password?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "00:37", "end": "00:39", "text": "No."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:39", "end": "01:06", "text": "Okay, no worries. So the tel performance grow is providing a self help link to reset or analog password. With your own sense, you can use anywhere and any devices to unlock or reset your password. Now I can. I will help you with the unlock your password right now, so you don't need to worry. So can you please provide me your vm's ID number."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:03", "end": "01:08", "text": "*******."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:07", "end": "01:12", "text": "Okay. What was your full name?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:11", "end": "01:14", "text": "****** *******."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:13", "end": "01:19", "text": "Okay. And what was your menu's name?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:18", "end": "01:20", "text": "Do what?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:20", "end": "01:24", "text": "What was your manager's name?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:24", "end": "01:28", "text": "I'm **** ******."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:27", "end": "01:34", "text": "OK? What is your heading?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:34", "end": "01:36", "text": "What is my. What?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:36", "end": "01:40", "text": "Your hiding date?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:40", "end": "01:43", "text": "My hiring date. Oh, my gosh. Yes."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:43", "end": "01:45", "text": "Oh, it doesn't."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:44", "end": "01:46", "text": "March."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:46", "end": "01:52", "text": "OK, and what was the year?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:51", "end": "01:56", "text": "Uh, this year?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:56", "end": "02:28", "text": "Okay, that's right. Thank you for providing me all the information. So it take me a moment to review information. May I put your call on hold for 2 minutes while I'm checking your information in my system? Thank you for that."}, {"speaker": "Customer", "speaker_type": "customer", "start": "02:13", "end": "04:03", "text": "[MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:03", "end": "04:28", "text": "We're looking at that. I hope you're password."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:13", "end": "04:51", "text": "[MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:51", "end": "05:03", "text": "Thank you for staying in hold, ma'am. I really appreciate your patience, ma'am. So, ma'am, as you told me, we're currently loved about in your system. Is it correct, ma'am?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:03", "end": "05:06", "text": "Is it connected?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:06", "end": "05:15", "text": "As you told me that you are having a love issue? Is that correct? I'm asking you a confirmation."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:15", "end": "05:25", "text": "Yeah. I tried to log back in for lunch and it said I want. I mean, I know that I couldn't get back in. I don't know."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:25", "end": "05:33", "text": "Yes, yes, yes. I got to work. Just give me a couple of heads, ma'am. I will let you know once you need to log in."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:33", "end": "06:08", "text": "OK, Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:08", "end": "06:26", "text": "Okay, ma'am, I have. I can see it is log. Not. So I have just heard of their accounts. Can you please try to log in and let me know if it is working for you or not."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:26", "end": "06:28", "text": "It. Thank you so much."}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:28", "end": "07:05", "text": "Okay, that's great, Mum. So, ma'am, I have created a ticket for you for your unlocked account. You can provide the ticket to your supervisor. Once you're ready to write it down, I can provide you the ticket which I have created for you, ma'am. Okay, so the ticket tomorrow is R as in Romeo E as in Echo U as in Quebec. *********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:05", "end": "07:12", "text": "Okay, I have R E N E Q *********."}, {"speaker": "Agent", "speaker_type": "agent", "start": "07:12", "end": "07:17", "text": "Yes, ma'am. That's correct. Apart from this, is there anything I can help you with, ma'am?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:17", "end": "07:20", "text": "No, that's it. Thank you. I appreciate your help."}, {"speaker": "Agent", "speaker_type": "agent", "start": "07:20", "end": "07:42", "text": "Okay, So, ma'am, I would connect you to a short survey call with the first surveys for the customer satisfaction wherein you can rate on the scale of 5 to 15 means very satisfied. And the second survey is for the false contact of resolution when in you can select one, which means your issue was resolving fast contact. Thank you for calling."}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:42", "end": "07:43", "text": "It helped me support, ma'am."}, {"speaker": "Agent", "speaker_type": "agent", "start": "07:43", "end": "07:47", "text": "Have a great, great day."}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:47", "end": "08:36", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call, Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. We did not get your response. Please try again. How satisfied were you with the assistance you had from the IT specialist on today's call, Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied."}]}, {"id": "audio_Call1-46e7bfa5-935e-4d87-825e-2820dd62204d.MP3", "name": "46e7bfa5-935e-4d87-825e-2820dd62204d", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:05", "end": "05:37", "text": "Hello? For contacting me. Support. My name is ***. How may I assist you today? Hello. I need a passive reset for BMS. Please. You need an passive reset for the BMS account? You're saying, right? Yeah. Sorry for the ratio, which I've reported. No worries. Let me check and help you out with the required information just to confirm. May I know your BMS ID number, please? *******. Thank you for confirming that. And may I know your full name, please? What is your full name? **** **** *********. And your hiring date, please. What is your joining date? 21st of June ****. Yep. And your reporting manager name, please. What is your manager name? ***** ******. And your location, please. Which country are you from you? Thank you for confirming all the details. So let me reset the password for you. Just stay on the line, OK? You for staying online? I'm resetting the password. Just stay on the line. OK? Yeah, Yeah. You for staying online? Can you please note down the new password, please? Yeah. So the password is lower case Z for Zulu. Yeah. Lowercase O for orange. Yep. Lowercase S for France. Number 4. Lowercase E for eco, uppercase V for Victor. Lower case T for tango, lowercase H for Harry. Lowercase U for umbrella. Yeah, that is the password. Can you please try to log in now and let me know whether you can log in or not. I'd be on the line. No. Say the correct user ID or password. The past type the correct user ID one. I can try again. I try it twice. It's not working. So what is the username you're using? **** **** patson dot 5. Yeah. And you have to enter the same password? Yes, not working. Sorry for that. So just I'll do one thing on your mobile number. I'm going to send you a video link. Can you please turn on the video and just show me the screen and make sure if any confidential information would be there? Yes, you can hide it. Ok, I've just read out what it says. It doesn't. I don't need to share it on screen, so I'll repeat the password on. Yeah, I'll repeat the password one second. **** Z for god O F number 4 E capital V T h u. So it is small letter V o f 4 e capital V P h u. Correct? Yes. So are you trying to log in onto the BMS or is the PC? I'm on client equipment. So it's BMS. The BMS link. So BMS means where you will be login for all your details, such as, like your full name, username and login details. And all right, my logging details are correct. It's just the password's expired. Ok, let me reset the password for you one second. Just stay on the line. I'm resetting the password. Yeah, please note down the password, please. It is low case W for whiskey lowercase H for hotel uppercase E for Echo lowercase I for India low case C for Charlie lowcase T for tango number 2. Low case I for India."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:37", "end": "05:41", "text": "Please. Load. In."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:40", "end": "06:21", "text": "No, ma'am. If you could temporary password for me and change it. Yeah, just change the password. Multiplied equipment. So that doesn't work. So I can't change my name. Password. You need to do it for me. Ok, You're saying that I should reset the password for your BMS account, right? Yeah. Let me try to give you a simple password, then just stay on the line. Ok? I'm able to try my best to give you the simple password. Just stay on the line."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:19", "end": "07:15", "text": "Hello? Hello. Hello. Hello. Welcome lecture. my to Hello. Welcome. To. My. Lecture."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:15", "end": "08:29", "text": "Thank you for staying online. Can you please note down the new password, please? Yeah. So it is uppercase W for whiskey lowercase E for eco lowercase L for Lima lower case C for Charlie lowercase O for orange lowercase M for Mary lowercase E for eco at sign at symbol ******. Is it working? I'm just closed it. I'm just reopening it. Ok? Sure. No. So it's not working. You're saying right. Let me create the password once. Just stay on the line."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:25", "end": "09:24", "text": "Thank much. very you Hello. Thank. You. Thank you very much. Yeah. Thank you. Hello. Thanks for calling."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:24", "end": "09:52", "text": "Thank you for staying online. I'm trying to create an simple password. Just stay on the line. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:51", "end": "10:15", "text": "Thank you so much. Thank you. Hello. Welcome to my lecture."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:15", "end": "11:31", "text": "Yep. Thank you for staying online. Please note down the password, please. It is uppercase W for whiskey lowercase E for eco lowercase L for Lima low case C for Charlie lowercase O for orange lowercase M for Mary uppercase E for echo at sign *******. It's not working. So are you logging into the PC or the BMS second account? BMS means where your details are delivered on equipment. I don't need it to log into PC. I need it to log into BMS. Can you need an password reset for the PC? Let me BNS. I don't use TP equipment. Ok, let me check it. Although that I can check it with my team or not. Just stay on the line. OK."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:30", "end": "12:19", "text": "Thank. You. Thank you. I'm going to say. This. It's like a. Computer. Hello. Welcome to my lecture."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:19", "end": "15:18", "text": "You for staying online? I'm checking the details. Just stay on the line. Thank you for staying online. Please note on the password, please. It is uppercase W for whiskey lowercase E for eco lowercase L for Lima low case C for Charlie lowcase O for orange lowercase M for Mary floor case E for eco at sign. ************. Only. Not 7 at all. *****. Only. Ok, yeah. Just a second. Yeah, that's what its working. Yeah, I need to do the same for a member of my team. Please. Yeah, just check it once. I'd be on the line. No, mine's working. But I also need to get a password reset for. Just give me the BMS ID number for another person as ***********. Thank you for confirming that. May I know the name, please? What is the full name here? **** ***** and hiring date, please? Yes, of the 11th of 20 and the reporting manager name, please. May Mr. **** *********. Ok, and the location please. UK. Thank you for confirming that. Let me reset the password for you. Did she also need the permanent password?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:18", "end": "15:20", "text": "Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:20", "end": "15:44", "text": "OK, let me check it on. Just stay on the line. I'm visiting the password. OK?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:44", "end": "16:25", "text": "Yeah. Thank you. Thank you. Its."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:22", "end": "16:52", "text": "You're."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:52", "end": "17:04", "text": "Welcome. Thank you very much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:04", "end": "18:45", "text": "You for staying online. Please note on the password for the agent as well. Yeah. So the password is uppercase W for whiskey lowercase E for eco lowercase L for Lima lower case C for Charlie lowercase O for orange lowercase M for Mary lowercase E for eco explanation. ****. ******. Ok, perfect. Thank Yeah, you. Thank you. And just I'll give you the ticket number for this call as well. So that in future, if you'd be having any issues, you can call us back with the same ticket number. So please note down the ticket number, please. Yeah. So the ticket number is Inc *********. And is there anything else apart from that I can help you with. No, that's everything. Okay? Yep. Thank you. And I have a small request from you. So post this call, I would be connecting you to a short survey wherein scale of 5 to 15 is very satisfied. And the second service for first contact revelation wherein you can select one, which means your issue was resolved in the first contact. Thank you. Thank you for contacting it. Support. Have a great day. Be safe. Thank you. You too. Bye. Thanks for giving us a few minutes of your time to complete."}]}, {"id": "audio_Call1-4aac5053-20aa-4329-9df9-ac2455311991.MP3", "name": "4aac5053-20aa-4329-9df9-ac2455311991", "utterances": [{"speaker": "Agent", "speaker_type": "agent", "start": "00:05", "end": "01:57", "text": "Regarding it. Home agent. This is ****. How may I assist you? Yes. Hello. I'm having some trouble with my keyboard connectivity. What is the issue you are getting with your keyword connectivity? It doesn't work into different ports and the entertainment goals. So you have connected your keyboard in another different port? It is not working. Yes, that's correct. Can you remove your keyboard from the PC and remove your headset or remove your mouse? Okay, in that port, connect the keyboard and check. Yeah, yeah, I do apologize for the inconvenience. We'll try to resolve the issue from our end. What is your first and last name? ******* ********. Ok. Yep. So restart the. Sorry. I'm sorry. Remove your mouse in that port. Connect the keyboard and in keyboard port, connect the mouse. Ok. Oh, OK. Switch out the mouse and keyboard you sent, sir. Yeah. So after we see each other, Ok, what is your first and last name? ******* ********. Oh, OK, tell that. Let me know. OK, once you're done, let me know. And I would like to keep your call on hold. Ok, just give me one moment. Take a. Yeah, be online."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:42", "end": "03:35", "text": "[MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Agent", "speaker_type": "agent", "start": "03:35", "end": "07:42", "text": "Thank you for being on hold, sir. You're welcome. Any updates? Okay? It's working now. Thank you. You're welcome. I will share the ticket number to you. Ok, Provide me a moment. Yes. Thank you. You're welcome. Give me one moment. Okay. Be online. So for swapping your key, it would start working, right? Yes, it is working now. One moment. Ok, almost done. Sure. Thank very much. you Be online, sir. Because tool is lagging a little bit. Just give me one more minute. Almost done performance. Thank you. You're welcome. Right on the ticket number. Ready? Yes, sir. It is. I for Indigo N for November C for Charlie. ***. ******. Ok, and just read that back to you. I have. And C ********. Yeah. Inc *********. Ok, perfect. Thank you. You're welcome. Apart from there's anything else I can assist you. No, that'd be it. Thank you again. OK, sir. So now I'm going to disconnect the session. Before that, I would like to connect you to the short survey post. This call were the first surveys for the customer satisfaction on scale of 5 to one filing satisfied and second surveys for the first contact resolution where you can select one, which means you should get resolved in first contact. Please read the survey. Thank you for calling it home agent. Have a great day, sir. Bye. Take care. Bye, sir. Bye, sir."}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:42", "end": "08:43", "text": "Thanks for giving us a few minutes of your time to complete the IT helped survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsettled. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One the strongest disagreement. Remember, thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-4e9adf7c-dee6-4c83-95ab-a615c9901c15.MP3", "name": "4e9adf7c-dee6-4c83-95ab-a615c9901c15", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:08", "end": "00:14", "text": "You for calling the ITIT health? My name is ******. How may I assist you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:14", "end": "00:34", "text": "Hello. Good day. My name is ***** the **** and my BME is *******. May I know your concern, sir, That you are in. My name is ********. Oh, that's fine."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:34", "end": "00:39", "text": "May I know your concern, sir? That you called the IT health text?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:39", "end": "00:57", "text": "Yeah, I would like to power off my ticket because earlier today I called one of your referencing the details. She advised me to contact him for the PC replacement to process my ticket number. May I know the."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:57", "end": "01:00", "text": "Ticket number, sir."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:00", "end": "01:32", "text": "Sure. Sure. Its incdigo. Nancy. *******. For the and *********. And then it's NC *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:31", "end": "01:40", "text": "I'm able to turn on the PC. Why do I not proceed for the replacement, sir?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:39", "end": "01:56", "text": "Yeah, I would like to make a follow up follow up for the ticket number. I would like to get an update on the ticket number. This ticket."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:56", "end": "02:22", "text": "Has already been resolved from the consent team. Wait for the few seconds. I just go ahead and check. Fine. May I know your first name and your last name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:21", "end": "02:25", "text": "Sorry. Can you speak close? What is your first name?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:25", "end": "02:34", "text": "And sir, I'm very close to my mic. What is your username that I'm using for the login?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:34", "end": "02:49", "text": "It's ******. That 51. I'm using BPN, by the way. And my first name is *********. Last name is ******. The provider's name is *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:49", "end": "02:57", "text": "And what is your higher date or date of joining in the teleper performance."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:56", "end": "03:00", "text": "ID of the teleper performance? Which delay on that topic to us?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:00", "end": "03:07", "text": "I ask you a higher date, not the ID."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:07", "end": "03:11", "text": "Prior date is September ****. September 2."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:10", "end": "03:34", "text": "**** *** fine. Thank you for confirming the detail. I understand you want to a replacement of this PC. Don't worry about it. I will help it for this issue. Sorry for the inconvenience that is caused to you. Surely I will assist you for that. Now, give me the few seconds. I'm going further and checking your account on my side. So till the name you need to just stay connected on the line with me."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:34", "end": "04:07", "text": "Ok, take your time. Uh, hello. Let me see one moment. Yep."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:07", "end": "04:14", "text": "Just stay connected on the line with me. Ok? I'm working on the same. Thank you so much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:13", "end": "04:22", "text": "Ok, fine."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:22", "end": "04:27", "text": "May I know your location at? Where are you calling from?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:27", "end": "04:35", "text": "I'm calling from the TV. Natural Philippines. They want my complete address."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:34", "end": "05:27", "text": "No, I just want this information. Wait for the few seconds, sir. Ok, I just go further and review your ticket once. Like I just proceed for the further replacement and that may I require your address. So please be on the line with me."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:27", "end": "05:30", "text": "Hello. Welcome to my lecture."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:30", "end": "06:10", "text": "All. Right. Just stay connected on the line with me. Okay? I'm still working on the same. Thank you so much. All right. And request."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:10", "end": "06:42", "text": "I agree. Take your time."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:42", "end": "06:48", "text": "May I know your location, which your side location?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:48", "end": "07:17", "text": "It's Telepermann's. *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:17", "end": "07:26", "text": "Can you please tell me or tell me which program are you currently working on?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:26", "end": "07:30", "text": "It's April healthcare."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:30", "end": "07:54", "text": "***** **********. And may your mobile phone number confirm your mobile number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:54", "end": "08:04", "text": "It's ************ OK."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:03", "end": "08:15", "text": "So wait for the few seconds. Ok, now I need to just your address of your location. Go ahead and verify your address."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:14", "end": "08:49", "text": "Its black. 46 block 10. EPA Village. Metro Manila. Pipin's zip code is ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:49", "end": "09:10", "text": "Excuse me. Give it a few seconds more, sir. Ok, because your address is showing far different than the teleper performance. It will not be back 46, but it's showing the ***. Give it a few seconds."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:10", "end": "09:11", "text": "Take your time."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:11", "end": "09:16", "text": "Is the BMS address is up to date."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:16", "end": "09:17", "text": "Sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:17", "end": "09:24", "text": "Is the BMS address is up to date."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:24", "end": "09:27", "text": "Email address is the layon."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:27", "end": "09:37", "text": "I don't require your email address, sir. I ask you that your BMS BMS address is up to date."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:36", "end": "09:44", "text": "Yes, it's. Yeah, the address for the the address. I said it's updated."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:44", "end": "09:55", "text": "No, it's not updated, sir. On the BMS. Ok, so give me the few seconds. because we need to get approval from your supervisor."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:55", "end": "09:58", "text": "What address is it indicated there?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:58", "end": "10:02", "text": "It shows a very different address on my side."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:01", "end": "10:06", "text": "****. So can you tell me what is the different address?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:06", "end": "10:16", "text": "So Domino Life compound. Tango City, Metro Manila. ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:16", "end": "10:18", "text": "It's showing the different address."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:17", "end": "10:52", "text": "Ok, so yeah, the thing is that if you are mentioning that your address is up to date, but on the BMS, it's showing the different address. So give it a few seconds more. I just reconfirm with the reconfirm or check with your recheck with the BMS. If I found that the address is not matching and the address was different than that, we will go for that for the approval from your supervisor. And then after that, we will process for the further replacement. But we need to follow this. So give me the few seconds."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:52", "end": "11:01", "text": "I just had a headset replacement and they confirm my address."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:01", "end": "11:14", "text": "The thing is, sir, while I am checking on the BMS because this address is atop, we are not commenting or anything. Ok, the address is already in the BMS. It is get to populated war here."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:14", "end": "11:19", "text": "So on the replacement showing a different address."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:19", "end": "11:21", "text": "Do you have a ticket?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:21", "end": "11:25", "text": "Yesterday. Can you please let me speak?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:25", "end": "11:28", "text": "Yeah, that is why I was asking you. Go ahead."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:28", "end": "11:44", "text": "All right. Yesterday, I just got a headset replacement and they asked me for the updated address and I gave them that it's updated for assuming they are not working. They're not doing their job updating my BMS."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:44", "end": "12:28", "text": "So the thing is that the BMS address was like the BMS address. If you're changing your location or anything, it will be all done from your supervisor or supervisor side, not from our side because the supervisor or your BHR everyr have right to change your address, not the IT. We have just access. We have access to replacement. Your default thing from our side. So I just said that we will proceed further further for for the replacement of the PPNC, but we need the approval from your supervisor. May I know your replicate number of your headset replacement? So I just go through once."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:28", "end": "12:31", "text": "Which address? The head replacement?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:31", "end": "12:40", "text": "Yeah, the headset replacement you already done. So may I know the inc number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:40", "end": "13:10", "text": "Hold on. Let me check for you. Oh, I sent it to any skins yesterday."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:09", "end": "13:47", "text": "Just checked if you got the address or not. So give me a few seconds. Ok, because I need to go further and check your address. It is up to date or not. If it is showing the same address in your BML, then we will proceed for the further replacement. Otherwise, I will ask your supervisor to update over here and then we. According to that, we will send the email to the asset team because your replacement will be done from the behalf of you from the asset team, not from our end. So that's why we required this information."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:47", "end": "13:51", "text": "Uhhuh, the power shift is later today."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:51", "end": "13:56", "text": "The supervisor is available now on the shift."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:56", "end": "13:59", "text": "It's not available now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:59", "end": "14:00", "text": "That's fine."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:00", "end": "14:14", "text": "Our ship is not shipped and I don't think she will. He will log in just to get my ticket number. Just updated my address."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:14", "end": "14:54", "text": "OK on your VMS. It's showing a different address. It is not the same address. Now do one thing. I am proceeding for the further replacement of your replacement of your VPN PC after that. Replacement of your VPN PC. And after that, if the address is showing the different, please ask your supervisor to go further approval it from their site and then we will go to book for further things. You have a system in any issue."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:54", "end": "14:57", "text": "But you can start with a replacement today right now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:57", "end": "15:10", "text": "Yeah, yeah, we are proceeding for the replacement. But make sure your supervisor reply on that. Because if your supervisor is not replying on that, then you were shipping will get dismissed."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:10", "end": "15:13", "text": "So make sure."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:12", "end": "16:39", "text": "Yeah, just stay connected on the line with me. Thank you so much. Mmhmm."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:38", "end": "17:42", "text": "Please continue to hold. Your business is important to us."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:42", "end": "17:59", "text": "To. Hold. Please. Continue."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:59", "end": "18:21", "text": "Please press 2."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:21", "end": "18:36", "text": "Thanks. For. Calling. Hello? Hello. Are you there?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:35", "end": "18:36", "text": "Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:36", "end": "18:54", "text": "Thank you for confirming. Yeah. Thank you for being on a line. And now, as per checking with the assets, they don't require any approval from your supervisor. We are now go to. Go for the replacement of your PNC. Now, I am providing you the ticket number."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:54", "end": "18:55", "text": "For this call."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:55", "end": "19:04", "text": "Can you please make a note of this ticket number? Are. You. There."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:04", "end": "19:06", "text": "Yeah. This ticket number is for. No."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:06", "end": "19:12", "text": "This ticket number is for the replacement of your VPN PC. OK, proper."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:11", "end": "19:14", "text": "VPN PC replacement."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:13", "end": "19:27", "text": "Yeah, VPN PC replacement. So are you ready to write it down? The ticket number Once you are ready, let me know. So I will provide you the ticket number for the call."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:27", "end": "19:30", "text": "Ok, go ahead."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:30", "end": "19:45", "text": "So the ticket number, it is I as in India N as in November C as in Charlie. ***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:43", "end": "19:49", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:46", "end": "19:55", "text": "0300 My best. Its ***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:53", "end": "19:57", "text": "****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:55", "end": "20:01", "text": "*****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:59", "end": "20:08", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:02", "end": "20:11", "text": "******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:10", "end": "20:22", "text": "483 Correct. It's **********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:22", "end": "20:27", "text": "8. Number 3."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:27", "end": "20:28", "text": "Ok, Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:28", "end": "20:38", "text": "That is the ticket number for this call. So apart from that, do you require any kind of assistance on my end?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:37", "end": "20:41", "text": "So I will. You will process the replacement now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:41", "end": "21:00", "text": "Yeah, like we already from our side, we already processed for the replacement. Now, within 2 to 4 business days, you will receive a new equipment that is a new VPN system to your home. Just one more time. Confirm your address."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:00", "end": "21:13", "text": "Yeah, my address is not 46. Hmm. Sorry, My name."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:13", "end": "21:14", "text": "What is that then?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:14", "end": "21:24", "text": "Its black. 46 Black. 10 Hm. Its echo. ****. That is fine. Yes. Listen."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:24", "end": "21:30", "text": "To me? Yeah. Can you please directly go ahead and tell me the address. That is fine. Don't spell it out for me. Go ahead."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:30", "end": "21:57", "text": "OK, it's not. 46 block. Pain is one. Hmm. Go ahead. Black. 46 block E P A S P Village. Paragraph Pine Samaj, page one and."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:57", "end": "22:05", "text": "Metro Manila, Philippines. Your pin code. It is us. Your zip code. It is."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:04", "end": "22:06", "text": "****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:06", "end": "22:28", "text": "Ok, fine. Now I have our address. Ok, make sure you are available on this. You are available on that address to receive your equipment. So within 2 to 4 business days, you will receive the new equipment for this. So apart from that, do you require any kind of assistance on my end?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:28", "end": "22:33", "text": "How many base?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:32", "end": "22:37", "text": "24 business days."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:37", "end": "22:38", "text": "Oh."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:38", "end": "23:06", "text": "Ok, so within 2 to 4 business they will be providing the replacement of this OK from their side and like it's totally 2 to 4 businesses. But according to that replacement, if you are yes or the equipment is available available with the setting, they will be directly processed for the further replacement. So you don't require to wait so long."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "23:05", "end": "23:08", "text": "OK, OK, yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:08", "end": "23:14", "text": "Apart from that, do you require any kind of assistance on my end?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "23:14", "end": "23:16", "text": "Oh, I think that's all."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:15", "end": "23:35", "text": "Ok, so post this call, I will connect your call to the short post survey where you can rate a service provider on a scale of 5 to one wherein 5 means where is that? So now, sir, I'm connecting your call to the IVR. Please complete this. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "23:35", "end": "24:10", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist? Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-4f48b525-5256-4a09-8233-9c2e01fff597.MP3", "name": "4f48b525-5256-4a09-8233-9c2e01fff597", "utterances": [{"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:10", "end": "00:18", "text": "You for contacting ID of the support. My name is ******. How may I assist you today?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:18", "end": "00:38", "text": "Hello, Ms. Well, this is **** from CPU Vertis. And I would like to report a deset due to assistant freeze."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:38", "end": "00:46", "text": "I'm so sorry is breaking. And you want to reboot."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:45", "end": "01:00", "text": "To this dispute, ma'am. Set call. ******. Yes. Ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:00", "end": "01:11", "text": "Like you got a quality parameter. They said due to system freeze and you need a ticket number for the same."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:10", "end": "01:19", "text": "Yes, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:18", "end": "01:25", "text": "Ok, I do understand the situation here. Now your system is working."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:25", "end": "01:27", "text": "Yes. Ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:27", "end": "01:31", "text": "Now the system is working."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:30", "end": "01:34", "text": "Yes, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:34", "end": "01:50", "text": "Thank you for the confirmation. I don't understand the situation you and I regret for the inconvenience cost. You Be assured I will try to provide you with the best possible resolution available. So allow me some answer that I could go ahead and create a ticket for you and provide you a ticket number. Ok?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:50", "end": "01:53", "text": "Ok, ma'am. Thank you very much."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:53", "end": "02:14", "text": "You're welcome. Please continue to hold. Your to important us. business is"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:14", "end": "07:18", "text": "Thank. You. Hello."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:18", "end": "07:22", "text": "Welcome my lecture. to"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:22", "end": "07:29", "text": "Hello, ma'am. You still there?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:29", "end": "07:39", "text": "Yes, sir. Here. And I've already created you ticket. Just allow me a minute or do I would provide you a ticket number."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:39", "end": "10:38", "text": "Okay. Thank you very much."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:38", "end": "10:45", "text": "Thank you for waiting. Can you please write down the ticket number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:45", "end": "10:50", "text": "OK, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:50", "end": "11:20", "text": "It would be I for India N for Nancy C. For Charlie. ***. ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:20", "end": "11:34", "text": "Ok, so let me repeat, ma'am. It is I for India N for Nancy C. For Charlie. *********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:34", "end": "11:40", "text": "That's absolutely correct. Anything else I can help you with?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:40", "end": "11:43", "text": "Thank you very much, Miss."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:42", "end": "12:03", "text": "You're welcome and I will be connecting you to our shop. Reports this call when the first service for customers in a section rate has a 5 to 15 minutes satisfied and the second service for fast contact resolution when you can select one which media issue was done. Plus contact. So thank you for contacting us. Have a great day ahead."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:03", "end": "12:07", "text": "Thank you very much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:07", "end": "13:20", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from the scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2 if it still has not been resolved, press 3. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. Made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-510403c2-774f-4f86-8a6c-f981b96dce0a.MP3", "name": "510403c2-774f-4f86-8a6c-f981b96dce0a", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:13", "end": "00:19", "text": "Thanks for calling radio supplements."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:19", "end": "00:25", "text": "Hi. I'm having an issue logging in my account."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:24", "end": "00:36", "text": "You've plotted to call me ******. Pardon? What is the problem you are facing with logging, then?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:36", "end": "00:44", "text": "It says like my account is locked, but it won't let me reset the password."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:44", "end": "00:57", "text": "That is fine. I'll help you with that. Can you please help me with the BMS number of yours? First?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:53", "end": "01:00", "text": "*******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:59", "end": "01:04", "text": "Okay. Can I have your full name also?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:04", "end": "01:07", "text": "Hopes for Polly."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:07", "end": "01:56", "text": "Thank you for the details. I'm really sorry that you're having this issue. I will try to highlight with this. Please turn con first. Let me check with your account. Mr. Tomorrow will help this in. Thank you. Okay, Thank you for being on hold. Can you please tell me? Where are you trying to log in? What is the exact application name you are trying to log in?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:56", "end": "02:00", "text": "I'm trying to log into the VDI."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:00", "end": "02:04", "text": "Okay. At this site."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:04", "end": "02:09", "text": "I'm on the screen. Its abused in the cave."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:09", "end": "02:17", "text": "Okay, that is fine. Is there any specific error message you are getting?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:17", "end": "02:24", "text": "It just says the account has been locked, but it's done this before, and it hasn't really been locked."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:24", "end": "02:44", "text": "That is fine. As I can see from your account is not allowed. We'll have to go with the password before doing password. What? Reset? We'll have to do some security checks. Can you please tell me what is your higher date? Montana And yet only."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:44", "end": "02:47", "text": "January 27, 25."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:47", "end": "02:53", "text": "Okay, what is your supervisor? Our monitor's name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:53", "end": "02:55", "text": "******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:54", "end": "03:02", "text": "Okay, what is our on site location? City or country? Anything?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:01", "end": "03:05", "text": "I'm in ******, *****. I'm looking at home."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:05", "end": "03:11", "text": "Okay, thank you for that. Please note down the password. Now."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:11", "end": "03:21", "text": "Give me one second."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:21", "end": "04:01", "text": "Ok? It is the small R as in Romeo Capital A as in Haploid Small Z as in Zulu Capital S as in Foxtrot Number 7, Capital U as in Umbrella Capital U as in Umbrella Capital R as in Romeo, then small R as in Romeo Capital S as in fast track Capital B as in Bravo and number 9."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:01", "end": "04:08", "text": "I missed the digit between the U and the R."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:08", "end": "04:21", "text": "Okay, so Capital U as in Umbrella Capital U as in Umbrella twice and then capital R as in Romeo, then smaller as in Umbila. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:21", "end": "04:45", "text": "Let me read this back to you. Small R like Romeo Capital A Alpha, Small V Zulu Capital F. Foxtrot 7 Capital, Umbrella Capital, Umbrella Capital R. Romeo, Small R. Romeo Capital F, Foxtrot Capital B. Bravo. And the number 9, correct?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:44", "end": "05:32", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:32", "end": "05:43", "text": "Well, it says welcome, but it's locked up. Yes. Give it the right number."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:43", "end": "05:49", "text": "Sure. No problem."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:49", "end": "05:56", "text": "No, it says the reference account is currently locked and may not be logged on to."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:56", "end": "06:42", "text": "Check the password once again. I'm telling you, it is small R. As in Romeo Capital A. As in Apple Small Z. As in Zebra Capital S. As in Foxtrot number 7. Capital U. As in Umbrella Capital U. As in Umbrella Capital R. As in Romeo Small R As in Romeo Capital F. As in Fox Capital B. As in Bravo number 9."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:42", "end": "07:17", "text": "Yeah, that's what I put in this. Welcome again. But it's. It'll take it out of this. So it says it's locked and can't be logged into."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:16", "end": "08:05", "text": "This is ***. I will try to take control of your screen. Priest call. Thank you. And if it shows a log, then we will have to log out your system. Then we can try logging in once again. Can we do the logout if required? No, I'm unable to take concoc screen. I'm doing the lower from my set. Please tune."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:05", "end": "08:09", "text": "All right, this is I'm signed out."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:09", "end": "08:56", "text": "That is fine. Now, I'm trying to take control for this 3 months again. Okay, try to log in once again with the same password once and check if possible. If you are able to log in our boss."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:56", "end": "09:00", "text": "Should I use the temporary password you gave me?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:59", "end": "09:27", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:26", "end": "10:05", "text": "Hello. Thanks for calling. Hello. Welcome to my lecture. It's prompting me to change the password."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:05", "end": "10:31", "text": "That is when. Please change it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:31", "end": "11:08", "text": "Hello. Thanks me. for having Thank you. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:08", "end": "11:34", "text": "Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:34", "end": "11:52", "text": "Okay. OK, It looks like it's running in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:52", "end": "12:03", "text": "No, just fine. You can move it. Logged in properly. Then we will close this call. Thank you. Let's try all the application. Smoke for this. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:03", "end": "14:07", "text": "Okay. Okay, I'm in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:07", "end": "14:14", "text": "OK, please note down the ticket for this call. I got a ticket also for you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:13", "end": "14:15", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:15", "end": "14:35", "text": "Go ahead. It is. Re. Q *********. Anything else that I can help you apart from this?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:35", "end": "14:38", "text": "No problem. Thank you so much."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:37", "end": "15:13", "text": "Okay, so I will connect you to a short survey. Positive call for a set of for customer satisfaction. On a scale of one, you can select PHI with means where satisfied and the second service. For first contact dilution. You can select the one which shewaterland first contact. Thanks following it imaging support, but they had."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:12", "end": "16:13", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from the scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with. It made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-52e2d36e-ca79-4946-9ac9-3f471bfbf031.MP3", "name": "52e2d36e-ca79-4946-9ac9-3f471bfbf031", "utterances": [{"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:07", "end": "00:21", "text": "Thank you for calling IQ meeting. My name is ****** ********. Hi. I am currently locked out of my account and I'm trying to log back in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:20", "end": "00:23", "text": "Ok."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:23", "end": "00:51", "text": "Maybe your account can be locked. We just unlocked it. May I know your BMS number? It is *******. May I put your call on hold for a moment so that I can verify it? Yes, of course. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:45", "end": "00:52", "text": "[MUSIC]"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:52", "end": "04:00", "text": "Yes. Thank you for being online. May I know your name? My name is ***** Facial. So as in your concern, you have been locked out from the system, right? Yes. I apologize for the inconvenience caused to you. Surely provided the required information. So before I need to unlock the account, I need to verify these questions. May I know your higher date? It is a 69 25 Mannitude Mercedes Humes location. I'll work from home. Your address. ** ** ***** ********* *****. ********* *, ******* ****, ********* ***. Oh, 4. Ok, just allow me a moment. Let me just go through with your. OK. Once it will be done, I will be updating you. Thank you. Yes. Thank you for being online. So as I just check on with your empty, your account was logged, so I just unlocked it. You can test it in one. And please let me know. I'll provide you a request number. Ok, Ok, All righty. Hold on. One moment. Let me try logging in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:59", "end": "04:16", "text": "Hello. Thanks. For. Calling."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:16", "end": "09:36", "text": "Ok? It's just buffering right now. Hold on. One moment. Sure. Once it's, let me know. It seems to be stuck on buffering and kind of froze. Uh, you can reboot it and then test it. Ok, I'll try doing that. Thank you. You're welcome. Uh, once you're in, let me know. Ok, I'll provide your request number. I'm waiting for it, Ok. All right. Thank you so much. Hold on. Ok, I am going to try to log back in. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:36", "end": "10:32", "text": "Please. Continue. To. Hold. Thank. You."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:32", "end": "12:18", "text": "Ok, I got logged in. OK, so I will be providing a request number. Just noted down just a moment. Yeah. So it is R for Romeo E for Echo. Q for Quebec. 004 9. *****. Ok, so I have R as in Romeo E as in Echo Q as Quebec *********. Is that correct? Yes. So, ma'am, I will be connecting you to a short survey poses call where the surveys for customer satisfaction were in on a scale of 5 to 15 means very satisfied and the second survey prefers contact resolution wherein you can click one, which means the issue was resolving first contact. So I request you to read the service after closing the session. Is there anything else? Nope. That'll be it. Ok, so thank you for contacting it. Have a great day. Bye bye. Take care. Have a great day. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:18", "end": "13:39", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist On today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with. It made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. We did not get your response. Please try again This time. Enter your response using a scale. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-54c80f78-30ad-4f48-b069-25b3ae8545ab.MP3", "name": "54c80f78-30ad-4f48-b069-25b3ae8545ab", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:14", "end": "00:20", "text": "Hello."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:19", "end": "00:30", "text": "Hello. Thank you for calling Ideal music. My name is ******, my sister."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:30", "end": "00:53", "text": "Oh, hi. I'm trying to see because I had got wiped out of my phone. And you know how you're supposed to use the authenticator app when you first log into your fellow performance account? Well, I'm having trouble with trying to access that. Are you able to assist me?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:52", "end": "01:00", "text": "Okay, Collie. So basically, you just want to set up the Microsoft authenticator, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:59", "end": "01:25", "text": "Yes. So that I can be able to. My teleper performance account because I had the, like, my phone had reset it, and I'm labeled to log in. So I wiped out all my apps and everything. So when I downloaded the Microsoft app, it's still not showing me the authenticator code or anything."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:25", "end": "01:51", "text": "All right, no worries. I understand this concern. I will surely help you out with this concern. I really thought you're getting tissue very online. I'm sorry. So, yes. So all users from the opinion. Can you please tell me a CMS number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:51", "end": "01:53", "text": "What was my number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:53", "end": "01:56", "text": "You're in employed my year?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:56", "end": "02:23", "text": "Yes. So the only thing about that is so I had my BMS number in my phone, like in my notes, so I don't have it. I think it's ******** ** something, but I can give you my first and last name. Maybe you can find it that way."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:23", "end": "02:29", "text": "Let me just check over here. In fact."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:29", "end": "02:31", "text": "I'm sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:31", "end": "02:39", "text": "I will just check. Let me just check over, customer. I will laugh. At least jump on the line. Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:39", "end": "02:43", "text": "I don't."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:43", "end": "03:30", "text": "Sorry for that. At least, ****, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:30", "end": "03:46", "text": "No, my first name is ***** *******. My BMS is probably wrong because I have it in my notes on the phone, but it's white, but I want to tell you my first and last name. I know. It's like, Yeah, OK, you want my first name and last name?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:46", "end": "03:57", "text": "Can you also please tell me your NPI? I would love your MTI ID or my what? Login ID?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:57", "end": "04:01", "text": "Oh, my login ID for teleperant."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:00", "end": "04:03", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:03", "end": "04:09", "text": "Its norwood dot 90 at telephone usa dot com."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:09", "end": "04:13", "text": "Can you just spell it out for me?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:13", "end": "04:46", "text": "N Yes N as in Nancy O. As in Oscar R as in road W as in wood O as in Oscar O. As in Oscar D as in dog dot 90 at teleperformance usa dot com."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:46", "end": "04:52", "text": "Ok, go ahead. Can you now please tell me your full name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:52", "end": "04:56", "text": "It's terrific, Norwood."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:56", "end": "05:07", "text": "Okay, so I just got your BMS ID. That is *******. Is it correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:07", "end": "05:21", "text": "Oh, I know with something like that, I think that is right, because I had AI think I remembered a little bit of it, but I think it's ******. But I forgot the last number. Yeah, that sounds right. Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:21", "end": "05:29", "text": "Okay, that is correct. And what is your date of hire?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:29", "end": "05:37", "text": "September 8th, ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:36", "end": "05:54", "text": "Okay, and for which program you are vocal. I'm. Sorry. For which program do you are? What would I ask you for as a program name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:53", "end": "05:56", "text": "UnitedHealthcare."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:56", "end": "06:01", "text": "That is correct. And what is the name of your supervisor?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:01", "end": "06:19", "text": "My supervisor name is ***** ******** or Isnessa. It was from Dria or ****** or something like that. I can't remember her name, but it recently just changed, but for now, it's ***** ********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:19", "end": "06:29", "text": "Okay, so do you just remember your last supervisor?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:29", "end": "06:45", "text": "Well, we only have these 2 supervisors, and her name is ***** ********, and the other lady is *******. I can't remember her last name, but I've seen in my team when I went on the other day, it was somebody may start with an S, but I've never been here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:45", "end": "07:19", "text": "I think. Yes, no worries. Gensa is correct. Name. That is correct, but it's ****, honey. Oh, OK. So no worries. And I'm really sorry you're taking this issue. I will shortly help you out with this discussion. So first of all, you can just the Microsoft authenticator on your mobile phone."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:19", "end": "07:24", "text": "Yes, I I download."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:24", "end": "07:29", "text": "OK, so just open it again."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:29", "end": "07:36", "text": "Ok, and then it says, ready to add your first account? Do I press add account?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:36", "end": "07:39", "text": "Just."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:38", "end": "07:48", "text": "Okay. And then it says personal account worker, school or other. Which one do I press?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:48", "end": "08:05", "text": "Okay, you can just click on sign in. Signing option. Was there? Just click on add work, then click on sign in. Okay. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:05", "end": "08:38", "text": "Ok, so its asking for the email of phone. Do I put the performance email? Yes. So I thought it was open for me. Hold on one second."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:38", "end": "09:01", "text": "Noise. Take your time."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:00", "end": "09:06", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:05", "end": "09:13", "text": "Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:13", "end": "09:30", "text": "OK, so now it says open your authentic data app and approve the request into the number if prompted, but it's like I'm not into, like I'm trying to log into that instead of apps on my phone right now. So."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:29", "end": "10:50", "text": "Okay, no worries. So let me just check. So I think so. I will just check the with the allowed team if we just share the temporary excess passcode, and they will also remove curved previous authentic indicator. So after that, you will be able to set up the new authentic indicator. Okay, yes. So probably *** on the line. So I'm just checking with the love of the team. Okay. Kindly. So on a lake. Can I just put your call on hold for one?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:50", "end": "11:12", "text": "Oh, yeah. Go ahead."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:57", "end": "13:21", "text": "[MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Hello? Yes. Thank you for being on hold."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:20", "end": "13:22", "text": "Yes, I'm here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:22", "end": "15:05", "text": "So for the long hold, I'm still checking more to be team. Okay, so, ****, I just got a few work from the Lauda team. They are just seeing the Azure VM is down. So the I think the Azure is down. So they are just asking to call us down. This is as you know, as your VM is down from there, they just reset the M&M and they just shared the temporary excess passcode from the ASIO. So I would just suggest you they are just asking to call us back after some time. Was the application really start working?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:05", "end": "15:10", "text": "But Microsoft is downright like the app. Like I wouldn't be able to do anything."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:10", "end": "15:19", "text": "Not my Microsoft. This is as you as your application."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:19", "end": "15:22", "text": "My application is down."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:22", "end": "16:34", "text": "Not your. The level team's application. Azure application is done. So due to that, they can't reset the MSA from this Their end. Is it curious? I can just do one. I'll give you the inc number to you so you can also do a call us back after some time with the same inc number. So and next representative, we'll just check and we'll also share the timber excess passcord once the application will start working from level to team. How? Many. Days, not these. It may take only half an hour, one hour or 2 hours someday. The server sometime the server down due date, due date due to as your VM is down, they are just."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:34", "end": "16:45", "text": "Ok, so would I be able to have it done before tomorrow? Go to work though? Like, is this met like, is this a fixable thing?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:44", "end": "17:12", "text": "Yes, Yes. You can also set up it 2 more in your next shift if your shift is about 2 over so you can also set up it in your next shift because hardly it takes only hardly. It takes 2 to 5 to 10 minutes only. So you could also try to set up or call us back in the next."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:11", "end": "17:14", "text": "Okay, may I have the number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:14", "end": "17:51", "text": "I'm just. Yes, I'm just waiting in the ticket number for you on the line. Sorry for that incurrence because the application is not working from the level TV. And that's why they are just seeing to call us back. Sorry for that, ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:50", "end": "18:06", "text": "Thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:06", "end": "18:51", "text": "You. Thank. You. ****** ********. Thanks for your patience. So I have a ticket number that is incendi. OK, I'm ready. **********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:50", "end": "18:52", "text": "****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:52", "end": "19:04", "text": "Yes. 36 5 feet."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:04", "end": "19:12", "text": "Is it correct? *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:12", "end": "19:24", "text": "Yes. *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:24", "end": "19:41", "text": "Ok. 02 by. Wait. Can you say it one more time? I'm sorry. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:32", "end": "19:45", "text": "*********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:44", "end": "19:48", "text": "Ok, OK, I got it. Ok, Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:48", "end": "19:56", "text": "Ok, thank you. Is there any further assistance from my side? I could also mention Hello, We're here."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:56", "end": "20:05", "text": "No, that's it. For now. I just need help with feeding Microsoft, but you sure they can help me with the app to get in Logged in, right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:05", "end": "20:39", "text": "Yes. Yes. ****. So was actually, once application start working from the leveled team, they will also reset your previous year old MFI. So after that, you will be able to set up the new MFA and they will also share the temporary excess passcode. So after that, you will be able to set up the fee. This is the process to set up the empathy. So without that level, the team felt we. Sorry. Yes. Go ahead."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:39", "end": "20:56", "text": "Would I be able to put a new email on there so that I can be able to because I can't access that email right now because my everything, all of my stuff is called. So I created a new email so that I can that one to be able to access all of."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:56", "end": "21:15", "text": "No, no, sorry, no new email. Do not work because your anti email like your last name dot 90 at teleperformance usc dot com. Only this email will work on the MFA because it is already registered."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:15", "end": "21:21", "text": "Oh, OK, so you wouldn't need like, yes, the telephone number, right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:21", "end": "21:24", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:24", "end": "21:25", "text": "No worries."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:25", "end": "22:04", "text": "Also to call us back anytime because. But as of now they're just freezing technical Asia. All right. Thank you so much. So now this call will be collected on our service. So I will just connect you to a short survey post call with service for customer satisfaction. Waiting. Can grade all the skill of 5 towards verified means. Were you satisfied at the second service for Scott Resolution? One week means so it shows us all in first contact. So thank you for contacting supporter. Great bye. Bye. Take care. Keep this survey. Bye."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:04", "end": "22:06", "text": "Thank you. Thanks for giving us a few."}]}, {"id": "audio_Call1-5a43075c-b5cd-4d91-a651-b06e79b9a67d.MP3", "name": "5a43075c-b5cd-4d91-a651-b06e79b9a67d", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:12", "end": "00:17", "text": "It home in support. My name is *****. How may I help you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:17", "end": "00:20", "text": "How are you doing?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:19", "end": "00:23", "text": "Hello. Can you hear me?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:22", "end": "00:25", "text": "Yes. Can you hear me?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:25", "end": "00:30", "text": "Yes, I can hear you. How can I help you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:30", "end": "01:05", "text": "I was calling. I was trying to. I had received my new monitor. Friday afternoon, and I was trying to get it sick. And I don't know if I'm doing something wrong or am I missing anything, but it still won't connect with the other computer. It keeps saying something about no cable cord. I'm not so sure I'm not doing it right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:04", "end": "01:28", "text": "Okay, So you just received a replacement monitor and it is still showing no input signal, right? Yeah. Okay. No worries, ma'am. I do get your concern. I'm really sorry for the inconvenience that you're facing, and I will try my best to help you out in this issue. Can you just confirm me? Are you a new hire?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:28", "end": "01:31", "text": "Yes, I am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:30", "end": "01:45", "text": "Okay, ma'am. Do you have the ticket number for the replacement of the monitor?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:45", "end": "01:58", "text": "Yes. *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:57", "end": "02:10", "text": "Ok, can you tell me your employment ID number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:05", "end": "02:19", "text": "*******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:19", "end": "02:24", "text": "Can you tell me your full name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:23", "end": "02:26", "text": "****** *****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:25", "end": "04:48", "text": "Okay, ma'am, I do get your concern. I just need to verify some security text on my site. Can I please put your call on hold for 2 minutes? [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Hello. [MUSIC] [MUSIC] Welcome. To. My. Lecture. Thank you so much for staying on. Holy ma'am. Can you hear me?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:48", "end": "04:51", "text": "Yes, I can hear you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:51", "end": "04:52", "text": "Ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:52", "end": "05:00", "text": "Like cable. So, yes, I hear you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:00", "end": "05:11", "text": "Yeah. As I was able to check the previous ticket, one of the monitors. It was not showing you any power light, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:11", "end": "05:18", "text": "It'll come on, but it's not going. Hold on. Let me turn it back on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:18", "end": "05:22", "text": "Mmhmm."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:22", "end": "05:50", "text": "It's not going no further than, but its saying, Hold on. It's pulling back on. No cable. Yeah. Isn't it Cable not connected. Which is? I have the cable cord, but I don't have another place to connect the cable."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:50", "end": "06:14", "text": "Okay, No worries, ma'am. In that case, I'll check this issue for you. I need to send you in this wheeling. It is a video session provided by Teleperformance for the users working from home, by which you can exactly show me your screen with the help of your cell phone. Okay. Can you please confirm me with your cell phone number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:09", "end": "06:18", "text": "**********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:18", "end": "06:23", "text": "I'm sending it right now. It will be a text message."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:23", "end": "06:44", "text": "OK. They go to the camera."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:43", "end": "06:49", "text": "Make sure that you're hiding any confidential information."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:49", "end": "06:52", "text": "OK?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:51", "end": "06:57", "text": "Yeah. Can you show me the cards now? The key?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:56", "end": "07:21", "text": "Um. See, it says missing the cable correl, which is, I have that, but I don't have a place to put it at on the router. Okay, This is what I kept telling."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:20", "end": "07:37", "text": "Can you show me the other end of the cable that is connected to the monitor? Show me that cable the other end this month? No, ma'am. The one that is not working. There is a cable connected on that monitor, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:37", "end": "07:42", "text": "I don't have a cable. I don't have it connected. You tell me I put it in right here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:42", "end": "07:49", "text": "Yes, ma'am. Just cable. Can you show me the other end of this cable? The other end?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:49", "end": "07:58", "text": "Um. You come."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:58", "end": "08:08", "text": "No, ma'am. This is a different cable. There is a cable connected to this monitor, right? The one that is not working."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:08", "end": "08:14", "text": "I don't have the the only cable you're talking about this table right here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:14", "end": "08:28", "text": "No, ma'am. Can you show us on the back of the monitor? No. The back of the monitor that is not working. Yeah, this cable. Yeah, this is the display cable, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:27", "end": "08:31", "text": "Don't need it. I don't understand what you're saying, sir."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:31", "end": "08:44", "text": "Ma'am, this cable that is connected here. Can you show me the other end of this cable that needs to be connected to the CPU."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:43", "end": "08:55", "text": "I'm connected to this one this month, sir. I need to take that apart because I have another one here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:55", "end": "09:06", "text": "Okay, Can you show me this cable that you're having another cable?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:06", "end": "09:08", "text": "Can you tell this right here?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:08", "end": "09:15", "text": "Yeah. Can you please show me the type of cable? This is."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:13", "end": "09:37", "text": "Hello. Welcome to my lecture."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:37", "end": "10:03", "text": "Mardi. Yes, this is this report. And the other one is ATMI. Okay, Yeah. You need to use this cable, ma'am, You can remove the cable from the monitor, the one that is connected and use this cable. Please take your time."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:03", "end": "10:37", "text": "Hello? Yep, that is. Thank you. Ok, so where would, where did this one go? I plugged it in the back. Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:37", "end": "10:52", "text": "Okay, yeah. This then goes to the CPU, the route of or the thin plant. You need to connect it to."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:52", "end": "11:11", "text": "I don't know. Where it's supposed to go to because is no."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:11", "end": "11:59", "text": "Can you show me the. OK, The VDA is connected. And the display photo is also connected. Okay, ma'am, can you show me the back of the monitor? The one that is working for you? Please show me that monitor because I need to check the type of table that is having. Okay, it's connected with VDA cable. Okay, No worries. Now show me the ZPO again. No worries, ma'am. Show me the ZPO again."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:58", "end": "12:00", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:00", "end": "12:19", "text": "Mom, please remove the black cable. The bottom cable. Please remove it. Don't remove the blue one. Only remove the black cable. Yeah, this one. Exactly. This one. Please remove it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:19", "end": "12:20", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:20", "end": "12:41", "text": "Okay. Now you can connect the other monitor to the sport. Okay, please connect it. Okay, Take your time. Please check. Now if it is working or not."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:41", "end": "12:54", "text": "Oh, OK."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:54", "end": "12:54", "text": "And it works."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:54", "end": "13:00", "text": "No problem doing the same thing. Um, one moment."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:00", "end": "13:31", "text": "Take your time. Oh, ma'am, I cannot see your screen. Yes, I can see it now. Okay? Yes, they are both working now."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:31", "end": "13:40", "text": "Wrong correlation. Ok, so with this, this extra code I can unfold, correct?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:40", "end": "13:47", "text": "Yes. Yes. Because we were using 2 codes on a single monitor. Yeah, you can unplug it. No worries."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:47", "end": "13:50", "text": "Okay, Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:49", "end": "13:57", "text": "Yeah, I know both of them are working now. No worries, ma'am. Is there anything else I can help you with?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:57", "end": "13:58", "text": "That'll be it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:58", "end": "14:07", "text": "Thank you. Okay, ma'am, you can close the camera on hold. Please stay connected on the call. Okay, let me create a ticket number for you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:06", "end": "14:08", "text": "Okay?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:07", "end": "14:27", "text": "Yeah. You can also provide that to your ******, our supervisor. I'm grading a ticket number. Please allow me a moment."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:26", "end": "14:56", "text": "Hello? Hello? Hello. Hello. Hello. Who's going? What else? We're."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:56", "end": "15:13", "text": "OK, ma'am, please note down the ticket number whenever you're ready. It's Phi as an indigo."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:13", "end": "15:14", "text": "Uhhuh n."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:14", "end": "15:27", "text": "As in November C. As in Charlie. *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:26", "end": "15:30", "text": "Oh, you said ***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:29", "end": "15:47", "text": "Oh, no, ma'am. Let me just repeat it again. After inc its ***. *****. Yeah, after that, it's ***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:46", "end": "15:49", "text": "Uhhuh."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:47", "end": "15:58", "text": "***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:51", "end": "15:59", "text": "************."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:58", "end": "16:02", "text": "That's absolutely correct, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:02", "end": "16:05", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:05", "end": "16:29", "text": "Ma'am. So before I hang up the call, I just need to tell you that I'll be connecting you to a short survey post this call, but the first survey is for customer satisfaction. We're on a scale of 5 to 15. Means that you're way satisfied, and the second survey will first contact and solution in which you can select one. That means our issue has been resolved in the first contact. Thank you for contacting it. Support. Have a great day ahead, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:29", "end": "16:35", "text": "Thanks for giving us a few minutes of your time to complete the it helpdesk survey your feedback."}]}, {"id": "audio_Call1-5d55fcdd-01ac-4a12-a4a9-122694f59468.MP3", "name": "5d55fcdd-01ac-4a12-a4a9-122694f59468", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:06", "end": "00:12", "text": "For calling ID home. My name is ****. How may I assist you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:12", "end": "00:23", "text": "Hello. I'm trying to log on to this, but it's 11 bucks out, and I'll tell you what it says now. Sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:22", "end": "00:27", "text": "I'm sorry, Miss. Can you please come again? Where are you trying to log in?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:27", "end": "00:40", "text": "Yeah, sorry. I'm trying to log into the computer to log on, but it's another locked out of the actual desktop when I log in with me. Username and password."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:40", "end": "00:47", "text": "Ok, can you, like, help me with your BMS number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:46", "end": "00:54", "text": "Yeah, it is *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:53", "end": "01:01", "text": "Thank you. Allow me a moment. Ok, may I know your first name and last name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:01", "end": "01:04", "text": "Yeah, it's ****** *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:04", "end": "01:13", "text": "Thank you. So what's the exact error message comes when you try to log in?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:13", "end": "01:34", "text": "So when I was trying to log in, I was putting my username or password. It said I've got locked out. So when I tried to log in through any connect, you know, through the VPN, it keeps saying authentication filed. OK, so I'm just completely locked."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:34", "end": "01:41", "text": "Out of the computer. Can you please verify me a higher date?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:41", "end": "01:50", "text": "And I think it's a 17th of February ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:50", "end": "01:54", "text": "May I know your supervisor name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:54", "end": "01:57", "text": "Georgia Dot."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:57", "end": "02:01", "text": "Can you work for which campaign?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:01", "end": "02:03", "text": "Not west."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:03", "end": "02:08", "text": "Ok, and what username you use for login?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:07", "end": "02:11", "text": "******* *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:11", "end": "02:39", "text": "Please stay connected. Checking with your account. And there is also a new update. So always log into the VPN first, then only to the system. Ok, now you will not be able to get into the system until you log into VPN. Ok, I'm pulling up your profile and I will check it. Let me put your call on hold for 2 minutes while I check on this information."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:38", "end": "02:40", "text": "Yeah, no problem."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:40", "end": "05:16", "text": "Thank you. Please stay connected. Hello. Hello. Thank you for being all in, miss. Thank you for your patience. I have unlocked your account. You can try to log in now and check it, but to the VPN first, then to the system."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:16", "end": "05:19", "text": "Yeah. You were to study your wallet. Try?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:19", "end": "05:51", "text": "Yeah, yes, you can check it. Please try to the VPN first because you need to connect with that because it changed for everyone from. Yesterday. If there's an update."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:51", "end": "05:55", "text": "Yeah. And mouth. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:55", "end": "05:59", "text": "Both the VPN and the system."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:59", "end": "06:03", "text": "Yes, VPN and the actual computer. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:03", "end": "06:08", "text": "Perfect. So anything else apart from this I can do to help?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:08", "end": "06:10", "text": "No, that was everything. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:10", "end": "06:16", "text": "Thank you. I've created an incident number for the call reference. Please note it down."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:16", "end": "06:20", "text": "OK, one moment."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:20", "end": "06:34", "text": "Yeah, its Inc. I as in Indigo N as in November C. As in Charlie. *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:34", "end": "06:41", "text": "So I N C *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:41", "end": "06:45", "text": "Yes. Correct. Was I able to resolve your issue today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:45", "end": "06:47", "text": "Yes, that's everything. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:47", "end": "06:52", "text": "Thank you. And anything else. Apart from this, I can do to help."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:52", "end": "06:54", "text": "No, that's it. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:54", "end": "07:20", "text": "Thank you, Miss. I would connect you now to a very short survey Post this call where the first survey is for customer satisfaction on scale of 5 to 15 means way satisfied. And the second survey is for first contact resolution. You can select one which means your issue carry information was resolved in first contact with me. Thanks for contacting it. Health desk support. Have a great day. Bye bye. Take care. Thank you. Have a wonderful day."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:20", "end": "08:23", "text": "Thank you so much. Thank you. Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very thank you. If your issue was resolved in one contact press one. If it took multiple times. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One the strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-60eeacea-9b1c-4140-b9fd-ae636600472c (1).MP3", "name": "60eeacea-9b1c-4140-b9fd-ae636600472c (1)", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:08", "end": "00:13", "text": "My name is ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:13", "end": "00:16", "text": "Hello? Are you there?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:16", "end": "00:20", "text": "Yes, you are. Audible. How can I assist you today?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:20", "end": "00:36", "text": "Yeah, this is **** ******. I work with TP. Yes, I am having login problems. I get a message that says my account is locked. I need to get it unlocked. Please."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:36", "end": "00:48", "text": "No problem. Can you please help me with your BMS account number to proceed further?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:44", "end": "00:51", "text": "*******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:50", "end": "00:55", "text": "Ok, help me with your full name."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:55", "end": "01:02", "text": "**** * A R Y Last name. *******. H A R W E L L."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:01", "end": "01:23", "text": "Thank you so much for the confirmation. It may take me a moment to review this details. Please be online. Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:20", "end": "01:55", "text": "Hello? Yeah. Please continue to hold. Your business is to us. important Please continue to hold. Hello. I'm doing this. Hello? Hello? Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:55", "end": "02:11", "text": "You for being online? I appreciate your patience. So upon checking the ad tool, I found your account is logged to unlock your account. We need to proceed with the security check. Questions. Help me with your higher date mania."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:11", "end": "02:19", "text": "That is January 29th, ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:19", "end": "02:25", "text": "Ok, help me with your supervisor name."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:25", "end": "02:36", "text": "Um, ****** ******. And she got a second last night, which I don't have in front of me."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:35", "end": "02:41", "text": "Ok, help me with your site. Location."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:41", "end": "02:46", "text": "Please. Remote in the United States."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:46", "end": "02:59", "text": "Thank you so much for the information proceeding with account. And look, stay with me."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:59", "end": "03:16", "text": "Can you tell me what you're trying to do?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:16", "end": "03:21", "text": "OK? Unlocked your account. Could you please give it a try?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:21", "end": "03:43", "text": "Ok. Ok, we're good. Ok, so give me an I and C number. That will be good."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:42", "end": "03:48", "text": "Yeah, I have a request number for you. REQ number. Let me know once you're ready to note it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:48", "end": "03:50", "text": "I'm ready."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:50", "end": "04:19", "text": "So it's R E Q Romeo, Echo. Quebec ***. ***. OK, ***. Could you please repeat that for me?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:14", "end": "04:27", "text": "******. R A Q *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:27", "end": "04:38", "text": "Yeah, it's re Q Romeo Echo."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:37", "end": "04:40", "text": "Yeah. Keep going."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:40", "end": "04:46", "text": "Yeah, it's R. Romeo. Yeah, *****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:46", "end": "04:55", "text": "R Romeo quality *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:54", "end": "05:01", "text": "Yeah, that's correct, sir. Is there anything else that I can help you with apart from this?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:01", "end": "05:05", "text": "That's it. I'm just go to work now. OK, Thank you for your assistance."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:05", "end": "05:38", "text": "You have. All right, Yeah. Thank you. And I would suppose this call. I will connect you to a short survey with the first survey for customer satisfaction, wherein we can read on a scale of **** ** very satisfied. And the second survey is for first contact resolution wherein you can select one, which means your issue was resolved in first contact. Is that OK for you? Hello? Sounds good. Thank you. Thank you for calling support. Have a great day. Bye bye. Take care."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:38", "end": "05:39", "text": "You too."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:39", "end": "05:42", "text": "Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:42", "end": "07:07", "text": "Thanks for giving us a few minutes of your time to complete the IT helps desk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call, Enter from the scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. We did not get your response. Please try again. How satisfied were you with the assistance you had from the IT specialist on today's call, Enter from a scale of one to 5 with 5 being very satisfied and one thank you. If your issue was resolved in one contact press one. If it took multiple contacts to read. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. Made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One the strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-610b3f19-a58b-4100-8dbb-798227d00288.MP3", "name": "610b3f19-a58b-4100-8dbb-798227d00288", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:06", "end": "00:13", "text": "You for contacting information support. My name is *****. How can I help you today?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:13", "end": "00:29", "text": "Hi. I've just got an issue with my computer where I'm trying to log into PPP and DMS and it's coming with ZCA scaler that is installed properly on your computer and they will contact your organization to fix the issue."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:28", "end": "00:41", "text": "Sorry for the inconvenience you're facing. Issue with the GSCA device. I surely help you regarding this issue. Could you please help me with your BMS?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:40", "end": "00:45", "text": "Yeah. *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:45", "end": "00:56", "text": "Ok, thank you. Ok, what the other message is it showing on your G scale?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:56", "end": "01:11", "text": "It's saying an application is preventing Microsoft Edge from safely connecting to this site. Zscaler didn't install properly on your computer or network. Contact your organizer to fix the issue."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:10", "end": "01:13", "text": "Could you please do? And I'm logging?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:12", "end": "01:26", "text": "I'm logging the VPN and stuff. It's just not working like normal today. So the only thing I could let me log into is to see my schedule. It's a nice web station."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:26", "end": "01:31", "text": "Could you please do one thing? Could you please help me with your mobile number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:31", "end": "01:46", "text": "Yeah. ***********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:43", "end": "01:52", "text": "****. *****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:52", "end": "02:06", "text": "Yeah. *****. Ok, did you get the *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:05", "end": "02:48", "text": "Thank you. Could you please check once? Could you please check once your mobile SMS text messages? Whether you receive the link or not."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:47", "end": "02:52", "text": "Nobody's not received anything of the year."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:52", "end": "02:56", "text": "On the SMS text messages."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:56", "end": "03:24", "text": "Nothing. You know, my teams is working. So, you know, if an IT person can ring me through teams and they can do screenshare, I can do a screen share. They'll be able to see what's wrong. Could."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:24", "end": "03:28", "text": "You please check now once you receive any link."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:28", "end": "03:43", "text": "I've not received any link. I would have told you. I've still not received anything. Then I received it. I received it now."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:42", "end": "03:52", "text": "I just sent it another one. Could you please try to click on that one as the previous one was expired?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:51", "end": "03:57", "text": "Ok, yeah. Opened the link."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:57", "end": "04:08", "text": "Yeah. And before turning on your camera, if you have any personal content information, please hide it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:08", "end": "04:10", "text": "Ok, can you see my screen now?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:10", "end": "04:13", "text": "Yes, I'm able to."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:13", "end": "04:16", "text": "This is the code."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:16", "end": "04:22", "text": "Could you please try to copy that link? Open on your word?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:22", "end": "04:24", "text": "Or."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:24", "end": "04:28", "text": "no. No, Click on Advanced. Advanced."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:28", "end": "04:32", "text": "Advanced."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:31", "end": "04:43", "text": "Ok, try to copy that link in the URL and try to open in private window on this edge browser."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:43", "end": "04:47", "text": "In private window. What does that mean? Yeah. Yeah. OK."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:47", "end": "04:48", "text": "In the browser."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:48", "end": "04:50", "text": "Google."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:50", "end": "04:55", "text": "No, no, no. And here, only click on the 3 dots."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:55", "end": "04:58", "text": "At the browser and the 3 dots."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:58", "end": "05:01", "text": "Yes. The 3rd option."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:01", "end": "05:06", "text": "A new private new in private window. Yes. Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:06", "end": "05:13", "text": "Now here, the link."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:13", "end": "05:19", "text": "Yeah, it works here. So do I need to use a private tub for all of these now?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:19", "end": "05:22", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:22", "end": "05:29", "text": "So what about BMS? How do I get a BMS now? Because BMS normally open. Look, when you open up a new tub."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:29", "end": "05:34", "text": "Yes, you can open here. Yes, you can open the BMS."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:34", "end": "05:49", "text": "Well, how do I open it? Normally, when you click flow sign, it automatically comes up as BMS. It's not coming up as BMS now, but I mean, in private. Do you understand what I'm saying?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:49", "end": "05:50", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:50", "end": "06:01", "text": "So how do I get the BMS link now? Is why I'm asking. Because I've never retrieved this link because it automatically opens every single morning."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:01", "end": "06:25", "text": "OK, in the, in private new window, go to the in private A new window?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:24", "end": "06:27", "text": "Yeah, So, I mean."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:27", "end": "06:36", "text": "Here on the top. Right. You are able to see the bookmarks. Are you able to see that one?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:35", "end": "06:37", "text": "Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:36", "end": "06:45", "text": "Yeah. Import favorites. Yes, there. Could you please check? You are able to see the BMS link?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:45", "end": "07:10", "text": "No, because these are my bookmarks. I don't have the BMS link here because it opens automatically every single morning. So I never felt the need to pull it here because every time I press a pro sign, the BMS opens anyway. But now that I'm in private, it's not doing. So I'm asking, How do I get the link then? Because I'm going to need to do my time sheet. I'm going to look at it. I'm going to need to look at communications all of this."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:10", "end": "07:16", "text": "Then try to copy this link and again try to open in the new Edge browser."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:16", "end": "07:18", "text": "Not in private."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:18", "end": "07:32", "text": "Tab. Just close this tap and press the link in a new tab."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:32", "end": "07:46", "text": "I don't understand the link in the new tab. The new tab just says Edge new tub. That's not a link. You don't understand what I'm saying. I need BMS. That's what I need."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:46", "end": "07:52", "text": "Yes. What I'm saying is, as previously, we copied the link, right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:51", "end": "08:35", "text": "Yes. Yeah, I understand that. But seriously, we copied the link and the actual link was there for BMS when I need a link. New tab? No, no link is coming. That's not the BMS link. Yes. So that's why I'm asking for the link. But if I put that in, what you just said to put in, nothing's going to come up. Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:34", "end": "08:54", "text": "Hello. Thank you for calling. Yes. Here on the top, right on the top of the URL. You were able to see in what favorite Could you please check? Once there you were able to see any BMS link."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:53", "end": "09:04", "text": "Wagons up. Hello? Where did it say that? What am I clicking?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:04", "end": "09:12", "text": "Ok, could you please help me with this one before? Have you opened the BMS?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:12", "end": "09:22", "text": "Say that again before. Have I opened the BMS today? Morning? BMS hasn't opened."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:22", "end": "10:47", "text": "It. Yes. Just to wait a moment. In a mobile phone in the link where you open, there is a convergation option. I just pasted the link. Could you please try to type this link on your browser?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:47", "end": "10:49", "text": "I'll give that link here."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:49", "end": "10:56", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:56", "end": "11:14", "text": "One second. Https. Wgo borough. Tcms dot com. Dominance dot com?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:14", "end": "11:21", "text": "Yes dot com dot com is fine. Try to click on enter."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:21", "end": "11:34", "text": "Yeah, its coming. Its coming. Very much. Let me just check everything else, though. Something else might cover."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:34", "end": "11:43", "text": "And make sure bookmark this link. So another time you're not able to finish this issue."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:43", "end": "12:41", "text": "Yeah, no problem. V Ms home. And then that's working. VMS is working. My schedule is working. TBPT is working. Let me just check if its working. Yeah. Ok, well, then this is not working. I'm going to have to ring it in. So."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:41", "end": "12:54", "text": "You've been placed on hold. Please wait."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:54", "end": "13:01", "text": "Yeah, Citrix is working. I think everything's all right now. Hello?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:01", "end": "13:11", "text": "Yes. Just to wait a moment. I have the ticket number with you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:11", "end": "13:18", "text": "You have the options and they gave me a ticket number. Do you need that?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:18", "end": "13:20", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:20", "end": "13:23", "text": "Yeah. So it's Inc."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:22", "end": "13:25", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:24", "end": "13:27", "text": "****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:26", "end": "13:33", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:28", "end": "13:56", "text": "*****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:56", "end": "14:03", "text": "Ok, I'm going to resolve this ticket because upon checking, all the tools aren't fine, right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:02", "end": "14:07", "text": "Yeah. Seems like everything's working now. Thank you very much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:07", "end": "14:13", "text": "Ok, just a moment. Ok, is there anything else may I help you with?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:13", "end": "14:18", "text": "So now that I know everything seems right now, anything else comes. I will enjoy."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:18", "end": "14:42", "text": "Before I let you go, I would short survey for this call. But the first survey is for customer satisfaction, wherein you can get a scale of 5 to one way. 5 is very satisfied, and the second survey is for us to contact resolution wherein you can select one, which means your issue is on first contact you for contacting it. Home agent support. Have a great day ahead."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:42", "end": "14:43", "text": "Thank you. Bye. Thank you."}]}, {"id": "audio_Call1-62511105-d315-4bd7-b880-b39e6a9e9459.MP3", "name": "62511105-d315-4bd7-b880-b39e6a9e9459", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:05", "end": "00:13", "text": "Hello. My name is *****. How may I help you today?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:13", "end": "00:24", "text": "I have a problem with my city. It keeps on blinking. However, it will not. Power on to the money."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:24", "end": "00:37", "text": "Not an issue. I do apologize for the inconvenience caused to you, Miss, and I will be surely assisting you with the same. So as I understood, you're having issues with the PC. That is why you're calling in, right?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:37", "end": "00:44", "text": "Yes, it's on the CPU. It's just the power just keeps blinking and."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:44", "end": "00:48", "text": "Is there any noise? It sounds like this."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:47", "end": "00:50", "text": "It has a noise."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:50", "end": "00:54", "text": "Like beep, beep, beep. Beat."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:54", "end": "00:58", "text": "Yes, it dates."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:58", "end": "01:15", "text": "Not an issue, ma'am. I do apologize for the inconvenience caused to you. I will be surely assisting you with the same. So as I understood, you're having issues with the PC. It is making deep noises and it's not working properly."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:14", "end": "01:18", "text": "Yes, that's correct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:18", "end": "01:26", "text": "Ok, can you please tell me your BMS number?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:23", "end": "01:28", "text": "*******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:28", "end": "01:38", "text": "Ok, and just to make sure this is your first call to it Help desk for the PC issues that you're facing today, right?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:38", "end": "01:40", "text": "Yes. It's just today."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:40", "end": "01:49", "text": "No, I got it. I'm just making sure that this is your first call to it. Help desk about it today."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:48", "end": "01:53", "text": "Yes. OK, first of all."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:52", "end": "02:03", "text": "OK, ma'am. Got you. Is it possible? Can you do one thing? Unplug all the cables that are connected to your PC? And let me know."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:03", "end": "02:05", "text": "Connect my cables to the PC."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:05", "end": "02:13", "text": "You mean, no, no. Disconnect all the cables that are connected to your PC."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:12", "end": "02:19", "text": "Cables. OK. Including the router."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:19", "end": "02:31", "text": "Or everything. Power cable, monitor, PC, whatever is connected. There should be not a single cable to the packaging that. Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:30", "end": "03:03", "text": "OK. It. All right. Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:02", "end": "03:11", "text": "Ok, All of the cable services come up now."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:10", "end": "03:21", "text": "Hello? Yes, ma'am. Now do one thing. Press the powered button for 30 seconds."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:21", "end": "03:24", "text": "Power button for 30 seconds, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:24", "end": "03:51", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:50", "end": "04:01", "text": "Thank you. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:01", "end": "04:08", "text": "Now remove this and just put the power cable back. OK?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:08", "end": "04:09", "text": "All the cables."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:09", "end": "04:13", "text": "Yeah, and no, just the power cable."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:13", "end": "04:29", "text": "Power cable."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:29", "end": "04:40", "text": "OK."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:40", "end": "04:46", "text": "So bring it under as well."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:46", "end": "04:57", "text": "No worries, ma'am. This is your PC. That is not working. Fine. We have to replace your PC. Can you let me know? Are you a VPN user or a VDI user?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:57", "end": "04:59", "text": "Yes, I'm going to be there."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:59", "end": "06:21", "text": "Ok, no worries. I will be replacing your PC so that you can get a new one. Please be with me. Ok?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:21", "end": "06:23", "text": "I have a question."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:23", "end": "06:26", "text": "Yes, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:25", "end": "06:30", "text": "Yes, it will be billed or the city will be billed for me."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:30", "end": "06:33", "text": "Yes, ma'am. On my house."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:32", "end": "06:34", "text": "Ok, thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:34", "end": "06:41", "text": "Not an issue, ma'am. Is it possible you can tell me, what is your home address, please?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:41", "end": "06:54", "text": "Ok, that will be ******. Rock Bargo, D U R O K and then D A G A."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:54", "end": "07:07", "text": "Let's read it for you, OK? It's 8 30 Lumb compound. Lipata Mingle CTC ****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:07", "end": "07:18", "text": "OK, yes. That's the old name for my address. But yes, it's still valid. So you can use that one."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:18", "end": "07:23", "text": "I can use this address, right? That is on our end."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:23", "end": "07:28", "text": "Yes, it's still valid. You can use that one for the actual."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:28", "end": "07:46", "text": "OK, The cell phone number that you're using is *********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:40", "end": "07:47", "text": "********** ****** it. Can."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:47", "end": "07:50", "text": "You repeat it, Please. I didn't catch you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:50", "end": "08:03", "text": "Ok, so. *****. Mmhmm ******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:03", "end": "08:15", "text": "Can you let me know your serial number from S tag number from the PC?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:15", "end": "08:36", "text": "So the serial number, it will be a l it Z for Victor. ******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:35", "end": "09:02", "text": "***. No worries, ma'am. Please hold on with me. I will be replacing this. OK, and just switching on the time frame. It's 24 to 48 hours. So within the next 2 days you will be getting it delivered at the address that I chose verified with you. Ok?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "09:02", "end": "10:08", "text": "You will be providing also a ticket number. Reference number, right? A ticket number in, OK."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:08", "end": "11:25", "text": "It. Hello?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:24", "end": "11:29", "text": "Yes, ma'am. I am still with you. I am still working on it."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:29", "end": "11:34", "text": "I was just checking as well. Nobody is nobody."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:34", "end": "11:48", "text": "Yeah, that is fine. I'm already done. Just raising the moms. I'm sending you email to your manager. It's going to take a minute or more."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:47", "end": "12:37", "text": "Ok, Thank you. Mmhmm."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:37", "end": "12:43", "text": "Hello, ma'am. Thank you for being on call. Please note down the ticket number."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:43", "end": "12:45", "text": "OK, thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:45", "end": "13:20", "text": "Let me know once you're ready, I'm ready. Give me a minute. OK? It's India. November Charlie. *********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:19", "end": "13:34", "text": "Ok, let me verify if its correct. So I have here. India. November Charlie. *********. You got it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:34", "end": "13:39", "text": "Right, ma'am. Anything else you need any help?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:39", "end": "13:42", "text": "All right, Thank you. That's it. Thank you so much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:42", "end": "14:07", "text": "No worries, ma'am. So, ma'am, post this call. I'm just going to connect to the short survey with the first survey for customer satisfaction where you can get the service on the scale of 5 to 15 means you're very satisfied in the second service. Regarding first contact resolution where you can read the service as number one, which means I've given you the resolution in the first contact. Thank you for reaching out to it helps a blessed day. Goodbye."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:07", "end": "15:12", "text": "All right. Thank you. Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve press 2. If it still has not been resolved. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-69c811de-e3fd-4415-996f-2615919fb40e.MP3", "name": "69c811de-e3fd-4415-996f-2615919fb40e", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:07", "end": "00:12", "text": "Thank you for calling support. My name is ****. How can I help you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:12", "end": "00:22", "text": "Hi. I just received a new PC and I kind of wanted help on setting that up. It was a replacement for my old one."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:22", "end": "00:31", "text": "Can you UPC? What is the exact issue with your UPC?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:31", "end": "00:36", "text": "I just needed help setting it up."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:36", "end": "00:45", "text": "Ok, you need a garden. I mean, questions with the setup of your PC."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:44", "end": "00:47", "text": "Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:47", "end": "00:54", "text": "Ok, I understand that. I'm sorry for this inconvenience caused. I will definitely help you with that. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:54", "end": "00:56", "text": "Mmhmm."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:56", "end": "01:02", "text": "Can you please confirm your BMS ID and your full name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:00", "end": "01:04", "text": "*******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:04", "end": "01:06", "text": "May I know your full name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:06", "end": "01:11", "text": "I have *** hide a."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:10", "end": "01:15", "text": "Ok, have you connected all the cables?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:15", "end": "01:31", "text": "No. So I connected 3, but I don't know what to do with the rest. 3. I can't see the they don't seem to have the same place to go in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:31", "end": "01:37", "text": "The suitable ports are not found, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:36", "end": "01:50", "text": "Basically, they set like an extra cable, but so can I like, you know how usually I'm able to share like my I can you guys send the link? I mean, I can click it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:50", "end": "02:01", "text": "No problem. I'll help you with that. Can you please provide me your personal email address? I can share you one sec into your personal email address."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:01", "end": "02:03", "text": "Ah, ad."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:03", "end": "02:05", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:05", "end": "02:07", "text": "All right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:07", "end": "02:10", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:09", "end": "02:17", "text": "****. Sorry. ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:16", "end": "02:18", "text": "****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:18", "end": "02:21", "text": "At gmail dot com."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:21", "end": "02:54", "text": "If it is your first full name. 802 at gmail dot com. Give me one second. I will share you with the link. Ok, I just shared it. Can you please check that? Have you received any links?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:54", "end": "02:56", "text": "Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:56", "end": "03:05", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:05", "end": "03:11", "text": "So that will be the bill."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:09", "end": "03:12", "text": "Here's."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:12", "end": "03:29", "text": "Something like somebody. Yes. Else? Let me quickly."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:29", "end": "03:43", "text": "Have you received the link? Oh. Yeah, So before journey session, I had any confidential data on your screen, Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:42", "end": "03:51", "text": "OK. So this is the old one."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:51", "end": "03:52", "text": "And then."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:52", "end": "04:02", "text": "This is a new one. I put all of them in, so I don't know where this one goes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:02", "end": "04:15", "text": "Just remove the old PC, Remove it from there. Do not connect it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:15", "end": "04:17", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:17", "end": "04:23", "text": "It wasn't helpful for you. Remove this cable also."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:23", "end": "04:29", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:28", "end": "04:32", "text": "How many monitors that you are using?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:32", "end": "04:34", "text": "One?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:33", "end": "04:38", "text": "Ok, no problem."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:38", "end": "05:17", "text": "Yeah. They sent me a club for the one thing to go in one second. Thank you for sharing your. Hello. It's ok. I'm talking to you, Ok, For example, this is the one they sent me today, right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:17", "end": "05:26", "text": "Show me the other end of this. OK, OK, you can connect that to the socket."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:26", "end": "05:28", "text": "But it doesn't go in the socket."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:28", "end": "05:32", "text": "Yes, it doesn't connect."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:32", "end": "05:35", "text": "But it's not going in the socket. It doesn't go."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:35", "end": "05:41", "text": "In just choose any other circuit or direct wall circuit."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:40", "end": "05:48", "text": "Yeah, I did try that as well. I tried my wooly one. Even that doesn't go in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:48", "end": "06:12", "text": "Just try to fit it. If it is possible, just try to fix it because that's the main cable. Just choose this. Just try to choose any suitable socket."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:12", "end": "06:44", "text": "Oh, going in everywhere. Ok, let me just transfer you. OK? Even if I take my phone one off, it doesn't go in there either. Where does it come? It is a straight. I don't know if you can see."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:44", "end": "06:50", "text": "Actually, that the plug, it is bent."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:49", "end": "06:57", "text": "Oh, is it? Oh, so it's not good. For what now? Yeah, this one's."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:57", "end": "07:08", "text": "Done. Oh, so have my work. If it is possible. If you have any tools with you, just try to fix it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:08", "end": "07:11", "text": "Yeah. So this one's been just to kind of see."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:11", "end": "07:38", "text": "Yeah, yes. One second, one second. Can you please show me that? Ok, if you have any tools with you, just try to fix it. Any screwdriver, like, because this is the main cable that we need to fix."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:38", "end": "07:44", "text": "OK, I don't really have tools, but I am using my hands and my full."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:44", "end": "07:48", "text": "In a cutting player in my hands."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:47", "end": "08:00", "text": "Um, one moment. It's not moving at all. It's not even like tiny, but, you know."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:00", "end": "08:19", "text": "Oh, OK. Can you please try to. Connect to the socket and show me that I can take a picture on it and I'll escalate it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:19", "end": "08:26", "text": "Where did it go? I just want to take a picture."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:25", "end": "08:44", "text": "Of that in other review and from the back said, show me from the back said I can take a picture. The 2 pins are crossed, right? OK, thank you. If it is possible, just try to push it harder. It might work."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:44", "end": "08:52", "text": "No, it's, no, I'm fine. It doesn't even go. It doesn't even fit into the hole a little bit."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:52", "end": "08:57", "text": "Ok, no problem. Can you please show me the other end of this cable?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:57", "end": "09:01", "text": "So that's the top plan in. Shall I take it out?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:00", "end": "09:20", "text": "Yes. Show me that. Ok, I got it. Show me the monitor, backside."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:20", "end": "09:32", "text": "Monitor side. Oh, keep locking my phone. When I pick. This."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:32", "end": "09:41", "text": "I'm not able to see that it is. I think it was stuck at the link. Can you please try to rejoin again?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:41", "end": "09:51", "text": "I can see. No. Is it the one I can?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:51", "end": "10:01", "text": "Not this one. The monitor screen. Yeah, Back of it. Is. That. Correct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:00", "end": "10:02", "text": "Like this?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:02", "end": "10:33", "text": "The power cable. I think it is suitable for you. Can you please remove this power cable and connect it back of this CPU? I mean, the the tower. And also there should be one tag number on the tower. Can you please provide me the tag number? Teleperforming sticker."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:33", "end": "11:14", "text": "Did you check that? Oh, I look. Yeah, I just unlocked it. Hold on a moment."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:14", "end": "11:17", "text": "Mmhmm."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:17", "end": "11:29", "text": "Sorry. One second, I just kind of lost. I unplugged it, and I saw it behind my. Okay, find it. Found it here. What did you say to pluck it? No, that's."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:29", "end": "11:34", "text": "Not it. Yes, it was the back of the morning Cpl."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:34", "end": "11:42", "text": "No, but I don't think it was this one. I think it was the total one. How does it look? Because I lost the show behind."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:42", "end": "11:46", "text": "Show me that. The cable. Show me the cable."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:45", "end": "11:47", "text": "Device."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:47", "end": "11:55", "text": "Yeah, it will fix to the CPU."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:55", "end": "12:03", "text": "A minute from now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:03", "end": "12:22", "text": "What's. In. Now, can you please turn on the term on CP? Also, can you please show me that there should be an attack number. White collar sticker on it. Do you see it? Maybe it is on the other side."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:22", "end": "12:33", "text": "No. It doesn't have a coupon. Hello. This cost one."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:33", "end": "12:37", "text": "Cost any other teleperforming sticker."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:37", "end": "12:41", "text": "No, you don't have any."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:41", "end": "12:56", "text": "Look at the sites of it. Right side. Yeah. Yeah, it is. It is. Ok. Got. It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:56", "end": "13:04", "text": "OK? Yeah, I'm taking it. But please, I guess it's the lights on now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:03", "end": "13:27", "text": "Ok? It is working with that. Ok, I will escalate the issue. Please stay connected. Ok? You need a replacement of the power cable. I'll escalate the issue once I got a response, I'll inform you. Do you have a ticket number with?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:26", "end": "13:28", "text": "Yeah, this is my."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:28", "end": "13:35", "text": "Number. ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:34", "end": "13:41", "text": "2. Ok. Can you see it or should?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:41", "end": "13:45", "text": "I read it. Yes, I got it. I got it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:45", "end": "13:53", "text": "Is it possible? You know how my old PC is this size? Why is this one so big compared to that one?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:53", "end": "13:58", "text": "Sometimes they'll provide you with a different PC."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:58", "end": "14:03", "text": "If you can't, can you please request to this one if it's possible?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:03", "end": "14:09", "text": "For that, we need to replace it again. Whole computer."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:09", "end": "14:14", "text": "And how do I return this?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:14", "end": "14:19", "text": "I'll check with the team if they're agreed, we can check with that. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:19", "end": "14:47", "text": "Ok, No, because I want to. Because I don't. I'm not going to use this now. So there's no point in having it. So I just want to return it. I believe I agree with you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:46", "end": "14:53", "text": "OK? I have escalated it. Once I got a response, I'll inform you. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:53", "end": "14:55", "text": "Am I going to be informed or."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:55", "end": "22:27", "text": "No, no, I will stay. Just try to stay on the same call. I'll inform you. Thank you for staying connected and just waiting for the response committee. Once I got a response, I'll inform you. Ok, just stay connected. Thank you for staying connected to the team. You suggested that we need to escalate this issue to the top engineer team. They'll help us to replacement of your cable. OK. Just a moment."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:26", "end": "29:19", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "29:19", "end": "30:05", "text": "You for staying connected? I'm just checking with the team. Once I got a response, I will inform you, OK. You for staying connected. Can you please confirm that your BMS is updated, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "30:04", "end": "30:06", "text": "Yeah, it is."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "30:06", "end": "30:43", "text": "OK. Just a moment. The team is proceeding with the replacement of your cable. Once I got an update, I'll inform you one second. Ok. Okay. Thank you. The team is approved for the replacement of your cable. You'll get a replacement of your power cable. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "30:42", "end": "30:45", "text": "OK, that's fine."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "30:44", "end": "31:39", "text": "OK, Thank you. Is that all done? Yes. Yes. Ok, is there anything else that I can help you with? Apart from this issue? No, no, that's it. Thank you. And also, I want to inform you that when you receive this cable, just try to turn on your computer by connecting this new cable and also log in into the VPN. Only into the VPN. Do not log into the windows. Ok, only into the VPN. Wait. Yeah, yeah, I'll complete it one second. Wait for 2 to 3 hours while you're logging into the VPN. Ok, OK, because your campaign tools and all need to be pulled when you connect it to the VPN only it will all get pulled and application will get installed. You have to follow this process."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:39", "end": "31:49", "text": "OK, that's fine. And also for regarding the old PC and the cable and stuff. How do I send this back?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:49", "end": "31:55", "text": "As a recorded team will contact you and they will record it from you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:55", "end": "31:56", "text": "Okay, that's fine."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:56", "end": "32:16", "text": "OK, OK, you have the ticket number. Yeah. Yeah. Inc. I'll repeat that from the beginning. Inc ********. This is the ticket I have created for you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "32:16", "end": "32:19", "text": "Ok, that's fine. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:19", "end": "32:20", "text": "No problem. It's the same one, isn't it?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "32:20", "end": "32:23", "text": "It's just updated."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:23", "end": "32:28", "text": "No, this is a new ticket number I have provided you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "32:27", "end": "32:30", "text": "Oh, so I can't use the old one again."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:30", "end": "32:36", "text": "No, no, you can't use the old one. I'll repeat that for you one more time. Inc."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "32:36", "end": "32:43", "text": "One second. I see. Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:43", "end": "32:54", "text": "Ok. Inc *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "32:53", "end": "32:58", "text": "Ok, All right. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:58", "end": "33:09", "text": "No problem. Is there anything else that I can help you with apart from this issue?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "33:09", "end": "33:11", "text": "No, that's fine."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "33:10", "end": "33:32", "text": "Thank you. Was this call? I'll connect you to a short survey with the first survey for customer satisfaction on a scale of 5 to one. Very satisfied. And second survey is the first to contact the relation where you can select the one which means your issue is resolved in first contact. Thank you for contacting support. Have a great day. Thank you. You too. Thank you. Bye."}]}, {"id": "audio_Call1-6e69a874-108a-48b3-8011-189e729a6fb9.MP3", "name": "6e69a874-108a-48b3-8011-189e729a6fb9", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:55", "end": "05:53", "text": "Hello. Hello. You for contacting it. Support. My name is ******. How can I help you today? Hi. This is *** from Walter PDP chat. So I'm calling to have AI am calling to get a ticket number due to internet issues. So you are having Internet issues, sir, and you are unable to use the internet. Is it correct? Yes, that is correct. OK, its good. Do not worry about it. I will surely help you on this. Ok, so just a minute. All right. Yeah. Yeah. So please, can you give me your BMS number? Sure. It's ****-******-****. Yes, that is correct. Ok, And your full name, please. **** *****. Bravo. OK, Thank you, **** *****. And as I can understand, you do not want the ticket number because it's an issue with your internet, right, sir? Yes, that is correct. Yeah, yeah. Just a minute. I'm giving a ticket number. Ok, can I put your call on hold for 2 minutes? Sure. No problem. Thank you for the confirmation. Thanks for being on hold. I really appreciate the patience, ****. So your ticket number is ready. OK, I'll wait a moment. Yeah. Yeah. And you can give this to the supervisor. OK, there is nobody in that. I've mentioned this and you're unable to work because of the internet outage. I have mentioned all these stuff. OK, for you. Yes. Yeah. All right. I'm ready now. Yeah, Yeah, it's I for India. And for November C for Charlie. *********. I'm repeating again. Inc. *********. All right. All right. They got it. Correcty. Is there anything else that I can help you apart from this? No, that's all. Thank you so much. Welcome, ****. So, ****, I will connect you to a short survey post with the first service for the customer satisfaction where scale of 5 to 15 is very satisfied and the second service for the first contact resolution where you can select one, which means your issue got resolved in the first contact. So thank you for contacting it. Help Deck. Have a great day. Bye bye, ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:53", "end": "07:13", "text": "Sure. Complete the IT helpd deck survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist On today's call, enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve press 2 if it still has not been resolved, press 3. We did not get your response. Please try again. If your issue was resolved in one contact press one. If it took multiple contacts to resolve press 2. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is a thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-72aec533-86ee-4998-8a9b-2919fe5d26a4.MP3", "name": "72aec533-86ee-4998-8a9b-2919fe5d26a4", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:06", "end": "00:11", "text": "You for calling ID? My name is ********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:11", "end": "00:15", "text": "Hi. Good morning. How are you today?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:14", "end": "00:18", "text": "Yes, its good."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:18", "end": "00:25", "text": "That's good to hear. So I want to tell you because a MITP platform is not working."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:24", "end": "00:31", "text": "OK, MYP platform is not working."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:31", "end": "00:37", "text": "Yes, the page is blank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:37", "end": "00:43", "text": "Okay, so you are not. First of all, provide me our BMS number."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:43", "end": "00:51", "text": "Yes, sir. It's *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:49", "end": "01:10", "text": "*******. Okay, I'm checking on it. And as I understand, you are not able to log into your BMS. Sorry, that might be. I am checking, and I apologize for it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:10", "end": "01:24", "text": "But my DMS is working and I was able to log into a DMS. It's just my 2 piece platform. The thing is that the whole page is blank, like it just. The page is blank. It doesn't load or anything."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:24", "end": "02:06", "text": "He wrote it. I am sending you one text versus to your phone number. Click on that ZNGA home your computer screen. If any sensitive, important data open, you can hide it. Already sended."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:06", "end": "02:10", "text": "Ok, I just got it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:09", "end": "02:54", "text": "Yes, I am able to see it. Ok. Okay. Could you please do one thing? Go to the global groom and search on the Google is Jude. Okay, It's a global groom. So tiers browse. Yes, dry on this myd dot on tv dot net."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:54", "end": "03:01", "text": "My tp dot on my TV."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:01", "end": "03:17", "text": "Mytp dot ont with mytp dot on dp dot ab. I already sent you on the chat also. Oh. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:17", "end": "03:28", "text": "Thank you. I see. It. It does the same thing."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:28", "end": "04:31", "text": "Ok, got it. Go to the start menu. Such triple C PR. I am sending on the D R I P L E C forch. Triple C. Open. It. Couldn't open. I think its pop up on the screen. You can just minimize everything. Check your desktop page. Maybe pop up. Yes, This one. Please select the groome. Hm? My boat."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:30", "end": "04:39", "text": "Opened a lot of them. Deleted chrome."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:38", "end": "05:20", "text": "Yes. Click on. Okay. Close. Yes. Okay. And close at the time. You can relaunch the chrome and then drive my debit on deep tab again. It. Ok. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:20", "end": "05:40", "text": "Thank you. Thank you. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:39", "end": "05:45", "text": "Can you check it? Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:45", "end": "06:09", "text": "Thank you. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:08", "end": "06:18", "text": "Okay. And to your credentials, even the audio and then check it noise."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:17", "end": "06:59", "text": "Okay, Thank you. Perfect. Thank you so much. I appreciate you so much. Its working."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:59", "end": "07:05", "text": "Thank you. I'm creating that ticket for you regarding this call."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:04", "end": "07:09", "text": "Okay, perfect. Thank you. I appreciate you. You have a wonderful day."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:09", "end": "07:18", "text": "No. Please note the ticket number. Also regarding this call. Sorry. Yes. Happy."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:18", "end": "07:21", "text": "What is the ticket number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:20", "end": "08:33", "text": "I am creating for you. It. Ok, 2. Okay. Please note down the ticket number Inc, India and ***** *****. *****. ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:30", "end": "08:34", "text": "*********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:34", "end": "08:38", "text": "Got it. Is there anything else I can do to help for you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:38", "end": "08:39", "text": "No, that would be all."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:39", "end": "09:01", "text": "Thank you so much after this call. To start with both of these customers at this fax size scale of 5 to 15 minutes satisfied and second is fresh content as a loose where you can say like to one, which means that you are during first content. Lazy for complete feedback and thank you for contacting ideals. The support. Have a great day. Thank you. Have a nice day."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:01", "end": "10:12", "text": "Thanks for giving us a few minutes of your time to complete the IT HelpDesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist On today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve press. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-75b052d0-acd0-44f0-8dbb-41d183be1822.MP3", "name": "75b052d0-acd0-44f0-8dbb-41d183be1822", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:06", "end": "00:12", "text": "You for calling it support. My name is ******. Who can I help you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:12", "end": "00:16", "text": "Hi. How are you? My name is ***** ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:16", "end": "00:19", "text": "M sure. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:19", "end": "00:36", "text": "All right, now I had a slight problem while I was utilizing my my computer. I was in the midst of a call. My left monitor. I wouldn't even necessarily say it's gone out because I can still see my mouth, but my entire screen is black."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:35", "end": "00:54", "text": "Okay, so we've all proceeded with troubleshooting part. I need to identify you with some basic questions. So can you proceed with that? Okay, so those help me with your beams. I get your full name, please."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:54", "end": "00:59", "text": "ID *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:58", "end": "01:05", "text": "Mmhmm. And just to help me with your full name, please."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:04", "end": "01:08", "text": "***** ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:08", "end": "02:05", "text": "Okay, So also, I need to verify your details from my end. So may I put you on a one for the same? Thank. You. So thank you for your patience. Hey, ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:05", "end": "02:07", "text": "Repeat that for me."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:06", "end": "02:16", "text": "Okay, So like, as per my understanding, like you are not, but like you're totally monitored. Is it totally black? Like out?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:16", "end": "02:25", "text": "Yes, its black completely. But when I moved the mouse, I can see the mouse on the screen, but I can't see what was on the screen previously. It's all black."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:25", "end": "02:47", "text": "Ok, you. So can you do one thing like, sorry so for the inconvenience. Cost surely will help you out in this or just do one thing. Remove all the cables from your CPU. Okay, let me. Okay, let."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:46", "end": "02:50", "text": "All right. Movement for both. Correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:50", "end": "03:04", "text": "And remove all the cables. Whatever cable connected on your CT. Remove all the cables."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:04", "end": "03:34", "text": "Right there. We see it does have the school and HD and services. And that's always. Has this been a common issue?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:34", "end": "03:41", "text": "Yes. Just now, let me know. Have you all the cables for me CFU."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:40", "end": "03:44", "text": "I'm still working on the one that I have to screw in some barely."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:44", "end": "03:59", "text": "Oh, noise."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:59", "end": "04:12", "text": "Ok. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:11", "end": "04:16", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:15", "end": "04:33", "text": "Oh, this is the only blue. I don't know. That's what it really is. OK? Hmm. Alright, I've been all the papers."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:33", "end": "04:39", "text": "Okay, now just do one and think, first of all, our repair for the 30 seconds."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:39", "end": "04:41", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:41", "end": "05:04", "text": "There's the power written for the 35. And after that. Love all the cables and dentists."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:04", "end": "05:46", "text": "Still counting. Hello. Welcome to my lecture. It. Ok, now I'm going to put the table tracking in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:46", "end": "06:15", "text": "Okay. It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:15", "end": "07:32", "text": "Second. I'm screwing in the court. Thank you. Thank you. Thank you. Ok, thank you very much. Ok, now I'll see the low VDI. I see that. We're going to have to do 5. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:32", "end": "07:35", "text": "Ok, are you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:35", "end": "07:45", "text": "Still, do not. I'm able to get in here, but I can't use this other money that it's still showing black."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:44", "end": "07:49", "text": "Ok, you're both monitored. You're still going black."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:49", "end": "07:53", "text": "Must have found that."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:53", "end": "07:57", "text": "Okay, after login."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:56", "end": "08:06", "text": "Yeah, I have to log in. Show black on the left side, but I can see the mouse on the screen, but I can't see what was on the screen previously."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:06", "end": "08:11", "text": "Hold on."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:11", "end": "08:29", "text": "I wonder what may do that."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:29", "end": "08:38", "text": "Okay, so can you do one thing? Can you check in the backside of Motorola? How many cabins connected?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:37", "end": "08:40", "text": "12."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:39", "end": "08:50", "text": "2 cable. And do one thing in case you swap the cable of the monitors."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:50", "end": "09:57", "text": "And give me a moment because its gone. I think it's on the turn. It's going to turn it off. Okay. Mmhmm. Thank you. Can you give me a second, Ms. Powering back on. Now when it says it's going to send them by mode. What does that mean?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:57", "end": "10:25", "text": "Let's do it the same year it is working."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:25", "end": "10:54", "text": "Please stay on. The line. Now. I am able to see the background."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:54", "end": "10:58", "text": "No, it is. Okay. It is good. It is working."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:58", "end": "11:00", "text": "Now. I have to see both of the backgrounds. Uhhuh."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:00", "end": "11:05", "text": "Okay. Okay. Now your computer is working, correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:05", "end": "11:07", "text": "Yes. My computer is working then."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:07", "end": "11:43", "text": "Okay, so just give me 2 minutes. I'm going to create the ticket for you quickly, and I'll get back to it and then please be stay connected."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:43", "end": "11:54", "text": "Excuse."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:54", "end": "12:04", "text": "Me."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:04", "end": "12:07", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:07", "end": "12:13", "text": "And thank you for your patience. So can you let me know? Are you a VPN user or VDI user?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:13", "end": "12:15", "text": "I'm a VDI user."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:15", "end": "13:19", "text": "Okay. Got you. Hello. Thanks. For. Calling. Thank you for your patience. I have created the ticket number for you. Once you're able to abound the. Let me know."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:19", "end": "13:32", "text": "Can you bear with me? All right, I am ready."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:32", "end": "13:46", "text": "Okay, so the d**k number is I as in India N As in Nancy C. As in Charlie. *********. Do you want to remit the ticket number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:46", "end": "13:56", "text": "I'll repeat it. It was I as in India N. As in Nancy C. As in Charlie. *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:55", "end": "14:02", "text": "Yes. This is a card ticket number you're having. So anything else that you want to help me?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:02", "end": "14:06", "text": "No, that'll be all for me. And I really do appreciate your time today."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:06", "end": "14:27", "text": "You thank you so much for connecting summer policies. Call with the first sort of other customer satisfaction rate on their skin of one to 5 year 5 is very satisfied. And as they can, false contact resolution really can select one, which means your issue as a result of false contact. So thank you for calling it day support. Have a great day. Bye."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:27", "end": "16:07", "text": "You're welcome. Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist On today's call, enter from a scale of one to 5. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve press 2 if it still has not been resolved. Fantastic. This time. Enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. Made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. We did not get your response. Please try again This time. Enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. Made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One The strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-77e74869-76b8-4865-9cad-c89bc7e1c015.MP3", "name": "77e74869-76b8-4865-9cad-c89bc7e1c015", "utterances": [{"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:05", "end": "00:12", "text": "Thank you for planning. My name is ******. How can I assist you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:12", "end": "00:21", "text": "Hi. Good evening. Is this. I'm having a problem with my issue."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:21", "end": "00:31", "text": "Which type of issue you're facing? Sorry, this type of issue you're facing."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:31", "end": "00:34", "text": "Type of."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:34", "end": "00:37", "text": "Issue issue."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:37", "end": "00:42", "text": "Yeah, I'm already receiving some error message."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:42", "end": "00:52", "text": "Could you please help me with that error message? Yeah, sure."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:52", "end": "00:56", "text": "It says Beatlocker recovery."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:55", "end": "01:02", "text": "OK, Beatlocker recovery."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:01", "end": "01:04", "text": "Ok."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:04", "end": "01:09", "text": "So you need bit local recovery, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:09", "end": "01:11", "text": "Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:10", "end": "01:32", "text": "Ok, I'm so sorry for the inconvenience cost to you. I surely help you with that. Ok. So before we proceed, I need some information from you. Could you please help me with your BMS? Number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:29", "end": "01:37", "text": "*******."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:34", "end": "01:40", "text": "******* ** that correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:39", "end": "01:41", "text": "Yes, that is correct."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:41", "end": "01:47", "text": "Okay. Could you please help me with your complete name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:46", "end": "01:52", "text": "***** o'barrow."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:51", "end": "01:57", "text": "*****, could you please help me with your higher date?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:56", "end": "02:03", "text": "I'm not so sure about the date, but it is ****. October."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:03", "end": "02:14", "text": "Yeah, correct. Could you please help me with your cell phone number? *****?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:13", "end": "02:20", "text": "Yeah, the one that is registered on my BMS or."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:20", "end": "02:25", "text": "The one? No, no. Use my cell phone. Cell phone."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:25", "end": "02:39", "text": "Yeah. *******."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:39", "end": "02:43", "text": "60 Mmhmm."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:42", "end": "02:57", "text": "6 zero. Yeah, *******. Now let me let me. *************."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:57", "end": "03:07", "text": "Just just for confirm. **********. Is that correct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:07", "end": "03:16", "text": "Again. ***********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:13", "end": "03:19", "text": "*********** *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:19", "end": "03:21", "text": "Yeah, that's right."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:21", "end": "03:30", "text": "What is the 11 number 11? Is it Sorry? It's 11, is it?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:30", "end": "03:37", "text": "Yes, it's 11."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:37", "end": "03:45", "text": "It's an 11. Is it most probably showing it's having the 10. Is it number? Right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:45", "end": "03:50", "text": "I don't know. In the Philippines we have 11 numbers."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:50", "end": "04:06", "text": "Ok, okay. Thank you for your confirmation. So, *****, it takes me a moment to revenge. Permission. May I have a permission? Can I put the partner on hold for some time?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:06", "end": "04:07", "text": "Sure. Go ahead."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:07", "end": "04:17", "text": "Thank you. Just to confirm it is the first time you're calling us with this issue. Yes. All right. I."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:17", "end": "04:20", "text": "Think she's working fine earlier and then."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:20", "end": "04:46", "text": "Yeah, yeah, I understand your issue. I understand your issue. Yeah. Please allow me a moment, OK, while checking your information. Go ahead. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:46", "end": "05:33", "text": "You. Thank you very much. Thank you. So much. Thank you. Thank you. Thank you. Thank you. Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:33", "end": "05:40", "text": "Welcome to my."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:38", "end": "05:51", "text": "Lecture."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:51", "end": "06:01", "text": "Thank you for being on hold. Hi, *****. Could you please help me with your manager name and your location for the security reasons?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:01", "end": "06:03", "text": "Sorry. What is your name?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:03", "end": "06:09", "text": "Your manager name and your location. Could you please help me with that for the security reasons?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:08", "end": "06:14", "text": "Yeah, Yeah. My manager's name. ******* ******."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:14", "end": "06:19", "text": "Annual location."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:18", "end": "06:21", "text": "Philippines. Baba."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:20", "end": "07:01", "text": "Ok. *****, I'm going to send you one link that is as willing that can access your cell phone. Back camera. Okay, I'll, I'll, I'll access your back camera, Then I'll check with my N. I'll take the snap and I'll, I'll get a Mandy things from your system. Then we process for a troubleshooting part. Ok, so before sending a link, could you please hide the confidential later and sticky notes of your system for the security reasons? That's not visual for me. Once you confirm, then let me know I'll send you the link then. Ok, sure."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:00", "end": "07:03", "text": "Where are you going? To send the link?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:03", "end": "07:25", "text": "You will find via text message. Give me a moment. Sure. So may I have a permission? Can I send you now?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:25", "end": "07:27", "text": "*****?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:27", "end": "07:30", "text": "Sure. Again, please."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:30", "end": "07:35", "text": "May I have a permission? Can I send you now?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:35", "end": "07:38", "text": "Sure. Where are you going to send the link?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:38", "end": "07:42", "text": "Via text message."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:41", "end": "07:43", "text": "Text message."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:43", "end": "08:01", "text": "All right, Yeah. OK, it's sent now. No at all to be invalid, the number would be invalid."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:01", "end": "08:19", "text": "Can you try to. From the first number? Can you change it to *****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:19", "end": "08:25", "text": "Ok, OK, give me one moment."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:25", "end": "08:33", "text": "This. *********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:28", "end": "08:38", "text": "************ *****. ******. Is that correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:38", "end": "08:48", "text": "Can you try to change the fix in the beginning? Yeah, you can try ***********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:48", "end": "09:17", "text": "Ok, give me one moment. Yeah, it's sent now. *****, can you please check once I just sent."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:17", "end": "09:35", "text": "There you go. Yeah, I have the other."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:35", "end": "09:58", "text": "Hello. Welcome to my lecture. Hello. Welcome to my lecture."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:58", "end": "10:02", "text": "Now."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:02", "end": "10:26", "text": "Yeah, I'm able to see. Now. Please give me a moment. Can you please show me? Yeah, just move closer. Little bit. Yeah. Okay. Got it. Give Hold on, please. Ok, the key ID would be 3. Ok, can you please show me the serial number of your system?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:26", "end": "10:28", "text": "Serial number of."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:28", "end": "10:39", "text": "How CPU? Show me the CPU. You can. You can. You can find the white color sticker. The serial number."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:39", "end": "10:57", "text": "All right, hold on. Hold on. Let me just put my."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:57", "end": "11:08", "text": "Phone down. Yeah, yeah, sure. Sure."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:08", "end": "11:31", "text": "Please. Continue to hold. Thank you. Thank. You. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:31", "end": "11:35", "text": "You're talking about the TPG or the."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:34", "end": "12:01", "text": "Tbside TPCPU. Yeah. Which one actually showing blurry. Can you please check the serial number one? Yeah. Hold on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:00", "end": "12:13", "text": "Hello. Welcome to my lecture."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:13", "end": "12:16", "text": "All right, hold on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:16", "end": "12:33", "text": "You're. Welcome."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:33", "end": "12:36", "text": "No, I'm not able to see the number."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:36", "end": "13:05", "text": "Because the team will do will create the key ID. Bit louder key ID. So that's why we need the TL number. They will. They will know the particular system having the issue on bitlocker recovery key. So that's why can you. Can you check the wire sticker anywhere? The right side, the left side."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:05", "end": "13:08", "text": "I'm trying to."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:08", "end": "13:18", "text": "Do you see, there s slash n."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:18", "end": "13:21", "text": "Hold on."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:20", "end": "13:32", "text": "Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:32", "end": "13:58", "text": "Hello. Is there anything else? Hello? Welcome. To my lecture."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:57", "end": "14:09", "text": "Yeah, you can see there. Yeah, you can. Can you please spell for me? I'm not able to see it Exactly. Its showing blurry."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:09", "end": "14:14", "text": "Yeah, My camera is not really working fine right now."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:14", "end": "14:18", "text": "So you can spell it for me. I load it down."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:18", "end": "14:36", "text": "Sure. Sure. The serial number is that would be. 6 and then C for Charlie R for Romeo. ***."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:35", "end": "14:41", "text": "****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:38", "end": "14:46", "text": "53953 J as in Juliet. And then. 9."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:46", "end": "14:50", "text": "After Juliet."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:50", "end": "14:52", "text": "9 9."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:51", "end": "15:04", "text": "Ok, just to confirm 6 C as in Charlie R. As in Romeo, 43953, then J. As in Juliet. Then number 9. Is that correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:03", "end": "15:05", "text": "That is correct."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:05", "end": "15:46", "text": "Okay, *****, can you please give me a moment? I'm going to escalate this issue to the Altom. Then altogether will generate the key for you. Then I'll provide you once I'll get the key. Ok? Yeah. Thank you. Please stay connected. Give me a moment. OK, I'm going to escalate first to this issue to the Altoid team. It looks *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:44", "end": "15:59", "text": "Hello? Hello. Hello?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:59", "end": "16:08", "text": "Okay, *****, I just escalated it. Okay, Once I'll get the response from team, I'll get back to you. Please. Kindly check connected. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:08", "end": "16:09", "text": "Sure. Sure."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "16:09", "end": "16:23", "text": "Yeah. Thank you. Thank you, *****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:22", "end": "17:35", "text": "Thank you very much. Thank you very much. Thank you. you. Thank Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "17:34", "end": "17:42", "text": "You for being online. Hello, *****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:41", "end": "17:43", "text": "Yes. Can you hear me?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "17:43", "end": "17:50", "text": "Yeah, I got the. I got the key. Are you ready for? Not down there?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:50", "end": "17:52", "text": "The ticket number?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "17:52", "end": "17:55", "text": "No, no, no. The key ID."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:55", "end": "17:56", "text": "What do you mean?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "17:56", "end": "18:00", "text": "The key ID. ID. Yeah, yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:00", "end": "18:09", "text": "Oh, there's a problem."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:09", "end": "18:13", "text": "It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:12", "end": "18:17", "text": "Yeah. Uh, go ahead."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:16", "end": "18:25", "text": "OK, that would be ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:23", "end": "18:27", "text": "****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:26", "end": "18:30", "text": "****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:29", "end": "18:32", "text": "03."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:31", "end": "18:35", "text": "33."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:34", "end": "18:36", "text": "33."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:36", "end": "18:42", "text": "All right. ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:41", "end": "18:45", "text": "****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:45", "end": "18:51", "text": "Then. ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:49", "end": "18:54", "text": "****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:52", "end": "18:58", "text": "****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:56", "end": "19:01", "text": "****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:59", "end": "19:05", "text": "****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:04", "end": "19:07", "text": "Mmhmm."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "19:06", "end": "19:14", "text": "Then *****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:14", "end": "19:16", "text": "Say this again."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "19:15", "end": "19:21", "text": "Sorry. ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:19", "end": "19:30", "text": "****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "19:22", "end": "19:34", "text": "********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:33", "end": "19:36", "text": "***."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "19:35", "end": "19:41", "text": "****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:38", "end": "19:44", "text": "****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "19:42", "end": "19:48", "text": "****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:46", "end": "19:50", "text": "****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "19:48", "end": "19:53", "text": "****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:52", "end": "19:54", "text": "****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "19:54", "end": "19:59", "text": "All right. Should I repeat once for you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:59", "end": "20:40", "text": "All right, Yeah. I'm going to repeat that. Yeah, sure. ************************************************."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:39", "end": "20:46", "text": "Correct. Correct. ****, can you please? You can continue this key."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:46", "end": "20:49", "text": "Yeah. And then a member, right? Yeah, Yeah."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:49", "end": "20:55", "text": "Enter and let me know once you're in."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:55", "end": "21:05", "text": "All right, and I'm having the window icon and its loading."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:04", "end": "21:09", "text": "Sounds good. So its working now?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:08", "end": "21:14", "text": "Yeah, I think I think so."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:14", "end": "21:23", "text": "So, *****, is there anything else that can I help you with? Apart from this?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:23", "end": "21:29", "text": "Am I going to have the survey or is that the call?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:29", "end": "21:34", "text": "Sorry. Can you please speak a little bit louder?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:34", "end": "21:40", "text": "Yeah. Am I going to have the survey right after the call or?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:39", "end": "21:44", "text": "No, no, no, no. It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:43", "end": "21:46", "text": "Doesn't have any survey."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:46", "end": "21:59", "text": "No, no, Yeah, I have survey after end call. You have to do survey. Okay. First of all, I'll I'll prepare the ticket for you. Okay. All right. Give me one moment."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:59", "end": "22:02", "text": "Nothing else. Sure."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:01", "end": "22:09", "text": "Yeah. If you have any type of issue, you feel free to contact us. We will surely help you with that. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:09", "end": "22:11", "text": "Alright. Yeah."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:11", "end": "22:16", "text": "If you have any doubt for *****, as of now, that. Can I help you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:15", "end": "22:21", "text": "Mhm. Yeah, I think I'm good now."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:20", "end": "22:22", "text": "OK, Sounds good."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:22", "end": "22:24", "text": "Thank you so much for your assistance."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:24", "end": "22:29", "text": "You're welcome, *****. Give me a moment. I'm preparing a ticket for you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:29", "end": "22:30", "text": "Sure. Sure."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:30", "end": "22:37", "text": "Thank you. Please stay connected."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:37", "end": "23:22", "text": "Thank. You. Thank. You. Thank you. Thank. You. Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:22", "end": "23:31", "text": "Thank you for being on hold. *****, I made a ticket for you. Please let me know once it is noted down the ticket number."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "23:31", "end": "23:33", "text": "Sure. Go ahead."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:32", "end": "24:00", "text": "Ok, the number would be uppercase. I as in India, uppercase N as in Nancy, uppercase C. As in Charlie. *********. I'm noted down."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "24:00", "end": "24:08", "text": "Yeah, it is incorrect. ******."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "24:08", "end": "24:16", "text": "All right, correct. So is there anything else that can help you with? Apart from this, ****, that can help."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "24:16", "end": "24:19", "text": "I'm all good Now, thank you for your assistance."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "24:19", "end": "24:41", "text": "You're welcome, ****. Before that you go, I will connect a short survey to post this call where the first service for customer satisfaction where you re candidate on scale of 5 to 15 is very satisfied. And the second service for fast contact resolution where we can select one, which means on the first contact. Thank you for calling ID. Help the support. Have a good day. Bye bye, *****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "24:40", "end": "26:42", "text": "Bye. Thank you. Yeah. Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2 if it still has not been resolved, press 3. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with. It. Made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. We did not get your response. Please try again this time. Enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. Made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One The strongest disagreement. Remember 7 is strongest agreement. One is strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-7a214bb1-d408-44ff-a767-892ee0265c11.MP3", "name": "7a214bb1-d408-44ff-a767-892ee0265c11", "utterances": [{"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:06", "end": "00:12", "text": "Thank you for calling it homage support. My name is ******. How may I assist you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:12", "end": "00:19", "text": "Hi. Good afternoon. I need an assistant in regards to my availability. One asking. Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:19", "end": "00:28", "text": "Ok, what is the issue that you need assistance with Avaya? Like, Is it not working?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:28", "end": "00:36", "text": "I cannot be able to connect it. VTI."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:36", "end": "00:41", "text": "VDI. You said you're not able to connect to the VDI."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:41", "end": "00:46", "text": "And no, I cannot be able to connect to the server address."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:46", "end": "00:54", "text": "To the VPN? Right? Is it giving you timed out and the SCP issue?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:53", "end": "00:56", "text": "I'm just sorry. Can you repeat that?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:56", "end": "01:35", "text": "Ok, so the VPN is giving you timed out and THCP. Is it giving you something like that? Yes, right. I'm really sorry about it, right? This is an outage. Multiple users are impacted because of this. Right? So, right. Have you informed this to your team leader? Contact your team leader, right? Because most of the users are facing this issue. You're using VPN. If you're using VPN, then it will be disconnected. It will not connect. Right? This is an outage. Inform your team about it. Have you informed or not?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:35", "end": "01:46", "text": "Ok, so I'm using a VBI. My problem here is my 15 connect to the server."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:46", "end": "02:20", "text": "Ok, so you're not using VPN? That's correct. So that's fine. Ok, And then we have to check further. Right? If it's a media and machine, Ok, go ahead and let me leave. Close this. Your Avaya, close your Avaya and then repool it and let me know and read the exact full error message for me. Right? What's the full error message? Close it. Closer message."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:20", "end": "03:05", "text": "Thank. You. Sir."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:05", "end": "03:34", "text": "Thank you for your patience and for staying connected. I'm still here. I'm still waiting for you, right? Let me know."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:33", "end": "04:10", "text": "Just bear with me. I'm trying to get the method. Ok, I do have here the error message. It says that the account was unsuccessful due to an unknown plan. Please refer the troubleshooting guide or contact the system administrator."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:09", "end": "04:28", "text": "Is there any recent changes like, have you got a new PC or any recent changes in your PC? And do you remember your password? Do you remember your your extension? The settings are proper. Have those been checked by your team leader or not?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:28", "end": "04:37", "text": "Yeah, it's still the same. It's all the information I provided here when I tried to connect it. It's still the same. I remember all my office."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:37", "end": "04:53", "text": "Ok, no problem. I certainly got your concern. And I'm really sorry that you're facing this issue. We'll try to check further with this and provide you the assistance in order to assist you further. Can you please help me out with the PMS or the CCMS number? What's your PMS number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:53", "end": "04:59", "text": "Sorry. Maybe my DMS number is going to be *******."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:59", "end": "05:03", "text": "Thank you. Your full name, please. What's your complete name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:03", "end": "05:10", "text": "Cherry in."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:09", "end": "05:26", "text": "Ok, thank you. Thank you very much. Just be online, right? Help me out with your host name. You know how to find the host name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:25", "end": "05:26", "text": "I'm sorry."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:26", "end": "05:34", "text": "Can you repeat that host name? I need your host, your computer's host name."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:34", "end": "05:43", "text": "Computer name."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:43", "end": "05:58", "text": "You know how to find the host name or not? Host name. Machine name. You know how to find the machine name or host name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:58", "end": "06:10", "text": "Ok, it's going to be a for alpha U for yup U for umbrella dash for Kelly."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:10", "end": "06:17", "text": "I'm sorry. From where you're giving me this."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:16", "end": "06:19", "text": "Yeah. From the host name."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:19", "end": "06:24", "text": "This is the host name on the screen."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:24", "end": "06:25", "text": "Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:25", "end": "06:34", "text": "Oh, OK, repeat that again. E for echo. You were saying, Repeat that again. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:34", "end": "06:35", "text": "Do you want me to repeat it?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:35", "end": "06:39", "text": "Yes. Yes. Start from the beginning."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:39", "end": "07:11", "text": "Ok, sure. Ok, I'm going to repeat it back. It's a for Alpha Z for zebra U for Umbrella dash E for Charlie, the number 6 M for Mary R for W for Lester 94 at workgroup."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:11", "end": "07:24", "text": "That's incorrect. That's incorrect. Incorrect. It's not going to work. Provide me your email ID. I will be doing a video assistance with you. This is incorrect."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:24", "end": "07:33", "text": "After my email is going to be M by knock, it's going to be my last name and the initial of my first ****@*****.***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:33", "end": "07:35", "text": "So."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:35", "end": "07:40", "text": "Last name, Then your first name and initial."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:40", "end": "07:41", "text": "Name."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:41", "end": "07:46", "text": "Initial. You said initial. So it's C."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:45", "end": "07:54", "text": "Yeah, it's a letter C it's going to be E M B A Y N o c at gmail dot com."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:54", "end": "08:34", "text": "Sure. Thank you. Thank you for the confirmation. Ok, I will be doing a video assistance video with you, right? You have to open this video assistance link and then we will be checking further video with you. Right? Make sure you hide all the sensitive and private information before opening it. Mmhmm."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:34", "end": "08:47", "text": "I'm going to show up."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:47", "end": "08:58", "text": "Thank you very much for your patience. Please check your email. If you receive any kind of link, you have to open it. Right? Make sure to hide all the sensitive and private information."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:58", "end": "09:39", "text": "Ok, one moment. Ok, let me check now. OK."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:39", "end": "09:47", "text": "Thank you. Thank you. Thank you. Thank."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:47", "end": "09:56", "text": "Ok. Are you able to see me screen?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "09:56", "end": "10:30", "text": "This is not a VDI machine. You said this is a VDI machine. This is not a VDI machine. This is a window 11 PC or this is a VPN machine. Right? So close this. Close this. Please show me your show me your Avaya. Where is your via? When have you received this machine? When was the last time you were working on it?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:30", "end": "10:34", "text": "I used it on last week."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:34", "end": "10:39", "text": "Last week Press. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:39", "end": "10:42", "text": "Yes. Pesso."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:42", "end": "10:51", "text": "Press. OK, close it. I don't understand. Press. Ok, Yeah. Press can close it. Close it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:51", "end": "11:02", "text": "Okay. I just want to inform you also that the CPU was just a bit new CPU right now, which was just provided to us last week."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:01", "end": "11:13", "text": "Uhhuh. So you didn't use it? This is your first time using it or you have used the Avia before on this PC."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:13", "end": "11:22", "text": "I have a via before this one. However, it was in a different CTU. The city that I a*s right now is a new one."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:22", "end": "11:37", "text": "That's what I was asking you if there's any changes. Okay, that's fine. Thank you. Go to your Avaya one X. And why are you needing a via? You are using Genesis. So why do you need a via?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:37", "end": "11:44", "text": "We are using a via Genesis. Yeah."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:44", "end": "11:59", "text": "If you click on a via. Do not click anything. Let me see all the options first. Right, click on change settings, Change login settings. Click on that."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:59", "end": "12:10", "text": "Show. Me."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:10", "end": "12:20", "text": "Click on Agent."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:20", "end": "12:33", "text": "It."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:33", "end": "12:40", "text": "Just give me a minute, right? I'm checking with the settings and everything and get back to you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:39", "end": "13:19", "text": "Thank you. Arithmetic, *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:19", "end": "13:29", "text": "Thank you. Thank you. Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:29", "end": "13:35", "text": "Thank you for your patience. I'm still checking on it, right? Please be online. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:35", "end": "14:11", "text": "Thank. You."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:11", "end": "14:20", "text": "Thank you for your patience and for staying connected on the call. Right? Open your Avaya again. Hello?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:20", "end": "14:22", "text": "Yes. Can you hear me?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:21", "end": "14:35", "text": "Yeah, I can hear you. Go ahead. Please open your Avaya again and give me the error message, right? Once it give you the error message, just let me know. I have to explain your issue to the team. Right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:35", "end": "14:46", "text": "So I'm going to put in here and the information."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:46", "end": "15:00", "text": "Open the video, right? Thank you. Video is still not open. I'm just waiting for this. Open it from the your email."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:00", "end": "15:26", "text": "Yeah, let me."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:26", "end": "16:41", "text": "Thank you. Thank you. Thank you. Thank you. It's. Horrible. *****. Thank. You. Thank. You. Thank. You."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "16:41", "end": "16:56", "text": "Ok, thank you for your patience, right? I am explaining our issue to the telecom team to check into it. Just be online. This can take a few minutes, right? I will let you know once the telecom team provide any information on it. Right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:56", "end": "16:57", "text": "Thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:57", "end": "18:17", "text": "You. You're welcome."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:17", "end": "18:23", "text": "Thank you for your patience. Still on it. Still working on it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:23", "end": "20:08", "text": "Ok. Sure."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:08", "end": "20:46", "text": "Thank you for your patience. OK, thank you for your patience and for staying on the call. The team has responded. The telecom team has responded. You need to check with your client for this, right? Because this is managed by them. This is client manage server and PBX. You have to call the health network for this. Right? As for the telecom, this is not managed by us."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:46", "end": "20:48", "text": "Which department should I call you guys?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:48", "end": "21:15", "text": "You need to call your client IT client it Health net. You're from Health net, right? Your account is head. So you have to call your account IP right head. They are managing it. The PP is not managing it. The TPH IP is not managing it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:15", "end": "21:18", "text": "OK, sir. But can you please provide me the check number?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:18", "end": "21:24", "text": "Sure. Sure. I will be giving you an operating one for you. Just give me a minute."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:24", "end": "21:43", "text": "Ok. Sure."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:43", "end": "21:52", "text": "Thank you for your patience and for staying. You can have the ticket number, right? If you're ready, I can provide it to you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:52", "end": "21:53", "text": "Go ahead."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:53", "end": "22:10", "text": "It's I for India N for Nancy C. For Charlie. *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:10", "end": "22:13", "text": "Can I get one more time?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:13", "end": "22:24", "text": "Sure. Inc. *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:24", "end": "22:29", "text": "Thank you so much for that one. And this is for your assistance."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:29", "end": "23:03", "text": "You too. Right. And get a check with the account ID. Right. So that they can help you with it. I will be connecting you for a short survey now with service for the customer satisfaction on a scale of 5 to one by means where you satisfy and the second service for the first contact resolution within tech one. Which issue was the first contact? Thank you for contacting it. Health support. Have a wonderful day. Thank you. Bye bye."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "23:02", "end": "23:38", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve, press 2. If it's fantastic this time, enter your response using a."}]}, {"id": "audio_Call1-7d093d2b-ce10-42ba-8bc3-4546cedda3c4.MP3", "name": "7d093d2b-ce10-42ba-8bc3-4546cedda3c4", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:08", "end": "00:15", "text": "Thank you for contacting test support. My name is ******. How can I help you today?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:15", "end": "00:27", "text": "Hello. This is *****. My name is ****. I'm calling with Wellcare. I was trying to log into my AWS extended PCP and it will not load."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:27", "end": "00:42", "text": "Okay, so as I can understand, you're unable to log into the AWS site, Ma'am. Am I getting any error message? While I'm just trying to log into the AWS?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:42", "end": "00:48", "text": "It said cannot open."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:48", "end": "01:00", "text": "I'm really sorry for the inconvenience cost to you, ma'am. I'll definitely help you with that. So can you please help me with your BMS ID?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:00", "end": "01:02", "text": "Do what?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:01", "end": "01:05", "text": "UBS ID. Ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:04", "end": "01:11", "text": "Sorry. 8 7."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:11", "end": "01:25", "text": "Thank you so much for the confirmation. And can you please help me with your first and last name? Your first and last name, ma'am?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:24", "end": "01:26", "text": "**** ********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:26", "end": "02:10", "text": "Thank you so much for the confirmation, ma'am. So, ma'am, can you please do one thing? Can you please unplug all the cables from the back of your CPU and hold the power button for 30 seconds and repack it back again? Please unplug all the cables, including the power cable as well. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:10", "end": "02:32", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:32", "end": "02:45", "text": "Thank."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:45", "end": "03:17", "text": "You. Thank you. Thank you. Thank you. Thank you. Thank it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:17", "end": "03:44", "text": "Thank. You. You. Thank. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:44", "end": "04:34", "text": "Thank you. Thank you. Thank you. Thank very much. you Thank you. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:34", "end": "04:46", "text": "Thank."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:46", "end": "05:03", "text": "You. Thank you. Thank you. Thank you. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:03", "end": "06:35", "text": "Thank. You. Very. Much. Okay. Let's. Stop."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:35", "end": "07:00", "text": "This. Another commander said. It."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:00", "end": "07:20", "text": "Ok. Thank. You. Thank. You. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:20", "end": "11:24", "text": "Ok. Thank you. Thank. You. Thank you. Thank you. Thank you. Thank you. Ok. Thank you. It's."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:24", "end": "25:51", "text": "Thank. You. Thank. You. Thank. You. Thank you so much. And *******, ma'am, are you doing? Are you doing the powdery? Hello? Hello, ma'am, is still there. Hello? Hello? Mama is still there. Are we still connected? Please let me know if you still need assistance. I've entered anything from you. Would you still like to get assistance? The ma'am. I'm still there. Yeah, ma'am. So have you done the troubleshooting?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "25:51", "end": "25:54", "text": "I still have it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "25:53", "end": "26:18", "text": "Yes, ma'am. Can you please try to reflug it back?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "26:18", "end": "26:49", "text": "Thank. You. Thank you. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "26:48", "end": "26:53", "text": "Hello. Thanks. Calling. For."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "26:53", "end": "27:23", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "27:23", "end": "27:24", "text": "Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "27:24", "end": "28:47", "text": "Thank you. Thank. You. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank. You."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "28:46", "end": "28:53", "text": "Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "28:53", "end": "29:05", "text": "Thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "29:05", "end": "29:32", "text": "You. Thank. You. Thank. You. Thank."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "29:32", "end": "31:13", "text": "You. Thank you very much. It. Thank you. Thank you. Thank you. Thank you. Thank you. Thank. You."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:12", "end": "31:30", "text": "Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:29", "end": "31:36", "text": "Hello. Hello. Hello."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:35", "end": "33:47", "text": "Please. Stay. On. The. Line. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "33:47", "end": "34:16", "text": "Thank you. Thank you. Its."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "34:16", "end": "34:34", "text": "Thank. You. Thank."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "34:34", "end": "35:11", "text": "You."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "35:10", "end": "35:50", "text": "Thank. You. Thank. You. Thank. You. Yes, ma'am. Hello."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "35:50", "end": "35:54", "text": "OK, I think I opened."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "35:53", "end": "36:02", "text": "Yeah. So you have all the cables back And can you please try to log into the AWS? Ma'am, are you able to log in?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "36:02", "end": "36:04", "text": "Yes, sir. It opened."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "36:04", "end": "36:17", "text": "OK, Perfect, ma'am. So your issue got is all right. Are you able to log in, ma'am?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "36:17", "end": "36:20", "text": "Yes, sir. It opened."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "36:20", "end": "37:00", "text": "Perfect, ma'am. So can you just please allow me a moment? I'll give a ticket number for this. So, ma'am, apart from this, is there anything else that I can help you with? Yes, ma'am. So can you please note down the ticket number? Yes, ma'am. The ticket number would be Inc. I as in India N as in November C as in Charlie. *********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "37:00", "end": "37:07", "text": "OK, that was inc. *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "37:07", "end": "37:13", "text": "Yes, ma'am. That's correct. So apart from this, is there anything else that I can help you with?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "37:13", "end": "37:14", "text": "No, sir."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "37:14", "end": "37:37", "text": "Thank you so much, ma'am. So, ma'am, I would connect you to a short survey Post this call with the first service for the customer satisfaction where you can read it on a scale of 5 to one where finance means very satisfied and the second survey for the first contract resolution wherein you can select one, which means that issue got all in the first contact. Thank you for contacting us. I have to support. Have a great day ahead. Bye, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "37:37", "end": "38:55", "text": "You too. Bye bye. Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist On today's call? Enter from the scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve press 2 if it still has not been resolved. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-839aa8cc-5496-4e25-84ac-2ffb611c8465.MP3", "name": "839aa8cc-5496-4e25-84ac-2ffb611c8465", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:06", "end": "00:12", "text": "You for contacting it? Health. Best support. This is *******. How can I assist you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:12", "end": "00:22", "text": "Good morning. My name is ***** *****, and I can't get into my computer. So it's not let me do anything at the moment."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:22", "end": "00:26", "text": "Whatever error you're facing. Exactly."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:26", "end": "00:46", "text": "So when I went to go to log in, it says just bear with me. So it says we can't find you in with this credential because your domain isn't available."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:46", "end": "00:52", "text": "Ok, do you have any ticket number regarding the issue, ma'am?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:52", "end": "00:54", "text": "Ok, No worries."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:54", "end": "01:01", "text": "Sorry for the inconvenience caused to you. I'm going to definitely help you to resolve the cancelation."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:01", "end": "01:09", "text": "Just a moment here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:09", "end": "01:11", "text": "I will first verify you. And then we are."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:11", "end": "01:19", "text": "Going to proceed further. OK, thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:18", "end": "01:24", "text": "Kindly confirm your BMS number."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:22", "end": "01:25", "text": "66."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:25", "end": "01:33", "text": "You have 6. Your full name."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:33", "end": "01:41", "text": "So it's ***** * A R I N. ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:41", "end": "01:50", "text": "You're logging in username."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:48", "end": "01:51", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:51", "end": "01:54", "text": "Calling from which country?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:54", "end": "02:10", "text": "UK. And what is your hiring month and the year? So I go to smile. Can you say that again for me?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:10", "end": "02:14", "text": "The date when you got hired for this company?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:14", "end": "02:25", "text": "I think."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:25", "end": "02:36", "text": "Just. A. Moment. Can you repeat it again? The month and the year?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:35", "end": "02:37", "text": "Sorry. Can you say that again?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:37", "end": "02:42", "text": "Can you repeat your hiring month and the year again? I'm asking."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:42", "end": "02:45", "text": "18th of August."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:45", "end": "02:49", "text": "August of which you are this year."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:48", "end": "02:49", "text": "Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:49", "end": "03:13", "text": "OK, thank you so much, ma'am. For the confirmation. So first of all, I'm going to share you the video station link for the troubleshooting that you need to join. You're working from home, right? Yes. On the same number. I'm sending it. Let me know if you're not able to receive it on the text message I will share via the email address. OK, so, of course, we'll try with the text message I'm sending you. Let me know."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:13", "end": "03:23", "text": "Whenever you are receiving it or not. All right, bear with me in the text."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:23", "end": "03:30", "text": "Yes. Can you check?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:30", "end": "03:33", "text": "I'm gonna fix it. Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:33", "end": "03:54", "text": "OK, just a minute. Please hide and the sensitive for the confidential data from the camera. OK. You need to spell out the personal email address, please."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:54", "end": "04:05", "text": "So it's ***** E V A M S here. ***** * A R I N."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:05", "end": "04:07", "text": "Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:07", "end": "04:10", "text": "At hotmail dot com."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:10", "end": "04:18", "text": "I will repeat the same. Evanscarin at hotmail dot com."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:18", "end": "04:19", "text": "That's it? Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:19", "end": "04:28", "text": "Please hide any sensitive confidential data. As I said, the link has been already shared with you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:28", "end": "04:41", "text": "Let me see. All right. Yes. I've got the link."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:41", "end": "05:12", "text": "Please join the link and access the camera."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:12", "end": "05:16", "text": "It's not letting me access the camera."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:16", "end": "05:24", "text": "You just need to click on the link and allow the camera access so it will be visible."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:24", "end": "06:20", "text": "It's not listening to me. It's not. It's not letting me do it. Just a minute. And go back in it again. Yeah, it's saying this so I can't ask for your permission. I'm not getting that either."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:20", "end": "06:35", "text": "Click on the link and you just need to allow allow notification 2 times so it will be visible for me. Ma'am, I can see you did not allow access to the camera. That's the reason why you're not saying."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:35", "end": "06:50", "text": "Yeah, it won't let me. It won't let me. It says I can't do it. So it's not that I'm not allowing you. It won't let me accept it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:50", "end": "07:10", "text": "Let me provide another link. Please wait. The another link has been already shared. Please try."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:10", "end": "08:00", "text": "All right, somebody. So again, it's not listing me. So I'm clicking on the terms of you and it's just not letting me go in it. I'm so sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:00", "end": "08:07", "text": "Click on the new link."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:07", "end": "08:17", "text": "I'm clicking on the new link and it says support channel not found."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:16", "end": "08:29", "text": "Without link. How I can assist you. Ok, let me know. Are you connected with the VPN."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:29", "end": "08:31", "text": "On your system?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:31", "end": "08:40", "text": "The right option for other user? Yeah. Are you connected with the VPN?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:40", "end": "08:44", "text": "I will repeat one moment. Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:43", "end": "08:49", "text": "Sorry. Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:48", "end": "08:53", "text": "Oh, 28 pm."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:53", "end": "09:07", "text": "Can you please reconnect again with the VPN and tell me every single small thing. Like when you click on networks, *****. I mean, which group you are selecting? Newport VPN or Slow VPN."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:07", "end": "09:19", "text": "So it's 3 PM. I'm not sure what you mean about plan CPM. It will pass on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:19", "end": "09:43", "text": "Can you please join the session, ma'am? Without that, I cannot see your PC, right? No."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:43", "end": "09:49", "text": "Let me try. Let me try one more time. It's not listing me through anything."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:49", "end": "10:04", "text": "Link is still active. I think you're doing some mistake. That's the reason you're not able to log in with that link so I can check with your PC."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:04", "end": "10:08", "text": "No, the link says, so I'll click on that link."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:08", "end": "10:12", "text": "The new link. I'm saying the new link. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:12", "end": "10:21", "text": "Then I'm clicked on the new link, and the new link says the port channel not found."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:21", "end": "10:27", "text": "Just a minute. Let me send a fresh link again."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:27", "end": "10:31", "text": "I'm so sorry. It's not. I think its may."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:31", "end": "10:43", "text": "I don't know why you're getting this. Because the link I can see you're still active. Please check for the new email now. OK?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:43", "end": "10:44", "text": "All right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:43", "end": "10:57", "text": "I'm mentioning as a new link. Can you check?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:57", "end": "11:20", "text": "Yeah, I'll just. Hold I've it. got 3 links. Yeah, thank you. It's just the same thing. So I go in the link and it says Portland. Do you have any other number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:20", "end": "11:24", "text": "Like I can send the link."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:24", "end": "11:28", "text": "But I already have this number. So. All right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:28", "end": "11:40", "text": "Then you know, you need to help me with the screenshots. Apart from this, there is no way to troubleshoot."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:40", "end": "11:41", "text": "Do you need to show me?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:41", "end": "11:53", "text": "Are you connected with the VPN? With what details? So I can guide you? Take care."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:53", "end": "12:04", "text": "Can I have a ticket number, please? Sorry. Have you got. Can you give me a ticket number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:04", "end": "12:12", "text": "I will definitely provide you the ticket number."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:12", "end": "12:15", "text": "This isn't working."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:15", "end": "12:24", "text": "I will provide you the ticket number, ma'am, but we need to troubleshoot before that. Right? Are you going to call back or what?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:24", "end": "12:26", "text": "I'm cool. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:26", "end": "12:29", "text": "Why, ma'am?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:29", "end": "12:34", "text": "I'm not going to try looking up and passing again."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:34", "end": "13:12", "text": "I'm guiding you with the girl login procedure. You first need to like we start the PcS. Then we unlock the screen. Control or delay. Right? Once we unlock the screen, we need to connect with the VPN. From right to bottom options available. There, there will be network signing option. Click on it. The pop up will open. You will select the Newport VPN. You will click on connect and you will select the group DWP only and enter your username and the password. And then you can update me if you're able to log in or not."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:11", "end": "13:18", "text": "Oh, just bear with me. Do you want me to do that? And I won't go back."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:18", "end": "13:24", "text": "You need to call, Ok, can you help me with your system unit tag number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:24", "end": "13:32", "text": "Yeah, just one moment. So t for Tommy."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:32", "end": "13:36", "text": "Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:34", "end": "13:43", "text": "***. Yeah. ***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:41", "end": "13:45", "text": "******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:44", "end": "13:52", "text": "Yeah. That's the type number."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:52", "end": "14:01", "text": "Just a minute. You will call back, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:00", "end": "14:04", "text": "Oh, OK."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:04", "end": "14:07", "text": "Note down the ticket number then."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:07", "end": "14:10", "text": "OK, can I have the ticket number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:10", "end": "14:16", "text": "Inc. *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:16", "end": "14:25", "text": "All right. Can you say that again for me? Inc."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:20", "end": "14:28", "text": "*********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:27", "end": "14:32", "text": "***. Yes. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:32", "end": "14:41", "text": "Please call back whenever you are ready for the troubleshooting. OK, is there anything else apart from this I can assist you with."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:40", "end": "14:44", "text": "By that time, thank you so much for helping."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:44", "end": "15:09", "text": "After this call, I'm going to connect you to the short survey where you will get for survey, which is for the customer satisfaction. You can read on a scale of 5 to 15 for the very satisfied second survey you will get, which is for the first contact resolution you can select. One. Which means your issue was resolved in the first contact. Thank you for contacting IP. Helpless. Have a wonderful day."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:08", "end": "15:12", "text": "Thank you so much. Thank you. Goodbye. Yes, ma'am."}]}, {"id": "audio_Call1-8469b1c0-68f5-4f43-a027-c082e8681fd5.MP3", "name": "8469b1c0-68f5-4f43-a027-c082e8681fd5", "utterances": [{"speaker": "Customer", "speaker_type": "customer", "start": "00:02", "end": "00:11", "text": "I don't know. I'm calling ID. Health. My name is ****."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:10", "end": "00:14", "text": "*******, how can I assist you today?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "00:14", "end": "00:22", "text": "Hi. This is ****. I need to change my empty login that I can contact the WAHA students."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:22", "end": "00:43", "text": "Do you want to change your anti dog and password? Yes. Okay. Okay. We will try our best to help you out. And we are really sorry for the inconvenience that has caused to you. Have you tried the self service tool for resetting your password?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "00:43", "end": "00:57", "text": "Actually. We have updated the process, so I don't know what is actually."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:57", "end": "01:00", "text": "Pardon? Me."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:00", "end": "01:06", "text": "I can change my magnetic factors."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:06", "end": "01:16", "text": "Ok, so you have tried the self service tool, but it wasn't working, right?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:15", "end": "01:18", "text": "No."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:18", "end": "01:40", "text": "Okay, Okay. No worries. It will try our best to help you out. And we are really sorry for the inconvenience that has caused to you. Can you help me with your name number that can help you with your BMI? So?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:36", "end": "01:42", "text": "**********."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:42", "end": "01:46", "text": "OK ******."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:44", "end": "01:49", "text": "*****. Yes, that's correct."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:49", "end": "01:54", "text": "Okay. Can you help me with your full name?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:53", "end": "02:00", "text": "*****. And my name is."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:59", "end": "02:07", "text": "OK. Can you help me with your manager's name or the supervisor's name?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "02:07", "end": "02:11", "text": "Can you give me this one?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:10", "end": "02:14", "text": "Pardon me."}, {"speaker": "Customer", "speaker_type": "customer", "start": "02:14", "end": "02:16", "text": "This one."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:16", "end": "02:37", "text": "Ok, Can you help me with your date of fighting? I'm. Sorry. Can you help me with your date of hiding? Higher date. The date when you started working for teleperformance."}, {"speaker": "Customer", "speaker_type": "customer", "start": "02:37", "end": "02:42", "text": "Me. ****."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:42", "end": "02:47", "text": "Ok, can you help me with your site? Location?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "02:47", "end": "02:49", "text": "2 half."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:49", "end": "03:37", "text": "Okay. Thank you for providing me all your details. We are working on your request. Kindly allow me a minute. Okay? I'm going to provide you a temporary password. So you have to change your password after the first login. And while changing the password, please do remember, the end of the password should be more than 12 directors. There should be at least one uppercase letter, one lower case letter. The medical number and special symbols also should be there. And the last 15 passwords that you have used before that will not work. And also that dictionary words will not work. Should I provide you the password now?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "03:37", "end": "03:49", "text": "OK, is it the same?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "03:49", "end": "03:57", "text": "OK, okay. The password is small E as in Echo."}, {"speaker": "Customer", "speaker_type": "customer", "start": "03:57", "end": "03:59", "text": "Small eco."}, {"speaker": "Agent", "speaker_type": "agent", "start": "03:59", "end": "04:05", "text": "Yeah, yeah. Capital C As in Charlie."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:05", "end": "04:08", "text": "Capital."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:08", "end": "04:12", "text": "Number 9."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:12", "end": "04:13", "text": "9."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:13", "end": "04:18", "text": "Capital W As in whiskey."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:18", "end": "04:23", "text": "Let me fix that out. Yeah."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:23", "end": "04:28", "text": "Capital M as in Mike."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:28", "end": "04:30", "text": "****."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:30", "end": "04:48", "text": "Capital Q As in Kobe. Number 2. Capital V As in Victor."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:48", "end": "04:51", "text": "Capital V is."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:51", "end": "04:56", "text": "Small V as in Victor."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:56", "end": "05:00", "text": "V as in Victor. Okay."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:00", "end": "05:14", "text": "Yeah, then capital X. As in X ray. Then small F as in Foxtrot."}, {"speaker": "Customer", "speaker_type": "customer", "start": "05:14", "end": "05:19", "text": "S for Doctor. I'm sorry S for doctor."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:19", "end": "05:28", "text": "Yeah. So let me repeat the password again. Small E as in Echo Capital C as in Charlie number 9."}, {"speaker": "Customer", "speaker_type": "customer", "start": "05:28", "end": "05:29", "text": "Yeah, yeah."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:29", "end": "05:31", "text": "Please go on."}, {"speaker": "Customer", "speaker_type": "customer", "start": "05:31", "end": "06:05", "text": "Ok, I repeat E for Echo T for Charlie number 9, Capital W for water M for Y T for Quebec 2 and capital G for victory and small B for D 3 again and then X for X, Capital X for x entry and class 4 equal ***."}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:05", "end": "06:14", "text": "Ok, before 2. As in tubic, there is one more alphabet Capital H for hotel."}, {"speaker": "Customer", "speaker_type": "customer", "start": "06:14", "end": "06:20", "text": "I'm sorry. I didn't think that the NQ 2."}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:20", "end": "06:31", "text": "Before Q, like Q, as in cubic. Before that, there is an alphabet that is capital H as in hotel."}, {"speaker": "Customer", "speaker_type": "customer", "start": "06:31", "end": "06:51", "text": "Capital H I repeat for Echo Capital charge 9 Mendel, partner for Watermelon N. Capital N for Mike and HP. Also, thank you for tubing. Mmhmm."}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:51", "end": "06:55", "text": "Yes, Yes."}, {"speaker": "Customer", "speaker_type": "customer", "start": "06:55", "end": "07:09", "text": "And then 4 and then Victory capital and then small victory, then x 4 x rays, then x 4 boxes."}, {"speaker": "Agent", "speaker_type": "agent", "start": "07:09", "end": "07:15", "text": "Yeah, that's right. Do you need any further assistance about from this?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:15", "end": "07:19", "text": "Nothing is. I just need the patient to answer that."}, {"speaker": "Agent", "speaker_type": "agent", "start": "07:19", "end": "07:29", "text": "Ok, let me know once you are able to log in so that I can provide you the past the ticket number for this call."}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:29", "end": "08:12", "text": "Ok, I trade the password. Ok. Thank."}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:12", "end": "08:14", "text": "You. So. Much."}, {"speaker": "Customer", "speaker_type": "customer", "start": "08:14", "end": "08:41", "text": "Please continue to hold. Your business is important to us. Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:41", "end": "08:47", "text": "All. Right."}, {"speaker": "Customer", "speaker_type": "customer", "start": "08:47", "end": "08:48", "text": "Thank you for being online."}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:48", "end": "08:51", "text": "Is it working?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "08:51", "end": "08:57", "text": "What should I put here in the current password? My old password or."}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:57", "end": "09:00", "text": "The password which I gave you."}, {"speaker": "Customer", "speaker_type": "customer", "start": "09:00", "end": "09:02", "text": "The current password."}, {"speaker": "Agent", "speaker_type": "agent", "start": "09:02", "end": "09:06", "text": "Will be the password that I gave you."}, {"speaker": "Customer", "speaker_type": "customer", "start": "09:05", "end": "09:09", "text": "Ok, Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "09:08", "end": "09:25", "text": "Ok."}, {"speaker": "Customer", "speaker_type": "customer", "start": "09:25", "end": "10:55", "text": "It. OK, Thank much. very you Please continue to hold. Your us. to important is business I'm not going She now. anything charge to you said. Thank you. Thank you. It. Thank."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:55", "end": "10:59", "text": "You for being online? Is it working?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "10:59", "end": "11:02", "text": "Yes. Thank you so much."}, {"speaker": "Agent", "speaker_type": "agent", "start": "11:02", "end": "11:10", "text": "You're most welcome. And please note down the ticket. Do you need any further assistance? Apart from this?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "11:10", "end": "11:12", "text": "Nothing else. Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "11:11", "end": "11:27", "text": "Ok, The ticket number is R for Romeo. E for Echo Q for Quebec. **********."}, {"speaker": "Customer", "speaker_type": "customer", "start": "11:27", "end": "11:31", "text": "Mmhmm. Thank you. And I will put you on Romeo."}, {"speaker": "Agent", "speaker_type": "agent", "start": "11:31", "end": "11:35", "text": "Yeah, please go on. I'm sorry."}, {"speaker": "Customer", "speaker_type": "customer", "start": "11:35", "end": "11:44", "text": "I repeat R for Romeo. E for Echo Q for Q. ********."}, {"speaker": "Agent", "speaker_type": "agent", "start": "11:43", "end": "12:14", "text": "Yeah, that's right. And I will put you on a short survey after this call where the first survey will be for the customer satisfaction where you can read on a scale of one to 5, wherein 5 means very satisfied. And the second survey will be for the first contacted solution where you can select one if they issue us resolve within the first contact. Thank you for calling it helpex. Have a nice day."}, {"speaker": "Customer", "speaker_type": "customer", "start": "12:14", "end": "12:15", "text": "Thank you so much."}, {"speaker": "Agent", "speaker_type": "agent", "start": "12:15", "end": "12:22", "text": "You're most welcome."}, {"speaker": "Customer", "speaker_type": "customer", "start": "12:21", "end": "13:15", "text": "Thanks for giving us a few minutes of your time to complete the IT HelpDesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist On today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2, if it still has not been resolved, press 3. Fantastic. This time, enter your response using a scale of one to 7. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-8ad0b68d-3279-4cb7-b81e-58dc53735894.MP3", "name": "8ad0b68d-3279-4cb7-b81e-58dc53735894", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:09", "end": "00:15", "text": "You for contacting it? Health desk. My name is *****. How may I help you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:15", "end": "00:22", "text": "Hi, *****. I can't connect to be able to get. And that's why I'm calling you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:22", "end": "00:31", "text": "Ok, so sorry for the inconvenience, ma'am. May I know. Is there any other you're getting on the screen while connecting a global product? Well, let's."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:30", "end": "00:52", "text": "Yeah. So connection failed. The root tool adapter was not set up correctly due to a deal was protected soon. If the issue versus try restarting your system. I tried that. I tried restarting the system twice. Yeah, it's still showing the same."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:52", "end": "00:58", "text": "Ok, so still, you're getting the same, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:58", "end": "01:19", "text": "Just a moment. Sorry. Yeah, that was the error that was showing me a couple of times, even after restarting the system. So I just tried it again. Yeah, it's still the same. It just keeps loading, but nothing's happening."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:19", "end": "01:29", "text": "Ok, so sorry for the inconvenience, ma'am. I haven't tried to resolve an issue. Can you please help me with your BMS number? Your employer ID."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:28", "end": "01:34", "text": "Yeah, it's *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:33", "end": "02:02", "text": "Ok, so it will take me a moment to review information. May I put you a on hold for the same?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:02", "end": "02:13", "text": "That's so funny."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:13", "end": "03:00", "text": "I'm. Yeah. Thank you so much for being on hold. Hello?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:59", "end": "03:00", "text": "Yeah, sure."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:00", "end": "03:06", "text": "Go ahead. Yeah. May I know your name, please? Your first and last name for verification?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:06", "end": "03:12", "text": "Yeah, absolutely. So it should be unaccounted or XXXA."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:12", "end": "03:17", "text": "Yeah, that's correct. And who is the supervisor?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:17", "end": "03:20", "text": "Its nausea."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:20", "end": "03:24", "text": "And let me know you're hiring it, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:24", "end": "03:26", "text": "I'm sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:26", "end": "03:30", "text": "May I know your hiring date?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:29", "end": "03:42", "text": "My hiring date? Well, that was, uh, the day I started was May 12, ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:41", "end": "03:52", "text": "But it's not 12, ma'am. So can you please reconfirm the month and year once again, what is the month and year?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:51", "end": "03:55", "text": "May **** ** April 2025?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:55", "end": "04:03", "text": "No, it's not. April. May is correct. And let you know your job description, please."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:02", "end": "04:09", "text": "Oh, just a moment. I am Customer relations."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:09", "end": "04:27", "text": "Ok, and help me with your site, location, your office location. Ok, thank you so much for providing this information. And I just want to confirm that your username will be jagged dot 4 5, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:27", "end": "04:29", "text": "Yes, that's correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:29", "end": "04:38", "text": "OK, ma'am. And may I know what is the username for your global product?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:37", "end": "04:41", "text": "Username for my global product? What you need."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:41", "end": "04:50", "text": "What credentials are you are using to connect your global Protect. What username and password are you using to get in?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:50", "end": "05:02", "text": "Oh, that would be my. The VW email and password."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:01", "end": "05:08", "text": "What is the email, ma'am? What email are you entering your global?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:07", "end": "05:15", "text": "Yeah. Extern dot annoped. ****** at a w dot."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:15", "end": "05:26", "text": "Ok, so, yeah, you're not using jugs dot 45 at teleperformance Username teleperformance usa dot com. It has a different username, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:26", "end": "05:35", "text": "Yes. So for global protect, we use VW."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:35", "end": "06:24", "text": "Okay, thank you for providing this information. Just give me a moment. I'm looking at the account. Yeah, thank you for being online. So can you just help me with the error message again? What is the error you're getting there on your screen?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:23", "end": "06:41", "text": "Okay, so the error message connection failed. The virtual adapter was not set up correctly due to a delay. Global product will try again soon if the issue says by restarting your system."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:40", "end": "06:55", "text": "Ok, so you're getting added that the connection has been failed and the virtual adapter was not set up due to delay. Can you please reconfirm it once again? Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:55", "end": "06:58", "text": "Yes, that's correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:57", "end": "07:02", "text": "That's correct. Can you please reconfirm the added once again, ma'am?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:02", "end": "07:16", "text": "Yeah, Okay, so it says connection failed. The virtual adapter was not set up correctly due to a deal. Local protect will try again soon. If the issue processes, try restarting your system."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:16", "end": "07:59", "text": "And you have restarted your system for multiple times, right? OK, so just do that, ma'am. Perform the power drain once. So just plug out every cable from your CPU. Plug out the line cable, the power cable and everything, every cable from your CPU. Then click on the CPU power button for 25 to 30 seconds. Just do a long quest for 30 seconds, then release it and wait for 34 minutes. And then try to log. Assemble all the cables again and then try to log in again in a system and check whether you're getting the same error or not. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:59", "end": "08:09", "text": "So you want me to restart it by after disconnecting everything and connecting it back, right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:09", "end": "08:20", "text": "Yeah. OK, I'm so sorry for the inconvenience causing you, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:20", "end": "09:40", "text": "This is fine to help you. I do appreciate it. Everything. Like how disconnected everything. I'm not taking my attention. No. Breakfast."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:39", "end": "09:46", "text": "Let's. See?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:46", "end": "10:37", "text": "When we started. Here. OK, so I have restarted the system. Ok, let me try. Let me try to go back again."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:36", "end": "10:55", "text": "OK, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:55", "end": "11:23", "text": "Okay. Okay. So it looks like it has connected."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:23", "end": "12:03", "text": "OK, it's working fine now. OK, check it properly. Let me know, ma'am. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:03", "end": "13:00", "text": "OK. So it looks like everything is working perfect."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:00", "end": "13:13", "text": "OK, so it's working fine. Perfect. Now it's working fine. Yes. OK, ma'am. So, is there anything else I can do to help you other than this?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:13", "end": "13:16", "text": "That's it. May I please get the ticket number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:16", "end": "15:26", "text": "Yeah, just hold on. I'll provide you a ticket number for the same. OK, give me a moment, please. Hello. Thanks. For. Calling. Thank you so much for being online. Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:26", "end": "15:30", "text": "Yes, please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:29", "end": "15:35", "text": "Yeah. So please note down the ticket number, ma'am. Are you ready?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:34", "end": "15:39", "text": "Yes. I'm ready."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:39", "end": "16:17", "text": "You for being online? Let me know once you're ready, please go ahead. Yeah. So the ticket number will be. I as in India N as in November C as in Charlie. *********. I repeat. Inc. *********. Did you get it? Yes. Ok, And is there anything else I can do to help you? Apart from this?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:17", "end": "16:20", "text": "No, that actually."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:20", "end": "16:56", "text": "OK, ma'am. So post this call. I'll connect you to a short survey where you can date our services on a scale of 5 to one where 5 is very satisfied in the first survey. And in the second survey you can select one here. In the second survey, one means your issue has been resolved in first content. So before disconnecting the call, just listen to the ivy carefully and please provide us good rating. The survey really matters for me for this month. So please attempt the survey. I'm requesting to you and thank you for contacting. It helps Have a great day and goodbye. And please attempt the survey member. Bye."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:56", "end": "18:38", "text": "Of course. Thank you so much. Bye. Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from the scale of one to 5 with 5 being very satisfied and one thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. We did not get your response. Please try again this time. Enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-8e892bd8-2b1e-48cf-bcb1-a294373e893a.MP3", "name": "8e892bd8-2b1e-48cf-bcb1-a294373e893a", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:07", "end": "01:06", "text": "Thank you for calling ID home support. My name is ****. How can I help? Hi. Good morning. I've been looking at the response regarding with my speaking news because it's not working. Ok, I'm really sorry about the inconvenience which has caused it to you, but you. Don't worry. I'm here to help you out, and I just. I want to verify your profile information. So could you please help me with your CCMS or your employee ID, please? Yeah. So. Could you help me with your full name? Your first and the last name? Yeah. So my full name is **** ******. OK, **** ****, It may take me a moment to review your profile information. Can you just stay online for a moment?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:05", "end": "01:53", "text": "Thank you. Thank much. very you Its."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:53", "end": "03:56", "text": "So much for staying connected. Marios, can I confirm your issue that your CPU is not working? Am I right? Yeah, it's not working. There isn't a line with it Since how long have you been noticing this issue? Like an hour ago? An hour ago? Yeah, the light is flashing, right? Yes. I'm just saying if there's any right now, Ok, and may I know, are you a VPN user or a video user. With the end? What is that window? Yeah, the windows. Ok, and also does, your CPO is giving the beat sound or it is not giving any sound. There is a ripping sound, Ok, And also, you can see the light right on the power button. Yes. Yes, I can see the flower box one, but it goes off for. I'm really sorry about the inconvenience, ****, which has caused it to you. But don't worry, I'll try to fix your problem. Yeah. ****, I'll send you a video session link to your phone number. Just click on the link and join the session by allowing the camera permissions. And remember, before giving you the remote session, please close or minimize if you have opened any confidential information on your system. Ok, thank you. Hold on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:56", "end": "04:21", "text": "Please. line. the on Stay"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:21", "end": "04:34", "text": "Or can you try to send it in my email?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:34", "end": "04:37", "text": "Hello?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:36", "end": "05:29", "text": "Yes, ****. So before sending you the link, I need your contact number. Could you please help me with your phone number? Can I just provide you my email address? Sorry. Can I just provide you my email? Yes, but before I do it, generate the verification link. I need your contact number. Could you please help me with your phone number? Uh, OK. ***********. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:29", "end": "06:22", "text": "Me. Thank. You. Thank. You. Thank. You. Thank. You. Thank you. Thank you. Thank you. Thank you. Thank you. It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:22", "end": "06:58", "text": "Can I have your email address, please? Yeah, my email is M. My last name is *****@*****.***. Ok, the letter M for Mike and *****@*****.***, right? Yes. OK. Let me send a link."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:57", "end": "07:31", "text": "Hello. I don't know how that logs. Hello. Hello. Thanks having me. for Thank you. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:30", "end": "08:12", "text": "Yes. I received an email right now. Let me just connect. Yeah. Here we are now connected."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:12", "end": "08:15", "text": "Hello?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:15", "end": "09:08", "text": "Yes. I have just sent the link. Yeah, yeah. Now I can able to see it. I'm so sorry. It was going to automatically let me just take the screenshot of it. Hello. I'm getting the background noise from your side. Yeah, no, it is. OK. Can you do one thing? Can you just perform a hard reboot like press and hold the power button of your CPU for 30 seconds and release and again, turn on the CPU. Since I already did that, by the way, but that's how I was going to show you. ***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:07", "end": "09:14", "text": "11. It's the same."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:13", "end": "09:25", "text": "Yeah. Just perform a hard reboot, press and hold the power button of your CPU for 30 seconds and release And again, turn on the CPU."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:25", "end": "09:28", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:28", "end": "09:42", "text": "Yeah, I want to do. I would discuss it again. I'm so sorry, ma'am. Your voice is getting very low. Could you please speak loudly?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:42", "end": "09:44", "text": "Give you a refrigerator."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:44", "end": "11:21", "text": "Even if I already. I'm so sorry. I'm still getting some. Did you perform the hard reboot by pressing on holding the power button of this? Yes, sir. I'm done. Yeah, it's done. Ok, can you do one thing? Can you just remove all the cables from the back of your CPU and just wait for at least 2 minutes after 2 minutes, reflect all the cables back and check how it works for a moment. Sure, you can keep down your phone and you can do it. First. Turn off the CPU and wait. Yeah, no problem. I want to talk to you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:21", "end": "11:30", "text": "Hello. Welcome. To. My. Lecture."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:30", "end": "11:45", "text": "For 2 minutes, right? Yes. For 2 minutes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:39", "end": "12:52", "text": "Hello. Welcome to my lecture. Thank you. Very much. Hello. Thanks for calling."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:52", "end": "13:22", "text": "You can all the cables back to your CPU. Now. What's that? Yeah. You can replug all the cables back to your CPU. OK, for a moment. Sure. One."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:22", "end": "14:45", "text": "It. Thank you. Thank. You. Hello. lecture. my Welcome to Thank you. Thank you. It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:45", "end": "15:23", "text": "Um, turn it on. OK? Yeah. Turn on the CPU power, but I'm not working. It's still flashing. OK, could you just press and hold the power button of your CPU for 30 seconds and release? Could you just do it and let me know. Because you already didn't perform this before. So that's what I'm asking you to do."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:23", "end": "15:41", "text": "It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:40", "end": "17:29", "text": "Ok, OK, please. And then turn it on, right? Yeah. It's just the same. It's the same. It's still. It's not blinking, right? And there is no beat sound coming from the CPO, right? Yeah. There is a big sound when it sounds the light flush. Ok, can you show me the tag number of this CPU? Can you show me? Ok? Yeah. Let me take this claim short of this, but mostly your CP goes for the replacement only. But let me just escalate your issue with my level team. Ok? Yeah, Yeah. Have you already captured that? Yeah, I'm done with the capturing the pictures of."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:22", "end": "20:49", "text": "It's. Thank you. Thank you. Thank you. Thank you. Thank you. Please. Continue to hold. Your call is important to us."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:49", "end": "21:10", "text": "Thank you so much for staying in. I really appreciate your time and patience, and I have just escalated your issue with my level 2 team. I'm just waiting for their response. Once any response from them, I'll just let you know. Could you please take for a few minutes? Hello? Hello?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:09", "end": "21:11", "text": "Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:11", "end": "21:52", "text": "I'm here to take your time. Yeah, yeah, sure. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:52", "end": "24:01", "text": "Thank you. Thank you. Thank you. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "24:01", "end": "24:40", "text": "Thank you so much for staying connected. Could you please power drain your PC and test again and also just make sure all the cables are properly connected or not? Yes. Multiples are properly connected. Hello? Yes, yes. Just a minute. I'm just updating to my leveling, OK?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "24:40", "end": "25:07", "text": "Thank you. Thank you. It's not going to happen. Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "25:07", "end": "26:10", "text": "Could you please do one thing? Could you please remove the power cable from your PC and you just reluct bag it again and check how it works And also just make sure all the cables are connected properly or not. And just let me know if even after doing this, the issue continues. Just let me know. I'll just go for the replacement. Yeah. Thank you. All right. No problem. Take your time."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "26:04", "end": "26:33", "text": "Its."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "26:33", "end": "26:40", "text": "Yeah, I tried this also. It's just the same. OK, it's still the same."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "26:40", "end": "28:08", "text": "Yeah. Thank. You. You. Thank. You. You. Thank. Thank. Thank. You. Thank. You. Thank. You. Thank. You. You. Thank. Thank. You. Thank. You. Thank. You its."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "28:08", "end": "28:40", "text": "Thank you so much for staying connected. I really appreciated your time and patience. Can you then on the camera and show me at the back of your CPU by removing all the cables. We already removed that. Just show me at the back row of your CPU. Turn on the camera and show me."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "28:39", "end": "28:47", "text": "Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "28:47", "end": "29:14", "text": "Here in my table. Next. Can you remove all the cables and show me the ports? I'll take the screenshot. Remove every cable from that CPU and show me only the ports."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "29:14", "end": "29:46", "text": "That's going to be. Good. Thank. You. It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "29:46", "end": "30:21", "text": "OK. Is it 9? Yes. Yes. Yeah. It's done. If I need anything else, I'll just ask you later. You can turn off the camera now. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "30:21", "end": "39:11", "text": "It. Thank you. Thank you. Thank you. Thank you. you. Thank Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. It's. you. you. Thank Thank Thank you. Thank. You. Thank. You. Thank. You. You. Thank you. you. Thank Thank you. Thank you. Thank you. It's its. Thank. Thank. Thank. You. Thank. You. You. You. Thank you. Thank you. Thank you. Thank you. Thank. You. Thank. You. Thank. Thank. You. Thank. You. Thank. You. Thank. You. Thank. You. Thank. You. Thank. You. Thank. Thank you. Thank you. Thank you. Thank you. Thank. Thank. You. Thank you. you. Thank you. Thank Thank you. It's. Thank you. Thank you. Thank you. Its. You. Thank. Thank. You. Thank. You. Thank. You. Thank. You. Its. It. OK. Thank. Much. Very. You. Thank you. Thank you. Thank you. Thank you. Thank you. you. Thank you. Thank you. Thank Thank you. Its."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "39:10", "end": "40:05", "text": "Hello. Yes. I'm still there. I'm creating a replacement ticket for you. Ok, so once I have done with the replacement or ticket, I'll just let you know. Ok, could you please bear with me a few minutes, please? Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "40:01", "end": "40:44", "text": "Its."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "40:44", "end": "43:29", "text": "So much for staying connected. I really appreciated your time and patience. And I have this talk done with creating a ticket for USC replacement. We'll be delivering to the shipping address which is mentioned on the BMS. And I just want to confirm with you like, is it lower you say ****. Philippines. Is this right? Yes. I've lowered this. Yes. OK, And what's your contact number? Is it **********. Yes. That's correct. Ok. And also, the replacement team will contact you shortly and they will update you the details of your CP one. Ok, and also regarding this will be, can I have the recent ticket? Yeah, sure. Are you ready to note down the ticket number? Yes. Go ahead. Yeah. It's Inc, India. Nancy. Charlie. ********. Yeah. And also, you will be getting an email regarding the replacement and you can check the replacement updates over the email. OK, All right. Thank you so much for anything, Ok, And also, apart from this, is there anything else that you need assistance from me? Thank you so much. You're welcome. You're welcome. And I'll connect you to a short survey Post this call where the first survey is for customer satisfaction on your scale of 5 to one Finance. Very satisfied. And the second survey is for us to contact resolution wherein you can select one, which means your issue was resolved in first contact. Thank you for contacting ID. Home support. Have a great day. Bye bye. Yeah. Goodbye. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "43:28", "end": "43:29", "text": "Thank."}]}, {"id": "audio_Call1-90ca4a66-2fb8-45ab-8467-a59eeb2101d5.MP3", "name": "90ca4a66-2fb8-45ab-8467-a59eeb2101d5", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:08", "end": "00:14", "text": "Thank you for having your idea. My name is *****. How can I help you?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:14", "end": "00:30", "text": "Hello. Good morning. I need help to sign into my Microsoft authenticator, but I can't proceed because I'm unable to get the code in. Can you help me?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:30", "end": "00:34", "text": "So you need to set up the data app, right?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:34", "end": "00:35", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:35", "end": "00:41", "text": "So is it the first time you are trying to set up by MFA alternative?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:41", "end": "00:43", "text": "I'm sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:43", "end": "00:55", "text": "Is it the first time you are trying to set up the authenticator? No. So have you recently changed your phone?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:55", "end": "00:57", "text": "Yeah, I did."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:57", "end": "01:04", "text": "Okay, Okay, so after ending the phone, you have not set up the MFS yet, right?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:04", "end": "01:06", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:05", "end": "01:17", "text": "Okay. Okay, I will. Charlotte, is she regarding the same? Sorry for the inconvenience your face. Please confirm your name and your bars ident."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:15", "end": "01:21", "text": "***** **** *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:21", "end": "01:29", "text": "Okay, thank you so much for that information. So it may take a moment to review information from my end. May I put you on more for the same?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:29", "end": "01:30", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:30", "end": "02:26", "text": "Thank you. Thank you so much for your patience. So for providing that for you that I'm set up. I need to authenticate you with some security questions. So can I proceed with that? So your first question is, what is your higher month and EU in this company?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:26", "end": "02:29", "text": "Higher month and year?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:29", "end": "02:32", "text": "Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:32", "end": "02:35", "text": "July ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:34", "end": "02:38", "text": "Ok, what is your manager name?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:38", "end": "02:41", "text": "Please stop me. Blank."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:40", "end": "02:47", "text": "Okay. What is your location? Philippines. Okay. Authentication."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:47", "end": "02:52", "text": "Is done. Now. Please dial up on the authenticator app on your phone."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:52", "end": "02:55", "text": "It. Ok, hold on."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:54", "end": "03:17", "text": "Ok, and let me know I can earlier. Sorry. Do you want me to?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:17", "end": "03:22", "text": "Okay, I have it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:21", "end": "03:44", "text": "Okay, please open the authenticator app and click on the plus sign on the top right side and then add or add. Work on school and pick on sign ins. After on sign in your."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:44", "end": "03:46", "text": "Signature."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:46", "end": "04:13", "text": "Mono. After clicking on the plus sign on the top price side, add work with a school and take on sign in. After that, it is asking for your username. Username means you're a anti at teleperformance usa dot com. Ok. Ok. Hold. On. So after I asking for password, so please don't do anything. I am going to provide you the password. Okay?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:12", "end": "04:15", "text": "Okay. Hold on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:14", "end": "04:24", "text": "Okay. May I have one chair on the password page?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:24", "end": "04:27", "text": "Okay, I'm on the back."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:26", "end": "04:34", "text": "Okay, please stay on the line. I'm going to check with the ****. Thank you. Don't do anything. Okay, please wait."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:34", "end": "04:52", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:51", "end": "05:36", "text": "Thank you. Hello. Hello."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:36", "end": "05:52", "text": "Hey. You're. Welcome."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:52", "end": "06:23", "text": "Please. hold. to Continue Your business is important to us."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:23", "end": "06:32", "text": "Thank you so much for your patience on the line. I was still waiting for the response for ******. So please stay on the line. Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:32", "end": "07:46", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:45", "end": "08:49", "text": "If you stay on the line, I was still waiting for the team. So allow me one moment. Thank you so much for your patience. So please write on the password without grade for you. Are you ready?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:49", "end": "08:50", "text": "Yeah. Go ahead."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:50", "end": "10:02", "text": "Okay, so it is uppercase C as in Charlie. Your guess U as in uniform. Your guess E as in Echo. Dollar sign. Uppercase V as in rich. Uppercase Y as in Yankee. Clogis N as in Nancy Lorgis D as in Delta uppercase K as in Kilo. Locus S as in Sam. Uppercase F as in Foxtrot. Uppercase H is an hotel. So try to *****. After that, click on sign in and next step is to select, Continue and register it off right? You will get the pop up. Your account will be added successfully."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:02", "end": "10:55", "text": "To let me know. After I use the password, it shows the password is incorrect. If I don't remember, I should reset."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:55", "end": "11:05", "text": "Please enter the password again carefully."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:05", "end": "11:30", "text": "Just to be sure, it's upper Charlie. Lower key uniform. Lower key Echo dollar sign and then uppercase ******. Upper key. Yankee lowercase. Lower case. Delta. Uppercase below. Lower case Sierra uppercase. Foxtrot."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:30", "end": "11:39", "text": "And upper Lord? S as in Sam."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:38", "end": "11:51", "text": "Yeah, that's after the uppercase kilo. Right lowercase plan and then upper keys Foxtrot uppercase hotels."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:51", "end": "12:18", "text": "All right, allow me one moment, ***** * of N Sam and then F Foxtrot and hotel in operas. Under the password cared fully. After that. Click on a skip and then next to sort of continue and register it. After that, you will begin. You will get a pop on your account where you're successful. You didn't let me know."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:18", "end": "12:20", "text": "Okay, hold on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:20", "end": "12:25", "text": "Sure."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:25", "end": "12:29", "text": "The special character is a dollar sign, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:29", "end": "12:54", "text": "Dollar sign, dollar sign. thank. Ok, You."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:53", "end": "12:59", "text": "It still shows the same thing as AI took the password before I submitted."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:59", "end": "13:10", "text": "Okay, I'm going to send you a receipt on your phone. It is only for extinct your phone Cabra for checking on the exact issue with your facing. Could you please provide me your contact number?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:10", "end": "13:15", "text": "Contact number is ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:15", "end": "13:16", "text": "4."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:15", "end": "13:21", "text": "Oh, *****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:20", "end": "13:22", "text": "Okay, I appreciate an."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:22", "end": "13:33", "text": "Limb on our phone. You will get an SFS. Then take on the link, call our camera and show me your system and you can close off the city details. Open new your system."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:33", "end": "13:37", "text": "Would it work if I'm using my phone to log into the authenticity?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:37", "end": "14:17", "text": "Yes, yes, yes. Log in on join, Click on the link and show me your system and make sure that **** has any sensitive details of it."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:17", "end": "14:21", "text": "I'm sorry. How can I do like the other?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:21", "end": "14:36", "text": "So many screens. Monitor screens. So may I monitor the screen?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:36", "end": "14:41", "text": "This is ******* *****. This is the laptop screen."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:41", "end": "14:52", "text": "So is that the company provided, right? Sorry. This is the unrevariative company, right?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:52", "end": "14:54", "text": "Yeah, this is the company lab. Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:54", "end": "15:19", "text": "Yeah. Okay. Okay. Reboot your system. Reward your laptop. Are you a user? Are ADI user? Are you a VPN user or a VDI user?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:19", "end": "15:21", "text": "VPN?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:21", "end": "18:21", "text": "Okay, so after once your sister may recited, please connect the VPN with this password, The one which I provided to you. Okay. Hello. Welcome. Lecture. To. My. Can I do the repeat and enter this password which I provided you? to Can I get a first? I'm. An. Audible. Hello. Are we connected? You please connect to the VPN. So at the bottom right side of the system one. Put your phone closer to the system. Yes. Can the VPN."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:21", "end": "18:25", "text": "Here? I'll use my NP, right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:25", "end": "18:30", "text": "No, I'm not able to see editing rate. Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:30", "end": "18:53", "text": "Okay, hold on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:53", "end": "20:13", "text": "Oh, I am ****. Password, which I have provided to you. Upper case C as in Charlie password. Lower case U as in uniform lorgis E as in echo dollar sign uppercase V as in Victor uppercase Y as in Yankee lorgis N as in Nancy Locusts D as in Hinto uppercase K as in Kilo logs S as in Sam uppercase F as in Foxtrot uppercase edges and hotels. Now click on show password and show me your screen. Show me your screen. Great. Click on sign in."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:13", "end": "20:16", "text": "It shows connected."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:16", "end": "20:22", "text": "Ok, now I'll log into your system."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:22", "end": "20:23", "text": "Back."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:23", "end": "20:33", "text": "Yes. Ok, and the username and this password which I have provided to you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:33", "end": "20:53", "text": "Ok, let's see."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:53", "end": "21:46", "text": "There's one eyewitten so that I can see. Cub dollars sign U Y N D E K S f. Okay, now and click on idolatry on Idol. Yes, click on it. Take one. Okay, again, E S P. I don't. Sales P I N. Yep. Say the same password again."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:46", "end": "21:52", "text": "That is fine."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:52", "end": "22:30", "text": "Can I check? I wrote so that I can check. Because I wrote it. Semi."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:29", "end": "22:33", "text": "Do you need to put up Performance USA here?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:33", "end": "22:37", "text": "Yes. Yes. Try."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:36", "end": "22:42", "text": "Ok, let me try."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:42", "end": "22:49", "text": "Yes, I'm in Durham."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:48", "end": "22:59", "text": "And then turn the password again."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:59", "end": "23:02", "text": "Thank. You."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:02", "end": "23:06", "text": "Can you have the 8 digit?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:05", "end": "23:13", "text": "Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:13", "end": "23:17", "text": "Yes, ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:17", "end": "23:28", "text": "For restart You saw again."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:28", "end": "23:32", "text": "Should I try again?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:32", "end": "23:41", "text": "Restart your system and then buy again. Restart your system, Connect to the VPN and then chest. Yep."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:41", "end": "23:46", "text": "I'm still connected."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:45", "end": "23:49", "text": "Restart your system."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:49", "end": "26:04", "text": "It's hard see. to"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "26:04", "end": "26:20", "text": "Thanks. For. Calling."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "26:20", "end": "26:23", "text": "What do I mean?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "26:23", "end": "29:35", "text": "Now connect to the VPN first with the same password. Connect to the VPN with the same password. Pick on show so that I can check. Yes. Pick on signing spears. Sign in. Okay, now bath and rub into windows with the same password. Coupon. And enters. And password. Now click on ARO. Stay on the line. Let me deal with a D."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "29:35", "end": "29:39", "text": "Want me to try it then?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "29:39", "end": "31:28", "text": "Please stay on the line. I'm checking with the team. Please click and test and provide me the host name of your system. Click. Enter the Pass the login screen show with the login screen. I need the horse's name. Click on. How do I sign into Adomen? Now? How do I sign into a Roman? How do I sign into another room? Allow me one moment. Yeah. When I."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "31:28", "end": "31:58", "text": "Click this. These 2 options appear. Should I sign in?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:58", "end": "32:06", "text": "How do I sign into another domain?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "32:05", "end": "32:11", "text": "I click there. Ok, And this is what appears."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:11", "end": "32:20", "text": "Click on how? Click on again. How do I sign into another Roman?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "32:20", "end": "32:27", "text": "I click this again. Shows the same page."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:27", "end": "32:40", "text": "Okay. Wait. This system restore the company, right? This is a company provided to some orders. None."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "32:40", "end": "32:44", "text": "Yeah, this is our company issue equipment."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:44", "end": "33:07", "text": "This. Okay. Okay. Okay, *****, one moment. Do you have one other system?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "33:07", "end": "33:09", "text": "They do this again?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "33:09", "end": "33:50", "text": "No, wait."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "33:50", "end": "33:54", "text": "You want me to try signing and using my old password?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "33:54", "end": "33:59", "text": "No, please just stay on the line. I'm checking with the team. Don't do anything."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "33:59", "end": "34:10", "text": "Ok. May I know?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "34:10", "end": "34:13", "text": "Have you recently changed your password?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "34:13", "end": "34:17", "text": "It? No. Ok, try to sign."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "34:17", "end": "34:22", "text": "With our old password once and then let me know."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "34:21", "end": "36:32", "text": "Ok. Hello. Welcome to my lecture. You're. Welcome. Thanks having me. for You're. Welcome. Thanks for calling. Thank you. You're welcome. Hello. Welcome lecture. to my You're. Welcome. It's no place as well."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "36:31", "end": "36:36", "text": "Yeah, I was able to bug in using my old password."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "36:36", "end": "36:38", "text": "Ok, so you can use the same password."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "36:38", "end": "36:41", "text": "Ok?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "36:41", "end": "36:48", "text": "Yeah, I can use that, but I cannot access the authenticator."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "36:48", "end": "37:02", "text": "Now you're able to access your indication about don't need to set up. You don't need to set up an data. It is already set up using your laptop. Ok."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "37:02", "end": "37:14", "text": "Okay, so I'm about to future use it because it always requires our authentication to factor using the it is already."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "37:14", "end": "37:19", "text": "No, you don't need to set up again. It is already set up."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "37:18", "end": "37:21", "text": "Okay, let me check."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "37:20", "end": "37:35", "text": "Okay, sure. And you don't need to set up again. Non memo check as well. I have already set up from the laptop. Okay, so just the ticket number. Are you ready for the ticket?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "37:34", "end": "37:36", "text": "Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "37:36", "end": "38:03", "text": "So it is, I as in India N as in Nancy C. As in Charlie. ****. 2. ***** ****** it. So right now, apart from this, is there anything else I can help you with?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "38:03", "end": "38:06", "text": "Okay, just one moment. Hold on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "38:05", "end": "38:40", "text": "Okay, I'm afraid that it is already done because once you've connected, a repeat is asking for temporary. Yes. So it is done. No need to set up a deal on the phone. Okay, so I will connect you shortly. Okay, that is great. So I will connect you to the short survey. Post this call. We're in the first service for the customer action, and you can wait on the scale of *** means either aside and the second service for the false contact resolution when you can select one, which means you ensure everyone in the false contact. Thank you for calling. Ideal Texaco. Have a great."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "38:39", "end": "39:24", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve press 2. If it still has not been resolved, press 3."}]}, {"id": "audio_Call1-9175cecd-74bf-48a2-95c9-29f5c6e48fc2.MP3", "name": "9175cecd-74bf-48a2-95c9-29f5c6e48fc2", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:06", "end": "00:48", "text": "You for calling it health support. My name is *******. How can I help you today? Hey, can you hear me? Yes, I can hear you. I'm going to my VCN. Keep disconnecting and reconnecting. So you are unable to connect your VPN. And not only that my computer sent down with me."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:48", "end": "00:50", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:50", "end": "05:20", "text": "I apologize for the inconvenience caused to you. And I understood. You are facing show with your VPN account. Surely I will help you on this. I need to verify your detail first. So can you please help me with your BMS number? I'm going to find it. I'm trying a little bit, but I'm not in health. Ok, please provide me your BMS number. I need to verify your detail first. Yeah, I said I can get a policy. Give me one moment. Ok, Take your time, ******. Please help me with the BMS number. I'm trying to get it one second in a certain place. I'm trying to get to it right now. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:20", "end": "05:42", "text": "Thank. You. Thank. You. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:42", "end": "10:14", "text": "And so it should be. ******. It is ******. Yes. Let me pull up your details. May I know what is your first name and the last name? ***. And what is your supervisor name? ***** ********. It might be under ***** because we just got out of training. Yeah, ***** is right. And what is your higher date? September 29th. And what is the year of your higher date? What is my, what date? I'm sorry. What is the year of your higher date? Oh, ****. I'm sorry. Ok, And may I know, what is the error message showing your VPN account When you are trying to log in and it says no VDI connected, then it will say VDI connected. Then my video. Excuse me, BPN. Well, VPN connect. They're going to say BP connected again. The computer shuts down and then I have to log again. Can you please? Can you please go ahead? Can you please help me with your phone number So I will share your video link over your phone number so I will check. What is the RMS showing your account? Yeah, my phone number. My cell phone number is **********. So I will share you a video session link over your phone number before sharing your screen. Please hide all of the personal information. Ok. Right now its showing that it connected. I don't know. It just did it. So it is, it's going to stay that way? Yes, but I don't know how long it's going to stay that way. So your VPN is connected now, am I right? Yes, it's connected right now. Okay, It's happened because if your internet is fluctuate, that's why your VPN is disconnected. Ok. Call my provider and they said they didn't have any fluctuations. They showed me and we also took the team and everything else. They said they didn't show anymore. Sometimes it's happened automatically. Ok, if you are facing the same issue. So you need to call back again. Ok, is there a ticket number or anything that I can do? Yes. I'm providing you a ticket number regarding this call so you can provide to your supervisor. Ok. Are you ready to note down your ticket number? Yes. I'm ready to write down. Your ticket number is Inc. 03."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:14", "end": "10:19", "text": "One. One."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:16", "end": "10:49", "text": "*****. Apart from this, is there anything else I can help you today? No, that is all. And also I will connect to your short survey post this call. Where in Gandhi, this service is provided on a scale to 52 and 5 means very satisfied and the second service for first contact resolution. We are in select one which means contact. Thank you for calling it helped support. Have a wonderful day."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:49", "end": "11:43", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with. It made it easy for you to handle your issue. Remember, 7 is the thank you for your important and valuable feedback. If you need any additional support, please call us."}]}, {"id": "audio_Call1-926ee9bf-ef49-45ac-b992-c2e46181a22b.MP3", "name": "926ee9bf-ef49-45ac-b992-c2e46181a22b", "utterances": [{"speaker": "Agent", "speaker_type": "agent", "start": "00:05", "end": "00:11", "text": "Thank you for calling ID. Help you speaking with *****. How may I assist you today?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:11", "end": "00:14", "text": "Hello. Good morning. My name."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:13", "end": "00:16", "text": "Hello."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:16", "end": "00:19", "text": "Hello."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:18", "end": "00:21", "text": "Hello. I'm audible to you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:21", "end": "00:25", "text": "Yes. Good morning."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:25", "end": "00:29", "text": "Good morning. How may I assist you today?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:29", "end": "00:37", "text": "Yeah, I am just looking for a account. It has been locked."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:36", "end": "00:40", "text": "Sorry you're looking for."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:40", "end": "00:42", "text": "Hello? Can you hear me?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:42", "end": "00:45", "text": "Yes, I can hear you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:44", "end": "00:53", "text": "Yes. I'm just looking for a assistance for my account. My account has been locked."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:53", "end": "01:04", "text": "No worries. I'll definitely help you. Could you help me with your BMS? ID number?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:04", "end": "01:22", "text": "Yes, it's ***** ****."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:22", "end": "01:28", "text": "It's ******. Am I correct?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:28", "end": "01:34", "text": "Sorry. Can you say, I guess?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:31", "end": "01:42", "text": "****** ** I correct? 2."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:37", "end": "01:46", "text": "*******."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:46", "end": "01:53", "text": "Got. It."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:50", "end": "01:57", "text": "******* ** I correct?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:57", "end": "02:00", "text": "Hello. Give me."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:00", "end": "02:14", "text": "Yeah, it's *******. Hello."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:14", "end": "02:23", "text": "Hello."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:22", "end": "02:27", "text": "Is it *******."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:27", "end": "02:32", "text": "Yes, *******."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:32", "end": "02:42", "text": "Got it. So as I understood that your account has been locked out and need to unlock your account. Am I correct? Yes."}, {"speaker": "Customer", "speaker_type": "customer", "start": "02:41", "end": "02:43", "text": "Yes."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:43", "end": "03:06", "text": "Got it. Thank you for that. And it would take me a moment to review information. May I put your call on hold for a while so that I can check your details?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:05", "end": "03:07", "text": "Sure."}, {"speaker": "Agent", "speaker_type": "agent", "start": "03:07", "end": "03:22", "text": "Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:22", "end": "03:54", "text": "Thank. You. Ok. Please."}, {"speaker": "Customer", "speaker_type": "customer", "start": "03:54", "end": "05:01", "text": "Stay. On. The. Line."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:01", "end": "05:12", "text": "Yes. Thanks for waiting. I really appreciate your time and patience. Can you please help me with? Can you please help me with your full name?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:12", "end": "05:16", "text": "It's ****** Hamo."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:16", "end": "05:20", "text": "Can you please spell it out for me?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:19", "end": "05:25", "text": "Yes. My name is ****** *******."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:25", "end": "05:31", "text": "Can you please spell out the last name?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:31", "end": "05:37", "text": "It's J A N O."}, {"speaker": "Customer", "speaker_type": "customer", "start": "05:37", "end": "05:39", "text": "Sorry."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:39", "end": "05:42", "text": "J A R A."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:42", "end": "05:45", "text": "F."}, {"speaker": "Customer", "speaker_type": "customer", "start": "05:45", "end": "05:47", "text": "O."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:47", "end": "05:54", "text": "J A O J for Juliet. A for Alpha O for Oscar."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:54", "end": "06:04", "text": "J for Juliet, A for Alpha, M for Mama and O for Oscar."}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:04", "end": "06:12", "text": "OK O for Oscar."}, {"speaker": "Customer", "speaker_type": "customer", "start": "06:11", "end": "06:16", "text": "Hello? Hello?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:16", "end": "06:23", "text": "*****. No, I didn't get that. Can you please help me with that again?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:23", "end": "06:26", "text": "Sorry again. Sorry, Please."}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:25", "end": "06:31", "text": "Can you please help me with your full name once again?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "06:30", "end": "06:33", "text": "Ok."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:33", "end": "06:37", "text": "My full name is ****** ****."}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:37", "end": "06:43", "text": "Can you please spell your name?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:42", "end": "06:44", "text": "Sorry. I didn't say that."}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:44", "end": "06:51", "text": "Can you please spell your name? Spell it, please?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:51", "end": "07:32", "text": "Yeah, My first name is *. ******. E for Esper. And then S. And then T for Tango and then E again and R for Romeo. And then my last name is J for Juliet. A for Alpha. And then O."}, {"speaker": "Agent", "speaker_type": "agent", "start": "07:32", "end": "07:43", "text": "Sorry. Sorry. Your last name? J for Juliet. A for Alpha. The next."}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:42", "end": "07:48", "text": "Ok. Did. You. Get. It."}, {"speaker": "Agent", "speaker_type": "agent", "start": "07:48", "end": "07:53", "text": "Jester Jam? That's it."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:53", "end": "07:58", "text": "J A M and then o."}, {"speaker": "Agent", "speaker_type": "agent", "start": "07:57", "end": "08:03", "text": "****** ***."}, {"speaker": "Customer", "speaker_type": "customer", "start": "08:03", "end": "08:09", "text": "Hello?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:08", "end": "08:11", "text": "Hello. Can you hear me?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:10", "end": "08:14", "text": "Yes, I can hear you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:14", "end": "08:18", "text": "Ok? Did you get my last name?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:18", "end": "08:24", "text": "Is it J for Juliet? A for Alpha, M for Mike O for Oscar? That's it."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:24", "end": "08:29", "text": "Yes. Yes, that's correct."}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:29", "end": "08:40", "text": "Ok."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:40", "end": "08:44", "text": "Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:44", "end": "08:49", "text": "Can you please help me with your BMS ID number Once again?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:49", "end": "08:52", "text": "Sorry. Can you repeat it again, please?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:52", "end": "08:57", "text": "Help me with your BMS ID number."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:56", "end": "09:06", "text": "Yes. ******."}, {"speaker": "Agent", "speaker_type": "agent", "start": "09:06", "end": "09:15", "text": "I'm sorry. I'm unable to fetch your details with the BMS ID number. Can you please check and let me know your BMS ID number. Correct? BMS ID number."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "09:15", "end": "09:49", "text": "Sorry. Let me double check it. Please. Hold on. Hello. Welcome. To my lecture. Hello? Hello. Can you?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "09:49", "end": "09:55", "text": "Yes, I can hear you. Can you please tell me the correct BMS ID number?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "09:54", "end": "10:09", "text": "Yes. Sorry about that. It's ***. ******."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:09", "end": "10:19", "text": "Got it. Thank you for the details. So may I know what is the issue that you're facing with?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:19", "end": "10:25", "text": "Yes, my account has been blocked."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:24", "end": "10:30", "text": "OK, *******."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:30", "end": "10:34", "text": "Yes."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:34", "end": "10:43", "text": "OK, your account is logged. May I know? What is the error message that you're getting when you're trying to log in?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:43", "end": "10:47", "text": "Now it's just authentication failed."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:47", "end": "10:54", "text": "So you're trying to connect to the VPN and you're getting the authentication failed error message?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:53", "end": "10:55", "text": "Yes, that's correct."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:55", "end": "11:03", "text": "Got it. Thanks for that. And before that, I'll be asking a few security questions. Please help me with those, Ok?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:03", "end": "11:05", "text": "Ok."}, {"speaker": "Agent", "speaker_type": "agent", "start": "11:05", "end": "11:09", "text": "Could you please confirm your full name?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:08", "end": "11:12", "text": "Yes, it's Jester Hamburg."}, {"speaker": "Agent", "speaker_type": "agent", "start": "11:12", "end": "11:19", "text": "Could you please confirm your higher date month and India?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:19", "end": "11:26", "text": "Um, it's March 23, ****."}, {"speaker": "Agent", "speaker_type": "agent", "start": "11:26", "end": "11:33", "text": "Could you please confirm your manager's name?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:31", "end": "11:35", "text": "****** ********."}, {"speaker": "Agent", "speaker_type": "agent", "start": "11:35", "end": "11:41", "text": "Ok, thank you for providing the details. Please stay connected."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:41", "end": "12:50", "text": "Thank you. And then E S N E Y apartment."}, {"speaker": "Agent", "speaker_type": "agent", "start": "12:50", "end": "13:08", "text": "Please take a connected. I'm looking into your account. Ok, I just see that your account is not locked. Can you please do one thing? Can you please try to log in again?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:08", "end": "13:16", "text": "Is it the old or the password address?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "13:16", "end": "13:22", "text": "Can you please try to log in with your old password? Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:21", "end": "13:24", "text": "Ok, thank you. Hold on."}, {"speaker": "Agent", "speaker_type": "agent", "start": "13:24", "end": "13:45", "text": "Ok."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:45", "end": "14:39", "text": "Thank you. Very much. Yeah. It's the same one column. For 2 minutes. I don't know what I'm saying. I don't. What's your name? Ok, Ok."}, {"speaker": "Agent", "speaker_type": "agent", "start": "14:39", "end": "14:44", "text": "Hello?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "14:44", "end": "14:53", "text": "Hello."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:53", "end": "15:10", "text": "Please continue hold. to Your business is important to us. Please line. the stay on"}, {"speaker": "Agent", "speaker_type": "agent", "start": "15:09", "end": "15:13", "text": "Hello. I'm audible to you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:12", "end": "15:14", "text": "Hello. Can you hear me?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "15:14", "end": "15:17", "text": "Yes, I can hear you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:17", "end": "15:25", "text": "Yes. On my BPN. It works. And then I'm trying to log in now on my computer."}, {"speaker": "Agent", "speaker_type": "agent", "start": "15:25", "end": "15:45", "text": "OK, got it. Yeah. Please confirm me. Once you are able to log in. Ok, I'll provide you the ticket number for this call as a reference."}, {"speaker": "Customer", "speaker_type": "customer", "start": "15:44", "end": "15:58", "text": "OK."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:58", "end": "16:02", "text": "Yes, it is working now. Thank you so much."}, {"speaker": "Agent", "speaker_type": "agent", "start": "16:01", "end": "16:07", "text": "You're welcome. That's great. And OK."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "16:07", "end": "16:10", "text": "Hello?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "16:09", "end": "16:21", "text": "Yes. Yes. Perfect. And is there anything else that you're welcome? And is there anything else that I can help you with apart from this?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "16:21", "end": "16:24", "text": "I'm nothing. Thank you so much."}, {"speaker": "Agent", "speaker_type": "agent", "start": "16:23", "end": "16:44", "text": "Ok, please stay connected. I'll provide you the ticket number for this call as a reference. Ok, please wait. Let me update the ticket. OK? Yes. Ok."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "16:43", "end": "17:20", "text": "Yeah, that's true. That'd be another time. Yeah, I'll see that."}, {"speaker": "Customer", "speaker_type": "customer", "start": "17:19", "end": "17:42", "text": "Ok."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "17:42", "end": "19:47", "text": "Please continue to hold."}, {"speaker": "Agent", "speaker_type": "agent", "start": "19:47", "end": "19:56", "text": "Please stay connected. I'm still working on it. The role is a bit slow. Ok, please stay connected."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "19:55", "end": "19:59", "text": "Sorry. I'm sorry. I have a question."}, {"speaker": "Agent", "speaker_type": "agent", "start": "19:58", "end": "20:01", "text": "Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:01", "end": "20:12", "text": "Um, I just want to ask if my password reset request will to go through."}, {"speaker": "Agent", "speaker_type": "agent", "start": "20:12", "end": "20:16", "text": "You want to reset the password?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:16", "end": "20:30", "text": "Because before I called, I tried to reset my password first and then the screen asking to wait for 10 minutes for it to be for me to receive an email confirmation."}, {"speaker": "Agent", "speaker_type": "agent", "start": "20:30", "end": "20:38", "text": "Yeah, you can. Yes. After 10 minutes, you'll get a confirmation. You can try to log in, Right."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:38", "end": "20:52", "text": "And my question is, did my password still go through with the password research reset or I'll keep going to use my old password."}, {"speaker": "Agent", "speaker_type": "agent", "start": "20:52", "end": "20:56", "text": "You can use the old password."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:56", "end": "20:58", "text": "The old password?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "20:58", "end": "21:24", "text": "Yes. Please stay connected."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:24", "end": "21:27", "text": "No, I think that's all."}, {"speaker": "Agent", "speaker_type": "agent", "start": "21:26", "end": "21:35", "text": "Yeah, OK, I'll provide you the ticket number. The tool is running a bit slow. Please stay connected."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:34", "end": "21:36", "text": "Copy."}, {"speaker": "Agent", "speaker_type": "agent", "start": "21:36", "end": "21:56", "text": "Yes. Yes. Can you please note down the ticket number?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:56", "end": "21:58", "text": "Ok?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "21:57", "end": "22:15", "text": "Yes, it's OK."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:14", "end": "22:17", "text": "OK, yes."}, {"speaker": "Agent", "speaker_type": "agent", "start": "22:17", "end": "22:59", "text": "Yes, it's Inc. Indian Charlie. *********. OK, and then post this call. I'll be connecting you to a short survey with the first survey for the customer satisfaction. We're in on a scale of 5 to 15 means very satisfied. And second survey is for the first contact resolution wherein you can select one, which means your issue was resolved in first contact. And thank you for contacting it. Help support. Have a great day ahead. Bye bye."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:58", "end": "23:03", "text": "Yes, sir. Can you send it again? The ticket number, please?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "23:03", "end": "23:13", "text": "Sure. It's Inc. Indian. Charlie. ******. First."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:13", "end": "23:16", "text": "Sorry. After Inc. What is it again?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "23:16", "end": "23:24", "text": "It's 031 Inc. ****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:23", "end": "23:26", "text": "80. Sorry."}, {"speaker": "Agent", "speaker_type": "agent", "start": "23:25", "end": "23:28", "text": "***."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:28", "end": "23:32", "text": "OK ***."}, {"speaker": "Agent", "speaker_type": "agent", "start": "23:30", "end": "23:34", "text": "***."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:33", "end": "23:36", "text": "***."}, {"speaker": "Agent", "speaker_type": "agent", "start": "23:35", "end": "23:39", "text": "***."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:38", "end": "23:49", "text": "***. OK, let me try to repeat it. I N C ***********."}, {"speaker": "Agent", "speaker_type": "agent", "start": "23:49", "end": "23:51", "text": "That's correct."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:51", "end": "23:53", "text": "OK, got it."}, {"speaker": "Agent", "speaker_type": "agent", "start": "23:53", "end": "24:14", "text": "Yes. And then post this call. I'll be connecting you to a short survey. Where are the first surveys for the customer satisfaction? Wherein on a scale of 5 to 15 minutes, very satisfied and second service for the first contact resolution wherein you can select one, which means your issue was in first contact. And thank you for contacting it to support. Have a great day ahead. Bye bye."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "24:14", "end": "24:22", "text": "Ok, thanks so much."}, {"speaker": "Customer", "speaker_type": "customer", "start": "24:22", "end": "26:00", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist On today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve, press 2 If it still has not been resolved, press. Fantastic. This time. Enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. We did not get your response. Please try again this time. Enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. May thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-94b3574a-ae15-45ee-9a21-f07e6346e75a.MP3", "name": "94b3574a-ae15-45ee-9a21-f07e6346e75a", "utterances": [{"speaker": "Customer", "speaker_type": "customer", "start": "00:09", "end": "01:17", "text": "Hello. Thank you for calling ID and blue support. My name is ****** *****. How may I help you? Hello. I'm audible, and I'm a sitting *******. Can you hear me? Yes, I can hear you. This is from performance benefits. And I didn't need assistance without accessing. I forgot the password. Ok, so just before you proceed to the troubleshooting parts, I need to verify your details. Can you proceed with that? Ok, Ok, can you help me with your BMS? ID *******. Ok, and just let me know your full name. I'm ***** Rather. Okay, and just help me with your higher date."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:16", "end": "01:18", "text": "Um."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:18", "end": "01:26", "text": "April 19th. Sorry. Can you repeat again? April 19th 2."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:25", "end": "01:28", "text": "****."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:27", "end": "02:06", "text": "Uh, the year is April ******. Ok, I got you. Got you. Just help me with your supervisor name. There I am anyway. Ok, so I need to verify detail from my end as well. So for that, may I put you on a hold for 2 minutes? Sure. Ok, so can you please be online? Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:01", "end": "03:35", "text": "Hello. Welcome to my lecture. Okay. Thank you. Thank. You. Thank you. Hello. Welcome to my lecture. Hello. my Welcome to lecture. Hello. Welcome lecture. to my Hello. Hello."}, {"speaker": "Customer", "speaker_type": "customer", "start": "03:35", "end": "04:44", "text": "Thank you for being online. So as as I understand, you are facing an issue related to your password like you are unable to log into your PC. Right? Am I right? Am I OK? So like, can you let me know what exactly error message you are getting on your screen while I log into your EC. Okay, so yesterday, actually, I changed my password to the. OK, then when I start, Yeah, I just forget the password that I inflicted yesterday. Ok, my analysis. Ok, Ok, so you are a VDI user, right? Yes, sir. Ok, so I am checking from the back end. So just allow me 4 minutes. So till then, please be your online. Once I'll unlock your account, I'll get back to you. Ok, Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:43", "end": "07:28", "text": "You're. Welcome. Thank you. Hello. Welcome. To. My. Lecture. Hello. Welcome to my lecture. Hello. Welcome to my lecture. Thank. You. Thank you very much. Thank. You. Thank very much. you Thank. You. Thank you very much. You're. Welcome. Thank you. Thank. You. Thank. You. Thank. You. Thank. You. Thank you. Thank you. Thank you. Thank you. Hello. Welcome lecture. to my Hello. Thanks for calling."}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:28", "end": "09:12", "text": "So thank you for being online. So as we I have resetted your passwords. So once you read, ready to note down the password, just do let me know and make sure once you, once you reset the password, once you have login with this password, you have to create the new password that's contained. The 15 character. Include the uppercase lowercase And also you need to mentioned alphanumerical letter so that it will be the strong password. So just let me know once you need to know the one time password. Yes, sir. I'm ready. Ok, you're ready. So that is. Lower case T as Tango. Lower case T as tango P as lowercase P as Papa. Hello. Got it. Uppercase J as. Uppercase uppercase *** as Julu. *** and Juul for J. Yes J for Zebra. OK, number 5. Uppercase S as *****. Number 5."}, {"speaker": "Agent", "speaker_type": "agent", "start": "09:12", "end": "09:14", "text": "All right."}, {"speaker": "Customer", "speaker_type": "customer", "start": "09:13", "end": "10:19", "text": "Uppercase J as Juliet. Uppercase P as Papa. Uppercase D as Delta. Uppercase E as Echo. A lowercase ki as Kilo. Lowercase X as x ray. Got it? Yes. So this is then just try to log in and just let me know. Are you done or not? Let me try to do that. Ok, please do log in and just let me know till then I'm here."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:18", "end": "10:47", "text": "You're. Welcome. Thanks for calling."}, {"speaker": "Customer", "speaker_type": "customer", "start": "10:47", "end": "10:51", "text": "Yes, I'm there. Just let me know."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:50", "end": "11:01", "text": "Are. You. Logged. In."}, {"speaker": "Customer", "speaker_type": "customer", "start": "11:01", "end": "11:31", "text": "I'm still here. I don't get you. Can you repeat again? Hello? Am I audible? Yes, sir. I'm so sorry to hold on for a moment. Ok, please, please take your time."}, {"speaker": "Agent", "speaker_type": "agent", "start": "11:31", "end": "11:54", "text": "Thank you. Hello. Welcome lecture. my to"}, {"speaker": "Customer", "speaker_type": "customer", "start": "11:54", "end": "13:39", "text": "I know, sir. I was hunting with it. Ok, have you logged in? No, sir. What error is that? Like in name? In what it is showing in Vantage. Yeah. Invented not in name or password. Okay, invalid. So just make sure you are putting the correct password. So you want me to repeat one more time? All right. OK, lower case T as Tango. OK, lowercase P as Papa. Uppercase ***. As Zulu. 5. Number 5. Uppercase S Sierra. OK. And number 5. Uppercase J as Gela Gmail and uppercase P As Papa Again. Uppercase D as a Delta. OK. Uppercase E as Echo."}, {"speaker": "Agent", "speaker_type": "agent", "start": "13:39", "end": "13:45", "text": "Ok."}, {"speaker": "Customer", "speaker_type": "customer", "start": "13:44", "end": "14:40", "text": "Lowercase K as Kilo Ok X as lowercase as X ray Verify, sir, that is lowercase P E and capital letter Z type 5 s Time J for Juliet G is jumping. Uppercase G is in uppercase. Yes, sir. Upper base J for Juliet. Upper base P for Peter. Uppercase D for delta upper Kate E for echo K. Small letter K for small letters 3. Yes. Just try to log in with this. Just let me know what it is for you. Actually."}, {"speaker": "Agent", "speaker_type": "agent", "start": "14:39", "end": "15:14", "text": "One moment. Ok, thank. You very much. Thank. You. Thank you."}, {"speaker": "Customer", "speaker_type": "customer", "start": "15:13", "end": "15:20", "text": "One moment, sir. Ok."}, {"speaker": "Agent", "speaker_type": "agent", "start": "15:20", "end": "16:44", "text": "Thank. You. Thank you. Okay. Thank you. Thank you. Thank. You very much. Thank. You. Thank. You."}, {"speaker": "Customer", "speaker_type": "customer", "start": "16:44", "end": "18:02", "text": "Thank you for being online. Just do. Let me know. Have you logged in? Thank you for having me, sir. I don't need to change the password. Ok, now you're changing your password, right? You're logged in. It means yes, sir. Ok, so once you change the password, like make sure that include the 15 characters, uppercase, lowercase included, and alphanumeric as well. So once your password is done, just do let me know. Is there okay to change the password? Have you have you changed the password? Yes, sir. Ok, so like now your issue is resolved, right? That is correct. Okay. Okay, so, okay. So be online. I'll give. I will give you the ticket number for our interaction so that you can show to you, supervisor and all. So till then, please be online. Thank you. Bye bye."}, {"speaker": "Agent", "speaker_type": "agent", "start": "17:52", "end": "22:20", "text": "Hello. Welcome to my lecture. Hello. Welcome. To. My. Lecture. Hello. Welcome to my lecture. Hello. Welcome to my lecture. Thank. You. Thank you. Hello. Welcome to my lecture. Thank. You. Thank much. you very Hello. Welcome to my lecture. Hello. lecture. my to Welcome Hello. Hello. Thank. You. Thank you. Thank much. very you Hello. Hello. Hello. Hello. Thank. You. Thank you. Thank you. Hello. Welcome to my lecture. Hello. Welcome lecture. my to Hello. Welcome to my lecture. Hello. Welcome lecture. my to Hello. Thank you for calling. Hello. lecture. my Welcome to Thank. You. Thank you. Hello. Thanks calling. for Hello. Welcome to my lecture."}, {"speaker": "Customer", "speaker_type": "customer", "start": "22:20", "end": "22:45", "text": "Oh, thank you for being online. So just let me know once you're ready to note down the ticket number. Ok R as in Romeo. E as echo Q as Q as cubic ****."}, {"speaker": "Agent", "speaker_type": "agent", "start": "22:45", "end": "22:48", "text": "All right."}, {"speaker": "Customer", "speaker_type": "customer", "start": "22:46", "end": "23:36", "text": "****. OK, ***. So, so anything else that you want me to help? No. Okay, suppose this call. I'll correct a short survey where you can where you can rate where I'd kind of post this call. I'll connect to a short survey Post this call where the first survey is for the customer satisfaction where you can rate on the scale of a 5 to when we are 5 means very satisfied. And the second survey is for the first contact resolution where you can select one, which means your issue was resolved in the first contact. Thank you. Bye. Thank you for calling IDL, please. Thanks for giving us a few minutes of your time to complete the it helpd desk survey."}]}, {"id": "audio_Call1-9889d726-2498-498f-85cf-a803d53b67cb.MP3", "name": "9889d726-2498-498f-85cf-a803d53b67cb", "utterances": [{"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:05", "end": "00:16", "text": "Just for contacting me. Support. My name is ***. How may I assist you today? Yeah, I already."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:16", "end": "00:20", "text": "Have my reference number and the call ID."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:20", "end": "00:36", "text": "Sorry, I didn't get you. Can you please repeat it once again? I'm sorry. Can you please repeat it one second? What do you mean to say?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:36", "end": "00:45", "text": "Actually, somebody will be. Can you repeat it for me?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:44", "end": "00:54", "text": "Ok, so you know, you need an update on the CPU replacement? You're saying right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:54", "end": "01:01", "text": "That's good. I already do have to do that. One ad."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:01", "end": "01:21", "text": "Sir, I'm unable to understand what you mean to say. Can you please repeat it one second properly and clearly so that I can check and help you out? Sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:21", "end": "01:26", "text": "What's your question?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:26", "end": "01:35", "text": "Sorry, I didn't get you. Can you please repeat it one second?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:34", "end": "01:39", "text": "I already have the reference number of the product."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:39", "end": "01:45", "text": "Yeah, just give me the ticket number, please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:45", "end": "01:46", "text": "So it is. I n."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:46", "end": "01:49", "text": "C o."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:48", "end": "01:50", "text": "***."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:50", "end": "01:55", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:52", "end": "01:58", "text": "****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:57", "end": "02:05", "text": "Sorry. Can you please repeat it? One second? I N C Then."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:05", "end": "02:15", "text": "I N C 03 Y C E 4 5."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:15", "end": "03:08", "text": "Inc 03100844 Correct. No, sir. This is the incorrect ticket number. Can you please recheck it once again for the exact ticket number. Please. Please check it once for the correct ticket number. Because the ticket number which you are giving me is incorrect. Sorry, I didn't get here. Can you please repeat that?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:08", "end": "03:09", "text": "Again."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:09", "end": "03:16", "text": "Can you please repeat the ticket number? One second? I'm asking."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:16", "end": "03:23", "text": "I don't need the ticket number for you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:22", "end": "03:27", "text": "Sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:27", "end": "03:34", "text": "I don't see it. Ticket numbers. It's just the reference."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:34", "end": "03:44", "text": "So the ticket number which you're giving is incorrect. Can you please help me with the correct ticket number, please?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:44", "end": "04:03", "text": "The number that we get to do? I don't think that it's a ticket number because can you please think of a negative balance? Is this the reference to the call?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:02", "end": "04:21", "text": "Yeah, it is an incorrect number, sir. So if possible, can you please help me with your BMS ID number, please? So that I can check the details. Give me the BMS ID number."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:20", "end": "04:22", "text": "BMS ID."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:21", "end": "04:31", "text": "Yeah. BMS ID number."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:27", "end": "04:34", "text": "*******."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:34", "end": "04:41", "text": "Just a moment. And may I know your name, please for your full name?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:41", "end": "04:45", "text": "******."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:45", "end": "05:04", "text": "Ok, let me check it on if any recent ticket has been created or not on your name. Yeah. You have called us on the follow up ticket. Yeah, you have called us here on the follow up ticket. So let me check the details here. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:04", "end": "05:07", "text": "Sure."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:07", "end": "05:58", "text": "Yeah. So here it is mentioned that we need to create a ticket for the CP replacement. Ok, just let me check and raise and request for the replacement from my end. So just stay on the line only. Let me try to create that again. Please. You're welcome. Due to earlier due to the tool was working very slow. So our agent didn't raise a request for the replacement at that moment. But not to worry. I'll check and help you out at this moment. Ok, just stay on the line."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:53", "end": "06:49", "text": "It's it. Thank you. Thank you. Thank you. Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:49", "end": "07:02", "text": "Thank you for staying online. Still, I'm raising a request for the replacement. Just stay on the line. OK. You're welcome."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:01", "end": "08:20", "text": "Hello. Thanks for calling. All right. Thank you very much. Thank you. Thank you. Thank you. Thank you. you. Thank you. you. Thank Thank Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:20", "end": "08:38", "text": "Thank you for staying online. Still, I'm reading a request for the replacement just on the line. Ok. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:38", "end": "08:49", "text": "Thank you very much. Hello. Welcome."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:49", "end": "08:51", "text": "Lecture. My. To."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:51", "end": "09:57", "text": "You can do that. Thank you. Thank you. you. Thank Thank you. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:57", "end": "10:05", "text": "Thank."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:05", "end": "10:07", "text": "You."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:07", "end": "10:17", "text": "Thank. You."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:17", "end": "10:37", "text": "Thank you for staying online. Still, I'm reading a request for the replacement. Just stay on the line. OK? Yep. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:30", "end": "10:53", "text": "Thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:53", "end": "11:12", "text": "You. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:00", "end": "11:47", "text": "Its."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:47", "end": "12:17", "text": "Thank. You. Hello. Lecture. My. Welcome. To."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:17", "end": "12:42", "text": "Thank you for staying online. Can you please do one thing? Can you please help me with your contact number so that on your mobile number, I'll be sending you a video link. Can you please turn on the video and just show me the CPU box so that I need the picture of the CPU box. So can you please help me with your contact number, please?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:39", "end": "12:44", "text": "****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:42", "end": "13:37", "text": "41 second, please. One second. One second. Allow me a moment. Ok? Yeah. Let me. I have the picture. Just stay on the line only. Ok? Ok, Yep. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:37", "end": "14:52", "text": "Thank you. Thank you. you. Thank Thank you. Thank you. you. you. Thank you. Thank Thank Thank you. It's. Thank you. Thank Thank you. you. Thank you. Thank you. Thank you. Thank you. Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:52", "end": "15:21", "text": "Thank you for staying online. I'm checking with my team here. Stay on the line. Ok. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:10", "end": "15:31", "text": "Its."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:31", "end": "15:43", "text": "You for staying online. Apart from the CPU, you have other CPU as well. Do you have any additional CPU with you?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:43", "end": "15:44", "text": "I'm sorry."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:44", "end": "16:01", "text": "Do you have any additional CPU available with you? Because it is showing, as on your name, there are 2 cpus has been applied. So just to confirm, are you having 2 cpus or one CPU?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:01", "end": "16:06", "text": "What? I can't understand."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "16:05", "end": "16:16", "text": "I'm asking you. Are you having 2 CpS or one CPU? I'm asking."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:16", "end": "16:19", "text": "Are you asking me what?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "16:19", "end": "16:29", "text": "Are you having 2 PcS or one PC with you? Because on your name, it is showing that 2 PcS are available here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:29", "end": "16:35", "text": "Oh, yeah. I have 2 money."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "16:35", "end": "17:29", "text": "Not 2 monitors. I'm asking you only have one CPU with you, Right? Ok. Just stay on the line. I'm checking with my team. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:28", "end": "18:16", "text": "Thank you. you. Thank Thank you. Thank you. It. Ok, Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:16", "end": "18:47", "text": "Thank you for staying online. Still, I'm checking with my team. Just stay on the line."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:40", "end": "19:10", "text": "Its."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:58", "end": "19:29", "text": "It's. Thank you. Thank you. Thank you. Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "19:29", "end": "21:40", "text": "Thank you for staying online. Still, I'm reading a request for the replacement. Just stay on the line. Ok. Thank you. You for staying online. So just. I want to say I've reached a request for the replacement of the PC. Ok, as soon as possible, the delivery team would be contacting you to deliver the PCR given address, and I I'll be giving you a ticket number for this call as well. Ok, so just note down the ticket number so that in future, if you'd be having an issue, you can call us back with this ticket number. OK."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:40", "end": "21:42", "text": "Thing that you don't need to do."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:42", "end": "21:54", "text": "Yeah, they should have to wait for some time as soon as possible. The delivery team would be contacting you to deliver the PCI given address. Ok?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:53", "end": "21:58", "text": "Oh, yes. Ticket number."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:58", "end": "22:19", "text": "So the ticket number is inc. *********. Oh, OK, thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:19", "end": "22:22", "text": "Can you repeat that?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:21", "end": "22:42", "text": "Yeah, sure. I Inc ******. Sorry. *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:42", "end": "22:51", "text": "I N T *********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:50", "end": "22:56", "text": "844 In the last."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:56", "end": "23:05", "text": "Yeah, So I N T *********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:05", "end": "23:18", "text": "14. Yeah, that is the ticket number. Ok, And is there anything else, Apax that I can help you with?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:18", "end": "23:29", "text": "I'm no ticket number ********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:29", "end": "23:39", "text": "Yep, ***. The last time. Is there anything else that I can help you with?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:39", "end": "23:46", "text": "So the numbers are my name."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "23:46", "end": "23:55", "text": "Yep. As soon as possible, the delivery team would be contacting you to deliver the PCI given address. And is there anything else apart from that again?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:55", "end": "24:04", "text": "I just wanted to confirm this number. Yeah, I've got this number. I want to continue with that."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "24:04", "end": "24:18", "text": "Inc *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "24:17", "end": "24:22", "text": "Yes, yes. Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "24:22", "end": "24:48", "text": "One second. Please just stay on the line. Yeah. Inc 031020844 in the last. Ok. Yep. And is there anything else that I can help you with?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "24:48", "end": "24:51", "text": "Um, no."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "24:50", "end": "25:12", "text": "Yeah. Thank you. And as I want to say, pose this call, I would be connecting you to ensure scale of 5 to one. Fine. It's very satisfied. And the second survey for contact resolution wherein you can select one, which means your issue was resolved in the flash. Contact. Thank you. Thank you for contacting it. Support. Have a great day. Be safe. Thank you."}]}, {"id": "audio_Call1-99102736-2277-466b-a60a-00ce190aaf02.MP3", "name": "99102736-2277-466b-a60a-00ce190aaf02", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:08", "end": "00:15", "text": "Thank you for contacting ID. Homogene support. My name is ****. How can I help you?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:15", "end": "00:22", "text": "Hi. Good morning. I need help with Microsoft Authenticator. Is that something that can help you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:22", "end": "00:33", "text": "Well, definitely, ***, I can help you with the Microsoft authentication. As I understand. You want to set it up, right?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:32", "end": "00:44", "text": "I have it set up with my old phone. Unfortunately, I don't have access to it anymore, so I'm trying to send back it to my new phone."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:44", "end": "00:48", "text": "Oh, no. Is that always?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:47", "end": "00:50", "text": "Yeah. Sorry."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:50", "end": "00:51", "text": "Sorry, My bad."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:50", "end": "00:55", "text": "Go ahead. Are you saying something? Yep. Go ahead."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:55", "end": "01:06", "text": "Yeah, I'm seeing the microscope indicator on your old firm. Now, do you have a new phone? Can anyone set it up on the new phone?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:05", "end": "01:19", "text": "Yeah, I want to set it up using my new phone because I don't have access to my old phone anymore. So when I try to do it, it requires me to have access to my old phone."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:19", "end": "01:28", "text": "I got it. I got it. No issues. Can you do one thing? Can you just delete that application from your old phone or you cannot? Can you or you cannot."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:28", "end": "01:34", "text": "I can no longer do that because my the old phone is no longer opening."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:34", "end": "01:43", "text": "Okay, That's that all right. Do one thing. Have you installed the microscope about ending it on your phone on a new phone?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:43", "end": "01:55", "text": "Yes, I did. I also tried setting it up. It's just that whenever I try to do it, it's asking me to verify using my old phone, which is, I no longer have access."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:55", "end": "02:18", "text": "Forget about it. Okay. I will guide you. How to set up a new Microsoft authenticator on a new phone. Do one thing. First, uninstall the application and reinstall the application. Okay, before that, ma'am, I'm sorry for the inconvenience cost. You're definitely for our best to help here. Can you please provide me with the CCMS or BMS in number?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:18", "end": "02:27", "text": "Sure, it's ******. Employee name. **** *** *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:26", "end": "02:44", "text": "**** *** *******. OK, yes. And I can see you're working for Teleperformance Philippines as a WFM manager, right?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:44", "end": "02:47", "text": "Yes, that's correct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:46", "end": "02:55", "text": "Okay, Any user ID would be *******. Dodd ***. Correct?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:54", "end": "02:57", "text": "Correct."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:57", "end": "03:05", "text": "Okay, Okay. Is I already uninstalled the authenticator app and have it installed again? So what do I need to do?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:05", "end": "03:12", "text": "Now, don't do anything. Guide you. Please follow my instructions."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:12", "end": "03:21", "text": "Sure."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:21", "end": "03:53", "text": "Okay. In the meanwhile, can I just put a call and hold for *********? I'm sorry. My bad. I'm so sorry. Can I just put a call on hold over 2 minutes. Let's verify your information and get back to you. Thank you so much, ma'am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:38", "end": "07:12", "text": "[MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Hello. Welcome. [MUSIC] [MUSIC] To. My. Lecture. [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:12", "end": "07:20", "text": "Thank you for staying on hold. And I'm pleased I'm still working with the information. Just give me a few moments. Okay? Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:20", "end": "07:22", "text": "Sure. Got it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:22", "end": "07:39", "text": "Thank you so much, ma'am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:24", "end": "08:17", "text": "[MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:17", "end": "08:23", "text": "Thank you for staying on hold, ma'am. Ma'am, are you VPN user? VDI user?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:22", "end": "08:32", "text": "Yeah, I'm using VPN, but unfortunately, I can't sign into VPN because I don't have the authenticator."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:32", "end": "08:53", "text": "Credit, correct? No worries. I'll just smoke this year. Thank you. This will be on the call."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:38", "end": "10:23", "text": "[MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:23", "end": "10:49", "text": "Thank you for staying on hold, ma'am. Ma'am, I have escalated this to the escalation team for their benefit. What I will do is I will send you a so I will send it a tap on your personal and mail ID. Okay, so that it would be easier for you to look and type temporary before that. Ma'am, can you please with the person mail ID?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:49", "end": "10:51", "text": "Sorry."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:51", "end": "10:52", "text": "I will share."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:52", "end": "10:55", "text": "You're asking For what?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:54", "end": "11:02", "text": "Personally can you please provide? Can you please provide me with a personal ready?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:02", "end": "11:07", "text": "You mean personal email or."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:06", "end": "11:10", "text": "Yes, Personal email, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:10", "end": "11:16", "text": "I can email it using my work email. I have access to it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:16", "end": "11:20", "text": "Okay. You have access to your work email?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:20", "end": "11:26", "text": "Yeah, I can access my work email. I can also access my teams."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:26", "end": "11:32", "text": "You have. You have teams, right? Okay. I'm poking you on teams. Okay, just a second."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:32", "end": "11:45", "text": "Alright."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:45", "end": "11:49", "text": "Just bear with me."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:49", "end": "11:52", "text": "Sure. No problem."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:52", "end": "12:11", "text": "Hello. It."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:11", "end": "12:13", "text": "Well."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:13", "end": "12:28", "text": "I mean, thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:28", "end": "12:35", "text": "You. Very. Much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:35", "end": "12:56", "text": "Okay. Regarding **** and ******* to double Assum manager. Yes, its beat. It's a bit slow. So just be on the call. Okay. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:56", "end": "13:37", "text": "Thank. You. Thank you. Thank you. Thank you. Thank you. Thank you. It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:37", "end": "13:50", "text": "Wrong with us. Shows like you're offline with many ways."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:50", "end": "13:59", "text": "I'm actually out of out of shape already. That's why I turned it off."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:59", "end": "14:37", "text": "Account. Thank you. Thank you. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:36", "end": "14:45", "text": "Okay, I've shared you the ****. Please check your teams."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:44", "end": "14:56", "text": "Didn't receive any message yet. There you go. Sorry. What's that?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:56", "end": "15:07", "text": "Yeah, just wait. I will guide you. How to do it. Okay. Follow my instructions. Now open the Microsoft Authenticator app."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:06", "end": "15:09", "text": "Okay, hold on."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:08", "end": "15:11", "text": "Mmhmm."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:11", "end": "15:14", "text": "Ok, I'm on it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:14", "end": "15:22", "text": "After opening the app. Do you see worker's full account?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:21", "end": "15:23", "text": "Sorry."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:23", "end": "15:25", "text": "After opening the."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:25", "end": "15:25", "text": "Application."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:25", "end": "15:34", "text": "Do you see me as workers? School account. Click on. Workers, pull the call, and then click on. Sign home."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:33", "end": "15:39", "text": "Okay, I'm ready. My email."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:38", "end": "15:42", "text": "Mmhmm. And then signing with your NPI."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:42", "end": "15:44", "text": "Performance dot com."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:44", "end": "15:51", "text": "Yes. Then with the mendoza dot **** ** teleperformance dot com."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:51", "end": "15:57", "text": "Enter temporary access. So that's. Yeah, that's a one divided, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:57", "end": "16:09", "text": "Correct. Yes, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "16:09", "end": "16:15", "text": "With me. Sorry, I'm unbelievable because I can't copy it. Sure. Sure."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:15", "end": "16:36", "text": "Mmhmm."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:36", "end": "16:46", "text": "Thank you. you. Thank you. Thank you. Thank Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "16:46", "end": "17:03", "text": "Ok, already creating fast key. Hold on. Ok, I have it added already. Hold on. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:03", "end": "17:10", "text": "Make sure you register. Make sure you click on register."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "17:10", "end": "17:14", "text": "It's already showing in the authenticator."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:14", "end": "17:19", "text": "Ok, Yeah, not by the login."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "17:19", "end": "17:24", "text": "Hold on. Let me try to connect the VPN."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:24", "end": "17:36", "text": "MHM."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "17:36", "end": "17:43", "text": "Why? It's showing temporary access."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:43", "end": "17:50", "text": "Beloaded Do you see signing with other option or more options?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "17:50", "end": "17:54", "text": "I use that and then use my password, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:54", "end": "18:02", "text": "Yeah. User password."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:01", "end": "18:10", "text": "There you go. Sorry. Yep. It works now. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:10", "end": "18:16", "text": "Most welcome, ma'am. Just wait. I will provide you with a ticket number. Ok?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:16", "end": "18:21", "text": "Sure. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:21", "end": "18:25", "text": "They give me a moment. Okay, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:25", "end": "18:28", "text": "Sure. No problem. Thank you so much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:28", "end": "18:52", "text": "Most welcome."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:52", "end": "19:33", "text": "Thank you. Thank you. Thank you. Thank very much. you Thank you. Thank. You it."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "19:32", "end": "19:50", "text": "Huh?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:50", "end": "19:58", "text": "Sure."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:58", "end": "20:19", "text": "Just me, ma'am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:18", "end": "20:53", "text": "What's. Up. Thank you. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:52", "end": "21:21", "text": "Yeah, ma'am. Please write down the ticket number. That would be I for India N for Nancy C for Charlie Inc. ******** *** *******. That February, I can."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:21", "end": "21:24", "text": "Understand that?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:24", "end": "21:33", "text": "Yeah, I N C **********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:33", "end": "21:37", "text": "Ok, All right. Got that. Thank you. Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:37", "end": "21:40", "text": "Is there anything else I can help you with?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "21:40", "end": "21:45", "text": "No, that would be all here. It's been a great talk. Have a great day."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:45", "end": "21:53", "text": "Okay, So, ma'am, can I just speak 30 seconds over time for this? So after this call for the assistance have provided you?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:53", "end": "21:55", "text": "Sure."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:54", "end": "22:23", "text": "Okay, So, ma'am, I would connect you to a short survey post this call where the first survey is for the customer satisfaction. Wearing on the scale of 5 to one or 5 means very satisfied and the second series for the first contact resolution when you can select one, which means the issue was resolving for a scant. I hope you were the best survey, ma'am. Means a lot for me. Thank you for contacting it. Home Agent support. Have a great day. Bye."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "22:22", "end": "23:33", "text": "Thank you. Have a good day. Bye bye. Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsaid. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2 if it still has not been resolved, press 3. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One the strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-99c3c841-77c3-4710-8b78-13f1c54453d3.MP3", "name": "99c3c841-77c3-4710-8b78-13f1c54453d3", "utterances": [{"speaker": "Customer", "speaker_type": "customer", "start": "00:15", "end": "00:18", "text": "Thanks for calling. My name is."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:18", "end": "00:23", "text": "How can I assist you today? Hi. This is **** from health net provider."}, {"speaker": "Customer", "speaker_type": "customer", "start": "00:23", "end": "00:30", "text": "Service line. I cannot log in."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:30", "end": "00:38", "text": "Ok, so as I understood that you are unable to log in and are you getting any specific error message while you're trying to log in?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "00:38", "end": "00:47", "text": "Yeah. You saw the temporary password that I'm able to let in."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:47", "end": "01:07", "text": "So you mean your password is not accepting, right? It is not letting in? Yes. Ok, no worries. Sorry for the inconvenience because you do this, we'll definitely help you out. And before posting further, could you please help me with your BMS? ID?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:06", "end": "01:12", "text": "Um, *******."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:12", "end": "01:18", "text": "So just to make sure I have *******. Right."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:18", "end": "01:19", "text": "Yes. Perfect."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:19", "end": "01:25", "text": "Ok, and it may take me a moment to reach your information. Can I place your call on hold for the same?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:25", "end": "01:26", "text": "Yes, sure."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:26", "end": "01:26", "text": "Thank you."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:26", "end": "01:43", "text": "Please be on hold."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:28", "end": "02:23", "text": "[MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Yes. Thanks for being on hold. Please confirm your first and last name."}, {"speaker": "Customer", "speaker_type": "customer", "start": "02:23", "end": "02:31", "text": "Hold on. Thank you. Hold on, sir. Just stay in the line. Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:30", "end": "02:35", "text": "Sorry. Are you able to log in now?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "02:35", "end": "02:36", "text": "No, no, Yeah."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:36", "end": "02:46", "text": "Please confirm. Yeah. Just confirm your first and last name."}, {"speaker": "Customer", "speaker_type": "customer", "start": "02:45", "end": "02:47", "text": "**** ******."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:47", "end": "03:04", "text": "Okay, great. And please verify your higher date. Like EAN month."}, {"speaker": "Customer", "speaker_type": "customer", "start": "03:03", "end": "03:06", "text": "September ****."}, {"speaker": "Agent", "speaker_type": "agent", "start": "03:06", "end": "03:12", "text": "Perfect, ma'am. Can you please confirm your supervisor's name?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "03:12", "end": "03:14", "text": "I'm ********."}, {"speaker": "Agent", "speaker_type": "agent", "start": "03:14", "end": "04:00", "text": "Great. Thank you so much for the verification. Let me check your account first. Whether it is locked out or not. Please bear with me. Yes. Thanks for being on hold. And upon checking. Yes, your account is perfectly fine. It was not locked and it is enabled. Only could you please try to log in once again with your same old password and let me know if you are facing still any difficulties."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:00", "end": "04:02", "text": "Sure. Just."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:02", "end": "04:06", "text": "Ok."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:06", "end": "04:11", "text": "The previous password or the temporary password."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:11", "end": "04:15", "text": "So you have the temporary password with you now?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:15", "end": "04:16", "text": "Yes."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:16", "end": "04:23", "text": "So recently your password got. I mean, updated, right?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:22", "end": "04:23", "text": "Yes."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:23", "end": "04:39", "text": "Ok, Ok, try once with your. Actually, I can see that you have already updated your password. If you have already updated, please log in with your updated password."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:38", "end": "04:43", "text": "Yeah, I will use the temporary password."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:42", "end": "04:52", "text": "Ok, then once try to log in using the temporary password. If it is still same, we'll reset your password. No worries."}, {"speaker": "Customer", "speaker_type": "customer", "start": "04:51", "end": "05:06", "text": "Ok, just hold on."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:59", "end": "05:08", "text": "Hello."}, {"speaker": "Customer", "speaker_type": "customer", "start": "05:08", "end": "05:55", "text": "Welcome to my lecture. Hello. Thanks for having me. Hello. Welcome to my. Lecture. Sorry, but I'm not able to log in using the temporary password."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:54", "end": "05:59", "text": "So what is the error message that you're getting?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "05:59", "end": "06:06", "text": "Yep. It shows incorrect password."}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:06", "end": "07:07", "text": "Ok, no worries. I will reset your password just a second. And I also would like to inform you that you have an option to reset your password using our password reset link. And this can be accessible from your open network and it can be accessible from your personal device. So I will share that link. And next time you can just use that link to update your password. Reset your password from your end. It's just simple. Ctssup support dot ont dot app. Backwards. Less password reset. So I'm going to reset it now. And just a second."}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:07", "end": "08:11", "text": "Let's see. Yeah, I'm supposed to do. Yeah, yeah, I'm looking for myself a lot. I'm going to leave it. I'm looking out somebody. Somebody."}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:11", "end": "09:33", "text": "Yes. Thanks for being on hold. And could you please note down your new password? Hello? Still there? Yes. The new password would be lowercase Y for yellow. And uppercase E for echo. And lowercase S for Sam. Number 5. And uppercase K for kilo. An uppercase S for Sam. An uppercase T for tango. Number 5. An uppercase N for November. An uppercase K for kilo and lowercase X for X ray and uppercase S for Sam. That's it. Please follow the password criteria and update your password and let me know if you are facing any difficulties."}, {"speaker": "Customer", "speaker_type": "customer", "start": "09:33", "end": "10:00", "text": "Just to confirm it's Y for young. For case B for echo lowercase S for Sam. 5 uppercase T for Kalo. Uppercase S for some upper case T for tango 5 uppercase N for November for case T for Kelo. Lower case X for x ray upper case X."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:00", "end": "10:12", "text": "Perfect. Yes. Please use the same password as your current password and temporary password and update your password and log in with your updated password and let me know."}, {"speaker": "Customer", "speaker_type": "customer", "start": "10:12", "end": "10:15", "text": "Thank you so much."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:15", "end": "12:49", "text": "Yeah, you're welcome. Yes. Thanks for being on hold still there."}, {"speaker": "Customer", "speaker_type": "customer", "start": "12:49", "end": "12:51", "text": "Uh, hello. The agent is currently."}, {"speaker": "Agent", "speaker_type": "agent", "start": "12:51", "end": "12:59", "text": "On the password. Ok, thanks for update. And please let me know once you're back. Ok?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "12:59", "end": "13:03", "text": "Ok, thank. Hello. Hello."}, {"speaker": "Agent", "speaker_type": "agent", "start": "13:03", "end": "13:07", "text": "Yes, ****."}, {"speaker": "Customer", "speaker_type": "customer", "start": "13:07", "end": "13:10", "text": "Thank you for assisting me. I'm able to let you know."}, {"speaker": "Agent", "speaker_type": "agent", "start": "13:10", "end": "13:16", "text": "Great. Sounds really good. And is there anything else I can do to help apart from this?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "13:16", "end": "13:18", "text": "No."}, {"speaker": "Agent", "speaker_type": "agent", "start": "13:18", "end": "13:30", "text": "Yes. **** and I also would like to provide one ticket number regarding this issue. And if you have any further difficulties to log in your account, you just use this ticket as your reference. Ok?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "13:30", "end": "13:32", "text": "Yeah. Ok, just."}, {"speaker": "Agent", "speaker_type": "agent", "start": "13:32", "end": "14:21", "text": "Yeah. Just a second, please. Yes, ****, Thank you so much for being on hold. Could you please note down your ticket number?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "14:21", "end": "14:27", "text": "Yep. Go on."}, {"speaker": "Agent", "speaker_type": "agent", "start": "14:26", "end": "14:43", "text": "Yeah. The ticket number would be R for Romeo E for Echo Q for Queen. *********."}, {"speaker": "Customer", "speaker_type": "customer", "start": "14:43", "end": "14:45", "text": "Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "14:44", "end": "15:04", "text": "Ok. And ****, one more thing. I would like to connect. One shot. We post this call for service for customer satisfaction weren'tified to 15 satisfied and second service for first contact resolution where you can select to one, which means your issue was resolved in the first contact. It was nice talking to you. Thank you for contacting. I tell the support. Have a great day. Take care. Bye bye."}, {"speaker": "Customer", "speaker_type": "customer", "start": "15:04", "end": "15:09", "text": "Thank you. Bye bye. Thanks for giving."}, {"speaker": "Agent", "speaker_type": "agent", "start": "15:09", "end": "15:10", "text": "Us a few minutes of your time to."}]}, {"id": "audio_Call1-9f9f0ff7-1c5e-4496-bb46-161a42fafc3f.MP3", "name": "9f9f0ff7-1c5e-4496-bb46-161a42fafc3f", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:06", "end": "00:12", "text": "You for calling this support? My name is ***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:12", "end": "00:22", "text": "Hi. This is ****** from Teleperformance Philippines. And I'm calling for a monitor placement. Can you help me with it?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:21", "end": "00:34", "text": "Yeah, sure. I'm sorry for the inconvenience cost. I'll definitely help you with this. In the meanwhile. May I know your BMS iDs?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:34", "end": "00:38", "text": "ID is *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:38", "end": "00:42", "text": "Your full name, please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:42", "end": "00:45", "text": "My full name is ******* ********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:45", "end": "00:49", "text": "Your manager name, please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:49", "end": "00:54", "text": "My manager's name is ******** ***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:54", "end": "01:00", "text": "Do you have any existing ticket number for this issue?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:00", "end": "01:10", "text": "I do not have as of yet because the call got dropped earlier."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:10", "end": "01:15", "text": "Both monitors are not working, or only one monitor is not working."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:14", "end": "01:23", "text": "Only one. Only one. The VGA one because the HDMI is working. Uhhuh."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:23", "end": "01:28", "text": "VGA one. You need replacement."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:28", "end": "01:37", "text": "Yes. The right monitor. The monitor from the right side."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:37", "end": "01:49", "text": "Completely understood. Sorry. Yeah, I completely should the issue. Please allow me the moment."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:49", "end": "01:59", "text": "Ok. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:58", "end": "02:22", "text": "Thank you. Thank you. Thank you. Thank you. Let me know your account number."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:22", "end": "02:40", "text": "It. Can you use my email address instead? Because I'm not able to receive offshore text messages from through text message. So can you use my email address instead? That's fine."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:40", "end": "02:50", "text": "I couldn't use your email address to take remote control."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:50", "end": "02:52", "text": "Let me know when you're ready."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:51", "end": "02:56", "text": "Yeah. Yes, I'm ready."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:56", "end": "03:19", "text": "It OK, My email address is ******. That is my surname dot R US S **@*****.***. Again, that is **** dot rush **@*****.***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:19", "end": "03:23", "text": "Ok, please have me a moment."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:23", "end": "03:32", "text": "Thank. You. ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:32", "end": "04:07", "text": "All. Right. Thank you. It. ****. Could you please try to swap the power cable between the monitor and CPU? If you're using the same cable?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:07", "end": "04:08", "text": "I'm sorry."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:08", "end": "04:16", "text": "Could you please swap the power cable between the monitor and CPU? The same cables if you're using the same cables?"}]}, {"id": "audio_Call1-a123256f-087d-4537-8e23-0a4ad8a0f944.MP3", "name": "a123256f-087d-4537-8e23-0a4ad8a0f944", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:06", "end": "00:09", "text": "Thank you for calling Home Legion Support. My name is ***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:09", "end": "00:38", "text": "May I assist you today? Yes. Hi. I'm calling about a ticket number that I had for my monitor. My second monitor is not working. It has a no signal. So they sent me a new code, but it's doing the same thing with the new code. I called the person yesterday that it was probably the plug in the box, but they said no, We're going to send you anyway. So, but it's still not working."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:38", "end": "00:41", "text": "Can I have the ticket number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:41", "end": "00:56", "text": "You sure can. It's I N C *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:56", "end": "01:02", "text": "The last designates after 5."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:02", "end": "01:04", "text": "2."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:03", "end": "01:34", "text": "Okay, 2. Thank you. Give me a few minutes to let me take your details first. I'm sorry that you are facing no way. I will try best you to help you out this."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:33", "end": "03:33", "text": "Oh, my God. Yeah, well. Oh, my God."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:32", "end": "03:39", "text": "Can I have your ID number, please? Your BMS ID number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:39", "end": "03:51", "text": "You sure can. It's *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:49", "end": "03:55", "text": "*******. Okay, Thank you. So. 61."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:54", "end": "04:10", "text": "I'm sorry. *******. That is correct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:10", "end": "04:16", "text": "You have received the new cable, but it is not working with the new cable. Also, right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:16", "end": "04:17", "text": "That is correct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:17", "end": "04:25", "text": "You have received the same cable which you are using earlier or it is something different."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:25", "end": "04:28", "text": "It's the same cable."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:28", "end": "04:42", "text": "It's the same cable. Have you tried to switch the cable from fast monitor to second monitor? Second monitor to fast monitor after getting the new one?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:42", "end": "05:00", "text": "So, yes. So what happens is it's okay. So there's the top port in the bottom port. Right. So, right. Monitor one is plugging to the top port. If I plug it into the bottom port, it doesn't work. So if I plug it into the top port, it works."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:00", "end": "05:04", "text": "So my same thing with the table."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:04", "end": "05:08", "text": "The new table? Yeah, yeah, no worries."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:07", "end": "05:47", "text": "I'm just saying you win the link on your contact number. Please click on the link. Allow it. Allow your camera. Just tell me once. And please hide your confidential information, if any. Now, have you received the link?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:47", "end": "05:49", "text": "No. Did you send it through text or email?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:49", "end": "06:21", "text": "The text. Let me send you an email. Give me a few minutes. Yes. Sometimes calling you on the call. You doesn't receive the message. Please check. No. On your meal."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:21", "end": "06:47", "text": "There we go. Thank you. Oh, no. The link. Here's the one right there. All right."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:46", "end": "06:48", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:48", "end": "06:49", "text": "Got it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:49", "end": "06:59", "text": "Hey, see on this. You are getting the screen year in this year or not. Can I see the backside of your monitor ones?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:58", "end": "07:01", "text": "The backside of the actual monitor?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:01", "end": "07:15", "text": "Yes. Which is not working? Yes. Yes. So there is the only 2 cable connected. One is the power cable. And second one is the display cable, right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:15", "end": "07:17", "text": "That is correct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:17", "end": "07:30", "text": "The power cable. And this is the key. Okay. Can you please try to stretch it? So let me see the other monitor work with the same cable or not?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:29", "end": "07:33", "text": "Yeah. So I think this DB became a lot of here and plug it into the other monitor."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:33", "end": "07:40", "text": "Yes. Yes. You change it from the monitor. Do not change it from the system unit."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:40", "end": "07:42", "text": "No worries. I'm to going have to put the phone down to do that."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:41", "end": "08:09", "text": "Okay, I should take your time. Take your time."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:09", "end": "08:36", "text": "You know, you're in there. That's what we got."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:36", "end": "08:44", "text": "And what about the second monitor."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:44", "end": "08:45", "text": "Again?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:44", "end": "09:27", "text": "Yes, please. Yes, please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:27", "end": "11:01", "text": "Yeah. I'm still going to make them too hard. Date on there. Yes. Hello there."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:01", "end": "11:09", "text": "I'm not getting the proper fixtures. Use greenish trees, I think. Yeah. Now it is okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:09", "end": "11:11", "text": "Is it working now?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:11", "end": "11:22", "text": "Is the cable, which, Yeah, the means the new cable which you have received, that is still, you have received the quality one."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:22", "end": "11:51", "text": "Well, now, what do you mean? This is the table. This is the first table from the first monitor cable. And this is the cable to the top port. If I hook this cable up, this monitor that's working. If I move the top, then to the bottom port, it's not going to work. It's the port. It's not the cable. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:51", "end": "11:59", "text": "The both of the cable are same of your monitor or it's different."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:58", "end": "12:02", "text": "Both of the monitors are the same monitors. Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:02", "end": "12:10", "text": "The monitor, same modem on the display cable. Both have the same display cable. Or it is the different."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:09", "end": "12:12", "text": "There's 2 different displays."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:12", "end": "12:14", "text": "Okay. Do you do physical?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:13", "end": "12:19", "text": "The new one you just sent me is the one I just looked up to. This monitor that's not working."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:19", "end": "12:20", "text": "Yeah, The new as."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:20", "end": "12:25", "text": "I said this one and it wasn't working. And then you have to note to this one."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:25", "end": "12:46", "text": "Yeah, there is no issue with the monitors working. Fine. I think the problem with the display cable, the display cable, that new one which you have received, that is also not working. That is the faulty one. If you can see if you have portal."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:46", "end": "12:53", "text": "The So the display table that you sent me does not work. I'm either monitoring."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:53", "end": "12:59", "text": "Right. It is not working. It is not working in both of the monitor. Right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:59", "end": "13:04", "text": "Because it hooked up to the bottom port. If I move it to the top port, it'll work."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:04", "end": "13:06", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:06", "end": "13:23", "text": "You sent me while I listen real quick. This monitor right here, OK? The one that's not working right now is plugged into the bottom. Now I'm going to plug it into the platform using the cable that you say is not working. Give me one second. Okay?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:23", "end": "14:36", "text": "Yes, please, please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:36", "end": "14:41", "text": "Well, that's me, sir. Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:41", "end": "14:45", "text": "They could have my issue."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:44", "end": "15:46", "text": "No, I was having an issue with something else, and I'm sorry. Oh, my God. Because I took the base off. It keeps falling. Look, So the power had got unplugged because I had took the base off. But now this is the core that you just sent me. The one that you said wasn't working. And now it's plugging to the top."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:46", "end": "15:48", "text": "Okay, now, can you?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:48", "end": "15:49", "text": "Import It it. doesn't get."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:49", "end": "15:56", "text": "Can you please switch on some light and show me the 4th, which is not working?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:56", "end": "15:59", "text": "I'm showing you the point. That's not working."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:59", "end": "16:18", "text": "Yes. Yeah. Hold on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:17", "end": "16:24", "text": "It's that bottom port. This port right here."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:24", "end": "16:43", "text": "Can you please focus your camera there? Because I need to take a picture of it. Thank you. Thank you. Do you have a VJIT in your PC backside?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:43", "end": "16:45", "text": "Do I have a what?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:45", "end": "16:49", "text": "Do you have a VG for in the piece? No, you don't have."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:49", "end": "16:53", "text": "So how much for the 2 VG?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:53", "end": "16:58", "text": "Only 2 DP ports are there? Only one is working currency, Correct?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:58", "end": "17:00", "text": "That is, that is correct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:00", "end": "17:23", "text": "Okay, give me a few moments. No problem. A few moments. You can close the window your session and just wait for our wise."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:23", "end": "17:27", "text": "You said, quote, this discussion thing."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:27", "end": "17:40", "text": "You said before that. Can you please? Can you please let me know how much sports. What type of sports are there in your monitor?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:40", "end": "17:42", "text": "What kind of what now?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:41", "end": "17:48", "text": "What type of foods other display foods are in?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:48", "end": "17:59", "text": "Yeah, they're most myport at AI port and a. The port with the. What's it called with the screws?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:59", "end": "18:09", "text": "And in your system, Okay. And in your system units only, there is a DP port. There is a no SBMI, no VD, right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:09", "end": "18:19", "text": "There is 2 HDMI ports in the front, but those HTMI ports are for the mouth and the camera."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:18", "end": "18:26", "text": "That is USB port. That is. I don't think it is. Yeah. Is there any."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:26", "end": "18:27", "text": "Is there?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:27", "end": "18:32", "text": "Is there any SGMIT in your PC?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:32", "end": "18:33", "text": "No."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:33", "end": "18:38", "text": "Okay. You have fully the DP ports in your PC. Correct?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:38", "end": "18:40", "text": "That is correct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:40", "end": "22:22", "text": "Only 2 forest there, which is VB. Okay. Thank you. Thank you. You can close the video session and just wait for a while. Give me a few minutes. Still waiting for the response from the team. I have already escalated your concern to Dale, too."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:22", "end": "26:03", "text": "No problem. Thank you so much. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "26:03", "end": "26:23", "text": "Give me a few minutes. I'm just going to make the replacement of UPC. Before that, I need one more information on your PC. You will find one tag number, so will be there. Can you please provide me the tag number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "26:23", "end": "26:31", "text": "Is it the one that's with the sticker that says Teleperform USA and has a barcode on it? Can?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "26:31", "end": "26:32", "text": "Yes, it is."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "26:32", "end": "26:44", "text": "No worries. A is an alpha. *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "26:43", "end": "30:10", "text": "Thanks. Give me a few minutes. Let me feed the replacement ticket for you. Thank you for staying active. Can you please note down your ticket number for this replacement of your PC?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "30:09", "end": "30:12", "text": "Yes, please go ahead."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "30:11", "end": "30:40", "text": "That is Inc. I is in India. N is in November. C is zing. Charlie. Zero 2. Sorry. 0313 to ****. I'm repeating once again. Inc. *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "30:40", "end": "30:42", "text": "All right, I got it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "30:42", "end": "30:47", "text": "Is there anything else I can help you out with this?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "30:47", "end": "30:59", "text": "Maybe. Let me ask you a question real quick. There's an app for work day. I don't know if you're familiar with that. Do you a have personal phone?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "30:59", "end": "31:01", "text": "Yes, ma'am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:01", "end": "31:17", "text": "It's sending me to a 2 party office and it won't let me log in from my phone. It gives me an error code. And is there anything you can do to help with that? Or is there someone else I need to call or what's going on?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:17", "end": "31:28", "text": "For the work day. I think it is asking new past excess password or some forward it is giving you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:28", "end": "31:35", "text": "What it does is it sends you a 2 party application. Let me try to log in real quick. It only takes 2 seconds."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:34", "end": "31:41", "text": "I think for that. Have you tried to log in? But you are trying your phone, right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:41", "end": "31:43", "text": "That is correct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:43", "end": "31:48", "text": "Have you tried in the PC? Your PC?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:48", "end": "31:50", "text": "I can log in in the PC."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:50", "end": "31:55", "text": "Okay, that it is not on the market."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "31:55", "end": "31:59", "text": "That's. Correct."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "31:59", "end": "32:00", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:00", "end": "32:05", "text": "What it tells me is It it. says your sign in was blocked."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "32:05", "end": "32:06", "text": "For you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:06", "end": "32:08", "text": "More details?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "32:08", "end": "32:15", "text": "Yeah, yes, I bought it. Got it. *****. I had the autumnator for that."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:15", "end": "32:17", "text": "Right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "32:17", "end": "32:38", "text": "There is a map. Often there is a Microsoft Continuator app is there, which makes 2 types of app. May I know what the username and password you are using for what the username that you are using for the mounting."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:37", "end": "32:43", "text": "My sign and username cutner dot 11 at teleperform at usa dot com."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "32:43", "end": "32:59", "text": "Okay, then it would be set up by our sides. Okay. We'll provide you one excess passcode."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:59", "end": "33:01", "text": "Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "33:01", "end": "33:11", "text": "And you need to set up the authenticator in your phone first. When you're able to set up it, then you will be able to log in into the room."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "33:11", "end": "33:31", "text": "So I have Teleper Performance USA signed up on my Microsoft authenticator. When I go to it, it says Connect account. Create a pass key. Set up. Set up. So the password sign the password was sign in. Same password, update, review and reset."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "33:31", "end": "33:56", "text": "Oh, it's already The autumn ticket is already set up in new phone. How did you set up. Means of how did you logged in into that? You have got the password or you are using the same password which you are using for the login."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "33:56", "end": "34:17", "text": "I had Microsoft Authenticator before for my other job. I heard he had an authenticator and then it just me what the new company was. And it was TPUSA, and that brought up Teleperformance USA. So then I tried to connect my son 11 at teleperformance dot com."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "34:16", "end": "35:13", "text": "No, it is not working. It is not working because maybe it is because effort is. Well, then you didn't get that error message. Your sign in was blocked. Then in that case, you've got a code. Authenticator means your authenticator is not working. In that case, we need to set up it like you need to uninstall the app and reinstall it. And for the login of that authenticator, we will for provide you excess pathcode, the temporary excess passcode. From that you will be. You need to log it into the authenticator. Once it will be set up, you will be able to log into the workday. So are you want to perform that activity right now?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "35:13", "end": "35:24", "text": "Well, no, we're supposed to see it. Well, I'm already logging into work. I'm guessing they're about to start working here. Truly. So let me give you a call back. I'll give you guys a call back tomorrow."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "35:24", "end": "35:34", "text": "No issue. Call back tomorrow for this team. We will set up your authenticator and then you will be able to log to."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "35:34", "end": "35:39", "text": "Okay, so just delete the app that I have now and then call back tomorrow and start."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "35:39", "end": "35:51", "text": "Yes, just install it. Reinstall it and do not do anything in that. After reinstalling. Just call us. We will help you out with that."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "35:50", "end": "35:53", "text": "Okay, Thank you so much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "35:52", "end": "36:16", "text": "Okay. I will connect you to sought survey after this call where you can read the service skill ***. on There are 5 means satisfied and excellent. And the second survey you will receive. If your problem has been sorted out in a first fall, please press one for that. Thank you for calling Dexa. Have a good day. Have a great day."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "36:15", "end": "36:26", "text": "Thank you. Thanks for giving us a few minutes of your time to complete the it helpdesk survey. Your feedback is essential to help us enhance."}]}, {"id": "audio_Call1-a1fac52d-c07e-47c7-b0d6-b57ce79ba068.MP3", "name": "a1fac52d-c07e-47c7-b0d6-b57ce79ba068", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:10", "end": "00:15", "text": "I home agent support. My name is ********. How can I assist you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:15", "end": "00:32", "text": "Hi there. I'm trying to log into my PC. Whenever I try to log into the VPN, it says that my account is dropped. And then when I log into the PC, it's saying I can't access like the web or teams or anything."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:32", "end": "01:13", "text": "Oh, OK, because basically we, you have to log in into your VPN, then into the windows. But if you're not going into login into the VPN and you're saying that it was blocked might be it was blocked. So we have unlock it. So we need to check it. The error message. What exact issue you're facing basis. We will check it out from RL. Then we will provide you the resolution. OK, to not worry. And really sorry for the inconvenient cost to you. Ok, so firstly, we have to do some security checks. May I have your BMS ID, please?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:13", "end": "01:23", "text": "Yep, that's *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:21", "end": "01:27", "text": "******* ****** your full name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:26", "end": "01:28", "text": "Liberty ********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:28", "end": "01:31", "text": "What's your supervisor name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:31", "end": "01:35", "text": "What is *******?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:35", "end": "01:40", "text": "Ok, and what's the site location?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:40", "end": "01:43", "text": "I am white from home."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:43", "end": "01:59", "text": "Thank you, Liberty for sharing me this detail over here. So just to reconfirming your issue that on your new PC, you're getting account is blogged. So may I know that? Do you have any? Do you have any ticket number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:59", "end": "02:01", "text": "Again. 9."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:01", "end": "02:10", "text": "Ok, no problem. We'll check on that. Can you please allow me some time so that I can go through with all your details and help you out?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:10", "end": "02:12", "text": "Yep, that's perfect. Thank you most."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:12", "end": "02:24", "text": "Welcome. Also, can you please tell me your PC tag number, which is pasted on your PC? It starts with T number T for tango."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:24", "end": "02:37", "text": "T ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:34", "end": "02:39", "text": "*******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:39", "end": "02:41", "text": "That. That's correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:41", "end": "03:27", "text": "Thank you. So I'll take the remote control first to check your issue, and on that basis, we will assist you further because we have to share the picture to the team. So I'm sharing you a link via text message via text. You just. You just need to click on the link. Allow the camera. Please make sure that you should hide your personal details or any other confidential data. OK, on your screen. That's."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:27", "end": "03:28", "text": "Fine. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:28", "end": "04:24", "text": "So I'm sharing you a link on your same mobile phone number which you have called. That is **********. Mmhmm. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:24", "end": "05:17", "text": "No, it's not. I've had nothing through it just yet."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:17", "end": "05:21", "text": "Hello. You haven't received yet?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:21", "end": "05:24", "text": "No, I haven't received it yet. Sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:24", "end": "05:30", "text": "No problem. Can you please help me with your email address? I'll share it on that."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:30", "end": "05:39", "text": "Yeah, that would be L I B Z. So Lima, India. Bravo, Zulu."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:38", "end": "05:42", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:41", "end": "05:43", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:43", "end": "05:46", "text": "One."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:46", "end": "05:51", "text": "At gmail dot com."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:51", "end": "05:58", "text": "Ok, L I B Z **** ** gmail dot com."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:58", "end": "06:01", "text": "Yeah, that's correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:01", "end": "06:22", "text": "Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:22", "end": "06:52", "text": "There we go. So I'll show you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:52", "end": "06:59", "text": "Can you show me connections?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:59", "end": "07:04", "text": "Every other time it said, your account is blocked."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:03", "end": "07:16", "text": "OK, no problem. Ok, can you please show me the backside of your means? Every time when you log in into the VPN, it gives different messages, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:15", "end": "07:16", "text": "Mmhmm."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:16", "end": "07:27", "text": "Ok, show me the backside of your CPU where the land cable ethernet cable has been inserted."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:27", "end": "07:28", "text": "Here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:28", "end": "08:27", "text": "On your PC on your PC, this is monitor. OK, red light is blinking. OK, got it. Can you please unplug this land cable. After unplugging it? Also unplug from the router. The internet cable."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:27", "end": "08:55", "text": "Right? Yeah, that's done. Yeah. I don't want do to it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:54", "end": "09:34", "text": "Ok, have you unplexed from the LAN also? Yeah. OK, what you have to do next that you have to reboot your router and reboot your PC both after rebooting both. Then plug in the land cable from both ends, like put into the router also and seep at the backside CPU. Then turn it on. Then show me. Then again, login into the VPN and check that. What's the error message it gives you?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:34", "end": "11:46", "text": "And I'm just going to wait. Thank. You. Thank you. Thank. You very much."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:45", "end": "12:25", "text": "Hello. Thanks. For. Calling. Thank. You. Thank. You. Its."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:25", "end": "12:30", "text": "Been strange thing now that the account is disabled."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:30", "end": "12:57", "text": "I'm actually, I'm unable to see on the video session. Means that the video session is not working. Can you please, like, close the link and refresh your phone? Means close all the applications on the background, which you open at your phone. Then again, reopen the link. Yeah, because sometimes it gets stuck."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:57", "end": "13:05", "text": "Yeah, that's fine. You're able to see that."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:05", "end": "13:19", "text": "Now, yes, I can able to see that. OK, I got this. You're getting the disabled letter, OK? No problem. You can turn off the camera and stay on the call. I'll escalate this issue to the team, Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:19", "end": "13:22", "text": "Yeah, Thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:21", "end": "13:46", "text": "You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:44", "end": "16:00", "text": "Thank. You. Thank you. You're. Welcome."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:59", "end": "16:19", "text": "Hello. I hope we are still connected. Please bear with me. I'm still working on it. I've escalated your issue to the team. I'm just. We were checking from the back end. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:18", "end": "16:19", "text": "Yeah. Perfect."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:19", "end": "18:17", "text": "Thank you. Thank you. I hope you are still connected. Please bear with me. I'm still working on it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:17", "end": "18:19", "text": "Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:19", "end": "19:12", "text": "OK, I can see that. OK, we have just enabled your account and moved to standard account from inactive. So you have. You have already remembered your old password so you can continue using that and you have to wait for some more time. Like after 15 to 30 minutes you have to log in back. OK, and log in and wait for 30 minutes after login 30 minutes because after that you can try the Z scale and other applications because it takes time to replicate the changes made. So wait for 5 minutes. I'll just wait for on the call. After 5 minutes, try to log in with the same old password. Once you are logged in into your PC, then we can check it out. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:12", "end": "19:14", "text": "Just wait on the call for some moments When?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:14", "end": "19:34", "text": "I'll ask you, You can just log in into their PC. Ok, thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:34", "end": "21:37", "text": "Thank much. you very Hello. Welcome to my lecture."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:37", "end": "26:27", "text": "Thank you so much for staying on the call. Yeah. Please log in and also, please turn on the video session so that I can check it. Yeah. Should I log into the VPN as well? And then wait. Yes. This is the correct procedure to log in into the always logging your VPN first and then windows. Mmhmm. Again, it shows. OK, then wait for some more time. Ok, because once it will be get enabled, so it takes time to replicate the changes which made. OK. Mmhmm. Yeah. After 5 to 10 minutes again, you can log in, close the VPN. Yes. Thank you so much for staying on the call. Hello. Are you still still the same that I'm unable to see on the video session? Just close it and then reopen it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "26:27", "end": "26:41", "text": "That should be."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "26:40", "end": "26:56", "text": "OK. Login."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "26:55", "end": "27:03", "text": "Hello. Thank you. Thank you. Ok?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "27:03", "end": "27:14", "text": "OK, enter correct on your password."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "27:13", "end": "27:35", "text": "Ok. So it should be not in. I have one guy."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "27:34", "end": "27:55", "text": "Yes, yes. Do one thing you can try after 30 minutes directly. You can try for after 30 minutes, OK? And hopefully, yeah, because we have just enable it. It takes time. I'll provide you the ticket number. If any issue will process, you can call back, OK?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "27:55", "end": "27:57", "text": "Ok, perfect."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "27:57", "end": "28:44", "text": "Just give me a moment. I'll provide you the ticket number. Hello. Hello. Thanks. For. Calling. I'm ready with that. It's inc. I for India N for Nancy C. For Charlie."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "28:44", "end": "28:44", "text": "Sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "28:44", "end": "29:13", "text": "Could you just repeat that? Yeah, sure. It's I for India N for Nancy. C for charlie. *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "29:12", "end": "29:14", "text": "2. Ok, perfect."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "29:14", "end": "29:21", "text": "Thank you most welcome. Anything else? Apart from this, I can assist you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "29:20", "end": "29:22", "text": "No, that's everything."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "29:22", "end": "29:59", "text": "Thank you. You're most welcome. So I'll just take only 20 seconds more from you. I'll connect to a short survey post this call where the first survey is for customers wearing on scale of 5 to 15 means very satisfied. And for the second survey, you have to select one, which means your issue has been resolved in first contact. So please read this survey after this call. It is very important. Thank you so much for contacting it. Home Agent support. Have a great day. Take care. Bye."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "29:59", "end": "30:02", "text": "Thanks for giving us a few minutes of your time to complete the it."}]}, {"id": "audio_Call1-b3c4f910-8f25-482b-9369-ad71fc25f912.MP3", "name": "b3c4f910-8f25-482b-9369-ad71fc25f912", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:06", "end": "00:13", "text": "Thanks for calling. My name is. How can I help you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:13", "end": "00:21", "text": "I am not able to log on to my system this morning. OK. You're."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:21", "end": "00:25", "text": "Unable to log in, right."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:24", "end": "00:28", "text": "I'm not able to log in, right? That is correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:28", "end": "00:34", "text": "Ok, is there any error message on the screen?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:33", "end": "00:42", "text": "I'm shutting my system down because I've been trying forever. Can I load it up with you? That way, you can see what happens when I try to sign in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:42", "end": "00:54", "text": "OK, I'm so sorry for the inconvenience caused to you. Could you please help me with your VMS?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:50", "end": "00:56", "text": "*******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:56", "end": "01:08", "text": "One moment. ****** ** I getting it right? Could you please help me with your first and last name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:07", "end": "01:12", "text": "***** *******. Wy."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:12", "end": "01:17", "text": "Could you please let me know since how long you are having this issue?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:17", "end": "01:21", "text": "I started trying to find in 30 minutes ago."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:21", "end": "01:32", "text": "OK, may I have your permission to put your call on hold so that I can check the further information of your account and I'll get back to you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:31", "end": "01:50", "text": "Thank you. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:35", "end": "02:06", "text": "[MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:06", "end": "02:19", "text": "I'll go ahead."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:16", "end": "02:20", "text": "[MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:20", "end": "02:44", "text": "Thank you. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:37", "end": "02:57", "text": "[MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:57", "end": "03:03", "text": "Hello?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:59", "end": "03:28", "text": "[MUSIC] Hello? [MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:28", "end": "03:43", "text": "Thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:35", "end": "05:07", "text": "[MUSIC] [MUSIC] [MUSIC] You. [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:07", "end": "05:12", "text": "Thank you for being online, ma'am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:11", "end": "05:22", "text": "Ma'am. Could you please help me with your mobile phone number so that I can take the S session for you for better understanding. Please help me with that."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:20", "end": "05:25", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:23", "end": "05:28", "text": "*****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:28", "end": "05:33", "text": "Then. *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:33", "end": "05:38", "text": "OK, **********. Right."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:38", "end": "05:39", "text": "Yes. Uhhuh."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:39", "end": "05:45", "text": "Thank you. Kindly request you to please be online for a while."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:44", "end": "06:08", "text": "Ok, Ready for me to find? I did not plan the computer, but on me. I was trying to do a power grind. Ok, let me find it. If you send me the text. I'm sorry. Thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:08", "end": "06:24", "text": "You for being on the line, ma'am. I'll just send a link to your mobile phone. Please click on the link and allow the access of that camera to your mobile phone and show the screen. If there is any confidential information over your screen, please try to hide it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:24", "end": "07:13", "text": "I'll wait. Thank you. Ok. Let's do it now. Can you see all of them?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:13", "end": "07:17", "text": "Would you please try to log on and show that?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:17", "end": "07:29", "text": "Yes, ma'am. Yeah, it's waiting at just a moment. Ok, sure. I had the power after the power drinking while I was waiting for you. I'm sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:28", "end": "07:30", "text": "Sure."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:30", "end": "07:32", "text": "It wasn't. And could you please?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:32", "end": "07:38", "text": "Let me know. The one thing is this the first time you're calling regarding this issue?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:38", "end": "07:41", "text": "Yes. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:40", "end": "07:43", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:43", "end": "08:20", "text": "So I'll let you know when it gets to the part where it phrases up. OK, Floating slowly. Thank Thank. you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:20", "end": "08:37", "text": "You. Thank. You. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:37", "end": "08:49", "text": "Thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:49", "end": "09:07", "text": "You. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:07", "end": "10:00", "text": "Can you hear me? No. Hello. Welcome to my lecture. It was practicing. I."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:00", "end": "10:03", "text": "Hey. Let. Me. See?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:03", "end": "10:24", "text": "I'm putting my authenticator in just a moment. Ok, Ok, ma'am. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:24", "end": "10:44", "text": "Ok. Ok. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:43", "end": "11:09", "text": "Sorry. Sorry. Are you told I'm talking?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:08", "end": "11:16", "text": "Hello. Welcome. To. My."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:16", "end": "11:19", "text": "OK. Do you see where it is now?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:19", "end": "11:22", "text": "Which one? Ma'am?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:22", "end": "12:03", "text": "Do you see where it is now? Yes, ma'am. Its spinning. Ok, well, what has been happening? All. Thank you. What's been happening all morning? It will stop spinning and sit here. I've done that for the last 30 minutes. Okay? It's still. It's still spinning. So hopefully the power grain held. But that's what it's been doing all morning. It's amazing for I hope I haven't followed you for no reason. It didn't. It would not get this far at any point this morning. So maybe the power brain counts, but that screen I gave you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:03", "end": "12:04", "text": "Yes, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:04", "end": "12:14", "text": "That's where it was freezing up all morning. It was freezing up right there. Can you stay with me to make sure it's all the way in? Please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:14", "end": "12:35", "text": "Please try to log in and check, ma'am. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:35", "end": "13:44", "text": "It's already going a little further. So that's a good thing. Thank you. Thank you. Thank you. Ok, let me give you my phone. Ok? I'm still waiting. I've got to go back and do my teeth. It's not a little box. That is so funny. I've waited all morning yet. Finally. Well, I wonder if I could just turn my computer off in the morning for 15 or 20 minutes before I send it note."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:44", "end": "13:47", "text": "Yes. Please try to."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:47", "end": "13:51", "text": "Log in. I'm sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:51", "end": "13:56", "text": "Please try to log in, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:55", "end": "14:12", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:12", "end": "14:31", "text": "It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:31", "end": "14:36", "text": "Can you believe this? This is so sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:35", "end": "14:49", "text": "Thank."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:49", "end": "14:56", "text": "You. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:56", "end": "15:03", "text": "It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:03", "end": "15:10", "text": "Ok, I need to try my phone now. Can you believe that this is crazy?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:10", "end": "15:14", "text": "It's working now, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:13", "end": "15:16", "text": "Yeah, I'll know in just a moment, but yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:16", "end": "15:17", "text": "Yes, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:17", "end": "16:17", "text": "I don't know. It might be the tower. Thank you. Thank you. It's still ******. It feels hanging with me. I think it's just about Got it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:17", "end": "16:19", "text": "Sorry. Huh?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:19", "end": "16:23", "text": "Almost. Not yet, but almost."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:23", "end": "16:27", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:27", "end": "16:35", "text": "Now, if it'll let me get to the other citric side, we'll know in just a minute. If you can bear with me, I'm just nervous because it wouldn't let me all."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:35", "end": "16:37", "text": "Please take your time."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:37", "end": "16:55", "text": "Yeah. It's trying."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:55", "end": "16:58", "text": "Just. A. Moment."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:58", "end": "17:31", "text": "Okay? Sure. Why is it still showing red? Okay, we'll try it. Okay, Now, can you stay with me while I try to get on the other side? I still have to hear one more size. I'm so sorry. I'm keeping you at home."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:31", "end": "17:34", "text": "No problem, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:34", "end": "18:00", "text": "You're kind. Thank you. Just grab my grade for it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:00", "end": "18:07", "text": "Just. One. Moment."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:07", "end": "18:15", "text": "Such a long process. Such a long process. It's OK, ma'am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:14", "end": "18:21", "text": "No problem. Please try to log in all and check it once."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:21", "end": "19:28", "text": "Thank you. Thank. You. Thank you. Thank you. Thank you. Thank you. Thank. You. Thank you. Oh, shoot. I'm sorry. Is that camera still?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:28", "end": "19:36", "text": "Your camera turned off. Ma'am. Could you please click on the link and show the screen?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:35", "end": "20:58", "text": "Yes. So I didn't know it. Hold on. I'm so sorry. Ok, Almost there. Ok, ma'am. It. So far, so good."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:58", "end": "21:00", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:00", "end": "22:09", "text": "Just one more time. But it is like to my credit card, just a moment. Thank. You. Thank you very much. It. OK, I am in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:08", "end": "22:13", "text": "Yes, ma'am. I hope you should resolve."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:13", "end": "22:15", "text": "I'm sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:15", "end": "22:20", "text": "I hope you got resolved, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:19", "end": "22:22", "text": "I'm sorry. Would you repeat that, please?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:22", "end": "22:29", "text": "I hope your issue got resolved."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:28", "end": "22:33", "text": "I'm not really sure what you're saying. I'm still there. I'm sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:33", "end": "22:34", "text": "Ok, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:34", "end": "22:55", "text": "I hope your insurance is required. Ok, let me do this. Hold on. Would you give me a favor on my camera? Keeps going off while I get my grid card. Whatever you're saying, dealing. Can you type it in our chat hair below the camera?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:55", "end": "22:57", "text": "Yes, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:57", "end": "23:42", "text": "It. Is my camera not working anymore. Yes, My issue is resolved. Yes, I got him. Well, I receive a ticket number, man."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:42", "end": "24:12", "text": "Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "24:12", "end": "24:53", "text": "Is that better? Yes, ma'am. Online."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "24:53", "end": "24:58", "text": "Thank you for being online, ma'am. Could you please note down the ticket number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "24:58", "end": "25:01", "text": "Yes, I'm ready when you are."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "25:00", "end": "25:06", "text": "Yes, ma'am. It's all up. Case Inc."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "25:06", "end": "25:08", "text": "Please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "25:08", "end": "25:23", "text": "I for India N for November C as Charlie. ******. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "25:23", "end": "25:25", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "25:24", "end": "25:28", "text": "***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "25:27", "end": "25:30", "text": "May I repeat it?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "25:30", "end": "25:33", "text": "Sure, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "25:33", "end": "25:46", "text": "Indian. Nancy. Charlie. ***. ******. Is that correct?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "25:46", "end": "25:53", "text": "Yes, ma'am. That is right. Is there anything else that I can help you with?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "25:53", "end": "25:57", "text": "No, I'd just like to thank you for your help. I sure appreciate it. Thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "25:57", "end": "26:32", "text": "You, ma'am. I would connect you to the short survey Post this call where the first survey is for the customer satisfaction. Where you can write on the scale of **** ***** very satisfied. And second survey is for the first contact resolution where you can select one, which means your issue got resolved on the first contact. Thank you for calling. It helps us support. Have a great day ahead, ma'am. This is the first interaction between you and me, so I kindly request you to please fill the survey. It will be helpful for me. Thank you. Have a great day ahead. Bye bye."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "26:32", "end": "27:41", "text": "Thank you. Thank you. Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One the strongest disagreement. Remember, thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-b95c117a-f33c-450f-bc42-06765b600b6d.MP3", "name": "b95c117a-f33c-450f-bc42-06765b600b6d", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:05", "end": "00:11", "text": "For calling it best support. My name is ******. How can I assist you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:11", "end": "00:16", "text": "Hi. Yes. I'm just calling to get a new camera."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:16", "end": "00:23", "text": "So as understood that you're requesting for a new web camera, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:22", "end": "00:23", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:23", "end": "00:30", "text": "OK, so what was the exact issue with your webcam?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:30", "end": "00:41", "text": "So every time I would try to go into a meeting, it would accept me out of the meeting every single time, and my camera won't stay on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:40", "end": "00:52", "text": "Ok, so it is like when you were on meeting, the camera went off and it won't turn around. Right? While you're on meeting?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:51", "end": "01:00", "text": "Yes. And then if it does turn on and it turns back off, kicks me out of the meeting. And it's like a nonstop thing."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:00", "end": "01:17", "text": "Ok, Understood. And sorry for the inconvenience because you, due to this, we'll definitely help you out. And every requirement will order for a new webcam as you requested. And before posting further, could you please just confirm your BMS ID?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:17", "end": "01:23", "text": "Yes, it's *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:23", "end": "02:34", "text": "Perfect. And it may take me a moment to review your information. Can I place your call on hold for the same? Yes. Thank you. Please be on hold. [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Yes. Thanks for being on hold. Please confirm your first and last name."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:33", "end": "02:37", "text": "Yes, it's loaded."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:37", "end": "02:43", "text": "Ok, Your supervisor's name, please."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:42", "end": "02:50", "text": "Oh, I'm still in training, so I'm going to say my trainer's name is *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:50", "end": "02:55", "text": "Right. You're right. And thanks for the cancelation."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:55", "end": "02:58", "text": "S a Y L E X?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:58", "end": "03:18", "text": "Yes, you're right. Thanks for the verification. Just a second. Please let me review your account first, and then we'll go with some initial troubleshooting steps. Is this the first time that you're, like, facing the facing any issues with your webcam or you had an already an issue with your webcam?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:17", "end": "03:24", "text": "I've already had the issue with my webcam."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:24", "end": "03:42", "text": "Ok, and I can see that your account is fine. There is no issue. So just to confirm, is this your mobile number that you are calling from? **********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:41", "end": "03:44", "text": "Yes. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:44", "end": "03:52", "text": "And please let me know. Like, is there any physical damage on your webcam?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:52", "end": "03:54", "text": "I'm sorry, I didn't hear you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:54", "end": "03:59", "text": "I'm sorry. Can you hear me now?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:58", "end": "03:59", "text": "Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:59", "end": "04:07", "text": "So I'm asking. So is there any physical damage on your webcam?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:06", "end": "04:10", "text": "No, sir. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:10", "end": "04:37", "text": "And I'm going to send you one as we are supporting link to this number. OK, you'll be receiving one text message. Actually, this is in video session link, and it can access your mobile camera. So please kindly hide or minimize any confidential information from your end before taking on the link. And just show me the webcam. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:36", "end": "04:41", "text": "Okay. Do you want me to put the webcam back up?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:40", "end": "04:53", "text": "Yes. Please. Please connect your webcam and try to turn it on and is like any indication light on your webcam."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:53", "end": "05:05", "text": "So I can't turn on my. I can't try to turn on my camera because I'm currently in a meeting and it will kick me out again."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:05", "end": "05:09", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:09", "end": "05:21", "text": "But I don't want to show you how it turns like blue and stuff, but it just like it's out itself."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:20", "end": "05:51", "text": "Ok, Understood. No worries. So you will receive one text message. Please click on the link and show me the webcam once. Ok? Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:51", "end": "05:52", "text": "Hello."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:51", "end": "06:23", "text": "Yes. Yes. Yeah, I can. OK, And can you please show me at back of your webcam? Like, you know, the serial number of your webcam? I need the serial number. All right. So have you tried, like, currently? OK? Currently, you're using your webcam. So have you tried by changing the ports, like, you know, swap the ports from."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:23", "end": "06:32", "text": "It did not work. It still did the exact same thing. Mmhmm."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:31", "end": "06:42", "text": "Ok, no worries. And do you have any space like webcam or any personal desktop to test?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:42", "end": "06:45", "text": "No. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:45", "end": "07:05", "text": "That's fine. No worries. And as of now, it is working. But like you said, like after some time, it is not working at it. It kicks you out from your meeting, and sometimes the web won't turn on back automatically turns off, right? Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:05", "end": "07:28", "text": "Yes, it'll turn blue, and then it will, uh, I'll be only listening or something or I'll type a message, and then it just sets my camera off, and we have to be on camera. Let's see right now. And I can't even go to open my camera if I wanted to. And so it will let me. And then just stop at times."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:28", "end": "07:38", "text": "Right. You are currently connected your web, but I can see that it's saying no device selected. Right."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:38", "end": "07:48", "text": "Correct. Everything. Like I don't. I try to unplug it, plug it in somewhere else, like it's still doing the same thing."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:48", "end": "07:59", "text": "OK, Understood. And I apologize for that. No worries. You can turn off your camera and just allow me for 2 minutes. I will check and I'll get back to you with an update. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:59", "end": "08:01", "text": "OK, thank you. You're welcome."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:01", "end": "10:11", "text": "Please be on hold. [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Yes. Thank you so much for being on hold. I really appreciate your patience and things. And can you please let me know? This is the first time that you have, like, contacted Help us for this issue. You had a conversation with any one of these specialists before. Hello. Can I have it?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:11", "end": "10:21", "text": "Yes, I can hear you. I called somewhere earlier, but the call dropped or something. I'm not sure if he hung up or what happened."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:20", "end": "10:56", "text": "Yeah. OK, no worries. And as you're already done, all possible troubleshooting steps. And that too. I have already checked on by taking the SFA. No worries. As you requested. We will provide you and we will order a new webcam as you requested. And please confirm your shipping address."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:48", "end": "10:58", "text": "*** ** ******** ****, ****, ********* *****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:58", "end": "11:27", "text": "Ok, just a second, please. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:27", "end": "11:57", "text": "Thank you. Thank you. It. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:57", "end": "12:10", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:09", "end": "12:35", "text": "Thank. You. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:35", "end": "12:54", "text": "Yes. Thanks for being on hold. Could you please just click on the same link which I have shared you before? Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:54", "end": "12:57", "text": "Ok, what do you want me to show you?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:57", "end": "13:07", "text": "no. No, Just have sent you one text. You can reply back with your address. Just enter your address. You can send me back."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:07", "end": "13:12", "text": "I'll just text you my address, right? Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:12", "end": "13:29", "text": "Ok, complete address. Ok. I. Did I got you? And you can turn off your camera now and please be on hold for 2 minutes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:29", "end": "13:43", "text": "OK? Yeah. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:43", "end": "14:21", "text": "Please."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:21", "end": "14:43", "text": "Continue to hold."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:43", "end": "15:36", "text": "You. Thank. You. Thank. Thank. You. Ok. Thank. You. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:36", "end": "15:42", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:42", "end": "16:10", "text": "Thank. You. Thank. You? Yes. Thanks for being on hold. I'm still working on your replacement. Please bear with me."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:10", "end": "16:12", "text": "I'm sorry. I didn't hear you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:12", "end": "16:18", "text": "Yeah, I'm still working on your replacement. Please be on hold. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:18", "end": "16:19", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:19", "end": "18:03", "text": "Thank you. Yes. Thanks for being on hold. Could you please help me with your personal email address?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:02", "end": "18:11", "text": "Yes. My email is **** ***** **@*****.***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:11", "end": "18:21", "text": "Please bear with me. I."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:21", "end": "18:48", "text": "It. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:48", "end": "20:10", "text": "Ok. Thank. You. Thank. You. Thank. You. Thank. You. You. Thank. Thank. You. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:10", "end": "20:23", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:23", "end": "20:36", "text": "Thank. You. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:36", "end": "20:53", "text": "Hello. Hello. Do you want to take a knack or anything?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:53", "end": "20:57", "text": "Oh. I'm. Done. With. This."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:57", "end": "21:11", "text": "Please. All right, *****, come on. We want to go downstairs for a little bit. Nana's going to take a net and then we'll come back and put. Come on. Come down. Yeah. And brothers will come down and play."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:11", "end": "21:16", "text": "Come. On. *****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:16", "end": "21:41", "text": "I'm leaving you. OK? Ok, you're welcome. We'll go number and find it to go down. So now I know that."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:40", "end": "21:43", "text": "Are. You. Going. To."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:43", "end": "23:11", "text": "Produce the text messaging. Hello? Oh, hush. No. I'll see you whenever you go. I'll see you whenever we can. I'm going down to hang out, brothers. It is shut off. Its off. Its off. Goodbye. I'm leaving you up here. Bye bye."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:11", "end": "23:21", "text": "Thank you so much for being on hold. I really appreciate your patience and time. Please bear with me. I'm still on your replacement. Ok, just allow me for 2 more minutes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "23:21", "end": "23:23", "text": "OK? You're good."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "23:23", "end": "26:25", "text": "Thank you. Thank you so much for being on hold. Could you please note down your ticket number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "26:24", "end": "26:28", "text": "Yes one. Ok, I'm ready."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "26:27", "end": "26:34", "text": "Yes, that would be Inc. I for India N for November C for Charlie. Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "26:34", "end": "26:39", "text": "Can you hear me? Yes C for Charlie?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "26:39", "end": "27:02", "text": "No, it is Inc. I for India and for Nancy. C for Charlie. *********. Could you please repeat one?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "27:01", "end": "27:17", "text": "Yes D for Charlie. I for India N for Nick. C for Charlie. *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "27:17", "end": "27:31", "text": "Yes. But starting from Inc. I as in India N as in Nancy C as in Charlie, Inc."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "27:30", "end": "27:33", "text": "Oh, I N Z for Zebra."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "27:33", "end": "27:41", "text": "no No, Z as in cat Charlie."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "27:40", "end": "27:45", "text": "OK, so its C I N C."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "27:45", "end": "27:56", "text": "No, no. There is no Z. Please. I will repeat again from the beginning, The first letter would be I as in India and the second letter."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "27:56", "end": "27:58", "text": "M n as in Nancy."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "27:58", "end": "28:12", "text": "And the 3rd letter C as in Charlie. That's it. So, inc."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "28:11", "end": "28:17", "text": "Yes, I N C *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "28:17", "end": "28:27", "text": "Perfect. Yes. This is your ticket number for your replacement of webcam. And is there anything else I can do to help apart from this?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "28:27", "end": "28:30", "text": "No, that's it. Thank you so much. You're most welcome."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "28:30", "end": "28:53", "text": "And also one more thing I would like to connect. One shot post this call where the first service is for customer satisfaction, wherein you can write on the scale of 5 to one where 5 unsatisfied and second service is for first contact resolution where you can select one, which means your issue was resolved in the first contact. And it was nice talking to you and thank you for contact. Night. Help the support."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "28:52", "end": "28:56", "text": "Have a great day. Take care. Bye bye."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "28:56", "end": "29:37", "text": "Thank. You. Today."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "29:36", "end": "29:49", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist?"}]}, {"id": "audio_Call1-bd0df969-0195-4e6f-96b7-e57e69a8b489.MP3", "name": "bd0df969-0195-4e6f-96b7-e57e69a8b489", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:06", "end": "00:13", "text": "Thank you for conducting idle manually. How may I assist you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:13", "end": "00:23", "text": "Hello. My name is ******. I was calling because I am locked out of my opening page and I just need to get the phone back in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:23", "end": "00:31", "text": "Ok, so the system. Ok, so we logged out. Sure, ma'am. I'll."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:31", "end": "00:39", "text": "Have you on this when you first? Oh, yes. In the lockout work."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:39", "end": "00:51", "text": "Sure, ma'am. I'll help you in this. I'm sorry for the inconvenience. Can you please share me your BMS ID."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:47", "end": "00:54", "text": "*******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:54", "end": "01:02", "text": "Okay. On 52797, P 6. And may I know your name, please?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:02", "end": "01:05", "text": "Yes. *****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:05", "end": "01:10", "text": "Oh, yeah. *******. Correct. And may I know your name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:10", "end": "01:16", "text": "My name is ******. ******. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:15", "end": "01:25", "text": "Okay, thank you for the. So please, may I put your call on a mute for 2 minutes to check and verify the."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:24", "end": "01:26", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:26", "end": "02:21", "text": "Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:21", "end": "02:47", "text": "Thank. You. Thank you. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:47", "end": "03:01", "text": "Okay, ma'am. Thank you for being on the stay. So as I checked from my end, your account is not logged. Can you please rewrite it again?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:01", "end": "03:27", "text": "Yes, I did. I just did. It's not. I can try again, but it's not letting me in. So. 50 minutes. I'll just try it again. If not, I don't want anything."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:27", "end": "03:32", "text": "Ok, I'm just taking the dug in."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:31", "end": "03:50", "text": "Yeah. It's saying my password is incorrect. My password is not incorrect."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:49", "end": "04:27", "text": "Okay, It is saying phosphory is incorrect. So, Okay, ma'am, but you're okay. I'm just checking it once again and. Swear account is not logged and the password. If you're entering the right part, can you please check and carefully drive the password because the account is not logged as I checked from mine twice."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:27", "end": "05:18", "text": "I keep checking password. I know it's overflowed. It's not letting me go in. O B E R I packet names. O B E R flo ****. It said the account is currently locked out. It may not. It may not be logged onto."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:18", "end": "05:59", "text": "Okay, ma'am, just. I need to just checking it again. Just one minute. And. May I know which application you are trying to log in? Because as I checked from my end, it is not showing the account is logged. May I know which application? Like as you are entering through the system? So are you connecting to the VPN? Then you are seeing this message in your account a lot."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:59", "end": "06:13", "text": "Yes. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:13", "end": "06:24", "text": "Okay, ma'am, can you please share me the cell phone number and I'm going to send you one video session, legal performance, and you can show me this."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:24", "end": "06:32", "text": "Yes. 9. Oh, ****. OK, ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:32", "end": "07:22", "text": "*****. So, ma'am, I'm sending you one link. You will receive a text message. There is a link in it. Please open the link and before opening any procedure from the screen and please show me the screen. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:22", "end": "07:49", "text": "Let me see something that I just hang up just now. Ok. So this is ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:48", "end": "08:10", "text": "I'm not able to see it. Just a minute. Is not. Working."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:09", "end": "08:12", "text": "Can you see that burning?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:11", "end": "08:46", "text": "Oh, no, ma'am. So this SV link is not working on this SDA. I have shared you another. Another link that is live dot is steamed dot com. The message. Can you please check? Did you receive my message? Slide dots dot com and there is a code. So please copy and paste it in the phone browser, any of the browser. And then please open that because SV is not working currently."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:46", "end": "08:50", "text": "Can you see there?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:50", "end": "08:54", "text": "No, ma'am."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:54", "end": "08:56", "text": "I don't know what's going on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:56", "end": "09:17", "text": "Yes, ma'am. So might be. This link is not working. That is on this connection. I shared you another on this as we have shared you another message that is livedmeat dot com. So please copy this and open it in the one and show me the scheme."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:17", "end": "09:23", "text": "I don't have AI don't have nothing."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:23", "end": "09:42", "text": "As you open the ice cream, the SBA once again, which you try to open it once again, I can send the message once again. I'm. Sorry. Its. Open."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:42", "end": "09:44", "text": "So I sent it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:44", "end": "10:22", "text": "Also, this is so you need to, like, copy, copy it. And like, open it in any browser of the phone and through that, you can show me the screen."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:22", "end": "10:29", "text": "Thank you. Now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:29", "end": "10:38", "text": "No. ***, have you tried to open the links? Which I assure you, live dot este min dot com?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:38", "end": "10:43", "text": "Yes. That's why I'm there in the outside."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:42", "end": "10:46", "text": "Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:46", "end": "10:50", "text": "Can you be there? Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:50", "end": "11:09", "text": "Okay, ma'am. I'm connecting it. Thank you. Just one. Just a second. Oh, yes, I can see. So, ma'am, the error. You are getting inside the citrix."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:09", "end": "11:22", "text": "Yes. I think I'm into the Citrix. I don't really know who I'm in. This looks warm. I forgot what side this is. This is for us. I don't really know what side this is."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:21", "end": "11:54", "text": "Okay, So can you please put it on black box. In the middle of this? In the middle of the scene. You will see one black box and then click on it and then minimize just in the middle of the scene, like a top middle. Show me the screen."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:54", "end": "11:55", "text": "This."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:54", "end": "12:54", "text": "Yes. Yes, Yes. This one believes. Minimize. Click on it, then click on. Minimize. Okay, now, please minimize the issue as well. Okay, now, please. Right click on the screen. Config consideration. Okay, now please tell me there is ND and then E and that is 88 to 088747 b one a N D E 8. *******. Yeah. B one A."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:54", "end": "12:56", "text": "Do I talk that?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:56", "end": "18:03", "text": "Hi, *****. Just one minute. I need to check it. I have captured it. Just one minute. Okay, ma'am, please close the phone camera. I'm going to perform one troubleshoot in your system. So please stay online. So, ma'am, I've taken a remote of the system now and going to perform one task. I've already pushed the update from here. So I need to perform one task. Please. Continue. To. Hold. Thank."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:03", "end": "18:32", "text": "You. Thank you. Thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:32", "end": "20:01", "text": "You. Thank. You. So, ma'am, once your system, the leg open, then please open the tool and check. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:01", "end": "21:01", "text": "Mmhmm. I think it's. Is there anything that I need to do?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:01", "end": "21:16", "text": "So, ma'am, please open and check. I have already posted D of kid and so you can please open the system. The radio and sick. Are you able to log in?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:16", "end": "21:23", "text": "So you want me to just log in as if I'm usually logging in talking at the time?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:23", "end": "21:28", "text": "Oh, yes, yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:28", "end": "21:34", "text": "Well, you want me to do it. You're doing it because I think its remote. Share what you want me to do. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:34", "end": "21:40", "text": "Oh, yeah. So you do the TPV VdS."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:40", "end": "21:42", "text": "Say that again."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:42", "end": "21:47", "text": "So, ma'am, you log into the TPV VDA, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:47", "end": "21:52", "text": "I do VD."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:51", "end": "21:58", "text": "Okay, You please log in. You log in and check."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:58", "end": "22:02", "text": "Right. So I'm asking, do you want me to go ahead and log in now?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:02", "end": "25:30", "text": "Yes. Yes. Please log in. So, ma'am, I have left remonstration. So you please log in and check and confirm."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "25:30", "end": "28:30", "text": "Right? Yeah, that's what we do right now. It looks like everything's going through."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "28:29", "end": "28:38", "text": "Okay. Okay, great. So please note down that you give number one, share 80."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "28:37", "end": "28:54", "text": "Okay, give me one second. Let me get a pen. Okay. I'm ready."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "28:54", "end": "29:13", "text": "Okay, so the ticket number is uppercase. I for India. Uppercase N from November. Uppercase C for Charlie. 03 or *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "29:13", "end": "29:21", "text": "Okay. I inclined, controlling. *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "29:21", "end": "29:26", "text": "5 years, Correct. And is there anything else I can help?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "29:26", "end": "29:30", "text": "No, I think that was it. I just could not get in. Thank you so much. Okay, okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "29:30", "end": "30:01", "text": "You're welcome. And also, I would connect you to a short survey for this Call midday for service for the customer satisfaction. Therein. We can date on this scale of 5 to one. There are 5 meters design and the second survey for the first contact is efficient. We are in. You can speak to one, which means the issue was resolved in the forest. Contact. Thank you for contacting ID. Support. Have a great day, Ed, and take care, Marai. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "30:01", "end": "30:03", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "30:02", "end": "30:05", "text": "Yeah, Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "30:05", "end": "30:08", "text": "Thanks for giving us a few minutes of your time to complete the."}]}, {"id": "audio_Call1-c03bf72e-d8f4-452f-9ce9-1e90668d51dc.MP3", "name": "c03bf72e-d8f4-452f-9ce9-1e90668d51dc", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:07", "end": "13:29", "text": "You for calling ID Health support. My name is ****. How may I help you today? Hi. This is ******. I was trying to unlock my account. Okay, I apologize for the inconvenience caused to you. And I understood. You are facing issue with your account. I'm low. Surely I will help you on this. I need to verify your detail first. So kindly help me with your BMS number. **********. So it is ***********. Yeah. ****. Let me pull up your details, sir. Give me one sec. Thank you. On hold all. May I know? What is your first name and the last name? What can you say? What is your supervisor name? ****** *******? No. What is your higher date? I think it was November. No November. But its wrong. I covered. And what is the year of your higher date? ****. And your login name is ***** dot ****. And what is the MMMS showing your account when you're trying to log in. My first initial? No. What is? DIAMS is showing your account when you are trying to log in. Sorry. Could you repeat that? What is the error message showing your account when you are trying to log in? Its mine right now, but I already. I already am logging in your account. Are you already loaded? Yeah, I already unloaded your account. So it is working now. Okay, one moment. Please let me know when its working. Then I will provide you a ticket number regarding this call. Ok, I'm ready. PR ticket number. Regarding this call is inc *********. Can you repeat that for me? One more time? Inc *********. Apart from this, Is there anything else I can help you today? No, it's not. Is there anything else I can help you today? One moment I tried to put my password in again and then let me enter and we'll try it again. I'm trying to check. Yeah, they're still not letting me sign in. It's a reference account. It's currently locked out to me. And your login name is ***** dot ****. No, it's. Well, that's my username, but my password is. 23. Don't share your password with me. Don't share your password with Miss. I am asking you. Your username is your last name is ***** dot ****. Okay, please stay on the line. Let me check your account one more time. Thank you for being on hold. Please stay on the line, sir. I am still checking your account. Give me one moment. All right, I'm still here. Thank you for being on hold. Please. To log in one more time. Yeah, it's still not allowing me to sign in. Yes, it is not working. It's still not working. Hi. Just check your account and your account is all good. Please do one thing. Please restart your computer and then try to log in in your account. Okay. Yeah, I was working. Are you and your ticket number is same. Inc *********. But apart from this, is there anything else I can help you today? No, thanks. And so your visa has been all now. So I will connect your short survey. Pause this call where this service provided on a scale of ***** ***** very satisfied. And this service for post contact resolution we had invested lack one, which we introduced on a first contact. Thank you for calling **** Heelbick support."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:28", "end": "14:09", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve press 2, if it still has not been resolved. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly."}]}, {"id": "audio_Call1-c1fb07f4-b3bf-4ca3-b397-c15e4dd2905c.MP3", "name": "c1fb07f4-b3bf-4ca3-b397-c15e4dd2905c", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:07", "end": "00:16", "text": "Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:16", "end": "02:57", "text": "Can you hear me? Hello? Yes. Yeah, I need assistance because I need to change my password. However, it was routed through Microsoft Authenticator app. This is the first thing because my CP was changed to my first 11. Yeah. So what about you need help to log in your system or you need help on Microsoft Authenticator setup. It is a Microsoft Authenticator setup, right? Yes. So basically you are able to log in your system, but you are not able to log in your TP account, right? Yeah, I have not yet set up with Microsoft Authenticator. Ok, OK, got it. Thank you for your confirmation. So I understand your issue and I'm sorry to hear that. Let me help you to resolve your concern and surely I will assist you on this. May I know your DMS ID *******. Ok, your first name and last name. ****** ******. OK, got it. In order to help you for Microsoft Authenticator setup, I need a few more information from your. It is basically a security questions. Uh, let me know you are hiring that September ****. Ok, you are on site location now. OK, reporting manager name. OK, and your ENT username. It is your last name. Dot ***. Ok, got it. May I put your call on hold to escalate issue with the level team now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:57", "end": "04:14", "text": "Thank. You. Thank. You much. very Thank. You. Very. Much. Hello. Welcome lecture. my to"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:13", "end": "04:44", "text": "Hello, sir. Thank you for being on hold. I have escalated issue with the level today. So please be online. Ok, OK, thank you. You're welcome."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:36", "end": "06:27", "text": "Thank you. Thank you. Thank. You. Very. Much. Thank you. Thank. You very much. Thank you. Thank you. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:27", "end": "08:32", "text": "Hello, sir. Thank you for being on hold. So the level 2 term is. Asking for the error message. So what is the error message you are getting while. Accessing your TP account? Yeah, well, I tried to change my password and it was routed to approve sign in the request. Open your authenticator up and up the request. Enter the number if prompted. The problem is I am not set up with myself Authenticator for PPS. I guess I need a QR code to scan them, so I connected with PPS. So basically there is no error. Any other message, right? No error that I am not set up with Microsoft. No error message. Once you try to log back into your TK account, it's sent you one. Approved request right on your login account. It is. But on your I already have the in my course of authenticator in my phone. However, I just need to scan a QR code. Ok, so you have the Microsoft, but there is no notification, right? You are not getting any notification."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:32", "end": "08:35", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:34", "end": "09:27", "text": "OK reported no error message. No notification. On MT. Mobile."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:18", "end": "10:45", "text": "It's. Thank you. Thank you. Thank you. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:45", "end": "12:26", "text": "OK, sir. Thank you for having me on hold. I will share you guidelines on your mobile on your personal email mobile. Ok, now could you please provide me your postal email address? Yep. Yes. Galliego. That's my last name. G A L L E G O. And that's for Julius. My first name. At ymail dot com. That's Yahoo. It is Yahoo. Mail dot com. It's Yankee Mary Alpha India larry dot com. Ok, I will send you one test of email. Ok, first. Let me know whenever you have received any email. Ok. Yeah. I was able to receive your email. Ok, let me send you another email now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:26", "end": "13:13", "text": "Thank. You. Thank. You. Thank. You. Hello? Welcome to my lecture. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:13", "end": "14:11", "text": "So, sir, thank you for being on hold. I have sent you an. Email, OK, you please follow all the steps which is mentioned in the email. Ok, so please take your time."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:11", "end": "16:13", "text": "Thank you. Thank you. Hello. Hello, hello. you. Thank Thank you. Thank you. Thank you. Thank you. Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:13", "end": "16:15", "text": "Welcome to my lecture."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:15", "end": "27:13", "text": "You're welcome. Thank you. you. Thank Thank you. Thank you. Thank you. Thank you. Thank. You. Thank you. Thank you. Thank you. you. Thank Thank you. Thank. You. Thank you. Thank you. Thank you. Thank you. Thank you. Thank. You. Thank you. Thank you. Thank you. Please continue to hold your. Business. You're welcome. Ok. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. you. Thank Thank you. Thank you. Let's. See? Thank. You. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank. You. Thank you. Thank you. Hello. Hello. Hello. Hello. Hello. Welcome to my lecture. Thank you. Thank you. Thank you. Hello. Welcome to my lecture. Hello. Welcome my lecture. to Please continue to. Hold. Thank. You. Thank you. It's. Hello. Welcome to my lecture. Thank you. Thank you. Thank you. Thank. You very much. Thank you. much. Very Thank. You. Thank you. Thank. You. Thank you. Thank. You. Thank you. Hello. Welcome to my lecture. Hello. Welcome lecture. to my Thank you. Thank. You. Thank you. you. Thank Thank you. Thank you. Thank. You. you. Thank Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "27:13", "end": "30:39", "text": "Yep. I'm good. I was able to change my password. Ok, great. Now I will provide you a reference ticket number of this call. Ok, so could you please note down your reference ticket number of this call whenever you are ready. I'm ready. Ok, it is inc. *********. Let me repeat it again. Yeah, it is Inc *********. Yeah, I got it. And I will also repeat that through email. Thank you for. Yeah, I got a notification as well. OK, so, sir, is there anything else I can help you with? Yeah, you're welcome. So, sir, I would connect you to a short survey post this call where the first service for the customer satisfaction. Where again, on scale of 5 to one, we are finding very satisfied. And the second service is for the first contact resolution where the cancelation number one, which means every issue was resolved in the first contact. So, sir, is this the first day you're calling the help regarding this issue? Yep, that's fine. Ok, great. So, sir, thank you for contacting Elvis. You have a great day ahead. Thank you. Bye. Take care. Bye bye. Bye. Thanks for giving us a few minutes of your time to complete the IT helpd desk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist On today's call, enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2 if it still has not been resolved. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-c2bdacb3-8498-4838-815c-979887f84847.MP3", "name": "c2bdacb3-8498-4838-815c-979887f84847", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:09", "end": "00:14", "text": "Thank you for calling Ideal deck support. My name is ******. How can I help you?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:14", "end": "00:22", "text": "Hi, I'm *****, so I just want to reset my N account password."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:22", "end": "00:34", "text": "Ok, Ok, sorry for the ingredient interface. I was sure you regarding the same. May I know the exact address which you are dating."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:34", "end": "00:48", "text": "So its saying, like invalid. Sorry. One second. It's saying invalid logging in name or password."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:47", "end": "00:55", "text": "Okay, please allow me BMS ident."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:55", "end": "00:59", "text": "BMS ID number. You ask me."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:58", "end": "01:01", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:01", "end": "01:09", "text": "One second. So its papa also Victor."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:09", "end": "01:15", "text": "The MS ID 7 digits number, the MMS ID."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:14", "end": "01:28", "text": "Ok, so yes, ma'am. It's *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:28", "end": "01:32", "text": "Also confirm your name."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:31", "end": "01:34", "text": "*****. *****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:33", "end": "01:41", "text": "Okay. Thank you so much for the confirmation. And may I know. Are you a VPN user or a VDI user?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:41", "end": "01:42", "text": "Users."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:42", "end": "01:51", "text": "Okay, thank you so much for the confirmation. So if I take a moment to review our information from my end, may I put you on hold for the same?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:50", "end": "01:52", "text": "Yeah, sure. Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:52", "end": "02:05", "text": "Thank you. All about minute to add the number of RBC. You can check there speaker on your system. That number is setting from TS and numbers. So please go ahead."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:05", "end": "02:17", "text": "Oh, it's a company laptop. Actually, it's not the TP one. It's the client laptop. I don't think we do have the number, but I can see the 6 digit map, but I can give you the number if you need."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:17", "end": "02:31", "text": "T number. So please provide. Okay, this way. So which password you are using willing here to log in the same password as you are using on the PP."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:31", "end": "02:39", "text": "So they sent me an email when I joined, so I highly use the same username and the password."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:38", "end": "02:44", "text": "And do you have any ticket number regarding this?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:44", "end": "02:57", "text": "No, I haven't realized any issue. So I just checked with my manager. Yeah, they said it's the account number. So you have to call to people."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:57", "end": "03:00", "text": "And you are the user, right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:00", "end": "03:02", "text": "Yeah. VPN user."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:02", "end": "03:08", "text": "Ok, so it may take a moment to review our information from my end. May I put you on hold for the same?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:08", "end": "03:10", "text": "Yeah, sure."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:10", "end": "03:56", "text": "Ok, thank you. Let. Me see. Let me see. Thank you so much for your patience so far. Checking on your rebound. I need to authenticate you with some security questions. So can I proceed with that?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:56", "end": "03:58", "text": "Yeah, sure. Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:57", "end": "04:03", "text": "Ok, sorry. Your first question is, what is your higher month and ear in this company?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:03", "end": "04:08", "text": "So I joined August 1820 25."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:07", "end": "04:12", "text": "Ok, what is our manager name?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:11", "end": "04:15", "text": "****** ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:15", "end": "04:20", "text": "What is your location?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:19", "end": "04:22", "text": "******. *****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:21", "end": "04:28", "text": "Okay, then vacation has done. Now I'm going to check with the team. Please turn on the line. Allow me a moment. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:28", "end": "04:48", "text": "Nobody."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:46", "end": "06:26", "text": "Hello. Welcome to my LE. Thank. You. you. Thank Thank you. Thank you. Thank you. Thank. You. All right. Thank you. Thank you so much for your patience. Please stay on the line. We're still checking with the team once I will get the response from the team. We'll let you know. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:26", "end": "07:05", "text": "You're welcome."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:05", "end": "07:54", "text": "Thank you very much. Thank you. Thank you. you. Thank It's. OK. Thank you. Thank you so much for your patience. So please cite on the past service I created for you. Are you ready?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:54", "end": "08:01", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:01", "end": "08:13", "text": "So it is uppercase O. As in Oscar. Lower gifts C As in Charlie."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:12", "end": "08:14", "text": "Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:14", "end": "08:23", "text": "Lorgis T. As in tango. Yeah, at."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:22", "end": "08:25", "text": "Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:24", "end": "08:37", "text": "****. ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:37", "end": "08:40", "text": "So this is the new password, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:40", "end": "09:06", "text": "Yes. So try to document this and let me know."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:06", "end": "09:29", "text": "Something that's wrong. Just bear with me, please. Yeah, its working."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:29", "end": "10:47", "text": "Okay, it is great. So please stay on the line so that I can provide a ticket number with that for you. Okay. No. Allow me one moment. It's. Thank you so much for your patience. So please side with the kit number which I created for you. Are you ready? I'm ready. So it is. I as in India N as in Nancy C. As in Charlie. *****. That's."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:47", "end": "10:52", "text": "It. Sorry. *****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:52", "end": "10:58", "text": "Again. *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:57", "end": "11:00", "text": "***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:59", "end": "11:03", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:03", "end": "11:09", "text": "So it's inc. *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:09", "end": "11:14", "text": "That is so right now by from this. Is there anything else I can help you with?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:14", "end": "11:16", "text": "Uh, no, I need that."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:16", "end": "11:35", "text": "Okay, so I would connect you to a short survey post call. We're in the first service for the customer section wherein you can rate on the scale of 5 to 15 main centuries site as the second service or the first contact evolution wearing select one, which means your issue was resolved in the first contact. Thank you for calling it duck support a brief day. Bye."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:35", "end": "12:22", "text": "You don't have access for giving us a few minutes of your time to complete the IT helps desk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? And thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement. And one means you strongly disagree with it made it easy for you to handle your issue. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-c7f6bb9a-c1f5-48f2-9322-7251f0fa996b.MP3", "name": "c7f6bb9a-c1f5-48f2-9322-7251f0fa996b", "utterances": [{"speaker": "Customer", "speaker_type": "customer", "start": "00:05", "end": "00:10", "text": "Thanks for calling IGL desk. My name is *****. How may I assist you?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:10", "end": "00:19", "text": "Hey, I was calling because I am locked out of my PC to log in."}, {"speaker": "Customer", "speaker_type": "customer", "start": "00:18", "end": "00:32", "text": "Apologize for the inconvenience caused to you, ma'am. But do not worry. I will try my best to solve your issue. Please confirm your BMS number."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:29", "end": "00:37", "text": "*******."}, {"speaker": "Customer", "speaker_type": "customer", "start": "00:37", "end": "00:42", "text": "Please confirm your first name and the last name."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:41", "end": "00:45", "text": "******* *******."}, {"speaker": "Customer", "speaker_type": "customer", "start": "00:45", "end": "00:49", "text": "Please confirm your username."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:49", "end": "00:56", "text": "Morlet dot 5 at telecoform dot com."}, {"speaker": "Customer", "speaker_type": "customer", "start": "00:55", "end": "01:01", "text": "What's the name of your manager?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:59", "end": "01:14", "text": "******* *******."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:14", "end": "01:18", "text": "Please confirm your location."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:17", "end": "01:21", "text": "Sorry, I want to remove."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:20", "end": "01:26", "text": "And what is your higher date?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:26", "end": "01:31", "text": "September 2nd."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:31", "end": "01:43", "text": "All. Right. Thank you so much for providing the information, ma'am. I would like to reconfirm the issue. You just reported that your account has been locked and you want it to be unlocked. Am I right, ma'am?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:43", "end": "01:48", "text": "I just need to unlock. I'll remember my password."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:47", "end": "01:52", "text": "OK, You just want to unlock it, right?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:52", "end": "01:53", "text": "Correct."}, {"speaker": "Customer", "speaker_type": "customer", "start": "01:53", "end": "02:07", "text": "All right. Thank you so much, ma'am, for sharing the information and confirming the issue. And please stay connected. I'm working on your issue. Be assured your issue will be resolved."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:07", "end": "02:08", "text": "Great."}, {"speaker": "Customer", "speaker_type": "customer", "start": "02:08", "end": "03:45", "text": "Thank you. May I place your call on hold? Yes, sir. Thank you. [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Thank you so much for being one. Your domain is still loading and we are still working on it. It may take some time. May I place your call on hold? Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "03:45", "end": "04:06", "text": "How do you have to go? I think it's Grandma. Because she has."}, {"speaker": "Customer", "speaker_type": "customer", "start": "03:54", "end": "06:17", "text": "[MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Hello. [MUSIC] [MUSIC] [MUSIC] Lecture. My. Welcome. To. [MUSIC] [MUSIC] Thank you so much for being on hold, ma'am. It is almost done. Please stay connected. Am I still there? Hello?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:17", "end": "06:19", "text": "Hello. Are you able to hear me now?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "06:19", "end": "06:36", "text": "Yes, ma'am. I'm able to hear you loud and clear. It's almost done, ma'am. Just stay connected."}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:36", "end": "07:08", "text": "Thank you. Ma'am. Thank you for calling. That's my job. Thank you. I'm always here. Thank you, ma'am. I'm going to invite you."}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:08", "end": "07:18", "text": "Done. Almost done. Ok."}, {"speaker": "Agent", "speaker_type": "agent", "start": "07:18", "end": "07:59", "text": "Please hold. continue to Your business is important to us. Please line. stay on the"}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:59", "end": "08:18", "text": "Almost done, ma'am. Please stay connected. Alright, ma'am, I have unlocked the account from my end, ma'am. You can just try to log in and confirm once you confirm, I will share the ticket number."}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:18", "end": "08:43", "text": "Okay, let me try to get your name so great. I am back in now. I was able to log in."}, {"speaker": "Customer", "speaker_type": "customer", "start": "08:43", "end": "08:49", "text": "All right, ma'am, Once you confirm, I will share the ticket number."}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:49", "end": "08:51", "text": "OK, I'm in."}, {"speaker": "Customer", "speaker_type": "customer", "start": "08:51", "end": "09:05", "text": "All right. Thank you so much, ma'am. For sharing the information. Please stay connected. While I generate the ticket number for you, the ticket number has been generated. Please note down the ticket number."}, {"speaker": "Agent", "speaker_type": "agent", "start": "09:05", "end": "09:10", "text": "All right, I'm ready."}, {"speaker": "Customer", "speaker_type": "customer", "start": "09:10", "end": "09:33", "text": "It is re. Q. Romeo Echo Quebec *********. I will repeat again. It is Romeo Echo cubic *********."}, {"speaker": "Agent", "speaker_type": "agent", "start": "09:33", "end": "09:34", "text": "Thank you. I have it here."}, {"speaker": "Customer", "speaker_type": "customer", "start": "09:34", "end": "10:16", "text": "You're welcome, ma'am. So this is your ticket number. If you issue, you can disconnect back through this and we'll be happy to assist you again. Is there anything else I can assist you? Apart from this, ma'am? No, thank you. One more thing, ma'am. I'll connect you to a short survey post call where the first survey is for the customer satisfaction. *******, on a scale of 5 to 15 is very satisfied and the second survey is for the first contact resolution upgraded. You can select one, which means your issue was resolved in fast contact. Ok, thank you for calling it Help desk. Have a great day ahead, ma'am. You too. Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:16", "end": "12:18", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call. Enter from the scale of one to 5 with 5 being very satisfied and one very unsatisfied. Satisfied. We did not get your response. Please try again. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. Made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. We did not get your response. Please try again this time. Enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. Made it easy for you to handle. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-ca9c8905-560f-4313-8d67-62e23a94ba54.MP3", "name": "ca9c8905-560f-4313-8d67-62e23a94ba54", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:05", "end": "00:11", "text": "Thank you for calling. It looks support. My name is *** Kannul. How can I help you?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:11", "end": "00:29", "text": "Hi, *****. I wonder if you can. I was on contact with **** ****** because I had problems with my PC this morning and he asked me to ask to go and restart the PC. But it's not letting me log in."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:29", "end": "00:33", "text": "What is the message?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:33", "end": "00:40", "text": "Coming up as our user, we can't sign you in with this credential because your domain isn't available."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:40", "end": "00:46", "text": "OK, when is the last time you log in with this PC?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:46", "end": "00:49", "text": "About 5 minutes ago?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:49", "end": "00:53", "text": "Help me with the PC. Tag number."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:53", "end": "01:00", "text": "T ******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:58", "end": "01:05", "text": "****** *******."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:02", "end": "01:06", "text": "******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:06", "end": "01:17", "text": "Okay, help me to BMS. Item number and your full name, please."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:13", "end": "01:25", "text": "******. 99. ******, I ISOT."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:25", "end": "01:37", "text": "Just to confirm. Like you logged in with the VPN. First. Correct denial, new Windows or fast Windows, then VPN. Please confirm."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:37", "end": "01:52", "text": "Just trying to log in. I haven't. I haven't even got the home screen yet. I just. He asked me to restart. I've restarted putting it in my username and password and it's not letting me log in."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:52", "end": "02:00", "text": "OK. So it may take me a moment to review all the information. May I put your on hold for the same?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:00", "end": "02:02", "text": "Yes, of course."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:02", "end": "02:20", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:05", "end": "02:37", "text": "[MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:37", "end": "02:47", "text": "Thank you for staying on hold. So that the issuing the login. When you try to log in, you'll go to error message domain agenda available. Correct?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:47", "end": "02:49", "text": "Connect."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:49", "end": "03:05", "text": "Really? Sorry for the inconvenience. Let me help with that. And could you please try to log in with the right bottom? Right side bottom? You will level to CI and network sign in. Could you please try to click that one?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:05", "end": "03:10", "text": "Is this the one? How do I sign into another domain? Is that one?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:09", "end": "03:22", "text": "No, no, no. On the right side bottom, there is 4 little I li icons. Okay, you need to play this network sign in on the right side bottom of your screen."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:21", "end": "03:26", "text": "Yes, I can see that. But for me to connect to VPN."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:26", "end": "03:29", "text": "Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:29", "end": "03:34", "text": "It's not coming up from a normal group."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:33", "end": "03:48", "text": "Yeah. You need to select the VWPTCR. Which one you are using? Actually, like DWPT or DWPT backup. Which one you are using?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:46", "end": "03:49", "text": "VWPTCR?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:49", "end": "03:53", "text": "Okay, select that one, then please."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:53", "end": "03:56", "text": "I'm just putting my username and password."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:56", "end": "04:01", "text": "Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:01", "end": "04:07", "text": "And. And that's, you know, connected."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:07", "end": "04:19", "text": "Now I'll try to log in with your PC."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:18", "end": "04:21", "text": "That's. It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:20", "end": "04:25", "text": "Do you have any ticket to get number?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:25", "end": "04:32", "text": "I don't have a ticket number. I just hold you. Okay? I can bring the ticket number if need be."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:32", "end": "04:35", "text": "Not required."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:35", "end": "04:38", "text": "Perfect. Thank you so much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:38", "end": "04:42", "text": "So you were able to log in, correct?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:41", "end": "04:48", "text": "Yeah, it's just coming up. Welcome. Just now. It does take quite a while sometimes to load up. Oh, okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:48", "end": "04:54", "text": "Yeah. Once you are only home screen, let me know I'm on the call. Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:53", "end": "05:03", "text": "Ok, Thank you. Yeah. Still coming up. Welcome. So is it worthwhile for me to connect to VPN before I log in from now on?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:02", "end": "05:05", "text": "Yes, all."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:04", "end": "05:07", "text": "Right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:06", "end": "05:08", "text": "Ok."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:08", "end": "05:15", "text": "Because normally I log on and they connect to VPN, but I'll do it the opposite way around."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:14", "end": "05:17", "text": "Pork."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:17", "end": "05:22", "text": "Still coming up. The welcome, but still going round and round."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:21", "end": "05:36", "text": "Pork. Ok, I'll shake your NTN PC vote in, correcto. So you should log in first on the VPN, then on the window. That will be work."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:36", "end": "05:44", "text": "Ok, that's perfect. Thank you so much. That's me. That is now onto the home screen. Now my teams have came up."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:43", "end": "05:50", "text": "Oh, okay. Please, not down at the gate number for this issue."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:50", "end": "06:03", "text": "Yeah, 2 seconds. The ticket number. It is Inc."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:57", "end": "06:05", "text": "*********."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:05", "end": "06:10", "text": "Okay, so it's *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:10", "end": "06:16", "text": "Correct. Is there anything else that can I help you apart from this issue?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:16", "end": "06:19", "text": "That. Thank you so much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:18", "end": "06:43", "text": "Welcome your survey agent. For us. On the end of this call, you will receive a short survey post this call. The first survey should be customer satisfaction on a scale of **** ***** very satisfied. Second survey for the fast contact where you can select one, which means you're sure to be all in fast contact. Thank you for contacting ID. Help support. Have a great day. Thank you. Bye. Take care."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:43", "end": "07:40", "text": "Thanks for giving us a few minutes of your time to complete the IT HelpDesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with. It made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One the strongest. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-d221baff-114d-4551-9684-74254bfc2efe.MP3", "name": "d221baff-114d-4551-9684-74254bfc2efe", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:06", "end": "00:13", "text": "Thank you for calling ID. Home agent support. My name is *****. How may I help you today?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:12", "end": "00:20", "text": "Yeah, my name is ****. I was speaking to somebody just a minute together. When the call drops. I'm just trying to see if I can pick back up."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:20", "end": "00:29", "text": "Sure, I'll help you. Please do. Let me know. How may I help you today and really apologize for the inconvenience first?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:29", "end": "00:48", "text": "No, Absolutely. Basically, I got a new phone. And ever since I got a new phone, I am unable to sign into service now to put in tickets or anything. So he's telling me that my 6 digit code from the application is incorrect. I'm not sure how to fix it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:48", "end": "00:53", "text": "Ok, don't worry. Just check one again and I'll guide you on this before that."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:53", "end": "00:56", "text": "Could you please confirm me the name and your."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:55", "end": "00:59", "text": "PMS ident once again."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:59", "end": "01:06", "text": "My name is ****** ******, and the band ID is *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:05", "end": "01:20", "text": "All right. Thank you so much for that information. And could you please confirm me recently? Did you change your phone or anything like that?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:20", "end": "01:22", "text": "Yeah, I did get a new phone."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:22", "end": "01:28", "text": "OK, and did you got the MFA setup done for your account for your teleper performance?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:28", "end": "01:43", "text": "Yeah. You guys helped me set it up last week. You guys helped me set it up, but we couldn't get it to work. They sent me over to GSI Tech Support or ADG and they couldn't have me to call you guys again."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:42", "end": "01:49", "text": "Okay. And could you please confirm me? Like what username do you use to sign into the service now?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:49", "end": "01:55", "text": "Yeah, its **** dot o dot walden. Atperformers usa dot com."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:55", "end": "02:08", "text": "All right, So when you put in that, put in the email and does it ask you for enter a code over there?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:08", "end": "02:25", "text": "No, it pops up Once I put it in, it pops up with the toad on the screen that I have to type into the authentication. OK, And then after that, it asked me for a 6 digit code from the app. And the 6 code doesn't work. It just says it's incorrect."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:25", "end": "03:08", "text": "OK, all right, just give me a minute. Let me just check your account, please. Just a moment. Also, what I'm going to do. I'm going to provide you with the link. I would like you to please open this link on your work. computer on your browser so we could check further on this. So just a moment. Let me just create one for you. OK? I've got the link. The link is myhealthscreen dot com."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:08", "end": "03:11", "text": "Is that N Y? And what was that for that?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:11", "end": "03:34", "text": "It's my help. M Y h for Hotel E for Echo. L for Lima. Yes, myhealthscreen dot com. After that, put a slash and then type in the number. The number is ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:33", "end": "03:42", "text": "***. It wants me to download something."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:41", "end": "03:46", "text": "Yes. Please go ahead and download that."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:45", "end": "03:47", "text": "Download it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:47", "end": "03:54", "text": "Yes. Allow that."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:54", "end": "03:57", "text": "What is this going to do?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:57", "end": "04:04", "text": "With this, I would have access for your computer, so I'll be able to troubleshoot on it. So."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:04", "end": "04:14", "text": "That's it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:14", "end": "04:26", "text": "So, yeah, before taking this video session, I would advise you to please make sure that you close any of your personal or confidential information so nothing gets recorded over the session."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:26", "end": "04:28", "text": "Yeah, everything's closed."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:28", "end": "04:47", "text": "All right, That's wonderful. Just your screen then. OK, could you show me your service now, page?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:47", "end": "04:54", "text": "Where? You're trying to log it. The page for it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:54", "end": "05:06", "text": "Yes. Please open your service. Now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:06", "end": "05:07", "text": "You want me to sign into it?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:07", "end": "05:12", "text": "Yes. Please go ahead and sign into this."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:12", "end": "05:25", "text": "Let me use. This to the news is the ability to authenticate."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:24", "end": "05:26", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:26", "end": "05:31", "text": "And get the code, which it says it is. *****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:31", "end": "05:37", "text": "Ok, are you getting this code from your teleper performance account?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:37", "end": "05:39", "text": "Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:39", "end": "05:44", "text": "Do you also have your censure account as well?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:44", "end": "05:46", "text": "Yeah, I have one here."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:46", "end": "05:50", "text": "Could you please put in the one that's for the censure account?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:50", "end": "05:57", "text": "Private transfer. Let's see. Yeah, it didn't work there."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:57", "end": "06:01", "text": "OK, please click on. Try another way to verify."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:01", "end": "06:08", "text": "Turn another way you see that or the email that I'm going to check."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:08", "end": "06:13", "text": "Do you have your access to your email for the teleper performance?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:12", "end": "06:18", "text": "I've never checked the total performance email before, so I don't understand."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:18", "end": "06:23", "text": "OK, please click on. Continue over here."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:22", "end": "06:24", "text": "Continue."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:24", "end": "07:09", "text": "OK, Still the same. OK, just give me a moment. Let me just help you on this. Please authenticate the sign in. OK, I would also need to verify your account details. So could you please confirm me with your date of higher?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:09", "end": "07:12", "text": "12 12 ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:11", "end": "07:17", "text": "Ok, could you please confirm me your client name and your supervisor name?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:17", "end": "07:23", "text": "It's either USA Gov or GSA or **** *******. She did not survive."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:23", "end": "08:03", "text": "All right. Thank you so much for that information. Now what I want you to do, I want you to please open your authenticator app. Ok, once you open your authenticator app on the top, there is an ad icon, the addition symbol. You need to click on that. And you need to select the option for ad work or school account. Sure. Ok, now it must be asking whether you need to sign in or you just scan. Please click on scan QR code and just scan the QR code that is showing you on your screen right now. Okay. Yeah. So once this account."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:03", "end": "08:05", "text": "Added successfully."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:05", "end": "08:08", "text": "What does it say?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:08", "end": "08:13", "text": "You said an account added successfully as soon as I stand it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:12", "end": "08:16", "text": "Okay, OK, so there would be a bump."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:16", "end": "08:33", "text": "On your side. Let me just put that in. Successfully set up and registered. OK?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:33", "end": "09:06", "text": "Now, let's try with your service. Now, Once again, we will try to open your service. Now, an incognito first just to make sure. Please go ahead and try it in this incognito. Use your teleper performance account."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:06", "end": "09:34", "text": "Yep. I just wanted to. Ok, let me try to see. Is it incorrect? Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:34", "end": "09:39", "text": "Ok, just OK."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:39", "end": "09:40", "text": "For me."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:40", "end": "09:54", "text": "No, that's OK. I'm going to check this with my team because this needs to be checked with the service note. So let me just confirm this with my team first."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:54", "end": "10:29", "text": "Please. Stay. On. The. Line. Yeah, I'm still here."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:28", "end": "12:21", "text": "Okay. Thank you. Thank. You. Thank you. Thank you. Thank. You. Thank you. Okay. I've already posted this to my team, just waiting for their response. Hello? Hello. And may I know since how long you're facing this issue?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:21", "end": "12:25", "text": "It's been a few weeks. Few."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:25", "end": "12:26", "text": "Ok?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:26", "end": "12:48", "text": "Yes. I just have a lady to get in there."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:48", "end": "14:08", "text": "Thank much. you very I'm still waiting for the team to respond. Kindly be online. And by the time I'm waiting for the response, I please leave the call on hold for a minute or 2. By the time I'm waiting for the response, may I please place the call on hold for a minute or 2. Yeah, please be online. I'll just get back to you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:07", "end": "17:12", "text": "Ok. Hello. Welcome. To. [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] My. Lecture. [MUSIC] Hello. Welcome. To. My. [MUSIC] Lecture. [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:12", "end": "17:33", "text": "You for being on hold? I appreciate your time and patience. Yeah. *******, could you please confirm me? As I can see, this is a censure service. Now that you are using, are you sure that you would be using a teleper performance ID over here or censure account?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:33", "end": "17:37", "text": "That's the only way to tell for it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:37", "end": "17:39", "text": "Could you please try using?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:39", "end": "17:41", "text": "The center one, if you want."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:41", "end": "17:47", "text": "Yeah, please try using the same over here. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:46", "end": "17:50", "text": "Yeah. Let me try on here. That could be the issue."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:50", "end": "17:58", "text": "Let's say yes, because have you tried with the censure account once."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:58", "end": "18:12", "text": "Since. Just a second. I'll give it a go. Just log down."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:11", "end": "18:19", "text": "You still need to log in again. Once."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:19", "end": "18:23", "text": "Asking it says teleperformance or here it has to be teleper performance."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:22", "end": "18:55", "text": "Yes. Still, I would advise you to just try with the censure. It could be a possibility that this could also be causing this issue. Ok, just try to open this in. Yeah, just try opening this in incognito."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "18:55", "end": "19:06", "text": "There's the same thing about what you'll use. Right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:06", "end": "19:08", "text": "Please continue to."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:08", "end": "19:18", "text": "Hold."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:18", "end": "19:19", "text": "Ok, let me know."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:18", "end": "19:21", "text": "That's what it gives you every time you get."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:21", "end": "20:26", "text": "Ok, let me just take a picture of this error message. Hello. lecture. my Welcome to OK, I've got hold with one of the level 2 agents. So for their response. Ok, so, ******, I've checked with the level 2 team. Are you there?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:25", "end": "20:27", "text": "Yeah, I'm here."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:26", "end": "21:02", "text": "Yeah. So just check this with the level team. Yeah, right now, the level 2 team tools on which they check the accounts. It's not working as of now. So they're asking you to call us back after some time. So once the tool would be up, they would be able to help you further on this. So what I will do, I will create a ticket for this, and I'll provide you with a ticket number. I would advise you to please try calling us back after half an hour with that same ticket number. So we would be escalated further with the level 2 and check with it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:02", "end": "21:04", "text": "7. Half an hour."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:04", "end": "21:28", "text": "Yes. Try calling us back after half an hour. So once the tool would be back up, the level 2 team would be able to check your account and further whatever we need to do on your account, we'll be able to do that. So I'll provide that. Yeah, I'll provide you with the ticket number so you can write down the ticket number."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:27", "end": "21:33", "text": "Sure. What is it?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:33", "end": "21:50", "text": "All right, The ticket number going to be I for Indigo N for Nancy C for Charlie. *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "21:50", "end": "21:51", "text": "I got it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "21:51", "end": "22:28", "text": "All right. So please do give us a call back after half an hour, and then we'll check this further with our level 2 team. So once if their tool would be up, they would guide us further. What further needs to be done on this and whether we need to check with the censure team or whatever we'll need to do, they will guide us further on this. Correct. So please do. Please do give us a call back with the same ticket number and we'll further check on this also. And apart from this, is there anything else I may help you with today?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:28", "end": "22:30", "text": "That'll be it. Thank you so much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "22:29", "end": "22:49", "text": "All right. You're most welcome. And post the call. The call would be redirected to a survey within the first service for customer satisfaction on the scale of 52 and 5 satisfied and the second service for first contact resolution wherein you can select one If you got a resolution on your first product and thank you for choosing it. Home agent support. You have a wonderful day ahead."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "22:49", "end": "22:55", "text": "You. Too. Thanks for giving us a few minutes of your time."}]}, {"id": "audio_Call1-d3e25b87-115f-4e4e-bbf9-e6c231451669.MP3", "name": "d3e25b87-115f-4e4e-bbf9-e6c231451669", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:08", "end": "00:15", "text": "You for calling healthcare support. My name is ********. Can I help you?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:15", "end": "00:27", "text": "Hi. Good evening. My name is ******. I have only an issue with one of my monitors. It is blinking."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:27", "end": "00:31", "text": "One of your monitor is blinking up."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:30", "end": "01:53", "text": "Yes, it's like turning on and off. But when I remove the tools like I remove the brain up and transfer it to the other monitor. it, the monitor will not blink. The monitor will not turn on and off. I already tried to switch the cables to the other monitor and the other monitor will do the same. It works. Sometimes it didn't, so I'll just let it be. But now the turning on and off. It's much not tolerable anymore. I can work at home now with one monitor. Because my duty is 11:30 pm in the Philippines. So sometimes only if themax the tools or the the tools is, um, transferred on the other monitor. Like now it it is blinking. It's turning on and off. But when I remove the the tools there and just have the like, uh, the horde, the email, it will not turn on and off."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:52", "end": "01:56", "text": "Ok, ma'am, it's the monitor's problem."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:56", "end": "02:02", "text": "Or what are the cable problem? What's the problem for that?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:02", "end": "02:09", "text": "It is a cable problem, ma'am. I've replaced your cable. Mmhmm. Because."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:09", "end": "02:33", "text": "In here, it has, like, a connector for the monitor to the CPU. It's not directly. Um, back of the monitor. Uh, I don't know what house to describe it. Uh, so you will just replace the. You will just request to replace the appeal ball."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:33", "end": "02:36", "text": "Yes, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:36", "end": "03:02", "text": "Ok. Ok, uh, I will just, uh, do my best so that I can use on one monitor. Or maybe if I can have it. Um, steady, but I already tried it. Even I started logging in at 9 pm and tried to check if that will work, but the blinking is notable anymore."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:02", "end": "03:06", "text": "Ok, ma'am. So you can just request."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:06", "end": "03:09", "text": "You can just request for the replacement of the key ball."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:09", "end": "03:19", "text": "Sure, ma'am. And I'm so sorry for the inconvenience, ma'am. I'll surely help you with that before that. Could you please help me with your BMS, ID and your full name? Please?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:19", "end": "03:25", "text": "Please. 5610254 Lorenabustan."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:25", "end": "03:32", "text": "Ok, ma'am, please help me with your phone number, ma'am. I want to take an ex."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "03:31", "end": "03:43", "text": "Mmhmm. So, ***********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:43", "end": "03:48", "text": "Ok, ma'am, just a minute. I'm sending you the link."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:47", "end": "04:00", "text": "Ok."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:00", "end": "04:11", "text": "And also, the monitor is like, there is like, um, I don't know how to describe that kind of the monitor."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:10", "end": "04:25", "text": "No worries, ma'am. I sent a link to your mobile, ma'am, please check. And before turning on your camera, please close all the confidential information and remove sticky notes or diary from your desk as we have a clean desk policy, please."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:25", "end": "04:31", "text": "Ok, just bear with me for a moment."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:31", "end": "04:34", "text": "Sure, ma'am. Take your time."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:34", "end": "05:09", "text": "Uhhuh. I have now opened the receipt. The link. Ok, Hello. Ok, here's what's happening right now. So you can see."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:09", "end": "05:12", "text": "OK, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:12", "end": "05:39", "text": "Yes. And then I will remove this. To the other one. So now it is not breaking anymore, right? But I will put back again the bill, the bill of the. Oh, see it, ma'am. It's like something."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:39", "end": "05:47", "text": "OK, ma'am. Well, what happened after you swap the cables, ma'am? Then the other monitor is linked. That."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:47", "end": "05:55", "text": "If the cable from this will transfer to this, this one will be like this. And this one now will be saved."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:55", "end": "06:00", "text": "Ok, ma'am, can you show me the cable once, ma'am?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:00", "end": "06:12", "text": "OK, so here, I'll just. So here is the table for this other monitor. Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:12", "end": "06:20", "text": "No, ma'am. You can show me the backside of your monitor, ma'am. I'll order the direct cables without the connectors."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:20", "end": "06:21", "text": "Wait one moment."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:21", "end": "06:22", "text": "Sure, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:22", "end": "06:27", "text": "So this is the back. Can you see it?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:26", "end": "06:29", "text": "Yes, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:29", "end": "06:39", "text": "Wait for a moment. Can you see?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:39", "end": "06:44", "text": "It? Yeah, ma'am. I can see it."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:44", "end": "06:46", "text": "So it's all good now."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:46", "end": "06:55", "text": "Yeah. Show me the cable on your CPU. The same cable. The other end. Were you connected to the CPU cable?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:55", "end": "06:58", "text": "Here are the CPU keyboards."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:58", "end": "07:02", "text": "Where is that connected with?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:02", "end": "07:06", "text": "Yes, they are all connected here."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:06", "end": "07:11", "text": "OK, ma'am. Got that, ma'am. Can you please send me?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:11", "end": "07:13", "text": "Your."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:13", "end": "07:16", "text": "Yes, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:16", "end": "07:28", "text": "I'll just. Yes, I'll a light there so you can see. Ok, so."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:28", "end": "07:31", "text": "Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:30", "end": "07:39", "text": "I I just get like, So this one is for the first, the monitor at the left."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:38", "end": "07:41", "text": "OK, OK. And this one."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:41", "end": "07:53", "text": "This one. And then this is the monitor for the it's, the cable for the right monitor. The one that is drinking this one."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:53", "end": "07:55", "text": "Ok, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:55", "end": "08:19", "text": "Because the other one, they are the same support. So this one, it's a different one. So it cannot be put in there. So there should be like, an adapter. So this is the doctor in this one. I'm here."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:19", "end": "08:33", "text": "OK, ma'am. Got that, ma'am. In the conversation tab. I'm sending it in high. Can you please send me a shipping address and your email address?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:33", "end": "08:39", "text": "My email address is **** ****. Wait for a moment."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:39", "end": "08:48", "text": "I just can't. Conversation, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "08:48", "end": "08:59", "text": "My email address. I forgot. What's my personal email address or the email?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:59", "end": "09:03", "text": "Address. Personal email address."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "09:03", "end": "09:14", "text": "Personal. OK. ****@*****.***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:13", "end": "09:21", "text": "And your shipping address, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "09:18", "end": "09:26", "text": "6251 ** ******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:26", "end": "09:32", "text": "And your zip code."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "09:29", "end": "09:33", "text": "****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:33", "end": "09:52", "text": "Ok, ma'am, that please be on the line. I'll create a replacement ticket and give you the ticket number. Ok, thank you. I'm."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "09:52", "end": "10:03", "text": "Just going to bring the papers."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:03", "end": "12:31", "text": "You're welcome. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank you. Thank. You. You. Thank. Thank. You. Can I see? You? Thank you. Thank Thank you. you. you. Thank Thank."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:31", "end": "12:32", "text": "Are you still there?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:32", "end": "12:38", "text": "Yes, ma'am. I'm still here. I'm still working on your replacement, ma'am. Please stay on the line."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:38", "end": "12:43", "text": "Thank you. No, I thought you're not anymore. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:42", "end": "12:56", "text": "Anytime, ma'am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:53", "end": "13:19", "text": "Thank you. Thank you. It. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:19", "end": "13:32", "text": "You for staying online, ma'am? Ma'am, can you please send me your shipping address once again, ma'am, in the conversation tab. I'm sorry to send you a message. Yes, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:32", "end": "13:34", "text": "Ok, just bear with me."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:34", "end": "13:44", "text": "Sure, ma'am. Open that link, ma'am. In that link only you'll find a conversation tab."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:44", "end": "13:47", "text": "You can repeat that. Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:46", "end": "13:55", "text": "Open that link again, ma'am. In that link only you'll find a conversation tab. You can type your address there, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "13:55", "end": "14:01", "text": "Where should I type the address? Open that link in the text message that you sent me."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:01", "end": "14:07", "text": "The link I've sent you, ma'am. Please open it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:07", "end": "14:18", "text": "Uhhuh."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:18", "end": "14:19", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:19", "end": "14:29", "text": "And then I'm sending a high, ma'am. Can you please check."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:29", "end": "14:34", "text": "Bear with me? I I didn't know what happened. Now I'll just open the link again."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:34", "end": "14:46", "text": "Sure, Sure. ma'am. Thank you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:45", "end": "14:51", "text": "Ok, so where will I send the here?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:50", "end": "14:55", "text": "I'm sending a high, ma'am. Do you see that?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:55", "end": "14:55", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:55", "end": "14:59", "text": "Please open that tab, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:59", "end": "15:27", "text": "How can I open it? As I said here at the end. Should I also put my contact number or not anymore?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:27", "end": "15:31", "text": "No, no, ma'am. Only your shipping address is fine."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:31", "end": "15:34", "text": "Ok, I sent you out the. Did you see?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:33", "end": "15:38", "text": "Yes, ma'am. I received it just a minute, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:37", "end": "15:38", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:38", "end": "15:42", "text": "Thank you so much, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "15:42", "end": "15:48", "text": "You're welcome."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:48", "end": "16:29", "text": "Wow. Thank you. Thank you. Thank you. Thank you. It's ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:29", "end": "16:35", "text": "You so much for staying online, ma'am. Let me know. Once you're ready, I'll give you the ticket number."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "16:35", "end": "16:38", "text": "Ok, what's the ticket number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:37", "end": "16:59", "text": "Yeah, it's. I as in India N as in November C as in Charlie. ***. ******."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "16:59", "end": "17:11", "text": "Ok, so I. As in India N. As in Nancy C. As in Charlie. *********. Did you get it correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:10", "end": "17:16", "text": "Yes, ma'am. That's correct. Is there anything else, ma'am that I can help you with?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "17:15", "end": "17:21", "text": "There's nothing else. I'll just wait for that. How long will it take?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:21", "end": "17:24", "text": "It takes 2 working days, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "17:24", "end": "17:47", "text": "14 days. Ok, thank you so much. I'll just wait for that. I just, um, let have myself do something else here so that I can use it. Uh, until it arrives. Thank you so much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:47", "end": "17:52", "text": "Any time, ma'am, Anytime. And before letting you go and have a wonderful."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "17:52", "end": "17:54", "text": "Day."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:54", "end": "18:14", "text": "Sure. Thank you, ma'am. Before letting you go, I'll connect you to a short survey. Post this call. We have the first survey for the customer satisfaction on a scale of 5 to 15 is very satisfied, and the second survey is for the first contact resolution where you can select one. That means your issue is resolved in first contact. Thank you for calling its support. Have a great day. Bye bye."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:14", "end": "18:16", "text": "Ok, bye bye. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "18:16", "end": "18:22", "text": "Thank you, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:21", "end": "19:08", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist On today's call, enter from a scale of one to 5 with 5 being very satisfied and one thank you. If your issue was resolved in one contact press one. If it took multiple. Fantastic. This time, enter your response. Using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest."}]}, {"id": "audio_Call1-d5c497e4-a262-44ca-94fb-c9a965b043cf.MP3", "name": "d5c497e4-a262-44ca-94fb-c9a965b043cf", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:07", "end": "00:13", "text": "Thank you for calling. Its support. My name is ******. How can I help you?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:13", "end": "00:23", "text": "Hi. Good morning. This is ******. I would like to request for a temporary password for my MSA account."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:23", "end": "00:28", "text": "Uh, you need a password for MFA?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:28", "end": "00:33", "text": "Yes. Thanks. Afternoon."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:32", "end": "00:52", "text": "Okay, sure. I'll be double to try to help you on this. Sorry for the inconvenience cost to you. I will definitely have to help you on that. First of all, tell me your bhasid ID number and your full name."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:49", "end": "01:02", "text": "*******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:02", "end": "01:12", "text": "Okay. Thank you. Can you please tell me your hired date, Month and year? ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:12", "end": "01:34", "text": "I forgot that it was around February ****. I can't get the exact date around maybe February 28th. Not sure. Is there other verification like date of birth?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:34", "end": "01:41", "text": "No. Some prior date, month and year."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:40", "end": "01:47", "text": "I can only recall the month and the year, but not the exact date."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:47", "end": "01:51", "text": "Can our Freedom, Month and year b?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:51", "end": "02:00", "text": "Month and year is February ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:59", "end": "02:15", "text": "Okay. And supervisor or manager name."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:09", "end": "02:19", "text": "**** *******. ********* ******. Momentum."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:18", "end": "02:39", "text": "Ok, sure. Thank you for providing me all the details. ******. I'm just going to check your account status and then I will. After checking the status, I will provide you the password. Ok, so be on the line. I'm putting the call on hold for some time. Stay connected on the call. Do not disconnect, Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:39", "end": "02:41", "text": "Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:41", "end": "02:52", "text": "Sure. Sure. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:49", "end": "04:28", "text": "Hello. [MUSIC] [MUSIC] Welcome to my lecture. [MUSIC] [MUSIC] We'll. Be. Right. Back. [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:28", "end": "04:32", "text": "Thank you for staying connected. Are you there?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:32", "end": "04:35", "text": "Yes, I'm here. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:34", "end": "04:58", "text": "Okay, sure. It's taking some time. Ready to check your account status. So be on the line. Do not disconnect the call. Okay. Once I check this ticket, I will let you know. Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:58", "end": "05:14", "text": "Of course. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:14", "end": "05:34", "text": "Be on the land, ******. It is taking some time."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:23", "end": "07:13", "text": "It's OK. Thank you. Thank. You very much. Thank. You. Thank you. Thank Thank Thank you. you. you. Its thank. You. Thank. You. Thank. You. Thank. You. Thank you. Thank. You. Thank you. Thank you. Thank you. Hello. Welcome. Lecture. To. My."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:13", "end": "07:25", "text": "Beyond the land, *******. It's taking some time. And just tell me that. What is the ner message you're getting there?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:25", "end": "07:58", "text": "I was trying to register. Yeah. I was actually trying to register a temporary password for me to gain access to a set for the performance of portal because our account is using like a church environment. And you don't have access to the teleper performance. URL link. And you are using."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:58", "end": "07:58", "text": "Where you do."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:58", "end": "08:08", "text": "What are you getting?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:08", "end": "08:20", "text": "OK? Ok, so you are getting the message on? Yeah, using the web VDI, right?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:20", "end": "08:22", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:22", "end": "08:29", "text": "Ok. And in the media, which username you're using it."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:28", "end": "08:35", "text": "******, that's ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:35", "end": "08:47", "text": "Okay, sure. I'm just going to provide you the new password. Okay, Please note it down. And also, I would like you to inform you about the ness. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:46", "end": "08:54", "text": "I'm sorry. I don't have something to write with. Can you send it via email?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:53", "end": "09:00", "text": "Sorry. We can't send it the password through the email we are working on site."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:00", "end": "09:19", "text": "So, yes, I'm working on site right now, but we are not allowed to bring our phones in the production area, and I don't have something to work with. How about this one? Let me put you on speakerphone and then I'll see if I can write it in a note. Would that be okay?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:19", "end": "09:23", "text": "If you are, are you on teams?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:23", "end": "09:26", "text": "I'm on my phone right now."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:26", "end": "09:30", "text": "No. Anyone available on teams?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:30", "end": "10:08", "text": "No, don't have access on team. So on outside network. But let me put you in speaker mode and then I'll type it down. Ok? All right, let me see. Can you hear me? Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:08", "end": "10:09", "text": "All right. Yeah."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:09", "end": "10:15", "text": "I have an option to cut it down on my phone."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:15", "end": "10:23", "text": "Ok?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:22", "end": "10:37", "text": "Yeah. Whenever you're ready, please. Yeah. Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:37", "end": "10:40", "text": "So can I tell you the password?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:40", "end": "10:43", "text": "Yeah, I'm ready."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:42", "end": "11:00", "text": "Okay, So everything will be in lower case. When there's an uppercase, I will use the word uppercase. Okay. Sure. It's lower case V for Victor."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:00", "end": "11:02", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:01", "end": "11:06", "text": "Uppercase K for kilo."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:05", "end": "11:07", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:07", "end": "11:11", "text": "Uppercase V for Victor."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:11", "end": "11:13", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:12", "end": "11:17", "text": "Uppercase P for Papa."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:17", "end": "11:19", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:19", "end": "11:33", "text": "Lower case Y for Yankee. OK, lowercase E for echo. OK, lowercase W for whiskey."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:33", "end": "11:35", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:35", "end": "11:38", "text": "Number 5."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:38", "end": "11:40", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:40", "end": "11:44", "text": "OK, Q for queen."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:44", "end": "11:47", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:46", "end": "11:52", "text": "Uppercase. Sorry. Its number 8."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:52", "end": "11:54", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:53", "end": "12:03", "text": "Uppercase F for 4 for Foxtrot. OK and uppercase Y for Yankee."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:03", "end": "12:07", "text": "All right. Thank you. Can I confirm it to you real quick?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:06", "end": "12:09", "text": "Sure."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:08", "end": "12:28", "text": "Alright. I have lowercase V for Victor or a cup? Uppercase K for Kilo V for Victor V for Papa. Our case Y Yankee E Echo W Whiskey number 5, uppercase G e K number 8 case at Foxtrot Y. Yankee."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:28", "end": "12:31", "text": "Yes, that's correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:31", "end": "12:45", "text": "Alright. I think that's all I need. ****. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:45", "end": "12:52", "text": "Okay, you need a. So you are able to get the password change password option?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:52", "end": "13:00", "text": "Um, I'll later on. Once I get to the production, I I still need this additional help. I may be calling you back."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:00", "end": "13:21", "text": "Oh, great. Perfect. Perfect. I am then providing you the ticket number for this call. I'm just telling you the ticket number for this call. Okay, so that will be. Hello. Can you hear me? I'm audible to you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:20", "end": "13:23", "text": "Yes, I'm here. I can hear you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:23", "end": "14:35", "text": "No. So we even changed. Tenny will login. Okay, later on, if you face any issue, you can call back. I would also like you to inform you and tell you about the password tool. It's a tool through which also you contain the password and it's a link. Even open it on your post device in an open internet as well. The lingo B cs is support dot org. They pay dot app slash passwordsit through that. Also, you can change the password. Okay, and change the you can use it. And. Okay, so this is a ticket number for this call. It will be our EQ is *********. That's the ticket number for this call and reggae. And going forward, Opioid was able to provide you the resumption. Who's going for the cervical survey will be our force contact resolution. You can select one, which means here the issue was resolved in force contact, and the second survey will be our first contact resolution can select one, which means the issue. Then what could that? So thank you for contacting. *****. Have a nice day. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:35", "end": "14:39", "text": "Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:39", "end": "15:54", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2 if it still has not been resolved, press 3. Fantastic. This time. Enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. Made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-d84d3076-4ff0-4cb3-a01a-2d5ce2600e3c.MP3", "name": "d84d3076-4ff0-4cb3-a01a-2d5ce2600e3c", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:07", "end": "00:13", "text": "You for calling at Lake Support? My name is *****. How can I help you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:12", "end": "00:23", "text": "Hey, I was calling about my screen. Sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:23", "end": "00:30", "text": "I can't hear you clearly. I am requesting you to. Could you speak louder, please?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:29", "end": "00:39", "text": "Ok, I'm sorry about that. I was calling because I still haven't received my card yet. My ethernet cable."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:39", "end": "00:53", "text": "Ok, I am really sorry that you're having this issue, and surely I will try to provide the best ever solution from my end. But before that, could you please help me with your BMS ID?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:52", "end": "01:00", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:00", "end": "01:09", "text": "Please help me with your BMS ID."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:03", "end": "01:10", "text": "*********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:10", "end": "01:15", "text": "It's *******. Am I correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:15", "end": "01:18", "text": "Yes, sir."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:18", "end": "01:24", "text": "Thank you for confirmation. Could you please help me with your full name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:24", "end": "01:26", "text": "Precisely as well?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:26", "end": "01:36", "text": "Thank you for confirmation. It may take me a moment to review your information. May I put you on hold for the same?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:36", "end": "01:38", "text": "Yes, sir."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:38", "end": "02:16", "text": "Thank you for confirmation. [MUSIC] [MUSIC] I appreciate your patience. Thank you for staying on hold. I request you to do. Could you please repeat the issue again? What the issue you're facing?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:16", "end": "02:18", "text": "Can you repeat that?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:18", "end": "02:35", "text": "I request you? Could you please repeat the issue again? What the issue you are facing? Hello. Can you hear me, ma'am?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:34", "end": "02:39", "text": "Yes, I have the phone, but you know, I can hear you better now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:38", "end": "02:48", "text": "Yes, ma'am. I request you to. Could you please repeat the issue? What the issue you're facing?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:47", "end": "02:55", "text": "Um, my internet table not working. So it's supposed to be sent me another table 3 days ago."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:55", "end": "03:06", "text": "Ok, as you said, you face in trouble regarding with your internet cable is not working. Am I correct? This is the issue you are facing."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:06", "end": "03:07", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:07", "end": "03:16", "text": "OK, ma'am. Could you please confirm, is there any physical damage on your internet cable?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:16", "end": "03:19", "text": "Please check."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:18", "end": "03:24", "text": "Ok, please check and let me know. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:24", "end": "03:48", "text": "It's not working. It won't light up. They're supposed to be something I'm calling. My call is I'm calling because I was trying to see. Like, is there any update on the shipment since I still haven't received the internet yet? This is what I was calling."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:48", "end": "04:02", "text": "I am really sorry that you're having this issue and let me help you with that. Yeah, as you said, you face in trouble regarding with due net cable not working. Am I correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:01", "end": "04:11", "text": "Yes, but they already we already troubleshoot it and went through everything and they supposed to accept it out last week, but I still haven't received it yet."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:11", "end": "04:47", "text": "Ok, sorry for the inconvenience. I am really sorry that you're having this issue. Let me help you with that, but before that I will start as via session. I will send you a link on your phone number and via message and you will receive the link. Once you click on the link and allow the camera access, we will be able to access your back camera and we will check further. But before that, please close all the important accountment and remove anykt notes or a diary which is personal as we have a claimless policy. Please provide the mobile number."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:47", "end": "05:00", "text": "Sir, I already done it 2 times on the final with someone they supposed to start the eating quarter already. I was just trying to check on the shooting."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:00", "end": "05:08", "text": "But I need to take it now. You need replacement right on internal cable. Am I correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:07", "end": "05:25", "text": "Yeah, they supposed to be tested payment out last week, so I was only calling to check the shipment. They already like I spoke with 3 people already. They already looked at it and sent me the link already. I was just calling to see. Has it been sent out yet?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:25", "end": "06:10", "text": "Ok, just a minute. I'm checking. And before call, the representative was completed, Please confirm our call disconnected. On before and before. Call on Last call on. Where is the right? Am I correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:10", "end": "06:13", "text": "Can you repeat that?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:12", "end": "06:18", "text": "When was the last time you're calling?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:17", "end": "06:22", "text": "I'll call it cable, Ok?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:22", "end": "07:21", "text": "Just a minute. I'm checking with my team. Please stay connected. Do not discount the call. Ok. I appreciate your patience. Thank you for staying online in, ma'am. The replacement was completed right on your land cable. Am I correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:21", "end": "07:25", "text": "You said, can you repeat that?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:25", "end": "07:32", "text": "The replacement was completed already? Right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:32", "end": "07:36", "text": "I'm not understanding what you're saying."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:35", "end": "07:47", "text": "Replacement was completed or not. Please confirm before call. The replacement of land cable is replacement was completed, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:47", "end": "08:13", "text": "The fire is breaking up. I'm sorry, but I just repeat what I was saying. I said I called in because I was trying to check the shootment of my ecosystem. I had already spoken with someone last week. I spoke to 3 people last week. They already chipped the ether. We did troubleshooting and all of it. We went to that process already. I was just calling to track the s**t. Yes, ma'am. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:13", "end": "08:28", "text": "On that call, the replacement was completed on your etern cable. Right. But, you know, but no, you didn't receive the land cable. Am I correct? Ethernet cable."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:28", "end": "08:30", "text": "Am I correct? The line cable?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:30", "end": "08:39", "text": "Yes, the Internet cable. No, the internet cable. The Internet cable is still. You not received? Am I correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:39", "end": "08:40", "text": "Yeah, it's great."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:40", "end": "10:04", "text": "Ok, thank you for confirmation. Give me a minute. I'm checking with my team. Thank. You. Very. Much. I appreciate your patience. Thank you for staying on line. The replacement was completed on 8th. Right? Am I correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:04", "end": "10:06", "text": "Can you repeat that?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:06", "end": "10:10", "text": "Hello. Can you hear me?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:09", "end": "10:13", "text": "Yes, I can hear you better."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:13", "end": "10:21", "text": "Ok, just a minute. The replacement was completed on 8th, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:21", "end": "10:24", "text": "I'm not understanding what you're saying."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:24", "end": "10:33", "text": "The replacement was completed on this month. October 8th. Sorry."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:33", "end": "10:41", "text": "Yes. The internet time this month."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:40", "end": "10:46", "text": "Ma'am, are you received the internet cable or not? Please confirm."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:46", "end": "10:50", "text": "I haven't received the ethernet cable."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:49", "end": "10:59", "text": "Ok, but the replacement process was completed on this month. 8th, right on 8th. On this month."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:59", "end": "11:14", "text": "I started. I started this month on the 6th."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:14", "end": "11:20", "text": "Still, you didn't receive the internet cable, right? This is the issue, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:19", "end": "11:21", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:20", "end": "12:23", "text": "Ok, thank you for confirmation. Give me a minute. Ok. I appreciate your patience. Thank you for staying online. It will be delivered within one day. Ok, we have to still need to wait one day. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:23", "end": "12:25", "text": "Can you still wait one day?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:25", "end": "12:29", "text": "Yes. One day."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:29", "end": "12:35", "text": "So it'll be here tomorrow. Yes. Ok, Thank you. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:35", "end": "15:02", "text": "Give me a minute. I will forward the ticket number. Ok, just a minute. I will forward the ticket number. Ok? Ok. I appreciate your patience. Thank you for staying online. Based on our interaction. I created one instant ticket. Let me know when you're ready. It's uppercase I I as in India Uppercase N As in November."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:02", "end": "15:04", "text": "Hello. Repeat that."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:04", "end": "15:12", "text": "Uppercase I as in India. Uppercase nn as in November. Uppercase C."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:12", "end": "15:14", "text": "As in Charlie."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:14", "end": "15:40", "text": "Ma'am, I am repeating from the beginning again. OK, please listen carefully. Uppercase I I as in India. Uppercase Yen N as in Nancy. Uppercase C C As in Charlie. ***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:38", "end": "15:51", "text": "*****. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:44", "end": "15:51", "text": "********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:51", "end": "15:56", "text": "9 Mmhmm. OK, thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:55", "end": "15:59", "text": "You. You want me to repeat again?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:59", "end": "16:02", "text": "No, I have it. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:01", "end": "16:06", "text": "Ma'am, is there anything else I can help you with?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:06", "end": "16:07", "text": "No, sir."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:07", "end": "16:29", "text": "Ok, ma'am, I would connect to your short survey post this call where the first survey is for the customer satisfaction. We are on the scale of 5. Their environment is very satisfied. And the second survey is for the first contact resolution where you can select one, which means your issue was resolved in the first contact. Thank you for contacting support. Have a great day. Bye."}]}, {"id": "audio_Call1-dcc22c8a-57e4-45d8-8361-5c290a32c35a.MP3", "name": "dcc22c8a-57e4-45d8-8361-5c290a32c35a", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:08", "end": "02:11", "text": "Thank you for calling Idmos. My name is *****. How can I help you? Hi. This is you from Wellcare. Mmhmm. I have an issue earlier. My mind doesn't work, and I don't have a sands on my PC. So I typed the respect, but unfortunately, is still no sinus in the microwave. But we are mandated to have a sinus. Well, calling. For your voice. I can understand that you're using sanitisers, right? Yes, I haven't. Snow changed PC and restart again. So I just need a ticket for the issue Because, Yes. Okay, so as I gain in the spend, you are facing issue with the NS and all. But right now, its win resolve. And you need a ticket number for the issue, right? Yes, that's right. Okay. I'm sorry, sir, that you're faced, so I will definitely help you out, sir. Before I proceed. Can you please provide me the CCM VMS in number? It's *******. Okay, ****, can you please answer me with your full name? **** ******. Join Nordic. OK. J O E Y m. I got it. And I can see you working for Vencare, right? Yes, that's right."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:11", "end": "02:13", "text": "Okay."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:12", "end": "02:39", "text": "Okay, sir, can I just put a call and hold for too many just to verify information and head back to you? Okay, That's all right. Thank you so much."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:24", "end": "04:41", "text": "[MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:41", "end": "05:09", "text": "Thank you also. So please read. I'm still working with the information, OK, just beyond the call and will not disconnect. Thank you. Mmhmm. Okay, welcome."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:54", "end": "07:35", "text": "[MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] [MUSIC] Hello. [MUSIC] [MUSIC] Welcome. To. My. Lecture. [MUSIC] [MUSIC] [MUSIC]"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:35", "end": "09:11", "text": "Thank you for staying on hold. So, yes, I'm done with the ticket. Please write down the ticket. Yes. Go ahead. Yeah, that would be for India. N for Nancy C. For Charlie. I am C *********. Ok, let me just confirm it. It's incorrect. *****. Charlie. *********. That's absolutely correct, sir. Ok, thank you. Is there anything else I can help you with? No, I'm all good. Thank you for helping. Okay, sir. So, ******, I just think 30 seconds over time for this. Are we after this call for the resolution? Yeah, sure, sure. Okay, So, sir, I would connect you to a short survey in this call where the first survey is for the customer satisfaction ran on the scale of *** mines sat at his fate and the second service will the first contact resolution when you can select one, which means first contact. I hope you will do the service. It means a lot for me. Thank you for contacting it. Home million support. Have a great day. So bye. Okay, bye. Have a great day. Also, you too. Bye."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:11", "end": "10:55", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call, enter from the scale of one to 5 with 5 being very satisfied and one very unsatisfied. We did not get your response. Please try again. How satisfied were you with the assistance you had from the IT specialist on today's call, enter from the scale of one to 5. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2. If it's still fantastic this time, enter your response. Using a scale of one to 7 where 7 means you strongly agree with the following statement. And one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. We did not get your response. Please try again this time. Enter your thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-e0e90bf8-cd62-4a44-a152-db5474cdd6e7.MP3", "name": "e0e90bf8-cd62-4a44-a152-db5474cdd6e7", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:07", "end": "00:20", "text": "Hello. Hello. Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:20", "end": "00:25", "text": "Thank you for calling adult support. My name is I have a little bit today."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:25", "end": "00:42", "text": "Hi. Yes. I'm trying to log into the new island system. And when I go to open my desktop, it states that it's blocked. And when I try to unblock it like the little pop up, it states it's disabled, like for space, even."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:42", "end": "00:53", "text": "I'm really sorry at the time. I'm sure they try to provide the best resolution from my end. But before that, could you please help me with a VMS number?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:53", "end": "01:00", "text": "I don't know what it is. To be honest, I think. Can you do my social or something?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:59", "end": "01:04", "text": "Your employee number."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:04", "end": "01:09", "text": "Okay, I don't have. Just give me one second. Let me look at my email. Okay?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:09", "end": "01:18", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:18", "end": "02:28", "text": "It's not one thing. What does the complaint? Thanks. The gene was later found abandoned. The other festival Memorial Hospital is currently in critical condition, and this investigation is well updated. Now we're going to shop it in half Street. Recorded. He said BMSD hospital and he's okay. His car was too. These services. And I'll say now, those are some breaking days we brought you yesterday morning. ******. Police are still looking for 2 substances as they're shooting outside. It's *******."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:28", "end": "02:32", "text": "Ok, could you please help me your full name?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:32", "end": "02:41", "text": "******. Please stand on the line."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:41", "end": "02:52", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:52", "end": "03:06", "text": "Good morning. Thanks so much for joining us before I have an issue. First of all, to start this new month of the new weekend off to a great start. I think it's not really confusing."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:05", "end": "03:29", "text": "Ok, tell me your. Mobile number. Tell me your cell phone number."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:25", "end": "03:39", "text": "**********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:39", "end": "03:45", "text": "Tell me the number once again."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:43", "end": "03:49", "text": "*********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:49", "end": "03:56", "text": "Okay. *******. Oh, 9 2. Am I correct?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:54", "end": "04:03", "text": "****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:03", "end": "04:24", "text": "Ok, I sent on video link on your mobile number. Please accept the link. Just show me your computer. I will guide you. Ok. Ok, before I send the link, can you information on our computer please hide? Just nails under the link."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:24", "end": "04:27", "text": "You say you're sending a link?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:26", "end": "04:30", "text": "Yes. On your test messages."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:30", "end": "05:11", "text": "Here. Thank you. You're. Welcome. Thank you. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:10", "end": "05:14", "text": "Hello. Hello."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:14", "end": "05:16", "text": "Are you able to see my screen?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:16", "end": "05:24", "text": "Yes, yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:23", "end": "05:44", "text": "Yeah, the power, but not certificates. Ok, you see this one?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:44", "end": "06:00", "text": "Wait, wait, wait, wait. Finish of wait. I'll take the snapshot of the processing. Ok, so unable to log in your."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:00", "end": "06:07", "text": "I'm sorry. You. Can. Try. Let me try again."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:07", "end": "06:11", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:10", "end": "06:46", "text": "Don't. Yes, Yes. OK. I see that. Were you able to see that?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:46", "end": "06:59", "text": "Yes, yes, yes. It's able to see the blocks. Can you show me?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:58", "end": "07:12", "text": "Let me do it again. I'm right here."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:12", "end": "07:24", "text": "So protect sensitive data from normal derivation. Ok, OK, click. This is VL."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:24", "end": "07:26", "text": "Yeah, I tried to click on it."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:26", "end": "07:43", "text": "No, no, no. I'm asking. This is a VDI. Oh, yes. Ok, click on. Minimize. Minimize the screen. Again. Minimize the screen."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:43", "end": "07:45", "text": "This is the."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:45", "end": "08:24", "text": "Provider. Click on the mouse. Ok, go to sessions System 4 sessions System info. They show me. They show me the first name. DD. No. Yeah. Ok, please wait. Ok, please stay on hold. I'm working on it, Ok?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:24", "end": "08:29", "text": "Let me hang up the the camera."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:28", "end": "08:32", "text": "Yeah. OK, no issue."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:32", "end": "10:06", "text": "So. In. The. I'm gonna just leave it on there. Thank you so much. Thank you very much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:06", "end": "10:13", "text": "You for staying on hold. Your system is rebooting."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:13", "end": "10:14", "text": "You want me to reboot it?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:14", "end": "11:30", "text": "No, no, no. I reboot your system. I think its rebooting. Am I correct? After reporting? Yes. After reporting, try to log in. Ok, I will share the session of your system. I take a remote session. Ok, thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:30", "end": "14:11", "text": "Thank you so much. Okay, its working now. Can I have the ticket number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:11", "end": "14:16", "text": "Thanks for staying on hold, ma'am. Ma'am. Hello? Yes. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:15", "end": "14:20", "text": "Yes, it seems to be working out. This is further than what I got before. Can I have a ticket number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:20", "end": "14:25", "text": "Yeah, just 2 minutes. I'll look at the ticket number, OK?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:25", "end": "14:28", "text": "Can I end this video?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:27", "end": "16:59", "text": "Yeah, yeah, Yeah. In this video, I will create a ticket number. Ok? You for staying on hold, please. One minute, I will create a ticket number. Ok?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:59", "end": "17:02", "text": "Hello? Yes. Can you hear?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:02", "end": "17:08", "text": "Me? Yeah. Just one minute. I will create a ticket number. Ok?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "17:08", "end": "19:02", "text": "Ok, for this one. Ok, Can you please? Do you want to change? Look at this. Yes, you will have to go in. And that way, you have access to the check. Well. Thank you. Yeah, no, you're not. Like. Yeah, work. Because, like in the island. Uh, but it won't allow any, uh, to open."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:01", "end": "19:23", "text": "Thank you for staying. Hold, Please note on the ticket number. Hello? Hello, ma'am. Can you hear me?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:23", "end": "19:26", "text": "Hello?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:26", "end": "19:35", "text": "Hello? Yeah, yeah, I'm here. Can you hear me? Yeah. Ok, please note it on the ticket number."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:34", "end": "19:46", "text": "OK, give me one second. And what's the."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "19:46", "end": "20:00", "text": "Inc. I as in India and as in number C. As in Charlie. ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "19:59", "end": "20:02", "text": "I'm going to need it one more time. I'm so sorry."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:01", "end": "20:22", "text": "Yeah. ****. ***. One 3. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "20:22", "end": "20:23", "text": "Okay. Thank you so much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "20:23", "end": "21:54", "text": "Okay, ma'am. Is there anything else I can help you with? No. Have a great one. Ok, just one thing, ma'am. Before discount the call, I would send a short service. This call with the first service for the customer where you can scale 5 to one every 5 minutes. Very satisfied on the second service. First contact distribution. Very cancellate one, which means our issue was in the first contact. Thank you for contacting support. Have a great day. Bye. Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve. *****. Fantastic. This time, enter your response. Using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-e2d72db4-822d-4dc8-9efb-a68e07a56d5d.MP3", "name": "e2d72db4-822d-4dc8-9efb-a68e07a56d5d", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:06", "end": "00:28", "text": "Thanks for contacting Mr. Code. My name is ********. How can I help you? Hello? Hello. This is iron from Lucas, Michigan. Actually, your voice is very low. If you don't mind, can you please repeat it again?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:27", "end": "00:29", "text": "Yeah."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:29", "end": "01:08", "text": "Hello. This is iron from nuclear incident. And I came to my password a few days ago. And today I'm trying to open, but this is my account. Temporary. Locked. Ok, so your account is locked out. You need help unlocking your account, right? Yeah, that's right. OK, I will surely help you with that before proceeding. May I know your BMS ID *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:08", "end": "01:09", "text": "4."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:09", "end": "01:25", "text": "Ok, may I know your first and last name? So my first name is ***** * for Hotel R for Romeo O for Oscar and for November. And your first initial. And your last name is ********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:25", "end": "01:27", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:27", "end": "02:38", "text": "You for confirming the details? Did you call the performance before for this particular issue? I'm so sorry. Can you please repeat this again? OK, sure. Did you contacted teleperformance before for this particular issue? ******* performance help. Not yet. OK, so this is your first time contacting health risk for this particular issue, right? Yes, that's right. Yeah, I will surely help you with that. Can you please provide me a couple of minutes? I'm going to review your profile. I'm so sorry. What should they provide to me? No, no. Can you please provide me a couple of minutes? I'm going to review your provider. Yeah. Thank you. You're done. Yeah. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:38", "end": "05:23", "text": "I'm going to give that to you. Thank you. Hello. Welcome to my lecture. Thank you. Thank you. How can I give you a second? Please continue to hold. For the next available representative. Thank you. Thank you. Hello. my to Welcome lecture. Thank you. Thank. You. Thank you very much. Thank you. Very much. Thank you. Very much. Hello. Welcome to my lecture. Thank you. Thank you. Thank you. Hello. Welcome lecture. my to Thank you. Very much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:23", "end": "05:53", "text": "You for staying on the line. I'm just done reviewing your profile. I will check your account in my tool. If it's locked, I'm going to unlock it. Please provide me a minute or 2. Yeah. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:51", "end": "07:37", "text": "Okay. Thank you. Thank you. Thank you. Thank. You. Thank you. All right. Thank you very much. Thank. You. Thank you. Thank. You. Thank you very much. You're. Welcome. How do you do the market? I'm."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:37", "end": "08:06", "text": "Thank you for staying on the line. I just checked your account in my tool. It is not logged. Can you please try to log in again? Oh, sure. Just give me a moment. So just give me a moment. I'm going to try to log in, please. Yeah, sure."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:06", "end": "11:31", "text": "Yes. Ma'am. Thank you. Thank you. Thank you. Thank. You. Thank you very much. Thank you. Thank you. Hello. Welcome to my lecture. Thank. You very much. All right. Thank you very much. Thank you. much. Very Thank you. Very much. Hello. Welcome to my lecture. Please continue to. Hold. Your us. to is business important Hello. Welcome to my lecture. You're. Welcome. Thanks for calling. Hello. to my. Welcome Lecture. Thank you. Thank you very much. Thank you. Thank you. Thank. You. you. Thank Thank you. Hello. Thanks for having me. Hello. Welcome. To my lecture. Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:30", "end": "11:38", "text": "Hello."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:37", "end": "11:43", "text": "Hello."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:42", "end": "12:41", "text": "Hello. Hello. Can you hear me? Hello? Yeah. Hello. Ok, so thank you for helping me. I already accessed an account. Ok, you were able to log in into your system. Ok. Uhhuh. That's correct. By the way, can you please send me? Can you please tell me the ticket number? Yeah, sure. I will provide you the ticket number. Can you please provide me a couple of minutes? I will create the ticket number. Ok, take your time. Yeah, Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:35", "end": "13:39", "text": "Thank. You very much. Let's call this. Oh, you're welcome. Thank you. That's what I'm calling. Thank. You. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:38", "end": "16:55", "text": "Yeah. Thank you for staying on the line. I got your ticket number right now with me. Please let me know once you're ready to take it down. OK, sure. Yeah, it is. I as in India N as in November C As in Charlie, I N C *********. That is your ticket number. Can you please repeat it back to me? So it's in India and Nancy. *********. Is that right? Yeah, it is inc *********. Yeah, that is your ticket number. Is there anything else apart from this that I can help you with? No, I think that's all. Thank you so much for helping me. And it'll be wonderful. Yeah, sure. So, Mr. ****** post this call. I would connect you to a short survey with the first survey for the customer satisfaction where you can wait on the scale of 5 to one where 5 means very satisfied. And the second survey is for the first contact resolution wherein you can select one, which means your issue was resolved in the first contact. I hope your issue was resolved in the first contact. Thank you for contacting this support. Have a great day. Bye bye. Bye bye. Yeah, you too. Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from the scale of one to 5 with 5 being very satisfied and one very unsatisfied. Yeah. We did not get your response. Please try again. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it. Made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One the strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-e7da4b17-545d-4a5e-a9f9-d30dbe893d75.MP3", "name": "e7da4b17-545d-4a5e-a9f9-d30dbe893d75", "utterances": [{"speaker": "Agent", "speaker_type": "agent", "start": "00:06", "end": "00:12", "text": "Thank you for calling Address Fort. My name is **** ****. How may I assist you?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:11", "end": "00:26", "text": "Okay. Hi. Good evening. My name is charity and I am from Performance Mania. And I need an assistance in setting up my PC as a first time work at home."}, {"speaker": "Customer", "speaker_type": "customer", "start": "00:25", "end": "00:27", "text": "Ok."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:27", "end": "00:42", "text": "No problem. I hate for the ingredients cost to you. Be sure I will surely assist you to do the reason carry. So as you have first sent it, set up on the home. So do you want to set up on the comment for the right?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:42", "end": "00:46", "text": "Yes. Yes, yes."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:46", "end": "00:51", "text": "Ok, no problem. First of all, may I know your employee ID number?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "00:51", "end": "00:59", "text": "Ok, my employee ID number is *******."}, {"speaker": "Agent", "speaker_type": "agent", "start": "00:59", "end": "01:11", "text": "Ok, and may I know the higher date? Do I know the higher date."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:11", "end": "01:21", "text": "I, um, hired. October 7th, ******, which is last year."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:21", "end": "01:27", "text": "May I know the location?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:27", "end": "01:34", "text": "I am working at 54 4 months."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:34", "end": "01:39", "text": "Okay, May I know the supervisor name?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:39", "end": "01:53", "text": "So my supervisor's name. So it's ********* ***. But on my DMS, I think I was transferred to me."}, {"speaker": "Agent", "speaker_type": "agent", "start": "01:52", "end": "01:57", "text": "Yeah. And may I know the username ID."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "01:57", "end": "02:04", "text": "So my job is stop."}, {"speaker": "Agent", "speaker_type": "agent", "start": "02:03", "end": "02:15", "text": "Okay. Thank you. Confirms. Okay. And may I know the May I know the issue on the setup for the computer."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "02:15", "end": "03:52", "text": "Ok, so before last week, when I tried to find anything, my last name, it is not accepting my returning and access. And the first error that I had since went home. And there was an error. August 8th ****. And I informed one of the available supervisors on the floor at the site and he found the piece and it was sold. And now the issue that I announced when I tried to get the case and the text that we had filed a case that we can try to gather. However, there's an option for me to love me. And when I answer to you may enter my use and password. There is another appeal on my team. Let me show. Let me give you what I'll be doing. Let me show you today. Okay, So the error. So the error appeared. It paid here. We can sign you in with this credential because your domain isn't available. Make sure your device is connected to your organization's network. If you previously signed in on this device with another credential, you can sign in with that credential. So that's the error message."}, {"speaker": "Customer", "speaker_type": "customer", "start": "03:51", "end": "03:53", "text": "Ok."}, {"speaker": "Agent", "speaker_type": "agent", "start": "03:53", "end": "04:07", "text": "You can also confirm V before log in the computer. Could you connect the VPN UI faster? You need to connect the VPN and then detail it to log in the window."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:07", "end": "04:15", "text": "So when I try to restart my previous, there's no option to connect the review."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:15", "end": "04:39", "text": "You can just see the right and I open whenever you open the computer and just see the right bottom corner dual motor icon. So just click on their head and then connect the VPN. Which one? And then try to do a motorker on the right bottom side on your screen."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "04:39", "end": "04:46", "text": "So before in my screen, please do that before."}, {"speaker": "Agent", "speaker_type": "agent", "start": "04:46", "end": "05:07", "text": "Yeah, before login the BMS, you need to connect the VPN so you can just see on their door mode icon. Have you seen dormotor icon on the bottom side? Right bottom side, door icon."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:06", "end": "05:27", "text": "So the icon that I can see here in my end is network signing. And then, yeah, ESF access and the powerbox on the right side. That's the information that I take."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:26", "end": "05:34", "text": "Okay, please show me the screen. So please put on the link and show me the is great."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "05:34", "end": "05:38", "text": "It is. You will attend online."}, {"speaker": "Agent", "speaker_type": "agent", "start": "05:38", "end": "06:28", "text": "I'll provide the link. So please open the browser and put on the link and show me the screen. So are you ready? Yeah. M for Mary Y for Yankee, H for Hotel, E for Echo, L for Lima, P for Papa, is for Sara, C for Charlie, R for Romeo, E for your goal, E for your call N for nancy dot com. Myhealthsisting dot com. Forward slash number ******."}, {"speaker": "Customer", "speaker_type": "customer", "start": "06:27", "end": "06:30", "text": "That's. It."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:30", "end": "06:36", "text": "So this is. It's not the one that I use."}, {"speaker": "Customer", "speaker_type": "customer", "start": "06:35", "end": "06:38", "text": "Sorry."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:38", "end": "06:42", "text": "So is this the website that I used to use on my phone?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "06:41", "end": "06:45", "text": "Yes. Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "06:45", "end": "07:08", "text": "Ok, give me a minute. That's me on the phone. Just a moment. So it is mine. Health team health. Dot com. Then forward slash ******. Is that right?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "07:07", "end": "07:22", "text": "Right."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:22", "end": "07:29", "text": "Oh, so do I use the installer?"}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:28", "end": "07:32", "text": "Yes."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:31", "end": "07:38", "text": "Yes."}, {"speaker": "Customer", "speaker_type": "customer", "start": "07:38", "end": "07:49", "text": "It."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "07:49", "end": "08:57", "text": "So the code that I will use? Yes. Because there was nothing. It. Uh. Well, how about it? Hello?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "08:56", "end": "09:33", "text": "Yes. Ok, just give me a Q second. Yeah. So please open the camera and show me the ice cream."}, {"speaker": "Customer", "speaker_type": "customer", "start": "09:33", "end": "09:36", "text": "Can. You. See? Now."}, {"speaker": "Agent", "speaker_type": "agent", "start": "09:36", "end": "09:42", "text": "You can just open the camera. I'm sorry. This is pain."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "09:42", "end": "09:45", "text": "I'll just open my gum."}, {"speaker": "Customer", "speaker_type": "customer", "start": "09:45", "end": "10:08", "text": "Yeah. So."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:08", "end": "10:13", "text": "How is it there? Anything else?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:12", "end": "10:31", "text": "Yes. Please show me the right bottom corner. Yeah. *******, are you going to Dual Reich? Just click on the door. *****."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "10:30", "end": "10:32", "text": "One."}, {"speaker": "Agent", "speaker_type": "agent", "start": "10:32", "end": "11:10", "text": "Yes. Just wait. Yeah, it's going to connect. Yeah. Put on the USN password one you can put on there capital dot 6 17 and then put on our password."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:10", "end": "11:33", "text": "Is that cool? Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "11:32", "end": "11:37", "text": "Yeah. And then put on a password."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "11:36", "end": "11:40", "text": "So I need to."}, {"speaker": "Agent", "speaker_type": "agent", "start": "11:39", "end": "12:25", "text": "Yeah. Same tablet 17 and then a password. We just wait."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:24", "end": "12:40", "text": "Okay. I'm going to."}, {"speaker": "Customer", "speaker_type": "customer", "start": "12:38", "end": "12:49", "text": "Thank."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "12:49", "end": "14:05", "text": "You. Thank you. Thank you. Thank you. you. you. Thank Thank Thank you. Thank you. Thank you. Thank you. you. Thank you. Thank you. Thank Thank you. How long is it?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "14:05", "end": "14:35", "text": "Yeah. Just wait. Don't do anything. You can just wait, ma'am. Your system is started."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "14:35", "end": "15:55", "text": "Thank you. Thank you. Thank you. Thank you. Thank you. you. Thank Thank Thank you. you. Thank you. Its. Thank. You. you. you. Thank you. Thank Thank Ok. Thank you. Thank you. Thank you."}, {"speaker": "Customer", "speaker_type": "customer", "start": "15:55", "end": "16:06", "text": "Thank. You. Thank. You. Thank. You. Thank. You. Thank. You."}, {"speaker": "Agent", "speaker_type": "agent", "start": "16:05", "end": "18:13", "text": "Yeah. Please be on the line. Now. I'm going to create a ticket regarding this issue. And you can just wait. Don't do anything because it will take a time for the opening on your computer. Just dealing with. Yeah, you can just wait with your computer having open each and everything. So don't do 20. Even just with 2 to 3 minutes. It will. Please give me the pleasure of Please call me. Yes. Just click on the es. Just click on there. Yes, yes. Click on the yes. Why Yankee for your pay. Yes. Yeah. Now your computer eop. Please say with the left bottom Carlor."}, {"speaker": "Customer", "speaker_type": "customer", "start": "18:13", "end": "18:20", "text": "Yeah."}, {"speaker": "Agent", "speaker_type": "agent", "start": "18:20", "end": "18:35", "text": "Please tell me if have you control. Yes, please. Ok, yeah. Ok."}, {"speaker": "Customer", "speaker_type": "customer", "start": "18:35", "end": "18:47", "text": "Thank."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "18:47", "end": "19:05", "text": "You. Thank you. Thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "19:05", "end": "19:25", "text": "Yeah, it will take our time, sir, for the opening. All the tools. Okay, so you can just note down the ticket number. And after that, if you have any issue on your spin date again, call later again. So, are you ready to note down the ticket number?"}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "19:25", "end": "19:30", "text": "If you're giving me a moment, OK, I'm ******."}, {"speaker": "Agent", "speaker_type": "agent", "start": "19:30", "end": "19:48", "text": "I for India. N for Nancy, C for Zarlie. *******."}, {"speaker": "Customer", "speaker_type": "customer", "start": "19:48", "end": "19:58", "text": "9. Conduct. That's. All."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "19:58", "end": "20:01", "text": "Yes, I am."}, {"speaker": "Agent", "speaker_type": "agent", "start": "20:01", "end": "20:05", "text": "Well, go ahead."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:05", "end": "20:18", "text": "Yeah. So the digit number is I N T 0314, then *****. Is that right?"}, {"speaker": "Agent", "speaker_type": "agent", "start": "20:18", "end": "20:22", "text": "Yes, Correct, ma'am."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:22", "end": "20:26", "text": "Okay, so I'll just wait for this one to do that."}, {"speaker": "Agent", "speaker_type": "agent", "start": "20:26", "end": "20:44", "text": "Yeah, you can just wait for time because you are low in the first time. So it will take time for the opening, each and everything. So you can just wait. And after that, have you facing the issue, Then you can call back again."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:44", "end": "20:47", "text": "Thank you. So that's all."}, {"speaker": "Agent", "speaker_type": "agent", "start": "20:47", "end": "20:54", "text": "Yes, ma'am. Is there anything else I may help you."}, {"speaker": "Speaker 3", "speaker_type": "customer", "start": "20:54", "end": "20:57", "text": "No, thank you."}, {"speaker": "Agent", "speaker_type": "agent", "start": "20:57", "end": "21:15", "text": "Ok. And the survey. Are you connected to a software survey? Post this call where you can do the service rise gallery 5 to 15 pieces side and the second survey. First contact resolution. Select one. Reach me or uhhuh False contact. Thank you for calling IP home. Have a great day. Thank you. Bye bye."}, {"speaker": "Customer", "speaker_type": "customer", "start": "21:14", "end": "22:57", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call, enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. We did not get your response. Please try again. How satisfied were you with the assistance you had from the IT specialist on today's call, Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2 if it still has not been resolved, press 3. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement."}]}, {"id": "audio_Call1-ee779b79-8e68-45f3-b408-f18cfe70862a.MP3", "name": "ee779b79-8e68-45f3-b408-f18cfe70862a", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:19", "end": "01:02", "text": "Thank you. Thank you. Thank you. Hello. Can you hear me? Hello? Hello. Can you hear?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:02", "end": "01:05", "text": "Me. Hello? Yes, I can hear you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:05", "end": "01:11", "text": "Yeah. Welcome to ID. Support. My name is *****. How may I help you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:11", "end": "01:20", "text": "Yes. I needed assistance for my for the password reset on my account."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:19", "end": "01:33", "text": "Ok, not an issue. So I do apologize. Ok, No worries. I do apologize for the inconvenience caused to use that. I will be sure assisting you with the same as the industry. You need the password or reset. That's why you're calling in, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:33", "end": "01:34", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:34", "end": "01:39", "text": "Can I have your BMS number?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:39", "end": "01:45", "text": "So it's ******* ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:45", "end": "01:49", "text": "Name, please."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:48", "end": "01:58", "text": "I'm *********** *****. ******* hiding date, please. Again, It's, uh, **** ***********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:58", "end": "02:02", "text": "Hiring date, Sir, I'm asking you a different question."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:01", "end": "02:12", "text": "Uh, hi. Ok, It's, uh, April 11th, **** *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:12", "end": "02:18", "text": "Name."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:17", "end": "02:20", "text": "**** ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:20", "end": "02:44", "text": "Ok, sir, I'm resetting you password. I'm resetting your password. I would like to tell you that this is going to be a temporary password. Once you'll be entertaining to this credit, we'll be routing you to the page where you can reset your own password while you setting a new password, You have to make sure the password should not match any of your previous passwords at all and should be containing the information more than 13 to 14 in total. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:44", "end": "02:45", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:45", "end": "03:02", "text": "And also, I would like to tell you that we have recently launched a tool which is called a self service tool, which is accessible on the opening internet and can be used for the password. Mobile. Uh, just to make sure, uh, where exactly you are signing and you're working from home or working from office."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:02", "end": "03:06", "text": "I'm working from the office on, Ok, not an issue."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:06", "end": "04:37", "text": "Please be with me. Thank you. Thank you. It. I don't know what I can. Oh, Ok. So. It."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:37", "end": "04:42", "text": "Hi. Hello."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:42", "end": "06:33", "text": "Hold on, please. Hello, sir. Thank you for being on call. Please note down the street password."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:33", "end": "06:45", "text": "Let's see. One moment, please. OK? It's gonna be lower."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:45", "end": "06:50", "text": "As in Romeo."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:50", "end": "06:51", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:51", "end": "07:05", "text": "Lowercase n as in November. Lowercase C as in Charlie."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:05", "end": "07:13", "text": "OK, capital U as in umbrella."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:13", "end": "07:29", "text": "Number 9. Small R, as in. Romeo. Small B, as in. Bravo. Small G, as in."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:29", "end": "07:33", "text": "Girl. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:33", "end": "07:40", "text": "Number 9. Small y as in yellow."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:39", "end": "07:41", "text": "Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:41", "end": "07:53", "text": "Small T as in tango. Capital G as in Juliet."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:53", "end": "08:54", "text": "Ok, can I confirm this? Sure. I have here a lower case R for Romeo, lowercase N for November. Lowercase C for Charlie, uppercase U for umbrella number 9. And then after that is lowercase R and then lowercase B for Bravo. And after it's lower case 34. Is it J or G 4? Yeah. GPA girl. And after that is 9. Ok, got it. And after that is Y for Yankee. Mmhmm. And after that is P for tangle over case for tangle and then uppercase J for Juliet. Yes. Yes. OK, got it. So that can be my temporary password, right? Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:54", "end": "08:56", "text": "Sir."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:55", "end": "08:57", "text": "Ok, got it. Thanks."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:57", "end": "09:06", "text": "Are you going to test it out or you will be calling back If it is not working."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:06", "end": "14:42", "text": "One moment, please let me check if this will work. Ok, sure. Sure. Ok, one moment. One moment, please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:42", "end": "15:17", "text": "Hello, sir. Thank you for being on call. Is it working?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:16", "end": "15:21", "text": "Hello? Hello? Yes, sir."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:21", "end": "15:26", "text": "Is it working? Yeah, so."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:26", "end": "15:29", "text": "I already changed my password and it's not working."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:29", "end": "15:35", "text": "Well, anything else? You need? Any address?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:35", "end": "15:37", "text": "I think I am all good now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:37", "end": "15:48", "text": "OK, Perfect. Ok, not an issue. So hold on. I will be giving you the ticket number for the call."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:47", "end": "15:50", "text": "I'm sorry. Hold on, please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:50", "end": "16:01", "text": "Yeah, no member. Let me know once you're ready."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:01", "end": "16:04", "text": "Ok, go on. Go ahead. Its."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:04", "end": "16:30", "text": "R As in Romeo E As in Echo Q As in Quebec. *****. All right. ****."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:30", "end": "16:32", "text": "Got it. Perfect."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:31", "end": "16:42", "text": "So just to make sure that's your first call to it. Help us about the issue that you're having with the password, right?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "16:41", "end": "16:46", "text": "Yes. Thank you so much. Not an issue."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "16:46", "end": "17:05", "text": "Suppose this call I will be connecting to survey for service or customer satisfaction where you can service on a scale of 5 means very satisfied on the second service. Regarding first contact reservation. Or you can connect the services number one, which means you should go fixed on the first contact. Thank you for reaching out to it. Help us have a blessed day. Goodbye."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "17:05", "end": "17:17", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT."}]}, {"id": "audio_Call1-f4630d8f-b938-4bfc-8506-69393639e733.MP3", "name": "f4630d8f-b938-4bfc-8506-69393639e733", "utterances": [{"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:12", "end": "00:23", "text": "My name is ****. How can I help you? Yes, this is. I get disconnected while we're in the process of replacement."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:23", "end": "00:27", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:27", "end": "00:53", "text": "So like, do you have an ticket number? I don't have a ticket number because the call gets disconnected. Ok, so what was the issue with you? Like which replacement you will be going to happen? I'm having an error. When I turn online to you, it says it's marked hard errors."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:53", "end": "01:04", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:04", "end": "01:27", "text": "OK, no worries. I will be checking your issue. First of all, I do apologize for the inconvenience caused you, and I will be helping you here before that. Can I have your BMS ID and your full name? That's maybe the MSI *******. My name is ***** ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:27", "end": "01:53", "text": "OK."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:53", "end": "02:14", "text": "OK, just give me a few minutes. Let me just check if any ticket on your name has been created or not. Ok. Also, the link was sent by ******. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:13", "end": "03:28", "text": "Is. That. Helps. Thank. You. Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:28", "end": "05:24", "text": "All right. So I got the previous ticket number here. And so before making the replacement, the call got disconnected. It went in between. So I'll be just. Making another replacement ticket for you. Ok. Hello. Are you there? Hello. Can you hear me? I'm sorry. I was talking on my phone. How should I send the photo of the wife? Which one? ****** was asking for? The photo of the Whitespeaker on the CP a while ago. So how should I send it? Ok, can you just share me your personal email address? I will be sharing you a virtual assistance link and you can just show me the CPU. OK, OK, it's my first name and last name. That's L r at gmail dot com. Your first name and last name, then dot l R. Right? Yes at gmail dot com. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:23", "end": "06:13", "text": "Thank you. you. Thank Thank you. Hello. Welcome to my lecture. Thank you. Thank you. Thank you. Thank. You. Very. Much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:13", "end": "06:24", "text": "OK, I've already shared the virtual assistance link. You can just click on it, allow the access to your camera and avoid sharing any sensitive information."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:23", "end": "07:01", "text": "Thank. You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:01", "end": "07:37", "text": "All right. I got it. Ok, just give me a couple of minutes here and let me just create the replacement. You can turn off your camera. I'm sorry. You can turn off your camera now. I will see."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:37", "end": "08:19", "text": "You. Thank. You. Very. Much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:18", "end": "08:49", "text": "So you are a VPN user or VDI user M and M's VPN meter. OK."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:49", "end": "13:23", "text": "Thank you very much. Thank. You. Very. Much. Thank. Very. Much. You. All right. Thank. You. Very. Much. Thank. Much. Very. You. Thank. You. Very. Much. Thank you. Thank much. very you Thank. You. Very. Much. Thank. You. Very. Much."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:23", "end": "13:30", "text": "You for being on the line? I'm still working on an issue. So just be with me, OK?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:30", "end": "13:38", "text": "I. Can. Hear? You."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:38", "end": "15:25", "text": "Can you confirm your phone number once? My mobile phone number? Yeah, it's ***********. So it's *******. It's **********. Correct. *****. Yes. Yeah. All right. So actually, your system has been stuck here with the fleet team, so I need to remove it first with the Walms team. And after that, I'll be creating the replacement for you. OK, so just be with me."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:25", "end": "23:54", "text": "Ok. No. Worries. Thank you very much. Thank. You. Very. Much. Thank you. Thank you. Thank you very much. Thank. You. Thank. You. Thank. You. Very. Much. Thank. You. Very. Much. Thank you very much. Thank you. Thank you. Thank much. you very Thank. You. Thank you. Thank you. you. Thank Thank you. Thank you. Thank you. Thank you. Thank much. you very Thank you. Thank you. Thank. You. Very. Much. Thank much. you very Thank. Very. You. Much. Thank much. very you Thank you very much. Thank very much. you Thank you very much. Thank. Much. You. Very. Thank you. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "23:54", "end": "25:29", "text": "You for being on the line. So I have already created the replacement there. Can you please confirm your supervisor's name? It's ***** *********, ****** or Anaria? Ok, can you confirm your shipping address? Management network is Santa Fe? Nevertheless, but I can take that PC and the PTSD. Ok, Firstly, your PC will come to your steps. Ok, if you didn't receive it then it will go to that TPS. Ok. Will it be fine If I take my CPU and the PP access instead, you can take it. It's OK. Now it is OK. That's great. And will I be needing any ticket ID or? Yeah, I'll provide you the reference number in the end of this call. Can you just confirm me the postal code once? *****. All right, now, just give me a few minutes. I'll provide you the reference number. Ok?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "25:29", "end": "30:16", "text": "Ok. Thank you. Thank you. Thank you. Thank you. Thank you. Thank. You. Thank you very much. Thank. Much. You. Very. Thank. You. Very. Much. Thank. You. Thank. You. Thank. You. Very. Much. Thank. You. Very. Much. Thank you very much. Thank. You. Very. Much. Thank you."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "30:16", "end": "30:42", "text": "All right. Thank you so much for being on the line here. So actually, we are facing some latency in our tool. That's why we are getting some delay over here. But right now, the replacement is already created and you can just note down the reference number whenever you are ready for it. Yes, I'm ready. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "30:41", "end": "30:43", "text": "Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "30:43", "end": "32:15", "text": "You cannot the reference number. It starts with Upper Case Inc as an Indigo November. Charlie. The number. *********. Ok, I'm going to read it back. Can you please confirm it's Inc? *********. That is absolutely correct. And this is the reference number for this interaction and you'll be getting your replacement within the next 2 to 3 business days. And I've already sent the mail to your supervisor and the respective replacement team as well. Ok, OK, thank you so much. Yeah. So as of now, I will be connecting you for a short survey post after this call where the first survey is for customer satisfaction. When scale of factor one need to choose 5 for very satisfied. And also the second survey is for first contact resolution where you can choose one. If you got your issue resolved in very first contact with me. Anything else I can help you with? 9. So thank you. All right. I do appreciate if you take that survey. Thank you for calling it. Have a nice day. Take care."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "32:15", "end": "32:19", "text": "Thank. You. Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "32:18", "end": "33:40", "text": "Thanks for giving us a few minutes of your time to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist On today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact, press one. If it took multiple contacts to resolve, press 2 if it still has not been resolved, press 3. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Remember, 7 is the strongest agreement. One. The strongest disagreement. Remember, 7 is strongest agreement. One is strongest disagreement. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-f645c145-e329-4ecf-9761-fa7ea15a7e54.MP3", "name": "f645c145-e329-4ecf-9761-fa7ea15a7e54", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:09", "end": "00:15", "text": "You for calling address? My name is *****. How can I help you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:15", "end": "00:22", "text": "Sorry. I can barely hear you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:21", "end": "00:26", "text": "Sorry. Could you please repeat again?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:25", "end": "00:46", "text": "Um, I would like to change my password because it was expired. Or maybe it says here your account is temporarily because I've called. However, the call just got disconnected and my password just got reset and I wanted a new password again."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:46", "end": "00:58", "text": "Ok, I am really sorry that you're having this issue, and surely I will try to provide the best ever solution from my end. But before that, could you please provide me your BMS ID?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:58", "end": "01:04", "text": "My BMS ID is *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:04", "end": "01:09", "text": "It's *******. Am I correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:09", "end": "01:10", "text": "Correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:10", "end": "01:15", "text": "Thank you for confirmation. Could you please help me with your full name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:15", "end": "01:20", "text": "Sure. First name is ********. Last name is ******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:20", "end": "01:31", "text": "OK, thank you for confirmation. It may take me a moment to review your information. May I put you on hold for the same?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:30", "end": "01:31", "text": "Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:31", "end": "02:15", "text": "Ok, please take another hold. Ok. [MUSIC] [MUSIC] [MUSIC] I appreciate your patience. Thank you for staying on hold. Yeah, I just said you need to change your password. Am I correct?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:14", "end": "02:16", "text": "Yes, that is correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:16", "end": "02:31", "text": "Ok, I am really sorry that you have this issue and let me help you with that. But before going to passport reset, you need to confirm some security questions. Let me know when you're ready. I will ask the questions. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:31", "end": "02:35", "text": "Sure."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:34", "end": "02:41", "text": "Could you please confirm your BMS ID once again?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:41", "end": "02:48", "text": "My BMS ID is *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:48", "end": "02:54", "text": "Thank you for confirmation. Could you please forward me your manager name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:54", "end": "03:00", "text": "A manager name is ******** *******. Ok, thank you for confirmation."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:00", "end": "03:07", "text": "Could you please help me with your higher month and year?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:06", "end": "03:15", "text": "Um, my higher date is February 27th of ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:14", "end": "03:26", "text": "Ok, thank you for confirmation. And could you please confirm? Is this your first time calling regarding this issue?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:26", "end": "03:27", "text": "I'm sorry."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:27", "end": "03:34", "text": "Is this your first time calling regarding this issue."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:34", "end": "03:42", "text": "About password change? Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:41", "end": "03:55", "text": "Yes. Please confirm this one. Is this your first time calling regarding this issue for password related issue? First time or second time?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:55", "end": "03:58", "text": "Um, yes, it's my first one."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "03:57", "end": "04:34", "text": "Okay, thank you for confirmation. And could you please confirm? But before before calling, Have you tried any password related tools to reset your password? Have you tried any password related tools. Before calling to it? Team for password reset Before I tried any password tools. Please confirm as or no. Are you tried or not?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:34", "end": "04:38", "text": "I'm sorry. What? I can understand."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:38", "end": "04:51", "text": "Before before password reset. Before calling to it. Team for password reset. Before have you tried any password related tools to reset your password? Please confirm as or."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:51", "end": "04:59", "text": "Yes. Before it was Microsoft, however, we changed to strap desk."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:58", "end": "05:05", "text": "Ok, have you tried any tools to reset your password?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:05", "end": "05:10", "text": "Um, since we migrated to Strategy Desk. No."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:10", "end": "05:12", "text": "Thank you for the information."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:12", "end": "05:13", "text": "And I am."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:13", "end": "05:32", "text": "Providing a one password reset link to your email. And further, if you have any issue with your password, you can reset your password using that link. OK, and I am providing a random password. Let me know when you're ready. Sir."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:32", "end": "05:34", "text": "I am for for now."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:33", "end": "05:56", "text": "I am giving you one random password. OK, from your next login, you need to change your password. The password should be in 14 characters. It contains minimum one uppercase, one lower case, one special character, one number. Also, for now, I am giving you one random password. Let me know when you're ready. I will provide the random password."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:55", "end": "06:00", "text": "Yes, please."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:00", "end": "06:06", "text": "It's a lowercase cucu? U as in uniform."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:06", "end": "06:08", "text": "Lowercase U."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:07", "end": "06:13", "text": "Yes. Uppercase R as in Romeo."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:13", "end": "06:23", "text": "Uppercase R as in Romeo number 2."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:22", "end": "06:34", "text": "Uppercase D. No, no, no lowercase no, no, no. After 2 lowercase P As in Papa."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:34", "end": "06:37", "text": "Yes. In Papa Lowercase Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:37", "end": "06:43", "text": "Uppercase D as in Delta."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:42", "end": "06:47", "text": "Uppercase D As in Delta. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:46", "end": "06:52", "text": "Uppercase G as in zero."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:52", "end": "06:55", "text": "I'm sorry G for George."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:55", "end": "07:02", "text": "No G for 00 or Julu."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:01", "end": "07:09", "text": "Oh, upper Z for zebra. Is that yes?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:09", "end": "07:13", "text": "And number 3."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:13", "end": "07:17", "text": "And number 3, is that correct? Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:16", "end": "07:22", "text": "Uppercase p As in Papa."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:21", "end": "07:24", "text": "Uppercase p As in Papa."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:24", "end": "07:31", "text": "Yes. Lowercase J As in Juliet."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:31", "end": "07:35", "text": "Ok, lowercase J as in Juliet."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:35", "end": "07:41", "text": "Yes. Lowercase B b as in Bravo."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:41", "end": "07:44", "text": "Lowercase B as in Bravo."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:44", "end": "07:51", "text": "Yes. Uppercase E as in echo."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:50", "end": "07:54", "text": "Uppercase E as in Echo. Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:54", "end": "07:59", "text": "Uppercase double w as in whiskey."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:58", "end": "08:02", "text": "Uppercase w as in whiskey."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:01", "end": "08:08", "text": "Yes, that's correct. Could you please repeat again? I will reconfirm it. OK?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:08", "end": "08:21", "text": "Sure. Lowercase U as in umbrella uppercase R as in Romeo. The number 2 lowercase P as in Paul."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:21", "end": "08:22", "text": "OK for case."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:22", "end": "08:42", "text": "D as in dog uppercase Z, as in zebra. The number 3 uppercase. P As in Paul. Lowercase J as in Jack. Lowercase B as in boy case E as in echo case W as in whiskey."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:42", "end": "08:58", "text": "Yes, that's correct. And please try to log in with this password. OK, from your next login, you need to change your password. The password should be in 14 characters. It contains Pingham one uppercase, one lower case special character one number also. OK."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:58", "end": "09:01", "text": "Oh, sure. Hang on one second. Let me try this first."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:01", "end": "09:10", "text": "Ok, please try. Please try to log in and let me know. Ok, and kindly, please stay connected to the call."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:10", "end": "09:26", "text": "Oh, hang on a second. Sorry. Ok, I just logged in. Let me just try to change over the phone. It's on it to make sure. Ok."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:26", "end": "09:33", "text": "And one more thing. Please do not use the whole password. The password should be in your care."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:33", "end": "09:39", "text": "Is it on my PC email? Oh, I see it now. I can change now the password."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:39", "end": "09:45", "text": "Thank you so much. Ok, now your issue was all right."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:44", "end": "09:47", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:47", "end": "09:56", "text": "Ok, give me a minute. I will provide the ticket number, Ok, but before that, could you please confirm? Is there anything else I can help you with?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:56", "end": "10:01", "text": "No, that'll be all. Is there a survey? Because I will give you 5 stars?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:01", "end": "10:15", "text": "Ok, yeah, definitely. Thank you for confirmation. And give me a minute. I will provide a ticket number regarding this issue. Please stay connected and discover the caller."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:15", "end": "10:35", "text": "Sure. Take your time. No, I'm fine. If that's person. Uhhuh. Thank you."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:35", "end": "10:47", "text": "I appreciate your patience. Thank you for staying online. Based on our interaction, I created one incident on record ticket. Let me know when you're ready, I will provide the ticket number. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:47", "end": "10:48", "text": "Sir."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:48", "end": "10:57", "text": "Based on our instruction, I created one request ticket. Let me know when you're ready, I will provide the ticket number. Ok?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:57", "end": "10:59", "text": "Sure. I'm ready."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:59", "end": "11:06", "text": "It's uppercase R as in Romeo."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:06", "end": "11:08", "text": "Alpha case R. As in Romeo."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:08", "end": "11:12", "text": "Uppercase E e as in echo."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:12", "end": "11:15", "text": "Uppercase E as in echo."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:14", "end": "11:19", "text": "Uppercase Q As in queen."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:18", "end": "11:22", "text": "Uppercase Q As in queen."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:21", "end": "11:25", "text": "***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:24", "end": "11:27", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:26", "end": "11:31", "text": "***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:29", "end": "11:33", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:31", "end": "11:36", "text": "***."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:35", "end": "11:37", "text": "***."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:36", "end": "11:41", "text": "Yes. You want me to repeat it again?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:41", "end": "11:53", "text": "No, I can repeat it. Its R as in Romeo uppercase E As in echo uppercase Q As in queen *********."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:53", "end": "12:03", "text": "Yes, that's correct. And could you please confirm, Is this your first time calling regarding this issue or second time?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:02", "end": "12:06", "text": "Sure. My first name instead?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:06", "end": "12:15", "text": "No, no, no, no. Is this your first time calling regarding this issue? This is first time."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:14", "end": "12:16", "text": "Yes. This is my first time."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:16", "end": "12:33", "text": "Ok, thank you for confirmation and I am going to push the survey. Please give the survey based on this call. Ok, please do not compare the previous call survey. Thank you so much for all that. Is there anything else I can help you with?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:32", "end": "12:34", "text": "That'll be all. Thank you so much."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:34", "end": "13:04", "text": "OK, ma'am, I would connect to your short survey post this call where the first survey is for the customer satisfaction wherein you can select trait on scale 5 to one where 5 means very satisfied and the second survey is for the first 2 to contact resolution wherein you can select one, which means your issue was resolved in the first contact. Thank you for contacting black support. Have a great day ahead. Bye."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:04", "end": "13:53", "text": "Thanks for giving us a few minutes of your time to complete the IT helpd desk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from the scale of one to 5 with 5 being very satisfied and one very un Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to receive. Fantastic this time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}, {"id": "audio_Call1-ff841840-41e3-4431-ad7f-28d41a331a0f.MP3", "name": "ff841840-41e3-4431-ad7f-28d41a331a0f", "utterances": [{"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:17", "end": "00:24", "text": "Thank you for calling it immediately. Support. My name is *****. How may I assist you today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:23", "end": "00:29", "text": "Yes, this is Clarinet."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:29", "end": "00:32", "text": "OK?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:32", "end": "00:43", "text": "Yeah, I have a VPN issue. I am working with him here, so I just got my confusion."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:42", "end": "00:53", "text": "So you are unable to connect to EPN, right? Yes. Ok, may I have your name?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "00:53", "end": "01:00", "text": "That was *******."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "00:58", "end": "01:09", "text": "*****. One. 3. One. 3. The first and last name."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:09", "end": "01:12", "text": "It's very yes, I am in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:12", "end": "01:19", "text": "OK, that is the VPN throwing any L message."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:19", "end": "01:27", "text": "As I can see here on the multiple showing that we cannot sign you in for the student because your delay isn't available."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:27", "end": "01:43", "text": "Make sure your device is connected to your medication. So you are. Are you trying to log in into Windows or VPN?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "01:42", "end": "01:49", "text": "VPN? That was the error message that I have."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "01:49", "end": "02:09", "text": "No. Listen, when we log into window or without connect VPN. So we get this error message. We never get the same error with VPN. That's why I'm asking. Are you logging into VPN or windows?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "02:09", "end": "02:16", "text": "I'm not sure about that one because this is the first time that I have this one."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "02:16", "end": "03:21", "text": "Okay, I will invite you one moment. I'm just pulling up your details. Sure. Please. Continue. To. Hold. Is there ever I need you to report my email address."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "03:21", "end": "04:12", "text": "Please. ******* ****** **** Micro. My personal email address or C email. So if it will be ********@*****.***. So I have here 4 icons."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:12", "end": "04:13", "text": "Can you see the leave here?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:13", "end": "04:16", "text": "Right from the."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:16", "end": "04:23", "text": "I'm. Sorry. Can you see the VP icon?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:23", "end": "04:31", "text": "Which one I have here? 4 icons. Actually, I have. Click."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:30", "end": "04:38", "text": "One from left. Click on first one from left."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:38", "end": "04:42", "text": "This one network sign in."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:42", "end": "04:47", "text": "Yeah, I see, like a loop."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "04:46", "end": "04:54", "text": "Do I need to click that one?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "04:53", "end": "05:05", "text": "Oh."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:04", "end": "05:13", "text": "On the website showing other user and then reset password and lap account."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:13", "end": "05:29", "text": "No icon repair icon is right hand side. There is 4 icon first. First on. What is your second one? Is that 3rd one is speaker and error. Click on first one from the left."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:29", "end": "05:40", "text": "I have here each of access. The other one is Internet. And then the other one is network. Sign in. Wait."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "05:40", "end": "05:50", "text": "I'm sending you one limb with that link you can from Houston so I can assist you together."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "05:49", "end": "06:01", "text": "Which one? Which one do do I need to see?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:01", "end": "06:07", "text": "The email. Wait. I'm sending a link. I'm sending a link to you one moment."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:07", "end": "06:27", "text": "Go ahead. Sure. Is it through email?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:26", "end": "06:33", "text": "Yes. Ok."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "06:33", "end": "06:53", "text": "Let's see. Thank."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "06:53", "end": "07:15", "text": "You. Thank. You. I have told it to you. You can check."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:15", "end": "07:21", "text": "Is it SVA link? Is that the one?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:21", "end": "07:24", "text": "Sorry."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:23", "end": "07:44", "text": "All right. I have here. So do I need to click that link?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "07:43", "end": "07:59", "text": "Yes. Put no one."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "07:59", "end": "08:27", "text": "Just give me one moment. Single. Saying this. Do you allow to use? Do you allow us to use 2 clicks? Which one do I need to Last week?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:26", "end": "08:31", "text": "Sorry, Link."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:30", "end": "08:40", "text": "Showing here that? Yes. Click on the link. Click the link and showing, huh?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "08:40", "end": "08:45", "text": "After could they go on the link Because they gonna allow?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "08:45", "end": "09:06", "text": "Oh, allow just one moment because I'm not seeing allow. have I no sign in. So do I need to sign in first?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:06", "end": "09:11", "text": "Can you show us?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:11", "end": "09:15", "text": "Do I need to sign in?"}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:15", "end": "09:20", "text": "Can you show me? Not at all."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:19", "end": "09:33", "text": "All right, give me one moment."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "09:33", "end": "09:45", "text": "Can you see that you are an online on your email, which is https. Colon forward slash supportnew. Tps."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "09:45", "end": "10:08", "text": "No, just one moment. Here. Let me just double check. I I have that one. I see. All right, I have here alone. Hello. Allow us of this time."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:07", "end": "10:08", "text": "Yes."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:08", "end": "10:16", "text": "****. Office. There you go. Click my screen. Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:16", "end": "10:25", "text": "Click anywhere on the screen. Click on the screen. Yeah, I can see. Now show me the right portion."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:25", "end": "10:27", "text": "That I have. Click on."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:27", "end": "10:35", "text": "Click on 2. Small screen. First 2. Smallest screen. First one. This one."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:35", "end": "10:44", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "10:44", "end": "10:57", "text": "Click on connect. And password."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "10:56", "end": "11:00", "text": "Guess password net username."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:00", "end": "11:48", "text": "Show me. Show me shortly of bubble. And the boat. Password and username inbod. OK. Salmon dot 8 and password. I'm. Sorry. Yes. Yes, he was. Thank you. One moment you are logged in. You are connected with VPN. That was the VPL. So every time many into PC, you have to click on to a small Kiev icon, then Kilicon connect."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "11:48", "end": "11:50", "text": "Enter your password."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "11:50", "end": "12:04", "text": "Then this is the Windows interface. It's called Windows interface that you have in front of you other user. Enter your username again. And password was same which you have which you have to."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:04", "end": "12:06", "text": "Change."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:06", "end": "12:28", "text": "no, No, no, no, no. They're the same. Now. You are being logged into a computer."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:28", "end": "12:35", "text": "Okay."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:35", "end": "12:41", "text": "And by the way, is this your first score with me for this issue today?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:41", "end": "12:44", "text": "Sure. Yes, of course."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:44", "end": "12:52", "text": "No, I'm asking. By the way, is it your first call with me today for this issue?"}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "12:52", "end": "12:54", "text": "Yes."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "12:53", "end": "13:06", "text": "Okay, so now you are being to log in after one alternative, you will be logging. Is there anything else? No. You are loading. No."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:06", "end": "13:08", "text": "Thank you so much."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "13:08", "end": "13:15", "text": "You're welcome. Just give me a minute. I'm providing you to give number One moment. Don't hang up. Okay, Sure."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "13:15", "end": "14:02", "text": "Sure."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:02", "end": "14:17", "text": "Hello. Thanks. Calling. For."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:17", "end": "14:19", "text": "Hello, ****."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:19", "end": "14:52", "text": "Yes. Ok. Okay, please. No daughter to get number."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "14:51", "end": "14:55", "text": "Yes, please. I am C."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "14:55", "end": "15:08", "text": "I like India like November C like cat *********."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:08", "end": "15:17", "text": "Let me read it back to you. It's the inc. *********. Correct."}, {"speaker": "Speaker 1", "speaker_type": "customer", "start": "15:16", "end": "15:40", "text": "That's correct. And I will connect you to short survey. Post this call their first survey for customers. That is Sectional *** wins Finance in service for fast contact resolution wherein you can select one, which means you issue dissolving fast contact with me. So please don't miss to rate only. Thank you for calling its support our."}, {"speaker": "Speaker 2", "speaker_type": "agent", "start": "15:40", "end": "17:05", "text": "Thanks for giving us a few minutes to complete the IT helpdesk survey. Your feedback is essential to help us enhance our service to you. How satisfied were you with the assistance you had from the IT specialist on today's call? Enter from a scale of one to 5 with 5 being very satisfied and one very unsatisfied. Thank you. If your issue was resolved in one contact press one. If it took multiple contacts to resolve press 2 If it still has not been resolved press 3. We did not get your response. Please try again. If your issue was resolved in one contact press one. If it took multiple contacts to resolve press 2. Fantastic. This time, enter your response using a scale of one to 7 where 7 means you strongly agree with the following statement and one means you strongly disagree with it made it easy for you to handle your issue. Thank you for your important and valuable feedback. If you need any additional support, please call us back."}]}]);
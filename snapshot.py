@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Corpus Snapshot
+Compact binary snapshot of the parsed transcript corpus, so servers can start
+by memory-mapping one file instead of re-reading and re-parsing every
+transcript. Run this module as a build step to write the snapshot; readers
+fall back to parsing the .txt files when it is missing or stale. Either way,
+only files whose size or mtime differ from the existing snapshot are parsed.
+
+The snapshot also holds the tables the server derives from the text (see
+corpus_tables.py): passage boundaries, sizes, hashes and both search
+indexes, so a warm start maps those too instead of recomputing them.
+
+Layout: 8-byte magic, 4-byte little-endian header length, JSON header, then
+8-byte aligned arrays: the transcript SECTIONS, with the UTF-8 text blob
+last, followed by each transcript's file size and mtime and the derived
+tables. The header records each array's offset, length and dtype.
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+from pathlib import Path
+
+import numpy as np
+
+from ingest import parse_files
+from transcript_columns import Transcript, to_seconds
+from transcript_index import CHUNK_UTTERANCES, CHUNK_CONTEXT
+from corpus_tables import derive_tables
+
+SNAPSHOT_MAGIC = b'TRSNAP01'
+SNAPSHOT_VERSION = 3
+
+# Array sections: name -> dtype. transcript_starts has one entry per
+# transcript plus a terminator; text_offsets one per utterance plus one.
+SECTIONS = {
+    'transcript_starts': '<u4',
+    'text_offsets': '<u8',
+    'speaker_codes': '<u2',
+    'start_seconds': '<u4',
+    'end_seconds': '<u4',
+    'text': 'u1',
+}
+
+TRANSCRIPT_DIR = Path(__file__).parent / "formatted"
+SNAPSHOT_FILE = Path(__file__).parent / ".cache" / "corpus.snapshot"
+
+def file_stats(directory: Path) -> dict:
+    """Map each transcript filename to its (size, mtime_ns)."""
+    stats = {}
+    for filepath in directory.glob("*.txt"):
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
+            continue
+        stats[filepath.name] = (stat.st_size, stat.st_mtime_ns)
+    return stats
+
+def stats_signature(stats: dict) -> str:
+    """Hash of a file_stats() result."""
+    digest = hashlib.sha1()
+    for name in sorted(stats):
+        size, mtime_ns = stats[name]
+        digest.update(f"{name}\0{size}\0{mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def corpus_rows(transcripts: list) -> list:
+    """
+    Positions of the transcripts the server serves, in its order: those
+    with utterances, sorted by filename.
+    """
+    rows = [i for i, t in enumerate(transcripts) if t['utterance_count']]
+    return sorted(rows, key=lambda i: transcripts[i]['filename'])
+
+def write_snapshot(transcripts: list, path: Path, stats: dict):
+    """
+    Write parsed transcripts (ingest.parse_transcript format) and the
+    tables derived from them to a snapshot file. stats is the file_stats()
+    of the directory as it was before the transcripts were parsed.
+    """
+    speakers = {}
+    transcript_starts = [0]
+    text_offsets = [0]
+    speaker_codes = []
+    start_seconds = []
+    end_seconds = []
+    blob = bytearray()
+
+    for t in transcripts:
+        for u in t['utterances']:
+            blob += u['text'].encode('utf-8')
+            text_offsets.append(len(blob))
+            speaker_codes.append(speakers.setdefault(u['speaker'], len(speakers)))
+            start_seconds.append(to_seconds(u['start']))
+            end_seconds.append(to_seconds(u['end']))
+        transcript_starts.append(len(speaker_codes))
+
+    arrays = {
+        'transcript_starts': transcript_starts,
+        'text_offsets': text_offsets,
+        'speaker_codes': speaker_codes,
+        'start_seconds': start_seconds,
+        'end_seconds': end_seconds,
+        'text': blob,
+    }
+    arrays = {name: np.asarray(arrays[name], dtype=dtype) for name, dtype in SECTIONS.items()}
+
+    arrays['file_sizes'] = np.array([stats[t['filename']][0] for t in transcripts], dtype='<u8')
+    arrays['file_mtimes'] = np.array([stats[t['filename']][1] for t in transcripts], dtype='<i8')
+
+    rows = corpus_rows(transcripts)
+    tables = derive_tables([transcripts[i] for i in rows])
+    arrays['corpus_rows'] = np.array(rows, dtype='<u4')
+    for name, table in tables.items():
+        if name != 'signature':
+            arrays[name] = table
+
+    header = {
+        'version': SNAPSHOT_VERSION,
+        'signature': stats_signature(stats),
+        'ids': [t['id'] for t in transcripts],
+        'names': [t['name'] for t in transcripts],
+        'filenames': [t['filename'] for t in transcripts],
+        'speakers': list(speakers),
+        'tables': {
+            'signature': tables['signature'],
+            'sections': [name for name in tables if name != 'signature'],
+            'chunk_utterances': CHUNK_UTTERANCES,
+            'chunk_context': CHUNK_CONTEXT,
+        },
+        'sections': {},
+    }
+
+    # Section offsets are relative to the end of the header
+    payload = []
+    offset = 0
+    for name, array in arrays.items():
+        data = array.tobytes()
+        header['sections'][name] = [offset, len(array), array.dtype.str]
+        padding = -len(data) % 8
+        payload.append(data + b'\0' * padding)
+        offset += len(data) + padding
+
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    header_bytes += b' ' * (-(len(header_bytes) + 12) % 8)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(struct.pack('<I', len(header_bytes)))
+        f.write(header_bytes)
+        for data in payload:
+            f.write(data)
+    os.replace(tmp_path, path)
+
+def read_snapshot(path: Path, signature: str = None):
+    """
+    Memory-map a snapshot. Returns a dict with the header fields and one
+    read-only NumPy array per section, or None if the file is missing,
+    unreadable, does not match signature or was cut into passages
+    differently.
+    """
+    try:
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        if buffer[:8] != SNAPSHOT_MAGIC:
+            return None
+        header_length = struct.unpack('<I', buffer[8:12])[0]
+        header = json.loads(buffer[12:12 + header_length])
+    except (struct.error, ValueError):
+        return None
+    if header.get('version') != SNAPSHOT_VERSION:
+        return None
+    if signature is not None and header.get('signature') != signature:
+        return None
+    tables = header['tables']
+    if (tables['chunk_utterances'], tables['chunk_context']) != (CHUNK_UTTERANCES, CHUNK_CONTEXT):
+        return None
+
+    base = 12 + header_length
+    snapshot = {key: value for key, value in header.items() if key != 'sections'}
+    snapshot['buffer'] = buffer
+    for name, (offset, count, dtype) in header['sections'].items():
+        if count:
+            snapshot[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=base + offset)
+        else:
+            snapshot[name] = np.zeros(0, dtype=dtype)
+    return snapshot
+
+def snapshot_transcripts(snapshot: dict) -> list:
+    """
+    Transcripts backed by the snapshot's arrays. Nothing is copied: every
+    transcript reads its utterances straight from the memory map.
+    """
+    speakers = tuple(snapshot['speakers'])
+    starts = snapshot['transcript_starts'].tolist()
+    text = memoryview(snapshot['text'])
+
+    transcripts = []
+    for i, transcript_id in enumerate(snapshot['ids']):
+        first, last = starts[i], starts[i + 1]
+        transcripts.append(Transcript(
+            transcript_id, snapshot['names'][i], snapshot['filenames'][i], speakers, text,
+            snapshot['text_offsets'][first:last + 1],
+            snapshot['speaker_codes'][first:last],
+            snapshot['start_seconds'][first:last],
+            snapshot['end_seconds'][first:last]))
+    return transcripts
+
+def snapshot_tables(snapshot: dict) -> dict:
+    """
+    The derived tables (corpus_tables.derive_tables) stored in the
+    snapshot, for its transcripts with utterances in filename order.
+    """
+    tables = {name: snapshot[name] for name in snapshot['tables']['sections']}
+    tables['signature'] = snapshot['tables']['signature']
+    return tables
+
+def update_transcripts(directory: Path, path: Path, stats: dict) -> list:
+    """
+    Transcripts for the files in stats, sorted by filename: those whose
+    size and mtime match the snapshot at path come from its memory map,
+    the others are parsed.
+    """
+    current = {}
+    snapshot = read_snapshot(path)
+    if snapshot is not None:
+        recorded = zip(snapshot['file_sizes'].tolist(), snapshot['file_mtimes'].tolist())
+        for t, file_stat in zip(snapshot_transcripts(snapshot), recorded):
+            if stats.get(t['filename']) == file_stat:
+                current[t['filename']] = t
+
+    changed = [directory / filename for filename in sorted(stats) if filename not in current]
+    for t in parse_files(changed):
+        current[t['filename']] = t
+    return [current[filename] for filename in sorted(current)]
+
+def build_snapshot(directory: Path = TRANSCRIPT_DIR, path: Path = SNAPSHOT_FILE) -> list:
+    """Bring the snapshot of the transcript directory up to date."""
+    stats = file_stats(directory)
+    transcripts = update_transcripts(directory, path, stats)
+    write_snapshot(transcripts, path, stats)
+    return transcripts
+
+def load_corpus(directory: Path = TRANSCRIPT_DIR, path: Path = SNAPSHOT_FILE,
+                with_tables: bool = False):
+    """
+    Load transcripts from the snapshot when it is current, otherwise parse
+    the directory and refresh the snapshot. The transcripts read from the
+    memory map, so processes forked after loading share one copy in the
+    page cache. With with_tables, returns (transcripts, derived tables),
+    the tables being None if the snapshot could not be written.
+    """
+    stats = file_stats(directory)
+    signature = stats_signature(stats)
+    snapshot = read_snapshot(path, signature)
+    if snapshot is None:
+        print(f"Snapshot {path.name} missing or stale, parsing transcripts...")
+        transcripts = update_transcripts(directory, path, stats)
+        try:
+            write_snapshot(transcripts, path, stats)
+        except OSError as e:
+            print(f"Warning: Could not write snapshot {path.name}: {e}")
+            return (transcripts, None) if with_tables else transcripts
+
+        # Serve from the memory map, as a warm start would
+        snapshot = read_snapshot(path, signature)
+        if snapshot is None:
+            return (transcripts, None) if with_tables else transcripts
+
+    transcripts = snapshot_transcripts(snapshot)
+    return (transcripts, snapshot_tables(snapshot)) if with_tables else transcripts
+
+def main():
+    """Build the snapshot for the transcript directory."""
+    directory = Path(sys.argv[1]) if len(sys.argv) > 1 else TRANSCRIPT_DIR
+    path = Path(sys.argv[2]) if len(sys.argv) > 2 else SNAPSHOT_FILE
+    transcripts = build_snapshot(directory, path)
+    size = os.path.getsize(path) / 1024
+    print(f"Wrote {path} ({len(transcripts)} transcripts, {size:.1f} KB)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Tests for answer_cache: questions that must not share a cached answer."""
+
+import pytest
+
+from answer_cache import SemanticCache, context_key, question_vector
+
+THRESHOLD = SemanticCache().threshold
+
+ROLE_SWAPPED = [
+    ("What do customers complain about?", "What do agents complain about?"),
+    ("What problems do customers have with VPN?", "What problems do agents have with VPN?"),
+    ("How do callers react when put on hold?", "How do reps react when put on hold?"),
+    ("What do customers ask for most often?", "What do agents ask for most often?"),
+]
+
+@pytest.mark.parametrize('a, b', ROLE_SWAPPED)
+def test_role_swapped_questions_stay_apart(a, b):
+    assert question_vector(a, 512) @ question_vector(b, 512) < THRESHOLD
+
+def test_role_synonyms_match():
+    a = question_vector("What do customers complain about?", 512)
+    b = question_vector("What do callers complain about?", 512)
+    assert a @ b > THRESHOLD
+
+def test_lookup_requires_same_context():
+    cache = SemanticCache()
+    params = {'temperature': 0.3}
+    context = context_key(['a', 'b'], params)
+    cache.add("What are the most common complaints?", {'answer': 'x'}, context)
+
+    hit = cache.lookup("What are the main complaints?", context)
+    assert hit is not None and hit[0] == {'answer': 'x'}
+    assert cache.lookup("What are the main complaints?", context_key(['a', 'c'], params)) is None
+    assert cache.lookup("What are the main complaints?",
+                        context_key(['a', 'b'], {'temperature': 0.7})) is None
+
+def test_context_key_ignores_item_order():
+    assert context_key(['a', 'b'], {}) == context_key(['b', 'a'], {})
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Topic Clusters
+Offline job that groups transcripts by topic so aggregate questions can
+sample one representative per kind of call instead of every Nth file.
+Each transcript becomes an L2-normalized TF-IDF vector; mini-batch
+spherical k-means (cosine similarity) clusters them on the CPU with NumPy
+only. The cluster sizes, the transcripts closest to each centroid (the
+first is the medoid) and every transcript's assignment are written to
+CLUSTER_FILE, which the server reads when it builds its corpus.
+
+Usage: python topic_clusters.py [cluster count]
+"""
+
+import os
+import sys
+import json
+import math
+from pathlib import Path
+from collections import Counter
+
+import numpy as np
+
+from transcript_index import tokenize, STOPWORDS
+from snapshot import load_corpus, TRANSCRIPT_DIR, SNAPSHOT_FILE
+
+CLUSTER_FILE = Path(__file__).parent / ".cache" / "topic_clusters.json"
+CLUSTER_VERSION = 1
+
+CLUSTER_COUNT = 30
+REPRESENTATIVES = 10  # Transcripts stored per cluster, closest to its centroid first
+LABEL_TERMS = 8  # Top centroid terms stored as a readable cluster label
+
+# Vocabulary: terms in at least MIN_DF transcripts and at most
+# MAX_DF_FRACTION of them, the MAX_FEATURES most frequent of those
+MAX_FEATURES = 5000
+MIN_DF = 2
+MAX_DF_FRACTION = 0.5
+
+# Mini-batch k-means (Sculley, "Web-scale k-means clustering")
+BATCH_SIZE = 256
+BATCH_ITERATIONS = 100
+SEED = 0
+
+def tfidf_matrix(transcripts: list) -> dict:
+    """
+    Sparse TF-IDF rows (CSR: indptr, indices, data) for transcripts, with
+    sublinear term frequency and unit-length rows.
+    """
+    counts = []
+    df = Counter()
+    for t in transcripts:
+        c = Counter(w for u in t['utterances'] for w in tokenize(u['text']) if w not in STOPWORDS)
+        counts.append(c)
+        df.update(c.keys())
+
+    num_docs = len(transcripts)
+    max_df = max(MIN_DF, MAX_DF_FRACTION * num_docs)
+    eligible = [term for term, n in df.items() if MIN_DF <= n <= max_df]
+    eligible.sort(key=lambda term: (-df[term], term))
+    vocabulary = sorted(eligible[:MAX_FEATURES])
+    columns = {term: i for i, term in enumerate(vocabulary)}
+    idf = {term: math.log(num_docs / df[term]) + 1 for term in vocabulary}
+
+    indptr = [0]
+    indices = []
+    data = []
+    for c in counts:
+        row = sorted((columns[term], (1 + math.log(n)) * idf[term])
+                     for term, n in c.items() if term in columns)
+        norm = math.sqrt(sum(value * value for _, value in row)) or 1.0
+        indices.extend(column for column, _ in row)
+        data.extend(value / norm for _, value in row)
+        indptr.append(len(indices))
+
+    return {
+        'indptr': np.array(indptr, dtype=np.int64),
+        'indices': np.array(indices, dtype=np.int32),
+        'data': np.array(data, dtype=np.float32),
+        'vocabulary': vocabulary,
+    }
+
+def dense_rows(matrix: dict, rows) -> np.ndarray:
+    """Rows of a tfidf_matrix() as a dense float32 array."""
+    dense = np.zeros((len(rows), len(matrix['vocabulary'])), dtype=np.float32)
+    indptr = matrix['indptr']
+    for i, row in enumerate(rows):
+        start, end = indptr[row], indptr[row + 1]
+        dense[i, matrix['indices'][start:end]] = matrix['data'][start:end]
+    return dense
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (zero rows stay zero)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1)
+
+def minibatch_kmeans(matrix: dict, k: int, rng) -> np.ndarray:
+    """
+    Spherical mini-batch k-means. Each step assigns a random batch to its
+    most similar centroids and moves every centroid towards its batch
+    members with a per-centroid learning rate of 1 / points seen.
+    Returns unit-length centroids.
+    """
+    num_docs = len(matrix['indptr']) - 1
+    centroids = dense_rows(matrix, rng.choice(num_docs, size=k, replace=False))
+    seen = np.zeros(k, dtype=np.int64)
+
+    for _ in range(BATCH_ITERATIONS):
+        batch = dense_rows(matrix, rng.choice(num_docs, size=min(BATCH_SIZE, num_docs), replace=False))
+        labels = np.argmax(batch @ centroids.T, axis=1)
+        for vector, label in zip(batch, labels):
+            seen[label] += 1
+            centroids[label] += (vector - centroids[label]) / seen[label]
+        centroids = normalize(centroids)
+    return centroids
+
+def assign(matrix: dict, centroids: np.ndarray) -> tuple:
+    """Most similar centroid of every transcript and the cosine similarity to it."""
+    num_docs = len(matrix['indptr']) - 1
+    labels = np.zeros(num_docs, dtype=np.int64)
+    similarities = np.zeros(num_docs, dtype=np.float32)
+    for start in range(0, num_docs, BATCH_SIZE):
+        rows = range(start, min(start + BATCH_SIZE, num_docs))
+        scores = dense_rows(matrix, rows) @ centroids.T
+        labels[rows.start:rows.stop] = np.argmax(scores, axis=1)
+        similarities[rows.start:rows.stop] = scores.max(axis=1)
+    return labels, similarities
+
+def build_clusters(transcripts: list, k: int = CLUSTER_COUNT) -> dict:
+    """
+    Cluster transcripts by topic. Returns the CLUSTER_FILE contents:
+    clusters largest first, each with its size, label terms and
+    representative transcript ids (medoid first), plus the cluster of
+    every transcript id.
+    """
+    transcripts = [t for t in transcripts if t['utterance_count']]
+    k = min(k, len(transcripts))
+    if not k:
+        return {'version': CLUSTER_VERSION, 'clusters': [], 'assignments': {}}
+
+    matrix = tfidf_matrix(transcripts)
+    centroids = minibatch_kmeans(matrix, k, np.random.default_rng(SEED))
+    labels, similarities = assign(matrix, centroids)
+
+    clusters = []
+    for label in np.argsort(-np.bincount(labels, minlength=k), kind='stable'):
+        members = np.flatnonzero(labels == label)
+        if not len(members):
+            continue
+        members = members[np.argsort(-similarities[members], kind='stable')]
+        top_terms = np.argsort(-centroids[label])[:LABEL_TERMS]
+        clusters.append({
+            'size': int(len(members)),
+            'terms': [matrix['vocabulary'][i] for i in top_terms if centroids[label][i] > 0],
+            'representatives': [transcripts[i]['id'] for i in members[:REPRESENTATIVES]],
+            'members': members,
+        })
+
+    assignments = {}
+    for number, cluster in enumerate(clusters):
+        for i in cluster.pop('members'):
+            assignments[transcripts[i]['id']] = number
+
+    return {'version': CLUSTER_VERSION, 'clusters': clusters, 'assignments': assignments}
+
+def save_clusters(clusters: dict, path: Path = CLUSTER_FILE):
+    """Write the clusters atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(clusters, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def load_clusters(path: Path = CLUSTER_FILE):
+    """Read the clusters written by this job, or None if missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            clusters = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if clusters.get('version') != CLUSTER_VERSION:
+        return None
+    return clusters
+
+def main():
+    """Cluster the transcript directory and write CLUSTER_FILE."""
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else CLUSTER_COUNT
+    transcripts = load_corpus(TRANSCRIPT_DIR, SNAPSHOT_FILE)
+    clusters = build_clusters(transcripts, k)
+    save_clusters(clusters)
+    print(f"Wrote {CLUSTER_FILE} ({len(clusters['assignments'])} transcripts "
+          f"in {len(clusters['clusters'])} clusters)")
+    for cluster in clusters['clusters']:
+        print(f"  {cluster['size']:5d}  {', '.join(cluster['terms'])}")
+
+if __name__ == "__main__":
+    main()
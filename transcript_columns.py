@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Transcript Columns
+Column-wise storage for parsed transcripts. A transcript keeps its utterance
+texts in one UTF-8 buffer with arrays of offsets, speaker codes and
+start/end seconds instead of a dict and a str per utterance, and builds no
+full-text copy up front. Utterance and Transcript are read-only Mapping
+views with __slots__, so code written against the old dict format
+(t['utterances'], u['text'], dict(u), ...) keeps working unchanged.
+"""
+
+from array import array
+from collections.abc import Mapping, Sequence
+
+def speaker_type(speaker: str) -> str:
+    """Normalize a speaker label to 'agent' or 'customer'."""
+    if speaker.lower() == 'agent' or speaker.lower() == 'speaker 2':
+        return 'agent'
+    return 'customer'
+
+def to_seconds(timestamp: str) -> int:
+    """Convert MM:SS to seconds."""
+    minutes, seconds = timestamp.split(':')
+    return int(minutes) * 60 + int(seconds)
+
+def to_timestamp(seconds: int) -> str:
+    """Convert seconds to MM:SS."""
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+class Utterance(Mapping):
+    """One utterance of a Transcript, read on demand from its columns."""
+
+    __slots__ = ('transcript', 'index')
+    KEYS = ('speaker', 'speaker_type', 'start', 'end', 'text')
+
+    def __init__(self, transcript: 'Transcript', index: int):
+        self.transcript = transcript
+        self.index = index
+
+    def __getitem__(self, key: str):
+        t = self.transcript
+        i = self.index
+        if key == 'text':
+            return t.utterance_text(i)
+        if key == 'speaker':
+            return t.speakers[t.speaker_codes[i]]
+        if key == 'speaker_type':
+            return t.speaker_types[t.speaker_codes[i]]
+        if key == 'start':
+            return to_timestamp(int(t.start_seconds[i]))
+        if key == 'end':
+            return to_timestamp(int(t.end_seconds[i]))
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __repr__(self) -> str:
+        return f"Utterance({dict(self)!r})"
+
+class Utterances(Sequence):
+    """A contiguous range of a transcript's utterances; slicing does not copy."""
+
+    __slots__ = ('transcript', 'start', 'stop')
+
+    def __init__(self, transcript: 'Transcript', start: int, stop: int):
+        self.transcript = transcript
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                return [self[j] for j in range(start, stop, step)]
+            return Utterances(self.transcript, self.start + start, self.start + max(start, stop))
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('utterance index out of range')
+        return Utterance(self.transcript, self.start + i)
+
+    def __iter__(self):
+        for i in range(self.start, self.stop):
+            yield Utterance(self.transcript, i)
+
+class Transcript(Mapping):
+    """
+    A parsed transcript in ingest.parse_transcript's format, stored by
+    column. text is a bytes-like buffer and text_offsets[i]:text_offsets[i + 1]
+    the bytes of utterance i, so several transcripts can share one buffer
+    (see snapshot.snapshot_transcripts). The column arrays may be array.array
+    or NumPy arrays.
+    """
+
+    __slots__ = ('id', 'name', 'filename', 'store_id', 'speakers', 'speaker_types',
+                 'text', 'text_offsets', 'speaker_codes', 'start_seconds', 'end_seconds')
+    KEYS = ('id', 'name', 'filename', 'utterances', 'full_text', 'utterance_count')
+
+    def __init__(self, id: str, name: str, filename: str, speakers: tuple, text,
+                 text_offsets, speaker_codes, start_seconds, end_seconds, store_id: int = None):
+        self.id = id
+        self.name = name
+        self.filename = filename
+        self.store_id = store_id
+        self.speakers = tuple(speakers)
+        self.speaker_types = tuple(speaker_type(s) for s in self.speakers)
+        self.text = text
+        self.text_offsets = text_offsets
+        self.speaker_codes = speaker_codes
+        self.start_seconds = start_seconds
+        self.end_seconds = end_seconds
+
+    @classmethod
+    def from_utterances(cls, id: str, name: str, filename: str, utterances,
+                        store_id: int = None) -> 'Transcript':
+        """Build a transcript from (speaker, start seconds, end seconds, text) tuples."""
+        speakers = {}
+        blob = bytearray()
+        text_offsets = array('I', [0])
+        speaker_codes = array('H')
+        start_seconds = array('I')
+        end_seconds = array('I')
+        for speaker, start, end, text in utterances:
+            blob += text.encode('utf-8')
+            text_offsets.append(len(blob))
+            speaker_codes.append(speakers.setdefault(speaker, len(speakers)))
+            start_seconds.append(start)
+            end_seconds.append(end)
+        return cls(id, name, filename, list(speakers), bytes(blob),
+                   text_offsets, speaker_codes, start_seconds, end_seconds, store_id)
+
+    def utterance_text(self, i: int) -> str:
+        """Text of utterance i."""
+        return str(self.text[self.text_offsets[i]:self.text_offsets[i + 1]], 'utf-8')
+
+    @property
+    def utterance_count(self) -> int:
+        return len(self.speaker_codes)
+
+    def __getitem__(self, key: str):
+        if key == 'utterances':
+            return Utterances(self, 0, self.utterance_count)
+        if key == 'utterance_count':
+            return self.utterance_count
+        if key == 'full_text':
+            return '\n'.join(f"{u['speaker']}: {u['text']}" for u in self['utterances'])
+        if key in ('id', 'name', 'filename'):
+            return getattr(self, key)
+        if key == 'store_id' and self.store_id is not None:
+            return self.store_id
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from self.KEYS
+        if self.store_id is not None:
+            yield 'store_id'
+
+    def __len__(self) -> int:
+        return len(self.KEYS) + (self.store_id is not None)
+
+    def __repr__(self) -> str:
+        return f"Transcript({self.id!r}, {self.utterance_count} utterances)"
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Transcript Index
+Token-level BM25F index over the passages of the loaded transcripts. The
+postings are flat arrays (TermPostings) that snapshot.py stores with the
+corpus, so server restarts map them instead of re-tokenizing everything.
+"""
+
+import re
+import math
+from collections import Counter
+from collections.abc import Mapping
+
+import numpy as np
+
+CHUNK_UTTERANCES = 4  # Utterances per retrievable passage
+CHUNK_CONTEXT = 1  # Neighbouring utterances shown on each side of a passage
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Utterances are indexed as two BM25F fields by speaker_type
+FIELDS = ('agent', 'customer')
+POSTING_STRIDE = 1 + len(FIELDS)
+
+# BM25F parameters. Customer turns describe the actual problem, so they
+# carry more weight than the agent's scripted lines.
+BM25_K1 = 1.2
+BM25_B = 0.75
+FIELD_WEIGHTS = {'agent': 1.0, 'customer': 1.5}
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'but', 'by', 'can', 'did', 'do',
+    'does', 'for', 'from', 'had', 'has', 'have', 'how', 'i', 'if', 'in', 'is',
+    'it', 'me', 'my', 'of', 'on', 'or', 'so', 'that', 'the', 'their', 'them',
+    'there', 'they', 'this', 'to', 'was', 'we', 'were', 'what', 'when', 'where',
+    'which', 'who', 'why', 'will', 'with', 'you', 'your',
+}
+
+def tokenize(text: str) -> list:
+    """Split text into lowercase word tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+def query_terms(question: str) -> list:
+    """Distinct non-stopword tokens of a question, in order of appearance."""
+    return list(dict.fromkeys(w for w in tokenize(question) if w not in STOPWORDS))
+
+def format_utterances(utterances: list) -> str:
+    """Render utterances as condensed "Speaker: text" lines."""
+    return "\n".join(f"{u['speaker']}: {u['text']}" for u in utterances)
+
+def passage_text(item: dict) -> str:
+    """
+    Text of a transcript or passage as the LLM sees it. Built on demand so
+    the corpus does not hold a second copy of every utterance.
+    """
+    if 'transcript' in item:
+        return format_utterances(item['transcript']['utterances'][item['start']:item['end']])
+    return format_utterances(item['utterances'])
+
+def make_chunk(t: dict, start: int, size: int, context: int) -> dict:
+    """The passage of transcript t whose core starts at utterance start."""
+    utterances = t['utterances']
+    end = min(start + size, len(utterances))
+    return {
+        'id': f"{t['id']}#{start}",
+        'name': t['name'],
+        'transcript': t,
+        'utterances': utterances[start:end],
+        'start': max(0, start - context),
+        'end': min(len(utterances), end + context),
+    }
+
+def build_chunks(transcripts: list, size: int, context: int) -> list:
+    """
+    Split each transcript into passages of `size` consecutive utterances.
+    Only the core window is indexed; the passage text (see passage_text)
+    also carries up to `context` neighbouring utterances on either side so
+    the LLM sees the surrounding exchange.
+    """
+    return [make_chunk(t, start, size, context)
+            for t in transcripts for start in range(0, len(t['utterances']), size)]
+
+class TermPostings(Mapping):
+    """
+    Read-only term -> postings mapping over flat arrays: terms holds the
+    sorted terms as fixed-width ASCII bytes and
+    postings[offsets[i]:offsets[i + 1]] the postings of term i, in rows of
+    stride values. Lookups bisect the term array, so nothing is built per
+    term and the arrays can stay in a memory map.
+    """
+
+    __slots__ = ('terms', 'offsets', 'postings', 'stride')
+
+    def __init__(self, terms: np.ndarray, offsets: np.ndarray, postings: np.ndarray, stride: int = 1):
+        self.terms = terms
+        self.offsets = offsets
+        self.postings = postings
+        self.stride = stride
+
+    @classmethod
+    def from_dict(cls, postings: dict, dtype, stride: int = 1) -> 'TermPostings':
+        """Pack {term: flat postings} into arrays."""
+        terms = sorted(postings)
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(postings[term]) for term in terms])
+        flat = np.zeros(int(offsets[-1]), dtype=dtype)
+        for i, term in enumerate(terms):
+            flat[offsets[i]:offsets[i + 1]] = postings[term]
+        return cls(np.array(terms, dtype='S'), offsets, flat, stride)
+
+    def find(self, term: str) -> int:
+        """Position of term in the term array, or -1."""
+        key = term.encode('ascii', 'replace')
+        i = int(np.searchsorted(self.terms, key))
+        if i < len(self.terms) and self.terms[i] == key:
+            return i
+        return -1
+
+    def row(self, i: int) -> np.ndarray:
+        """Postings of the term at position i."""
+        flat = self.postings[self.offsets[i]:self.offsets[i + 1]]
+        return flat.reshape(-1, self.stride) if self.stride > 1 else flat
+
+    def __getitem__(self, term: str) -> np.ndarray:
+        i = self.find(term)
+        if i < 0:
+            raise KeyError(term)
+        return self.row(i)
+
+    def __contains__(self, term) -> bool:
+        return isinstance(term, str) and self.find(term) >= 0
+
+    def __iter__(self):
+        for term in self.terms:
+            yield term.decode('ascii')
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+def build_index(chunks: list) -> dict:
+    """
+    Build an inverted index over the utterances of transcripts or chunks.
+    Postings are stored flat per term as [doc, tf_agent, tf_customer, ...]
+    where doc is the position of the document in the list.
+    """
+    postings = {}
+    doc_lengths = {field: [] for field in FIELDS}
+
+    for doc, t in enumerate(chunks):
+        counts = {field: Counter() for field in FIELDS}
+        for u in t['utterances']:
+            counts[u['speaker_type']].update(tokenize(u['text']))
+        for field in FIELDS:
+            doc_lengths[field].append(sum(counts[field].values()))
+        for term in set().union(*counts.values()):
+            postings.setdefault(term, []).extend(
+                (doc, *(counts[field][term] for field in FIELDS)))
+
+    return {
+        'postings': TermPostings.from_dict(postings, np.int32, POSTING_STRIDE),
+        'doc_lengths': {field: np.array(lengths, dtype=np.uint32)
+                        for field, lengths in doc_lengths.items()},
+    }
+
+def build_bm25_tables(index: dict) -> dict:
+    """
+    Precompute the per-corpus BM25F tables: the length-normalization
+    divisor of every document for each field, next to the postings. Both
+    are NumPy buffers instead of lists of ints, so forked server workers
+    share the pages (reference counting never writes to them).
+    """
+    num_docs = len(index['doc_lengths'][FIELDS[0]])
+    norms = {}
+    for field in FIELDS:
+        lengths = np.asarray(index['doc_lengths'][field], dtype=np.float64)
+        avg_length = lengths.mean() if num_docs and lengths.mean() > 0 else 1.0
+        norms[field] = (1 - BM25_B) + BM25_B * lengths / avg_length
+
+    return {'num_docs': num_docs, 'norms': norms, 'postings': index['postings']}
+
+def bm25_scores(tables: dict, terms: list) -> np.ndarray:
+    """Score every document against the query terms with BM25F."""
+    scores = np.zeros(tables['num_docs'], dtype=np.float64)
+
+    for term in terms:
+        postings = tables['postings'].get(term)
+        if postings is None:
+            continue
+        docs = postings[:, 0]
+
+        # Field-weighted, length-normalized pseudo term frequency
+        tf = np.zeros(len(docs), dtype=np.float64)
+        for col, field in enumerate(FIELDS, 1):
+            tf += FIELD_WEIGHTS[field] * postings[:, col] / tables['norms'][field][docs]
+
+        idf = math.log(1 + (tables['num_docs'] - len(docs) + 0.5) / (len(docs) + 0.5))
+        scores[docs] += idf * tf * (BM25_K1 + 1) / (BM25_K1 + tf)
+
+    return scores
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Transcript Store
+Optional SQLite storage backend. Transcripts and utterances live in
+ordinary tables, with two external-content FTS5 indexes over the
+utterance text: a word index ranked with bm25() for question retrieval
+and a trigram index that answers the search page's substring queries.
+Ingestion is incremental by file size and mtime, in bulk transactions on
+a WAL-mode database, so readers are never blocked by a sync.
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from ingest import parse_files
+from snapshot import file_stats
+from transcript_columns import Transcript
+
+STORE_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    id INTEGER PRIMARY KEY,
+    transcript_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    filename TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    utterance_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS utterances (
+    id INTEGER PRIMARY KEY,
+    transcript INTEGER NOT NULL REFERENCES transcripts(id),
+    position INTEGER NOT NULL,
+    speaker TEXT NOT NULL,
+    start_seconds INTEGER NOT NULL,
+    end_seconds INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS utterances_by_transcript ON utterances (transcript, position);
+CREATE VIRTUAL TABLE IF NOT EXISTS utterances_fts USING fts5(
+    speaker UNINDEXED, text, content='utterances', content_rowid='id');
+CREATE VIRTUAL TABLE IF NOT EXISTS utterances_trigram USING fts5(
+    text, content='utterances', content_rowid='id', tokenize='trigram');
+CREATE TRIGGER IF NOT EXISTS utterances_insert AFTER INSERT ON utterances BEGIN
+    INSERT INTO utterances_fts (rowid, speaker, text) VALUES (new.id, new.speaker, new.text);
+    INSERT INTO utterances_trigram (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS utterances_delete AFTER DELETE ON utterances BEGIN
+    INSERT INTO utterances_fts (utterances_fts, rowid, speaker, text)
+        VALUES ('delete', old.id, old.speaker, old.text);
+    INSERT INTO utterances_trigram (utterances_trigram, rowid, text)
+        VALUES ('delete', old.id, old.text);
+END;
+"""
+
+# The trigram index cannot match anything shorter than this
+TRIGRAM_MIN_LENGTH = 3
+
+def fts_phrase(text: str) -> str:
+    """Quote text as a single FTS5 phrase."""
+    return '"' + text.replace('"', '""') + '"'
+
+class TranscriptStore:
+    """SQLite transcript database with one connection per thread."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.local = threading.local()
+        self.inherited = []
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        db = self.connection()
+        version = db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, STORE_VERSION):
+            raise sqlite3.DatabaseError(
+                f"{self.path.name} has store version {version}, expected {STORE_VERSION}")
+        db.executescript(SCHEMA)
+        db.execute(f"PRAGMA user_version = {STORE_VERSION}")
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        This thread's connection to the database. After a fork the thread
+        that forked keeps its thread-local, so the child opens a new
+        connection and leaves the parent's one untouched.
+        """
+        db = getattr(self.local, 'db', None)
+        if db is not None and self.local.pid != os.getpid():
+            self.inherited.append(db)
+            db = None
+        if db is None:
+            db = sqlite3.connect(str(self.path), timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self.local.db = db
+            self.local.pid = os.getpid()
+        return db
+
+    def sync(self, directory: Path, stats: dict = None) -> tuple:
+        """
+        Bring the database in line with the .txt files in directory,
+        parsing only files whose size or mtime changed.
+        Returns (number of files ingested, number removed).
+        """
+        stats = file_stats(directory) if stats is None else stats
+        db = self.connection()
+        stored = {filename: (size, mtime_ns, row_id) for row_id, filename, size, mtime_ns
+                  in db.execute("SELECT id, filename, size, mtime_ns FROM transcripts")}
+
+        stale = [stored[name][2] for name in stored
+                 if name not in stats or stored[name][:2] != stats[name]]
+        changed = sorted(name for name in stats
+                         if name not in stored or stored[name][:2] != stats[name])
+        parsed = parse_files([directory / filename for filename in changed])
+
+        with db:
+            db.executemany("DELETE FROM utterances WHERE transcript = ?", [(i,) for i in stale])
+            db.executemany("DELETE FROM transcripts WHERE id = ?", [(i,) for i in stale])
+            for t in parsed:
+                size, mtime_ns = stats[t['filename']]
+                cursor = db.execute(
+                    "INSERT INTO transcripts (transcript_id, name, filename, size, mtime_ns, utterance_count) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (t['id'], t['name'], t['filename'], size, mtime_ns, t['utterance_count']))
+                row_id = cursor.lastrowid
+                db.executemany(
+                    "INSERT INTO utterances (transcript, position, speaker, start_seconds, end_seconds, text) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(row_id, i, t.speakers[code], start, end, t.utterance_text(i))
+                     for i, (code, start, end)
+                     in enumerate(zip(t.speaker_codes, t.start_seconds, t.end_seconds))])
+
+        return len(parsed), sum(1 for name in stored if name not in stats)
+
+    def load_transcripts(self) -> list:
+        """
+        All transcripts as column-stored Transcripts sorted by filename,
+        each with its database row id as store_id.
+        """
+        db = self.connection()
+        rows = db.execute("SELECT id, transcript_id, name, filename FROM transcripts ORDER BY filename").fetchall()
+        transcripts = []
+        for row_id, transcript_id, name, filename in rows:
+            utterances = db.execute(
+                "SELECT speaker, start_seconds, end_seconds, text FROM utterances "
+                "WHERE transcript = ? ORDER BY position", (row_id,))
+            transcripts.append(Transcript.from_utterances(
+                transcript_id, name, filename, utterances, store_id=row_id))
+        return transcripts
+
+    def rank_utterances(self, terms: list, limit: int) -> list:
+        """
+        Best-matching utterances for any of terms by FTS5 bm25().
+        Returns (transcript row id, position, speaker, score) tuples, best
+        first, with scores positive (bm25() reports better matches as
+        more negative).
+        """
+        if not terms:
+            return []
+        query = ' OR '.join(fts_phrase(term) for term in terms)
+        return [(row_id, position, speaker, -score) for row_id, position, speaker, score in
+                self.connection().execute(
+                    "SELECT u.transcript, u.position, u.speaker, bm25(utterances_fts) AS score "
+                    "FROM utterances_fts JOIN utterances u ON u.id = utterances_fts.rowid "
+                    "WHERE utterances_fts MATCH ? ORDER BY score LIMIT ?",
+                    (query, limit))]
+
+    def substring_candidates(self, values: list):
+        """
+        (transcript row id, position) of utterances that may contain every
+        value as a case-insensitive substring, from the trigram index.
+        Returns None when no value is long enough to use the index.
+        """
+        values = [value for value in values if len(value) >= TRIGRAM_MIN_LENGTH]
+        if not values:
+            return None
+        query = ' AND '.join(fts_phrase(value) for value in values)
+        return self.connection().execute(
+            "SELECT u.transcript, u.position FROM utterances_trigram "
+            "JOIN utterances u ON u.id = utterances_trigram.rowid "
+            "WHERE utterances_trigram MATCH ? ORDER BY u.transcript, u.position",
+            (query,)).fetchall()
+
+def open_store(path: Path, directory: Path) -> TranscriptStore:
+    """Open (creating if needed) the store at path and sync it with directory."""
+    store = TranscriptStore(path)
+    ingested, removed = store.sync(directory)
+    if ingested or removed:
+        print(f"Transcript store: ingested {ingested} files, removed {removed}")
+    return store
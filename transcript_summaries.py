@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Transcript Summaries
+Offline batch job that asks the model for a three-line summary (issue,
+resolution, sentiment) of every transcript and stores it in SUMMARY_FILE,
+keyed by a hash of the transcript text so edited transcripts are
+summarized again and unchanged ones never are. The server answers
+corpus-wide questions from these summaries, which are a small fraction of
+the raw text, so one prompt covers many more calls.
+
+Usage: python transcript_summaries.py  (needs the RunPod settings of the server)
+"""
+
+import os
+import re
+import json
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from runpod_client import RunPodError
+
+SUMMARY_FILE = Path(__file__).parent / ".cache" / "transcript_summaries.json"
+SUMMARY_VERSION = 1
+
+SUMMARY_PROMPT = """Summarize this customer service call in exactly three lines:
+Issue: <the customer's problem, in one sentence>
+Resolution: <what the agent did and whether it was resolved, in one sentence>
+Sentiment: <the customer's sentiment by the end: positive, neutral or negative>
+
+{transcript}"""
+
+SUMMARY_FIELDS = ('issue', 'resolution', 'sentiment')
+SUMMARY_LINE = re.compile(r'^\W*(issue|resolution|sentiment)\W*:[ \t*_]*(.+?)[ \t*_]*$',
+                          re.IGNORECASE | re.MULTILINE)
+
+SUMMARY_CONCURRENCY = 16
+MAX_CONSECUTIVE_FAILURES = 5  # Failed model calls in a row that stop the run, e.g. during an outage
+SAVE_EVERY = 50  # Summaries between saves, so an interrupted run keeps its progress
+
+def content_hash(text: str) -> str:
+    """Key of a transcript's summary: hash of its formatted text."""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+def parse_summary(raw: str):
+    """Fields of a model summary, or None if it has no Issue line."""
+    fields = {}
+    for name, value in SUMMARY_LINE.findall(raw.split('</think>')[-1]):
+        fields.setdefault(name.lower(), value.strip())
+    if 'issue' not in fields:
+        return None
+    return {name: fields.get(name, '') for name in SUMMARY_FIELDS}
+
+def format_summary(fields: dict) -> str:
+    """Render summary fields as the lines shown to the model."""
+    return '\n'.join(f"{name.capitalize()}: {fields[name]}" for name in SUMMARY_FIELDS if fields[name])
+
+def load_summaries(path: Path = SUMMARY_FILE) -> dict:
+    """Map content hash -> summary fields; empty if the file is missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != SUMMARY_VERSION:
+        return {}
+    return data['summaries']
+
+def save_summaries(summaries: dict, path: Path = SUMMARY_FILE):
+    """Write summaries atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': SUMMARY_VERSION, 'summaries': summaries}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def summarize_transcripts(texts: dict, summaries: dict, call_model, path: Path = SUMMARY_FILE) -> int:
+    """
+    Summarize every text in texts (content hash -> transcript text) that
+    summaries lacks, calling call_model(prompt) -> str concurrently; it
+    raises RunPodError on failure. Adds the results to summaries, saving as
+    it goes, and returns how many were added. Failed calls and responses
+    without an Issue line are skipped and retried on the next run. After
+    MAX_CONSECUTIVE_FAILURES failed calls in a row the run stops, leaving
+    the transcripts not yet sent for the next run.
+    """
+    missing = [key for key in texts if key not in summaries]
+
+    def summarize(key):
+        return parse_summary(call_model(SUMMARY_PROMPT.format(transcript=texts[key])))
+
+    added = 0
+    failures = 0
+    pool = ThreadPoolExecutor(max_workers=SUMMARY_CONCURRENCY)
+    futures = {pool.submit(summarize, key): key for key in missing}
+    try:
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                fields = future.result()
+            except RunPodError as e:
+                failures += 1
+                print(f"Warning: Summary of transcript {key[:12]} failed: {e}")
+                if failures >= MAX_CONSECUTIVE_FAILURES:
+                    print(f"Error: {failures} summaries failed in a row; stopping, run again later")
+                    break
+                continue
+            failures = 0
+            if fields is None:
+                print(f"Warning: No summary for transcript {key[:12]}")
+                continue
+            summaries[key] = fields
+            added += 1
+            if added % SAVE_EVERY == 0:
+                save_summaries(summaries, path)
+                print(f"  {added}/{len(missing)} summarized")
+    finally:
+        # Transcripts still queued are never sent
+        pool.shutdown(cancel_futures=True)
+    save_summaries(summaries, path)
+    return added
+
+def main():
+    """Summarize the server's corpus, dropping summaries of transcripts that are gone."""
+    os.environ.setdefault('WATCH_INTERVAL', '0')
+    import assistant_server as server
+    from transcript_index import passage_text
+
+    texts = {t['content_hash']: passage_text(t) for t in server.CORPUS['transcripts']}
+    summaries = {key: fields for key, fields in load_summaries().items() if key in texts}
+    # run_prompt goes through the server's RunPod client, which caps the
+    # jobs in flight at RUNPOD_MAX_CONCURRENCY
+    added = summarize_transcripts(texts, summaries, server.run_prompt)
+    print(f"Wrote {SUMMARY_FILE} ({added} new, {len(summaries)}/{len(texts)} transcripts summarized)")
+
+if __name__ == "__main__":
+    main()
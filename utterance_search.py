@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Utterance Search
+Server-side version of the search page's query language: quoted phrases,
+`;`-separated AND terms, optional case sensitivity and a speaker filter,
+all matched as substrings of single utterances. An inverted index over
+utterance words narrows each query to candidate utterances, which are then
+checked exactly as search.html does, so both return the same hits.
+"""
+
+import re
+
+import numpy as np
+
+from transcript_index import TermPostings
+
+# Same word definition as the page's index (app.INDEX_TOKEN): runs of
+# ASCII letters and digits in lowercased text
+INDEX_TOKEN = re.compile(r'[a-z0-9]+')
+PHRASE_PATTERN = re.compile(r'"([^"]+)"')
+
+# Query words matching more than this share of all utterances do not
+# narrow the search, so they are left to verification
+MAX_CANDIDATE_FRACTION = 0.5
+POSTINGS_CACHE_SIZE = 1000
+
+def parse_search_query(query: str) -> list:
+    """
+    Parse a query like search.html's parseSearchQuery: quoted strings
+    become phrase terms and the rest splits on semicolons into keywords.
+    Returns [{'type': 'phrase' | 'keyword', 'value': str}, ...].
+    """
+    terms = []
+    remaining = query
+    for match in PHRASE_PATTERN.finditer(query):
+        terms.append({'type': 'phrase', 'value': match.group(1)})
+        remaining = remaining.replace(match.group(0), '', 1)
+
+    for part in remaining.split(';'):
+        part = part.strip()
+        if part:
+            terms.append({'type': 'keyword', 'value': part})
+    return terms
+
+def matches_all_terms(text: str, terms: list, case_sensitive: bool) -> bool:
+    """True if every term occurs in text."""
+    if not case_sensitive:
+        text = text.lower()
+        return all(term['value'].lower() in text for term in terms)
+    return all(term['value'] in text for term in terms)
+
+def count_matches(text: str, terms: list, case_sensitive: bool) -> int:
+    """Count non-overlapping occurrences of each term in text."""
+    if not case_sensitive:
+        text = text.lower()
+    count = 0
+    for term in terms:
+        value = term['value'] if case_sensitive else term['value'].lower()
+        count += text.count(value)
+    return count
+
+def highlight_pattern(terms: list, case_sensitive: bool):
+    """Regex matching any term, like the page's highlight regex."""
+    pattern = '|'.join(re.escape(term['value']) for term in terms)
+    return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+
+def build_search_index(transcripts: list) -> dict:
+    """
+    Index the utterances of transcripts (server corpus format). Utterances
+    are numbered across the corpus in transcript order; each word maps to
+    the sorted numbers of the utterances containing it.
+    """
+    postings = {}
+    utterance_starts = [0]
+    utterance_id = 0
+    for t in transcripts:
+        for u in t['utterances']:
+            for term in set(INDEX_TOKEN.findall(u['text'].lower())):
+                postings.setdefault(term, []).append(utterance_id)
+            utterance_id += 1
+        utterance_starts.append(utterance_id)
+
+    return search_index(TermPostings.from_dict(postings, np.uint32),
+                        np.array(utterance_starts, dtype=np.int64))
+
+def search_index(postings: TermPostings, utterance_starts: np.ndarray) -> dict:
+    """A search index over built or memory-mapped postings."""
+    return {'postings': postings, 'utterance_starts': utterance_starts, 'cache': {}}
+
+def matching_terms(index: dict, token: str, starts_word: bool, ends_word: bool) -> np.ndarray:
+    """
+    Positions of the index terms a query token can be part of. A token
+    with a word boundary before it in the query must start a term, one
+    with a boundary after it must end a term.
+    """
+    postings = index['postings']
+    terms = postings.terms
+    key = token.encode('ascii', 'replace')
+    if starts_word and ends_word:
+        i = postings.find(token)
+        return np.array([i] if i >= 0 else [], dtype=np.int64)
+    if starts_word:
+        # Terms are ASCII, so every term with this prefix sorts before prefix + 0xff
+        start = np.searchsorted(terms, key)
+        return np.arange(start, np.searchsorted(terms, key + b'\xff'))
+    if ends_word:
+        return np.flatnonzero(np.char.endswith(terms, key))
+    return np.flatnonzero(np.char.find(terms, key) >= 0)
+
+def token_postings(index: dict, token: str, starts_word: bool, ends_word: bool):
+    """
+    Sorted utterance numbers that may contain a query token, or None when
+    the token is too common to be worth intersecting.
+    """
+    key = (token, starts_word, ends_word)
+    cache = index['cache']
+    if key in cache:
+        return cache[key]
+
+    postings = index['postings']
+    limit = int(index['utterance_starts'][-1]) * MAX_CANDIDATE_FRACTION
+    lists = []
+    size = 0
+    for i in matching_terms(index, token, starts_word, ends_word):
+        lists.append(postings.row(i))
+        size += len(lists[-1])
+        if size > limit:
+            break
+
+    result = None
+    if size <= limit:
+        if len(lists) == 1:
+            result = lists[0]
+        elif lists:
+            result = np.unique(np.concatenate(lists))
+        else:
+            result = np.zeros(0, dtype=np.uint32)
+
+    if len(cache) >= POSTINGS_CACHE_SIZE:
+        cache.clear()
+    cache[key] = result
+    return result
+
+def find_candidates(index: dict, terms: list):
+    """
+    Utterance numbers that may match every term, or None when the index
+    cannot narrow the search and every utterance has to be checked.
+    """
+    candidates = None
+    for term in terms:
+        value = term['value'].lower()
+        for match in INDEX_TOKEN.finditer(value):
+            starts_word = match.start() > 0
+            ends_word = match.end() < len(value)
+            postings = token_postings(index, match.group(), starts_word, ends_word)
+            if postings is None:
+                continue
+            if candidates is None:
+                candidates = postings
+            else:
+                candidates = np.intersect1d(candidates, postings, assume_unique=True)
+            if len(candidates) == 0:
+                return candidates
+    return candidates
+
+def candidate_groups(index: dict, candidates):
+    """Yield (transcript position, utterance indices or None for all) pairs."""
+    starts = index['utterance_starts']
+    if candidates is None:
+        for position in range(len(starts) - 1):
+            yield position, None
+        return
+
+    positions = np.searchsorted(starts, candidates, side='right') - 1
+    boundaries = np.flatnonzero(np.diff(positions)) + 1
+    for group in np.split(np.arange(len(candidates)), boundaries):
+        if len(group):
+            position = int(positions[group[0]])
+            yield position, (candidates[group] - starts[position]).tolist()
+
+def verify_candidates(transcripts: list, groups, terms: list,
+                      case_sensitive: bool = False, speaker: str = 'all') -> list:
+    """
+    Check candidate utterances exactly against the terms.
+    groups yields (transcript position, utterance indices or None for all),
+    in corpus order. Returns (match count, transcript position, matching
+    utterance indices) tuples, most matches first with ties in corpus order.
+    """
+    results = []
+    for position, indices in groups:
+        utterances = transcripts[position]['utterances']
+        if indices is None:
+            indices = range(len(utterances))
+
+        matching = []
+        matches = 0
+        for i in indices:
+            utterance = utterances[i]
+            if speaker != 'all' and utterance['speaker_type'] != speaker:
+                continue
+            if matches_all_terms(utterance['text'], terms, case_sensitive):
+                matches += count_matches(utterance['text'], terms, case_sensitive)
+                matching.append(i)
+
+        if matching:
+            results.append((matches, position, matching))
+
+    results.sort(key=lambda result: -result[0])
+    return results
+
+def search_utterances(index: dict, transcripts: list, query: str,
+                      case_sensitive: bool = False, speaker: str = 'all') -> tuple:
+    """
+    Run a query over transcripts (the list index was built from).
+    Returns (terms, results) with results as from verify_candidates.
+    """
+    terms = parse_search_query(query.strip())
+    if not terms:
+        return terms, []
+    groups = candidate_groups(index, find_candidates(index, terms))
+    return terms, verify_candidates(transcripts, groups, terms, case_sensitive, speaker)
+
+def highlight_offsets(text: str, pattern) -> list:
+    """[start, end) character offsets of each highlighted match in text."""
+    return [[m.start(), m.end()] for m in pattern.finditer(text) if m.end() > m.start()]